@@ -153,14 +153,17 @@ class BootstrapFixedBins(object):
             self.profileCol = config['profilecol']
         
 
+    def binEdges(self):
+
+        if self.binspacing == 'linear':
+            return np.linspace(self.minradii, self.maxradii, self.nbins+1)
+        return np.logspace(np.log10(self.minradii), np.log10(self.maxradii), self.nbins+1)
+
     def __call__(self, cat):
 
         profileCol = getattr(cat, self.profileCol)
 
-        if self.binspacing == 'linear':
-            binedges = np.linspace(self.minradii, self.maxradii, self.nbins+1)
-        else:
-            binedges = np.logspace(np.log10(self.minradii), np.log10(self.maxradii), self.nbins+1)
+        binedges = self.binEdges()
 
         radii = []
         shear = []
@@ -231,14 +234,17 @@ class GaussianFixedBins(object):
             self.shapenoise = config['shapenoise']
         
 
+    def binEdges(self):
+
+        if self.binspacing == 'linear':
+            return np.linspace(self.minradii, self.maxradii, self.nbins+1)
+        return np.logspace(np.log10(self.minradii), np.log10(self.maxradii), self.nbins+1)
+
     def __call__(self, cat):
 
         profileCol = getattr(cat, self.profileCol)
 
-        if self.binspacing == 'linear':
-            binedges = np.linspace(self.minradii, self.maxradii, self.nbins+1)
-        else:
-            binedges = np.logspace(np.log10(self.minradii), np.log10(self.maxradii), self.nbins+1)
+        binedges = self.binEdges()
 
         radii = []
         shear = []
@@ -283,4 +289,46 @@ class GaussianFixedBins(object):
 
 ########################################
 
+def stackedFixedBins(binedges, radii, ghat, beta_s, shapenoise):
+    '''Bin K shear profiles of the same galaxies at once, as GaussianFixedBins would each of them.
+
+    radii and ghat are (K x ngals) arrays (eg one row per center realization), beta_s is (ngals).
+    Returns a dict of (K x nbins) arrays with the same columns as the fixed-bin binners.
+    Shear errors are shapenoise/sqrt(ngal). Empty bins are flagged with -1.'''
+
+    radii = np.atleast_2d(radii)
+    ghat = np.atleast_2d(ghat)
+    nprofiles, ngals = radii.shape
+    nbins = len(binedges) - 1
+
+    binindex = np.searchsorted(binedges, radii, side='right') - 1
+    inrange = np.logical_and(binindex >= 0, binindex < nbins)
+    flatindex = (binindex + nbins*np.arange(nprofiles)[:,None])[inrange]
+
+    def binsum(weights):
+        return np.bincount(flatindex, weights = weights, 
+                           minlength = nprofiles*nbins).reshape((nprofiles, nbins))
+
+    betas = np.broadcast_to(beta_s, radii.shape)
+
+    number = binsum(None)
+    sum_r = binsum(radii[inrange])
+    sum_g = binsum(ghat[inrange])
+    sum_beta = binsum(betas[inrange])
+    sum_beta2 = binsum(betas[inrange]**2)
+
+    good = number >= 1
+    safenumber = np.where(good, number, 1)
+
+    mean_g = sum_g/safenumber
+    sigma_g = shapenoise/np.sqrt(safenumber)
+
+    def flagged(vals):
+        return np.where(good, vals, -1)
 
+    return dict(radii = flagged(sum_r/safenumber),
+                ghat = flagged(mean_g),
+                sigma_ghat = flagged(sigma_g),
+                beta_s = flagged(sum_beta/safenumber),
+                beta_s2 = flagged(sum_beta2/safenumber),
+                ngals = flagged(number))
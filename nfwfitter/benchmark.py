@@ -0,0 +1,410 @@
+#!/usr/bin/env python
+#######################
+# Benchmarks for the fitting hot paths, on synthetic NFW halos, so speedups and regressions
+# can be checked without the simulation archives.
+#
+#   python nfwfitter/benchmark.py [--quick] [--only name ...] [--save base.json] [--compare base.json]
+#
+# Each benchmark runs at a few problem sizes and reports seconds per call and throughput
+# (items per second; what an item is depends on the benchmark). Baselines are machine
+# specific: save one before a change, compare after.
+#######################
+
+import os, sys, time, json, socket, shutil, struct, tempfile, argparse
+import numpy as np
+import astropy.io.fits as pyfits
+
+import nfwutils
+import nfwmodeltools as tools
+import deconvolvedlognormtools as dlntools
+import nfwnoise
+import nfwfit
+import basicMassCon
+import basicBinning
+import catalog
+import readMXXL
+import readBK11
+
+#######################
+
+cosmology = nfwutils.Cosmology(omega_m = 0.25, omega_l = 0.75, h = 0.73)
+
+zcluster = 0.3
+m200 = 5e14
+c200 = 4.
+beta = 0.5
+
+#######################
+# Synthetic halos
+
+
+def syntheticProfile(nbins, rng, rmin = 0.5, rmax = 2.5, sigma = 0.02):
+    '''Binned reduced shear profile of an NFW halo (nfwnoise.createPerfectProfile) plus gaussian noise'''
+
+    profile = catalog.Catalog()
+    profile.r_mpc = np.linspace(rmin, rmax, nbins)
+    profile.beta_s = beta*np.ones(nbins)
+    profile.beta_s2 = profile.beta_s**2
+    profile.sigma_ghat = sigma*np.ones(nbins)
+    profile.ghat = nfwnoise.createPerfectProfile(m200, c200, zcluster, profile.r_mpc, profile.beta_s) + \
+        sigma*rng.standard_normal(nbins)
+    profile.zcluster = zcluster
+    profile.zlens = zcluster
+
+    return profile
+
+###
+
+def shearMaps(npix, maxdist_mpc):
+    '''gamma1, gamma2 and kappa (at infinite redshift) of an NFW halo on an npix x npix grid, and the axis'''
+
+    xs = np.linspace(-maxdist_mpc, maxdist_mpc, npix)
+    x_mpc, y_mpc = np.meshgrid(xs, xs, indexing = 'ij')
+    r_mpc = np.sqrt(x_mpc**2 + y_mpc**2).flatten()
+    r_mpc[r_mpc == 0] = 1e-3
+    phi = np.arctan2(y_mpc, x_mpc).flatten()
+
+    rscale = nfwutils.rscaleConstM(m200, c200, zcluster, 200.)
+    rho_c_over_sigma_c = 1.5 * nfwutils.global_cosmology.angulardist(zcluster) * nfwutils.global_cosmology.beta([1e6], zcluster)[0] * nfwutils.global_cosmology.hubble2(zcluster) / nfwutils.global_cosmology.v_c**2
+
+    gamma_t = tools.NFWShear(r_mpc, c200, rscale, rho_c_over_sigma_c)
+    kappa = tools.NFWKappa(r_mpc, c200, rscale, rho_c_over_sigma_c)
+
+    return -gamma_t*np.cos(2*phi), -gamma_t*np.sin(2*phi), kappa, r_mpc
+
+###
+
+def syntheticGalaxies(ngals, rng, maxdist_mpc = 3., shapenoise = 0.25):
+    '''Galaxies at random positions around an NFW halo, with shape noise, centered and
+    rotated into tangential shear as profilebuilder hands them to a binner'''
+
+    x_mpc = rng.uniform(-maxdist_mpc, maxdist_mpc, ngals)
+    y_mpc = rng.uniform(-maxdist_mpc, maxdist_mpc, ngals)
+
+    galaxies = catalog.Catalog()
+    galaxies.r_mpc = np.sqrt(x_mpc**2 + y_mpc**2)
+    galaxies.beta_s = beta*np.ones(ngals)
+    galaxies.ghat = nfwnoise.createPerfectProfile(m200, c200, zcluster, galaxies.r_mpc, galaxies.beta_s) + \
+        shapenoise*rng.standard_normal(ngals)
+    galaxies.zcluster = zcluster
+    galaxies.zlens = zcluster
+
+    return galaxies
+
+###
+
+def writeMXXLMap(filename, data, npix, halfwidth_arcsec = 600., redshift = zcluster):
+    '''An MXXL binary map, in the layout readMXXL.MXXLBinary parses'''
+
+    with open(filename, 'wb') as output:
+        output.write(struct.pack('@2d', -halfwidth_arcsec, -halfwidth_arcsec))
+        output.write(struct.pack('@2d', halfwidth_arcsec, halfwidth_arcsec))
+        output.write(struct.pack('@d', 0.5*np.pi))
+        output.write(struct.pack('@d', redshift))
+        output.write(struct.pack('@f', 1.))
+        output.write(struct.pack('@2i', npix, npix))
+        output.write(np.asarray(data, dtype = np.float32).tostring())
+
+def writeMXXLSim(filebase, npix):
+
+    gamma1, gamma2, kappa, r_mpc = shearMaps(npix, 1.5)
+    for ext, data in [('convergence_map', kappa), ('shear_1_map', gamma1), ('shear_2_map', gamma2)]:
+        writeMXXLMap('%s.%s' % (filebase, ext), data, npix)
+
+###
+
+def writeBK11Sim(filename, npix = 512, boxwidth = 15.):
+    '''A BK11 fits file, in the layout readBK11.BK11Sim parses (which assumes 512 x 512 maps)'''
+
+    gamma1, gamma2, kappa, r_mpc = shearMaps(npix, 0.5*boxwidth/cosmology.h)
+
+    #A = [[1 - kappa - gamma1, -gamma2], [-gamma2, 1 - kappa + gamma1]]
+    maps = dict(A00 = 1 - kappa - gamma1, A11 = 1 - kappa + gamma1, A01 = -gamma2, A10 = -gamma2)
+
+    npixels = npix*npix
+    columns = [pyfits.Column(name = name, format = '%dE' % npixels, array = maps[name].reshape((1, npixels)))
+               for name in 'A00 A01 A10 A11'.split()]
+    for name, val in [('BOXWIDTHCOMOVINGHINVMPC', boxwidth), ('BOXLENGTHCOMOVINGHINVMPC', 2*boxwidth),
+                      ('ZLENS', zcluster), ('ZSOURCE', 1.5), ('M500C', 0.7*m200), ('M200C', m200), ('C200C', c200)]:
+        columns.append(pyfits.Column(name = name, format = 'D', array = np.array([val])))
+
+    hdulist = pyfits.HDUList([pyfits.PrimaryHDU(), pyfits.BinTableHDU.from_columns(columns)])
+    hdulist.writeto(filename)
+
+#######################
+# Benchmarks. Each takes a problem size and a RandomState, and returns
+# (function to time, number of items it processes per call, cleanup function or None)
+
+
+def benchShearprofileLike(nbins, rng):
+
+    profile = syntheticProfile(nbins, rng)
+    model = nfwfit.NFW_Model()
+    model.configure({})
+    model.setData(profile.beta_s, profile.beta_s2, profile.zcluster, zlens = profile.zlens)
+
+    masses = rng.uniform(1e14, 1e15, 1000)
+    concens = rng.uniform(2., 8., 1000)
+
+    def run():
+        for m, c in zip(masses, concens):
+            tools.shearprofile_like(m, c, profile.r_mpc, profile.ghat, profile.sigma_ghat,
+                                    model.beta_s, model.beta_s2, model.rho_c, model.rho_c_over_sigma_c, 200.)
+
+    return run, len(masses), None
+
+###
+
+def benchPDFScanner(nbins, rng):
+
+    profile = syntheticProfile(nbins, rng)
+    model = nfwfit.NFW_MC_Model()
+    config = dict(model = model, massconRelation = basicMassCon.Duffy())
+    model.configure(config)
+    fitter = nfwfit.PDFScanner()
+    fitter.configure(config)
+    fitter(profile)     #the mass-concentration grid is cached per redshift; time the scan itself
+
+    return lambda: fitter(profile), 1, None
+
+###
+
+def benchMCMCFitter(nsamples, rng):
+
+    profile = syntheticProfile(12, rng)
+    model = nfwfit.NFW_Model()
+    config = dict(model = model, nsamples = nsamples)
+    model.configure(config)
+    fitter = nfwfit.MCMCFitter()
+    fitter.configure(config)
+    fitter.deltas = [200]
+
+    def run():
+        stdout = sys.stdout
+        sys.stdout = open(os.devnull, 'w')
+        try:
+            fitter(profile)
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+
+    return run, nsamples, None
+
+###
+
+def binnerBenchmark(binnerclass, config):
+
+    def bench(ngals, rng):
+
+        galaxies = syntheticGalaxies(ngals, rng)
+        binner = binnerclass()
+        binnerconfig = dict(profileMin = 0.25, profileMax = 2.5, profilecol = 'r_mpc',
+                            binspacing = 'linear', nbins = 12, shapenoise = 0.25)
+        binnerconfig.update(config)
+        binner.configure(binnerconfig)
+
+        return lambda: binner(galaxies), ngals, None
+
+    return bench
+
+###
+
+def benchCosmologyBeta(nredshifts, rng):
+
+    zs = rng.uniform(zcluster, 3., nredshifts)
+
+    return lambda: nfwutils.global_cosmology.beta(zs, zcluster), nredshifts, None
+
+###
+
+def benchMXXLReader(npix, rng):
+
+    workdir = tempfile.mkdtemp()
+    filebase = '%s/halo' % workdir
+    writeMXXLSim(filebase, npix)
+
+    def run():
+        stdout = sys.stdout
+        sys.stdout = open(os.devnull, 'w')
+        try:
+            readMXXL.MXXLSimReader().load(filebase)
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+
+    return run, npix*npix, lambda: shutil.rmtree(workdir)
+
+###
+
+def benchBK11Reader(npix, rng):
+
+    workdir = tempfile.mkdtemp()
+    filename = '%s/halo.fits' % workdir
+    writeBK11Sim(filename, npix)
+
+    return lambda: readBK11.BK11SimReader().load(filename), npix*npix, lambda: shutil.rmtree(workdir)
+
+###
+
+def dlnHalos(nhalos, nsamples, rng, logmu = 0., sigma = 0.2, noise = 0.3):
+    '''ml_ints, delta_logmls and ngoodsamples as deconvolvedlognorm.buildMCMCModel hands them to the likelihood'''
+
+    true_masses = 10**rng.uniform(14, 15, nhalos)
+    lensing_masses = true_masses*np.exp(logmu + sigma*rng.standard_normal(nhalos))
+    ml_ints = np.abs(lensing_masses[:,None]*(1 + noise*rng.standard_normal((nhalos, nsamples))))
+    delta_logmls = np.log(ml_ints) - np.log(true_masses)[:,None]
+
+    return ml_ints/1e15, delta_logmls, nsamples*np.ones(nhalos, dtype = np.int)
+
+def benchDLNMCMCLike(nhalos, rng):
+
+    ml_ints, delta_logmls, ngoodsamples = dlnHalos(nhalos, 2000, rng)
+
+    return lambda: dlntools.mcmcloglinearlike(ml_ints, delta_logmls, ngoodsamples, 0.05, 0.25), nhalos, None
+
+def benchDLNPDFLike(nhalos, rng):
+
+    masses = np.arange(1e13, 3e15, 1e13)
+    true_masses = 10**rng.uniform(14, 15, nhalos)
+    lensing_masses = true_masses*np.exp(0.2*rng.standard_normal(nhalos))
+    pdfs = np.exp(-0.5*((masses[None,:] - lensing_masses[:,None])/(0.3*lensing_masses[:,None]))**2)
+    pdfs = pdfs/np.sum(pdfs, axis = 1)[:,None]
+    delta_logmls = np.log(masses)[None,:] - np.log(true_masses)[:,None]
+    ml_ints = masses/1e15
+    deltamasses = np.hstack([ml_ints[1:] - ml_ints[:-1], 0.])
+
+    return lambda: dlntools.pdfloglinearlike(ml_ints, deltamasses, delta_logmls, pdfs, 0.05, 0.25), nhalos, None
+
+#######################
+
+benchmarks = [('shearprofile_like', 'likelihoods', [10, 30, 100], benchShearprofileLike),
+              ('PDFScanner', 'profiles', [12, 30], benchPDFScanner),
+              ('MCMCFitter', 'samples', [6000, 20000], benchMCMCFitter),
+              ('BootstrapFixedBins', 'galaxies', [10000, 100000], binnerBenchmark(basicBinning.BootstrapFixedBins, {})),
+              ('GaussianFixedBins', 'galaxies', [10000, 100000, 1000000], binnerBenchmark(basicBinning.GaussianFixedBins, {})),
+              ('Cosmology.beta', 'redshifts', [100, 1000], benchCosmologyBeta),
+              ('MXXLSimReader', 'pixels', [256, 1024], benchMXXLReader),
+              ('BK11SimReader', 'pixels', [512], benchBK11Reader),
+              ('mcmcloglinearlike', 'halos', [100, 1000], benchDLNMCMCLike),
+              ('pdfloglinearlike', 'halos', [100, 1000], benchDLNPDFLike)]
+
+#######################
+
+def timeCall(func, mintime = 0.2, repeat = 3):
+    '''Best of repeat timings of func, in seconds per call. Each timing loops
+    over enough calls to take at least mintime.'''
+
+    start = time.time()
+    func()
+    elapsed = time.time() - start
+
+    nloops = 1
+    if elapsed < mintime:
+        nloops = int(np.ceil(mintime/max(elapsed, 1e-6)))
+
+    best = elapsed
+    for i in range(repeat):
+        start = time.time()
+        for j in range(nloops):
+            func()
+        best = min(best, (time.time() - start)/nloops)
+
+    return best
+
+###
+
+def runBenchmarks(only = None, quick = False, repeat = 3, seed = 1):
+    '''{name : {size : dict(seconds, rate, units)}}'''
+
+    nfwutils.global_cosmology.set_cosmology(cosmology)
+
+    results = {}
+    for name, units, sizes, bench in benchmarks:
+        if only is not None and name not in only:
+            continue
+        if quick:
+            sizes = sizes[:1]
+
+        results[name] = {}
+        for size in sizes:
+            run, nitems, cleanup = bench(size, np.random.RandomState(seed))
+            np.random.seed(seed)
+            try:
+                seconds = timeCall(run, repeat = repeat)
+            finally:
+                if cleanup is not None:
+                    cleanup()
+
+            results[name][str(size)] = dict(seconds = seconds, rate = nitems/seconds, units = units)
+            print '%-20s %8s %12.4g s %12.4g %s/s' % (name, size, seconds, nitems/seconds, units)
+            sys.stdout.flush()
+
+    return results
+
+#######################
+
+def saveBaseline(results, filename):
+
+    with open(filename, 'w') as output:
+        json.dump(dict(info = dict(host = socket.gethostname(), date = time.ctime(),
+                                   numpy = np.__version__, python = sys.version.split()[0]),
+                       results = results), output, indent = 1, sort_keys = True)
+
+###
+
+def compare(results, baseline, tolerance = 1.25):
+    '''Print the speedup of results over baseline for every benchmark in both. Returns
+    the (name, size, slowdown) of those more than tolerance times slower.'''
+
+    regressions = []
+
+    print '%-20s %8s %12s %12s %8s' % ('benchmark', 'size', 'baseline s', 'now s', 'speedup')
+    for name in sorted(results.keys()):
+        if name not in baseline:
+            continue
+        for size in sorted(results[name].keys(), key = int):
+            if size not in baseline[name]:
+                continue
+            before = baseline[name][size]['seconds']
+            now = results[name][size]['seconds']
+            flag = ''
+            if now > tolerance*before:
+                flag = '  SLOWER'
+                regressions.append((name, size, now/before))
+            print '%-20s %8s %12.4g %12.4g %8.2f%s' % (name, size, before, now, before/now, flag)
+
+    return regressions
+
+#######################
+
+def main(argv = sys.argv[1:]):
+
+    parser = argparse.ArgumentParser(description = 'Benchmark fitting hot paths on synthetic halos')
+    parser.add_argument('--only', nargs = '+', default = None,
+                        help = 'benchmarks to run: %s' % ', '.join([x[0] for x in benchmarks]))
+    parser.add_argument('--quick', action = 'store_true', help = 'smallest problem size only')
+    parser.add_argument('--repeat', type = int, default = 3)
+    parser.add_argument('--save', default = None, help = 'write results as a baseline json file')
+    parser.add_argument('--compare', default = None, help = 'baseline json file to compare against')
+    parser.add_argument('--tolerance', type = float, default = 1.25,
+                        help = 'slowdown over the baseline counted as a regression')
+    args = parser.parse_args(argv)
+
+    results = runBenchmarks(args.only, args.quick, args.repeat)
+
+    if args.save is not None:
+        saveBaseline(results, args.save)
+
+    if args.compare is not None:
+        with open(args.compare) as input:
+            baseline = json.load(input)['results']
+        print
+        regressions = compare(results, baseline, args.tolerance)
+        if len(regressions) > 0:
+            sys.exit(1)
+
+#######################
+
+if __name__ == '__main__':
+
+    main()
@@ -7,6 +7,7 @@ Assign betas and redshifts to galaxies, and assign appropriately.
 import simutils
 import numpy as np
 import nfwutils
+import readtxtfile
 
 ##########
 
@@ -25,6 +26,23 @@ class BetaCalcer(object):
 
         return galaxies
 
+    def betaInf(self, zlens):
+        '''beta for a source at infinite redshift. Computed once per lens redshift.'''
+
+        return self.betaTable(zlens, 1e6)
+
+    def betaTable(self, zlens, z_source):
+        '''beta (not normalized by beta_inf) for a single source redshift, memoized per (z_source, zlens)'''
+
+        if not hasattr(self, '_betacache'):
+            self._betacache = {}
+
+        key = (nfwutils.cosmologyKey(), float(z_source), float(zlens))
+        if key not in self._betacache:
+            self._betacache[key] = nfwutils.global_cosmology.beta([z_source], zlens)[0]
+
+        return self._betacache[key]
+
 #########
 
 class InfiniteRedshift(BetaCalcer):
@@ -45,9 +63,9 @@ class FixedRedshift(BetaCalcer):
 
     def calcBetas(self, zlens, galaxies):
 
-        beta_s = nfwutils.global_cosmology.beta_s(np.ones(len(galaxies))*self.z_source, zlens)
+        beta_s = self.betaTable(zlens, self.z_source) / self.betaInf(zlens)
 
-        return beta_s
+        return beta_s*np.ones(len(galaxies))
 
 
 ##########
@@ -61,7 +79,62 @@ class FixedBeta(BetaCalcer):
     def calcBetas(self, zlens, galaxies):
 
 
-        return self.beta*np.ones(len(galaxies))/nfwutils.global_cosmology.beta([1e6], galaxies.zlens)
+        return self.beta*np.ones(len(galaxies))/self.betaInf(galaxies.zlens)
+
+##########
+
+class RedshiftDistribution(BetaCalcer):
+    '''Draws a source redshift per galaxy from a tabulated p(z), then maps redshifts to
+    beta_s through a beta(z) table that is precomputed once per lens redshift.
+
+    Config:
+       zdistfile     -- two column text file: z, p(z) (need not be normalized)
+       zdist_nbetagrid -- number of redshift nodes for the beta(z) table (default 200)
+    '''
+
+    def configure(self, config):
+
+        zdist = readtxtfile.readtxtfile(config['zdistfile'])
+        self.setDistribution(zdist[:,0], zdist[:,1])
+
+        self.nbetagrid = 200
+        if 'zdist_nbetagrid' in config:
+            self.nbetagrid = config['zdist_nbetagrid']
+
+    def setDistribution(self, z, pz):
+
+        order = np.argsort(z)
+        self.z = np.asarray(z, dtype=np.float64)[order]
+        pz = np.asarray(pz, dtype=np.float64)[order]
+
+        cdf = np.hstack([0., np.cumsum(0.5*(pz[1:] + pz[:-1])*(self.z[1:] - self.z[:-1]))])
+        self.cdf = cdf / cdf[-1]
+
+        self._betagrids = {}
+
+    def drawRedshifts(self, ngals):
+
+        return np.interp(np.random.uniform(0., 1., ngals), self.cdf, self.z)
+
+    def betaGrid(self, zlens):
+        '''(z, beta_s) interpolation nodes spanning the tabulated distribution, cached per zlens'''
+
+        key = (nfwutils.cosmologyKey(), float(zlens))
+        if key not in self._betagrids:
+            zgrid = np.linspace(self.z[0], self.z[-1], self.nbetagrid)
+            #beta(z) has a kink at the lens; make it a node
+            if self.z[0] < zlens < self.z[-1]:
+                zgrid = np.union1d(zgrid, [zlens])
+            betagrid = nfwutils.global_cosmology.beta(zgrid, zlens) / self.betaInf(zlens)
+            self._betagrids[key] = (zgrid, betagrid)
+
+        return self._betagrids[key]
+
+    def calcBetas(self, zlens, galaxies):
+
+        z_source = self.drawRedshifts(len(galaxies))
+        galaxies.z_source = z_source
+
+        zgrid, betagrid = self.betaGrid(zlens)
 
-        
-        
+        return np.interp(z_source, zgrid, betagrid)
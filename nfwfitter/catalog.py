@@ -73,6 +73,92 @@ class Catalog(object):
         return newcat
 
 
+#########################
+
+class LazyColumn(object):
+    '''A catalog column that only materializes the rows that are requested.
+
+    The source can be anything that supports len() and integer/boolean
+    indexing, e.g. a np.memmap of a map file or a GridCoordinate.
+    Values are scale*source[rows], with the scale carried along by
+    multiplication and division so that rescalings stay lazy.'''
+
+    def __init__(self, source, scale = 1.):
+        self.source = source
+        self.scale = scale
+
+    def __len__(self):
+        return len(self.source)
+
+    def __getitem__(self, rows):
+        return self.scale*np.asarray(self.source[rows])
+
+    def __array__(self, dtype = None):
+        vals = self[:]
+        if dtype is not None:
+            vals = vals.astype(dtype)
+        return vals
+
+    def __mul__(self, other):
+        return LazyColumn(self.source, self.scale*other)
+
+    __rmul__ = __mul__
+
+    def __div__(self, other):
+        return LazyColumn(self.source, self.scale/other)
+
+    __truediv__ = __div__
+
+    def __neg__(self):
+        return LazyColumn(self.source, -self.scale)
+
+    def _extremes(self):
+        if hasattr(self.source, 'extremes'):
+            low, high = self.source.extremes()
+        else:
+            low, high = np.min(self.source), np.max(self.source)
+        return np.sort(np.hstack([self.scale*low, self.scale*high]))
+
+    def min(self, *args, **kwds):
+        return self._extremes()[0]
+
+    def max(self, *args, **kwds):
+        return self._extremes()[-1]
+
+###
+
+class GridCoordinate(object):
+    '''Coordinate of each pixel of a flattened (C-order) 2d grid, computed from the pixel index.
+
+    axis = 0 gives the row coordinate, axis = 1 the column coordinate.'''
+
+    def __init__(self, axisvals, shape, axis):
+        self.axisvals = np.asarray(axisvals)
+        self.shape = tuple(shape)
+        self.axis = axis
+
+    def __len__(self):
+        return self.shape[0]*self.shape[1]
+
+    def __getitem__(self, rows):
+
+        if isinstance(rows, slice):
+            index = np.arange(*rows.indices(len(self)))
+        else:
+            rows = np.asarray(rows)
+            if rows.dtype == bool:
+                index = np.flatnonzero(rows)
+            else:
+                index = rows
+
+        if self.axis == 0:
+            return self.axisvals[index // self.shape[1]]
+        return self.axisvals[index % self.shape[1]]
+
+    def extremes(self):
+        return np.min(self.axisvals), np.max(self.axisvals)
+
+
 #########################
 
 
@@ -146,6 +232,56 @@ class TestCatalog(unittest.TestCase):
         self.assertTrue((newcat.betas == betas).all())
         
 
+###
+
+class TestLazyColumn(unittest.TestCase):
+
+    def testGridCoordinates(self):
+
+        rowvals = np.arange(3)*2.
+        colvals = np.arange(4)*3.
+        X2, X1 = np.meshgrid(colvals, rowvals)
+
+        cat = Catalog()
+        cat.x = LazyColumn(GridCoordinate(rowvals, (3,4), 0))
+        cat.y = LazyColumn(GridCoordinate(colvals, (3,4), 1))
+
+        self.assertEqual(len(cat), 12)
+        self.assertTrue((np.asarray(cat.x) == X1.flatten()).all())
+        self.assertTrue((np.asarray(cat.y) == X2.flatten()).all())
+        self.assertEqual(np.max(cat.y), 9.)
+        self.assertEqual(np.min(cat.x), 0.)
+
+    ###
+
+    def testFilterMaterializesRows(self):
+
+        vals = np.arange(20, dtype=np.float32)
+
+        cat = Catalog()
+        cat.clusterz = 0.5
+        cat.vals = LazyColumn(vals)*2.
+
+        rows = np.array([1, 5, 7])
+        newcat = cat.filter(rows)
+        self.assertTrue(isinstance(newcat.vals, np.ndarray))
+        self.assertTrue((newcat.vals == 2*vals[rows]).all())
+
+        masked = cat.filter(vals < 3)
+        self.assertTrue((masked.vals == 2*vals[vals < 3]).all())
+
+    ###
+
+    def testLazyRescale(self):
+
+        vals = np.arange(-5., 5.)
+
+        col = -(LazyColumn(vals)/2.)
+        self.assertTrue(isinstance(col, LazyColumn))
+        self.assertTrue((np.asarray(col) == -vals/2.).all())
+        self.assertEqual(col.max(), 2.5)
+        self.assertEqual(col.min(), -2.)
+
 
 
 def runtests():
@@ -15,126 +15,154 @@ import nfwutils
 
 #############
 
+def mpc2arcmin(zlens):
 
-class NoOffset(object):
-        
-    def __call__(self, sim):
-        return 0., 0.
+    dL = nfwutils.global_cosmology.angulardist(zlens)
 
-########
+    return (180./np.pi)*60./dL
 
-class SZSimOffset(object):
+###
 
-    def __init__(self):
+def rotate(offsetx, offsety, offset_phi):
 
-        szsim_offsetcat = asciireader.read(pkg_resources.resource_stream('nfwfitter', 'data/SPT_SN_offset.dat'))
+    newoffsetx = offsetx*np.cos(offset_phi) - offsety*np.sin(offset_phi)
+    newoffsety = offsetx*np.sin(offset_phi) + offsety*np.cos(offset_phi)
 
-        self.szsim_offsetcat = szsim_offsetcat[szsim_offsetcat['SN'] >= 5]
+    return newoffsetx, newoffsety
 
-    def configure(self, config):
+#############
 
-        self.coresize = config['coresize']
+class CenterGenerator(object):
+    '''ABSTRACT. Subclasses implement draw(n, zlens), returning arrays of n x and n y offsets in arcmin.'''
 
     def __call__(self, sim):
 
-        offsetingcoresize = self.szsim_offsetcat[self.szsim_offsetcat['coresize[arcmin]'] == self.coresize]
+        offsetx, offsety = self.draw(1, sim.zlens)
 
-        selectedsim =np.random.randint(0, len(offsetingcoresize))
+        return offsetx[0], offsety[0]
 
-        offsetx = (offsetingcoresize['peak_xpix[arcmin]'] - offsetingcoresize['cluster_xpix'])[selectedsim]  #arcmin
-        offsety = (offsetingcoresize['peak_ypix'] - offsetingcoresize['cluster_ypix'])[selectedsim]
+#############
 
 
-        offset_phi = np.random.uniform(0, 2*np.pi)
+class NoOffset(CenterGenerator):
 
-        newoffsetx = offsetx*np.cos(offset_phi) - offsety*np.sin(offset_phi)
-        newoffsety = offsetx*np.sin(offset_phi) + offsety*np.cos(offset_phi)
+    def draw(self, n, zlens):
+        return np.zeros(n), np.zeros(n)
 
-        return newoffsetx, newoffsety
+########
 
+def readSZSimOffsets():
 
-class SZSimOffsetCoreIgnored(object):
+    szsim_offsetcat = asciireader.read(pkg_resources.resource_stream('nfwfitter', 'data/SPT_SN_offset.dat'))
 
-    def __init__(self):
+    return szsim_offsetcat[szsim_offsetcat['SN'] >= 5]
 
-        szsim_offsetcat = asciireader.read(pkg_resources.resource_stream('nfwfitter', 'data/SPT_SN_offset.dat'))
+###
 
+def extractSZSimOffsets(szsim_offsetcat):
 
-        self.szsim_offsetcat = szsim_offsetcat[szsim_offsetcat['SN'] >= 5]
+    offsetx = np.array(szsim_offsetcat['peak_xpix[arcmin]'] - szsim_offsetcat['cluster_xpix'], dtype=np.float64)  #arcmin
+    offsety = np.array(szsim_offsetcat['peak_ypix'] - szsim_offsetcat['cluster_ypix'], dtype=np.float64)
+
+    return offsetx, offsety
+
+###
+
+class SZSimOffset(CenterGenerator):
+
+    def __init__(self):
+
+        self.szsim_offsetcat = readSZSimOffsets()
 
     def configure(self, config):
 
-        pass
+        self.coresize = config['coresize']
 
-    def __call__(self, sim):
+        offsetingcoresize = self.szsim_offsetcat[self.szsim_offsetcat['coresize[arcmin]'] == self.coresize]
+        self.offsetx, self.offsety = extractSZSimOffsets(offsetingcoresize)
 
-        selectedsim = np.random.randint(0, len(self.szsim_offsetcat))
+    def draw(self, n, zlens):
 
-        offsetx = (self.szsim_offsetcat['peak_xpix[arcmin]'] - self.szsim_offsetcat['cluster_xpix'])[selectedsim]  #arcmin
-        offsety = (self.szsim_offsetcat['peak_ypix'] - self.szsim_offsetcat['cluster_ypix'])[selectedsim]
+        selectedsim = np.random.randint(0, len(self.offsetx), n)
 
+        offset_phi = np.random.uniform(0, 2*np.pi, n)
 
-        offset_phi = np.random.uniform(0, 2*np.pi)
+        return rotate(self.offsetx[selectedsim], self.offsety[selectedsim], offset_phi)
 
-        newoffsetx = offsetx*np.cos(offset_phi) - offsety*np.sin(offset_phi)
-        newoffsety = offsetx*np.sin(offset_phi) + offsety*np.cos(offset_phi)
 
-        return newoffsetx, newoffsety
+class SZSimOffsetCoreIgnored(CenterGenerator):
+
+    def __init__(self):
+
+        self.szsim_offsetcat = readSZSimOffsets()
+        self.offsetx, self.offsety = extractSZSimOffsets(self.szsim_offsetcat)
+
+    def configure(self, config):
+
+        pass
+
+    def draw(self, n, zlens):
+
+        selectedsim = np.random.randint(0, len(self.offsetx), n)
+
+        offset_phi = np.random.uniform(0, 2*np.pi, n)
+
+        return rotate(self.offsetx[selectedsim], self.offsety[selectedsim], offset_phi)
 
 
 #######
 
 
-class SZLensingPeakOffset(object):
+class SZLensingPeakOffset(CenterGenerator):
 
 
-    def __call__(self, sim):
+    def draw(self, n, zlens):
 
         scatter = 0.237
-        centeroffsetx, centeroffsety = scatter*np.random.standard_normal(2)
+        centeroffsets = scatter*np.random.standard_normal((n, 2))
 
-        return centeroffsetx, centeroffsety
+        return centeroffsets[:,0], centeroffsets[:,1]
 
 
 ####
 
 
-class SZXVPTheoryOffset(object):
+class SZXVPTheoryOffset(CenterGenerator):
 
     def __init__(self):
         self.xvpoffset = XrayXVPOffset()
 
 
-    def __call__(self, sim):
+    def draw(self, n, zlens):
 
         #physical scatter in arcmin, approp for target redshift
-        xvp_offsetx, xvp_offsety = self.xvpoffset(sim)
+        xvp_offsetx, xvp_offsety = self.xvpoffset.draw(n, zlens)
 
         sz_noisescatter = 0.3
-        centeroffsetx, centeroffsety = sz_noisescatter*np.random.standard_normal(2)
+        centeroffsets = sz_noisescatter*np.random.standard_normal((n, 2))
 
-        return (centeroffsetx + xvp_offsetx, 
-                centeroffsety + xvp_offsety)
+        return (centeroffsets[:,0] + xvp_offsetx,
+                centeroffsets[:,1] + xvp_offsety)
 
 
 ####
 
 
 
-class SZXVPBCGOffset(object):
+class SZXVPBCGOffset(CenterGenerator):
 
     def __init__(self):
 
         self.sz_xvp_bcg_offsets_deg = readtxtfile.readtxtfile(pkg_resources.resource_filename('nfwfitter', 'data/sptxvp_bcgsz'))[:,1]
 
 
-    def __call__(self, sim):
+    def draw(self, n, zlens):
 
 
 
-        offset = 60*sz_xvp_bcg_offsets_deg[np.random.randint(0, len(sz_xvp_bcg_offsets_deg), 1)]
+        offset = 60*self.sz_xvp_bcg_offsets_deg[np.random.randint(0, len(self.sz_xvp_bcg_offsets_deg), n)]
 
-        offset_phi = np.random.uniform(0, 2*np.pi)
+        offset_phi = np.random.uniform(0, 2*np.pi, n)
 
         newoffsetx = offset*np.cos(offset_phi)
         newoffsety = offset*np.sin(offset_phi)
@@ -144,7 +172,7 @@ class SZXVPBCGOffset(object):
 
 ####
 
-class SZAnalytic(object):
+class SZAnalytic(CenterGenerator):
 
     def configure(self, config):
 
@@ -152,14 +180,14 @@ class SZAnalytic(object):
         self.coresize = config['coresize']
         self.sz_xi = config['sz_xi']
 
-    def __call__(self, sim):
+        self.sz_noisescatter = np.sqrt(self.szbeam**2 + self.coresize**2)/self.sz_xi
 
+    def draw(self, n, zlens):
 
-        sz_noisescatter = np.sqrt(self.szbeam**2 + self.coresize**2)/self.sz_xi
 
-        offset = sz_noisescatter*np.random.standard_normal()
+        offset = self.sz_noisescatter*np.random.standard_normal(n)
 
-        offset_phi = np.random.uniform(0, 2*np.pi)
+        offset_phi = np.random.uniform(0, 2*np.pi, n)
 
         newoffsetx = offset*np.cos(offset_phi)
         newoffsety = offset*np.sin(offset_phi)
@@ -167,45 +195,42 @@ class SZAnalytic(object):
         return newoffsetx, newoffsety
 
 
-    
-####    
-
-
 
+####
 
-class XrayWTGOffset(object):
+class RadialOffsetDistro(CenterGenerator):
+    '''ABSTRACT. Radial offsets (in Mpc) resampled from self.offsets_mpc, with a random position angle.'''
 
-    def __init__(self):
+    def draw(self, n, zlens):
 
-        self.wtg_offsets_mpc = [x[0] for x in readtxtfile.readtxtfile(pkg_resources.resource_filename('nfwfitter', 'data/wtg_offsets.dat'))]
+        radial_offset_mpc = self.offsets_mpc[np.random.randint(0, len(self.offsets_mpc), n)]
+        radial_offset_arcmin = radial_offset_mpc*mpc2arcmin(zlens)
+        phi_offset = np.random.uniform(0, 2*np.pi, n)
+        centeroffsetx = radial_offset_arcmin*np.cos(phi_offset)
+        centeroffsety = radial_offset_arcmin*np.sin(phi_offset)
 
+        return centeroffsetx, centeroffsety
 
-    def __call__(self, sim):
+###
 
 
-        dL = nfwutils.global_cosmology.angulardist(sim.zlens)
+class XrayWTGOffset(RadialOffsetDistro):
 
-        radial_offset_mpc = self.wtg_offsets_mpc[np.random.randint(0, len(self.wtg_offsets_mpc), 1)]
-        radial_offset_arcmin = (radial_offset_mpc/(dL))*(180./np.pi)*60.
-        phi_offset = np.random.uniform(0, 2*np.pi)
-        centeroffsetx = radial_offset_arcmin*np.cos(phi_offset)
-        centeroffsety = radial_offset_arcmin*np.sin(phi_offset)
+    def __init__(self):
 
-        return centeroffsetx, centeroffsety
+        self.offsets_mpc = np.array([x[0] for x in readtxtfile.readtxtfile(pkg_resources.resource_filename('nfwfitter', 'data/wtg_offsets.dat'))])
 
 
 ###
 
-class XraySPTHSTOffset(object):
+class XraySPTHSTOffset(CenterGenerator):
 
-    def __call__(self, sim):
-
-        dL = nfwutils.global_cosmology.angulardist(sim.zlens)    
+    def draw(self, n, zlens):
 
         #offset distribution simple log delta r ~ N(mu, sig) fit to SPT-HST xray bcg offset distro (from Inon)
-        centeroffset_mpc = np.exp(-2.625 + 1.413*np.random.standard_normal())
-        offset_radial = (centeroffset_mpc/dL)*(180./np.pi)*60.
-        offset_phi = np.random.uniform(0, 2*np.pi)
+        centeroffset_mpc = np.exp(-2.625 + 1.413*np.random.standard_normal(n))
+        offset_radial = centeroffset_mpc*mpc2arcmin(zlens)
+        offset_phi = np.random.uniform(0, 2*np.pi, n)
 
         centeroffsetx = offset_radial*np.cos(offset_phi)
         centeroffsety = offset_radial*np.sin(offset_phi)
@@ -215,113 +240,67 @@ class XraySPTHSTOffset(object):
 ###
 
 
-class XrayXVPOffset(object):
+class XrayXVPOffset(RadialOffsetDistro):
 
     def __init__(self):
 
-        self.xvp_offsets_mpc = readtxtfile.readtxtfile(pkg_resources.resource_filename('nfwfitter', 'data/sptxvp_bcgxray'))[:,0]
-
-
-    def __call__(self, sim):
-
-
-        dL = nfwutils.global_cosmology.angulardist(sim.zlens)    
-
-
-        radial_offset_mpc = self.xvp_offsets_mpc[np.random.randint(0, len(self.xvp_offsets_mpc), 1)][0]
-        radial_offset_arcmin = (radial_offset_mpc/(dL))*(180./np.pi)*60.
-        phi_offset = np.random.uniform(0, 2*np.pi)
-        centeroffsetx = radial_offset_arcmin*np.cos(phi_offset)
-        centeroffsety = radial_offset_arcmin*np.sin(phi_offset)
-
-        return centeroffsetx, centeroffsety
+        self.offsets_mpc = readtxtfile.readtxtfile(pkg_resources.resource_filename('nfwfitter', 'data/sptxvp_bcgxray'))[:,0]
 
 
 ###
 
 
-class XrayCCCPOffset(object):
+class XrayCCCPOffset(RadialOffsetDistro):
 
     def __init__(self):
 
-        self.offsets_kpc = [x[0] for x in readtxtfile.readtxtfile(pkg_resources.resource_filename('nfwfitter', 'data/cccp_offsets.dat'))]
-
-    def __call__(self, sim):
-
-        dL = nfwutils.global_cosmology.angulardist(sim.zlens)    
-
-
-
-        radial_offset_kpc = self.offsets_kpc[np.random.randint(0, len(self.offsets_kpc), 1)]
-        radial_offset_arcmin = (radial_offset_kpc/(1000.*dL))*(180./np.pi)*60.
-        phi_offset = np.random.uniform(0, 2*np.pi)
-        centeroffsetx = radial_offset_arcmin*np.cos(phi_offset)
-        centeroffsety = radial_offset_arcmin*np.sin(phi_offset)
-
-        return centeroffsetx, centeroffsety
+        self.offsets_kpc = np.array([x[0] for x in readtxtfile.readtxtfile(pkg_resources.resource_filename('nfwfitter', 'data/cccp_offsets.dat'))])
+        self.offsets_mpc = self.offsets_kpc/1000.
 
 
 ###
 
 
-class XrayLensingPeakOffset(object):
+class XrayLensingPeakOffset(CenterGenerator):
 
-    def __call__(self, sim):
+    def draw(self, n, zlens):
 
-        dL = nfwutils.global_cosmology.angulardist(sim.zlens)    
+        delta_mpc = 0.107*np.random.standard_normal((n, 2))
 
-        delta_mpc = 0.107*np.random.standard_normal(2)
+        centeroffsets = delta_mpc*mpc2arcmin(zlens) #arcmin
 
-        centeroffsetx, centeroffsety = (delta_mpc/dL)*(180./np.pi)*60 #arcmin
-
-        return centeroffsetx, centeroffsety
+        return centeroffsets[:,0], centeroffsets[:,1]
 
 ###
 
-class XrayLensingPeakVoigtOffset(object):
+class XrayLensingPeakVoigtOffset(CenterGenerator):
 
-    def __call__(self, sim):
+    def __init__(self):
 
-        print 'Xray Lensing Peak Voigt'
+        self.voigtsampler = vt.VoigtSampler(0.048, 0.0565, limits=(-0.3, 0.3))
 
-        dL = nfwutils.global_cosmology.angulardist(sim.zlens)    
+    def draw(self, n, zlens):
 
-        delta_mpc = vt.voigtSamples(0.048, 0.0565, 2, limits=(-0.3, 0.3))
+        print 'Xray Lensing Peak Voigt'
 
-        centeroffsetx, centeroffsety = (delta_mpc/dL)*(180./np.pi)*60 #arcmin
+        delta_mpc = self.voigtsampler.draw(2*n).reshape((n, 2))
 
-        return centeroffsetx, centeroffsety
+        centeroffsets = delta_mpc*mpc2arcmin(zlens) #arcmin
+
+        return centeroffsets[:,0], centeroffsets[:,1]
 
 ###
 
 
 
-class XrayMagneticumOffset(object):
+class XrayMagneticumOffset(RadialOffsetDistro):
 
     def __init__(self):
 
         self.xray_magneticum_distro = asciireader.read(pkg_resources.resource_filename('nfwfitter', 'data/xray_offsets_may2016.txt'))
+        self.offsets_mpc = np.array(self.xray_magneticum_distro['xray_offset_kpc'], dtype=np.float64)/1000.
 
 
-    def __call__(self, sim):
-
-        dL = nfwutils.global_cosmology.angulardist(sim.zlens)    
 
-        delta_kpc = self.xray_magneticum_distro['xray_offset_kpc'][np.random.randint(0, len(self.xray_magneticum_distro), 1)][0]
-
-        radial_offset_arcmin = (delta_kpc/(1000*dL))*(180./np.pi)*60 #arcmin
-        phi_offset = np.random.uniform(0, 2*np.pi)
-
-        centeroffsetx = radial_offset_arcmin*np.cos(phi_offset)
-        centeroffsety = radial_offset_arcmin*np.sin(phi_offset)
-
-
-
-        return centeroffsetx, centeroffsety
-
-
-    
 
 ###
-
-
@@ -14,14 +14,15 @@
 import numpy as np
 cimport numpy as np
 cimport cython
+from cython.parallel cimport prange
 
 import scipy.stats
 
 
 cdef extern from "math.h":
-    double exp(double)
-    double log(double)
-    double sqrt(double)
+    double exp(double) nogil
+    double log(double) nogil
+    double sqrt(double) nogil
 
 cdef double sqrt2pi = sqrt(2*np.pi)
 cdef double twopi = 2*np.pi
@@ -113,3 +114,101 @@ def mcmcloglinearlike_mc(np.ndarray[np.double_t, ndim=2, mode='c'] ml_ints,
 
 
 ##############
+# Cached form of the mass-concentration likelihood.
+# Sample-only quantities (log c, and the -log(m) - log(c) jacobian of the two lognormals)
+# are computed once by precomputeMassConcentrationCache; each likelihood call is then
+# a log-sum-exp over samples, run in parallel over clusters when built with OpenMP (see setup.py).
+# The sum over clusters is then split between threads, so the result can change in the last
+# bits with the number of threads; it is not bit-reproducible across thread counts.
+##############
+
+def precomputeMassConcentrationCache(np.ndarray[np.double_t, ndim=2, mode='c'] ml_ints,
+                                     np.ndarray[np.double_t, ndim=2, mode='c'] cl_ints,
+                                     np.ndarray[np.int_t, ndim=1, mode='c'] ngoodsamples):
+    '''Returns (log_cls, lognorms), same shape as cl_ints. Unused sample slots are zero.'''
+
+    cdef Py_ssize_t nclusters = ml_ints.shape[0]
+    cdef Py_ssize_t i, nsamples
+
+    log_cls = np.zeros_like(cl_ints)
+    lognorms = np.zeros_like(ml_ints)
+
+    for i from 0 <= i < nclusters:
+        nsamples = ngoodsamples[i]
+        log_cls[i,:nsamples] = np.log(cl_ints[i,:nsamples])
+        lognorms[i,:nsamples] = -np.log(ml_ints[i,:nsamples]) - log_cls[i,:nsamples]
+
+    return log_cls, lognorms
+
+###
+
+@cython.cdivision(True)
+cdef inline double clusterlogprob(double * delta_logmls,
+                                  double * log_cls,
+                                  double * lognorms,
+                                  Py_ssize_t nsamples,
+                                  double logmu,
+                                  double invsigma,
+                                  double logmu_c,
+                                  double invsigma_c) nogil:
+
+    cdef Py_ssize_t j
+    cdef double x, xc, term
+    cdef double maxterm = -1e300
+    cdef double thesum = 0.
+
+    for j from 0 <= j < nsamples:
+        x = (delta_logmls[j] - logmu)*invsigma
+        xc = (log_cls[j] - logmu_c)*invsigma_c
+        term = lognorms[j] - 0.5*(x*x + xc*xc)
+        if term > maxterm:
+            maxterm = term
+
+    for j from 0 <= j < nsamples:
+        x = (delta_logmls[j] - logmu)*invsigma
+        xc = (log_cls[j] - logmu_c)*invsigma_c
+        thesum += exp(lognorms[j] - 0.5*(x*x + xc*xc) - maxterm)
+
+    return maxterm + log(thesum/nsamples)
+
+###
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def mcmcloglinearlike_mc_cached(np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
+                                np.ndarray[np.double_t, ndim=2, mode='c'] log_cls,
+                                np.ndarray[np.double_t, ndim=2, mode='c'] lognorms,
+                                np.ndarray[np.int_t, ndim=1, mode='c'] ngoodsamples,
+                                double logmu,
+                                double sigma,
+                                double logmu_c,
+                                double sigma_c):
+    '''Same likelihood as mcmcloglinearlike_mc, from precomputeMassConcentrationCache output.
+    Clusters without samples contribute nothing.'''
+
+    cdef Py_ssize_t nclusters = delta_logmls.shape[0]
+    cdef Py_ssize_t rowlength = delta_logmls.shape[1]
+    cdef Py_ssize_t i
+
+    cdef double * dlm_data = <double *> delta_logmls.data
+    cdef double * logc_data = <double *> log_cls.data
+    cdef double * norm_data = <double *> lognorms.data
+    cdef np.int_t * nsample_data = <np.int_t *> ngoodsamples.data
+
+    cdef double invsigma = 1./sigma
+    cdef double invsigma_c = 1./sigma_c
+    cdef double lognormalization = -log(twopi*sigma*sigma_c)
+
+    cdef double sumlogprob = 0.
+
+    with nogil:
+        for i in prange(nclusters, schedule='static'):
+            if nsample_data[i] > 0:
+                sumlogprob += lognormalization + clusterlogprob(dlm_data + i*rowlength,
+                                                                logc_data + i*rowlength,
+                                                                norm_data + i*rowlength,
+                                                                nsample_data[i],
+                                                                logmu, invsigma,
+                                                                logmu_c, invsigma_c)
+
+    return sumlogprob
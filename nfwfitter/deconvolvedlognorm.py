@@ -5,7 +5,7 @@
 
 
 
-import glob, cPickle, os, shutil, tempfile, pkg_resources
+import glob, cPickle, os, shutil, tempfile, pkg_resources, unittest
 import numpy as np
 import pymc
 import consolidate_fits
@@ -29,7 +29,9 @@ def MCMCReader(inputfile, halo, delta, truth, thin=1, cprior = None, burn=500):
     with open(inputfile, 'rb') as input:
         masschains = cPickle.load(input)
 
-    # Burns first 500 samples from the chains
+    # Burns first 500 samples from the chains, unless the fitter already picked a burn-in
+    if 'burn' in masschains[delta]:
+        burn = 0
     msamples = np.array(masschains[delta]['mdelta'][burn::thin])*nfwutils.global_cosmology.h
     csamples = np.array(masschains[delta]['cdelta'][burn::thin])
     
@@ -60,9 +62,9 @@ def PDFReader(pdffile, halo, delta, truth, model=None):
         pdfs = {200:pdfs}  #historical reasons. If it isn't a pdf, it was computed as 200.
 
     if delta in pdfs:
-        pdf = pdfs[delta]
+        pdf = nfwfit.expandPDF(pdfs[delta])
     else:
-        pdf = nfwfit.convertLikelihoodScan(model, delta, masses, pdfs[200], truth['redshift'])
+        pdf = nfwfit.convertLikelihoodScan(model, delta, masses, nfwfit.expandPDF(pdfs[200]), truth['redshift'])
 
     if np.any(np.logical_not(np.isfinite(pdf))):
         raise BadPDFException(filebase)
@@ -315,11 +317,14 @@ def buildGaussMixture1DModel(halos, ngauss, modeltype='ratio'):
 
     
 
+    #halo-only terms are fixed for the life of the chain; compute them once
+    evalpoints, evalindex, weightedpdfs = dlntools.precomputeGaussMix1D(delta_mls, delta_masses, pdfs)
+
     @pymc.observed
     def data(value = 0., 
-             delta_mls = delta_mls, 
-             delta_masses = delta_masses,
-             pdfs = pdfs,
+             evalpoints = evalpoints,
+             evalindex = evalindex,
+             weightedpdfs = weightedpdfs,
              piprior = piprior,
              xmus = xmus,
              xvars = xvars):
@@ -336,12 +341,12 @@ def buildGaussMixture1DModel(halos, ngauss, modeltype='ratio'):
 #                raise pymc.ZeroProbability
 #
 
-        return dlntools.pdfGaussMix1D(delta_mls = delta_mls,
-                                      delta_masses = delta_masses,
-                                      pdfs = pdfs,
-                                      pis = pis,
-                                      mus = xmus,
-                                      tau2 = xvars[:-1])
+        return dlntools.pdfGaussMix1D_cached(evalpoints = evalpoints,
+                                             evalindex = evalindex,
+                                             weightedpdfs = weightedpdfs,
+                                             pis = pis,
+                                             mus = xmus,
+                                             tau2 = xvars[:-1])
     parts['data'] = data
 
     return parts
@@ -381,20 +386,24 @@ def buildPDFModel(halos, sigmapriors = None):
 
     delta_logmls = np.zeros((nclusters, nmasses))
     pdfs = np.zeros((nclusters, nmasses))
+    supports = np.zeros((nclusters, 2), dtype=np.intp)  #[start, stop) of nonzero pdf
 
     for i in range(nclusters):
 
         delta_logmls[i,:] = np.log(posmasses) - np.log(halos[i]['true_mass'])
         rawpdf = halos[i]['pdf'][masses>0]
         pdfs[i,:] = rawpdf / scipy.integrate.trapz(rawpdf, posmasses)
-        if not (pdfs[i,:] > 0).any():
+        nonzero = np.nonzero(pdfs[i,:] > 0)[0]
+        if len(nonzero) == 0:
             print 'WARNING: Halo {} has zero probability'.format(halos[i]['id'])
+        else:
+            supports[i,:] = nonzero[0], nonzero[-1] + 1
 
     
 
     @pymc.observed
     def data(value = 0., ml_ints = posmasses, deltamasses = deltamasses,
-             delta_logmls = delta_logmls, pdfs = pdfs,
+             delta_logmls = delta_logmls, pdfs = pdfs, supports = supports,
              logmu = parts['logmu'], sigma = parts['sigma']):
 
         return dlntools.pdfloglinearlike(ml_ints = ml_ints,
@@ -402,7 +411,8 @@ def buildPDFModel(halos, sigmapriors = None):
                                           delta_logmls = delta_logmls,
                                           pdfs = pdfs,
                                           logmu = logmu,
-                                          sigma = sigma)
+                                          sigma = sigma,
+                                          supports = supports)
     parts['data'] = data
 
     return parts
@@ -416,37 +426,97 @@ def buildPDFModel(halos, sigmapriors = None):
 
 ########################
 
-def buildMCMCModel(halos, maxsamples = 2000):
+def buildSampleMatrices(halos, maxsamples = 2000, seed = None):
+    '''Random subsample of at most maxsamples positive mass (and concentration, if present) samples
+    per halo, padded into (nhalos x maxsamples) arrays. Pass a seed to make the subsample reproducible.
 
-    massnorm = 1e15
+    The returned dict can be given to the MCMC model builders in place of the halo list.'''
 
-    parts = {}
+    rng = np.random
+    if seed is not None:
+        rng = np.random.RandomState(seed)
 
-    parts['logmu'] = pymc.Uniform('logmu', -1., 1.)
-    parts['logsigma'] = pymc.Uniform('logsigma', np.log(1e-2), np.log(10))
+    nclusters = len(halos)
+    hasconcentrations = nclusters > 0 and 'concentration_samples' in halos[0]
 
-    @pymc.deterministic(trace=True)
-    def sigma(logsigma = parts['logsigma']):
-        return np.exp(logsigma)
-    
-    parts['sigma'] = sigma
+    samples = dict(ids = [halo['id'] for halo in halos],
+                   true_masses = np.array([halo['true_mass'] for halo in halos]),
+                   ml_ints = np.zeros((nclusters, maxsamples)),
+                   ngoodsamples = np.zeros(nclusters, dtype=np.int),
+                   maxsamples = maxsamples)
+    if hasconcentrations:
+        samples['cl_ints'] = np.zeros((nclusters, maxsamples))
 
-    nclusters = len(halos)
-    ml_ints = np.zeros((nclusters, maxsamples))
-    delta_logmls = np.zeros((nclusters, maxsamples))
-    ngoodsamples = np.zeros(nclusters, dtype=np.int)
     for i in range(nclusters):
         mass_samples = halos[i]['mass_samples']
         positive_samples = mass_samples[mass_samples > 0]
+
         navailablesamples = len(positive_samples)
         takesamples = min(navailablesamples, maxsamples)
+
         if navailablesamples < 25:
             print 'Need more samples: ', halos[i]['id'], navailablesamples
 
-        ml_ints[i,:takesamples] = np.random.permutation(positive_samples)[:takesamples]
-        delta_logmls[i,:takesamples] = np.log(ml_ints[i,:takesamples]) - np.log(halos[i]['true_mass'])
-        ngoodsamples[i] = takesamples
+        # Random downsampling
+        sample_indices = rng.permutation(navailablesamples)[:takesamples]
+
+        samples['ml_ints'][i,:takesamples] = positive_samples[sample_indices]
+        if hasconcentrations:
+            positive_samples_c = halos[i]['concentration_samples'][mass_samples > 0]
+            samples['cl_ints'][i,:takesamples] = positive_samples_c[sample_indices]
+
+        samples['ngoodsamples'][i] = takesamples
+
+    return samples
+
+###
+
+def sampleMatrices(halos, maxsamples):
+    '''halos is either a list of halo dicts or the output of buildSampleMatrices'''
+
+    if isinstance(halos, dict):
+        return halos
+
+    return buildSampleMatrices(halos, maxsamples)
 
+###
+
+def deltaLogMasses(samples):
+    '''log(ml) - log(true mass) for every used sample; zero in the padding'''
+
+    ml_ints = samples['ml_ints']
+    used = np.arange(ml_ints.shape[1]) < samples['ngoodsamples'][:,None]
+
+    delta_logmls = np.zeros_like(ml_ints)
+    rows = np.nonzero(used)[0]
+    delta_logmls[used] = np.log(ml_ints[used]) - np.log(samples['true_masses'][rows])
+
+    return delta_logmls
+
+###
+
+def buildMCMCModel(halos, maxsamples = 2000, sigmapriors = None):
+
+    if sigmapriors is not None :
+        raise NotImplementedError
+
+    massnorm = 1e15
+
+    parts = {}
+
+    parts['logmu'] = pymc.Uniform('logmu', -1., 1.)
+    parts['logsigma'] = pymc.Uniform('logsigma', np.log(1e-2), np.log(10))
+
+    @pymc.deterministic(trace=True)
+    def sigma(logsigma = parts['logsigma']):
+        return np.exp(logsigma)
+    
+    parts['sigma'] = sigma
+
+    samples = sampleMatrices(halos, maxsamples)
+    ml_ints = samples['ml_ints']
+    delta_logmls = deltaLogMasses(samples)
+    ngoodsamples = samples['ngoodsamples']
     
 
     @pymc.observed
@@ -580,11 +650,11 @@ def runFit(parts):
 #######################################
 
 def sample(parts, outputfile, samples, adaptevery = 100, adaptafter = 100, singlecore = False, tempoutputdir=None, init_with_MAP=True):
-    '''This function saves to disk the samples from the chain as they're drawn. '''
-    del_tempoutdir = False
-    if tempoutputdir is None :
-        tempoutputdir = tempfile.mkdtemp()
-        del_tempoutdir = True
+    '''This function saves to disk the samples from the chain as they're drawn. 
+    Chains run in a private temp dir (inside tempoutputdir, if given) and are copied to outputfile's dir.'''
+    if tempoutputdir is not None and not os.path.exists(tempoutputdir):
+        os.makedirs(tempoutputdir)
+    tempoutputdir = tempfile.mkdtemp(dir = tempoutputdir)
     outputdir, outputbase = os.path.split(outputfile)
 
     options = varcontainer.VarContainer()
@@ -593,12 +663,31 @@ def sample(parts, outputfile, samples, adaptevery = 100, adaptafter = 100, singl
     options.nsamples = samples
     options.adapt_every = adaptevery
     options.adapt_after = adaptafter
-    options.restore=True
 
     manager = varcontainer.VarContainer()
     manager.options = options
     manager.model = pymc.Model(parts)    
 
+    #resume from the checkpoint of an earlier, killed, run; keep outputdir up to date as we go.
+    #Chains without a checkpoint (eg finished by an older version) are started fresh.
+    resumed = 0
+    for checkpoint in glob.glob('%s.ckpt.*' % outputfile):
+        chain = '%s.chain.%s' % (outputfile, checkpoint.rsplit('.', 1)[-1])
+        if os.path.exists(chain):
+            for previous in [chain, checkpoint]:
+                shutil.copyfile(previous, '%s/%s' % (tempoutputdir, os.path.basename(previous)))
+            resumed += 1
+    options.restore = resumed > 0
+
+    def mirrorCheckpoint(filenames):
+        #chain first: a checkpoint may only point into a chain at least as long as itself
+        for filename in filenames:
+            handle, tmpname = tempfile.mkstemp(dir = outputdir or '.', suffix = '.tmp')
+            os.close(handle)
+            shutil.copyfile(filename, tmpname)
+            os.rename(tmpname, os.path.join(outputdir, os.path.basename(filename)))
+    manager.on_checkpoint = mirrorCheckpoint
+
     if init_with_MAP :
         model_map = pymc.MAP(parts)
         model_map.fit()
@@ -620,8 +709,7 @@ def sample(parts, outputfile, samples, adaptevery = 100, adaptafter = 100, singl
             if os.path.exists(destination_output):
                 os.remove(destination_output)
             shutil.copyfile(curoutputfile, destination_output)
-        if del_tempoutdir:
-            shutil.rmtree(tempoutputdir)
+        shutil.rmtree(tempoutputdir)
 
 
 
@@ -665,7 +753,8 @@ def buildMCMCModel_massconcentration(halos, maxsamples = 2000, sigmapriors = Non
     '''
     This now runs the MCMC to fit both mass and concentration
 
-    halos is a list of dictionaries corresponding to each halo
+    halos is a list of dictionaries corresponding to each halo,
+    or the output of buildSampleMatrices
     
     id 
     true_mass
@@ -701,51 +790,30 @@ def buildMCMCModel_massconcentration(halos, maxsamples = 2000, sigmapriors = Non
     parts['sigma'] = sigma
     parts['sigma_c'] = sigma_c
 
-    nclusters = len(halos)
-    ml_ints = np.zeros((nclusters, maxsamples))
-    delta_logmls = np.zeros((nclusters, maxsamples))
-    ngoodsamples = np.zeros(nclusters, dtype=np.int)
-
-    cl_ints = np.zeros((nclusters, maxsamples))
-    
-    for i in range(nclusters):
-        mass_samples = halos[i]['mass_samples']
-        concentration_samples = halos[i]['concentration_samples']
-        positive_samples = mass_samples[mass_samples > 0]
-        positive_samples_c = concentration_samples[mass_samples > 0] 
-
-        navailablesamples = len(positive_samples)
-        takesamples = min(navailablesamples, maxsamples)
-
-        if navailablesamples < 25:
-            print 'Need more samples: ', halos[i]['id'], navailablesamples
-
-        # Random downsampling
-        sample_indices = np.random.permutation(np.arange(navailablesamples))[:takesamples]
-
-        ml_ints[i,:takesamples] = positive_samples[sample_indices]
-        cl_ints[i,:takesamples] = positive_samples_c[sample_indices]
-
-        # Bias
-        delta_logmls[i,:takesamples] = np.log(ml_ints[i,:takesamples]) - np.log(halos[i]['true_mass'])
-        ngoodsamples[i] = takesamples
+    samples = sampleMatrices(halos, maxsamples)
+    ml_ints = samples['ml_ints']
+    cl_ints = samples['cl_ints']
+    delta_logmls = deltaLogMasses(samples)
+    ngoodsamples = samples['ngoodsamples']
 
-    
+    #sample-only terms are fixed for the life of the chain; compute them once
+    log_cls, lognorms = cfittools.precomputeMassConcentrationCache(ml_ints/massnorm, cl_ints, ngoodsamples)
 
     @pymc.observed
-    def data(value = 0., ml_ints = ml_ints/massnorm, delta_logmls = delta_logmls, ngoodsamples = ngoodsamples,
+    def data(value = 0., delta_logmls = delta_logmls, log_cls = log_cls, lognorms = lognorms,
+             ngoodsamples = ngoodsamples,
              logmu = parts['logmu'], sigma = parts['sigma'],
-             cl_ints = cl_ints, logmu_c = parts['logmu_c'], sigma_c = parts['sigma_c']
+             logmu_c = parts['logmu_c'], sigma_c = parts['sigma_c']
     ):
 
-        return cfittools.mcmcloglinearlike_mc(ml_ints = ml_ints,
-                                           delta_logmls = delta_logmls,
-                                           ngoodsamples = ngoodsamples,
-                                           logmu = logmu,
-                                           sigma = sigma,
-                                           cl_ints = cl_ints,
-                                           logmu_c = logmu_c,
-                                           sigma_c = sigma_c
+        return cfittools.mcmcloglinearlike_mc_cached(delta_logmls = delta_logmls,
+                                                     log_cls = log_cls,
+                                                     lognorms = lognorms,
+                                                     ngoodsamples = ngoodsamples,
+                                                     logmu = logmu,
+                                                     sigma = sigma,
+                                                     logmu_c = logmu_c,
+                                                     sigma_c = sigma_c
         )
     parts['data'] = data
 
@@ -804,5 +872,83 @@ def draw_samples(mu, sig, sigmeasured, num_samples_per_halo) :
     return true_lens_param, lens_param_i
 
 
-    
-    
+################################
+
+class TestPDFLikelihood(unittest.TestCase):
+
+    def setUp(self):
+
+        self.masses = np.arange(1e13, 3e15, 1e13)/1e15
+        self.deltamasses = self.masses[1:] - self.masses[:-1]
+        nsamples = len(self.masses)
+
+        true_masses = np.array([2e14, 5e14, 1e15])/1e15
+        self.delta_logmls = np.log(self.masses)[None,:] - np.log(true_masses)[:,None]
+
+        self.pdfs = np.zeros((3, nsamples))
+        self.supports = np.zeros((3, 2), dtype=np.intp)
+        for i, (start, stop) in enumerate([(5, 40), (0, 90), (200, nsamples)]):
+            self.pdfs[i,start:stop] = np.exp(-0.5*((self.masses[start:stop] - true_masses[i])/(0.3*true_masses[i]))**2)
+            self.supports[i,:] = start, stop
+
+    def testSupportMatchesFullGrid(self):
+
+        full = dlntools.pdfloglinearlike(self.masses, self.deltamasses, self.delta_logmls, self.pdfs, 0.05, 0.25)
+        limited = dlntools.pdfloglinearlike(self.masses, self.deltamasses, self.delta_logmls, self.pdfs, 0.05, 0.25,
+                                            supports = self.supports)
+
+        self.assertTrue(np.isfinite(full))
+        self.assertAlmostEqual(full, limited, places = 10)
+
+        for i in range(3):
+            self.assertAlmostEqual(dlntools.pdfintegral(self.masses, self.deltamasses, self.delta_logmls[i],
+                                                        self.pdfs[i], 0.05, 0.25),
+                                   dlntools.pdfintegral(self.masses, self.deltamasses, self.delta_logmls[i],
+                                                        self.pdfs[i], 0.05, 0.25,
+                                                        self.supports[i,0], self.supports[i,1]),
+                                   places = 12)
+
+    def testRejectsBadSupport(self):
+
+        nsamples = len(self.masses)
+        args = (self.masses, self.deltamasses, self.delta_logmls[0], self.pdfs[0], 0.1, 0.3)
+
+        self.assertRaises(ValueError, dlntools.pdfintegral, *(args + (0, 10**6)))
+        self.assertRaises(ValueError, dlntools.pdfintegral, *(args + (-1, 10)))
+        self.assertRaises(ValueError, dlntools.pdfintegral, *(args + (20, 10)))
+        self.assertEqual(dlntools.pdfintegral(*(args + (0, nsamples))), dlntools.pdfintegral(*args))
+
+        for start, stop in [(0, nsamples + 1), (-1, 10), (20, 10)]:
+            supports = self.supports.copy()
+            supports[1,:] = start, stop
+            self.assertRaises(ValueError, dlntools.pdfloglinearlike, self.masses, self.deltamasses,
+                              self.delta_logmls, self.pdfs, 0.05, 0.25, supports)
+
+        self.assertRaises(ValueError, dlntools.pdfloglinearlike, self.masses, self.deltamasses,
+                          self.delta_logmls, self.pdfs, 0.05, 0.25, self.supports[:2].copy())
+
+    def testRejectsBadShapes(self):
+
+        self.assertRaises(ValueError, dlntools.pdfintegral, self.masses, self.deltamasses[:10],
+                          self.delta_logmls[0], self.pdfs[0], 0.1, 0.3)
+        self.assertRaises(ValueError, dlntools.pdfintegral, self.masses, self.deltamasses,
+                          self.delta_logmls[0,:-1].copy(), self.pdfs[0], 0.1, 0.3)
+        self.assertRaises(ValueError, dlntools.pdfintegral, self.masses, self.deltamasses,
+                          self.delta_logmls[0], self.pdfs[0,:-1].copy(), 0.1, 0.3)
+        self.assertRaises(ValueError, dlntools.pdfloglinearlike, self.masses, self.deltamasses,
+                          self.delta_logmls[:2].copy(), self.pdfs, 0.05, 0.25)
+
+################################
+
+def test():
+
+    testcases = [TestPDFLikelihood]
+    suite = unittest.TestSuite(map(unittest.TestLoader().loadTestsFromTestCase,
+                                   testcases))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+################################
+
+if __name__ == '__main__':
+
+    test()
@@ -442,8 +442,8 @@ static CYTHON_INLINE float __PYX_NAN() {
   #endif
 #endif
 
-#define __PYX_HAVE__nfwfitter__deconvolvedlognormtools
-#define __PYX_HAVE_API__nfwfitter__deconvolvedlognormtools
+#define __PYX_HAVE__deconvolvedlognormtools
+#define __PYX_HAVE_API__deconvolvedlognormtools
 #include <string.h>
 #include <stdio.h>
 #include <stdlib.h>
@@ -1023,18 +1023,6 @@ typedef npy_cdouble __pyx_t_5numpy_complex_t;
 #define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
 #define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
 
-/* RaiseArgTupleInvalid.proto */
-static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
-    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
-
-/* RaiseDoubleKeywords.proto */
-static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
-
-/* ParseKeywords.proto */
-static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
-    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
-    const char* function_name);
-
 /* PyObjectGetAttrStr.proto */
 #if CYTHON_USE_TYPE_SLOTS
 static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
@@ -1054,6 +1042,18 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject
 /* GetBuiltinName.proto */
 static PyObject *__Pyx_GetBuiltinName(PyObject *name);
 
+/* RaiseArgTupleInvalid.proto */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
+
+/* RaiseDoubleKeywords.proto */
+static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
+
+/* ParseKeywords.proto */
+static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
+    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
+    const char* function_name);
+
 /* GetModuleGlobalName.proto */
 static CYTHON_INLINE PyObject *__Pyx_GetModuleGlobalName(PyObject *name);
 
@@ -1131,25 +1131,61 @@ static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject
 static CYTHON_INLINE int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
     const char *name, int exact);
 
-/* PyFloatBinop.proto */
+/* GetItemInt.proto */
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
+               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int is_list, int wraparound, int boundscheck);
+
+/* PyIntBinop.proto */
 #if !CYTHON_COMPILING_IN_PYPY
-static PyObject* __Pyx_PyFloat_SubtractCObj(PyObject *op1, PyObject *op2, double floatval, int inplace);
+static PyObject* __Pyx_PyInt_SubtractObjC(PyObject *op1, PyObject *op2, long intval, int inplace);
 #else
-#define __Pyx_PyFloat_SubtractCObj(op1, op2, floatval, inplace)\
+#define __Pyx_PyInt_SubtractObjC(op1, op2, intval, inplace)\
     (inplace ? PyNumber_InPlaceSubtract(op1, op2) : PyNumber_Subtract(op1, op2))
 #endif
 
-/* PyFloatBinop.proto */
-#if !CYTHON_COMPILING_IN_PYPY
-static PyObject* __Pyx_PyFloat_DivideCObj(PyObject *op1, PyObject *op2, double floatval, int inplace);
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
+/* BufferFallbackError.proto */
+static void __Pyx_RaiseBufferFallbackError(void);
+
+/* PyObjectCallNoArg.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
 #else
-#define __Pyx_PyFloat_DivideCObj(op1, op2, floatval, inplace)\
-    ((inplace ? __Pyx_PyNumber_InPlaceDivide(op1, op2) : __Pyx_PyNumber_Divide(op1, op2)))
-    #endif
+#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
+#endif
 
 #define __Pyx_BufPtrCContig2d(type, buf, i0, s0, i1, s1) ((type)((char*)buf + i0 * s0) + i1)
-/* RaiseException.proto */
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+/* RaiseTooManyValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
+
+/* RaiseNeedMoreValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
+
+/* IterFinish.proto */
+static CYTHON_INLINE int __Pyx_IterFinish(void);
+
+/* UnpackItemEndCheck.proto */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected);
 
 /* DictGetItem.proto */
 #if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
@@ -1172,12 +1208,6 @@ static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key) {
     #define __Pyx_PyDict_GetItem(d, key) PyObject_GetItem(d, key)
 #endif
 
-/* RaiseTooManyValuesToUnpack.proto */
-static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
-
-/* RaiseNeedMoreValuesToUnpack.proto */
-static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
-
 /* RaiseNoneIterError.proto */
 static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void);
 
@@ -1257,6 +1287,17 @@ typedef struct {
 static Py_ssize_t __Pyx_zeros[] = {0, 0, 0, 0, 0, 0, 0, 0};
 static Py_ssize_t __Pyx_minusones[] = {-1, -1, -1, -1, -1, -1, -1, -1};
 
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_Py_intptr_t(Py_intptr_t value);
+
+/* ForceInitThreads.proto */
+#ifndef __PYX_FORCE_INIT_THREADS
+  #define __PYX_FORCE_INIT_THREADS 0
+#endif
+
 /* RealImag.proto */
 #if CYTHON_CCOMPLEX
   #ifdef __cplusplus
@@ -1364,9 +1405,6 @@ static CYTHON_INLINE PyObject* __Pyx_PyInt_From_enum__NPY_TYPES(enum NPY_TYPES v
 /* CIntFromPy.proto */
 static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
 
-/* CIntToPy.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
-
 /* CIntFromPy.proto */
 static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
 
@@ -1423,13 +1461,17 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *, cha
 
 /* Module declarations from 'cython' */
 
-/* Module declarations from 'nfwfitter.deconvolvedlognormtools' */
+/* Module declarations from 'deconvolvedlognormtools' */
+static double __pyx_v_23deconvolvedlognormtools_sqrt2;
+static double __pyx_v_23deconvolvedlognormtools_sqrt2pi_c;
+static double __pyx_f_23deconvolvedlognormtools_pdfintegral_support(double *, double *, double *, double *, Py_ssize_t, Py_ssize_t, Py_ssize_t, double, double); /*proto*/
 static __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5numpy_double_t = { "double_t", NULL, sizeof(__pyx_t_5numpy_double_t), { 0 }, 0, 'R', 0, 0 };
 static __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5numpy_int_t = { "int_t", NULL, sizeof(__pyx_t_5numpy_int_t), { 0 }, 0, IS_UNSIGNED(__pyx_t_5numpy_int_t) ? 'U' : 'I', IS_UNSIGNED(__pyx_t_5numpy_int_t), 0 };
-#define __Pyx_MODULE_NAME "nfwfitter.deconvolvedlognormtools"
-int __pyx_module_is_main_nfwfitter__deconvolvedlognormtools = 0;
+static __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5numpy_intp_t = { "intp_t", NULL, sizeof(__pyx_t_5numpy_intp_t), { 0 }, 0, IS_UNSIGNED(__pyx_t_5numpy_intp_t) ? 'U' : 'I', IS_UNSIGNED(__pyx_t_5numpy_intp_t), 0 };
+#define __Pyx_MODULE_NAME "deconvolvedlognormtools"
+int __pyx_module_is_main_deconvolvedlognormtools = 0;
 
-/* Implementation of 'nfwfitter.deconvolvedlognormtools' */
+/* Implementation of 'deconvolvedlognormtools' */
 static PyObject *__pyx_builtin_ValueError;
 static PyObject *__pyx_builtin_range;
 static PyObject *__pyx_builtin_RuntimeError;
@@ -1437,30 +1479,34 @@ static PyObject *__pyx_builtin_ImportError;
 static const char __pyx_k_i[] = "i";
 static const char __pyx_k_j[] = "j";
 static const char __pyx_k_k[] = "k";
+static const char __pyx_k_x[] = "x";
+static const char __pyx_k_dx[] = "dx";
 static const char __pyx_k_np[] = "np";
 static const char __pyx_k_pi[] = "pi";
-static const char __pyx_k_cdf[] = "cdf";
+static const char __pyx_k_any[] = "any";
 static const char __pyx_k_inf[] = "inf";
 static const char __pyx_k_mus[] = "mus";
 static const char __pyx_k_pdf[] = "pdf";
 static const char __pyx_k_pis[] = "pis";
 static const char __pyx_k_tau[] = "tau";
+static const char __pyx_k_intp[] = "intp";
 static const char __pyx_k_main[] = "__main__";
 static const char __pyx_k_merr[] = "merr";
-static const char __pyx_k_norm[] = "norm";
 static const char __pyx_k_pdfs[] = "pdfs";
 static const char __pyx_k_prob[] = "prob";
+static const char __pyx_k_stop[] = "stop";
 static const char __pyx_k_tau2[] = "tau2";
 static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_dtype[] = "dtype";
 static const char __pyx_k_logmu[] = "logmu";
 static const char __pyx_k_mlens[] = "mlens";
 static const char __pyx_k_mtrue[] = "mtrue";
-static const char __pyx_k_norms[] = "norms";
 static const char __pyx_k_numpy[] = "numpy";
 static const char __pyx_k_range[] = "range";
 static const char __pyx_k_scipy[] = "scipy";
+static const char __pyx_k_shape[] = "shape";
 static const char __pyx_k_sigma[] = "sigma";
-static const char __pyx_k_stats[] = "stats";
+static const char __pyx_k_start[] = "start";
 static const char __pyx_k_twopi[] = "twopi";
 static const char __pyx_k_zeros[] = "zeros";
 static const char __pyx_k_import[] = "__import__";
@@ -1469,18 +1515,27 @@ static const char __pyx_k_ngauss[] = "ngauss";
 static const char __pyx_k_random[] = "random";
 static const char __pyx_k_sigma2[] = "sigma2";
 static const char __pyx_k_thesum[] = "thesum";
+static const char __pyx_k_unique[] = "unique";
+static const char __pyx_k_ml_data[] = "ml_data";
 static const char __pyx_k_ml_ints[] = "ml_ints";
 static const char __pyx_k_nmasses[] = "nmasses";
+static const char __pyx_k_npoints[] = "npoints";
+static const char __pyx_k_reshape[] = "reshape";
 static const char __pyx_k_sqrt2pi[] = "sqrt2pi";
+static const char __pyx_k_weights[] = "weights";
+static const char __pyx_k_dlm_data[] = "dlm_data";
 static const char __pyx_k_integral[] = "integral";
 static const char __pyx_k_logmtrue[] = "logmtrue";
 static const char __pyx_k_normpart[] = "normpart";
 static const char __pyx_k_nsamples[] = "nsamples";
+static const char __pyx_k_pdf_data[] = "pdf_data";
+static const char __pyx_k_supports[] = "supports";
 static const char __pyx_k_delta_mls[] = "delta_mls";
-static const char __pyx_k_gausseval[] = "gausseval";
-static const char __pyx_k_integrand[] = "integrand";
+static const char __pyx_k_evalindex[] = "evalindex";
 static const char __pyx_k_nclusters[] = "nclusters";
 static const char __pyx_k_ValueError[] = "ValueError";
+static const char __pyx_k_amplitudes[] = "amplitudes";
+static const char __pyx_k_evalpoints[] = "evalpoints";
 static const char __pyx_k_neg2sigma2[] = "neg2sigma2";
 static const char __pyx_k_sumlogprob[] = "sumlogprob";
 static const char __pyx_k_ImportError[] = "ImportError";
@@ -1491,31 +1546,48 @@ static const char __pyx_k_outlierprob[] = "outlierprob";
 static const char __pyx_k_pdfintegral[] = "pdfintegral";
 static const char __pyx_k_scipy_stats[] = "scipy.stats";
 static const char __pyx_k_RuntimeError[] = "RuntimeError";
+static const char __pyx_k_checkSupport[] = "checkSupport";
 static const char __pyx_k_delta_logmls[] = "delta_logmls";
 static const char __pyx_k_delta_masses[] = "delta_masses";
 static const char __pyx_k_fracoutliers[] = "fracoutliers";
+static const char __pyx_k_intrinsicpdf[] = "intrinsicpdf";
 static const char __pyx_k_ngoodsamples[] = "ngoodsamples";
 static const char __pyx_k_sigmasqrt2pi[] = "sigmasqrt2pi";
-static const char __pyx_k_deltamass_mu2[] = "deltamass_mu2";
+static const char __pyx_k_weightedpdfs[] = "weightedpdfs";
 static const char __pyx_k_loglinearlike[] = "loglinearlike";
 static const char __pyx_k_pdfGaussMix1D[] = "pdfGaussMix1D";
+static const char __pyx_k_checkPDFShapes[] = "checkPDFShapes";
+static const char __pyx_k_deltamass_data[] = "deltamass_data";
+static const char __pyx_k_neghalfinvtau2[] = "neghalfinvtau2";
 static const char __pyx_k_randomdeviates[] = "randomdeviates";
+static const char __pyx_k_return_inverse[] = "return_inverse";
 static const char __pyx_k_outlier_ml_ints[] = "outlier_ml_ints";
 static const char __pyx_k_standard_normal[] = "standard_normal";
 static const char __pyx_k_zeroboundrenorm[] = "zeroboundrenorm";
 static const char __pyx_k_pdfloglinearlike[] = "pdfloglinearlike";
+static const char __pyx_k_trapezoidWeights[] = "trapezoidWeights";
+static const char __pyx_k_ascontiguousarray[] = "ascontiguousarray";
 static const char __pyx_k_mcmcloglinearlike[] = "mcmcloglinearlike";
 static const char __pyx_k_outlier_delta_logmls[] = "outlier_delta_logmls";
 static const char __pyx_k_outlierloglinearlike[] = "outlierloglinearlike";
+static const char __pyx_k_pdfGaussMix1D_cached[] = "pdfGaussMix1D_cached";
+static const char __pyx_k_precomputeGaussMix1D[] = "precomputeGaussMix1D";
+static const char __pyx_k_deconvolvedlognormtools[] = "deconvolvedlognormtools";
 static const char __pyx_k_ndarray_is_not_C_contiguous[] = "ndarray is not C contiguous";
+static const char __pyx_k_pdf_has_d_masses_grid_has_d[] = "pdf has %d masses, grid has %d";
+static const char __pyx_k_supports_should_be_d_2_is_d_d[] = "supports should be (%d, 2), is (%d, %d)";
 static const char __pyx_k_home_avestruz_codes_clmassmod_n[] = "/home/avestruz/codes/clmassmod/nfwfitter/deconvolvedlognormtools.pyx";
 static const char __pyx_k_numpy_core_multiarray_failed_to[] = "numpy.core.multiarray failed to import";
+static const char __pyx_k_support_d_d_outside_of_the_mass[] = "support [%d, %d) outside of the mass grid [0, %d)";
 static const char __pyx_k_unknown_dtype_code_in_numpy_pxd[] = "unknown dtype code in numpy.pxd (%d)";
 static const char __pyx_k_Format_string_allocated_too_shor[] = "Format string allocated too short, see comment in numpy.pxd";
 static const char __pyx_k_Non_native_byte_order_not_suppor[] = "Non-native byte order not supported";
+static const char __pyx_k_delta_logmls_and_pdfs_have_diffe[] = "delta_logmls and pdfs have different numbers of clusters (%d, %d)";
+static const char __pyx_k_delta_logmls_has_d_masses_grid_h[] = "delta_logmls has %d masses, grid has %d";
+static const char __pyx_k_deltamasses_needs_at_least_d_ent[] = "deltamasses needs at least %d entries, has %d";
 static const char __pyx_k_ndarray_is_not_Fortran_contiguou[] = "ndarray is not Fortran contiguous";
-static const char __pyx_k_nfwfitter_deconvolvedlognormtool[] = "nfwfitter.deconvolvedlognormtools";
 static const char __pyx_k_numpy_core_umath_failed_to_impor[] = "numpy.core.umath failed to import";
+static const char __pyx_k_supports_must_satisfy_0_start_st[] = "supports must satisfy 0 <= start <= stop <= %d";
 static const char __pyx_k_Format_string_allocated_too_shor_2[] = "Format string allocated too short.";
 static PyObject *__pyx_kp_u_Format_string_allocated_too_shor;
 static PyObject *__pyx_kp_u_Format_string_allocated_too_shor_2;
@@ -1524,20 +1596,33 @@ static PyObject *__pyx_kp_u_Non_native_byte_order_not_suppor;
 static PyObject *__pyx_n_s_RuntimeError;
 static PyObject *__pyx_n_s_ValueError;
 static PyObject *__pyx_n_s_altintegral;
-static PyObject *__pyx_n_s_cdf;
+static PyObject *__pyx_n_s_amplitudes;
+static PyObject *__pyx_n_s_any;
+static PyObject *__pyx_n_s_ascontiguousarray;
+static PyObject *__pyx_n_s_checkPDFShapes;
+static PyObject *__pyx_n_s_checkSupport;
+static PyObject *__pyx_n_s_deconvolvedlognormtools;
 static PyObject *__pyx_n_s_delta_logmls;
+static PyObject *__pyx_kp_s_delta_logmls_and_pdfs_have_diffe;
+static PyObject *__pyx_kp_s_delta_logmls_has_d_masses_grid_h;
 static PyObject *__pyx_n_s_delta_masses;
 static PyObject *__pyx_n_s_delta_mls;
-static PyObject *__pyx_n_s_deltamass_mu2;
+static PyObject *__pyx_n_s_deltamass_data;
 static PyObject *__pyx_n_s_deltamasses;
+static PyObject *__pyx_kp_s_deltamasses_needs_at_least_d_ent;
+static PyObject *__pyx_n_s_dlm_data;
+static PyObject *__pyx_n_s_dtype;
+static PyObject *__pyx_n_s_dx;
+static PyObject *__pyx_n_s_evalindex;
+static PyObject *__pyx_n_s_evalpoints;
 static PyObject *__pyx_n_s_fracoutliers;
-static PyObject *__pyx_n_s_gausseval;
 static PyObject *__pyx_kp_s_home_avestruz_codes_clmassmod_n;
 static PyObject *__pyx_n_s_i;
 static PyObject *__pyx_n_s_import;
 static PyObject *__pyx_n_s_inf;
 static PyObject *__pyx_n_s_integral;
-static PyObject *__pyx_n_s_integrand;
+static PyObject *__pyx_n_s_intp;
+static PyObject *__pyx_n_s_intrinsicpdf;
 static PyObject *__pyx_n_s_j;
 static PyObject *__pyx_n_s_k;
 static PyObject *__pyx_n_s_loglinearlike;
@@ -1547,6 +1632,7 @@ static PyObject *__pyx_n_s_lognormpart;
 static PyObject *__pyx_n_s_main;
 static PyObject *__pyx_n_s_mcmcloglinearlike;
 static PyObject *__pyx_n_s_merr;
+static PyObject *__pyx_n_s_ml_data;
 static PyObject *__pyx_n_s_ml_int;
 static PyObject *__pyx_n_s_ml_ints;
 static PyObject *__pyx_n_s_mlens;
@@ -1556,14 +1642,13 @@ static PyObject *__pyx_n_s_nclusters;
 static PyObject *__pyx_kp_u_ndarray_is_not_C_contiguous;
 static PyObject *__pyx_kp_u_ndarray_is_not_Fortran_contiguou;
 static PyObject *__pyx_n_s_neg2sigma2;
-static PyObject *__pyx_n_s_nfwfitter_deconvolvedlognormtool;
+static PyObject *__pyx_n_s_neghalfinvtau2;
 static PyObject *__pyx_n_s_ngauss;
 static PyObject *__pyx_n_s_ngoodsamples;
 static PyObject *__pyx_n_s_nmasses;
-static PyObject *__pyx_n_s_norm;
 static PyObject *__pyx_n_s_normpart;
-static PyObject *__pyx_n_s_norms;
 static PyObject *__pyx_n_s_np;
+static PyObject *__pyx_n_s_npoints;
 static PyObject *__pyx_n_s_nsamples;
 static PyObject *__pyx_n_s_numpy;
 static PyObject *__pyx_kp_s_numpy_core_multiarray_failed_to;
@@ -1574,81 +1659,129 @@ static PyObject *__pyx_n_s_outlierloglinearlike;
 static PyObject *__pyx_n_s_outlierprob;
 static PyObject *__pyx_n_s_pdf;
 static PyObject *__pyx_n_s_pdfGaussMix1D;
+static PyObject *__pyx_n_s_pdfGaussMix1D_cached;
+static PyObject *__pyx_n_s_pdf_data;
+static PyObject *__pyx_kp_s_pdf_has_d_masses_grid_has_d;
 static PyObject *__pyx_n_s_pdfintegral;
 static PyObject *__pyx_n_s_pdfloglinearlike;
 static PyObject *__pyx_n_s_pdfs;
 static PyObject *__pyx_n_s_pi;
 static PyObject *__pyx_n_s_pis;
+static PyObject *__pyx_n_s_precomputeGaussMix1D;
 static PyObject *__pyx_n_s_prob;
 static PyObject *__pyx_n_s_random;
 static PyObject *__pyx_n_s_randomdeviates;
 static PyObject *__pyx_n_s_range;
+static PyObject *__pyx_n_s_reshape;
+static PyObject *__pyx_n_s_return_inverse;
 static PyObject *__pyx_n_s_scipy;
 static PyObject *__pyx_n_s_scipy_stats;
+static PyObject *__pyx_n_s_shape;
 static PyObject *__pyx_n_s_sigma;
 static PyObject *__pyx_n_s_sigma2;
 static PyObject *__pyx_n_s_sigmasqrt2pi;
 static PyObject *__pyx_n_s_sqrt2pi;
 static PyObject *__pyx_n_s_standard_normal;
-static PyObject *__pyx_n_s_stats;
+static PyObject *__pyx_n_s_start;
+static PyObject *__pyx_n_s_stop;
 static PyObject *__pyx_n_s_sumlogprob;
+static PyObject *__pyx_kp_s_support_d_d_outside_of_the_mass;
+static PyObject *__pyx_n_s_supports;
+static PyObject *__pyx_kp_s_supports_must_satisfy_0_start_st;
+static PyObject *__pyx_kp_s_supports_should_be_d_2_is_d_d;
 static PyObject *__pyx_n_s_tau;
 static PyObject *__pyx_n_s_tau2;
 static PyObject *__pyx_n_s_test;
 static PyObject *__pyx_n_s_thesum;
+static PyObject *__pyx_n_s_trapezoidWeights;
 static PyObject *__pyx_n_s_twopi;
+static PyObject *__pyx_n_s_unique;
 static PyObject *__pyx_kp_u_unknown_dtype_code_in_numpy_pxd;
+static PyObject *__pyx_n_s_weightedpdfs;
+static PyObject *__pyx_n_s_weights;
+static PyObject *__pyx_n_s_x;
 static PyObject *__pyx_n_s_zeroboundrenorm;
 static PyObject *__pyx_n_s_zeros;
-static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_integral(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_mlens, double __pyx_v_merr, double __pyx_v_mtrue, double __pyx_v_logmu, double __pyx_v_sigma); /* proto */
-static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_2altintegral(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_ml_ints, PyArrayObject *__pyx_v_delta_logmls, double __pyx_v_logmu, double __pyx_v_sigma); /* proto */
-static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_4pdfintegral(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_ml_ints, PyArrayObject *__pyx_v_deltamasses, PyArrayObject *__pyx_v_delta_logmls, PyArrayObject *__pyx_v_pdf, double __pyx_v_logmu, double __pyx_v_sigma); /* proto */
-static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_6loglinearlike(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_ml_ints, PyArrayObject *__pyx_v_delta_logmls, double __pyx_v_logmu, double __pyx_v_sigma); /* proto */
-static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_8mcmcloglinearlike(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_ml_ints, PyArrayObject *__pyx_v_delta_logmls, PyArrayObject *__pyx_v_ngoodsamples, double __pyx_v_logmu, double __pyx_v_sigma); /* proto */
-static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_10pdfloglinearlike(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_ml_ints, PyArrayObject *__pyx_v_deltamasses, PyArrayObject *__pyx_v_delta_logmls, PyArrayObject *__pyx_v_pdfs, double __pyx_v_logmu, double __pyx_v_sigma); /* proto */
-static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_12outlierloglinearlike(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_ml_ints, PyArrayObject *__pyx_v_delta_logmls, PyArrayObject *__pyx_v_outlier_ml_ints, CYTHON_UNUSED PyArrayObject *__pyx_v_outlier_delta_logmls, double __pyx_v_logmu, double __pyx_v_sigma, double __pyx_v_fracoutliers); /* proto */
-static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_14pdfGaussMix1D(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_delta_mls, PyArrayObject *__pyx_v_delta_masses, PyArrayObject *__pyx_v_pdfs, PyArrayObject *__pyx_v_pis, PyArrayObject *__pyx_v_mus, PyArrayObject *__pyx_v_tau2); /* proto */
+static PyObject *__pyx_pf_23deconvolvedlognormtools_integral(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_mlens, double __pyx_v_merr, double __pyx_v_mtrue, double __pyx_v_logmu, double __pyx_v_sigma); /* proto */
+static PyObject *__pyx_pf_23deconvolvedlognormtools_2altintegral(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_ml_ints, PyArrayObject *__pyx_v_delta_logmls, double __pyx_v_logmu, double __pyx_v_sigma); /* proto */
+static PyObject *__pyx_pf_23deconvolvedlognormtools_4checkPDFShapes(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ml_ints, PyObject *__pyx_v_deltamasses, PyObject *__pyx_v_delta_logmls, PyObject *__pyx_v_pdf); /* proto */
+static PyObject *__pyx_pf_23deconvolvedlognormtools_6checkSupport(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_start, PyObject *__pyx_v_stop, PyObject *__pyx_v_nsamples); /* proto */
+static PyObject *__pyx_pf_23deconvolvedlognormtools_8pdfintegral(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_ml_ints, PyArrayObject *__pyx_v_deltamasses, PyArrayObject *__pyx_v_delta_logmls, PyArrayObject *__pyx_v_pdf, double __pyx_v_logmu, double __pyx_v_sigma, Py_ssize_t __pyx_v_start, Py_ssize_t __pyx_v_stop); /* proto */
+static PyObject *__pyx_pf_23deconvolvedlognormtools_10loglinearlike(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_ml_ints, PyArrayObject *__pyx_v_delta_logmls, double __pyx_v_logmu, double __pyx_v_sigma); /* proto */
+static PyObject *__pyx_pf_23deconvolvedlognormtools_12mcmcloglinearlike(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_ml_ints, PyArrayObject *__pyx_v_delta_logmls, PyArrayObject *__pyx_v_ngoodsamples, double __pyx_v_logmu, double __pyx_v_sigma); /* proto */
+static PyObject *__pyx_pf_23deconvolvedlognormtools_14pdfloglinearlike(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_ml_ints, PyArrayObject *__pyx_v_deltamasses, PyArrayObject *__pyx_v_delta_logmls, PyArrayObject *__pyx_v_pdfs, double __pyx_v_logmu, double __pyx_v_sigma, PyArrayObject *__pyx_v_supports); /* proto */
+static PyObject *__pyx_pf_23deconvolvedlognormtools_16outlierloglinearlike(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_ml_ints, PyArrayObject *__pyx_v_delta_logmls, PyArrayObject *__pyx_v_outlier_ml_ints, CYTHON_UNUSED PyArrayObject *__pyx_v_outlier_delta_logmls, double __pyx_v_logmu, double __pyx_v_sigma, double __pyx_v_fracoutliers); /* proto */
+static PyObject *__pyx_pf_23deconvolvedlognormtools_18trapezoidWeights(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_delta_masses); /* proto */
+static PyObject *__pyx_pf_23deconvolvedlognormtools_20precomputeGaussMix1D(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_delta_mls, PyArrayObject *__pyx_v_delta_masses, PyArrayObject *__pyx_v_pdfs); /* proto */
+static PyObject *__pyx_pf_23deconvolvedlognormtools_22pdfGaussMix1D_cached(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_evalpoints, PyArrayObject *__pyx_v_evalindex, PyArrayObject *__pyx_v_weightedpdfs, PyArrayObject *__pyx_v_pis, PyArrayObject *__pyx_v_mus, PyArrayObject *__pyx_v_tau2); /* proto */
+static PyObject *__pyx_pf_23deconvolvedlognormtools_24pdfGaussMix1D(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_delta_mls, PyArrayObject *__pyx_v_delta_masses, PyArrayObject *__pyx_v_pdfs, PyArrayObject *__pyx_v_pis, PyArrayObject *__pyx_v_mus, PyArrayObject *__pyx_v_tau2); /* proto */
 static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /* proto */
 static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info); /* proto */
 static PyObject *__pyx_float_0_;
-static PyObject *__pyx_float_1_;
 static PyObject *__pyx_float_0_5;
+static PyObject *__pyx_int_0;
+static PyObject *__pyx_int_1;
 static PyObject *__pyx_int_2;
+static PyObject *__pyx_int_neg_1;
 static PyObject *__pyx_slice_;
 static PyObject *__pyx_slice__2;
 static PyObject *__pyx_slice__3;
-static PyObject *__pyx_slice__4;
 static PyObject *__pyx_slice__5;
-static PyObject *__pyx_slice__6;
 static PyObject *__pyx_slice__7;
-static PyObject *__pyx_slice__8;
-static PyObject *__pyx_tuple__9;
+static PyObject *__pyx_slice__9;
+static PyObject *__pyx_tuple__4;
+static PyObject *__pyx_tuple__6;
+static PyObject *__pyx_tuple__8;
+static PyObject *__pyx_slice__11;
+static PyObject *__pyx_slice__13;
+static PyObject *__pyx_slice__14;
+static PyObject *__pyx_slice__15;
+static PyObject *__pyx_slice__16;
+static PyObject *__pyx_slice__17;
+static PyObject *__pyx_slice__18;
+static PyObject *__pyx_slice__20;
+static PyObject *__pyx_slice__21;
 static PyObject *__pyx_tuple__10;
-static PyObject *__pyx_tuple__11;
 static PyObject *__pyx_tuple__12;
-static PyObject *__pyx_tuple__13;
-static PyObject *__pyx_tuple__14;
-static PyObject *__pyx_tuple__15;
-static PyObject *__pyx_tuple__16;
-static PyObject *__pyx_tuple__17;
-static PyObject *__pyx_tuple__18;
-static PyObject *__pyx_tuple__20;
+static PyObject *__pyx_tuple__19;
 static PyObject *__pyx_tuple__22;
+static PyObject *__pyx_tuple__23;
 static PyObject *__pyx_tuple__24;
+static PyObject *__pyx_tuple__25;
 static PyObject *__pyx_tuple__26;
+static PyObject *__pyx_tuple__27;
 static PyObject *__pyx_tuple__28;
+static PyObject *__pyx_tuple__29;
 static PyObject *__pyx_tuple__30;
+static PyObject *__pyx_tuple__31;
 static PyObject *__pyx_tuple__32;
-static PyObject *__pyx_codeobj__19;
-static PyObject *__pyx_codeobj__21;
-static PyObject *__pyx_codeobj__23;
-static PyObject *__pyx_codeobj__25;
-static PyObject *__pyx_codeobj__27;
-static PyObject *__pyx_codeobj__29;
-static PyObject *__pyx_codeobj__31;
+static PyObject *__pyx_tuple__34;
+static PyObject *__pyx_tuple__36;
+static PyObject *__pyx_tuple__38;
+static PyObject *__pyx_tuple__40;
+static PyObject *__pyx_tuple__42;
+static PyObject *__pyx_tuple__44;
+static PyObject *__pyx_tuple__46;
+static PyObject *__pyx_tuple__48;
+static PyObject *__pyx_tuple__50;
+static PyObject *__pyx_tuple__52;
+static PyObject *__pyx_tuple__54;
+static PyObject *__pyx_tuple__56;
 static PyObject *__pyx_codeobj__33;
-
-/* "nfwfitter/deconvolvedlognormtools.pyx":37
+static PyObject *__pyx_codeobj__35;
+static PyObject *__pyx_codeobj__37;
+static PyObject *__pyx_codeobj__39;
+static PyObject *__pyx_codeobj__41;
+static PyObject *__pyx_codeobj__43;
+static PyObject *__pyx_codeobj__45;
+static PyObject *__pyx_codeobj__47;
+static PyObject *__pyx_codeobj__49;
+static PyObject *__pyx_codeobj__51;
+static PyObject *__pyx_codeobj__53;
+static PyObject *__pyx_codeobj__55;
+static PyObject *__pyx_codeobj__57;
+
+/* "deconvolvedlognormtools.pyx":41
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def integral(double mlens,             # <<<<<<<<<<<<<<
@@ -1657,9 +1790,9 @@ static PyObject *__pyx_codeobj__33;
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_1integral(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_9nfwfitter_23deconvolvedlognormtools_1integral = {"integral", (PyCFunction)__pyx_pw_9nfwfitter_23deconvolvedlognormtools_1integral, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_1integral(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_23deconvolvedlognormtools_1integral(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_23deconvolvedlognormtools_1integral = {"integral", (PyCFunction)__pyx_pw_23deconvolvedlognormtools_1integral, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_23deconvolvedlognormtools_1integral(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   double __pyx_v_mlens;
   double __pyx_v_merr;
   double __pyx_v_mtrue;
@@ -1691,26 +1824,26 @@ static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_1integral(PyObjec
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_merr)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("integral", 1, 5, 5, 1); __PYX_ERR(0, 37, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("integral", 1, 5, 5, 1); __PYX_ERR(0, 41, __pyx_L3_error)
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_mtrue)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("integral", 1, 5, 5, 2); __PYX_ERR(0, 37, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("integral", 1, 5, 5, 2); __PYX_ERR(0, 41, __pyx_L3_error)
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_logmu)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("integral", 1, 5, 5, 3); __PYX_ERR(0, 37, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("integral", 1, 5, 5, 3); __PYX_ERR(0, 41, __pyx_L3_error)
         }
         case  4:
         if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sigma)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("integral", 1, 5, 5, 4); __PYX_ERR(0, 37, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("integral", 1, 5, 5, 4); __PYX_ERR(0, 41, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "integral") < 0)) __PYX_ERR(0, 37, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "integral") < 0)) __PYX_ERR(0, 41, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 5) {
       goto __pyx_L5_argtuple_error;
@@ -1721,28 +1854,28 @@ static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_1integral(PyObjec
       values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
       values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
     }
-    __pyx_v_mlens = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_mlens == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 37, __pyx_L3_error)
-    __pyx_v_merr = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_merr == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 38, __pyx_L3_error)
-    __pyx_v_mtrue = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_mtrue == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 39, __pyx_L3_error)
-    __pyx_v_logmu = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_logmu == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 40, __pyx_L3_error)
-    __pyx_v_sigma = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_sigma == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 41, __pyx_L3_error)
+    __pyx_v_mlens = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_mlens == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 41, __pyx_L3_error)
+    __pyx_v_merr = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_merr == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 42, __pyx_L3_error)
+    __pyx_v_mtrue = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_mtrue == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 43, __pyx_L3_error)
+    __pyx_v_logmu = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_logmu == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 44, __pyx_L3_error)
+    __pyx_v_sigma = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_sigma == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 45, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("integral", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 37, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("integral", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 41, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("nfwfitter.deconvolvedlognormtools.integral", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("deconvolvedlognormtools.integral", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9nfwfitter_23deconvolvedlognormtools_integral(__pyx_self, __pyx_v_mlens, __pyx_v_merr, __pyx_v_mtrue, __pyx_v_logmu, __pyx_v_sigma);
+  __pyx_r = __pyx_pf_23deconvolvedlognormtools_integral(__pyx_self, __pyx_v_mlens, __pyx_v_merr, __pyx_v_mtrue, __pyx_v_logmu, __pyx_v_sigma);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_integral(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_mlens, double __pyx_v_merr, double __pyx_v_mtrue, double __pyx_v_logmu, double __pyx_v_sigma) {
+static PyObject *__pyx_pf_23deconvolvedlognormtools_integral(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_mlens, double __pyx_v_merr, double __pyx_v_mtrue, double __pyx_v_logmu, double __pyx_v_sigma) {
   Py_ssize_t __pyx_v_i;
   Py_ssize_t __pyx_v_nsamples;
   PyArrayObject *__pyx_v_randomdeviates = 0;
@@ -1769,7 +1902,7 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_integral(CYTHON_U
   __pyx_pybuffernd_randomdeviates.data = NULL;
   __pyx_pybuffernd_randomdeviates.rcbuffer = &__pyx_pybuffer_randomdeviates;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":44
+  /* "deconvolvedlognormtools.pyx":48
  * 
  *     cdef Py_ssize_t i, nsamples
  *     nsamples = 50             # <<<<<<<<<<<<<<
@@ -1778,22 +1911,22 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_integral(CYTHON_U
  */
   __pyx_v_nsamples = 50;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":46
+  /* "deconvolvedlognormtools.pyx":50
  *     nsamples = 50
  * 
  *     cdef np.ndarray[np.double_t, ndim=1, mode='c'] randomdeviates = np.random.standard_normal(nsamples)             # <<<<<<<<<<<<<<
  * 
  *     cdef double thesum, logmtrue, ml_int, normpart
  */
-  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 46, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 50, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_random); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 46, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_random); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 50, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_standard_normal); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 46, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_standard_normal); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 50, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_nsamples); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 46, __pyx_L1_error)
+  __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_nsamples); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 50, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_4 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -1806,14 +1939,14 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_integral(CYTHON_U
     }
   }
   if (!__pyx_t_4) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 46, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 50, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_GOTREF(__pyx_t_1);
   } else {
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_2)) {
       PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_3};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 46, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 50, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -1822,32 +1955,32 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_integral(CYTHON_U
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
       PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_3};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 46, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 50, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     } else
     #endif
     {
-      __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 46, __pyx_L1_error)
+      __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 50, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4); __pyx_t_4 = NULL;
       __Pyx_GIVEREF(__pyx_t_3);
       PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_t_3);
       __pyx_t_3 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 46, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 50, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     }
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 46, __pyx_L1_error)
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 50, __pyx_L1_error)
   __pyx_t_6 = ((PyArrayObject *)__pyx_t_1);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_randomdeviates.rcbuffer->pybuffer, (PyObject*)__pyx_t_6, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_randomdeviates = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_randomdeviates.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 46, __pyx_L1_error)
+      __PYX_ERR(0, 50, __pyx_L1_error)
     } else {__pyx_pybuffernd_randomdeviates.diminfo[0].strides = __pyx_pybuffernd_randomdeviates.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_randomdeviates.diminfo[0].shape = __pyx_pybuffernd_randomdeviates.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -1855,7 +1988,7 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_integral(CYTHON_U
   __pyx_v_randomdeviates = ((PyArrayObject *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":49
+  /* "deconvolvedlognormtools.pyx":53
  * 
  *     cdef double thesum, logmtrue, ml_int, normpart
  *     logmtrue = log(mtrue)             # <<<<<<<<<<<<<<
@@ -1864,7 +1997,7 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_integral(CYTHON_U
  */
   __pyx_v_logmtrue = log(__pyx_v_mtrue);
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":50
+  /* "deconvolvedlognormtools.pyx":54
  *     cdef double thesum, logmtrue, ml_int, normpart
  *     logmtrue = log(mtrue)
  *     thesum = 0.             # <<<<<<<<<<<<<<
@@ -1873,7 +2006,7 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_integral(CYTHON_U
  */
   __pyx_v_thesum = 0.;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":52
+  /* "deconvolvedlognormtools.pyx":56
  *     thesum = 0.
  * 
  *     for i from nsamples > i >= 0:             # <<<<<<<<<<<<<<
@@ -1882,7 +2015,7 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_integral(CYTHON_U
  */
   for (__pyx_v_i = __pyx_v_nsamples-1; __pyx_v_i >= 0; __pyx_v_i--) {
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":54
+    /* "deconvolvedlognormtools.pyx":58
  *     for i from nsamples > i >= 0:
  * 
  *         ml_int = exp(logmu + logmtrue + sigma*randomdeviates[i])             # <<<<<<<<<<<<<<
@@ -1892,7 +2025,7 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_integral(CYTHON_U
     __pyx_t_7 = __pyx_v_i;
     __pyx_v_ml_int = exp(((__pyx_v_logmu + __pyx_v_logmtrue) + (__pyx_v_sigma * (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_randomdeviates.rcbuffer->pybuffer.buf, __pyx_t_7, __pyx_pybuffernd_randomdeviates.diminfo[0].strides)))));
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":56
+    /* "deconvolvedlognormtools.pyx":60
  *         ml_int = exp(logmu + logmtrue + sigma*randomdeviates[i])
  * 
  *         normpart = exp(-0.5*(ml_int-mlens)**2/merr**2)/(sqrt2pi*merr)             # <<<<<<<<<<<<<<
@@ -1903,27 +2036,27 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_integral(CYTHON_U
     __pyx_t_9 = pow(__pyx_v_merr, 2.0);
     if (unlikely(__pyx_t_9 == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 56, __pyx_L1_error)
+      __PYX_ERR(0, 60, __pyx_L1_error)
     }
-    __pyx_t_1 = PyFloat_FromDouble(exp((__pyx_t_8 / __pyx_t_9))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 56, __pyx_L1_error)
+    __pyx_t_1 = PyFloat_FromDouble(exp((__pyx_t_8 / __pyx_t_9))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 60, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_sqrt2pi); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 56, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_sqrt2pi); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 60, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_5 = PyFloat_FromDouble(__pyx_v_merr); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 56, __pyx_L1_error)
+    __pyx_t_5 = PyFloat_FromDouble(__pyx_v_merr); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 60, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_3 = PyNumber_Multiply(__pyx_t_2, __pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 56, __pyx_L1_error)
+    __pyx_t_3 = PyNumber_Multiply(__pyx_t_2, __pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 60, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_5 = __Pyx_PyNumber_Divide(__pyx_t_1, __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 56, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyNumber_Divide(__pyx_t_1, __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 60, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_9 = __pyx_PyFloat_AsDouble(__pyx_t_5); if (unlikely((__pyx_t_9 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 56, __pyx_L1_error)
+    __pyx_t_9 = __pyx_PyFloat_AsDouble(__pyx_t_5); if (unlikely((__pyx_t_9 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 60, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __pyx_v_normpart = __pyx_t_9;
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":59
+    /* "deconvolvedlognormtools.pyx":63
  * 
  * 
  *         thesum += normpart             # <<<<<<<<<<<<<<
@@ -1933,7 +2066,7 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_integral(CYTHON_U
     __pyx_v_thesum = (__pyx_v_thesum + __pyx_v_normpart);
   }
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":61
+  /* "deconvolvedlognormtools.pyx":65
  *         thesum += normpart
  * 
  *     thesum = thesum / nsamples             # <<<<<<<<<<<<<<
@@ -1942,11 +2075,11 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_integral(CYTHON_U
  */
   if (unlikely(__pyx_v_nsamples == 0)) {
     PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-    __PYX_ERR(0, 61, __pyx_L1_error)
+    __PYX_ERR(0, 65, __pyx_L1_error)
   }
   __pyx_v_thesum = (__pyx_v_thesum / __pyx_v_nsamples);
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":63
+  /* "deconvolvedlognormtools.pyx":67
  *     thesum = thesum / nsamples
  * 
  *     return thesum             # <<<<<<<<<<<<<<
@@ -1954,13 +2087,13 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_integral(CYTHON_U
  * @cython.boundscheck(False)
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_thesum); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_thesum); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 67, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __pyx_r = __pyx_t_5;
   __pyx_t_5 = 0;
   goto __pyx_L0;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":37
+  /* "deconvolvedlognormtools.pyx":41
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def integral(double mlens,             # <<<<<<<<<<<<<<
@@ -1981,7 +2114,7 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_integral(CYTHON_U
     __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_randomdeviates.rcbuffer->pybuffer);
   __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("nfwfitter.deconvolvedlognormtools.integral", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("deconvolvedlognormtools.integral", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   goto __pyx_L2;
   __pyx_L0:;
@@ -1993,7 +2126,7 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_integral(CYTHON_U
   return __pyx_r;
 }
 
-/* "nfwfitter/deconvolvedlognormtools.pyx":67
+/* "deconvolvedlognormtools.pyx":71
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def altintegral(np.ndarray[np.double_t, ndim=1, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
@@ -2002,9 +2135,9 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_integral(CYTHON_U
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_3altintegral(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_9nfwfitter_23deconvolvedlognormtools_3altintegral = {"altintegral", (PyCFunction)__pyx_pw_9nfwfitter_23deconvolvedlognormtools_3altintegral, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_3altintegral(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_23deconvolvedlognormtools_3altintegral(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_23deconvolvedlognormtools_3altintegral = {"altintegral", (PyCFunction)__pyx_pw_23deconvolvedlognormtools_3altintegral, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_23deconvolvedlognormtools_3altintegral(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyArrayObject *__pyx_v_ml_ints = 0;
   PyArrayObject *__pyx_v_delta_logmls = 0;
   double __pyx_v_logmu;
@@ -2034,21 +2167,21 @@ static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_3altintegral(PyOb
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_delta_logmls)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("altintegral", 1, 4, 4, 1); __PYX_ERR(0, 67, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("altintegral", 1, 4, 4, 1); __PYX_ERR(0, 71, __pyx_L3_error)
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_logmu)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("altintegral", 1, 4, 4, 2); __PYX_ERR(0, 67, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("altintegral", 1, 4, 4, 2); __PYX_ERR(0, 71, __pyx_L3_error)
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sigma)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("altintegral", 1, 4, 4, 3); __PYX_ERR(0, 67, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("altintegral", 1, 4, 4, 3); __PYX_ERR(0, 71, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "altintegral") < 0)) __PYX_ERR(0, 67, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "altintegral") < 0)) __PYX_ERR(0, 71, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
       goto __pyx_L5_argtuple_error;
@@ -2060,20 +2193,20 @@ static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_3altintegral(PyOb
     }
     __pyx_v_ml_ints = ((PyArrayObject *)values[0]);
     __pyx_v_delta_logmls = ((PyArrayObject *)values[1]);
-    __pyx_v_logmu = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_logmu == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 69, __pyx_L3_error)
-    __pyx_v_sigma = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_sigma == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 70, __pyx_L3_error)
+    __pyx_v_logmu = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_logmu == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 73, __pyx_L3_error)
+    __pyx_v_sigma = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_sigma == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 74, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("altintegral", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 67, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("altintegral", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 71, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("nfwfitter.deconvolvedlognormtools.altintegral", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("deconvolvedlognormtools.altintegral", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_ml_ints), __pyx_ptype_5numpy_ndarray, 1, "ml_ints", 0))) __PYX_ERR(0, 67, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_delta_logmls), __pyx_ptype_5numpy_ndarray, 1, "delta_logmls", 0))) __PYX_ERR(0, 68, __pyx_L1_error)
-  __pyx_r = __pyx_pf_9nfwfitter_23deconvolvedlognormtools_2altintegral(__pyx_self, __pyx_v_ml_ints, __pyx_v_delta_logmls, __pyx_v_logmu, __pyx_v_sigma);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_ml_ints), __pyx_ptype_5numpy_ndarray, 1, "ml_ints", 0))) __PYX_ERR(0, 71, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_delta_logmls), __pyx_ptype_5numpy_ndarray, 1, "delta_logmls", 0))) __PYX_ERR(0, 72, __pyx_L1_error)
+  __pyx_r = __pyx_pf_23deconvolvedlognormtools_2altintegral(__pyx_self, __pyx_v_ml_ints, __pyx_v_delta_logmls, __pyx_v_logmu, __pyx_v_sigma);
 
   /* function exit code */
   goto __pyx_L0;
@@ -2084,7 +2217,7 @@ static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_3altintegral(PyOb
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_2altintegral(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_ml_ints, PyArrayObject *__pyx_v_delta_logmls, double __pyx_v_logmu, double __pyx_v_sigma) {
+static PyObject *__pyx_pf_23deconvolvedlognormtools_2altintegral(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_ml_ints, PyArrayObject *__pyx_v_delta_logmls, double __pyx_v_logmu, double __pyx_v_sigma) {
   Py_ssize_t __pyx_v_i;
   Py_ssize_t __pyx_v_nsamples;
   double __pyx_v_thesum;
@@ -2115,16 +2248,16 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_2altintegral(CYTH
   __pyx_pybuffernd_delta_logmls.rcbuffer = &__pyx_pybuffer_delta_logmls;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer, (PyObject*)__pyx_v_ml_ints, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 67, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer, (PyObject*)__pyx_v_ml_ints, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 71, __pyx_L1_error)
   }
   __pyx_pybuffernd_ml_ints.diminfo[0].strides = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_ml_ints.diminfo[0].shape = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer, (PyObject*)__pyx_v_delta_logmls, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 67, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer, (PyObject*)__pyx_v_delta_logmls, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 71, __pyx_L1_error)
   }
   __pyx_pybuffernd_delta_logmls.diminfo[0].strides = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_delta_logmls.diminfo[0].shape = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.shape[0];
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":73
+  /* "deconvolvedlognormtools.pyx":77
  * 
  *     cdef Py_ssize_t i, nsamples
  *     nsamples = ml_ints.shape[0]             # <<<<<<<<<<<<<<
@@ -2133,7 +2266,7 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_2altintegral(CYTH
  */
   __pyx_v_nsamples = (__pyx_v_ml_ints->dimensions[0]);
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":76
+  /* "deconvolvedlognormtools.pyx":80
  * 
  *     cdef double thesum, lognormpart
  *     thesum = 0.             # <<<<<<<<<<<<<<
@@ -2142,7 +2275,7 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_2altintegral(CYTH
  */
   __pyx_v_thesum = 0.;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":79
+  /* "deconvolvedlognormtools.pyx":83
  * 
  *     cdef double sigma2, sigmasqrt2pi
  *     neg2sigma2 = -2*(sigma**2)             # <<<<<<<<<<<<<<
@@ -2151,26 +2284,26 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_2altintegral(CYTH
  */
   __pyx_v_neg2sigma2 = (-2.0 * pow(__pyx_v_sigma, 2.0));
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":80
+  /* "deconvolvedlognormtools.pyx":84
  *     cdef double sigma2, sigmasqrt2pi
  *     neg2sigma2 = -2*(sigma**2)
  *     sigmasqrt2pi = sigma*sqrt2pi             # <<<<<<<<<<<<<<
  * 
  *     for i from nsamples > i >= 0:
  */
-  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_sigma); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 80, __pyx_L1_error)
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_sigma); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 84, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_sqrt2pi); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 80, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_sqrt2pi); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 84, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyNumber_Multiply(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 80, __pyx_L1_error)
+  __pyx_t_3 = PyNumber_Multiply(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 84, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_4 = __pyx_PyFloat_AsDouble(__pyx_t_3); if (unlikely((__pyx_t_4 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 80, __pyx_L1_error)
+  __pyx_t_4 = __pyx_PyFloat_AsDouble(__pyx_t_3); if (unlikely((__pyx_t_4 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 84, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_v_sigmasqrt2pi = __pyx_t_4;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":82
+  /* "deconvolvedlognormtools.pyx":86
  *     sigmasqrt2pi = sigma*sqrt2pi
  * 
  *     for i from nsamples > i >= 0:             # <<<<<<<<<<<<<<
@@ -2179,7 +2312,7 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_2altintegral(CYTH
  */
   for (__pyx_v_i = __pyx_v_nsamples-1; __pyx_v_i >= 0; __pyx_v_i--) {
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":84
+    /* "deconvolvedlognormtools.pyx":88
  *     for i from nsamples > i >= 0:
  * 
  *         lognormpart = exp((delta_logmls[i]-logmu)**2/neg2sigma2)/(sigmasqrt2pi*ml_ints[i])             # <<<<<<<<<<<<<<
@@ -2190,18 +2323,18 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_2altintegral(CYTH
     __pyx_t_6 = pow(((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.buf, __pyx_t_5, __pyx_pybuffernd_delta_logmls.diminfo[0].strides)) - __pyx_v_logmu), 2.0);
     if (unlikely(__pyx_v_neg2sigma2 == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 84, __pyx_L1_error)
+      __PYX_ERR(0, 88, __pyx_L1_error)
     }
     __pyx_t_4 = exp((__pyx_t_6 / __pyx_v_neg2sigma2));
     __pyx_t_7 = __pyx_v_i;
     __pyx_t_6 = (__pyx_v_sigmasqrt2pi * (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.buf, __pyx_t_7, __pyx_pybuffernd_ml_ints.diminfo[0].strides)));
     if (unlikely(__pyx_t_6 == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 84, __pyx_L1_error)
+      __PYX_ERR(0, 88, __pyx_L1_error)
     }
     __pyx_v_lognormpart = (__pyx_t_4 / __pyx_t_6);
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":86
+    /* "deconvolvedlognormtools.pyx":90
  *         lognormpart = exp((delta_logmls[i]-logmu)**2/neg2sigma2)/(sigmasqrt2pi*ml_ints[i])
  * 
  *         thesum += lognormpart             # <<<<<<<<<<<<<<
@@ -2211,7 +2344,7 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_2altintegral(CYTH
     __pyx_v_thesum = (__pyx_v_thesum + __pyx_v_lognormpart);
   }
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":88
+  /* "deconvolvedlognormtools.pyx":92
  *         thesum += lognormpart
  * 
  *     thesum = thesum / nsamples             # <<<<<<<<<<<<<<
@@ -2220,11 +2353,11 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_2altintegral(CYTH
  */
   if (unlikely(__pyx_v_nsamples == 0)) {
     PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-    __PYX_ERR(0, 88, __pyx_L1_error)
+    __PYX_ERR(0, 92, __pyx_L1_error)
   }
   __pyx_v_thesum = (__pyx_v_thesum / __pyx_v_nsamples);
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":90
+  /* "deconvolvedlognormtools.pyx":94
  *     thesum = thesum / nsamples
  * 
  *     return thesum             # <<<<<<<<<<<<<<
@@ -2232,13 +2365,13 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_2altintegral(CYTH
  * #########
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_thesum); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 90, __pyx_L1_error)
+  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_thesum); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 94, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_r = __pyx_t_3;
   __pyx_t_3 = 0;
   goto __pyx_L0;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":67
+  /* "deconvolvedlognormtools.pyx":71
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def altintegral(np.ndarray[np.double_t, ndim=1, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
@@ -2258,7 +2391,7 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_2altintegral(CYTH
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer);
   __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("nfwfitter.deconvolvedlognormtools.altintegral", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("deconvolvedlognormtools.altintegral", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   goto __pyx_L2;
   __pyx_L0:;
@@ -2270,36 +2403,247 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_2altintegral(CYTH
   return __pyx_r;
 }
 
-/* "nfwfitter/deconvolvedlognormtools.pyx":96
- * @cython.boundscheck(False)
+/* "deconvolvedlognormtools.pyx":101
  * @cython.wraparound(False)
- * def pdfintegral(np.ndarray[np.double_t, ndim=1, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
- *                 np.ndarray[np.double_t, ndim=1, mode='c'] deltamasses,
- *                 np.ndarray[np.double_t, ndim=1, mode='c'] delta_logmls,
+ * @cython.cdivision(True)
+ * cdef double pdfintegral_support(double * ml_ints,             # <<<<<<<<<<<<<<
+ *                                 double * deltamasses,
+ *                                 double * delta_logmls,
+ */
+
+static double __pyx_f_23deconvolvedlognormtools_pdfintegral_support(double *__pyx_v_ml_ints, double *__pyx_v_deltamasses, double *__pyx_v_delta_logmls, double *__pyx_v_pdf, Py_ssize_t __pyx_v_nsamples, Py_ssize_t __pyx_v_start, Py_ssize_t __pyx_v_stop, double __pyx_v_logmu, double __pyx_v_sigma) {
+  Py_ssize_t __pyx_v_i;
+  double __pyx_v_thesum;
+  double __pyx_v_neg2sigma2;
+  double __pyx_v_sigmasqrt2pi;
+  double __pyx_v_integrand;
+  double __pyx_v_previntegrand;
+  double __pyx_r;
+  int __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+
+  /* "deconvolvedlognormtools.pyx":114
+ * 
+ *     cdef Py_ssize_t i, first, last
+ *     cdef double thesum = 0.             # <<<<<<<<<<<<<<
+ *     cdef double neg2sigma2 = -2*(sigma**2)
+ *     cdef double sigmasqrt2pi = sigma*sqrt2pi_c
+ */
+  __pyx_v_thesum = 0.;
+
+  /* "deconvolvedlognormtools.pyx":115
+ *     cdef Py_ssize_t i, first, last
+ *     cdef double thesum = 0.
+ *     cdef double neg2sigma2 = -2*(sigma**2)             # <<<<<<<<<<<<<<
+ *     cdef double sigmasqrt2pi = sigma*sqrt2pi_c
+ *     cdef double integrand, previntegrand
+ */
+  __pyx_v_neg2sigma2 = (-2.0 * pow(__pyx_v_sigma, 2.0));
+
+  /* "deconvolvedlognormtools.pyx":116
+ *     cdef double thesum = 0.
+ *     cdef double neg2sigma2 = -2*(sigma**2)
+ *     cdef double sigmasqrt2pi = sigma*sqrt2pi_c             # <<<<<<<<<<<<<<
+ *     cdef double integrand, previntegrand
+ * 
+ */
+  __pyx_v_sigmasqrt2pi = (__pyx_v_sigma * __pyx_v_23deconvolvedlognormtools_sqrt2pi_c);
+
+  /* "deconvolvedlognormtools.pyx":119
+ *     cdef double integrand, previntegrand
+ * 
+ *     if stop <= start:             # <<<<<<<<<<<<<<
+ *         return 0.
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_stop <= __pyx_v_start) != 0);
+  if (__pyx_t_1) {
+
+    /* "deconvolvedlognormtools.pyx":120
+ * 
+ *     if stop <= start:
+ *         return 0.             # <<<<<<<<<<<<<<
+ * 
+ *     integrand = exp((delta_logmls[start]-logmu)**2/neg2sigma2)/(sigmasqrt2pi*ml_ints[start])*pdf[start]
+ */
+    __pyx_r = 0.;
+    goto __pyx_L0;
+
+    /* "deconvolvedlognormtools.pyx":119
+ *     cdef double integrand, previntegrand
+ * 
+ *     if stop <= start:             # <<<<<<<<<<<<<<
+ *         return 0.
+ * 
+ */
+  }
+
+  /* "deconvolvedlognormtools.pyx":122
+ *         return 0.
+ * 
+ *     integrand = exp((delta_logmls[start]-logmu)**2/neg2sigma2)/(sigmasqrt2pi*ml_ints[start])*pdf[start]             # <<<<<<<<<<<<<<
+ * 
+ *     if start == 0:
+ */
+  __pyx_v_integrand = ((exp((pow(((__pyx_v_delta_logmls[__pyx_v_start]) - __pyx_v_logmu), 2.0) / __pyx_v_neg2sigma2)) / (__pyx_v_sigmasqrt2pi * (__pyx_v_ml_ints[__pyx_v_start]))) * (__pyx_v_pdf[__pyx_v_start]));
+
+  /* "deconvolvedlognormtools.pyx":124
+ *     integrand = exp((delta_logmls[start]-logmu)**2/neg2sigma2)/(sigmasqrt2pi*ml_ints[start])*pdf[start]
+ * 
+ *     if start == 0:             # <<<<<<<<<<<<<<
+ *         thesum += 0.5*ml_ints[0]*integrand  #ml_ints[0] is deltamasses[-1]; integrand @ ml=0 is 0
+ *     else:
+ */
+  __pyx_t_1 = ((__pyx_v_start == 0) != 0);
+  if (__pyx_t_1) {
+
+    /* "deconvolvedlognormtools.pyx":125
+ * 
+ *     if start == 0:
+ *         thesum += 0.5*ml_ints[0]*integrand  #ml_ints[0] is deltamasses[-1]; integrand @ ml=0 is 0             # <<<<<<<<<<<<<<
+ *     else:
+ *         thesum += 0.5*deltamasses[start-1]*integrand  #left neighbour is outside the support
+ */
+    __pyx_v_thesum = (__pyx_v_thesum + ((0.5 * (__pyx_v_ml_ints[0])) * __pyx_v_integrand));
+
+    /* "deconvolvedlognormtools.pyx":124
+ *     integrand = exp((delta_logmls[start]-logmu)**2/neg2sigma2)/(sigmasqrt2pi*ml_ints[start])*pdf[start]
+ * 
+ *     if start == 0:             # <<<<<<<<<<<<<<
+ *         thesum += 0.5*ml_ints[0]*integrand  #ml_ints[0] is deltamasses[-1]; integrand @ ml=0 is 0
+ *     else:
+ */
+    goto __pyx_L4;
+  }
+
+  /* "deconvolvedlognormtools.pyx":127
+ *         thesum += 0.5*ml_ints[0]*integrand  #ml_ints[0] is deltamasses[-1]; integrand @ ml=0 is 0
+ *     else:
+ *         thesum += 0.5*deltamasses[start-1]*integrand  #left neighbour is outside the support             # <<<<<<<<<<<<<<
+ * 
+ *     for i from start+1 <= i < stop:
+ */
+  /*else*/ {
+    __pyx_v_thesum = (__pyx_v_thesum + ((0.5 * (__pyx_v_deltamasses[(__pyx_v_start - 1)])) * __pyx_v_integrand));
+  }
+  __pyx_L4:;
+
+  /* "deconvolvedlognormtools.pyx":129
+ *         thesum += 0.5*deltamasses[start-1]*integrand  #left neighbour is outside the support
+ * 
+ *     for i from start+1 <= i < stop:             # <<<<<<<<<<<<<<
+ * 
+ *         previntegrand = integrand
+ */
+  __pyx_t_2 = __pyx_v_stop;
+  for (__pyx_v_i = (__pyx_v_start + 1); __pyx_v_i < __pyx_t_2; __pyx_v_i++) {
+
+    /* "deconvolvedlognormtools.pyx":131
+ *     for i from start+1 <= i < stop:
+ * 
+ *         previntegrand = integrand             # <<<<<<<<<<<<<<
+ *         integrand = exp((delta_logmls[i]-logmu)**2/neg2sigma2)/(sigmasqrt2pi*ml_ints[i])*pdf[i]
+ * 
+ */
+    __pyx_v_previntegrand = __pyx_v_integrand;
+
+    /* "deconvolvedlognormtools.pyx":132
+ * 
+ *         previntegrand = integrand
+ *         integrand = exp((delta_logmls[i]-logmu)**2/neg2sigma2)/(sigmasqrt2pi*ml_ints[i])*pdf[i]             # <<<<<<<<<<<<<<
+ * 
+ *         thesum += 0.5*deltamasses[i-1]*(integrand + previntegrand)
+ */
+    __pyx_v_integrand = ((exp((pow(((__pyx_v_delta_logmls[__pyx_v_i]) - __pyx_v_logmu), 2.0) / __pyx_v_neg2sigma2)) / (__pyx_v_sigmasqrt2pi * (__pyx_v_ml_ints[__pyx_v_i]))) * (__pyx_v_pdf[__pyx_v_i]));
+
+    /* "deconvolvedlognormtools.pyx":134
+ *         integrand = exp((delta_logmls[i]-logmu)**2/neg2sigma2)/(sigmasqrt2pi*ml_ints[i])*pdf[i]
+ * 
+ *         thesum += 0.5*deltamasses[i-1]*(integrand + previntegrand)             # <<<<<<<<<<<<<<
+ * 
+ *     if stop < nsamples:
+ */
+    __pyx_v_thesum = (__pyx_v_thesum + ((0.5 * (__pyx_v_deltamasses[(__pyx_v_i - 1)])) * (__pyx_v_integrand + __pyx_v_previntegrand)));
+  }
+
+  /* "deconvolvedlognormtools.pyx":136
+ *         thesum += 0.5*deltamasses[i-1]*(integrand + previntegrand)
+ * 
+ *     if stop < nsamples:             # <<<<<<<<<<<<<<
+ *         thesum += 0.5*deltamasses[stop-1]*integrand
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_stop < __pyx_v_nsamples) != 0);
+  if (__pyx_t_1) {
+
+    /* "deconvolvedlognormtools.pyx":137
+ * 
+ *     if stop < nsamples:
+ *         thesum += 0.5*deltamasses[stop-1]*integrand             # <<<<<<<<<<<<<<
+ * 
+ *     return thesum
+ */
+    __pyx_v_thesum = (__pyx_v_thesum + ((0.5 * (__pyx_v_deltamasses[(__pyx_v_stop - 1)])) * __pyx_v_integrand));
+
+    /* "deconvolvedlognormtools.pyx":136
+ *         thesum += 0.5*deltamasses[i-1]*(integrand + previntegrand)
+ * 
+ *     if stop < nsamples:             # <<<<<<<<<<<<<<
+ *         thesum += 0.5*deltamasses[stop-1]*integrand
+ * 
+ */
+  }
+
+  /* "deconvolvedlognormtools.pyx":139
+ *         thesum += 0.5*deltamasses[stop-1]*integrand
+ * 
+ *     return thesum             # <<<<<<<<<<<<<<
+ * 
+ * ###
+ */
+  __pyx_r = __pyx_v_thesum;
+  goto __pyx_L0;
+
+  /* "deconvolvedlognormtools.pyx":101
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * cdef double pdfintegral_support(double * ml_ints,             # <<<<<<<<<<<<<<
+ *                                 double * deltamasses,
+ *                                 double * delta_logmls,
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "deconvolvedlognormtools.pyx":143
+ * ###
+ * 
+ * def checkPDFShapes(ml_ints, deltamasses, delta_logmls, pdf):             # <<<<<<<<<<<<<<
+ *     '''The pdf integrals read these unchecked; make sure they fit the mass grid'''
+ * 
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_5pdfintegral(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_9nfwfitter_23deconvolvedlognormtools_5pdfintegral = {"pdfintegral", (PyCFunction)__pyx_pw_9nfwfitter_23deconvolvedlognormtools_5pdfintegral, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_5pdfintegral(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyArrayObject *__pyx_v_ml_ints = 0;
-  PyArrayObject *__pyx_v_deltamasses = 0;
-  PyArrayObject *__pyx_v_delta_logmls = 0;
-  PyArrayObject *__pyx_v_pdf = 0;
-  double __pyx_v_logmu;
-  double __pyx_v_sigma;
+static PyObject *__pyx_pw_23deconvolvedlognormtools_5checkPDFShapes(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_23deconvolvedlognormtools_4checkPDFShapes[] = "The pdf integrals read these unchecked; make sure they fit the mass grid";
+static PyMethodDef __pyx_mdef_23deconvolvedlognormtools_5checkPDFShapes = {"checkPDFShapes", (PyCFunction)__pyx_pw_23deconvolvedlognormtools_5checkPDFShapes, METH_VARARGS|METH_KEYWORDS, __pyx_doc_23deconvolvedlognormtools_4checkPDFShapes};
+static PyObject *__pyx_pw_23deconvolvedlognormtools_5checkPDFShapes(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_ml_ints = 0;
+  PyObject *__pyx_v_deltamasses = 0;
+  PyObject *__pyx_v_delta_logmls = 0;
+  PyObject *__pyx_v_pdf = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("pdfintegral (wrapper)", 0);
+  __Pyx_RefNannySetupContext("checkPDFShapes (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_ml_ints,&__pyx_n_s_deltamasses,&__pyx_n_s_delta_logmls,&__pyx_n_s_pdf,&__pyx_n_s_logmu,&__pyx_n_s_sigma,0};
-    PyObject* values[6] = {0,0,0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_ml_ints,&__pyx_n_s_deltamasses,&__pyx_n_s_delta_logmls,&__pyx_n_s_pdf,0};
+    PyObject* values[4] = {0,0,0,0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
-        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
         case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
         case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
         case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
@@ -2315,441 +2659,315 @@ static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_5pdfintegral(PyOb
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_deltamasses)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("pdfintegral", 1, 6, 6, 1); __PYX_ERR(0, 96, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("checkPDFShapes", 1, 4, 4, 1); __PYX_ERR(0, 143, __pyx_L3_error)
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_delta_logmls)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("pdfintegral", 1, 6, 6, 2); __PYX_ERR(0, 96, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("checkPDFShapes", 1, 4, 4, 2); __PYX_ERR(0, 143, __pyx_L3_error)
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_pdf)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("pdfintegral", 1, 6, 6, 3); __PYX_ERR(0, 96, __pyx_L3_error)
-        }
-        case  4:
-        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_logmu)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("pdfintegral", 1, 6, 6, 4); __PYX_ERR(0, 96, __pyx_L3_error)
-        }
-        case  5:
-        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sigma)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("pdfintegral", 1, 6, 6, 5); __PYX_ERR(0, 96, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("checkPDFShapes", 1, 4, 4, 3); __PYX_ERR(0, 143, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "pdfintegral") < 0)) __PYX_ERR(0, 96, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "checkPDFShapes") < 0)) __PYX_ERR(0, 143, __pyx_L3_error)
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 6) {
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
       values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
       values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
     }
-    __pyx_v_ml_ints = ((PyArrayObject *)values[0]);
-    __pyx_v_deltamasses = ((PyArrayObject *)values[1]);
-    __pyx_v_delta_logmls = ((PyArrayObject *)values[2]);
-    __pyx_v_pdf = ((PyArrayObject *)values[3]);
-    __pyx_v_logmu = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_logmu == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 100, __pyx_L3_error)
-    __pyx_v_sigma = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_sigma == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 101, __pyx_L3_error)
+    __pyx_v_ml_ints = values[0];
+    __pyx_v_deltamasses = values[1];
+    __pyx_v_delta_logmls = values[2];
+    __pyx_v_pdf = values[3];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("pdfintegral", 1, 6, 6, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 96, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("checkPDFShapes", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 143, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("nfwfitter.deconvolvedlognormtools.pdfintegral", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("deconvolvedlognormtools.checkPDFShapes", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_ml_ints), __pyx_ptype_5numpy_ndarray, 1, "ml_ints", 0))) __PYX_ERR(0, 96, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_deltamasses), __pyx_ptype_5numpy_ndarray, 1, "deltamasses", 0))) __PYX_ERR(0, 97, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_delta_logmls), __pyx_ptype_5numpy_ndarray, 1, "delta_logmls", 0))) __PYX_ERR(0, 98, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_pdf), __pyx_ptype_5numpy_ndarray, 1, "pdf", 0))) __PYX_ERR(0, 99, __pyx_L1_error)
-  __pyx_r = __pyx_pf_9nfwfitter_23deconvolvedlognormtools_4pdfintegral(__pyx_self, __pyx_v_ml_ints, __pyx_v_deltamasses, __pyx_v_delta_logmls, __pyx_v_pdf, __pyx_v_logmu, __pyx_v_sigma);
+  __pyx_r = __pyx_pf_23deconvolvedlognormtools_4checkPDFShapes(__pyx_self, __pyx_v_ml_ints, __pyx_v_deltamasses, __pyx_v_delta_logmls, __pyx_v_pdf);
 
   /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = NULL;
-  __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_4pdfintegral(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_ml_ints, PyArrayObject *__pyx_v_deltamasses, PyArrayObject *__pyx_v_delta_logmls, PyArrayObject *__pyx_v_pdf, double __pyx_v_logmu, double __pyx_v_sigma) {
-  Py_ssize_t __pyx_v_i;
-  Py_ssize_t __pyx_v_nsamples;
-  double __pyx_v_thesum;
-  double __pyx_v_sigmasqrt2pi;
-  double __pyx_v_neg2sigma2;
-  PyArrayObject *__pyx_v_lognormpart = 0;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_delta_logmls;
-  __Pyx_Buffer __pyx_pybuffer_delta_logmls;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_deltamasses;
-  __Pyx_Buffer __pyx_pybuffer_deltamasses;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_lognormpart;
-  __Pyx_Buffer __pyx_pybuffer_lognormpart;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_ml_ints;
-  __Pyx_Buffer __pyx_pybuffer_ml_ints;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_pdf;
-  __Pyx_Buffer __pyx_pybuffer_pdf;
+static PyObject *__pyx_pf_23deconvolvedlognormtools_4checkPDFShapes(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ml_ints, PyObject *__pyx_v_deltamasses, PyObject *__pyx_v_delta_logmls, PyObject *__pyx_v_pdf) {
+  PyObject *__pyx_v_nsamples = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  double __pyx_t_4;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  PyArrayObject *__pyx_t_7 = NULL;
-  Py_ssize_t __pyx_t_8;
-  __pyx_t_5numpy_double_t __pyx_t_9;
-  Py_ssize_t __pyx_t_10;
-  Py_ssize_t __pyx_t_11;
-  Py_ssize_t __pyx_t_12;
-  Py_ssize_t __pyx_t_13;
-  Py_ssize_t __pyx_t_14;
-  Py_ssize_t __pyx_t_15;
-  Py_ssize_t __pyx_t_16;
-  Py_ssize_t __pyx_t_17;
-  Py_ssize_t __pyx_t_18;
-  Py_ssize_t __pyx_t_19;
-  Py_ssize_t __pyx_t_20;
-  Py_ssize_t __pyx_t_21;
-  Py_ssize_t __pyx_t_22;
-  Py_ssize_t __pyx_t_23;
-  __Pyx_RefNannySetupContext("pdfintegral", 0);
-  __pyx_pybuffer_lognormpart.pybuffer.buf = NULL;
-  __pyx_pybuffer_lognormpart.refcount = 0;
-  __pyx_pybuffernd_lognormpart.data = NULL;
-  __pyx_pybuffernd_lognormpart.rcbuffer = &__pyx_pybuffer_lognormpart;
-  __pyx_pybuffer_ml_ints.pybuffer.buf = NULL;
-  __pyx_pybuffer_ml_ints.refcount = 0;
-  __pyx_pybuffernd_ml_ints.data = NULL;
-  __pyx_pybuffernd_ml_ints.rcbuffer = &__pyx_pybuffer_ml_ints;
-  __pyx_pybuffer_deltamasses.pybuffer.buf = NULL;
-  __pyx_pybuffer_deltamasses.refcount = 0;
-  __pyx_pybuffernd_deltamasses.data = NULL;
-  __pyx_pybuffernd_deltamasses.rcbuffer = &__pyx_pybuffer_deltamasses;
-  __pyx_pybuffer_delta_logmls.pybuffer.buf = NULL;
-  __pyx_pybuffer_delta_logmls.refcount = 0;
-  __pyx_pybuffernd_delta_logmls.data = NULL;
-  __pyx_pybuffernd_delta_logmls.rcbuffer = &__pyx_pybuffer_delta_logmls;
-  __pyx_pybuffer_pdf.pybuffer.buf = NULL;
-  __pyx_pybuffer_pdf.refcount = 0;
-  __pyx_pybuffernd_pdf.data = NULL;
-  __pyx_pybuffernd_pdf.rcbuffer = &__pyx_pybuffer_pdf;
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer, (PyObject*)__pyx_v_ml_ints, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 96, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_ml_ints.diminfo[0].strides = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_ml_ints.diminfo[0].shape = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_deltamasses.rcbuffer->pybuffer, (PyObject*)__pyx_v_deltamasses, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 96, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_deltamasses.diminfo[0].strides = __pyx_pybuffernd_deltamasses.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_deltamasses.diminfo[0].shape = __pyx_pybuffernd_deltamasses.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer, (PyObject*)__pyx_v_delta_logmls, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 96, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_delta_logmls.diminfo[0].strides = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_delta_logmls.diminfo[0].shape = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_pdf.rcbuffer->pybuffer, (PyObject*)__pyx_v_pdf, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 96, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_pdf.diminfo[0].strides = __pyx_pybuffernd_pdf.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_pdf.diminfo[0].shape = __pyx_pybuffernd_pdf.rcbuffer->pybuffer.shape[0];
+  int __pyx_t_4;
+  __Pyx_RefNannySetupContext("checkPDFShapes", 0);
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":107
+  /* "deconvolvedlognormtools.pyx":146
+ *     '''The pdf integrals read these unchecked; make sure they fit the mass grid'''
  * 
- *     cdef Py_ssize_t i, nsamples
  *     nsamples = ml_ints.shape[0]             # <<<<<<<<<<<<<<
- * 
- *     cdef double thesum
- */
-  __pyx_v_nsamples = (__pyx_v_ml_ints->dimensions[0]);
-
-  /* "nfwfitter/deconvolvedlognormtools.pyx":110
- * 
- *     cdef double thesum
- *     thesum = 0.             # <<<<<<<<<<<<<<
- * 
- *     cdef double sigma2, sigmasqrt2pi
- */
-  __pyx_v_thesum = 0.;
-
-  /* "nfwfitter/deconvolvedlognormtools.pyx":113
- * 
- *     cdef double sigma2, sigmasqrt2pi
- *     neg2sigma2 = -2*(sigma**2)             # <<<<<<<<<<<<<<
- *     sigmasqrt2pi = sigma*sqrt2pi
- * 
+ *     if deltamasses.shape[0] < nsamples - 1:
+ *         raise ValueError('deltamasses needs at least %d entries, has %d' % (nsamples - 1, deltamasses.shape[0]))
  */
-  __pyx_v_neg2sigma2 = (-2.0 * pow(__pyx_v_sigma, 2.0));
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_ml_ints, __pyx_n_s_shape); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 146, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_GetItemInt(__pyx_t_1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 146, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_nsamples = __pyx_t_2;
+  __pyx_t_2 = 0;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":114
- *     cdef double sigma2, sigmasqrt2pi
- *     neg2sigma2 = -2*(sigma**2)
- *     sigmasqrt2pi = sigma*sqrt2pi             # <<<<<<<<<<<<<<
+  /* "deconvolvedlognormtools.pyx":147
  * 
- *     cdef np.ndarray[np.double_t, ndim=1, mode='c'] lognormpart = np.zeros(nsamples)
+ *     nsamples = ml_ints.shape[0]
+ *     if deltamasses.shape[0] < nsamples - 1:             # <<<<<<<<<<<<<<
+ *         raise ValueError('deltamasses needs at least %d entries, has %d' % (nsamples - 1, deltamasses.shape[0]))
+ *     if delta_logmls.shape[-1] != nsamples:
  */
-  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_sigma); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 114, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_deltamasses, __pyx_n_s_shape); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 147, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_2, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 147, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_sqrt2pi); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 114, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyInt_SubtractObjC(__pyx_v_nsamples, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 147, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyNumber_Multiply(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 114, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_3 = PyObject_RichCompare(__pyx_t_1, __pyx_t_2, Py_LT); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 147, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_4 = __pyx_PyFloat_AsDouble(__pyx_t_3); if (unlikely((__pyx_t_4 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 114, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 147, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_v_sigmasqrt2pi = __pyx_t_4;
+  if (__pyx_t_4) {
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":116
- *     sigmasqrt2pi = sigma*sqrt2pi
- * 
- *     cdef np.ndarray[np.double_t, ndim=1, mode='c'] lognormpart = np.zeros(nsamples)             # <<<<<<<<<<<<<<
+    /* "deconvolvedlognormtools.pyx":148
+ *     nsamples = ml_ints.shape[0]
+ *     if deltamasses.shape[0] < nsamples - 1:
+ *         raise ValueError('deltamasses needs at least %d entries, has %d' % (nsamples - 1, deltamasses.shape[0]))             # <<<<<<<<<<<<<<
+ *     if delta_logmls.shape[-1] != nsamples:
+ *         raise ValueError('delta_logmls has %d masses, grid has %d' % (delta_logmls.shape[-1], nsamples))
+ */
+    __pyx_t_3 = __Pyx_PyInt_SubtractObjC(__pyx_v_nsamples, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 148, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_deltamasses, __pyx_n_s_shape); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 148, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_2, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 148, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 148, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_1);
+    __pyx_t_3 = 0;
+    __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_PyString_Format(__pyx_kp_s_deltamasses_needs_at_least_d_ent, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 148, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 148, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
+    __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 148, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 148, __pyx_L1_error)
+
+    /* "deconvolvedlognormtools.pyx":147
  * 
- *     lognormpart[0] = exp((delta_logmls[0]-logmu)**2/neg2sigma2)/(sigmasqrt2pi*ml_ints[0])
+ *     nsamples = ml_ints.shape[0]
+ *     if deltamasses.shape[0] < nsamples - 1:             # <<<<<<<<<<<<<<
+ *         raise ValueError('deltamasses needs at least %d entries, has %d' % (nsamples - 1, deltamasses.shape[0]))
+ *     if delta_logmls.shape[-1] != nsamples:
  */
-  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 116, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_zeros); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 116, __pyx_L1_error)
+  }
+
+  /* "deconvolvedlognormtools.pyx":149
+ *     if deltamasses.shape[0] < nsamples - 1:
+ *         raise ValueError('deltamasses needs at least %d entries, has %d' % (nsamples - 1, deltamasses.shape[0]))
+ *     if delta_logmls.shape[-1] != nsamples:             # <<<<<<<<<<<<<<
+ *         raise ValueError('delta_logmls has %d masses, grid has %d' % (delta_logmls.shape[-1], nsamples))
+ *     if pdf.shape[-1] != nsamples:
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_delta_logmls, __pyx_n_s_shape); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 149, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_nsamples); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 116, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_GetItemInt(__pyx_t_1, -1L, long, 1, __Pyx_PyInt_From_long, 0, 1, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 149, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_5 = NULL;
-  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
-    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
-    if (likely(__pyx_t_5)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-      __Pyx_INCREF(__pyx_t_5);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_1, function);
-    }
-  }
-  if (!__pyx_t_5) {
-    __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 116, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_GOTREF(__pyx_t_3);
-  } else {
-    #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_1)) {
-      PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_t_2};
-      __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 116, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    } else
-    #endif
-    #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(__pyx_t_1)) {
-      PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_t_2};
-      __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 116, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    } else
-    #endif
-    {
-      __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 116, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5); __pyx_t_5 = NULL;
-      __Pyx_GIVEREF(__pyx_t_2);
-      PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_t_2);
-      __pyx_t_2 = 0;
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 116, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    }
-  }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 116, __pyx_L1_error)
-  __pyx_t_7 = ((PyArrayObject *)__pyx_t_3);
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_lognormpart.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
-      __pyx_v_lognormpart = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_lognormpart.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 116, __pyx_L1_error)
-    } else {__pyx_pybuffernd_lognormpart.diminfo[0].strides = __pyx_pybuffernd_lognormpart.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_lognormpart.diminfo[0].shape = __pyx_pybuffernd_lognormpart.rcbuffer->pybuffer.shape[0];
-    }
-  }
-  __pyx_t_7 = 0;
-  __pyx_v_lognormpart = ((PyArrayObject *)__pyx_t_3);
-  __pyx_t_3 = 0;
+  __pyx_t_1 = PyObject_RichCompare(__pyx_t_2, __pyx_v_nsamples, Py_NE); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 149, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 149, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__pyx_t_4) {
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":118
- *     cdef np.ndarray[np.double_t, ndim=1, mode='c'] lognormpart = np.zeros(nsamples)
- * 
- *     lognormpart[0] = exp((delta_logmls[0]-logmu)**2/neg2sigma2)/(sigmasqrt2pi*ml_ints[0])             # <<<<<<<<<<<<<<
- *     thesum += 0.5*ml_ints[0]*lognormpart[0]*pdf[0]  #ml_ints[0] is deltamasses[-1]; integrand @ ml=0 is 0
- * 
+    /* "deconvolvedlognormtools.pyx":150
+ *         raise ValueError('deltamasses needs at least %d entries, has %d' % (nsamples - 1, deltamasses.shape[0]))
+ *     if delta_logmls.shape[-1] != nsamples:
+ *         raise ValueError('delta_logmls has %d masses, grid has %d' % (delta_logmls.shape[-1], nsamples))             # <<<<<<<<<<<<<<
+ *     if pdf.shape[-1] != nsamples:
+ *         raise ValueError('pdf has %d masses, grid has %d' % (pdf.shape[-1], nsamples))
  */
-  __pyx_t_8 = 0;
-  __pyx_t_9 = pow(((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.buf, __pyx_t_8, __pyx_pybuffernd_delta_logmls.diminfo[0].strides)) - __pyx_v_logmu), 2.0);
-  if (unlikely(__pyx_v_neg2sigma2 == 0)) {
-    PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-    __PYX_ERR(0, 118, __pyx_L1_error)
-  }
-  __pyx_t_4 = exp((__pyx_t_9 / __pyx_v_neg2sigma2));
-  __pyx_t_10 = 0;
-  __pyx_t_9 = (__pyx_v_sigmasqrt2pi * (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.buf, __pyx_t_10, __pyx_pybuffernd_ml_ints.diminfo[0].strides)));
-  if (unlikely(__pyx_t_9 == 0)) {
-    PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-    __PYX_ERR(0, 118, __pyx_L1_error)
-  }
-  __pyx_t_11 = 0;
-  *__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_lognormpart.rcbuffer->pybuffer.buf, __pyx_t_11, __pyx_pybuffernd_lognormpart.diminfo[0].strides) = (__pyx_t_4 / __pyx_t_9);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_delta_logmls, __pyx_n_s_shape); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 150, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = __Pyx_GetItemInt(__pyx_t_1, -1L, long, 1, __Pyx_PyInt_From_long, 0, 1, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 150, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 150, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
+    __Pyx_INCREF(__pyx_v_nsamples);
+    __Pyx_GIVEREF(__pyx_v_nsamples);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_nsamples);
+    __pyx_t_2 = 0;
+    __pyx_t_2 = __Pyx_PyString_Format(__pyx_kp_s_delta_logmls_has_d_masses_grid_h, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 150, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 150, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
+    __pyx_t_2 = 0;
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 150, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 150, __pyx_L1_error)
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":119
- * 
- *     lognormpart[0] = exp((delta_logmls[0]-logmu)**2/neg2sigma2)/(sigmasqrt2pi*ml_ints[0])
- *     thesum += 0.5*ml_ints[0]*lognormpart[0]*pdf[0]  #ml_ints[0] is deltamasses[-1]; integrand @ ml=0 is 0             # <<<<<<<<<<<<<<
- * 
- *     for i from 1 <= i < nsamples:
+    /* "deconvolvedlognormtools.pyx":149
+ *     if deltamasses.shape[0] < nsamples - 1:
+ *         raise ValueError('deltamasses needs at least %d entries, has %d' % (nsamples - 1, deltamasses.shape[0]))
+ *     if delta_logmls.shape[-1] != nsamples:             # <<<<<<<<<<<<<<
+ *         raise ValueError('delta_logmls has %d masses, grid has %d' % (delta_logmls.shape[-1], nsamples))
+ *     if pdf.shape[-1] != nsamples:
  */
-  __pyx_t_12 = 0;
-  __pyx_t_13 = 0;
-  __pyx_t_14 = 0;
-  __pyx_v_thesum = (__pyx_v_thesum + (((0.5 * (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_ml_ints.diminfo[0].strides))) * (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_lognormpart.rcbuffer->pybuffer.buf, __pyx_t_13, __pyx_pybuffernd_lognormpart.diminfo[0].strides))) * (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_pdf.rcbuffer->pybuffer.buf, __pyx_t_14, __pyx_pybuffernd_pdf.diminfo[0].strides))));
+  }
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":121
- *     thesum += 0.5*ml_ints[0]*lognormpart[0]*pdf[0]  #ml_ints[0] is deltamasses[-1]; integrand @ ml=0 is 0
+  /* "deconvolvedlognormtools.pyx":151
+ *     if delta_logmls.shape[-1] != nsamples:
+ *         raise ValueError('delta_logmls has %d masses, grid has %d' % (delta_logmls.shape[-1], nsamples))
+ *     if pdf.shape[-1] != nsamples:             # <<<<<<<<<<<<<<
+ *         raise ValueError('pdf has %d masses, grid has %d' % (pdf.shape[-1], nsamples))
  * 
- *     for i from 1 <= i < nsamples:             # <<<<<<<<<<<<<<
- * 
- *         lognormpart[i] = exp((delta_logmls[i]-logmu)**2/neg2sigma2)/(sigmasqrt2pi*ml_ints[i])
  */
-  __pyx_t_15 = __pyx_v_nsamples;
-  for (__pyx_v_i = 1; __pyx_v_i < __pyx_t_15; __pyx_v_i++) {
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_pdf, __pyx_n_s_shape); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 151, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_2, -1L, long, 1, __Pyx_PyInt_From_long, 0, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 151, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyObject_RichCompare(__pyx_t_1, __pyx_v_nsamples, Py_NE); __Pyx_XGOTREF(__pyx_t_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 151, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 151, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (__pyx_t_4) {
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":123
- *     for i from 1 <= i < nsamples:
+    /* "deconvolvedlognormtools.pyx":152
+ *         raise ValueError('delta_logmls has %d masses, grid has %d' % (delta_logmls.shape[-1], nsamples))
+ *     if pdf.shape[-1] != nsamples:
+ *         raise ValueError('pdf has %d masses, grid has %d' % (pdf.shape[-1], nsamples))             # <<<<<<<<<<<<<<
  * 
- *         lognormpart[i] = exp((delta_logmls[i]-logmu)**2/neg2sigma2)/(sigmasqrt2pi*ml_ints[i])             # <<<<<<<<<<<<<<
- * 
- *         thesum += 0.5*deltamasses[i-1]*(lognormpart[i]*pdf[i] + lognormpart[i-1]*pdf[i-1])
+ * def checkSupport(start, stop, nsamples):
  */
-    __pyx_t_16 = __pyx_v_i;
-    __pyx_t_9 = pow(((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.buf, __pyx_t_16, __pyx_pybuffernd_delta_logmls.diminfo[0].strides)) - __pyx_v_logmu), 2.0);
-    if (unlikely(__pyx_v_neg2sigma2 == 0)) {
-      PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 123, __pyx_L1_error)
-    }
-    __pyx_t_4 = exp((__pyx_t_9 / __pyx_v_neg2sigma2));
-    __pyx_t_17 = __pyx_v_i;
-    __pyx_t_9 = (__pyx_v_sigmasqrt2pi * (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.buf, __pyx_t_17, __pyx_pybuffernd_ml_ints.diminfo[0].strides)));
-    if (unlikely(__pyx_t_9 == 0)) {
-      PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 123, __pyx_L1_error)
-    }
-    __pyx_t_18 = __pyx_v_i;
-    *__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_lognormpart.rcbuffer->pybuffer.buf, __pyx_t_18, __pyx_pybuffernd_lognormpart.diminfo[0].strides) = (__pyx_t_4 / __pyx_t_9);
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_pdf, __pyx_n_s_shape); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 152, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_2, -1L, long, 1, __Pyx_PyInt_From_long, 0, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 152, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 152, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
+    __Pyx_INCREF(__pyx_v_nsamples);
+    __Pyx_GIVEREF(__pyx_v_nsamples);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_nsamples);
+    __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_PyString_Format(__pyx_kp_s_pdf_has_d_masses_grid_has_d, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 152, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 152, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
+    __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 152, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 152, __pyx_L1_error)
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":125
- *         lognormpart[i] = exp((delta_logmls[i]-logmu)**2/neg2sigma2)/(sigmasqrt2pi*ml_ints[i])
- * 
- *         thesum += 0.5*deltamasses[i-1]*(lognormpart[i]*pdf[i] + lognormpart[i-1]*pdf[i-1])             # <<<<<<<<<<<<<<
- * 
+    /* "deconvolvedlognormtools.pyx":151
+ *     if delta_logmls.shape[-1] != nsamples:
+ *         raise ValueError('delta_logmls has %d masses, grid has %d' % (delta_logmls.shape[-1], nsamples))
+ *     if pdf.shape[-1] != nsamples:             # <<<<<<<<<<<<<<
+ *         raise ValueError('pdf has %d masses, grid has %d' % (pdf.shape[-1], nsamples))
  * 
  */
-    __pyx_t_19 = (__pyx_v_i - 1);
-    __pyx_t_20 = __pyx_v_i;
-    __pyx_t_21 = __pyx_v_i;
-    __pyx_t_22 = (__pyx_v_i - 1);
-    __pyx_t_23 = (__pyx_v_i - 1);
-    __pyx_v_thesum = (__pyx_v_thesum + ((0.5 * (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_deltamasses.rcbuffer->pybuffer.buf, __pyx_t_19, __pyx_pybuffernd_deltamasses.diminfo[0].strides))) * (((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_lognormpart.rcbuffer->pybuffer.buf, __pyx_t_20, __pyx_pybuffernd_lognormpart.diminfo[0].strides)) * (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_pdf.rcbuffer->pybuffer.buf, __pyx_t_21, __pyx_pybuffernd_pdf.diminfo[0].strides))) + ((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_lognormpart.rcbuffer->pybuffer.buf, __pyx_t_22, __pyx_pybuffernd_lognormpart.diminfo[0].strides)) * (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_pdf.rcbuffer->pybuffer.buf, __pyx_t_23, __pyx_pybuffernd_pdf.diminfo[0].strides))))));
   }
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":128
- * 
- * 
- *     return thesum             # <<<<<<<<<<<<<<
+  /* "deconvolvedlognormtools.pyx":143
+ * ###
  * 
+ * def checkPDFShapes(ml_ints, deltamasses, delta_logmls, pdf):             # <<<<<<<<<<<<<<
+ *     '''The pdf integrals read these unchecked; make sure they fit the mass grid'''
  * 
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_thesum); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 128, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_r = __pyx_t_3;
-  __pyx_t_3 = 0;
-  goto __pyx_L0;
-
-  /* "nfwfitter/deconvolvedlognormtools.pyx":96
- * @cython.boundscheck(False)
- * @cython.wraparound(False)
- * def pdfintegral(np.ndarray[np.double_t, ndim=1, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
- *                 np.ndarray[np.double_t, ndim=1, mode='c'] deltamasses,
- *                 np.ndarray[np.double_t, ndim=1, mode='c'] delta_logmls,
  */
 
   /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
-    __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_deltamasses.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_lognormpart.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_pdf.rcbuffer->pybuffer);
-  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("nfwfitter.deconvolvedlognormtools.pdfintegral", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("deconvolvedlognormtools.checkPDFShapes", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
-  goto __pyx_L2;
   __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_deltamasses.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_lognormpart.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_pdf.rcbuffer->pybuffer);
-  __pyx_L2:;
-  __Pyx_XDECREF((PyObject *)__pyx_v_lognormpart);
+  __Pyx_XDECREF(__pyx_v_nsamples);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "nfwfitter/deconvolvedlognormtools.pyx":137
- * @cython.boundscheck(False)
- * @cython.wraparound(False)
- * def loglinearlike(np.ndarray[np.double_t, ndim=2, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
- *                   np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
- *                   double logmu,
+/* "deconvolvedlognormtools.pyx":154
+ *         raise ValueError('pdf has %d masses, grid has %d' % (pdf.shape[-1], nsamples))
+ * 
+ * def checkSupport(start, stop, nsamples):             # <<<<<<<<<<<<<<
+ * 
+ *     if not (0 <= start <= stop <= nsamples):
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_7loglinearlike(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_9nfwfitter_23deconvolvedlognormtools_7loglinearlike = {"loglinearlike", (PyCFunction)__pyx_pw_9nfwfitter_23deconvolvedlognormtools_7loglinearlike, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_7loglinearlike(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyArrayObject *__pyx_v_ml_ints = 0;
-  PyArrayObject *__pyx_v_delta_logmls = 0;
-  double __pyx_v_logmu;
-  double __pyx_v_sigma;
+static PyObject *__pyx_pw_23deconvolvedlognormtools_7checkSupport(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_23deconvolvedlognormtools_7checkSupport = {"checkSupport", (PyCFunction)__pyx_pw_23deconvolvedlognormtools_7checkSupport, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_23deconvolvedlognormtools_7checkSupport(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_start = 0;
+  PyObject *__pyx_v_stop = 0;
+  PyObject *__pyx_v_nsamples = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("loglinearlike (wrapper)", 0);
+  __Pyx_RefNannySetupContext("checkSupport (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_ml_ints,&__pyx_n_s_delta_logmls,&__pyx_n_s_logmu,&__pyx_n_s_sigma,0};
-    PyObject* values[4] = {0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_start,&__pyx_n_s_stop,&__pyx_n_s_nsamples,0};
+    PyObject* values[3] = {0,0,0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
-        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
         case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
         case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
         case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
@@ -2759,360 +2977,175 @@ static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_7loglinearlike(Py
       kw_args = PyDict_Size(__pyx_kwds);
       switch (pos_args) {
         case  0:
-        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_ml_ints)) != 0)) kw_args--;
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_start)) != 0)) kw_args--;
         else goto __pyx_L5_argtuple_error;
         case  1:
-        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_delta_logmls)) != 0)) kw_args--;
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_stop)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("loglinearlike", 1, 4, 4, 1); __PYX_ERR(0, 137, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("checkSupport", 1, 3, 3, 1); __PYX_ERR(0, 154, __pyx_L3_error)
         }
         case  2:
-        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_logmu)) != 0)) kw_args--;
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_nsamples)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("loglinearlike", 1, 4, 4, 2); __PYX_ERR(0, 137, __pyx_L3_error)
-        }
-        case  3:
-        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sigma)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("loglinearlike", 1, 4, 4, 3); __PYX_ERR(0, 137, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("checkSupport", 1, 3, 3, 2); __PYX_ERR(0, 154, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "loglinearlike") < 0)) __PYX_ERR(0, 137, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "checkSupport") < 0)) __PYX_ERR(0, 154, __pyx_L3_error)
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
       values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
     }
-    __pyx_v_ml_ints = ((PyArrayObject *)values[0]);
-    __pyx_v_delta_logmls = ((PyArrayObject *)values[1]);
-    __pyx_v_logmu = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_logmu == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 139, __pyx_L3_error)
-    __pyx_v_sigma = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_sigma == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 140, __pyx_L3_error)
+    __pyx_v_start = values[0];
+    __pyx_v_stop = values[1];
+    __pyx_v_nsamples = values[2];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("loglinearlike", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 137, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("checkSupport", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 154, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("nfwfitter.deconvolvedlognormtools.loglinearlike", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("deconvolvedlognormtools.checkSupport", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_ml_ints), __pyx_ptype_5numpy_ndarray, 1, "ml_ints", 0))) __PYX_ERR(0, 137, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_delta_logmls), __pyx_ptype_5numpy_ndarray, 1, "delta_logmls", 0))) __PYX_ERR(0, 138, __pyx_L1_error)
-  __pyx_r = __pyx_pf_9nfwfitter_23deconvolvedlognormtools_6loglinearlike(__pyx_self, __pyx_v_ml_ints, __pyx_v_delta_logmls, __pyx_v_logmu, __pyx_v_sigma);
+  __pyx_r = __pyx_pf_23deconvolvedlognormtools_6checkSupport(__pyx_self, __pyx_v_start, __pyx_v_stop, __pyx_v_nsamples);
 
   /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = NULL;
-  __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_6loglinearlike(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_ml_ints, PyArrayObject *__pyx_v_delta_logmls, double __pyx_v_logmu, double __pyx_v_sigma) {
-  Py_ssize_t __pyx_v_i;
-  Py_ssize_t __pyx_v_nclusters;
-  double __pyx_v_sumlogprob;
-  double __pyx_v_prob;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_delta_logmls;
-  __Pyx_Buffer __pyx_pybuffer_delta_logmls;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_ml_ints;
-  __Pyx_Buffer __pyx_pybuffer_ml_ints;
+static PyObject *__pyx_pf_23deconvolvedlognormtools_6checkSupport(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_start, PyObject *__pyx_v_stop, PyObject *__pyx_v_nsamples) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
   PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  int __pyx_t_8;
-  PyObject *__pyx_t_9 = NULL;
-  double __pyx_t_10;
-  __Pyx_RefNannySetupContext("loglinearlike", 0);
-  __pyx_pybuffer_ml_ints.pybuffer.buf = NULL;
-  __pyx_pybuffer_ml_ints.refcount = 0;
-  __pyx_pybuffernd_ml_ints.data = NULL;
-  __pyx_pybuffernd_ml_ints.rcbuffer = &__pyx_pybuffer_ml_ints;
-  __pyx_pybuffer_delta_logmls.pybuffer.buf = NULL;
-  __pyx_pybuffer_delta_logmls.refcount = 0;
-  __pyx_pybuffernd_delta_logmls.data = NULL;
-  __pyx_pybuffernd_delta_logmls.rcbuffer = &__pyx_pybuffer_delta_logmls;
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer, (PyObject*)__pyx_v_ml_ints, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 137, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_ml_ints.diminfo[0].strides = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_ml_ints.diminfo[0].shape = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_ml_ints.diminfo[1].strides = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_ml_ints.diminfo[1].shape = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.shape[1];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer, (PyObject*)__pyx_v_delta_logmls, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 137, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_delta_logmls.diminfo[0].strides = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_delta_logmls.diminfo[0].shape = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_delta_logmls.diminfo[1].strides = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_delta_logmls.diminfo[1].shape = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.shape[1];
+  __Pyx_RefNannySetupContext("checkSupport", 0);
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":144
+  /* "deconvolvedlognormtools.pyx":156
+ * def checkSupport(start, stop, nsamples):
  * 
- *     cdef Py_ssize_t i, nclusters
- *     nclusters = ml_ints.shape[0]             # <<<<<<<<<<<<<<
+ *     if not (0 <= start <= stop <= nsamples):             # <<<<<<<<<<<<<<
+ *         raise ValueError('support [%d, %d) outside of the mass grid [0, %d)' % (start, stop, nsamples))
  * 
- *     cdef double sumlogprob = 0.
  */
-  __pyx_v_nclusters = (__pyx_v_ml_ints->dimensions[0]);
+  __pyx_t_1 = PyObject_RichCompare(__pyx_int_0, __pyx_v_start, Py_LE); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 156, __pyx_L1_error)
+  if (__Pyx_PyObject_IsTrue(__pyx_t_1)) {
+    __Pyx_DECREF(__pyx_t_1);
+    __pyx_t_1 = PyObject_RichCompare(__pyx_v_start, __pyx_v_stop, Py_LE); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 156, __pyx_L1_error)
+    if (__Pyx_PyObject_IsTrue(__pyx_t_1)) {
+      __Pyx_DECREF(__pyx_t_1);
+      __pyx_t_1 = PyObject_RichCompare(__pyx_v_stop, __pyx_v_nsamples, Py_LE); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 156, __pyx_L1_error)
+    }
+  }
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 156, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = ((!__pyx_t_2) != 0);
+  if (__pyx_t_3) {
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":146
- *     nclusters = ml_ints.shape[0]
+    /* "deconvolvedlognormtools.pyx":157
  * 
- *     cdef double sumlogprob = 0.             # <<<<<<<<<<<<<<
- *     cdef double prob = 0.
+ *     if not (0 <= start <= stop <= nsamples):
+ *         raise ValueError('support [%d, %d) outside of the mass grid [0, %d)' % (start, stop, nsamples))             # <<<<<<<<<<<<<<
  * 
+ * ###
  */
-  __pyx_v_sumlogprob = 0.;
-
-  /* "nfwfitter/deconvolvedlognormtools.pyx":147
- * 
- *     cdef double sumlogprob = 0.
- *     cdef double prob = 0.             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __pyx_v_prob = 0.;
-
-  /* "nfwfitter/deconvolvedlognormtools.pyx":151
- * 
- * 
- *     for i from nclusters > i >= 0:             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  for (__pyx_v_i = __pyx_v_nclusters-1; __pyx_v_i >= 0; __pyx_v_i--) {
-
-    /* "nfwfitter/deconvolvedlognormtools.pyx":155
- * 
- * 
- *         prob = altintegral(ml_ints[i,:],             # <<<<<<<<<<<<<<
- *                            delta_logmls[i,:],
- *                            logmu,
- */
-    __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_altintegral); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 155, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_i); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 155, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 155, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_GIVEREF(__pyx_t_3);
-    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
-    __Pyx_INCREF(__pyx_slice_);
-    __Pyx_GIVEREF(__pyx_slice_);
-    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_slice_);
-    __pyx_t_3 = 0;
-    __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_ml_ints), __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 155, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-
-    /* "nfwfitter/deconvolvedlognormtools.pyx":156
- * 
- *         prob = altintegral(ml_ints[i,:],
- *                            delta_logmls[i,:],             # <<<<<<<<<<<<<<
- *                            logmu,
- *                            sigma)
- */
-    __pyx_t_4 = PyInt_FromSsize_t(__pyx_v_i); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 156, __pyx_L1_error)
+    __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 157, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_v_start);
+    __Pyx_GIVEREF(__pyx_v_start);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_start);
+    __Pyx_INCREF(__pyx_v_stop);
+    __Pyx_GIVEREF(__pyx_v_stop);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_stop);
+    __Pyx_INCREF(__pyx_v_nsamples);
+    __Pyx_GIVEREF(__pyx_v_nsamples);
+    PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_nsamples);
+    __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_support_d_d_outside_of_the_mass, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 157, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 156, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 157, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
     __Pyx_GIVEREF(__pyx_t_4);
-    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
-    __Pyx_INCREF(__pyx_slice__2);
-    __Pyx_GIVEREF(__pyx_slice__2);
-    PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_slice__2);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_4);
     __pyx_t_4 = 0;
-    __pyx_t_4 = PyObject_GetItem(((PyObject *)__pyx_v_delta_logmls), __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 156, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_t_1, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 157, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-
-    /* "nfwfitter/deconvolvedlognormtools.pyx":157
- *         prob = altintegral(ml_ints[i,:],
- *                            delta_logmls[i,:],
- *                            logmu,             # <<<<<<<<<<<<<<
- *                            sigma)
- * 
- */
-    __pyx_t_5 = PyFloat_FromDouble(__pyx_v_logmu); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 157, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-
-    /* "nfwfitter/deconvolvedlognormtools.pyx":158
- *                            delta_logmls[i,:],
- *                            logmu,
- *                            sigma)             # <<<<<<<<<<<<<<
- * 
- * 
- */
-    __pyx_t_6 = PyFloat_FromDouble(__pyx_v_sigma); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 158, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_7 = NULL;
-    __pyx_t_8 = 0;
-    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
-      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_2);
-      if (likely(__pyx_t_7)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-        __Pyx_INCREF(__pyx_t_7);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_2, function);
-        __pyx_t_8 = 1;
-      }
-    }
-    #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_2)) {
-      PyObject *__pyx_temp[5] = {__pyx_t_7, __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_t_6};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 155, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    } else
-    #endif
-    #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
-      PyObject *__pyx_temp[5] = {__pyx_t_7, __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_t_6};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 155, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    } else
-    #endif
-    {
-      __pyx_t_9 = PyTuple_New(4+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 155, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_9);
-      if (__pyx_t_7) {
-        __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_7); __pyx_t_7 = NULL;
-      }
-      __Pyx_GIVEREF(__pyx_t_3);
-      PyTuple_SET_ITEM(__pyx_t_9, 0+__pyx_t_8, __pyx_t_3);
-      __Pyx_GIVEREF(__pyx_t_4);
-      PyTuple_SET_ITEM(__pyx_t_9, 1+__pyx_t_8, __pyx_t_4);
-      __Pyx_GIVEREF(__pyx_t_5);
-      PyTuple_SET_ITEM(__pyx_t_9, 2+__pyx_t_8, __pyx_t_5);
-      __Pyx_GIVEREF(__pyx_t_6);
-      PyTuple_SET_ITEM(__pyx_t_9, 3+__pyx_t_8, __pyx_t_6);
-      __pyx_t_3 = 0;
-      __pyx_t_4 = 0;
-      __pyx_t_5 = 0;
-      __pyx_t_6 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 155, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-    }
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-    /* "nfwfitter/deconvolvedlognormtools.pyx":155
- * 
- * 
- *         prob = altintegral(ml_ints[i,:],             # <<<<<<<<<<<<<<
- *                            delta_logmls[i,:],
- *                            logmu,
- */
-    __pyx_t_10 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_10 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 155, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_v_prob = __pyx_t_10;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __PYX_ERR(0, 157, __pyx_L1_error)
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":162
- * 
+    /* "deconvolvedlognormtools.pyx":156
+ * def checkSupport(start, stop, nsamples):
  * 
- *         sumlogprob += log(prob)             # <<<<<<<<<<<<<<
+ *     if not (0 <= start <= stop <= nsamples):             # <<<<<<<<<<<<<<
+ *         raise ValueError('support [%d, %d) outside of the mass grid [0, %d)' % (start, stop, nsamples))
  * 
- *     return sumlogprob
  */
-    __pyx_v_sumlogprob = (__pyx_v_sumlogprob + log(__pyx_v_prob));
   }
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":164
- *         sumlogprob += log(prob)
- * 
- *     return sumlogprob             # <<<<<<<<<<<<<<
+  /* "deconvolvedlognormtools.pyx":154
+ *         raise ValueError('pdf has %d masses, grid has %d' % (pdf.shape[-1], nsamples))
  * 
+ * def checkSupport(start, stop, nsamples):             # <<<<<<<<<<<<<<
  * 
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_sumlogprob); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 164, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  /* "nfwfitter/deconvolvedlognormtools.pyx":137
- * @cython.boundscheck(False)
- * @cython.wraparound(False)
- * def loglinearlike(np.ndarray[np.double_t, ndim=2, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
- *                   np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
- *                   double logmu,
+ *     if not (0 <= start <= stop <= nsamples):
  */
 
   /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_9);
-  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
-    __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer);
-  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("nfwfitter.deconvolvedlognormtools.loglinearlike", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("deconvolvedlognormtools.checkSupport", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
-  goto __pyx_L2;
   __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer);
-  __pyx_L2:;
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "nfwfitter/deconvolvedlognormtools.pyx":170
- * @cython.boundscheck(False)
- * @cython.wraparound(False)
- * def mcmcloglinearlike(np.ndarray[np.double_t, ndim=2, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
- *                       np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
- *                       np.ndarray[np.int_t, ndim=1, mode='c'] ngoodsamples,
+/* "deconvolvedlognormtools.pyx":161
+ * ###
+ * 
+ * def pdfintegral(np.ndarray[np.double_t, ndim=1, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
+ *                 np.ndarray[np.double_t, ndim=1, mode='c'] deltamasses,
+ *                 np.ndarray[np.double_t, ndim=1, mode='c'] delta_logmls,
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_9mcmcloglinearlike(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_9nfwfitter_23deconvolvedlognormtools_9mcmcloglinearlike = {"mcmcloglinearlike", (PyCFunction)__pyx_pw_9nfwfitter_23deconvolvedlognormtools_9mcmcloglinearlike, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_9mcmcloglinearlike(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_23deconvolvedlognormtools_9pdfintegral(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_23deconvolvedlognormtools_9pdfintegral = {"pdfintegral", (PyCFunction)__pyx_pw_23deconvolvedlognormtools_9pdfintegral, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_23deconvolvedlognormtools_9pdfintegral(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyArrayObject *__pyx_v_ml_ints = 0;
+  PyArrayObject *__pyx_v_deltamasses = 0;
   PyArrayObject *__pyx_v_delta_logmls = 0;
-  PyArrayObject *__pyx_v_ngoodsamples = 0;
+  PyArrayObject *__pyx_v_pdf = 0;
   double __pyx_v_logmu;
   double __pyx_v_sigma;
+  Py_ssize_t __pyx_v_start;
+  Py_ssize_t __pyx_v_stop;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("mcmcloglinearlike (wrapper)", 0);
+  __Pyx_RefNannySetupContext("pdfintegral (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_ml_ints,&__pyx_n_s_delta_logmls,&__pyx_n_s_ngoodsamples,&__pyx_n_s_logmu,&__pyx_n_s_sigma,0};
-    PyObject* values[5] = {0,0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_ml_ints,&__pyx_n_s_deltamasses,&__pyx_n_s_delta_logmls,&__pyx_n_s_pdf,&__pyx_n_s_logmu,&__pyx_n_s_sigma,&__pyx_n_s_start,&__pyx_n_s_stop,0};
+    PyObject* values[8] = {0,0,0,0,0,0,0,0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
         case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
         case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
         case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
@@ -3127,56 +3160,88 @@ static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_9mcmcloglinearlik
         if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_ml_ints)) != 0)) kw_args--;
         else goto __pyx_L5_argtuple_error;
         case  1:
-        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_delta_logmls)) != 0)) kw_args--;
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_deltamasses)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("mcmcloglinearlike", 1, 5, 5, 1); __PYX_ERR(0, 170, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("pdfintegral", 0, 6, 8, 1); __PYX_ERR(0, 161, __pyx_L3_error)
         }
         case  2:
-        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_ngoodsamples)) != 0)) kw_args--;
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_delta_logmls)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("mcmcloglinearlike", 1, 5, 5, 2); __PYX_ERR(0, 170, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("pdfintegral", 0, 6, 8, 2); __PYX_ERR(0, 161, __pyx_L3_error)
         }
         case  3:
-        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_logmu)) != 0)) kw_args--;
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_pdf)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("mcmcloglinearlike", 1, 5, 5, 3); __PYX_ERR(0, 170, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("pdfintegral", 0, 6, 8, 3); __PYX_ERR(0, 161, __pyx_L3_error)
         }
         case  4:
-        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sigma)) != 0)) kw_args--;
+        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_logmu)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("pdfintegral", 0, 6, 8, 4); __PYX_ERR(0, 161, __pyx_L3_error)
+        }
+        case  5:
+        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sigma)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("mcmcloglinearlike", 1, 5, 5, 4); __PYX_ERR(0, 170, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("pdfintegral", 0, 6, 8, 5); __PYX_ERR(0, 161, __pyx_L3_error)
+        }
+        case  6:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_start);
+          if (value) { values[6] = value; kw_args--; }
+        }
+        case  7:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_stop);
+          if (value) { values[7] = value; kw_args--; }
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "mcmcloglinearlike") < 0)) __PYX_ERR(0, 170, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "pdfintegral") < 0)) __PYX_ERR(0, 161, __pyx_L3_error)
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 5) {
-      goto __pyx_L5_argtuple_error;
     } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
     }
     __pyx_v_ml_ints = ((PyArrayObject *)values[0]);
-    __pyx_v_delta_logmls = ((PyArrayObject *)values[1]);
-    __pyx_v_ngoodsamples = ((PyArrayObject *)values[2]);
-    __pyx_v_logmu = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_logmu == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 173, __pyx_L3_error)
-    __pyx_v_sigma = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_sigma == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 174, __pyx_L3_error)
+    __pyx_v_deltamasses = ((PyArrayObject *)values[1]);
+    __pyx_v_delta_logmls = ((PyArrayObject *)values[2]);
+    __pyx_v_pdf = ((PyArrayObject *)values[3]);
+    __pyx_v_logmu = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_logmu == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 165, __pyx_L3_error)
+    __pyx_v_sigma = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_sigma == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 166, __pyx_L3_error)
+    if (values[6]) {
+      __pyx_v_start = __Pyx_PyIndex_AsSsize_t(values[6]); if (unlikely((__pyx_v_start == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 167, __pyx_L3_error)
+    } else {
+      __pyx_v_start = ((Py_ssize_t)0);
+    }
+    if (values[7]) {
+      __pyx_v_stop = __Pyx_PyIndex_AsSsize_t(values[7]); if (unlikely((__pyx_v_stop == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 168, __pyx_L3_error)
+    } else {
+      __pyx_v_stop = ((Py_ssize_t)-1L);
+    }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("mcmcloglinearlike", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 170, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("pdfintegral", 0, 6, 8, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 161, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("nfwfitter.deconvolvedlognormtools.mcmcloglinearlike", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("deconvolvedlognormtools.pdfintegral", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_ml_ints), __pyx_ptype_5numpy_ndarray, 1, "ml_ints", 0))) __PYX_ERR(0, 170, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_delta_logmls), __pyx_ptype_5numpy_ndarray, 1, "delta_logmls", 0))) __PYX_ERR(0, 171, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_ngoodsamples), __pyx_ptype_5numpy_ndarray, 1, "ngoodsamples", 0))) __PYX_ERR(0, 172, __pyx_L1_error)
-  __pyx_r = __pyx_pf_9nfwfitter_23deconvolvedlognormtools_8mcmcloglinearlike(__pyx_self, __pyx_v_ml_ints, __pyx_v_delta_logmls, __pyx_v_ngoodsamples, __pyx_v_logmu, __pyx_v_sigma);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_ml_ints), __pyx_ptype_5numpy_ndarray, 1, "ml_ints", 0))) __PYX_ERR(0, 161, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_deltamasses), __pyx_ptype_5numpy_ndarray, 1, "deltamasses", 0))) __PYX_ERR(0, 162, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_delta_logmls), __pyx_ptype_5numpy_ndarray, 1, "delta_logmls", 0))) __PYX_ERR(0, 163, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_pdf), __pyx_ptype_5numpy_ndarray, 1, "pdf", 0))) __PYX_ERR(0, 164, __pyx_L1_error)
+  __pyx_r = __pyx_pf_23deconvolvedlognormtools_8pdfintegral(__pyx_self, __pyx_v_ml_ints, __pyx_v_deltamasses, __pyx_v_delta_logmls, __pyx_v_pdf, __pyx_v_logmu, __pyx_v_sigma, __pyx_v_start, __pyx_v_stop);
 
   /* function exit code */
   goto __pyx_L0;
@@ -3187,343 +3252,323 @@ static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_9mcmcloglinearlik
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_8mcmcloglinearlike(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_ml_ints, PyArrayObject *__pyx_v_delta_logmls, PyArrayObject *__pyx_v_ngoodsamples, double __pyx_v_logmu, double __pyx_v_sigma) {
-  Py_ssize_t __pyx_v_i;
-  Py_ssize_t __pyx_v_nclusters;
+static PyObject *__pyx_pf_23deconvolvedlognormtools_8pdfintegral(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_ml_ints, PyArrayObject *__pyx_v_deltamasses, PyArrayObject *__pyx_v_delta_logmls, PyArrayObject *__pyx_v_pdf, double __pyx_v_logmu, double __pyx_v_sigma, Py_ssize_t __pyx_v_start, Py_ssize_t __pyx_v_stop) {
   Py_ssize_t __pyx_v_nsamples;
-  double __pyx_v_sumlogprob;
-  double __pyx_v_prob;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_delta_logmls;
   __Pyx_Buffer __pyx_pybuffer_delta_logmls;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_deltamasses;
+  __Pyx_Buffer __pyx_pybuffer_deltamasses;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_ml_ints;
   __Pyx_Buffer __pyx_pybuffer_ml_ints;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_ngoodsamples;
-  __Pyx_Buffer __pyx_pybuffer_ngoodsamples;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_pdf;
+  __Pyx_Buffer __pyx_pybuffer_pdf;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  Py_ssize_t __pyx_t_1;
+  PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_4;
   PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_6;
   PyObject *__pyx_t_7 = NULL;
   PyObject *__pyx_t_8 = NULL;
-  int __pyx_t_9;
-  PyObject *__pyx_t_10 = NULL;
-  double __pyx_t_11;
-  __Pyx_RefNannySetupContext("mcmcloglinearlike", 0);
+  PyObject *__pyx_t_9 = NULL;
+  __Pyx_RefNannySetupContext("pdfintegral", 0);
   __pyx_pybuffer_ml_ints.pybuffer.buf = NULL;
   __pyx_pybuffer_ml_ints.refcount = 0;
   __pyx_pybuffernd_ml_ints.data = NULL;
   __pyx_pybuffernd_ml_ints.rcbuffer = &__pyx_pybuffer_ml_ints;
+  __pyx_pybuffer_deltamasses.pybuffer.buf = NULL;
+  __pyx_pybuffer_deltamasses.refcount = 0;
+  __pyx_pybuffernd_deltamasses.data = NULL;
+  __pyx_pybuffernd_deltamasses.rcbuffer = &__pyx_pybuffer_deltamasses;
   __pyx_pybuffer_delta_logmls.pybuffer.buf = NULL;
   __pyx_pybuffer_delta_logmls.refcount = 0;
   __pyx_pybuffernd_delta_logmls.data = NULL;
   __pyx_pybuffernd_delta_logmls.rcbuffer = &__pyx_pybuffer_delta_logmls;
-  __pyx_pybuffer_ngoodsamples.pybuffer.buf = NULL;
-  __pyx_pybuffer_ngoodsamples.refcount = 0;
-  __pyx_pybuffernd_ngoodsamples.data = NULL;
-  __pyx_pybuffernd_ngoodsamples.rcbuffer = &__pyx_pybuffer_ngoodsamples;
+  __pyx_pybuffer_pdf.pybuffer.buf = NULL;
+  __pyx_pybuffer_pdf.refcount = 0;
+  __pyx_pybuffernd_pdf.data = NULL;
+  __pyx_pybuffernd_pdf.rcbuffer = &__pyx_pybuffer_pdf;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer, (PyObject*)__pyx_v_ml_ints, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 170, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer, (PyObject*)__pyx_v_ml_ints, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 161, __pyx_L1_error)
   }
-  __pyx_pybuffernd_ml_ints.diminfo[0].strides = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_ml_ints.diminfo[0].shape = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_ml_ints.diminfo[1].strides = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_ml_ints.diminfo[1].shape = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.shape[1];
+  __pyx_pybuffernd_ml_ints.diminfo[0].strides = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_ml_ints.diminfo[0].shape = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer, (PyObject*)__pyx_v_delta_logmls, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 170, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_deltamasses.rcbuffer->pybuffer, (PyObject*)__pyx_v_deltamasses, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 161, __pyx_L1_error)
   }
-  __pyx_pybuffernd_delta_logmls.diminfo[0].strides = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_delta_logmls.diminfo[0].shape = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_delta_logmls.diminfo[1].strides = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_delta_logmls.diminfo[1].shape = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.shape[1];
+  __pyx_pybuffernd_deltamasses.diminfo[0].strides = __pyx_pybuffernd_deltamasses.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_deltamasses.diminfo[0].shape = __pyx_pybuffernd_deltamasses.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_ngoodsamples.rcbuffer->pybuffer, (PyObject*)__pyx_v_ngoodsamples, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 170, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer, (PyObject*)__pyx_v_delta_logmls, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 161, __pyx_L1_error)
   }
-  __pyx_pybuffernd_ngoodsamples.diminfo[0].strides = __pyx_pybuffernd_ngoodsamples.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_ngoodsamples.diminfo[0].shape = __pyx_pybuffernd_ngoodsamples.rcbuffer->pybuffer.shape[0];
+  __pyx_pybuffernd_delta_logmls.diminfo[0].strides = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_delta_logmls.diminfo[0].shape = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_pdf.rcbuffer->pybuffer, (PyObject*)__pyx_v_pdf, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 161, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_pdf.diminfo[0].strides = __pyx_pybuffernd_pdf.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_pdf.diminfo[0].shape = __pyx_pybuffernd_pdf.rcbuffer->pybuffer.shape[0];
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":178
+  /* "deconvolvedlognormtools.pyx":174
+ *     ### pdf is taken to be zero outside of [start, stop); stop=-1 means the end of the grid
  * 
- *     cdef Py_ssize_t i, nclusters, nsamples
- *     nclusters = ml_ints.shape[0]             # <<<<<<<<<<<<<<
+ *     checkPDFShapes(ml_ints, deltamasses, delta_logmls, pdf)             # <<<<<<<<<<<<<<
  * 
- *     cdef double sumlogprob = 0.
+ *     cdef Py_ssize_t nsamples = ml_ints.shape[0]
  */
-  __pyx_v_nclusters = (__pyx_v_ml_ints->dimensions[0]);
+  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_checkPDFShapes); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 174, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = NULL;
+  __pyx_t_4 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_4 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[5] = {__pyx_t_3, ((PyObject *)__pyx_v_ml_ints), ((PyObject *)__pyx_v_deltamasses), ((PyObject *)__pyx_v_delta_logmls), ((PyObject *)__pyx_v_pdf)};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 4+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 174, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[5] = {__pyx_t_3, ((PyObject *)__pyx_v_ml_ints), ((PyObject *)__pyx_v_deltamasses), ((PyObject *)__pyx_v_delta_logmls), ((PyObject *)__pyx_v_pdf)};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 4+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 174, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else
+  #endif
+  {
+    __pyx_t_5 = PyTuple_New(4+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 174, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (__pyx_t_3) {
+      __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3); __pyx_t_3 = NULL;
+    }
+    __Pyx_INCREF(((PyObject *)__pyx_v_ml_ints));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_ml_ints));
+    PyTuple_SET_ITEM(__pyx_t_5, 0+__pyx_t_4, ((PyObject *)__pyx_v_ml_ints));
+    __Pyx_INCREF(((PyObject *)__pyx_v_deltamasses));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_deltamasses));
+    PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_4, ((PyObject *)__pyx_v_deltamasses));
+    __Pyx_INCREF(((PyObject *)__pyx_v_delta_logmls));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_delta_logmls));
+    PyTuple_SET_ITEM(__pyx_t_5, 2+__pyx_t_4, ((PyObject *)__pyx_v_delta_logmls));
+    __Pyx_INCREF(((PyObject *)__pyx_v_pdf));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_pdf));
+    PyTuple_SET_ITEM(__pyx_t_5, 3+__pyx_t_4, ((PyObject *)__pyx_v_pdf));
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 174, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":180
- *     nclusters = ml_ints.shape[0]
- * 
- *     cdef double sumlogprob = 0.             # <<<<<<<<<<<<<<
- *     cdef double prob = 0.
+  /* "deconvolvedlognormtools.pyx":176
+ *     checkPDFShapes(ml_ints, deltamasses, delta_logmls, pdf)
  * 
+ *     cdef Py_ssize_t nsamples = ml_ints.shape[0]             # <<<<<<<<<<<<<<
+ *     if stop == -1:
+ *         stop = nsamples
  */
-  __pyx_v_sumlogprob = 0.;
+  __pyx_v_nsamples = (__pyx_v_ml_ints->dimensions[0]);
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":181
- * 
- *     cdef double sumlogprob = 0.
- *     cdef double prob = 0.             # <<<<<<<<<<<<<<
- * 
+  /* "deconvolvedlognormtools.pyx":177
  * 
+ *     cdef Py_ssize_t nsamples = ml_ints.shape[0]
+ *     if stop == -1:             # <<<<<<<<<<<<<<
+ *         stop = nsamples
+ *     checkSupport(start, stop, nsamples)
  */
-  __pyx_v_prob = 0.;
+  __pyx_t_6 = ((__pyx_v_stop == -1L) != 0);
+  if (__pyx_t_6) {
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":185
- * 
- * 
- *     for i from nclusters > i >= 0:             # <<<<<<<<<<<<<<
+    /* "deconvolvedlognormtools.pyx":178
+ *     cdef Py_ssize_t nsamples = ml_ints.shape[0]
+ *     if stop == -1:
+ *         stop = nsamples             # <<<<<<<<<<<<<<
+ *     checkSupport(start, stop, nsamples)
  * 
- *         nsamples = ngoodsamples[i]
  */
-  for (__pyx_v_i = __pyx_v_nclusters-1; __pyx_v_i >= 0; __pyx_v_i--) {
+    __pyx_v_stop = __pyx_v_nsamples;
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":187
- *     for i from nclusters > i >= 0:
+    /* "deconvolvedlognormtools.pyx":177
  * 
- *         nsamples = ngoodsamples[i]             # <<<<<<<<<<<<<<
- * 
- *         prob = altintegral(ml_ints[i,:nsamples],
+ *     cdef Py_ssize_t nsamples = ml_ints.shape[0]
+ *     if stop == -1:             # <<<<<<<<<<<<<<
+ *         stop = nsamples
+ *     checkSupport(start, stop, nsamples)
  */
-    __pyx_t_1 = __pyx_v_i;
-    __pyx_v_nsamples = (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_int_t *, __pyx_pybuffernd_ngoodsamples.rcbuffer->pybuffer.buf, __pyx_t_1, __pyx_pybuffernd_ngoodsamples.diminfo[0].strides));
+  }
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":189
- *         nsamples = ngoodsamples[i]
+  /* "deconvolvedlognormtools.pyx":179
+ *     if stop == -1:
+ *         stop = nsamples
+ *     checkSupport(start, stop, nsamples)             # <<<<<<<<<<<<<<
  * 
- *         prob = altintegral(ml_ints[i,:nsamples],             # <<<<<<<<<<<<<<
- *                            delta_logmls[i,:nsamples],
- *                            logmu,
+ *     return pdfintegral_support(<double *> ml_ints.data, <double *> deltamasses.data,
  */
-    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_altintegral); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 189, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PyInt_FromSsize_t(__pyx_v_i); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 189, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = PyInt_FromSsize_t(__pyx_v_nsamples); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 189, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_6 = PySlice_New(Py_None, __pyx_t_5, Py_None); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 189, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_checkSupport); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 179, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = PyInt_FromSsize_t(__pyx_v_start); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 179, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_stop); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 179, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_7 = PyInt_FromSsize_t(__pyx_v_nsamples); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 179, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_8 = NULL;
+  __pyx_t_4 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_8)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_8);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_4 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[4] = {__pyx_t_8, __pyx_t_5, __pyx_t_3, __pyx_t_7};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 3+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 179, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 189, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_GIVEREF(__pyx_t_4);
-    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
-    __Pyx_GIVEREF(__pyx_t_6);
-    PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_6);
-    __pyx_t_4 = 0;
-    __pyx_t_6 = 0;
-    __pyx_t_6 = PyObject_GetItem(((PyObject *)__pyx_v_ml_ints), __pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 189, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[4] = {__pyx_t_8, __pyx_t_5, __pyx_t_3, __pyx_t_7};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 3+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 179, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-
-    /* "nfwfitter/deconvolvedlognormtools.pyx":190
- * 
- *         prob = altintegral(ml_ints[i,:nsamples],
- *                            delta_logmls[i,:nsamples],             # <<<<<<<<<<<<<<
- *                            logmu,
- *                            sigma)
- */
-    __pyx_t_5 = PyInt_FromSsize_t(__pyx_v_i); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 190, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_4 = PyInt_FromSsize_t(__pyx_v_nsamples); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 190, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_7 = PySlice_New(Py_None, __pyx_t_4, Py_None); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 190, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 190, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_9 = PyTuple_New(3+__pyx_t_4); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 179, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    if (__pyx_t_8) {
+      __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_8); __pyx_t_8 = NULL;
+    }
     __Pyx_GIVEREF(__pyx_t_5);
-    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_9, 0+__pyx_t_4, __pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_9, 1+__pyx_t_4, __pyx_t_3);
     __Pyx_GIVEREF(__pyx_t_7);
-    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_7);
+    PyTuple_SET_ITEM(__pyx_t_9, 2+__pyx_t_4, __pyx_t_7);
     __pyx_t_5 = 0;
+    __pyx_t_3 = 0;
     __pyx_t_7 = 0;
-    __pyx_t_7 = PyObject_GetItem(((PyObject *)__pyx_v_delta_logmls), __pyx_t_4); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 190, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-
-    /* "nfwfitter/deconvolvedlognormtools.pyx":191
- *         prob = altintegral(ml_ints[i,:nsamples],
- *                            delta_logmls[i,:nsamples],
- *                            logmu,             # <<<<<<<<<<<<<<
- *                            sigma)
- * 
- */
-    __pyx_t_4 = PyFloat_FromDouble(__pyx_v_logmu); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 191, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-
-    /* "nfwfitter/deconvolvedlognormtools.pyx":192
- *                            delta_logmls[i,:nsamples],
- *                            logmu,
- *                            sigma)             # <<<<<<<<<<<<<<
- * 
- * 
- */
-    __pyx_t_5 = PyFloat_FromDouble(__pyx_v_sigma); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 192, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_8 = NULL;
-    __pyx_t_9 = 0;
-    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_8)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_8);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-        __pyx_t_9 = 1;
-      }
-    }
-    #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_3)) {
-      PyObject *__pyx_temp[5] = {__pyx_t_8, __pyx_t_6, __pyx_t_7, __pyx_t_4, __pyx_t_5};
-      __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_9, 4+__pyx_t_9); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 189, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    } else
-    #endif
-    #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
-      PyObject *__pyx_temp[5] = {__pyx_t_8, __pyx_t_6, __pyx_t_7, __pyx_t_4, __pyx_t_5};
-      __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_9, 4+__pyx_t_9); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 189, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    } else
-    #endif
-    {
-      __pyx_t_10 = PyTuple_New(4+__pyx_t_9); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 189, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_10);
-      if (__pyx_t_8) {
-        __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_t_8); __pyx_t_8 = NULL;
-      }
-      __Pyx_GIVEREF(__pyx_t_6);
-      PyTuple_SET_ITEM(__pyx_t_10, 0+__pyx_t_9, __pyx_t_6);
-      __Pyx_GIVEREF(__pyx_t_7);
-      PyTuple_SET_ITEM(__pyx_t_10, 1+__pyx_t_9, __pyx_t_7);
-      __Pyx_GIVEREF(__pyx_t_4);
-      PyTuple_SET_ITEM(__pyx_t_10, 2+__pyx_t_9, __pyx_t_4);
-      __Pyx_GIVEREF(__pyx_t_5);
-      PyTuple_SET_ITEM(__pyx_t_10, 3+__pyx_t_9, __pyx_t_5);
-      __pyx_t_6 = 0;
-      __pyx_t_7 = 0;
-      __pyx_t_4 = 0;
-      __pyx_t_5 = 0;
-      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_10, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 189, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-    }
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-    /* "nfwfitter/deconvolvedlognormtools.pyx":189
- *         nsamples = ngoodsamples[i]
- * 
- *         prob = altintegral(ml_ints[i,:nsamples],             # <<<<<<<<<<<<<<
- *                            delta_logmls[i,:nsamples],
- *                            logmu,
- */
-    __pyx_t_11 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_11 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 189, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_v_prob = __pyx_t_11;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 179, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":196
- * 
- * 
- *         sumlogprob += log(prob)             # <<<<<<<<<<<<<<
+  /* "deconvolvedlognormtools.pyx":181
+ *     checkSupport(start, stop, nsamples)
  * 
- *     return sumlogprob
+ *     return pdfintegral_support(<double *> ml_ints.data, <double *> deltamasses.data,             # <<<<<<<<<<<<<<
+ *                                <double *> delta_logmls.data, <double *> pdf.data,
+ *                                nsamples, start, stop, logmu, sigma)
  */
-    __pyx_v_sumlogprob = (__pyx_v_sumlogprob + log(__pyx_v_prob));
-  }
+  __Pyx_XDECREF(__pyx_r);
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":198
- *         sumlogprob += log(prob)
- * 
- *     return sumlogprob             # <<<<<<<<<<<<<<
+  /* "deconvolvedlognormtools.pyx":183
+ *     return pdfintegral_support(<double *> ml_ints.data, <double *> deltamasses.data,
+ *                                <double *> delta_logmls.data, <double *> pdf.data,
+ *                                nsamples, start, stop, logmu, sigma)             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_sumlogprob); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 198, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_r = __pyx_t_2;
-  __pyx_t_2 = 0;
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_f_23deconvolvedlognormtools_pdfintegral_support(((double *)__pyx_v_ml_ints->data), ((double *)__pyx_v_deltamasses->data), ((double *)__pyx_v_delta_logmls->data), ((double *)__pyx_v_pdf->data), __pyx_v_nsamples, __pyx_v_start, __pyx_v_stop, __pyx_v_logmu, __pyx_v_sigma)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 181, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":170
- * @cython.boundscheck(False)
- * @cython.wraparound(False)
- * def mcmcloglinearlike(np.ndarray[np.double_t, ndim=2, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
- *                       np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
- *                       np.ndarray[np.int_t, ndim=1, mode='c'] ngoodsamples,
+  /* "deconvolvedlognormtools.pyx":161
+ * ###
+ * 
+ * def pdfintegral(np.ndarray[np.double_t, ndim=1, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
+ *                 np.ndarray[np.double_t, ndim=1, mode='c'] deltamasses,
+ *                 np.ndarray[np.double_t, ndim=1, mode='c'] delta_logmls,
  */
 
   /* function exit code */
   __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_7);
   __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_9);
   { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
     __Pyx_PyThreadState_declare
     __Pyx_PyThreadState_assign
     __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_deltamasses.rcbuffer->pybuffer);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ngoodsamples.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_pdf.rcbuffer->pybuffer);
   __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("nfwfitter.deconvolvedlognormtools.mcmcloglinearlike", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("deconvolvedlognormtools.pdfintegral", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   goto __pyx_L2;
   __pyx_L0:;
   __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_deltamasses.rcbuffer->pybuffer);
   __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ngoodsamples.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_pdf.rcbuffer->pybuffer);
   __pyx_L2:;
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "nfwfitter/deconvolvedlognormtools.pyx":206
+/* "deconvolvedlognormtools.pyx":192
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
- * def pdfloglinearlike(np.ndarray[np.double_t, ndim=1, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
- *                       np.ndarray[np.double_t, ndim=1, mode='c'] deltamasses,
- *                       np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
+ * def loglinearlike(np.ndarray[np.double_t, ndim=2, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
+ *                   np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
+ *                   double logmu,
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_11pdfloglinearlike(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_9nfwfitter_23deconvolvedlognormtools_11pdfloglinearlike = {"pdfloglinearlike", (PyCFunction)__pyx_pw_9nfwfitter_23deconvolvedlognormtools_11pdfloglinearlike, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_11pdfloglinearlike(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_23deconvolvedlognormtools_11loglinearlike(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_23deconvolvedlognormtools_11loglinearlike = {"loglinearlike", (PyCFunction)__pyx_pw_23deconvolvedlognormtools_11loglinearlike, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_23deconvolvedlognormtools_11loglinearlike(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyArrayObject *__pyx_v_ml_ints = 0;
-  PyArrayObject *__pyx_v_deltamasses = 0;
   PyArrayObject *__pyx_v_delta_logmls = 0;
-  PyArrayObject *__pyx_v_pdfs = 0;
   double __pyx_v_logmu;
   double __pyx_v_sigma;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("pdfloglinearlike (wrapper)", 0);
+  __Pyx_RefNannySetupContext("loglinearlike (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_ml_ints,&__pyx_n_s_deltamasses,&__pyx_n_s_delta_logmls,&__pyx_n_s_pdfs,&__pyx_n_s_logmu,&__pyx_n_s_sigma,0};
-    PyObject* values[6] = {0,0,0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_ml_ints,&__pyx_n_s_delta_logmls,&__pyx_n_s_logmu,&__pyx_n_s_sigma,0};
+    PyObject* values[4] = {0,0,0,0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
-        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
         case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
         case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
         case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
@@ -3537,64 +3582,48 @@ static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_11pdfloglinearlik
         if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_ml_ints)) != 0)) kw_args--;
         else goto __pyx_L5_argtuple_error;
         case  1:
-        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_deltamasses)) != 0)) kw_args--;
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_delta_logmls)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("pdfloglinearlike", 1, 6, 6, 1); __PYX_ERR(0, 206, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("loglinearlike", 1, 4, 4, 1); __PYX_ERR(0, 192, __pyx_L3_error)
         }
         case  2:
-        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_delta_logmls)) != 0)) kw_args--;
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_logmu)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("pdfloglinearlike", 1, 6, 6, 2); __PYX_ERR(0, 206, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("loglinearlike", 1, 4, 4, 2); __PYX_ERR(0, 192, __pyx_L3_error)
         }
         case  3:
-        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_pdfs)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("pdfloglinearlike", 1, 6, 6, 3); __PYX_ERR(0, 206, __pyx_L3_error)
-        }
-        case  4:
-        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_logmu)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("pdfloglinearlike", 1, 6, 6, 4); __PYX_ERR(0, 206, __pyx_L3_error)
-        }
-        case  5:
-        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sigma)) != 0)) kw_args--;
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sigma)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("pdfloglinearlike", 1, 6, 6, 5); __PYX_ERR(0, 206, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("loglinearlike", 1, 4, 4, 3); __PYX_ERR(0, 192, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "pdfloglinearlike") < 0)) __PYX_ERR(0, 206, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "loglinearlike") < 0)) __PYX_ERR(0, 192, __pyx_L3_error)
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 6) {
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
       values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
       values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
     }
     __pyx_v_ml_ints = ((PyArrayObject *)values[0]);
-    __pyx_v_deltamasses = ((PyArrayObject *)values[1]);
-    __pyx_v_delta_logmls = ((PyArrayObject *)values[2]);
-    __pyx_v_pdfs = ((PyArrayObject *)values[3]);
-    __pyx_v_logmu = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_logmu == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 210, __pyx_L3_error)
-    __pyx_v_sigma = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_sigma == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 211, __pyx_L3_error)
+    __pyx_v_delta_logmls = ((PyArrayObject *)values[1]);
+    __pyx_v_logmu = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_logmu == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 194, __pyx_L3_error)
+    __pyx_v_sigma = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_sigma == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 195, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("pdfloglinearlike", 1, 6, 6, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 206, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("loglinearlike", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 192, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("nfwfitter.deconvolvedlognormtools.pdfloglinearlike", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("deconvolvedlognormtools.loglinearlike", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_ml_ints), __pyx_ptype_5numpy_ndarray, 1, "ml_ints", 0))) __PYX_ERR(0, 206, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_deltamasses), __pyx_ptype_5numpy_ndarray, 1, "deltamasses", 0))) __PYX_ERR(0, 207, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_delta_logmls), __pyx_ptype_5numpy_ndarray, 1, "delta_logmls", 0))) __PYX_ERR(0, 208, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_pdfs), __pyx_ptype_5numpy_ndarray, 1, "pdfs", 0))) __PYX_ERR(0, 209, __pyx_L1_error)
-  __pyx_r = __pyx_pf_9nfwfitter_23deconvolvedlognormtools_10pdfloglinearlike(__pyx_self, __pyx_v_ml_ints, __pyx_v_deltamasses, __pyx_v_delta_logmls, __pyx_v_pdfs, __pyx_v_logmu, __pyx_v_sigma);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_ml_ints), __pyx_ptype_5numpy_ndarray, 1, "ml_ints", 0))) __PYX_ERR(0, 192, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_delta_logmls), __pyx_ptype_5numpy_ndarray, 1, "delta_logmls", 0))) __PYX_ERR(0, 193, __pyx_L1_error)
+  __pyx_r = __pyx_pf_23deconvolvedlognormtools_10loglinearlike(__pyx_self, __pyx_v_ml_ints, __pyx_v_delta_logmls, __pyx_v_logmu, __pyx_v_sigma);
 
   /* function exit code */
   goto __pyx_L0;
@@ -3605,19 +3634,15 @@ static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_11pdfloglinearlik
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_10pdfloglinearlike(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_ml_ints, PyArrayObject *__pyx_v_deltamasses, PyArrayObject *__pyx_v_delta_logmls, PyArrayObject *__pyx_v_pdfs, double __pyx_v_logmu, double __pyx_v_sigma) {
+static PyObject *__pyx_pf_23deconvolvedlognormtools_10loglinearlike(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_ml_ints, PyArrayObject *__pyx_v_delta_logmls, double __pyx_v_logmu, double __pyx_v_sigma) {
   Py_ssize_t __pyx_v_i;
   Py_ssize_t __pyx_v_nclusters;
   double __pyx_v_sumlogprob;
   double __pyx_v_prob;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_delta_logmls;
   __Pyx_Buffer __pyx_pybuffer_delta_logmls;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_deltamasses;
-  __Pyx_Buffer __pyx_pybuffer_deltamasses;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_ml_ints;
   __Pyx_Buffer __pyx_pybuffer_ml_ints;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_pdfs;
-  __Pyx_Buffer __pyx_pybuffer_pdfs;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -3630,55 +3655,37 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_10pdfloglinearlik
   int __pyx_t_8;
   PyObject *__pyx_t_9 = NULL;
   double __pyx_t_10;
-  __Pyx_RefNannySetupContext("pdfloglinearlike", 0);
+  __Pyx_RefNannySetupContext("loglinearlike", 0);
   __pyx_pybuffer_ml_ints.pybuffer.buf = NULL;
   __pyx_pybuffer_ml_ints.refcount = 0;
   __pyx_pybuffernd_ml_ints.data = NULL;
   __pyx_pybuffernd_ml_ints.rcbuffer = &__pyx_pybuffer_ml_ints;
-  __pyx_pybuffer_deltamasses.pybuffer.buf = NULL;
-  __pyx_pybuffer_deltamasses.refcount = 0;
-  __pyx_pybuffernd_deltamasses.data = NULL;
-  __pyx_pybuffernd_deltamasses.rcbuffer = &__pyx_pybuffer_deltamasses;
   __pyx_pybuffer_delta_logmls.pybuffer.buf = NULL;
   __pyx_pybuffer_delta_logmls.refcount = 0;
   __pyx_pybuffernd_delta_logmls.data = NULL;
   __pyx_pybuffernd_delta_logmls.rcbuffer = &__pyx_pybuffer_delta_logmls;
-  __pyx_pybuffer_pdfs.pybuffer.buf = NULL;
-  __pyx_pybuffer_pdfs.refcount = 0;
-  __pyx_pybuffernd_pdfs.data = NULL;
-  __pyx_pybuffernd_pdfs.rcbuffer = &__pyx_pybuffer_pdfs;
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer, (PyObject*)__pyx_v_ml_ints, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 206, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_ml_ints.diminfo[0].strides = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_ml_ints.diminfo[0].shape = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_deltamasses.rcbuffer->pybuffer, (PyObject*)__pyx_v_deltamasses, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 206, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer, (PyObject*)__pyx_v_ml_ints, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 192, __pyx_L1_error)
   }
-  __pyx_pybuffernd_deltamasses.diminfo[0].strides = __pyx_pybuffernd_deltamasses.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_deltamasses.diminfo[0].shape = __pyx_pybuffernd_deltamasses.rcbuffer->pybuffer.shape[0];
+  __pyx_pybuffernd_ml_ints.diminfo[0].strides = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_ml_ints.diminfo[0].shape = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_ml_ints.diminfo[1].strides = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_ml_ints.diminfo[1].shape = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.shape[1];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer, (PyObject*)__pyx_v_delta_logmls, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 206, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer, (PyObject*)__pyx_v_delta_logmls, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 192, __pyx_L1_error)
   }
   __pyx_pybuffernd_delta_logmls.diminfo[0].strides = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_delta_logmls.diminfo[0].shape = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_delta_logmls.diminfo[1].strides = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_delta_logmls.diminfo[1].shape = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.shape[1];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_pdfs.rcbuffer->pybuffer, (PyObject*)__pyx_v_pdfs, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 206, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_pdfs.diminfo[0].strides = __pyx_pybuffernd_pdfs.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_pdfs.diminfo[0].shape = __pyx_pybuffernd_pdfs.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_pdfs.diminfo[1].strides = __pyx_pybuffernd_pdfs.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_pdfs.diminfo[1].shape = __pyx_pybuffernd_pdfs.rcbuffer->pybuffer.shape[1];
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":215
+  /* "deconvolvedlognormtools.pyx":199
  * 
  *     cdef Py_ssize_t i, nclusters
- *     nclusters = pdfs.shape[0]             # <<<<<<<<<<<<<<
- * 
+ *     nclusters = ml_ints.shape[0]             # <<<<<<<<<<<<<<
  * 
+ *     cdef double sumlogprob = 0.
  */
-  __pyx_v_nclusters = (__pyx_v_pdfs->dimensions[0]);
+  __pyx_v_nclusters = (__pyx_v_ml_ints->dimensions[0]);
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":218
- * 
+  /* "deconvolvedlognormtools.pyx":201
+ *     nclusters = ml_ints.shape[0]
  * 
  *     cdef double sumlogprob = 0.             # <<<<<<<<<<<<<<
  *     cdef double prob = 0.
@@ -3686,7 +3693,7 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_10pdfloglinearlik
  */
   __pyx_v_sumlogprob = 0.;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":219
+  /* "deconvolvedlognormtools.pyx":202
  * 
  *     cdef double sumlogprob = 0.
  *     cdef double prob = 0.             # <<<<<<<<<<<<<<
@@ -3695,85 +3702,77 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_10pdfloglinearlik
  */
   __pyx_v_prob = 0.;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":223
+  /* "deconvolvedlognormtools.pyx":206
  * 
  * 
  *     for i from nclusters > i >= 0:             # <<<<<<<<<<<<<<
  * 
- *         prob = pdfintegral(ml_ints,
+ * 
  */
   for (__pyx_v_i = __pyx_v_nclusters-1; __pyx_v_i >= 0; __pyx_v_i--) {
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":225
- *     for i from nclusters > i >= 0:
+    /* "deconvolvedlognormtools.pyx":210
  * 
- *         prob = pdfintegral(ml_ints,             # <<<<<<<<<<<<<<
- *                            deltamasses,
+ * 
+ *         prob = altintegral(ml_ints[i,:],             # <<<<<<<<<<<<<<
  *                            delta_logmls[i,:],
- */
-    __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_pdfintegral); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 225, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-
-    /* "nfwfitter/deconvolvedlognormtools.pyx":227
- *         prob = pdfintegral(ml_ints,
- *                            deltamasses,
- *                            delta_logmls[i,:],             # <<<<<<<<<<<<<<
- *                            pdfs[i,:],
  *                            logmu,
  */
-    __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_i); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 227, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_altintegral); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 210, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_i); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 210, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 227, __pyx_L1_error)
+    __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 210, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_GIVEREF(__pyx_t_3);
     PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
-    __Pyx_INCREF(__pyx_slice__3);
-    __Pyx_GIVEREF(__pyx_slice__3);
-    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_slice__3);
+    __Pyx_INCREF(__pyx_slice_);
+    __Pyx_GIVEREF(__pyx_slice_);
+    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_slice_);
     __pyx_t_3 = 0;
-    __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_delta_logmls), __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 227, __pyx_L1_error)
+    __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_ml_ints), __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 210, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":228
- *                            deltamasses,
- *                            delta_logmls[i,:],
- *                            pdfs[i,:],             # <<<<<<<<<<<<<<
+    /* "deconvolvedlognormtools.pyx":211
+ * 
+ *         prob = altintegral(ml_ints[i,:],
+ *                            delta_logmls[i,:],             # <<<<<<<<<<<<<<
  *                            logmu,
  *                            sigma)
  */
-    __pyx_t_4 = PyInt_FromSsize_t(__pyx_v_i); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 228, __pyx_L1_error)
+    __pyx_t_4 = PyInt_FromSsize_t(__pyx_v_i); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 211, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 228, __pyx_L1_error)
+    __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 211, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_GIVEREF(__pyx_t_4);
     PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
-    __Pyx_INCREF(__pyx_slice__4);
-    __Pyx_GIVEREF(__pyx_slice__4);
-    PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_slice__4);
+    __Pyx_INCREF(__pyx_slice__2);
+    __Pyx_GIVEREF(__pyx_slice__2);
+    PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_slice__2);
     __pyx_t_4 = 0;
-    __pyx_t_4 = PyObject_GetItem(((PyObject *)__pyx_v_pdfs), __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 228, __pyx_L1_error)
+    __pyx_t_4 = PyObject_GetItem(((PyObject *)__pyx_v_delta_logmls), __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 211, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":229
+    /* "deconvolvedlognormtools.pyx":212
+ *         prob = altintegral(ml_ints[i,:],
  *                            delta_logmls[i,:],
- *                            pdfs[i,:],
  *                            logmu,             # <<<<<<<<<<<<<<
  *                            sigma)
  * 
  */
-    __pyx_t_5 = PyFloat_FromDouble(__pyx_v_logmu); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 229, __pyx_L1_error)
+    __pyx_t_5 = PyFloat_FromDouble(__pyx_v_logmu); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 212, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":230
- *                            pdfs[i,:],
+    /* "deconvolvedlognormtools.pyx":213
+ *                            delta_logmls[i,:],
  *                            logmu,
  *                            sigma)             # <<<<<<<<<<<<<<
  * 
  * 
  */
-    __pyx_t_6 = PyFloat_FromDouble(__pyx_v_sigma); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 230, __pyx_L1_error)
+    __pyx_t_6 = PyFloat_FromDouble(__pyx_v_sigma); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 213, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __pyx_t_7 = NULL;
     __pyx_t_8 = 0;
@@ -3789,8 +3788,8 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_10pdfloglinearlik
     }
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_2)) {
-      PyObject *__pyx_temp[7] = {__pyx_t_7, ((PyObject *)__pyx_v_ml_ints), ((PyObject *)__pyx_v_deltamasses), __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_t_6};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 6+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 225, __pyx_L1_error)
+      PyObject *__pyx_temp[5] = {__pyx_t_7, __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_t_6};
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 210, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -3801,8 +3800,8 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_10pdfloglinearlik
     #endif
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
-      PyObject *__pyx_temp[7] = {__pyx_t_7, ((PyObject *)__pyx_v_ml_ints), ((PyObject *)__pyx_v_deltamasses), __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_t_6};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 6+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 225, __pyx_L1_error)
+      PyObject *__pyx_temp[5] = {__pyx_t_7, __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_t_6};
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 210, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -3812,47 +3811,41 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_10pdfloglinearlik
     } else
     #endif
     {
-      __pyx_t_9 = PyTuple_New(6+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 225, __pyx_L1_error)
+      __pyx_t_9 = PyTuple_New(4+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 210, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_9);
       if (__pyx_t_7) {
         __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_7); __pyx_t_7 = NULL;
       }
-      __Pyx_INCREF(((PyObject *)__pyx_v_ml_ints));
-      __Pyx_GIVEREF(((PyObject *)__pyx_v_ml_ints));
-      PyTuple_SET_ITEM(__pyx_t_9, 0+__pyx_t_8, ((PyObject *)__pyx_v_ml_ints));
-      __Pyx_INCREF(((PyObject *)__pyx_v_deltamasses));
-      __Pyx_GIVEREF(((PyObject *)__pyx_v_deltamasses));
-      PyTuple_SET_ITEM(__pyx_t_9, 1+__pyx_t_8, ((PyObject *)__pyx_v_deltamasses));
       __Pyx_GIVEREF(__pyx_t_3);
-      PyTuple_SET_ITEM(__pyx_t_9, 2+__pyx_t_8, __pyx_t_3);
+      PyTuple_SET_ITEM(__pyx_t_9, 0+__pyx_t_8, __pyx_t_3);
       __Pyx_GIVEREF(__pyx_t_4);
-      PyTuple_SET_ITEM(__pyx_t_9, 3+__pyx_t_8, __pyx_t_4);
+      PyTuple_SET_ITEM(__pyx_t_9, 1+__pyx_t_8, __pyx_t_4);
       __Pyx_GIVEREF(__pyx_t_5);
-      PyTuple_SET_ITEM(__pyx_t_9, 4+__pyx_t_8, __pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_9, 2+__pyx_t_8, __pyx_t_5);
       __Pyx_GIVEREF(__pyx_t_6);
-      PyTuple_SET_ITEM(__pyx_t_9, 5+__pyx_t_8, __pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_9, 3+__pyx_t_8, __pyx_t_6);
       __pyx_t_3 = 0;
       __pyx_t_4 = 0;
       __pyx_t_5 = 0;
       __pyx_t_6 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 225, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 210, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
     }
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":225
- *     for i from nclusters > i >= 0:
+    /* "deconvolvedlognormtools.pyx":210
  * 
- *         prob = pdfintegral(ml_ints,             # <<<<<<<<<<<<<<
- *                            deltamasses,
+ * 
+ *         prob = altintegral(ml_ints[i,:],             # <<<<<<<<<<<<<<
  *                            delta_logmls[i,:],
+ *                            logmu,
  */
-    __pyx_t_10 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_10 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 225, __pyx_L1_error)
+    __pyx_t_10 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_10 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 210, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_v_prob = __pyx_t_10;
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":234
+    /* "deconvolvedlognormtools.pyx":217
  * 
  * 
  *         sumlogprob += log(prob)             # <<<<<<<<<<<<<<
@@ -3862,7 +3855,7 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_10pdfloglinearlik
     __pyx_v_sumlogprob = (__pyx_v_sumlogprob + log(__pyx_v_prob));
   }
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":236
+  /* "deconvolvedlognormtools.pyx":219
  *         sumlogprob += log(prob)
  * 
  *     return sumlogprob             # <<<<<<<<<<<<<<
@@ -3870,18 +3863,18 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_10pdfloglinearlik
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_sumlogprob); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 236, __pyx_L1_error)
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_sumlogprob); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 219, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":206
+  /* "deconvolvedlognormtools.pyx":192
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
- * def pdfloglinearlike(np.ndarray[np.double_t, ndim=1, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
- *                       np.ndarray[np.double_t, ndim=1, mode='c'] deltamasses,
- *                       np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
+ * def loglinearlike(np.ndarray[np.double_t, ndim=2, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
+ *                   np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
+ *                   double logmu,
  */
 
   /* function exit code */
@@ -3899,55 +3892,47 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_10pdfloglinearlik
     __Pyx_PyThreadState_assign
     __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_deltamasses.rcbuffer->pybuffer);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_pdfs.rcbuffer->pybuffer);
   __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("nfwfitter.deconvolvedlognormtools.pdfloglinearlike", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("deconvolvedlognormtools.loglinearlike", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   goto __pyx_L2;
   __pyx_L0:;
   __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_deltamasses.rcbuffer->pybuffer);
   __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_pdfs.rcbuffer->pybuffer);
   __pyx_L2:;
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "nfwfitter/deconvolvedlognormtools.pyx":243
+/* "deconvolvedlognormtools.pyx":225
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
- * def outlierloglinearlike(np.ndarray[np.double_t, ndim=2, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
- *                          np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
- *                          np.ndarray[np.double_t, ndim=2, mode='c'] outlier_ml_ints,
+ * def mcmcloglinearlike(np.ndarray[np.double_t, ndim=2, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
+ *                       np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
+ *                       np.ndarray[np.int_t, ndim=1, mode='c'] ngoodsamples,
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_13outlierloglinearlike(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_9nfwfitter_23deconvolvedlognormtools_13outlierloglinearlike = {"outlierloglinearlike", (PyCFunction)__pyx_pw_9nfwfitter_23deconvolvedlognormtools_13outlierloglinearlike, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_13outlierloglinearlike(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_23deconvolvedlognormtools_13mcmcloglinearlike(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_23deconvolvedlognormtools_13mcmcloglinearlike = {"mcmcloglinearlike", (PyCFunction)__pyx_pw_23deconvolvedlognormtools_13mcmcloglinearlike, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_23deconvolvedlognormtools_13mcmcloglinearlike(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyArrayObject *__pyx_v_ml_ints = 0;
   PyArrayObject *__pyx_v_delta_logmls = 0;
-  PyArrayObject *__pyx_v_outlier_ml_ints = 0;
-  CYTHON_UNUSED PyArrayObject *__pyx_v_outlier_delta_logmls = 0;
+  PyArrayObject *__pyx_v_ngoodsamples = 0;
   double __pyx_v_logmu;
   double __pyx_v_sigma;
-  double __pyx_v_fracoutliers;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("outlierloglinearlike (wrapper)", 0);
+  __Pyx_RefNannySetupContext("mcmcloglinearlike (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_ml_ints,&__pyx_n_s_delta_logmls,&__pyx_n_s_outlier_ml_ints,&__pyx_n_s_outlier_delta_logmls,&__pyx_n_s_logmu,&__pyx_n_s_sigma,&__pyx_n_s_fracoutliers,0};
-    PyObject* values[7] = {0,0,0,0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_ml_ints,&__pyx_n_s_delta_logmls,&__pyx_n_s_ngoodsamples,&__pyx_n_s_logmu,&__pyx_n_s_sigma,0};
+    PyObject* values[5] = {0,0,0,0,0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
-        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
-        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
         case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
         case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
         case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
@@ -3964,38 +3949,28 @@ static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_13outlierloglinea
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_delta_logmls)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("outlierloglinearlike", 1, 7, 7, 1); __PYX_ERR(0, 243, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("mcmcloglinearlike", 1, 5, 5, 1); __PYX_ERR(0, 225, __pyx_L3_error)
         }
         case  2:
-        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_outlier_ml_ints)) != 0)) kw_args--;
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_ngoodsamples)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("outlierloglinearlike", 1, 7, 7, 2); __PYX_ERR(0, 243, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("mcmcloglinearlike", 1, 5, 5, 2); __PYX_ERR(0, 225, __pyx_L3_error)
         }
         case  3:
-        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_outlier_delta_logmls)) != 0)) kw_args--;
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_logmu)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("outlierloglinearlike", 1, 7, 7, 3); __PYX_ERR(0, 243, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("mcmcloglinearlike", 1, 5, 5, 3); __PYX_ERR(0, 225, __pyx_L3_error)
         }
         case  4:
-        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_logmu)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("outlierloglinearlike", 1, 7, 7, 4); __PYX_ERR(0, 243, __pyx_L3_error)
-        }
-        case  5:
-        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sigma)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("outlierloglinearlike", 1, 7, 7, 5); __PYX_ERR(0, 243, __pyx_L3_error)
-        }
-        case  6:
-        if (likely((values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_fracoutliers)) != 0)) kw_args--;
+        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sigma)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("outlierloglinearlike", 1, 7, 7, 6); __PYX_ERR(0, 243, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("mcmcloglinearlike", 1, 5, 5, 4); __PYX_ERR(0, 225, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "outlierloglinearlike") < 0)) __PYX_ERR(0, 243, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "mcmcloglinearlike") < 0)) __PYX_ERR(0, 225, __pyx_L3_error)
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 7) {
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 5) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
@@ -4003,30 +3978,25 @@ static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_13outlierloglinea
       values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
       values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
       values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
     }
     __pyx_v_ml_ints = ((PyArrayObject *)values[0]);
     __pyx_v_delta_logmls = ((PyArrayObject *)values[1]);
-    __pyx_v_outlier_ml_ints = ((PyArrayObject *)values[2]);
-    __pyx_v_outlier_delta_logmls = ((PyArrayObject *)values[3]);
-    __pyx_v_logmu = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_logmu == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 247, __pyx_L3_error)
-    __pyx_v_sigma = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_sigma == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 248, __pyx_L3_error)
-    __pyx_v_fracoutliers = __pyx_PyFloat_AsDouble(values[6]); if (unlikely((__pyx_v_fracoutliers == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 249, __pyx_L3_error)
+    __pyx_v_ngoodsamples = ((PyArrayObject *)values[2]);
+    __pyx_v_logmu = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_logmu == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 228, __pyx_L3_error)
+    __pyx_v_sigma = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_sigma == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 229, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("outlierloglinearlike", 1, 7, 7, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 243, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("mcmcloglinearlike", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 225, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("nfwfitter.deconvolvedlognormtools.outlierloglinearlike", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("deconvolvedlognormtools.mcmcloglinearlike", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_ml_ints), __pyx_ptype_5numpy_ndarray, 1, "ml_ints", 0))) __PYX_ERR(0, 243, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_delta_logmls), __pyx_ptype_5numpy_ndarray, 1, "delta_logmls", 0))) __PYX_ERR(0, 244, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_outlier_ml_ints), __pyx_ptype_5numpy_ndarray, 1, "outlier_ml_ints", 0))) __PYX_ERR(0, 245, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_outlier_delta_logmls), __pyx_ptype_5numpy_ndarray, 1, "outlier_delta_logmls", 0))) __PYX_ERR(0, 246, __pyx_L1_error)
-  __pyx_r = __pyx_pf_9nfwfitter_23deconvolvedlognormtools_12outlierloglinearlike(__pyx_self, __pyx_v_ml_ints, __pyx_v_delta_logmls, __pyx_v_outlier_ml_ints, __pyx_v_outlier_delta_logmls, __pyx_v_logmu, __pyx_v_sigma, __pyx_v_fracoutliers);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_ml_ints), __pyx_ptype_5numpy_ndarray, 1, "ml_ints", 0))) __PYX_ERR(0, 225, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_delta_logmls), __pyx_ptype_5numpy_ndarray, 1, "delta_logmls", 0))) __PYX_ERR(0, 226, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_ngoodsamples), __pyx_ptype_5numpy_ndarray, 1, "ngoodsamples", 0))) __PYX_ERR(0, 227, __pyx_L1_error)
+  __pyx_r = __pyx_pf_23deconvolvedlognormtools_12mcmcloglinearlike(__pyx_self, __pyx_v_ml_ints, __pyx_v_delta_logmls, __pyx_v_ngoodsamples, __pyx_v_logmu, __pyx_v_sigma);
 
   /* function exit code */
   goto __pyx_L0;
@@ -4037,33 +4007,32 @@ static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_13outlierloglinea
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_12outlierloglinearlike(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_ml_ints, PyArrayObject *__pyx_v_delta_logmls, PyArrayObject *__pyx_v_outlier_ml_ints, CYTHON_UNUSED PyArrayObject *__pyx_v_outlier_delta_logmls, double __pyx_v_logmu, double __pyx_v_sigma, double __pyx_v_fracoutliers) {
+static PyObject *__pyx_pf_23deconvolvedlognormtools_12mcmcloglinearlike(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_ml_ints, PyArrayObject *__pyx_v_delta_logmls, PyArrayObject *__pyx_v_ngoodsamples, double __pyx_v_logmu, double __pyx_v_sigma) {
   Py_ssize_t __pyx_v_i;
   Py_ssize_t __pyx_v_nclusters;
+  Py_ssize_t __pyx_v_nsamples;
   double __pyx_v_sumlogprob;
   double __pyx_v_prob;
-  PyObject *__pyx_v_outlierprob = 0;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_delta_logmls;
   __Pyx_Buffer __pyx_pybuffer_delta_logmls;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_ml_ints;
   __Pyx_Buffer __pyx_pybuffer_ml_ints;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_outlier_delta_logmls;
-  __Pyx_Buffer __pyx_pybuffer_outlier_delta_logmls;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_outlier_ml_ints;
-  __Pyx_Buffer __pyx_pybuffer_outlier_ml_ints;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_ngoodsamples;
+  __Pyx_Buffer __pyx_pybuffer_ngoodsamples;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_1;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
   PyObject *__pyx_t_6 = NULL;
   PyObject *__pyx_t_7 = NULL;
-  int __pyx_t_8;
-  PyObject *__pyx_t_9 = NULL;
-  double __pyx_t_10;
-  __Pyx_RefNannySetupContext("outlierloglinearlike", 0);
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  PyObject *__pyx_t_10 = NULL;
+  double __pyx_t_11;
+  __Pyx_RefNannySetupContext("mcmcloglinearlike", 0);
   __pyx_pybuffer_ml_ints.pybuffer.buf = NULL;
   __pyx_pybuffer_ml_ints.refcount = 0;
   __pyx_pybuffernd_ml_ints.data = NULL;
@@ -4072,383 +4041,3207 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_12outlierloglinea
   __pyx_pybuffer_delta_logmls.refcount = 0;
   __pyx_pybuffernd_delta_logmls.data = NULL;
   __pyx_pybuffernd_delta_logmls.rcbuffer = &__pyx_pybuffer_delta_logmls;
-  __pyx_pybuffer_outlier_ml_ints.pybuffer.buf = NULL;
-  __pyx_pybuffer_outlier_ml_ints.refcount = 0;
-  __pyx_pybuffernd_outlier_ml_ints.data = NULL;
-  __pyx_pybuffernd_outlier_ml_ints.rcbuffer = &__pyx_pybuffer_outlier_ml_ints;
-  __pyx_pybuffer_outlier_delta_logmls.pybuffer.buf = NULL;
-  __pyx_pybuffer_outlier_delta_logmls.refcount = 0;
-  __pyx_pybuffernd_outlier_delta_logmls.data = NULL;
-  __pyx_pybuffernd_outlier_delta_logmls.rcbuffer = &__pyx_pybuffer_outlier_delta_logmls;
+  __pyx_pybuffer_ngoodsamples.pybuffer.buf = NULL;
+  __pyx_pybuffer_ngoodsamples.refcount = 0;
+  __pyx_pybuffernd_ngoodsamples.data = NULL;
+  __pyx_pybuffernd_ngoodsamples.rcbuffer = &__pyx_pybuffer_ngoodsamples;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer, (PyObject*)__pyx_v_ml_ints, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 243, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer, (PyObject*)__pyx_v_ml_ints, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 225, __pyx_L1_error)
   }
   __pyx_pybuffernd_ml_ints.diminfo[0].strides = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_ml_ints.diminfo[0].shape = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_ml_ints.diminfo[1].strides = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_ml_ints.diminfo[1].shape = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.shape[1];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer, (PyObject*)__pyx_v_delta_logmls, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 243, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer, (PyObject*)__pyx_v_delta_logmls, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 225, __pyx_L1_error)
   }
   __pyx_pybuffernd_delta_logmls.diminfo[0].strides = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_delta_logmls.diminfo[0].shape = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_delta_logmls.diminfo[1].strides = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_delta_logmls.diminfo[1].shape = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.shape[1];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_outlier_ml_ints.rcbuffer->pybuffer, (PyObject*)__pyx_v_outlier_ml_ints, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 243, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_outlier_ml_ints.diminfo[0].strides = __pyx_pybuffernd_outlier_ml_ints.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_outlier_ml_ints.diminfo[0].shape = __pyx_pybuffernd_outlier_ml_ints.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_outlier_ml_ints.diminfo[1].strides = __pyx_pybuffernd_outlier_ml_ints.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_outlier_ml_ints.diminfo[1].shape = __pyx_pybuffernd_outlier_ml_ints.rcbuffer->pybuffer.shape[1];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_outlier_delta_logmls.rcbuffer->pybuffer, (PyObject*)__pyx_v_outlier_delta_logmls, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 243, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_ngoodsamples.rcbuffer->pybuffer, (PyObject*)__pyx_v_ngoodsamples, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 225, __pyx_L1_error)
   }
-  __pyx_pybuffernd_outlier_delta_logmls.diminfo[0].strides = __pyx_pybuffernd_outlier_delta_logmls.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_outlier_delta_logmls.diminfo[0].shape = __pyx_pybuffernd_outlier_delta_logmls.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_outlier_delta_logmls.diminfo[1].strides = __pyx_pybuffernd_outlier_delta_logmls.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_outlier_delta_logmls.diminfo[1].shape = __pyx_pybuffernd_outlier_delta_logmls.rcbuffer->pybuffer.shape[1];
+  __pyx_pybuffernd_ngoodsamples.diminfo[0].strides = __pyx_pybuffernd_ngoodsamples.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_ngoodsamples.diminfo[0].shape = __pyx_pybuffernd_ngoodsamples.rcbuffer->pybuffer.shape[0];
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":253
+  /* "deconvolvedlognormtools.pyx":233
  * 
- *     cdef Py_ssize_t i, nclusters
+ *     cdef Py_ssize_t i, nclusters, nsamples
  *     nclusters = ml_ints.shape[0]             # <<<<<<<<<<<<<<
  * 
  *     cdef double sumlogprob = 0.
  */
   __pyx_v_nclusters = (__pyx_v_ml_ints->dimensions[0]);
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":255
+  /* "deconvolvedlognormtools.pyx":235
  *     nclusters = ml_ints.shape[0]
  * 
  *     cdef double sumlogprob = 0.             # <<<<<<<<<<<<<<
  *     cdef double prob = 0.
- *     cdef outlierprob = 0.
+ * 
  */
   __pyx_v_sumlogprob = 0.;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":256
+  /* "deconvolvedlognormtools.pyx":236
  * 
  *     cdef double sumlogprob = 0.
  *     cdef double prob = 0.             # <<<<<<<<<<<<<<
- *     cdef outlierprob = 0.
- * 
- */
-  __pyx_v_prob = 0.;
-
-  /* "nfwfitter/deconvolvedlognormtools.pyx":257
- *     cdef double sumlogprob = 0.
- *     cdef double prob = 0.
- *     cdef outlierprob = 0.             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __Pyx_INCREF(__pyx_float_0_);
-  __pyx_v_outlierprob = __pyx_float_0_;
+  __pyx_v_prob = 0.;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":260
+  /* "deconvolvedlognormtools.pyx":240
  * 
  * 
  *     for i from nclusters > i >= 0:             # <<<<<<<<<<<<<<
  * 
- * 
+ *         nsamples = ngoodsamples[i]
  */
   for (__pyx_v_i = __pyx_v_nclusters-1; __pyx_v_i >= 0; __pyx_v_i--) {
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":264
+    /* "deconvolvedlognormtools.pyx":242
+ *     for i from nclusters > i >= 0:
  * 
+ *         nsamples = ngoodsamples[i]             # <<<<<<<<<<<<<<
  * 
- *         prob = altintegral(ml_ints[i,:],             # <<<<<<<<<<<<<<
- *                            delta_logmls[i,:],
- *                            logmu,
+ *         prob = altintegral(ml_ints[i,:nsamples],
  */
-    __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_altintegral); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 264, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_i); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 264, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 264, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_GIVEREF(__pyx_t_3);
-    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
-    __Pyx_INCREF(__pyx_slice__5);
-    __Pyx_GIVEREF(__pyx_slice__5);
-    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_slice__5);
-    __pyx_t_3 = 0;
-    __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_ml_ints), __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 264, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_1 = __pyx_v_i;
+    __pyx_v_nsamples = (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_int_t *, __pyx_pybuffernd_ngoodsamples.rcbuffer->pybuffer.buf, __pyx_t_1, __pyx_pybuffernd_ngoodsamples.diminfo[0].strides));
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":265
+    /* "deconvolvedlognormtools.pyx":244
+ *         nsamples = ngoodsamples[i]
  * 
- *         prob = altintegral(ml_ints[i,:],
- *                            delta_logmls[i,:],             # <<<<<<<<<<<<<<
+ *         prob = altintegral(ml_ints[i,:nsamples],             # <<<<<<<<<<<<<<
+ *                            delta_logmls[i,:nsamples],
  *                            logmu,
- *                            sigma)
  */
-    __pyx_t_4 = PyInt_FromSsize_t(__pyx_v_i); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 265, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_altintegral); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 244, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = PyInt_FromSsize_t(__pyx_v_i); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 244, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 265, __pyx_L1_error)
+    __pyx_t_5 = PyInt_FromSsize_t(__pyx_v_nsamples); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 244, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = PySlice_New(Py_None, __pyx_t_5, Py_None); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 244, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 244, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_GIVEREF(__pyx_t_4);
     PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
-    __Pyx_INCREF(__pyx_slice__6);
-    __Pyx_GIVEREF(__pyx_slice__6);
-    PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_slice__6);
+    __Pyx_GIVEREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_6);
     __pyx_t_4 = 0;
-    __pyx_t_4 = PyObject_GetItem(((PyObject *)__pyx_v_delta_logmls), __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 265, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_6 = 0;
+    __pyx_t_6 = PyObject_GetItem(((PyObject *)__pyx_v_ml_ints), __pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 244, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":266
- *         prob = altintegral(ml_ints[i,:],
- *                            delta_logmls[i,:],
+    /* "deconvolvedlognormtools.pyx":245
+ * 
+ *         prob = altintegral(ml_ints[i,:nsamples],
+ *                            delta_logmls[i,:nsamples],             # <<<<<<<<<<<<<<
+ *                            logmu,
+ *                            sigma)
+ */
+    __pyx_t_5 = PyInt_FromSsize_t(__pyx_v_i); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 245, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_4 = PyInt_FromSsize_t(__pyx_v_nsamples); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 245, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_7 = PySlice_New(Py_None, __pyx_t_4, Py_None); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 245, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 245, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_7);
+    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_7);
+    __pyx_t_5 = 0;
+    __pyx_t_7 = 0;
+    __pyx_t_7 = PyObject_GetItem(((PyObject *)__pyx_v_delta_logmls), __pyx_t_4); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 245, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "deconvolvedlognormtools.pyx":246
+ *         prob = altintegral(ml_ints[i,:nsamples],
+ *                            delta_logmls[i,:nsamples],
  *                            logmu,             # <<<<<<<<<<<<<<
  *                            sigma)
  * 
  */
-    __pyx_t_5 = PyFloat_FromDouble(__pyx_v_logmu); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 266, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_4 = PyFloat_FromDouble(__pyx_v_logmu); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 246, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":267
- *                            delta_logmls[i,:],
+    /* "deconvolvedlognormtools.pyx":247
+ *                            delta_logmls[i,:nsamples],
  *                            logmu,
  *                            sigma)             # <<<<<<<<<<<<<<
  * 
- *         outlierprob = altintegral(outlier_ml_ints[i,:],
+ * 
  */
-    __pyx_t_6 = PyFloat_FromDouble(__pyx_v_sigma); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 267, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_7 = NULL;
-    __pyx_t_8 = 0;
-    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
-      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_2);
-      if (likely(__pyx_t_7)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-        __Pyx_INCREF(__pyx_t_7);
-        __Pyx_INCREF(function);
+    __pyx_t_5 = PyFloat_FromDouble(__pyx_v_sigma); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 247, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_8 = NULL;
+    __pyx_t_9 = 0;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_8)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_8);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __pyx_t_9 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[5] = {__pyx_t_8, __pyx_t_6, __pyx_t_7, __pyx_t_4, __pyx_t_5};
+      __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_9, 4+__pyx_t_9); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 244, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[5] = {__pyx_t_8, __pyx_t_6, __pyx_t_7, __pyx_t_4, __pyx_t_5};
+      __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_9, 4+__pyx_t_9); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 244, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_10 = PyTuple_New(4+__pyx_t_9); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 244, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_10);
+      if (__pyx_t_8) {
+        __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_t_8); __pyx_t_8 = NULL;
+      }
+      __Pyx_GIVEREF(__pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_10, 0+__pyx_t_9, __pyx_t_6);
+      __Pyx_GIVEREF(__pyx_t_7);
+      PyTuple_SET_ITEM(__pyx_t_10, 1+__pyx_t_9, __pyx_t_7);
+      __Pyx_GIVEREF(__pyx_t_4);
+      PyTuple_SET_ITEM(__pyx_t_10, 2+__pyx_t_9, __pyx_t_4);
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_10, 3+__pyx_t_9, __pyx_t_5);
+      __pyx_t_6 = 0;
+      __pyx_t_7 = 0;
+      __pyx_t_4 = 0;
+      __pyx_t_5 = 0;
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_10, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 244, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "deconvolvedlognormtools.pyx":244
+ *         nsamples = ngoodsamples[i]
+ * 
+ *         prob = altintegral(ml_ints[i,:nsamples],             # <<<<<<<<<<<<<<
+ *                            delta_logmls[i,:nsamples],
+ *                            logmu,
+ */
+    __pyx_t_11 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_11 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 244, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_v_prob = __pyx_t_11;
+
+    /* "deconvolvedlognormtools.pyx":251
+ * 
+ * 
+ *         sumlogprob += log(prob)             # <<<<<<<<<<<<<<
+ * 
+ *     return sumlogprob
+ */
+    __pyx_v_sumlogprob = (__pyx_v_sumlogprob + log(__pyx_v_prob));
+  }
+
+  /* "deconvolvedlognormtools.pyx":253
+ *         sumlogprob += log(prob)
+ * 
+ *     return sumlogprob             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_sumlogprob); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 253, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "deconvolvedlognormtools.pyx":225
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def mcmcloglinearlike(np.ndarray[np.double_t, ndim=2, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
+ *                       np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
+ *                       np.ndarray[np.int_t, ndim=1, mode='c'] ngoodsamples,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_10);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ngoodsamples.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("deconvolvedlognormtools.mcmcloglinearlike", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ngoodsamples.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "deconvolvedlognormtools.pyx":261
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def pdfloglinearlike(np.ndarray[np.double_t, ndim=1, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
+ *                       np.ndarray[np.double_t, ndim=1, mode='c'] deltamasses,
+ *                       np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_23deconvolvedlognormtools_15pdfloglinearlike(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_23deconvolvedlognormtools_15pdfloglinearlike = {"pdfloglinearlike", (PyCFunction)__pyx_pw_23deconvolvedlognormtools_15pdfloglinearlike, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_23deconvolvedlognormtools_15pdfloglinearlike(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_ml_ints = 0;
+  PyArrayObject *__pyx_v_deltamasses = 0;
+  PyArrayObject *__pyx_v_delta_logmls = 0;
+  PyArrayObject *__pyx_v_pdfs = 0;
+  double __pyx_v_logmu;
+  double __pyx_v_sigma;
+  PyArrayObject *__pyx_v_supports = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("pdfloglinearlike (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_ml_ints,&__pyx_n_s_deltamasses,&__pyx_n_s_delta_logmls,&__pyx_n_s_pdfs,&__pyx_n_s_logmu,&__pyx_n_s_sigma,&__pyx_n_s_supports,0};
+    PyObject* values[7] = {0,0,0,0,0,0,0};
+
+    /* "deconvolvedlognormtools.pyx":267
+ *                       double logmu,
+ *                       double sigma,
+ *                       np.ndarray[np.intp_t, ndim=2, mode='c'] supports = None):             # <<<<<<<<<<<<<<
+ *     ### supports, if given, is (nclusters x 2) [start, stop) of each nonzero pdf
+ * 
+ */
+    values[6] = (PyObject *)((PyArrayObject *)Py_None);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_ml_ints)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_deltamasses)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("pdfloglinearlike", 0, 6, 7, 1); __PYX_ERR(0, 261, __pyx_L3_error)
+        }
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_delta_logmls)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("pdfloglinearlike", 0, 6, 7, 2); __PYX_ERR(0, 261, __pyx_L3_error)
+        }
+        case  3:
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_pdfs)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("pdfloglinearlike", 0, 6, 7, 3); __PYX_ERR(0, 261, __pyx_L3_error)
+        }
+        case  4:
+        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_logmu)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("pdfloglinearlike", 0, 6, 7, 4); __PYX_ERR(0, 261, __pyx_L3_error)
+        }
+        case  5:
+        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sigma)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("pdfloglinearlike", 0, 6, 7, 5); __PYX_ERR(0, 261, __pyx_L3_error)
+        }
+        case  6:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_supports);
+          if (value) { values[6] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "pdfloglinearlike") < 0)) __PYX_ERR(0, 261, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_ml_ints = ((PyArrayObject *)values[0]);
+    __pyx_v_deltamasses = ((PyArrayObject *)values[1]);
+    __pyx_v_delta_logmls = ((PyArrayObject *)values[2]);
+    __pyx_v_pdfs = ((PyArrayObject *)values[3]);
+    __pyx_v_logmu = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_logmu == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 265, __pyx_L3_error)
+    __pyx_v_sigma = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_sigma == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 266, __pyx_L3_error)
+    __pyx_v_supports = ((PyArrayObject *)values[6]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("pdfloglinearlike", 0, 6, 7, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 261, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("deconvolvedlognormtools.pdfloglinearlike", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_ml_ints), __pyx_ptype_5numpy_ndarray, 1, "ml_ints", 0))) __PYX_ERR(0, 261, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_deltamasses), __pyx_ptype_5numpy_ndarray, 1, "deltamasses", 0))) __PYX_ERR(0, 262, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_delta_logmls), __pyx_ptype_5numpy_ndarray, 1, "delta_logmls", 0))) __PYX_ERR(0, 263, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_pdfs), __pyx_ptype_5numpy_ndarray, 1, "pdfs", 0))) __PYX_ERR(0, 264, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_supports), __pyx_ptype_5numpy_ndarray, 1, "supports", 0))) __PYX_ERR(0, 267, __pyx_L1_error)
+  __pyx_r = __pyx_pf_23deconvolvedlognormtools_14pdfloglinearlike(__pyx_self, __pyx_v_ml_ints, __pyx_v_deltamasses, __pyx_v_delta_logmls, __pyx_v_pdfs, __pyx_v_logmu, __pyx_v_sigma, __pyx_v_supports);
+
+  /* "deconvolvedlognormtools.pyx":261
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def pdfloglinearlike(np.ndarray[np.double_t, ndim=1, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
+ *                       np.ndarray[np.double_t, ndim=1, mode='c'] deltamasses,
+ *                       np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_23deconvolvedlognormtools_14pdfloglinearlike(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_ml_ints, PyArrayObject *__pyx_v_deltamasses, PyArrayObject *__pyx_v_delta_logmls, PyArrayObject *__pyx_v_pdfs, double __pyx_v_logmu, double __pyx_v_sigma, PyArrayObject *__pyx_v_supports) {
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_nclusters;
+  Py_ssize_t __pyx_v_nsamples;
+  double *__pyx_v_ml_data;
+  double *__pyx_v_deltamass_data;
+  double *__pyx_v_dlm_data;
+  double *__pyx_v_pdf_data;
+  double __pyx_v_sumlogprob;
+  double __pyx_v_prob;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_delta_logmls;
+  __Pyx_Buffer __pyx_pybuffer_delta_logmls;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_deltamasses;
+  __Pyx_Buffer __pyx_pybuffer_deltamasses;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_ml_ints;
+  __Pyx_Buffer __pyx_pybuffer_ml_ints;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_pdfs;
+  __Pyx_Buffer __pyx_pybuffer_pdfs;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_supports;
+  __Pyx_Buffer __pyx_pybuffer_supports;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyArrayObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  Py_ssize_t __pyx_t_13;
+  Py_ssize_t __pyx_t_14;
+  Py_ssize_t __pyx_t_15;
+  Py_ssize_t __pyx_t_16;
+  __Pyx_RefNannySetupContext("pdfloglinearlike", 0);
+  __Pyx_INCREF((PyObject *)__pyx_v_supports);
+  __pyx_pybuffer_ml_ints.pybuffer.buf = NULL;
+  __pyx_pybuffer_ml_ints.refcount = 0;
+  __pyx_pybuffernd_ml_ints.data = NULL;
+  __pyx_pybuffernd_ml_ints.rcbuffer = &__pyx_pybuffer_ml_ints;
+  __pyx_pybuffer_deltamasses.pybuffer.buf = NULL;
+  __pyx_pybuffer_deltamasses.refcount = 0;
+  __pyx_pybuffernd_deltamasses.data = NULL;
+  __pyx_pybuffernd_deltamasses.rcbuffer = &__pyx_pybuffer_deltamasses;
+  __pyx_pybuffer_delta_logmls.pybuffer.buf = NULL;
+  __pyx_pybuffer_delta_logmls.refcount = 0;
+  __pyx_pybuffernd_delta_logmls.data = NULL;
+  __pyx_pybuffernd_delta_logmls.rcbuffer = &__pyx_pybuffer_delta_logmls;
+  __pyx_pybuffer_pdfs.pybuffer.buf = NULL;
+  __pyx_pybuffer_pdfs.refcount = 0;
+  __pyx_pybuffernd_pdfs.data = NULL;
+  __pyx_pybuffernd_pdfs.rcbuffer = &__pyx_pybuffer_pdfs;
+  __pyx_pybuffer_supports.pybuffer.buf = NULL;
+  __pyx_pybuffer_supports.refcount = 0;
+  __pyx_pybuffernd_supports.data = NULL;
+  __pyx_pybuffernd_supports.rcbuffer = &__pyx_pybuffer_supports;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer, (PyObject*)__pyx_v_ml_ints, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 261, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_ml_ints.diminfo[0].strides = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_ml_ints.diminfo[0].shape = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_deltamasses.rcbuffer->pybuffer, (PyObject*)__pyx_v_deltamasses, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 261, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_deltamasses.diminfo[0].strides = __pyx_pybuffernd_deltamasses.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_deltamasses.diminfo[0].shape = __pyx_pybuffernd_deltamasses.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer, (PyObject*)__pyx_v_delta_logmls, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 261, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_delta_logmls.diminfo[0].strides = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_delta_logmls.diminfo[0].shape = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_delta_logmls.diminfo[1].strides = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_delta_logmls.diminfo[1].shape = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_pdfs.rcbuffer->pybuffer, (PyObject*)__pyx_v_pdfs, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 261, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_pdfs.diminfo[0].strides = __pyx_pybuffernd_pdfs.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_pdfs.diminfo[0].shape = __pyx_pybuffernd_pdfs.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_pdfs.diminfo[1].strides = __pyx_pybuffernd_pdfs.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_pdfs.diminfo[1].shape = __pyx_pybuffernd_pdfs.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_supports.rcbuffer->pybuffer, (PyObject*)__pyx_v_supports, &__Pyx_TypeInfo_nn___pyx_t_5numpy_intp_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 261, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_supports.diminfo[0].strides = __pyx_pybuffernd_supports.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_supports.diminfo[0].shape = __pyx_pybuffernd_supports.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_supports.diminfo[1].strides = __pyx_pybuffernd_supports.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_supports.diminfo[1].shape = __pyx_pybuffernd_supports.rcbuffer->pybuffer.shape[1];
+
+  /* "deconvolvedlognormtools.pyx":271
+ * 
+ * 
+ *     checkPDFShapes(ml_ints, deltamasses, delta_logmls, pdfs)             # <<<<<<<<<<<<<<
+ *     if delta_logmls.shape[0] != pdfs.shape[0]:
+ *         raise ValueError('delta_logmls and pdfs have different numbers of clusters (%d, %d)' % \
+ */
+  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_checkPDFShapes); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 271, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = NULL;
+  __pyx_t_4 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_4 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[5] = {__pyx_t_3, ((PyObject *)__pyx_v_ml_ints), ((PyObject *)__pyx_v_deltamasses), ((PyObject *)__pyx_v_delta_logmls), ((PyObject *)__pyx_v_pdfs)};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 4+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 271, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[5] = {__pyx_t_3, ((PyObject *)__pyx_v_ml_ints), ((PyObject *)__pyx_v_deltamasses), ((PyObject *)__pyx_v_delta_logmls), ((PyObject *)__pyx_v_pdfs)};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 4+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 271, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else
+  #endif
+  {
+    __pyx_t_5 = PyTuple_New(4+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 271, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (__pyx_t_3) {
+      __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3); __pyx_t_3 = NULL;
+    }
+    __Pyx_INCREF(((PyObject *)__pyx_v_ml_ints));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_ml_ints));
+    PyTuple_SET_ITEM(__pyx_t_5, 0+__pyx_t_4, ((PyObject *)__pyx_v_ml_ints));
+    __Pyx_INCREF(((PyObject *)__pyx_v_deltamasses));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_deltamasses));
+    PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_4, ((PyObject *)__pyx_v_deltamasses));
+    __Pyx_INCREF(((PyObject *)__pyx_v_delta_logmls));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_delta_logmls));
+    PyTuple_SET_ITEM(__pyx_t_5, 2+__pyx_t_4, ((PyObject *)__pyx_v_delta_logmls));
+    __Pyx_INCREF(((PyObject *)__pyx_v_pdfs));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_pdfs));
+    PyTuple_SET_ITEM(__pyx_t_5, 3+__pyx_t_4, ((PyObject *)__pyx_v_pdfs));
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 271, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "deconvolvedlognormtools.pyx":272
+ * 
+ *     checkPDFShapes(ml_ints, deltamasses, delta_logmls, pdfs)
+ *     if delta_logmls.shape[0] != pdfs.shape[0]:             # <<<<<<<<<<<<<<
+ *         raise ValueError('delta_logmls and pdfs have different numbers of clusters (%d, %d)' % \
+ *                              (delta_logmls.shape[0], pdfs.shape[0]))
+ */
+  __pyx_t_6 = (((__pyx_v_delta_logmls->dimensions[0]) != (__pyx_v_pdfs->dimensions[0])) != 0);
+  if (__pyx_t_6) {
+
+    /* "deconvolvedlognormtools.pyx":274
+ *     if delta_logmls.shape[0] != pdfs.shape[0]:
+ *         raise ValueError('delta_logmls and pdfs have different numbers of clusters (%d, %d)' % \
+ *                              (delta_logmls.shape[0], pdfs.shape[0]))             # <<<<<<<<<<<<<<
+ * 
+ *     cdef Py_ssize_t i, nclusters, nsamples
+ */
+    __pyx_t_1 = __Pyx_PyInt_From_Py_intptr_t((__pyx_v_delta_logmls->dimensions[0])); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 274, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = __Pyx_PyInt_From_Py_intptr_t((__pyx_v_pdfs->dimensions[0])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 274, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 274, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_2);
+    __pyx_t_1 = 0;
+    __pyx_t_2 = 0;
+
+    /* "deconvolvedlognormtools.pyx":273
+ *     checkPDFShapes(ml_ints, deltamasses, delta_logmls, pdfs)
+ *     if delta_logmls.shape[0] != pdfs.shape[0]:
+ *         raise ValueError('delta_logmls and pdfs have different numbers of clusters (%d, %d)' % \             # <<<<<<<<<<<<<<
+ *                              (delta_logmls.shape[0], pdfs.shape[0]))
+ * 
+ */
+    __pyx_t_2 = __Pyx_PyString_Format(__pyx_kp_s_delta_logmls_and_pdfs_have_diffe, __pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 273, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 273, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_2);
+    __pyx_t_2 = 0;
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_t_5, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 273, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 273, __pyx_L1_error)
+
+    /* "deconvolvedlognormtools.pyx":272
+ * 
+ *     checkPDFShapes(ml_ints, deltamasses, delta_logmls, pdfs)
+ *     if delta_logmls.shape[0] != pdfs.shape[0]:             # <<<<<<<<<<<<<<
+ *         raise ValueError('delta_logmls and pdfs have different numbers of clusters (%d, %d)' % \
+ *                              (delta_logmls.shape[0], pdfs.shape[0]))
+ */
+  }
+
+  /* "deconvolvedlognormtools.pyx":277
+ * 
+ *     cdef Py_ssize_t i, nclusters, nsamples
+ *     nclusters = pdfs.shape[0]             # <<<<<<<<<<<<<<
+ *     nsamples = ml_ints.shape[0]
+ * 
+ */
+  __pyx_v_nclusters = (__pyx_v_pdfs->dimensions[0]);
+
+  /* "deconvolvedlognormtools.pyx":278
+ *     cdef Py_ssize_t i, nclusters, nsamples
+ *     nclusters = pdfs.shape[0]
+ *     nsamples = ml_ints.shape[0]             # <<<<<<<<<<<<<<
+ * 
+ *     if supports is None:
+ */
+  __pyx_v_nsamples = (__pyx_v_ml_ints->dimensions[0]);
+
+  /* "deconvolvedlognormtools.pyx":280
+ *     nsamples = ml_ints.shape[0]
+ * 
+ *     if supports is None:             # <<<<<<<<<<<<<<
+ *         supports = np.zeros((nclusters, 2), dtype=np.intp)
+ *         supports[:,1] = nsamples
+ */
+  __pyx_t_6 = (((PyObject *)__pyx_v_supports) == Py_None);
+  __pyx_t_7 = (__pyx_t_6 != 0);
+  if (__pyx_t_7) {
+
+    /* "deconvolvedlognormtools.pyx":281
+ * 
+ *     if supports is None:
+ *         supports = np.zeros((nclusters, 2), dtype=np.intp)             # <<<<<<<<<<<<<<
+ *         supports[:,1] = nsamples
+ *     else:
+ */
+    __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 281, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_zeros); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 281, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_nclusters); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 281, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 281, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
+    __Pyx_INCREF(__pyx_int_2);
+    __Pyx_GIVEREF(__pyx_int_2);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_int_2);
+    __pyx_t_2 = 0;
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 281, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
+    __pyx_t_1 = 0;
+    __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 281, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 281, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_intp); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 281, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_8) < 0) __PYX_ERR(0, 281, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_8 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_2, __pyx_t_1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 281, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (!(likely(((__pyx_t_8) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_8, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 281, __pyx_L1_error)
+    __pyx_t_9 = ((PyArrayObject *)__pyx_t_8);
+    {
+      __Pyx_BufFmt_StackElem __pyx_stack[1];
+      __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_supports.rcbuffer->pybuffer);
+      __pyx_t_4 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_supports.rcbuffer->pybuffer, (PyObject*)__pyx_t_9, &__Pyx_TypeInfo_nn___pyx_t_5numpy_intp_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack);
+      if (unlikely(__pyx_t_4 < 0)) {
+        PyErr_Fetch(&__pyx_t_10, &__pyx_t_11, &__pyx_t_12);
+        if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_supports.rcbuffer->pybuffer, (PyObject*)__pyx_v_supports, &__Pyx_TypeInfo_nn___pyx_t_5numpy_intp_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) {
+          Py_XDECREF(__pyx_t_10); Py_XDECREF(__pyx_t_11); Py_XDECREF(__pyx_t_12);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_10, __pyx_t_11, __pyx_t_12);
+        }
+      }
+      __pyx_pybuffernd_supports.diminfo[0].strides = __pyx_pybuffernd_supports.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_supports.diminfo[0].shape = __pyx_pybuffernd_supports.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_supports.diminfo[1].strides = __pyx_pybuffernd_supports.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_supports.diminfo[1].shape = __pyx_pybuffernd_supports.rcbuffer->pybuffer.shape[1];
+      if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 281, __pyx_L1_error)
+    }
+    __pyx_t_9 = 0;
+    __Pyx_DECREF_SET(__pyx_v_supports, ((PyArrayObject *)__pyx_t_8));
+    __pyx_t_8 = 0;
+
+    /* "deconvolvedlognormtools.pyx":282
+ *     if supports is None:
+ *         supports = np.zeros((nclusters, 2), dtype=np.intp)
+ *         supports[:,1] = nsamples             # <<<<<<<<<<<<<<
+ *     else:
+ *         if supports.shape[0] != nclusters or supports.shape[1] != 2:
+ */
+    __pyx_t_8 = PyInt_FromSsize_t(__pyx_v_nsamples); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 282, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    if (unlikely(PyObject_SetItem(((PyObject *)__pyx_v_supports), __pyx_tuple__4, __pyx_t_8) < 0)) __PYX_ERR(0, 282, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+    /* "deconvolvedlognormtools.pyx":280
+ *     nsamples = ml_ints.shape[0]
+ * 
+ *     if supports is None:             # <<<<<<<<<<<<<<
+ *         supports = np.zeros((nclusters, 2), dtype=np.intp)
+ *         supports[:,1] = nsamples
+ */
+    goto __pyx_L4;
+  }
+
+  /* "deconvolvedlognormtools.pyx":284
+ *         supports[:,1] = nsamples
+ *     else:
+ *         if supports.shape[0] != nclusters or supports.shape[1] != 2:             # <<<<<<<<<<<<<<
+ *             raise ValueError('supports should be (%d, 2), is (%d, %d)' % (nclusters, supports.shape[0], supports.shape[1]))
+ *         if ((supports[:,0] < 0) | (supports[:,1] < supports[:,0]) | (supports[:,1] > nsamples)).any():
+ */
+  /*else*/ {
+    __pyx_t_6 = (((__pyx_v_supports->dimensions[0]) != __pyx_v_nclusters) != 0);
+    if (!__pyx_t_6) {
+    } else {
+      __pyx_t_7 = __pyx_t_6;
+      goto __pyx_L6_bool_binop_done;
+    }
+    __pyx_t_6 = (((__pyx_v_supports->dimensions[1]) != 2) != 0);
+    __pyx_t_7 = __pyx_t_6;
+    __pyx_L6_bool_binop_done:;
+    if (__pyx_t_7) {
+
+      /* "deconvolvedlognormtools.pyx":285
+ *     else:
+ *         if supports.shape[0] != nclusters or supports.shape[1] != 2:
+ *             raise ValueError('supports should be (%d, 2), is (%d, %d)' % (nclusters, supports.shape[0], supports.shape[1]))             # <<<<<<<<<<<<<<
+ *         if ((supports[:,0] < 0) | (supports[:,1] < supports[:,0]) | (supports[:,1] > nsamples)).any():
+ *             raise ValueError('supports must satisfy 0 <= start <= stop <= %d' % nsamples)
+ */
+      __pyx_t_8 = PyInt_FromSsize_t(__pyx_v_nclusters); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 285, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __pyx_t_1 = __Pyx_PyInt_From_Py_intptr_t((__pyx_v_supports->dimensions[0])); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 285, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_2 = __Pyx_PyInt_From_Py_intptr_t((__pyx_v_supports->dimensions[1])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 285, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_5 = PyTuple_New(3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 285, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_GIVEREF(__pyx_t_8);
+      PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_8);
+      __Pyx_GIVEREF(__pyx_t_1);
+      PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_1);
+      __Pyx_GIVEREF(__pyx_t_2);
+      PyTuple_SET_ITEM(__pyx_t_5, 2, __pyx_t_2);
+      __pyx_t_8 = 0;
+      __pyx_t_1 = 0;
+      __pyx_t_2 = 0;
+      __pyx_t_2 = __Pyx_PyString_Format(__pyx_kp_s_supports_should_be_d_2_is_d_d, __pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 285, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 285, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_GIVEREF(__pyx_t_2);
+      PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_2);
+      __pyx_t_2 = 0;
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_t_5, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 285, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __PYX_ERR(0, 285, __pyx_L1_error)
+
+      /* "deconvolvedlognormtools.pyx":284
+ *         supports[:,1] = nsamples
+ *     else:
+ *         if supports.shape[0] != nclusters or supports.shape[1] != 2:             # <<<<<<<<<<<<<<
+ *             raise ValueError('supports should be (%d, 2), is (%d, %d)' % (nclusters, supports.shape[0], supports.shape[1]))
+ *         if ((supports[:,0] < 0) | (supports[:,1] < supports[:,0]) | (supports[:,1] > nsamples)).any():
+ */
+    }
+
+    /* "deconvolvedlognormtools.pyx":286
+ *         if supports.shape[0] != nclusters or supports.shape[1] != 2:
+ *             raise ValueError('supports should be (%d, 2), is (%d, %d)' % (nclusters, supports.shape[0], supports.shape[1]))
+ *         if ((supports[:,0] < 0) | (supports[:,1] < supports[:,0]) | (supports[:,1] > nsamples)).any():             # <<<<<<<<<<<<<<
+ *             raise ValueError('supports must satisfy 0 <= start <= stop <= %d' % nsamples)
+ * 
+ */
+    __pyx_t_5 = PyObject_GetItem(((PyObject *)__pyx_v_supports), __pyx_tuple__6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 286, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_1 = PyObject_RichCompare(__pyx_t_5, __pyx_int_0, Py_LT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 286, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = PyObject_GetItem(((PyObject *)__pyx_v_supports), __pyx_tuple__8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 286, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_8 = PyObject_GetItem(((PyObject *)__pyx_v_supports), __pyx_tuple__10); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 286, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_3 = PyObject_RichCompare(__pyx_t_5, __pyx_t_8, Py_LT); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 286, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_8 = PyNumber_Or(__pyx_t_1, __pyx_t_3); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 286, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_supports), __pyx_tuple__12); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 286, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = PyInt_FromSsize_t(__pyx_v_nsamples); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 286, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = PyObject_RichCompare(__pyx_t_3, __pyx_t_1, Py_GT); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 286, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyNumber_Or(__pyx_t_8, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 286, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_any); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 286, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_1)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_1);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+      }
+    }
+    if (__pyx_t_1) {
+      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 286, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    } else {
+      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 286, __pyx_L1_error)
+    }
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 286, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (__pyx_t_7) {
+
+      /* "deconvolvedlognormtools.pyx":287
+ *             raise ValueError('supports should be (%d, 2), is (%d, %d)' % (nclusters, supports.shape[0], supports.shape[1]))
+ *         if ((supports[:,0] < 0) | (supports[:,1] < supports[:,0]) | (supports[:,1] > nsamples)).any():
+ *             raise ValueError('supports must satisfy 0 <= start <= stop <= %d' % nsamples)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double * ml_data = <double *> ml_ints.data
+ */
+      __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_nsamples); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 287, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_supports_must_satisfy_0_start_st, __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 287, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 287, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_5);
+      __pyx_t_5 = 0;
+      __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_t_2, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 287, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_Raise(__pyx_t_5, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __PYX_ERR(0, 287, __pyx_L1_error)
+
+      /* "deconvolvedlognormtools.pyx":286
+ *         if supports.shape[0] != nclusters or supports.shape[1] != 2:
+ *             raise ValueError('supports should be (%d, 2), is (%d, %d)' % (nclusters, supports.shape[0], supports.shape[1]))
+ *         if ((supports[:,0] < 0) | (supports[:,1] < supports[:,0]) | (supports[:,1] > nsamples)).any():             # <<<<<<<<<<<<<<
+ *             raise ValueError('supports must satisfy 0 <= start <= stop <= %d' % nsamples)
+ * 
+ */
+    }
+  }
+  __pyx_L4:;
+
+  /* "deconvolvedlognormtools.pyx":289
+ *             raise ValueError('supports must satisfy 0 <= start <= stop <= %d' % nsamples)
+ * 
+ *     cdef double * ml_data = <double *> ml_ints.data             # <<<<<<<<<<<<<<
+ *     cdef double * deltamass_data = <double *> deltamasses.data
+ *     cdef double * dlm_data = <double *> delta_logmls.data
+ */
+  __pyx_v_ml_data = ((double *)__pyx_v_ml_ints->data);
+
+  /* "deconvolvedlognormtools.pyx":290
+ * 
+ *     cdef double * ml_data = <double *> ml_ints.data
+ *     cdef double * deltamass_data = <double *> deltamasses.data             # <<<<<<<<<<<<<<
+ *     cdef double * dlm_data = <double *> delta_logmls.data
+ *     cdef double * pdf_data = <double *> pdfs.data
+ */
+  __pyx_v_deltamass_data = ((double *)__pyx_v_deltamasses->data);
+
+  /* "deconvolvedlognormtools.pyx":291
+ *     cdef double * ml_data = <double *> ml_ints.data
+ *     cdef double * deltamass_data = <double *> deltamasses.data
+ *     cdef double * dlm_data = <double *> delta_logmls.data             # <<<<<<<<<<<<<<
+ *     cdef double * pdf_data = <double *> pdfs.data
+ * 
+ */
+  __pyx_v_dlm_data = ((double *)__pyx_v_delta_logmls->data);
+
+  /* "deconvolvedlognormtools.pyx":292
+ *     cdef double * deltamass_data = <double *> deltamasses.data
+ *     cdef double * dlm_data = <double *> delta_logmls.data
+ *     cdef double * pdf_data = <double *> pdfs.data             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double sumlogprob = 0.
+ */
+  __pyx_v_pdf_data = ((double *)__pyx_v_pdfs->data);
+
+  /* "deconvolvedlognormtools.pyx":294
+ *     cdef double * pdf_data = <double *> pdfs.data
+ * 
+ *     cdef double sumlogprob = 0.             # <<<<<<<<<<<<<<
+ *     cdef double prob = 0.
+ * 
+ */
+  __pyx_v_sumlogprob = 0.;
+
+  /* "deconvolvedlognormtools.pyx":295
+ * 
+ *     cdef double sumlogprob = 0.
+ *     cdef double prob = 0.             # <<<<<<<<<<<<<<
+ * 
+ *     with nogil:
+ */
+  __pyx_v_prob = 0.;
+
+  /* "deconvolvedlognormtools.pyx":297
+ *     cdef double prob = 0.
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i from nclusters > i >= 0:
+ * 
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "deconvolvedlognormtools.pyx":298
+ * 
+ *     with nogil:
+ *         for i from nclusters > i >= 0:             # <<<<<<<<<<<<<<
+ * 
+ *             prob = pdfintegral_support(ml_data, deltamass_data,
+ */
+        for (__pyx_v_i = __pyx_v_nclusters-1; __pyx_v_i >= 0; __pyx_v_i--) {
+
+          /* "deconvolvedlognormtools.pyx":304
+ *                                        pdf_data + i*nsamples,
+ *                                        nsamples,
+ *                                        supports[i,0], supports[i,1],             # <<<<<<<<<<<<<<
+ *                                        logmu,
+ *                                        sigma)
+ */
+          __pyx_t_13 = __pyx_v_i;
+          __pyx_t_14 = 0;
+          __pyx_t_15 = __pyx_v_i;
+          __pyx_t_16 = 1;
+
+          /* "deconvolvedlognormtools.pyx":300
+ *         for i from nclusters > i >= 0:
+ * 
+ *             prob = pdfintegral_support(ml_data, deltamass_data,             # <<<<<<<<<<<<<<
+ *                                        dlm_data + i*nsamples,
+ *                                        pdf_data + i*nsamples,
+ */
+          __pyx_v_prob = __pyx_f_23deconvolvedlognormtools_pdfintegral_support(__pyx_v_ml_data, __pyx_v_deltamass_data, (__pyx_v_dlm_data + (__pyx_v_i * __pyx_v_nsamples)), (__pyx_v_pdf_data + (__pyx_v_i * __pyx_v_nsamples)), __pyx_v_nsamples, (*__Pyx_BufPtrCContig2d(__pyx_t_5numpy_intp_t *, __pyx_pybuffernd_supports.rcbuffer->pybuffer.buf, __pyx_t_13, __pyx_pybuffernd_supports.diminfo[0].strides, __pyx_t_14, __pyx_pybuffernd_supports.diminfo[1].strides)), (*__Pyx_BufPtrCContig2d(__pyx_t_5numpy_intp_t *, __pyx_pybuffernd_supports.rcbuffer->pybuffer.buf, __pyx_t_15, __pyx_pybuffernd_supports.diminfo[0].strides, __pyx_t_16, __pyx_pybuffernd_supports.diminfo[1].strides)), __pyx_v_logmu, __pyx_v_sigma);
+
+          /* "deconvolvedlognormtools.pyx":308
+ *                                        sigma)
+ * 
+ *             sumlogprob += log(prob)             # <<<<<<<<<<<<<<
+ * 
+ *     return sumlogprob
+ */
+          __pyx_v_sumlogprob = (__pyx_v_sumlogprob + log(__pyx_v_prob));
+        }
+      }
+
+      /* "deconvolvedlognormtools.pyx":297
+ *     cdef double prob = 0.
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i from nclusters > i >= 0:
+ * 
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L11;
+        }
+        __pyx_L11:;
+      }
+  }
+
+  /* "deconvolvedlognormtools.pyx":310
+ *             sumlogprob += log(prob)
+ * 
+ *     return sumlogprob             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_sumlogprob); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 310, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_r = __pyx_t_5;
+  __pyx_t_5 = 0;
+  goto __pyx_L0;
+
+  /* "deconvolvedlognormtools.pyx":261
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def pdfloglinearlike(np.ndarray[np.double_t, ndim=1, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
+ *                       np.ndarray[np.double_t, ndim=1, mode='c'] deltamasses,
+ *                       np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_8);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_deltamasses.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_pdfs.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_supports.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("deconvolvedlognormtools.pdfloglinearlike", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_deltamasses.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_pdfs.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_supports.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_supports);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "deconvolvedlognormtools.pyx":317
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def outlierloglinearlike(np.ndarray[np.double_t, ndim=2, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
+ *                          np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
+ *                          np.ndarray[np.double_t, ndim=2, mode='c'] outlier_ml_ints,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_23deconvolvedlognormtools_17outlierloglinearlike(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_23deconvolvedlognormtools_17outlierloglinearlike = {"outlierloglinearlike", (PyCFunction)__pyx_pw_23deconvolvedlognormtools_17outlierloglinearlike, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_23deconvolvedlognormtools_17outlierloglinearlike(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_ml_ints = 0;
+  PyArrayObject *__pyx_v_delta_logmls = 0;
+  PyArrayObject *__pyx_v_outlier_ml_ints = 0;
+  CYTHON_UNUSED PyArrayObject *__pyx_v_outlier_delta_logmls = 0;
+  double __pyx_v_logmu;
+  double __pyx_v_sigma;
+  double __pyx_v_fracoutliers;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("outlierloglinearlike (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_ml_ints,&__pyx_n_s_delta_logmls,&__pyx_n_s_outlier_ml_ints,&__pyx_n_s_outlier_delta_logmls,&__pyx_n_s_logmu,&__pyx_n_s_sigma,&__pyx_n_s_fracoutliers,0};
+    PyObject* values[7] = {0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_ml_ints)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_delta_logmls)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("outlierloglinearlike", 1, 7, 7, 1); __PYX_ERR(0, 317, __pyx_L3_error)
+        }
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_outlier_ml_ints)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("outlierloglinearlike", 1, 7, 7, 2); __PYX_ERR(0, 317, __pyx_L3_error)
+        }
+        case  3:
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_outlier_delta_logmls)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("outlierloglinearlike", 1, 7, 7, 3); __PYX_ERR(0, 317, __pyx_L3_error)
+        }
+        case  4:
+        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_logmu)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("outlierloglinearlike", 1, 7, 7, 4); __PYX_ERR(0, 317, __pyx_L3_error)
+        }
+        case  5:
+        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sigma)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("outlierloglinearlike", 1, 7, 7, 5); __PYX_ERR(0, 317, __pyx_L3_error)
+        }
+        case  6:
+        if (likely((values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_fracoutliers)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("outlierloglinearlike", 1, 7, 7, 6); __PYX_ERR(0, 317, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "outlierloglinearlike") < 0)) __PYX_ERR(0, 317, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 7) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+    }
+    __pyx_v_ml_ints = ((PyArrayObject *)values[0]);
+    __pyx_v_delta_logmls = ((PyArrayObject *)values[1]);
+    __pyx_v_outlier_ml_ints = ((PyArrayObject *)values[2]);
+    __pyx_v_outlier_delta_logmls = ((PyArrayObject *)values[3]);
+    __pyx_v_logmu = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_logmu == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 321, __pyx_L3_error)
+    __pyx_v_sigma = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_sigma == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 322, __pyx_L3_error)
+    __pyx_v_fracoutliers = __pyx_PyFloat_AsDouble(values[6]); if (unlikely((__pyx_v_fracoutliers == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 323, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("outlierloglinearlike", 1, 7, 7, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 317, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("deconvolvedlognormtools.outlierloglinearlike", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_ml_ints), __pyx_ptype_5numpy_ndarray, 1, "ml_ints", 0))) __PYX_ERR(0, 317, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_delta_logmls), __pyx_ptype_5numpy_ndarray, 1, "delta_logmls", 0))) __PYX_ERR(0, 318, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_outlier_ml_ints), __pyx_ptype_5numpy_ndarray, 1, "outlier_ml_ints", 0))) __PYX_ERR(0, 319, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_outlier_delta_logmls), __pyx_ptype_5numpy_ndarray, 1, "outlier_delta_logmls", 0))) __PYX_ERR(0, 320, __pyx_L1_error)
+  __pyx_r = __pyx_pf_23deconvolvedlognormtools_16outlierloglinearlike(__pyx_self, __pyx_v_ml_ints, __pyx_v_delta_logmls, __pyx_v_outlier_ml_ints, __pyx_v_outlier_delta_logmls, __pyx_v_logmu, __pyx_v_sigma, __pyx_v_fracoutliers);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_23deconvolvedlognormtools_16outlierloglinearlike(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_ml_ints, PyArrayObject *__pyx_v_delta_logmls, PyArrayObject *__pyx_v_outlier_ml_ints, CYTHON_UNUSED PyArrayObject *__pyx_v_outlier_delta_logmls, double __pyx_v_logmu, double __pyx_v_sigma, double __pyx_v_fracoutliers) {
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_nclusters;
+  double __pyx_v_sumlogprob;
+  double __pyx_v_prob;
+  PyObject *__pyx_v_outlierprob = 0;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_delta_logmls;
+  __Pyx_Buffer __pyx_pybuffer_delta_logmls;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_ml_ints;
+  __Pyx_Buffer __pyx_pybuffer_ml_ints;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_outlier_delta_logmls;
+  __Pyx_Buffer __pyx_pybuffer_outlier_delta_logmls;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_outlier_ml_ints;
+  __Pyx_Buffer __pyx_pybuffer_outlier_ml_ints;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
+  double __pyx_t_10;
+  __Pyx_RefNannySetupContext("outlierloglinearlike", 0);
+  __pyx_pybuffer_ml_ints.pybuffer.buf = NULL;
+  __pyx_pybuffer_ml_ints.refcount = 0;
+  __pyx_pybuffernd_ml_ints.data = NULL;
+  __pyx_pybuffernd_ml_ints.rcbuffer = &__pyx_pybuffer_ml_ints;
+  __pyx_pybuffer_delta_logmls.pybuffer.buf = NULL;
+  __pyx_pybuffer_delta_logmls.refcount = 0;
+  __pyx_pybuffernd_delta_logmls.data = NULL;
+  __pyx_pybuffernd_delta_logmls.rcbuffer = &__pyx_pybuffer_delta_logmls;
+  __pyx_pybuffer_outlier_ml_ints.pybuffer.buf = NULL;
+  __pyx_pybuffer_outlier_ml_ints.refcount = 0;
+  __pyx_pybuffernd_outlier_ml_ints.data = NULL;
+  __pyx_pybuffernd_outlier_ml_ints.rcbuffer = &__pyx_pybuffer_outlier_ml_ints;
+  __pyx_pybuffer_outlier_delta_logmls.pybuffer.buf = NULL;
+  __pyx_pybuffer_outlier_delta_logmls.refcount = 0;
+  __pyx_pybuffernd_outlier_delta_logmls.data = NULL;
+  __pyx_pybuffernd_outlier_delta_logmls.rcbuffer = &__pyx_pybuffer_outlier_delta_logmls;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer, (PyObject*)__pyx_v_ml_ints, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 317, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_ml_ints.diminfo[0].strides = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_ml_ints.diminfo[0].shape = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_ml_ints.diminfo[1].strides = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_ml_ints.diminfo[1].shape = __pyx_pybuffernd_ml_ints.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer, (PyObject*)__pyx_v_delta_logmls, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 317, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_delta_logmls.diminfo[0].strides = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_delta_logmls.diminfo[0].shape = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_delta_logmls.diminfo[1].strides = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_delta_logmls.diminfo[1].shape = __pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_outlier_ml_ints.rcbuffer->pybuffer, (PyObject*)__pyx_v_outlier_ml_ints, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 317, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_outlier_ml_ints.diminfo[0].strides = __pyx_pybuffernd_outlier_ml_ints.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_outlier_ml_ints.diminfo[0].shape = __pyx_pybuffernd_outlier_ml_ints.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_outlier_ml_ints.diminfo[1].strides = __pyx_pybuffernd_outlier_ml_ints.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_outlier_ml_ints.diminfo[1].shape = __pyx_pybuffernd_outlier_ml_ints.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_outlier_delta_logmls.rcbuffer->pybuffer, (PyObject*)__pyx_v_outlier_delta_logmls, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 317, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_outlier_delta_logmls.diminfo[0].strides = __pyx_pybuffernd_outlier_delta_logmls.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_outlier_delta_logmls.diminfo[0].shape = __pyx_pybuffernd_outlier_delta_logmls.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_outlier_delta_logmls.diminfo[1].strides = __pyx_pybuffernd_outlier_delta_logmls.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_outlier_delta_logmls.diminfo[1].shape = __pyx_pybuffernd_outlier_delta_logmls.rcbuffer->pybuffer.shape[1];
+
+  /* "deconvolvedlognormtools.pyx":327
+ * 
+ *     cdef Py_ssize_t i, nclusters
+ *     nclusters = ml_ints.shape[0]             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double sumlogprob = 0.
+ */
+  __pyx_v_nclusters = (__pyx_v_ml_ints->dimensions[0]);
+
+  /* "deconvolvedlognormtools.pyx":329
+ *     nclusters = ml_ints.shape[0]
+ * 
+ *     cdef double sumlogprob = 0.             # <<<<<<<<<<<<<<
+ *     cdef double prob = 0.
+ *     cdef outlierprob = 0.
+ */
+  __pyx_v_sumlogprob = 0.;
+
+  /* "deconvolvedlognormtools.pyx":330
+ * 
+ *     cdef double sumlogprob = 0.
+ *     cdef double prob = 0.             # <<<<<<<<<<<<<<
+ *     cdef outlierprob = 0.
+ * 
+ */
+  __pyx_v_prob = 0.;
+
+  /* "deconvolvedlognormtools.pyx":331
+ *     cdef double sumlogprob = 0.
+ *     cdef double prob = 0.
+ *     cdef outlierprob = 0.             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_INCREF(__pyx_float_0_);
+  __pyx_v_outlierprob = __pyx_float_0_;
+
+  /* "deconvolvedlognormtools.pyx":334
+ * 
+ * 
+ *     for i from nclusters > i >= 0:             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  for (__pyx_v_i = __pyx_v_nclusters-1; __pyx_v_i >= 0; __pyx_v_i--) {
+
+    /* "deconvolvedlognormtools.pyx":338
+ * 
+ * 
+ *         prob = altintegral(ml_ints[i,:],             # <<<<<<<<<<<<<<
+ *                            delta_logmls[i,:],
+ *                            logmu,
+ */
+    __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_altintegral); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 338, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_i); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 338, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 338, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
+    __Pyx_INCREF(__pyx_slice__13);
+    __Pyx_GIVEREF(__pyx_slice__13);
+    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_slice__13);
+    __pyx_t_3 = 0;
+    __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_ml_ints), __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 338, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "deconvolvedlognormtools.pyx":339
+ * 
+ *         prob = altintegral(ml_ints[i,:],
+ *                            delta_logmls[i,:],             # <<<<<<<<<<<<<<
+ *                            logmu,
+ *                            sigma)
+ */
+    __pyx_t_4 = PyInt_FromSsize_t(__pyx_v_i); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 339, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 339, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
+    __Pyx_INCREF(__pyx_slice__14);
+    __Pyx_GIVEREF(__pyx_slice__14);
+    PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_slice__14);
+    __pyx_t_4 = 0;
+    __pyx_t_4 = PyObject_GetItem(((PyObject *)__pyx_v_delta_logmls), __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 339, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "deconvolvedlognormtools.pyx":340
+ *         prob = altintegral(ml_ints[i,:],
+ *                            delta_logmls[i,:],
+ *                            logmu,             # <<<<<<<<<<<<<<
+ *                            sigma)
+ * 
+ */
+    __pyx_t_5 = PyFloat_FromDouble(__pyx_v_logmu); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 340, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+
+    /* "deconvolvedlognormtools.pyx":341
+ *                            delta_logmls[i,:],
+ *                            logmu,
+ *                            sigma)             # <<<<<<<<<<<<<<
+ * 
+ *         outlierprob = altintegral(outlier_ml_ints[i,:],
+ */
+    __pyx_t_6 = PyFloat_FromDouble(__pyx_v_sigma); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 341, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_7 = NULL;
+    __pyx_t_8 = 0;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_7)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_7);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+        __pyx_t_8 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_2)) {
+      PyObject *__pyx_temp[5] = {__pyx_t_7, __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_t_6};
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 338, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
+      PyObject *__pyx_temp[5] = {__pyx_t_7, __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_t_6};
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 338, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_9 = PyTuple_New(4+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 338, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      if (__pyx_t_7) {
+        __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_7); __pyx_t_7 = NULL;
+      }
+      __Pyx_GIVEREF(__pyx_t_3);
+      PyTuple_SET_ITEM(__pyx_t_9, 0+__pyx_t_8, __pyx_t_3);
+      __Pyx_GIVEREF(__pyx_t_4);
+      PyTuple_SET_ITEM(__pyx_t_9, 1+__pyx_t_8, __pyx_t_4);
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_9, 2+__pyx_t_8, __pyx_t_5);
+      __Pyx_GIVEREF(__pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_9, 3+__pyx_t_8, __pyx_t_6);
+      __pyx_t_3 = 0;
+      __pyx_t_4 = 0;
+      __pyx_t_5 = 0;
+      __pyx_t_6 = 0;
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 338, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "deconvolvedlognormtools.pyx":338
+ * 
+ * 
+ *         prob = altintegral(ml_ints[i,:],             # <<<<<<<<<<<<<<
+ *                            delta_logmls[i,:],
+ *                            logmu,
+ */
+    __pyx_t_10 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_10 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 338, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_v_prob = __pyx_t_10;
+
+    /* "deconvolvedlognormtools.pyx":343
+ *                            sigma)
+ * 
+ *         outlierprob = altintegral(outlier_ml_ints[i,:],             # <<<<<<<<<<<<<<
+ *                                   delta_logmls[i,:],
+ *                                   logmu,
+ */
+    __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_altintegral); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 343, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_9 = PyInt_FromSsize_t(__pyx_v_i); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 343, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 343, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_9);
+    PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_9);
+    __Pyx_INCREF(__pyx_slice__15);
+    __Pyx_GIVEREF(__pyx_slice__15);
+    PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_slice__15);
+    __pyx_t_9 = 0;
+    __pyx_t_9 = PyObject_GetItem(((PyObject *)__pyx_v_outlier_ml_ints), __pyx_t_6); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 343, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+    /* "deconvolvedlognormtools.pyx":344
+ * 
+ *         outlierprob = altintegral(outlier_ml_ints[i,:],
+ *                                   delta_logmls[i,:],             # <<<<<<<<<<<<<<
+ *                                   logmu,
+ *                                   sigma)
+ */
+    __pyx_t_6 = PyInt_FromSsize_t(__pyx_v_i); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 344, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 344, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_6);
+    __Pyx_INCREF(__pyx_slice__16);
+    __Pyx_GIVEREF(__pyx_slice__16);
+    PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_slice__16);
+    __pyx_t_6 = 0;
+    __pyx_t_6 = PyObject_GetItem(((PyObject *)__pyx_v_delta_logmls), __pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 344, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "deconvolvedlognormtools.pyx":345
+ *         outlierprob = altintegral(outlier_ml_ints[i,:],
+ *                                   delta_logmls[i,:],
+ *                                   logmu,             # <<<<<<<<<<<<<<
+ *                                   sigma)
+ * 
+ */
+    __pyx_t_5 = PyFloat_FromDouble(__pyx_v_logmu); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 345, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+
+    /* "deconvolvedlognormtools.pyx":346
+ *                                   delta_logmls[i,:],
+ *                                   logmu,
+ *                                   sigma)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+    __pyx_t_4 = PyFloat_FromDouble(__pyx_v_sigma); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 346, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = NULL;
+    __pyx_t_8 = 0;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
         __Pyx_DECREF_SET(__pyx_t_2, function);
         __pyx_t_8 = 1;
       }
     }
     #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_2)) {
-      PyObject *__pyx_temp[5] = {__pyx_t_7, __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_t_6};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 264, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (PyFunction_Check(__pyx_t_2)) {
+      PyObject *__pyx_temp[5] = {__pyx_t_3, __pyx_t_9, __pyx_t_6, __pyx_t_5, __pyx_t_4};
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 343, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
+      PyObject *__pyx_temp[5] = {__pyx_t_3, __pyx_t_9, __pyx_t_6, __pyx_t_5, __pyx_t_4};
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 343, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_7 = PyTuple_New(4+__pyx_t_8); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 343, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      if (__pyx_t_3) {
+        __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_3); __pyx_t_3 = NULL;
+      }
+      __Pyx_GIVEREF(__pyx_t_9);
+      PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_8, __pyx_t_9);
+      __Pyx_GIVEREF(__pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_8, __pyx_t_6);
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_7, 2+__pyx_t_8, __pyx_t_5);
+      __Pyx_GIVEREF(__pyx_t_4);
+      PyTuple_SET_ITEM(__pyx_t_7, 3+__pyx_t_8, __pyx_t_4);
+      __pyx_t_9 = 0;
+      __pyx_t_6 = 0;
+      __pyx_t_5 = 0;
+      __pyx_t_4 = 0;
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 343, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF_SET(__pyx_v_outlierprob, __pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "deconvolvedlognormtools.pyx":350
+ * 
+ * 
+ *         sumlogprob += log((1-fracoutliers)*prob + fracoutliers*outlierprob)             # <<<<<<<<<<<<<<
+ * 
+ *     return sumlogprob
+ */
+    __pyx_t_1 = PyFloat_FromDouble(((1.0 - __pyx_v_fracoutliers) * __pyx_v_prob)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 350, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_fracoutliers); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 350, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_7 = PyNumber_Multiply(__pyx_t_2, __pyx_v_outlierprob); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 350, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyNumber_Add(__pyx_t_1, __pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 350, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_t_10 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_10 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 350, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_v_sumlogprob = (__pyx_v_sumlogprob + log(__pyx_t_10));
+  }
+
+  /* "deconvolvedlognormtools.pyx":352
+ *         sumlogprob += log((1-fracoutliers)*prob + fracoutliers*outlierprob)
+ * 
+ *     return sumlogprob             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_sumlogprob); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 352, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "deconvolvedlognormtools.pyx":317
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def outlierloglinearlike(np.ndarray[np.double_t, ndim=2, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
+ *                          np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
+ *                          np.ndarray[np.double_t, ndim=2, mode='c'] outlier_ml_ints,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_9);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_outlier_delta_logmls.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_outlier_ml_ints.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("deconvolvedlognormtools.outlierloglinearlike", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_outlier_delta_logmls.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_outlier_ml_ints.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF(__pyx_v_outlierprob);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "deconvolvedlognormtools.pyx":358
+ * 
+ * 
+ * def trapezoidWeights(np.ndarray[np.double_t, ndim=2, mode='c'] delta_masses):             # <<<<<<<<<<<<<<
+ *     '''Per-node trapezoid weights; delta_masses is one shorter per row than the mass grid'''
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_23deconvolvedlognormtools_19trapezoidWeights(PyObject *__pyx_self, PyObject *__pyx_v_delta_masses); /*proto*/
+static char __pyx_doc_23deconvolvedlognormtools_18trapezoidWeights[] = "Per-node trapezoid weights; delta_masses is one shorter per row than the mass grid";
+static PyMethodDef __pyx_mdef_23deconvolvedlognormtools_19trapezoidWeights = {"trapezoidWeights", (PyCFunction)__pyx_pw_23deconvolvedlognormtools_19trapezoidWeights, METH_O, __pyx_doc_23deconvolvedlognormtools_18trapezoidWeights};
+static PyObject *__pyx_pw_23deconvolvedlognormtools_19trapezoidWeights(PyObject *__pyx_self, PyObject *__pyx_v_delta_masses) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("trapezoidWeights (wrapper)", 0);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_delta_masses), __pyx_ptype_5numpy_ndarray, 1, "delta_masses", 0))) __PYX_ERR(0, 358, __pyx_L1_error)
+  __pyx_r = __pyx_pf_23deconvolvedlognormtools_18trapezoidWeights(__pyx_self, ((PyArrayObject *)__pyx_v_delta_masses));
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_23deconvolvedlognormtools_18trapezoidWeights(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_delta_masses) {
+  npy_intp __pyx_v_nclusters;
+  PyObject *__pyx_v_weights = NULL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_delta_masses;
+  __Pyx_Buffer __pyx_pybuffer_delta_masses;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  __Pyx_RefNannySetupContext("trapezoidWeights", 0);
+  __pyx_pybuffer_delta_masses.pybuffer.buf = NULL;
+  __pyx_pybuffer_delta_masses.refcount = 0;
+  __pyx_pybuffernd_delta_masses.data = NULL;
+  __pyx_pybuffernd_delta_masses.rcbuffer = &__pyx_pybuffer_delta_masses;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_delta_masses.rcbuffer->pybuffer, (PyObject*)__pyx_v_delta_masses, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 358, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_delta_masses.diminfo[0].strides = __pyx_pybuffernd_delta_masses.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_delta_masses.diminfo[0].shape = __pyx_pybuffernd_delta_masses.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_delta_masses.diminfo[1].strides = __pyx_pybuffernd_delta_masses.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_delta_masses.diminfo[1].shape = __pyx_pybuffernd_delta_masses.rcbuffer->pybuffer.shape[1];
+
+  /* "deconvolvedlognormtools.pyx":361
+ *     '''Per-node trapezoid weights; delta_masses is one shorter per row than the mass grid'''
+ * 
+ *     nclusters = delta_masses.shape[0]             # <<<<<<<<<<<<<<
+ *     weights = np.zeros((nclusters, delta_masses.shape[1]+1))
+ *     weights[:,:-1] += 0.5*delta_masses
+ */
+  __pyx_v_nclusters = (__pyx_v_delta_masses->dimensions[0]);
+
+  /* "deconvolvedlognormtools.pyx":362
+ * 
+ *     nclusters = delta_masses.shape[0]
+ *     weights = np.zeros((nclusters, delta_masses.shape[1]+1))             # <<<<<<<<<<<<<<
+ *     weights[:,:-1] += 0.5*delta_masses
+ *     weights[:,1:] += 0.5*delta_masses
+ */
+  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 362, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_zeros); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 362, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyInt_From_Py_intptr_t(__pyx_v_nclusters); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 362, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __Pyx_PyInt_From_long(((__pyx_v_delta_masses->dimensions[1]) + 1)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 362, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 362, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_4);
+  __pyx_t_2 = 0;
+  __pyx_t_4 = 0;
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  if (!__pyx_t_4) {
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 362, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else {
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_5};
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 362, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_5};
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 362, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_2 = PyTuple_New(1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 362, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_4); __pyx_t_4 = NULL;
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_2, 0+1, __pyx_t_5);
+      __pyx_t_5 = 0;
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 362, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_weights = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "deconvolvedlognormtools.pyx":363
+ *     nclusters = delta_masses.shape[0]
+ *     weights = np.zeros((nclusters, delta_masses.shape[1]+1))
+ *     weights[:,:-1] += 0.5*delta_masses             # <<<<<<<<<<<<<<
+ *     weights[:,1:] += 0.5*delta_masses
+ * 
+ */
+  __Pyx_INCREF(__pyx_tuple__19);
+  __pyx_t_6 = __pyx_tuple__19;
+  __pyx_t_1 = PyObject_GetItem(__pyx_v_weights, __pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 363, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = PyNumber_Multiply(__pyx_float_0_5, ((PyObject *)__pyx_v_delta_masses)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 363, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_t_1, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 363, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(PyObject_SetItem(__pyx_v_weights, __pyx_t_6, __pyx_t_2) < 0)) __PYX_ERR(0, 363, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+  /* "deconvolvedlognormtools.pyx":364
+ *     weights = np.zeros((nclusters, delta_masses.shape[1]+1))
+ *     weights[:,:-1] += 0.5*delta_masses
+ *     weights[:,1:] += 0.5*delta_masses             # <<<<<<<<<<<<<<
+ * 
+ *     return weights
+ */
+  __Pyx_INCREF(__pyx_tuple__22);
+  __pyx_t_6 = __pyx_tuple__22;
+  __pyx_t_2 = PyObject_GetItem(__pyx_v_weights, __pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 364, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyNumber_Multiply(__pyx_float_0_5, ((PyObject *)__pyx_v_delta_masses)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 364, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_1 = PyNumber_InPlaceAdd(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 364, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(PyObject_SetItem(__pyx_v_weights, __pyx_t_6, __pyx_t_1) < 0)) __PYX_ERR(0, 364, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+  /* "deconvolvedlognormtools.pyx":366
+ *     weights[:,1:] += 0.5*delta_masses
+ * 
+ *     return weights             # <<<<<<<<<<<<<<
+ * 
+ * ###
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_weights);
+  __pyx_r = __pyx_v_weights;
+  goto __pyx_L0;
+
+  /* "deconvolvedlognormtools.pyx":358
+ * 
+ * 
+ * def trapezoidWeights(np.ndarray[np.double_t, ndim=2, mode='c'] delta_masses):             # <<<<<<<<<<<<<<
+ *     '''Per-node trapezoid weights; delta_masses is one shorter per row than the mass grid'''
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_masses.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("deconvolvedlognormtools.trapezoidWeights", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_masses.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF(__pyx_v_weights);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "deconvolvedlognormtools.pyx":370
+ * ###
+ * 
+ * def precomputeGaussMix1D(np.ndarray[np.double_t, ndim=2, mode='c'] delta_mls,             # <<<<<<<<<<<<<<
+ *                          np.ndarray[np.double_t, ndim=2, mode='c'] delta_masses,
+ *                          np.ndarray[np.double_t, ndim=2, mode='c'] pdfs):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_23deconvolvedlognormtools_21precomputeGaussMix1D(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_23deconvolvedlognormtools_20precomputeGaussMix1D[] = "Fixed inputs for pdfGaussMix1D_cached.\n    Returns (evalpoints, evalindex, weightedpdfs): the distinct delta_ml values,\n    each node's index into them, and pdfs times trapezoid weights.";
+static PyMethodDef __pyx_mdef_23deconvolvedlognormtools_21precomputeGaussMix1D = {"precomputeGaussMix1D", (PyCFunction)__pyx_pw_23deconvolvedlognormtools_21precomputeGaussMix1D, METH_VARARGS|METH_KEYWORDS, __pyx_doc_23deconvolvedlognormtools_20precomputeGaussMix1D};
+static PyObject *__pyx_pw_23deconvolvedlognormtools_21precomputeGaussMix1D(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_delta_mls = 0;
+  PyArrayObject *__pyx_v_delta_masses = 0;
+  PyArrayObject *__pyx_v_pdfs = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("precomputeGaussMix1D (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_delta_mls,&__pyx_n_s_delta_masses,&__pyx_n_s_pdfs,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_delta_mls)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_delta_masses)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("precomputeGaussMix1D", 1, 3, 3, 1); __PYX_ERR(0, 370, __pyx_L3_error)
+        }
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_pdfs)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("precomputeGaussMix1D", 1, 3, 3, 2); __PYX_ERR(0, 370, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "precomputeGaussMix1D") < 0)) __PYX_ERR(0, 370, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v_delta_mls = ((PyArrayObject *)values[0]);
+    __pyx_v_delta_masses = ((PyArrayObject *)values[1]);
+    __pyx_v_pdfs = ((PyArrayObject *)values[2]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("precomputeGaussMix1D", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 370, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("deconvolvedlognormtools.precomputeGaussMix1D", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_delta_mls), __pyx_ptype_5numpy_ndarray, 1, "delta_mls", 0))) __PYX_ERR(0, 370, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_delta_masses), __pyx_ptype_5numpy_ndarray, 1, "delta_masses", 0))) __PYX_ERR(0, 371, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_pdfs), __pyx_ptype_5numpy_ndarray, 1, "pdfs", 0))) __PYX_ERR(0, 372, __pyx_L1_error)
+  __pyx_r = __pyx_pf_23deconvolvedlognormtools_20precomputeGaussMix1D(__pyx_self, __pyx_v_delta_mls, __pyx_v_delta_masses, __pyx_v_pdfs);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_23deconvolvedlognormtools_20precomputeGaussMix1D(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_delta_mls, PyArrayObject *__pyx_v_delta_masses, PyArrayObject *__pyx_v_pdfs) {
+  PyObject *__pyx_v_evalpoints = NULL;
+  PyObject *__pyx_v_evalindex = NULL;
+  PyObject *__pyx_v_weightedpdfs = NULL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_delta_masses;
+  __Pyx_Buffer __pyx_pybuffer_delta_masses;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_delta_mls;
+  __Pyx_Buffer __pyx_pybuffer_delta_mls;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_pdfs;
+  __Pyx_Buffer __pyx_pybuffer_pdfs;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *(*__pyx_t_5)(PyObject *);
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  __Pyx_RefNannySetupContext("precomputeGaussMix1D", 0);
+  __pyx_pybuffer_delta_mls.pybuffer.buf = NULL;
+  __pyx_pybuffer_delta_mls.refcount = 0;
+  __pyx_pybuffernd_delta_mls.data = NULL;
+  __pyx_pybuffernd_delta_mls.rcbuffer = &__pyx_pybuffer_delta_mls;
+  __pyx_pybuffer_delta_masses.pybuffer.buf = NULL;
+  __pyx_pybuffer_delta_masses.refcount = 0;
+  __pyx_pybuffernd_delta_masses.data = NULL;
+  __pyx_pybuffernd_delta_masses.rcbuffer = &__pyx_pybuffer_delta_masses;
+  __pyx_pybuffer_pdfs.pybuffer.buf = NULL;
+  __pyx_pybuffer_pdfs.refcount = 0;
+  __pyx_pybuffernd_pdfs.data = NULL;
+  __pyx_pybuffernd_pdfs.rcbuffer = &__pyx_pybuffer_pdfs;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_delta_mls.rcbuffer->pybuffer, (PyObject*)__pyx_v_delta_mls, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 370, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_delta_mls.diminfo[0].strides = __pyx_pybuffernd_delta_mls.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_delta_mls.diminfo[0].shape = __pyx_pybuffernd_delta_mls.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_delta_mls.diminfo[1].strides = __pyx_pybuffernd_delta_mls.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_delta_mls.diminfo[1].shape = __pyx_pybuffernd_delta_mls.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_delta_masses.rcbuffer->pybuffer, (PyObject*)__pyx_v_delta_masses, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 370, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_delta_masses.diminfo[0].strides = __pyx_pybuffernd_delta_masses.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_delta_masses.diminfo[0].shape = __pyx_pybuffernd_delta_masses.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_delta_masses.diminfo[1].strides = __pyx_pybuffernd_delta_masses.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_delta_masses.diminfo[1].shape = __pyx_pybuffernd_delta_masses.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_pdfs.rcbuffer->pybuffer, (PyObject*)__pyx_v_pdfs, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 370, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_pdfs.diminfo[0].strides = __pyx_pybuffernd_pdfs.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_pdfs.diminfo[0].shape = __pyx_pybuffernd_pdfs.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_pdfs.diminfo[1].strides = __pyx_pybuffernd_pdfs.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_pdfs.diminfo[1].shape = __pyx_pybuffernd_pdfs.rcbuffer->pybuffer.shape[1];
+
+  /* "deconvolvedlognormtools.pyx":377
+ *     each node's index into them, and pdfs times trapezoid weights.'''
+ * 
+ *     evalpoints, evalindex = np.unique(delta_mls, return_inverse=True)             # <<<<<<<<<<<<<<
+ *     evalindex = np.ascontiguousarray(evalindex.reshape(np.shape(delta_mls)), dtype=np.intp)
+ * 
+ */
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 377, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_unique); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 377, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 377, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(((PyObject *)__pyx_v_delta_mls));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_delta_mls));
+  PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_v_delta_mls));
+  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 377, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_return_inverse, Py_True) < 0) __PYX_ERR(0, 377, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_1, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 377, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if ((likely(PyTuple_CheckExact(__pyx_t_4))) || (PyList_CheckExact(__pyx_t_4))) {
+    PyObject* sequence = __pyx_t_4;
+    #if !CYTHON_COMPILING_IN_PYPY
+    Py_ssize_t size = Py_SIZE(sequence);
+    #else
+    Py_ssize_t size = PySequence_Size(sequence);
+    #endif
+    if (unlikely(size != 2)) {
+      if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+      else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+      __PYX_ERR(0, 377, __pyx_L1_error)
+    }
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    if (likely(PyTuple_CheckExact(sequence))) {
+      __pyx_t_3 = PyTuple_GET_ITEM(sequence, 0); 
+      __pyx_t_1 = PyTuple_GET_ITEM(sequence, 1); 
+    } else {
+      __pyx_t_3 = PyList_GET_ITEM(sequence, 0); 
+      __pyx_t_1 = PyList_GET_ITEM(sequence, 1); 
+    }
+    __Pyx_INCREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_t_1);
+    #else
+    __pyx_t_3 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 377, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 377, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    #endif
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  } else {
+    Py_ssize_t index = -1;
+    __pyx_t_2 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 377, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_5 = Py_TYPE(__pyx_t_2)->tp_iternext;
+    index = 0; __pyx_t_3 = __pyx_t_5(__pyx_t_2); if (unlikely(!__pyx_t_3)) goto __pyx_L3_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_3);
+    index = 1; __pyx_t_1 = __pyx_t_5(__pyx_t_2); if (unlikely(!__pyx_t_1)) goto __pyx_L3_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_1);
+    if (__Pyx_IternextUnpackEndCheck(__pyx_t_5(__pyx_t_2), 2) < 0) __PYX_ERR(0, 377, __pyx_L1_error)
+    __pyx_t_5 = NULL;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    goto __pyx_L4_unpacking_done;
+    __pyx_L3_unpacking_failed:;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_5 = NULL;
+    if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+    __PYX_ERR(0, 377, __pyx_L1_error)
+    __pyx_L4_unpacking_done:;
+  }
+  __pyx_v_evalpoints = __pyx_t_3;
+  __pyx_t_3 = 0;
+  __pyx_v_evalindex = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "deconvolvedlognormtools.pyx":378
+ * 
+ *     evalpoints, evalindex = np.unique(delta_mls, return_inverse=True)
+ *     evalindex = np.ascontiguousarray(evalindex.reshape(np.shape(delta_mls)), dtype=np.intp)             # <<<<<<<<<<<<<<
+ * 
+ *     weightedpdfs = np.ascontiguousarray(pdfs*trapezoidWeights(delta_masses))
+ */
+  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_ascontiguousarray); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_evalindex, __pyx_n_s_reshape); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_shape); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_7))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_7);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_7, function);
+    }
+  }
+  if (!__pyx_t_6) {
+    __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_7, ((PyObject *)__pyx_v_delta_mls)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 378, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+  } else {
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_7)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_6, ((PyObject *)__pyx_v_delta_mls)};
+      __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_7, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 378, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_GOTREF(__pyx_t_2);
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_7)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_6, ((PyObject *)__pyx_v_delta_mls)};
+      __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_7, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 378, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_GOTREF(__pyx_t_2);
+    } else
+    #endif
+    {
+      __pyx_t_8 = PyTuple_New(1+1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 378, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6); __pyx_t_6 = NULL;
+      __Pyx_INCREF(((PyObject *)__pyx_v_delta_mls));
+      __Pyx_GIVEREF(((PyObject *)__pyx_v_delta_mls));
+      PyTuple_SET_ITEM(__pyx_t_8, 0+1, ((PyObject *)__pyx_v_delta_mls));
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_t_8, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 378, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_7)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_7);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  if (!__pyx_t_7) {
+    __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 378, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_GOTREF(__pyx_t_4);
+  } else {
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_t_2};
+      __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 378, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_t_2};
+      __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 378, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_8 = PyTuple_New(1+1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 378, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_7); __pyx_t_7 = NULL;
+      __Pyx_GIVEREF(__pyx_t_2);
+      PyTuple_SET_ITEM(__pyx_t_8, 0+1, __pyx_t_2);
+      __pyx_t_2 = 0;
+      __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_8, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 378, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = PyDict_New(); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_8 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_intp); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_2) < 0) __PYX_ERR(0, 378, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF_SET(__pyx_v_evalindex, __pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "deconvolvedlognormtools.pyx":380
+ *     evalindex = np.ascontiguousarray(evalindex.reshape(np.shape(delta_mls)), dtype=np.intp)
+ * 
+ *     weightedpdfs = np.ascontiguousarray(pdfs*trapezoidWeights(delta_masses))             # <<<<<<<<<<<<<<
+ * 
+ *     return evalpoints, evalindex, weightedpdfs
+ */
+  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 380, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_ascontiguousarray); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 380, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_trapezoidWeights); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 380, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_8 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_8)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_8);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
+    }
+  }
+  if (!__pyx_t_8) {
+    __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_1, ((PyObject *)__pyx_v_delta_masses)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 380, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+  } else {
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_1)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_8, ((PyObject *)__pyx_v_delta_masses)};
+      __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 380, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_GOTREF(__pyx_t_4);
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_1)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_8, ((PyObject *)__pyx_v_delta_masses)};
+      __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 380, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_GOTREF(__pyx_t_4);
+    } else
+    #endif
+    {
+      __pyx_t_7 = PyTuple_New(1+1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 380, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_8); __pyx_t_8 = NULL;
+      __Pyx_INCREF(((PyObject *)__pyx_v_delta_masses));
+      __Pyx_GIVEREF(((PyObject *)__pyx_v_delta_masses));
+      PyTuple_SET_ITEM(__pyx_t_7, 0+1, ((PyObject *)__pyx_v_delta_masses));
+      __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_7, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 380, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyNumber_Multiply(((PyObject *)__pyx_v_pdfs), __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 380, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  if (!__pyx_t_4) {
+    __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 380, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+  } else {
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_1};
+      __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 380, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_1};
+      __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 380, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_7 = PyTuple_New(1+1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 380, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4); __pyx_t_4 = NULL;
+      __Pyx_GIVEREF(__pyx_t_1);
+      PyTuple_SET_ITEM(__pyx_t_7, 0+1, __pyx_t_1);
+      __pyx_t_1 = 0;
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 380, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_weightedpdfs = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "deconvolvedlognormtools.pyx":382
+ *     weightedpdfs = np.ascontiguousarray(pdfs*trapezoidWeights(delta_masses))
+ * 
+ *     return evalpoints, evalindex, weightedpdfs             # <<<<<<<<<<<<<<
+ * 
+ * ###
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = PyTuple_New(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 382, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_v_evalpoints);
+  __Pyx_GIVEREF(__pyx_v_evalpoints);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_evalpoints);
+  __Pyx_INCREF(__pyx_v_evalindex);
+  __Pyx_GIVEREF(__pyx_v_evalindex);
+  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_evalindex);
+  __Pyx_INCREF(__pyx_v_weightedpdfs);
+  __Pyx_GIVEREF(__pyx_v_weightedpdfs);
+  PyTuple_SET_ITEM(__pyx_t_2, 2, __pyx_v_weightedpdfs);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "deconvolvedlognormtools.pyx":370
+ * ###
+ * 
+ * def precomputeGaussMix1D(np.ndarray[np.double_t, ndim=2, mode='c'] delta_mls,             # <<<<<<<<<<<<<<
+ *                          np.ndarray[np.double_t, ndim=2, mode='c'] delta_masses,
+ *                          np.ndarray[np.double_t, ndim=2, mode='c'] pdfs):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_masses.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_mls.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_pdfs.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("deconvolvedlognormtools.precomputeGaussMix1D", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_masses.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_mls.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_pdfs.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF(__pyx_v_evalpoints);
+  __Pyx_XDECREF(__pyx_v_evalindex);
+  __Pyx_XDECREF(__pyx_v_weightedpdfs);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "deconvolvedlognormtools.pyx":389
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def pdfGaussMix1D_cached(np.ndarray[np.double_t, ndim=1, mode='c'] evalpoints,             # <<<<<<<<<<<<<<
+ *                          np.ndarray[np.intp_t, ndim=2, mode='c'] evalindex,
+ *                          np.ndarray[np.double_t, ndim=2, mode='c'] weightedpdfs,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_23deconvolvedlognormtools_23pdfGaussMix1D_cached(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_23deconvolvedlognormtools_23pdfGaussMix1D_cached = {"pdfGaussMix1D_cached", (PyCFunction)__pyx_pw_23deconvolvedlognormtools_23pdfGaussMix1D_cached, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_23deconvolvedlognormtools_23pdfGaussMix1D_cached(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_evalpoints = 0;
+  PyArrayObject *__pyx_v_evalindex = 0;
+  PyArrayObject *__pyx_v_weightedpdfs = 0;
+  PyArrayObject *__pyx_v_pis = 0;
+  PyArrayObject *__pyx_v_mus = 0;
+  PyArrayObject *__pyx_v_tau2 = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("pdfGaussMix1D_cached (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_evalpoints,&__pyx_n_s_evalindex,&__pyx_n_s_weightedpdfs,&__pyx_n_s_pis,&__pyx_n_s_mus,&__pyx_n_s_tau2,0};
+    PyObject* values[6] = {0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_evalpoints)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_evalindex)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("pdfGaussMix1D_cached", 1, 6, 6, 1); __PYX_ERR(0, 389, __pyx_L3_error)
+        }
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_weightedpdfs)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("pdfGaussMix1D_cached", 1, 6, 6, 2); __PYX_ERR(0, 389, __pyx_L3_error)
+        }
+        case  3:
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_pis)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("pdfGaussMix1D_cached", 1, 6, 6, 3); __PYX_ERR(0, 389, __pyx_L3_error)
+        }
+        case  4:
+        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_mus)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("pdfGaussMix1D_cached", 1, 6, 6, 4); __PYX_ERR(0, 389, __pyx_L3_error)
+        }
+        case  5:
+        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_tau2)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("pdfGaussMix1D_cached", 1, 6, 6, 5); __PYX_ERR(0, 389, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "pdfGaussMix1D_cached") < 0)) __PYX_ERR(0, 389, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 6) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+    }
+    __pyx_v_evalpoints = ((PyArrayObject *)values[0]);
+    __pyx_v_evalindex = ((PyArrayObject *)values[1]);
+    __pyx_v_weightedpdfs = ((PyArrayObject *)values[2]);
+    __pyx_v_pis = ((PyArrayObject *)values[3]);
+    __pyx_v_mus = ((PyArrayObject *)values[4]);
+    __pyx_v_tau2 = ((PyArrayObject *)values[5]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("pdfGaussMix1D_cached", 1, 6, 6, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 389, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("deconvolvedlognormtools.pdfGaussMix1D_cached", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_evalpoints), __pyx_ptype_5numpy_ndarray, 1, "evalpoints", 0))) __PYX_ERR(0, 389, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_evalindex), __pyx_ptype_5numpy_ndarray, 1, "evalindex", 0))) __PYX_ERR(0, 390, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_weightedpdfs), __pyx_ptype_5numpy_ndarray, 1, "weightedpdfs", 0))) __PYX_ERR(0, 391, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_pis), __pyx_ptype_5numpy_ndarray, 1, "pis", 0))) __PYX_ERR(0, 392, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_mus), __pyx_ptype_5numpy_ndarray, 1, "mus", 0))) __PYX_ERR(0, 393, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_tau2), __pyx_ptype_5numpy_ndarray, 1, "tau2", 0))) __PYX_ERR(0, 394, __pyx_L1_error)
+  __pyx_r = __pyx_pf_23deconvolvedlognormtools_22pdfGaussMix1D_cached(__pyx_self, __pyx_v_evalpoints, __pyx_v_evalindex, __pyx_v_weightedpdfs, __pyx_v_pis, __pyx_v_mus, __pyx_v_tau2);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_23deconvolvedlognormtools_22pdfGaussMix1D_cached(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_evalpoints, PyArrayObject *__pyx_v_evalindex, PyArrayObject *__pyx_v_weightedpdfs, PyArrayObject *__pyx_v_pis, PyArrayObject *__pyx_v_mus, PyArrayObject *__pyx_v_tau2) {
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_v_k;
+  Py_ssize_t __pyx_v_nclusters;
+  Py_ssize_t __pyx_v_nmasses;
+  Py_ssize_t __pyx_v_npoints;
+  Py_ssize_t __pyx_v_ngauss;
+  PyArrayObject *__pyx_v_amplitudes = 0;
+  PyArrayObject *__pyx_v_neghalfinvtau2 = 0;
+  double __pyx_v_zeroboundrenorm;
+  double __pyx_v_tau;
+  PyArrayObject *__pyx_v_intrinsicpdf = 0;
+  double __pyx_v_x;
+  double __pyx_v_dx;
+  double __pyx_v_thesum;
+  double __pyx_v_sumlogprob;
+  double __pyx_v_prob;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_amplitudes;
+  __Pyx_Buffer __pyx_pybuffer_amplitudes;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_evalindex;
+  __Pyx_Buffer __pyx_pybuffer_evalindex;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_evalpoints;
+  __Pyx_Buffer __pyx_pybuffer_evalpoints;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_intrinsicpdf;
+  __Pyx_Buffer __pyx_pybuffer_intrinsicpdf;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_mus;
+  __Pyx_Buffer __pyx_pybuffer_mus;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_neghalfinvtau2;
+  __Pyx_Buffer __pyx_pybuffer_neghalfinvtau2;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_pis;
+  __Pyx_Buffer __pyx_pybuffer_pis;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_tau2;
+  __Pyx_Buffer __pyx_pybuffer_tau2;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_weightedpdfs;
+  __Pyx_Buffer __pyx_pybuffer_weightedpdfs;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyArrayObject *__pyx_t_6 = NULL;
+  PyArrayObject *__pyx_t_7 = NULL;
+  Py_ssize_t __pyx_t_8;
+  Py_ssize_t __pyx_t_9;
+  Py_ssize_t __pyx_t_10;
+  int __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  Py_ssize_t __pyx_t_13;
+  Py_ssize_t __pyx_t_14;
+  Py_ssize_t __pyx_t_15;
+  PyArrayObject *__pyx_t_16 = NULL;
+  Py_ssize_t __pyx_t_17;
+  Py_ssize_t __pyx_t_18;
+  Py_ssize_t __pyx_t_19;
+  Py_ssize_t __pyx_t_20;
+  Py_ssize_t __pyx_t_21;
+  Py_ssize_t __pyx_t_22;
+  Py_ssize_t __pyx_t_23;
+  Py_ssize_t __pyx_t_24;
+  Py_ssize_t __pyx_t_25;
+  Py_ssize_t __pyx_t_26;
+  Py_ssize_t __pyx_t_27;
+  __Pyx_RefNannySetupContext("pdfGaussMix1D_cached", 0);
+  __pyx_pybuffer_amplitudes.pybuffer.buf = NULL;
+  __pyx_pybuffer_amplitudes.refcount = 0;
+  __pyx_pybuffernd_amplitudes.data = NULL;
+  __pyx_pybuffernd_amplitudes.rcbuffer = &__pyx_pybuffer_amplitudes;
+  __pyx_pybuffer_neghalfinvtau2.pybuffer.buf = NULL;
+  __pyx_pybuffer_neghalfinvtau2.refcount = 0;
+  __pyx_pybuffernd_neghalfinvtau2.data = NULL;
+  __pyx_pybuffernd_neghalfinvtau2.rcbuffer = &__pyx_pybuffer_neghalfinvtau2;
+  __pyx_pybuffer_intrinsicpdf.pybuffer.buf = NULL;
+  __pyx_pybuffer_intrinsicpdf.refcount = 0;
+  __pyx_pybuffernd_intrinsicpdf.data = NULL;
+  __pyx_pybuffernd_intrinsicpdf.rcbuffer = &__pyx_pybuffer_intrinsicpdf;
+  __pyx_pybuffer_evalpoints.pybuffer.buf = NULL;
+  __pyx_pybuffer_evalpoints.refcount = 0;
+  __pyx_pybuffernd_evalpoints.data = NULL;
+  __pyx_pybuffernd_evalpoints.rcbuffer = &__pyx_pybuffer_evalpoints;
+  __pyx_pybuffer_evalindex.pybuffer.buf = NULL;
+  __pyx_pybuffer_evalindex.refcount = 0;
+  __pyx_pybuffernd_evalindex.data = NULL;
+  __pyx_pybuffernd_evalindex.rcbuffer = &__pyx_pybuffer_evalindex;
+  __pyx_pybuffer_weightedpdfs.pybuffer.buf = NULL;
+  __pyx_pybuffer_weightedpdfs.refcount = 0;
+  __pyx_pybuffernd_weightedpdfs.data = NULL;
+  __pyx_pybuffernd_weightedpdfs.rcbuffer = &__pyx_pybuffer_weightedpdfs;
+  __pyx_pybuffer_pis.pybuffer.buf = NULL;
+  __pyx_pybuffer_pis.refcount = 0;
+  __pyx_pybuffernd_pis.data = NULL;
+  __pyx_pybuffernd_pis.rcbuffer = &__pyx_pybuffer_pis;
+  __pyx_pybuffer_mus.pybuffer.buf = NULL;
+  __pyx_pybuffer_mus.refcount = 0;
+  __pyx_pybuffernd_mus.data = NULL;
+  __pyx_pybuffernd_mus.rcbuffer = &__pyx_pybuffer_mus;
+  __pyx_pybuffer_tau2.pybuffer.buf = NULL;
+  __pyx_pybuffer_tau2.refcount = 0;
+  __pyx_pybuffernd_tau2.data = NULL;
+  __pyx_pybuffernd_tau2.rcbuffer = &__pyx_pybuffer_tau2;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_evalpoints.rcbuffer->pybuffer, (PyObject*)__pyx_v_evalpoints, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 389, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_evalpoints.diminfo[0].strides = __pyx_pybuffernd_evalpoints.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_evalpoints.diminfo[0].shape = __pyx_pybuffernd_evalpoints.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_evalindex.rcbuffer->pybuffer, (PyObject*)__pyx_v_evalindex, &__Pyx_TypeInfo_nn___pyx_t_5numpy_intp_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 389, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_evalindex.diminfo[0].strides = __pyx_pybuffernd_evalindex.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_evalindex.diminfo[0].shape = __pyx_pybuffernd_evalindex.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_evalindex.diminfo[1].strides = __pyx_pybuffernd_evalindex.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_evalindex.diminfo[1].shape = __pyx_pybuffernd_evalindex.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_weightedpdfs.rcbuffer->pybuffer, (PyObject*)__pyx_v_weightedpdfs, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 389, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_weightedpdfs.diminfo[0].strides = __pyx_pybuffernd_weightedpdfs.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_weightedpdfs.diminfo[0].shape = __pyx_pybuffernd_weightedpdfs.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_weightedpdfs.diminfo[1].strides = __pyx_pybuffernd_weightedpdfs.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_weightedpdfs.diminfo[1].shape = __pyx_pybuffernd_weightedpdfs.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_pis.rcbuffer->pybuffer, (PyObject*)__pyx_v_pis, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 389, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_pis.diminfo[0].strides = __pyx_pybuffernd_pis.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_pis.diminfo[0].shape = __pyx_pybuffernd_pis.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_mus.rcbuffer->pybuffer, (PyObject*)__pyx_v_mus, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 389, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_mus.diminfo[0].strides = __pyx_pybuffernd_mus.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_mus.diminfo[0].shape = __pyx_pybuffernd_mus.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_tau2.rcbuffer->pybuffer, (PyObject*)__pyx_v_tau2, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 389, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_tau2.diminfo[0].strides = __pyx_pybuffernd_tau2.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_tau2.diminfo[0].shape = __pyx_pybuffernd_tau2.rcbuffer->pybuffer.shape[0];
+
+  /* "deconvolvedlognormtools.pyx":397
+ * 
+ *     cdef Py_ssize_t i, j, k
+ *     cdef Py_ssize_t nclusters = weightedpdfs.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t nmasses = weightedpdfs.shape[1]
+ *     cdef Py_ssize_t npoints = evalpoints.shape[0]
+ */
+  __pyx_v_nclusters = (__pyx_v_weightedpdfs->dimensions[0]);
+
+  /* "deconvolvedlognormtools.pyx":398
+ *     cdef Py_ssize_t i, j, k
+ *     cdef Py_ssize_t nclusters = weightedpdfs.shape[0]
+ *     cdef Py_ssize_t nmasses = weightedpdfs.shape[1]             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t npoints = evalpoints.shape[0]
+ *     cdef Py_ssize_t ngauss = pis.shape[0]
+ */
+  __pyx_v_nmasses = (__pyx_v_weightedpdfs->dimensions[1]);
+
+  /* "deconvolvedlognormtools.pyx":399
+ *     cdef Py_ssize_t nclusters = weightedpdfs.shape[0]
+ *     cdef Py_ssize_t nmasses = weightedpdfs.shape[1]
+ *     cdef Py_ssize_t npoints = evalpoints.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t ngauss = pis.shape[0]
+ * 
+ */
+  __pyx_v_npoints = (__pyx_v_evalpoints->dimensions[0]);
+
+  /* "deconvolvedlognormtools.pyx":400
+ *     cdef Py_ssize_t nmasses = weightedpdfs.shape[1]
+ *     cdef Py_ssize_t npoints = evalpoints.shape[0]
+ *     cdef Py_ssize_t ngauss = pis.shape[0]             # <<<<<<<<<<<<<<
+ * 
+ *     ### mixture weights, truncated at 0 and renormalized
+ */
+  __pyx_v_ngauss = (__pyx_v_pis->dimensions[0]);
+
+  /* "deconvolvedlognormtools.pyx":404
+ *     ### mixture weights, truncated at 0 and renormalized
+ * 
+ *     cdef np.ndarray[np.double_t, ndim=1, mode='c'] amplitudes = np.zeros(ngauss)             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.double_t, ndim=1, mode='c'] neghalfinvtau2 = np.zeros(ngauss)
+ *     cdef double zeroboundrenorm, tau
+ */
+  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 404, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_zeros); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 404, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_ngauss); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 404, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  if (!__pyx_t_4) {
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 404, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else {
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_2};
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 404, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_2};
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 404, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 404, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4); __pyx_t_4 = NULL;
+      __Pyx_GIVEREF(__pyx_t_2);
+      PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_t_2);
+      __pyx_t_2 = 0;
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 404, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 404, __pyx_L1_error)
+  __pyx_t_6 = ((PyArrayObject *)__pyx_t_1);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_amplitudes.rcbuffer->pybuffer, (PyObject*)__pyx_t_6, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_amplitudes = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_amplitudes.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 404, __pyx_L1_error)
+    } else {__pyx_pybuffernd_amplitudes.diminfo[0].strides = __pyx_pybuffernd_amplitudes.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_amplitudes.diminfo[0].shape = __pyx_pybuffernd_amplitudes.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_6 = 0;
+  __pyx_v_amplitudes = ((PyArrayObject *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "deconvolvedlognormtools.pyx":405
+ * 
+ *     cdef np.ndarray[np.double_t, ndim=1, mode='c'] amplitudes = np.zeros(ngauss)
+ *     cdef np.ndarray[np.double_t, ndim=1, mode='c'] neghalfinvtau2 = np.zeros(ngauss)             # <<<<<<<<<<<<<<
+ *     cdef double zeroboundrenorm, tau
+ *     for k from 0 <= k < ngauss:
+ */
+  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 405, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_zeros); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 405, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_ngauss); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 405, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_2)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_2);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+    }
+  }
+  if (!__pyx_t_2) {
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 405, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else {
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_5)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_2, __pyx_t_3};
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 405, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     } else
     #endif
     #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
-      PyObject *__pyx_temp[5] = {__pyx_t_7, __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_t_6};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 264, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_2, __pyx_t_3};
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 405, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     } else
     #endif
     {
-      __pyx_t_9 = PyTuple_New(4+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 264, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_9);
-      if (__pyx_t_7) {
-        __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_7); __pyx_t_7 = NULL;
-      }
+      __pyx_t_4 = PyTuple_New(1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 405, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_GIVEREF(__pyx_t_2); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2); __pyx_t_2 = NULL;
       __Pyx_GIVEREF(__pyx_t_3);
-      PyTuple_SET_ITEM(__pyx_t_9, 0+__pyx_t_8, __pyx_t_3);
-      __Pyx_GIVEREF(__pyx_t_4);
-      PyTuple_SET_ITEM(__pyx_t_9, 1+__pyx_t_8, __pyx_t_4);
-      __Pyx_GIVEREF(__pyx_t_5);
-      PyTuple_SET_ITEM(__pyx_t_9, 2+__pyx_t_8, __pyx_t_5);
-      __Pyx_GIVEREF(__pyx_t_6);
-      PyTuple_SET_ITEM(__pyx_t_9, 3+__pyx_t_8, __pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_4, 0+1, __pyx_t_3);
       __pyx_t_3 = 0;
-      __pyx_t_4 = 0;
-      __pyx_t_5 = 0;
-      __pyx_t_6 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 264, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 405, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     }
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 405, __pyx_L1_error)
+  __pyx_t_7 = ((PyArrayObject *)__pyx_t_1);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_neghalfinvtau2.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_neghalfinvtau2 = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_neghalfinvtau2.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 405, __pyx_L1_error)
+    } else {__pyx_pybuffernd_neghalfinvtau2.diminfo[0].strides = __pyx_pybuffernd_neghalfinvtau2.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_neghalfinvtau2.diminfo[0].shape = __pyx_pybuffernd_neghalfinvtau2.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_7 = 0;
+  __pyx_v_neghalfinvtau2 = ((PyArrayObject *)__pyx_t_1);
+  __pyx_t_1 = 0;
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":264
- * 
- * 
- *         prob = altintegral(ml_ints[i,:],             # <<<<<<<<<<<<<<
- *                            delta_logmls[i,:],
- *                            logmu,
+  /* "deconvolvedlognormtools.pyx":407
+ *     cdef np.ndarray[np.double_t, ndim=1, mode='c'] neghalfinvtau2 = np.zeros(ngauss)
+ *     cdef double zeroboundrenorm, tau
+ *     for k from 0 <= k < ngauss:             # <<<<<<<<<<<<<<
+ *         tau = sqrt(tau2[k])
+ *         zeroboundrenorm = 0.5*erfc(-mus[k]/(tau*sqrt2))
+ */
+  __pyx_t_8 = __pyx_v_ngauss;
+  for (__pyx_v_k = 0; __pyx_v_k < __pyx_t_8; __pyx_v_k++) {
+
+    /* "deconvolvedlognormtools.pyx":408
+ *     cdef double zeroboundrenorm, tau
+ *     for k from 0 <= k < ngauss:
+ *         tau = sqrt(tau2[k])             # <<<<<<<<<<<<<<
+ *         zeroboundrenorm = 0.5*erfc(-mus[k]/(tau*sqrt2))
+ *         if zeroboundrenorm < 1e-4:  #avoid divide by 0 by making it zero probability
  */
-    __pyx_t_10 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_10 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 264, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_v_prob = __pyx_t_10;
+    __pyx_t_9 = __pyx_v_k;
+    __pyx_v_tau = sqrt((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_tau2.rcbuffer->pybuffer.buf, __pyx_t_9, __pyx_pybuffernd_tau2.diminfo[0].strides)));
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":269
- *                            sigma)
- * 
- *         outlierprob = altintegral(outlier_ml_ints[i,:],             # <<<<<<<<<<<<<<
- *                                   delta_logmls[i,:],
- *                                   logmu,
+    /* "deconvolvedlognormtools.pyx":409
+ *     for k from 0 <= k < ngauss:
+ *         tau = sqrt(tau2[k])
+ *         zeroboundrenorm = 0.5*erfc(-mus[k]/(tau*sqrt2))             # <<<<<<<<<<<<<<
+ *         if zeroboundrenorm < 1e-4:  #avoid divide by 0 by making it zero probability
+ *             return -np.inf
  */
-    __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_altintegral); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 269, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_9 = PyInt_FromSsize_t(__pyx_v_i); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 269, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_9);
-    __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 269, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_GIVEREF(__pyx_t_9);
-    PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_9);
-    __Pyx_INCREF(__pyx_slice__7);
-    __Pyx_GIVEREF(__pyx_slice__7);
-    PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_slice__7);
-    __pyx_t_9 = 0;
-    __pyx_t_9 = PyObject_GetItem(((PyObject *)__pyx_v_outlier_ml_ints), __pyx_t_6); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 269, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_9);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_10 = __pyx_v_k;
+    __pyx_v_zeroboundrenorm = (0.5 * erfc(((-(*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_mus.rcbuffer->pybuffer.buf, __pyx_t_10, __pyx_pybuffernd_mus.diminfo[0].strides))) / (__pyx_v_tau * __pyx_v_23deconvolvedlognormtools_sqrt2))));
+
+    /* "deconvolvedlognormtools.pyx":410
+ *         tau = sqrt(tau2[k])
+ *         zeroboundrenorm = 0.5*erfc(-mus[k]/(tau*sqrt2))
+ *         if zeroboundrenorm < 1e-4:  #avoid divide by 0 by making it zero probability             # <<<<<<<<<<<<<<
+ *             return -np.inf
+ *         amplitudes[k] = pis[k]/(zeroboundrenorm*sqrt2pi_c*tau)
+ */
+    __pyx_t_11 = ((__pyx_v_zeroboundrenorm < 1e-4) != 0);
+    if (__pyx_t_11) {
+
+      /* "deconvolvedlognormtools.pyx":411
+ *         zeroboundrenorm = 0.5*erfc(-mus[k]/(tau*sqrt2))
+ *         if zeroboundrenorm < 1e-4:  #avoid divide by 0 by making it zero probability
+ *             return -np.inf             # <<<<<<<<<<<<<<
+ *         amplitudes[k] = pis[k]/(zeroboundrenorm*sqrt2pi_c*tau)
+ *         neghalfinvtau2[k] = -0.5/tau2[k]
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 411, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_inf); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 411, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_1 = PyNumber_Negative(__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 411, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_r = __pyx_t_1;
+      __pyx_t_1 = 0;
+      goto __pyx_L0;
+
+      /* "deconvolvedlognormtools.pyx":410
+ *         tau = sqrt(tau2[k])
+ *         zeroboundrenorm = 0.5*erfc(-mus[k]/(tau*sqrt2))
+ *         if zeroboundrenorm < 1e-4:  #avoid divide by 0 by making it zero probability             # <<<<<<<<<<<<<<
+ *             return -np.inf
+ *         amplitudes[k] = pis[k]/(zeroboundrenorm*sqrt2pi_c*tau)
+ */
+    }
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":270
+    /* "deconvolvedlognormtools.pyx":412
+ *         if zeroboundrenorm < 1e-4:  #avoid divide by 0 by making it zero probability
+ *             return -np.inf
+ *         amplitudes[k] = pis[k]/(zeroboundrenorm*sqrt2pi_c*tau)             # <<<<<<<<<<<<<<
+ *         neghalfinvtau2[k] = -0.5/tau2[k]
  * 
- *         outlierprob = altintegral(outlier_ml_ints[i,:],
- *                                   delta_logmls[i,:],             # <<<<<<<<<<<<<<
- *                                   logmu,
- *                                   sigma)
  */
-    __pyx_t_6 = PyInt_FromSsize_t(__pyx_v_i); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 270, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 270, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_GIVEREF(__pyx_t_6);
-    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_6);
-    __Pyx_INCREF(__pyx_slice__8);
-    __Pyx_GIVEREF(__pyx_slice__8);
-    PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_slice__8);
-    __pyx_t_6 = 0;
-    __pyx_t_6 = PyObject_GetItem(((PyObject *)__pyx_v_delta_logmls), __pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 270, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_12 = __pyx_v_k;
+    __pyx_t_13 = __pyx_v_k;
+    *__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_amplitudes.rcbuffer->pybuffer.buf, __pyx_t_13, __pyx_pybuffernd_amplitudes.diminfo[0].strides) = ((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_pis.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_pis.diminfo[0].strides)) / ((__pyx_v_zeroboundrenorm * __pyx_v_23deconvolvedlognormtools_sqrt2pi_c) * __pyx_v_tau));
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":271
- *         outlierprob = altintegral(outlier_ml_ints[i,:],
- *                                   delta_logmls[i,:],
- *                                   logmu,             # <<<<<<<<<<<<<<
- *                                   sigma)
+    /* "deconvolvedlognormtools.pyx":413
+ *             return -np.inf
+ *         amplitudes[k] = pis[k]/(zeroboundrenorm*sqrt2pi_c*tau)
+ *         neghalfinvtau2[k] = -0.5/tau2[k]             # <<<<<<<<<<<<<<
  * 
+ *     ### intrinsic pdf at every distinct evaluation point (points x components, dotted with amplitudes)
  */
-    __pyx_t_5 = PyFloat_FromDouble(__pyx_v_logmu); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 271, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_14 = __pyx_v_k;
+    __pyx_t_15 = __pyx_v_k;
+    *__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_neghalfinvtau2.rcbuffer->pybuffer.buf, __pyx_t_15, __pyx_pybuffernd_neghalfinvtau2.diminfo[0].strides) = (-0.5 / (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_tau2.rcbuffer->pybuffer.buf, __pyx_t_14, __pyx_pybuffernd_tau2.diminfo[0].strides)));
+  }
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":272
- *                                   delta_logmls[i,:],
- *                                   logmu,
- *                                   sigma)             # <<<<<<<<<<<<<<
+  /* "deconvolvedlognormtools.pyx":417
+ *     ### intrinsic pdf at every distinct evaluation point (points x components, dotted with amplitudes)
  * 
+ *     cdef np.ndarray[np.double_t, ndim=1, mode='c'] intrinsicpdf = np.zeros(npoints)             # <<<<<<<<<<<<<<
+ *     cdef double x, dx, thesum
  * 
  */
-    __pyx_t_4 = PyFloat_FromDouble(__pyx_v_sigma); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 272, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_3 = NULL;
-    __pyx_t_8 = 0;
-    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
-      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-      if (likely(__pyx_t_3)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-        __Pyx_INCREF(__pyx_t_3);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_2, function);
-        __pyx_t_8 = 1;
-      }
+  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 417, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_zeros); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 417, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = PyInt_FromSsize_t(__pyx_v_npoints); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 417, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
     }
+  }
+  if (!__pyx_t_3) {
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 417, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else {
     #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_2)) {
-      PyObject *__pyx_temp[5] = {__pyx_t_3, __pyx_t_9, __pyx_t_6, __pyx_t_5, __pyx_t_4};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 269, __pyx_L1_error)
+    if (PyFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_3, __pyx_t_5};
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 417, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
       __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     } else
     #endif
     #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
-      PyObject *__pyx_temp[5] = {__pyx_t_3, __pyx_t_9, __pyx_t_6, __pyx_t_5, __pyx_t_4};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 269, __pyx_L1_error)
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_3, __pyx_t_5};
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 417, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
       __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     } else
     #endif
     {
-      __pyx_t_7 = PyTuple_New(4+__pyx_t_8); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 269, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_7);
-      if (__pyx_t_3) {
-        __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_3); __pyx_t_3 = NULL;
-      }
-      __Pyx_GIVEREF(__pyx_t_9);
-      PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_8, __pyx_t_9);
-      __Pyx_GIVEREF(__pyx_t_6);
-      PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_8, __pyx_t_6);
+      __pyx_t_2 = PyTuple_New(1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 417, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_3); __pyx_t_3 = NULL;
       __Pyx_GIVEREF(__pyx_t_5);
-      PyTuple_SET_ITEM(__pyx_t_7, 2+__pyx_t_8, __pyx_t_5);
-      __Pyx_GIVEREF(__pyx_t_4);
-      PyTuple_SET_ITEM(__pyx_t_7, 3+__pyx_t_8, __pyx_t_4);
-      __pyx_t_9 = 0;
-      __pyx_t_6 = 0;
+      PyTuple_SET_ITEM(__pyx_t_2, 0+1, __pyx_t_5);
       __pyx_t_5 = 0;
-      __pyx_t_4 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 269, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 417, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     }
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF_SET(__pyx_v_outlierprob, __pyx_t_1);
-    __pyx_t_1 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 417, __pyx_L1_error)
+  __pyx_t_16 = ((PyArrayObject *)__pyx_t_1);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_intrinsicpdf.rcbuffer->pybuffer, (PyObject*)__pyx_t_16, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_intrinsicpdf = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_intrinsicpdf.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 417, __pyx_L1_error)
+    } else {__pyx_pybuffernd_intrinsicpdf.diminfo[0].strides = __pyx_pybuffernd_intrinsicpdf.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_intrinsicpdf.diminfo[0].shape = __pyx_pybuffernd_intrinsicpdf.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_16 = 0;
+  __pyx_v_intrinsicpdf = ((PyArrayObject *)__pyx_t_1);
+  __pyx_t_1 = 0;
 
-    /* "nfwfitter/deconvolvedlognormtools.pyx":276
+  /* "deconvolvedlognormtools.pyx":420
+ *     cdef double x, dx, thesum
  * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i from 0 <= i < npoints:
+ *             x = evalpoints[i]
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "deconvolvedlognormtools.pyx":421
+ * 
+ *     with nogil:
+ *         for i from 0 <= i < npoints:             # <<<<<<<<<<<<<<
+ *             x = evalpoints[i]
+ *             thesum = 0.
+ */
+        __pyx_t_8 = __pyx_v_npoints;
+        for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_8; __pyx_v_i++) {
+
+          /* "deconvolvedlognormtools.pyx":422
+ *     with nogil:
+ *         for i from 0 <= i < npoints:
+ *             x = evalpoints[i]             # <<<<<<<<<<<<<<
+ *             thesum = 0.
+ *             for k from 0 <= k < ngauss:
+ */
+          __pyx_t_17 = __pyx_v_i;
+          __pyx_v_x = (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_evalpoints.rcbuffer->pybuffer.buf, __pyx_t_17, __pyx_pybuffernd_evalpoints.diminfo[0].strides));
+
+          /* "deconvolvedlognormtools.pyx":423
+ *         for i from 0 <= i < npoints:
+ *             x = evalpoints[i]
+ *             thesum = 0.             # <<<<<<<<<<<<<<
+ *             for k from 0 <= k < ngauss:
+ *                 dx = x - mus[k]
+ */
+          __pyx_v_thesum = 0.;
+
+          /* "deconvolvedlognormtools.pyx":424
+ *             x = evalpoints[i]
+ *             thesum = 0.
+ *             for k from 0 <= k < ngauss:             # <<<<<<<<<<<<<<
+ *                 dx = x - mus[k]
+ *                 thesum += amplitudes[k]*exp(neghalfinvtau2[k]*dx*dx)
+ */
+          __pyx_t_18 = __pyx_v_ngauss;
+          for (__pyx_v_k = 0; __pyx_v_k < __pyx_t_18; __pyx_v_k++) {
+
+            /* "deconvolvedlognormtools.pyx":425
+ *             thesum = 0.
+ *             for k from 0 <= k < ngauss:
+ *                 dx = x - mus[k]             # <<<<<<<<<<<<<<
+ *                 thesum += amplitudes[k]*exp(neghalfinvtau2[k]*dx*dx)
+ *             intrinsicpdf[i] = thesum
+ */
+            __pyx_t_19 = __pyx_v_k;
+            __pyx_v_dx = (__pyx_v_x - (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_mus.rcbuffer->pybuffer.buf, __pyx_t_19, __pyx_pybuffernd_mus.diminfo[0].strides)));
+
+            /* "deconvolvedlognormtools.pyx":426
+ *             for k from 0 <= k < ngauss:
+ *                 dx = x - mus[k]
+ *                 thesum += amplitudes[k]*exp(neghalfinvtau2[k]*dx*dx)             # <<<<<<<<<<<<<<
+ *             intrinsicpdf[i] = thesum
+ * 
+ */
+            __pyx_t_20 = __pyx_v_k;
+            __pyx_t_21 = __pyx_v_k;
+            __pyx_v_thesum = (__pyx_v_thesum + ((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_amplitudes.rcbuffer->pybuffer.buf, __pyx_t_20, __pyx_pybuffernd_amplitudes.diminfo[0].strides)) * exp((((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_neghalfinvtau2.rcbuffer->pybuffer.buf, __pyx_t_21, __pyx_pybuffernd_neghalfinvtau2.diminfo[0].strides)) * __pyx_v_dx) * __pyx_v_dx))));
+          }
+
+          /* "deconvolvedlognormtools.pyx":427
+ *                 dx = x - mus[k]
+ *                 thesum += amplitudes[k]*exp(neghalfinvtau2[k]*dx*dx)
+ *             intrinsicpdf[i] = thesum             # <<<<<<<<<<<<<<
  * 
- *         sumlogprob += log((1-fracoutliers)*prob + fracoutliers*outlierprob)             # <<<<<<<<<<<<<<
+ *     ### convolve with each halo's pdf
+ */
+          __pyx_t_22 = __pyx_v_i;
+          *__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_intrinsicpdf.rcbuffer->pybuffer.buf, __pyx_t_22, __pyx_pybuffernd_intrinsicpdf.diminfo[0].strides) = __pyx_v_thesum;
+        }
+      }
+
+      /* "deconvolvedlognormtools.pyx":420
+ *     cdef double x, dx, thesum
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i from 0 <= i < npoints:
+ *             x = evalpoints[i]
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L8;
+        }
+        __pyx_L8:;
+      }
+  }
+
+  /* "deconvolvedlognormtools.pyx":431
+ *     ### convolve with each halo's pdf
+ * 
+ *     cdef double sumlogprob = 0.             # <<<<<<<<<<<<<<
+ *     cdef double prob
+ * 
+ */
+  __pyx_v_sumlogprob = 0.;
+
+  /* "deconvolvedlognormtools.pyx":434
+ *     cdef double prob
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i from 0 <= i < nclusters:
+ *             prob = 0.
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "deconvolvedlognormtools.pyx":435
+ * 
+ *     with nogil:
+ *         for i from 0 <= i < nclusters:             # <<<<<<<<<<<<<<
+ *             prob = 0.
+ *             for j from 0 <= j < nmasses:
+ */
+        __pyx_t_8 = __pyx_v_nclusters;
+        for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_8; __pyx_v_i++) {
+
+          /* "deconvolvedlognormtools.pyx":436
+ *     with nogil:
+ *         for i from 0 <= i < nclusters:
+ *             prob = 0.             # <<<<<<<<<<<<<<
+ *             for j from 0 <= j < nmasses:
+ *                 prob += weightedpdfs[i,j]*intrinsicpdf[evalindex[i,j]]
+ */
+          __pyx_v_prob = 0.;
+
+          /* "deconvolvedlognormtools.pyx":437
+ *         for i from 0 <= i < nclusters:
+ *             prob = 0.
+ *             for j from 0 <= j < nmasses:             # <<<<<<<<<<<<<<
+ *                 prob += weightedpdfs[i,j]*intrinsicpdf[evalindex[i,j]]
+ *             sumlogprob += log(prob)
+ */
+          __pyx_t_18 = __pyx_v_nmasses;
+          for (__pyx_v_j = 0; __pyx_v_j < __pyx_t_18; __pyx_v_j++) {
+
+            /* "deconvolvedlognormtools.pyx":438
+ *             prob = 0.
+ *             for j from 0 <= j < nmasses:
+ *                 prob += weightedpdfs[i,j]*intrinsicpdf[evalindex[i,j]]             # <<<<<<<<<<<<<<
+ *             sumlogprob += log(prob)
+ * 
+ */
+            __pyx_t_23 = __pyx_v_i;
+            __pyx_t_24 = __pyx_v_j;
+            __pyx_t_25 = __pyx_v_i;
+            __pyx_t_26 = __pyx_v_j;
+            __pyx_t_27 = (*__Pyx_BufPtrCContig2d(__pyx_t_5numpy_intp_t *, __pyx_pybuffernd_evalindex.rcbuffer->pybuffer.buf, __pyx_t_25, __pyx_pybuffernd_evalindex.diminfo[0].strides, __pyx_t_26, __pyx_pybuffernd_evalindex.diminfo[1].strides));
+            __pyx_v_prob = (__pyx_v_prob + ((*__Pyx_BufPtrCContig2d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_weightedpdfs.rcbuffer->pybuffer.buf, __pyx_t_23, __pyx_pybuffernd_weightedpdfs.diminfo[0].strides, __pyx_t_24, __pyx_pybuffernd_weightedpdfs.diminfo[1].strides)) * (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_intrinsicpdf.rcbuffer->pybuffer.buf, __pyx_t_27, __pyx_pybuffernd_intrinsicpdf.diminfo[0].strides))));
+          }
+
+          /* "deconvolvedlognormtools.pyx":439
+ *             for j from 0 <= j < nmasses:
+ *                 prob += weightedpdfs[i,j]*intrinsicpdf[evalindex[i,j]]
+ *             sumlogprob += log(prob)             # <<<<<<<<<<<<<<
  * 
  *     return sumlogprob
  */
-    __pyx_t_1 = PyFloat_FromDouble(((1.0 - __pyx_v_fracoutliers) * __pyx_v_prob)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 276, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_fracoutliers); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 276, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_7 = PyNumber_Multiply(__pyx_t_2, __pyx_v_outlierprob); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 276, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_2 = PyNumber_Add(__pyx_t_1, __pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 276, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __pyx_t_10 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_10 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 276, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_v_sumlogprob = (__pyx_v_sumlogprob + log(__pyx_t_10));
+          __pyx_v_sumlogprob = (__pyx_v_sumlogprob + log(__pyx_v_prob));
+        }
+      }
+
+      /* "deconvolvedlognormtools.pyx":434
+ *     cdef double prob
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i from 0 <= i < nclusters:
+ *             prob = 0.
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L15;
+        }
+        __pyx_L15:;
+      }
   }
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":278
- *         sumlogprob += log((1-fracoutliers)*prob + fracoutliers*outlierprob)
+  /* "deconvolvedlognormtools.pyx":441
+ *             sumlogprob += log(prob)
  * 
  *     return sumlogprob             # <<<<<<<<<<<<<<
  * 
- * 
+ * ###
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_sumlogprob); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 278, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_r = __pyx_t_2;
-  __pyx_t_2 = 0;
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_sumlogprob); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 441, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":243
- * @cython.boundscheck(False)
+  /* "deconvolvedlognormtools.pyx":389
  * @cython.wraparound(False)
- * def outlierloglinearlike(np.ndarray[np.double_t, ndim=2, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
- *                          np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
- *                          np.ndarray[np.double_t, ndim=2, mode='c'] outlier_ml_ints,
+ * @cython.cdivision(True)
+ * def pdfGaussMix1D_cached(np.ndarray[np.double_t, ndim=1, mode='c'] evalpoints,             # <<<<<<<<<<<<<<
+ *                          np.ndarray[np.intp_t, ndim=2, mode='c'] evalindex,
+ *                          np.ndarray[np.double_t, ndim=2, mode='c'] weightedpdfs,
  */
 
   /* function exit code */
@@ -4458,45 +7251,55 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_12outlierloglinea
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_9);
   { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
     __Pyx_PyThreadState_declare
     __Pyx_PyThreadState_assign
     __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_outlier_delta_logmls.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_outlier_ml_ints.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_amplitudes.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_evalindex.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_evalpoints.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_intrinsicpdf.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_mus.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_neghalfinvtau2.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_pis.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_tau2.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_weightedpdfs.rcbuffer->pybuffer);
   __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("nfwfitter.deconvolvedlognormtools.outlierloglinearlike", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("deconvolvedlognormtools.pdfGaussMix1D_cached", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   goto __pyx_L2;
   __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_logmls.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ml_ints.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_outlier_delta_logmls.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_outlier_ml_ints.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_amplitudes.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_evalindex.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_evalpoints.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_intrinsicpdf.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_mus.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_neghalfinvtau2.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_pis.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_tau2.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_weightedpdfs.rcbuffer->pybuffer);
   __pyx_L2:;
-  __Pyx_XDECREF(__pyx_v_outlierprob);
+  __Pyx_XDECREF((PyObject *)__pyx_v_amplitudes);
+  __Pyx_XDECREF((PyObject *)__pyx_v_neghalfinvtau2);
+  __Pyx_XDECREF((PyObject *)__pyx_v_intrinsicpdf);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "nfwfitter/deconvolvedlognormtools.pyx":286
- * @cython.boundscheck(False)
- * @cython.wraparound(False)
+/* "deconvolvedlognormtools.pyx":445
+ * ###
+ * 
  * def pdfGaussMix1D(np.ndarray[np.double_t, ndim=2, mode='c'] delta_mls,             # <<<<<<<<<<<<<<
  *                   np.ndarray[np.double_t, ndim=2, mode='c'] delta_masses,
  *                   np.ndarray[np.double_t, ndim=2, mode='c'] pdfs,
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_15pdfGaussMix1D(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_9nfwfitter_23deconvolvedlognormtools_15pdfGaussMix1D = {"pdfGaussMix1D", (PyCFunction)__pyx_pw_9nfwfitter_23deconvolvedlognormtools_15pdfGaussMix1D, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_15pdfGaussMix1D(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_23deconvolvedlognormtools_25pdfGaussMix1D(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_23deconvolvedlognormtools_24pdfGaussMix1D[] = "Gaussian mixture convolved with per-halo pdfs. For repeated calls on the same halos,\n    use precomputeGaussMix1D once and pdfGaussMix1D_cached.";
+static PyMethodDef __pyx_mdef_23deconvolvedlognormtools_25pdfGaussMix1D = {"pdfGaussMix1D", (PyCFunction)__pyx_pw_23deconvolvedlognormtools_25pdfGaussMix1D, METH_VARARGS|METH_KEYWORDS, __pyx_doc_23deconvolvedlognormtools_24pdfGaussMix1D};
+static PyObject *__pyx_pw_23deconvolvedlognormtools_25pdfGaussMix1D(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyArrayObject *__pyx_v_delta_mls = 0;
   PyArrayObject *__pyx_v_delta_masses = 0;
   PyArrayObject *__pyx_v_pdfs = 0;
@@ -4530,31 +7333,31 @@ static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_15pdfGaussMix1D(P
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_delta_masses)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("pdfGaussMix1D", 1, 6, 6, 1); __PYX_ERR(0, 286, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("pdfGaussMix1D", 1, 6, 6, 1); __PYX_ERR(0, 445, __pyx_L3_error)
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_pdfs)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("pdfGaussMix1D", 1, 6, 6, 2); __PYX_ERR(0, 286, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("pdfGaussMix1D", 1, 6, 6, 2); __PYX_ERR(0, 445, __pyx_L3_error)
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_pis)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("pdfGaussMix1D", 1, 6, 6, 3); __PYX_ERR(0, 286, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("pdfGaussMix1D", 1, 6, 6, 3); __PYX_ERR(0, 445, __pyx_L3_error)
         }
         case  4:
         if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_mus)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("pdfGaussMix1D", 1, 6, 6, 4); __PYX_ERR(0, 286, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("pdfGaussMix1D", 1, 6, 6, 4); __PYX_ERR(0, 445, __pyx_L3_error)
         }
         case  5:
         if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_tau2)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("pdfGaussMix1D", 1, 6, 6, 5); __PYX_ERR(0, 286, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("pdfGaussMix1D", 1, 6, 6, 5); __PYX_ERR(0, 445, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "pdfGaussMix1D") < 0)) __PYX_ERR(0, 286, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "pdfGaussMix1D") < 0)) __PYX_ERR(0, 445, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 6) {
       goto __pyx_L5_argtuple_error;
@@ -4575,19 +7378,19 @@ static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_15pdfGaussMix1D(P
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("pdfGaussMix1D", 1, 6, 6, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 286, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("pdfGaussMix1D", 1, 6, 6, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 445, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("nfwfitter.deconvolvedlognormtools.pdfGaussMix1D", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("deconvolvedlognormtools.pdfGaussMix1D", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_delta_mls), __pyx_ptype_5numpy_ndarray, 1, "delta_mls", 0))) __PYX_ERR(0, 286, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_delta_masses), __pyx_ptype_5numpy_ndarray, 1, "delta_masses", 0))) __PYX_ERR(0, 287, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_pdfs), __pyx_ptype_5numpy_ndarray, 1, "pdfs", 0))) __PYX_ERR(0, 288, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_pis), __pyx_ptype_5numpy_ndarray, 1, "pis", 0))) __PYX_ERR(0, 289, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_mus), __pyx_ptype_5numpy_ndarray, 1, "mus", 0))) __PYX_ERR(0, 290, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_tau2), __pyx_ptype_5numpy_ndarray, 1, "tau2", 0))) __PYX_ERR(0, 291, __pyx_L1_error)
-  __pyx_r = __pyx_pf_9nfwfitter_23deconvolvedlognormtools_14pdfGaussMix1D(__pyx_self, __pyx_v_delta_mls, __pyx_v_delta_masses, __pyx_v_pdfs, __pyx_v_pis, __pyx_v_mus, __pyx_v_tau2);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_delta_mls), __pyx_ptype_5numpy_ndarray, 1, "delta_mls", 0))) __PYX_ERR(0, 445, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_delta_masses), __pyx_ptype_5numpy_ndarray, 1, "delta_masses", 0))) __PYX_ERR(0, 446, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_pdfs), __pyx_ptype_5numpy_ndarray, 1, "pdfs", 0))) __PYX_ERR(0, 447, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_pis), __pyx_ptype_5numpy_ndarray, 1, "pis", 0))) __PYX_ERR(0, 448, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_mus), __pyx_ptype_5numpy_ndarray, 1, "mus", 0))) __PYX_ERR(0, 449, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_tau2), __pyx_ptype_5numpy_ndarray, 1, "tau2", 0))) __PYX_ERR(0, 450, __pyx_L1_error)
+  __pyx_r = __pyx_pf_23deconvolvedlognormtools_24pdfGaussMix1D(__pyx_self, __pyx_v_delta_mls, __pyx_v_delta_masses, __pyx_v_pdfs, __pyx_v_pis, __pyx_v_mus, __pyx_v_tau2);
 
   /* function exit code */
   goto __pyx_L0;
@@ -4598,31 +7401,16 @@ static PyObject *__pyx_pw_9nfwfitter_23deconvolvedlognormtools_15pdfGaussMix1D(P
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_14pdfGaussMix1D(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_delta_mls, PyArrayObject *__pyx_v_delta_masses, PyArrayObject *__pyx_v_pdfs, PyArrayObject *__pyx_v_pis, PyArrayObject *__pyx_v_mus, PyArrayObject *__pyx_v_tau2) {
-  Py_ssize_t __pyx_v_i;
-  Py_ssize_t __pyx_v_j;
-  Py_ssize_t __pyx_v_nclusters;
-  Py_ssize_t __pyx_v_ngauss;
-  Py_ssize_t __pyx_v_nmasses;
-  PyArrayObject *__pyx_v_norms = 0;
-  double __pyx_v_zeroboundrenorm;
-  double __pyx_v_tau;
-  double __pyx_v_sumlogprob;
-  double __pyx_v_deltamass_mu2;
-  double __pyx_v_gausseval;
-  PyArrayObject *__pyx_v_integrand = 0;
-  Py_ssize_t __pyx_v_k;
-  PyObject *__pyx_v_prob = NULL;
+static PyObject *__pyx_pf_23deconvolvedlognormtools_24pdfGaussMix1D(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_delta_mls, PyArrayObject *__pyx_v_delta_masses, PyArrayObject *__pyx_v_pdfs, PyArrayObject *__pyx_v_pis, PyArrayObject *__pyx_v_mus, PyArrayObject *__pyx_v_tau2) {
+  PyObject *__pyx_v_evalpoints = NULL;
+  PyObject *__pyx_v_evalindex = NULL;
+  PyObject *__pyx_v_weightedpdfs = NULL;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_delta_masses;
   __Pyx_Buffer __pyx_pybuffer_delta_masses;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_delta_mls;
   __Pyx_Buffer __pyx_pybuffer_delta_mls;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_integrand;
-  __Pyx_Buffer __pyx_pybuffer_integrand;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_mus;
   __Pyx_Buffer __pyx_pybuffer_mus;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_norms;
-  __Pyx_Buffer __pyx_pybuffer_norms;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_pdfs;
   __Pyx_Buffer __pyx_pybuffer_pdfs;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_pis;
@@ -4634,40 +7422,11 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_14pdfGaussMix1D(C
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_4;
   PyObject *__pyx_t_5 = NULL;
-  PyArrayObject *__pyx_t_6 = NULL;
-  Py_ssize_t __pyx_t_7;
-  Py_ssize_t __pyx_t_8;
-  __pyx_t_5numpy_double_t __pyx_t_9;
-  double __pyx_t_10;
-  int __pyx_t_11;
-  Py_ssize_t __pyx_t_12;
-  PyArrayObject *__pyx_t_13 = NULL;
-  Py_ssize_t __pyx_t_14;
-  Py_ssize_t __pyx_t_15;
-  Py_ssize_t __pyx_t_16;
-  Py_ssize_t __pyx_t_17;
-  Py_ssize_t __pyx_t_18;
-  Py_ssize_t __pyx_t_19;
-  Py_ssize_t __pyx_t_20;
-  Py_ssize_t __pyx_t_21;
-  Py_ssize_t __pyx_t_22;
-  Py_ssize_t __pyx_t_23;
-  Py_ssize_t __pyx_t_24;
-  Py_ssize_t __pyx_t_25;
-  Py_ssize_t __pyx_t_26;
-  Py_ssize_t __pyx_t_27;
-  Py_ssize_t __pyx_t_28;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *(*__pyx_t_7)(PyObject *);
   __Pyx_RefNannySetupContext("pdfGaussMix1D", 0);
-  __pyx_pybuffer_norms.pybuffer.buf = NULL;
-  __pyx_pybuffer_norms.refcount = 0;
-  __pyx_pybuffernd_norms.data = NULL;
-  __pyx_pybuffernd_norms.rcbuffer = &__pyx_pybuffer_norms;
-  __pyx_pybuffer_integrand.pybuffer.buf = NULL;
-  __pyx_pybuffer_integrand.refcount = 0;
-  __pyx_pybuffernd_integrand.data = NULL;
-  __pyx_pybuffernd_integrand.rcbuffer = &__pyx_pybuffer_integrand;
   __pyx_pybuffer_delta_mls.pybuffer.buf = NULL;
   __pyx_pybuffer_delta_mls.refcount = 0;
   __pyx_pybuffernd_delta_mls.data = NULL;
@@ -4694,565 +7453,228 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_14pdfGaussMix1D(C
   __pyx_pybuffernd_tau2.rcbuffer = &__pyx_pybuffer_tau2;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_delta_mls.rcbuffer->pybuffer, (PyObject*)__pyx_v_delta_mls, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 286, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_delta_mls.rcbuffer->pybuffer, (PyObject*)__pyx_v_delta_mls, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 445, __pyx_L1_error)
   }
   __pyx_pybuffernd_delta_mls.diminfo[0].strides = __pyx_pybuffernd_delta_mls.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_delta_mls.diminfo[0].shape = __pyx_pybuffernd_delta_mls.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_delta_mls.diminfo[1].strides = __pyx_pybuffernd_delta_mls.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_delta_mls.diminfo[1].shape = __pyx_pybuffernd_delta_mls.rcbuffer->pybuffer.shape[1];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_delta_masses.rcbuffer->pybuffer, (PyObject*)__pyx_v_delta_masses, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 286, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_delta_masses.rcbuffer->pybuffer, (PyObject*)__pyx_v_delta_masses, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 445, __pyx_L1_error)
   }
   __pyx_pybuffernd_delta_masses.diminfo[0].strides = __pyx_pybuffernd_delta_masses.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_delta_masses.diminfo[0].shape = __pyx_pybuffernd_delta_masses.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_delta_masses.diminfo[1].strides = __pyx_pybuffernd_delta_masses.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_delta_masses.diminfo[1].shape = __pyx_pybuffernd_delta_masses.rcbuffer->pybuffer.shape[1];
   {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_pdfs.rcbuffer->pybuffer, (PyObject*)__pyx_v_pdfs, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 286, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_pdfs.diminfo[0].strides = __pyx_pybuffernd_pdfs.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_pdfs.diminfo[0].shape = __pyx_pybuffernd_pdfs.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_pdfs.diminfo[1].strides = __pyx_pybuffernd_pdfs.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_pdfs.diminfo[1].shape = __pyx_pybuffernd_pdfs.rcbuffer->pybuffer.shape[1];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_pis.rcbuffer->pybuffer, (PyObject*)__pyx_v_pis, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 286, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_pis.diminfo[0].strides = __pyx_pybuffernd_pis.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_pis.diminfo[0].shape = __pyx_pybuffernd_pis.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_mus.rcbuffer->pybuffer, (PyObject*)__pyx_v_mus, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 286, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_mus.diminfo[0].strides = __pyx_pybuffernd_mus.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_mus.diminfo[0].shape = __pyx_pybuffernd_mus.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_tau2.rcbuffer->pybuffer, (PyObject*)__pyx_v_tau2, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 286, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_tau2.diminfo[0].strides = __pyx_pybuffernd_tau2.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_tau2.diminfo[0].shape = __pyx_pybuffernd_tau2.rcbuffer->pybuffer.shape[0];
-
-  /* "nfwfitter/deconvolvedlognormtools.pyx":296
- * 
- *     cdef Py_ssize_t i, j, nclusters, ngauss, nmasses
- *     nclusters = pdfs.shape[0]             # <<<<<<<<<<<<<<
- *     ngauss = pis.shape[0]
- *     nmasses = delta_mls.shape[1]
- */
-  __pyx_v_nclusters = (__pyx_v_pdfs->dimensions[0]);
-
-  /* "nfwfitter/deconvolvedlognormtools.pyx":297
- *     cdef Py_ssize_t i, j, nclusters, ngauss, nmasses
- *     nclusters = pdfs.shape[0]
- *     ngauss = pis.shape[0]             # <<<<<<<<<<<<<<
- *     nmasses = delta_mls.shape[1]
- * 
- */
-  __pyx_v_ngauss = (__pyx_v_pis->dimensions[0]);
-
-  /* "nfwfitter/deconvolvedlognormtools.pyx":298
- *     nclusters = pdfs.shape[0]
- *     ngauss = pis.shape[0]
- *     nmasses = delta_mls.shape[1]             # <<<<<<<<<<<<<<
- * 
- *     ### build intrinsic pdf
- */
-  __pyx_v_nmasses = (__pyx_v_delta_mls->dimensions[1]);
-
-  /* "nfwfitter/deconvolvedlognormtools.pyx":303
- * 
- *     #normalization
- *     cdef np.ndarray[np.double_t, ndim=1, mode='c'] norms = np.zeros(ngauss)             # <<<<<<<<<<<<<<
- *     cdef double zeroboundrenorm
- *     cdef double tau
- */
-  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 303, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_zeros); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 303, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_ngauss); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 303, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = NULL;
-  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-    if (likely(__pyx_t_4)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_4);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_3, function);
-    }
-  }
-  if (!__pyx_t_4) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 303, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_GOTREF(__pyx_t_1);
-  } else {
-    #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_3)) {
-      PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_2};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 303, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    } else
-    #endif
-    #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
-      PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_2};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 303, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    } else
-    #endif
-    {
-      __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 303, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4); __pyx_t_4 = NULL;
-      __Pyx_GIVEREF(__pyx_t_2);
-      PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_t_2);
-      __pyx_t_2 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 303, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    }
-  }
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 303, __pyx_L1_error)
-  __pyx_t_6 = ((PyArrayObject *)__pyx_t_1);
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_norms.rcbuffer->pybuffer, (PyObject*)__pyx_t_6, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
-      __pyx_v_norms = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_norms.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 303, __pyx_L1_error)
-    } else {__pyx_pybuffernd_norms.diminfo[0].strides = __pyx_pybuffernd_norms.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_norms.diminfo[0].shape = __pyx_pybuffernd_norms.rcbuffer->pybuffer.shape[0];
-    }
-  }
-  __pyx_t_6 = 0;
-  __pyx_v_norms = ((PyArrayObject *)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "nfwfitter/deconvolvedlognormtools.pyx":306
- *     cdef double zeroboundrenorm
- *     cdef double tau
- *     for j from ngauss > j >= 0:             # <<<<<<<<<<<<<<
- *         tau = sqrt(tau2[j])
- *         zeroboundrenorm = 1. - scipy.stats.norm.cdf(-mus[j]/tau)
- */
-  for (__pyx_v_j = __pyx_v_ngauss-1; __pyx_v_j >= 0; __pyx_v_j--) {
-
-    /* "nfwfitter/deconvolvedlognormtools.pyx":307
- *     cdef double tau
- *     for j from ngauss > j >= 0:
- *         tau = sqrt(tau2[j])             # <<<<<<<<<<<<<<
- *         zeroboundrenorm = 1. - scipy.stats.norm.cdf(-mus[j]/tau)
- *         if zeroboundrenorm < 1e-4:  #avoid divide by 0 by making it zero probability
- */
-    __pyx_t_7 = __pyx_v_j;
-    __pyx_v_tau = sqrt((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_tau2.rcbuffer->pybuffer.buf, __pyx_t_7, __pyx_pybuffernd_tau2.diminfo[0].strides)));
-
-    /* "nfwfitter/deconvolvedlognormtools.pyx":308
- *     for j from ngauss > j >= 0:
- *         tau = sqrt(tau2[j])
- *         zeroboundrenorm = 1. - scipy.stats.norm.cdf(-mus[j]/tau)             # <<<<<<<<<<<<<<
- *         if zeroboundrenorm < 1e-4:  #avoid divide by 0 by making it zero probability
- *             return -np.inf
- */
-    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_scipy); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 308, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_stats); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 308, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_norm); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 308, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_cdf); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 308, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_8 = __pyx_v_j;
-    __pyx_t_9 = (-(*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_mus.rcbuffer->pybuffer.buf, __pyx_t_8, __pyx_pybuffernd_mus.diminfo[0].strides)));
-    if (unlikely(__pyx_v_tau == 0)) {
-      PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 308, __pyx_L1_error)
-    }
-    __pyx_t_3 = PyFloat_FromDouble((__pyx_t_9 / __pyx_v_tau)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 308, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_2 = NULL;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
-      __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_5);
-      if (likely(__pyx_t_2)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-        __Pyx_INCREF(__pyx_t_2);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_5, function);
-      }
-    }
-    if (!__pyx_t_2) {
-      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 308, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-    } else {
-      #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_5)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_2, __pyx_t_3};
-        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 308, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      } else
-      #endif
-      #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_2, __pyx_t_3};
-        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 308, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      } else
-      #endif
-      {
-        __pyx_t_4 = PyTuple_New(1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 308, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        __Pyx_GIVEREF(__pyx_t_2); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2); __pyx_t_2 = NULL;
-        __Pyx_GIVEREF(__pyx_t_3);
-        PyTuple_SET_ITEM(__pyx_t_4, 0+1, __pyx_t_3);
-        __pyx_t_3 = 0;
-        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 308, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      }
-    }
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_5 = __Pyx_PyFloat_SubtractCObj(__pyx_float_1_, __pyx_t_1, 1., 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 308, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_10 = __pyx_PyFloat_AsDouble(__pyx_t_5); if (unlikely((__pyx_t_10 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 308, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_v_zeroboundrenorm = __pyx_t_10;
-
-    /* "nfwfitter/deconvolvedlognormtools.pyx":309
- *         tau = sqrt(tau2[j])
- *         zeroboundrenorm = 1. - scipy.stats.norm.cdf(-mus[j]/tau)
- *         if zeroboundrenorm < 1e-4:  #avoid divide by 0 by making it zero probability             # <<<<<<<<<<<<<<
- *             return -np.inf
- *         norms[j] = 1./(zeroboundrenorm*sqrt2pi*tau)   #truncate at 0, boost normalization
- */
-    __pyx_t_11 = ((__pyx_v_zeroboundrenorm < 1e-4) != 0);
-    if (__pyx_t_11) {
-
-      /* "nfwfitter/deconvolvedlognormtools.pyx":310
- *         zeroboundrenorm = 1. - scipy.stats.norm.cdf(-mus[j]/tau)
- *         if zeroboundrenorm < 1e-4:  #avoid divide by 0 by making it zero probability
- *             return -np.inf             # <<<<<<<<<<<<<<
- *         norms[j] = 1./(zeroboundrenorm*sqrt2pi*tau)   #truncate at 0, boost normalization
- * 
- */
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 310, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_inf); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 310, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __pyx_t_5 = PyNumber_Negative(__pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 310, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_r = __pyx_t_5;
-      __pyx_t_5 = 0;
-      goto __pyx_L0;
-
-      /* "nfwfitter/deconvolvedlognormtools.pyx":309
- *         tau = sqrt(tau2[j])
- *         zeroboundrenorm = 1. - scipy.stats.norm.cdf(-mus[j]/tau)
- *         if zeroboundrenorm < 1e-4:  #avoid divide by 0 by making it zero probability             # <<<<<<<<<<<<<<
- *             return -np.inf
- *         norms[j] = 1./(zeroboundrenorm*sqrt2pi*tau)   #truncate at 0, boost normalization
- */
-    }
-
-    /* "nfwfitter/deconvolvedlognormtools.pyx":311
- *         if zeroboundrenorm < 1e-4:  #avoid divide by 0 by making it zero probability
- *             return -np.inf
- *         norms[j] = 1./(zeroboundrenorm*sqrt2pi*tau)   #truncate at 0, boost normalization             # <<<<<<<<<<<<<<
- * 
- * 
- */
-    __pyx_t_5 = PyFloat_FromDouble(__pyx_v_zeroboundrenorm); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 311, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_sqrt2pi); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 311, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = PyNumber_Multiply(__pyx_t_5, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 311, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = PyFloat_FromDouble(__pyx_v_tau); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 311, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_5 = PyNumber_Multiply(__pyx_t_4, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 311, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_PyFloat_DivideCObj(__pyx_float_1_, __pyx_t_5, 1., 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 311, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_9 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_9 == ((npy_double)-1)) && PyErr_Occurred())) __PYX_ERR(0, 311, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_12 = __pyx_v_j;
-    *__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_norms.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_norms.diminfo[0].strides) = __pyx_t_9;
-  }
-
-  /* "nfwfitter/deconvolvedlognormtools.pyx":327
- *     ### convolve with pdfs
- * 
- *     cdef double sumlogprob = 0.             # <<<<<<<<<<<<<<
- *     cdef double deltamass_mu2, gausseval
- *     cdef np.ndarray[np.double_t, ndim=1, mode='c'] integrand = np.zeros(nmasses)
- */
-  __pyx_v_sumlogprob = 0.;
-
-  /* "nfwfitter/deconvolvedlognormtools.pyx":329
- *     cdef double sumlogprob = 0.
- *     cdef double deltamass_mu2, gausseval
- *     cdef np.ndarray[np.double_t, ndim=1, mode='c'] integrand = np.zeros(nmasses)             # <<<<<<<<<<<<<<
- * 
- *     for i from nclusters > i >= 0:
- */
-  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 329, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_zeros); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 329, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = PyInt_FromSsize_t(__pyx_v_nmasses); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 329, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_3 = NULL;
-  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
-    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_4);
-    if (likely(__pyx_t_3)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
-      __Pyx_INCREF(__pyx_t_3);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_4, function);
-    }
-  }
-  if (!__pyx_t_3) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 329, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_GOTREF(__pyx_t_1);
-  } else {
-    #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_4)) {
-      PyObject *__pyx_temp[2] = {__pyx_t_3, __pyx_t_5};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 329, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    } else
-    #endif
-    #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
-      PyObject *__pyx_temp[2] = {__pyx_t_3, __pyx_t_5};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 329, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    } else
-    #endif
-    {
-      __pyx_t_2 = PyTuple_New(1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 329, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_3); __pyx_t_3 = NULL;
-      __Pyx_GIVEREF(__pyx_t_5);
-      PyTuple_SET_ITEM(__pyx_t_2, 0+1, __pyx_t_5);
-      __pyx_t_5 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 329, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    }
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_pdfs.rcbuffer->pybuffer, (PyObject*)__pyx_v_pdfs, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 445, __pyx_L1_error)
   }
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 329, __pyx_L1_error)
-  __pyx_t_13 = ((PyArrayObject *)__pyx_t_1);
+  __pyx_pybuffernd_pdfs.diminfo[0].strides = __pyx_pybuffernd_pdfs.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_pdfs.diminfo[0].shape = __pyx_pybuffernd_pdfs.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_pdfs.diminfo[1].strides = __pyx_pybuffernd_pdfs.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_pdfs.diminfo[1].shape = __pyx_pybuffernd_pdfs.rcbuffer->pybuffer.shape[1];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_integrand.rcbuffer->pybuffer, (PyObject*)__pyx_t_13, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
-      __pyx_v_integrand = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_integrand.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 329, __pyx_L1_error)
-    } else {__pyx_pybuffernd_integrand.diminfo[0].strides = __pyx_pybuffernd_integrand.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_integrand.diminfo[0].shape = __pyx_pybuffernd_integrand.rcbuffer->pybuffer.shape[0];
-    }
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_pis.rcbuffer->pybuffer, (PyObject*)__pyx_v_pis, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 445, __pyx_L1_error)
   }
-  __pyx_t_13 = 0;
-  __pyx_v_integrand = ((PyArrayObject *)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "nfwfitter/deconvolvedlognormtools.pyx":331
- *     cdef np.ndarray[np.double_t, ndim=1, mode='c'] integrand = np.zeros(nmasses)
- * 
- *     for i from nclusters > i >= 0:             # <<<<<<<<<<<<<<
- * 
- *         for j from nmasses > j >= 0:
- */
-  for (__pyx_v_i = __pyx_v_nclusters-1; __pyx_v_i >= 0; __pyx_v_i--) {
-
-    /* "nfwfitter/deconvolvedlognormtools.pyx":333
- *     for i from nclusters > i >= 0:
- * 
- *         for j from nmasses > j >= 0:             # <<<<<<<<<<<<<<
- *             integrand[j] = 0.
- * 
- */
-    for (__pyx_v_j = __pyx_v_nmasses-1; __pyx_v_j >= 0; __pyx_v_j--) {
+  __pyx_pybuffernd_pis.diminfo[0].strides = __pyx_pybuffernd_pis.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_pis.diminfo[0].shape = __pyx_pybuffernd_pis.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_mus.rcbuffer->pybuffer, (PyObject*)__pyx_v_mus, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 445, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_mus.diminfo[0].strides = __pyx_pybuffernd_mus.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_mus.diminfo[0].shape = __pyx_pybuffernd_mus.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_tau2.rcbuffer->pybuffer, (PyObject*)__pyx_v_tau2, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 445, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_tau2.diminfo[0].strides = __pyx_pybuffernd_tau2.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_tau2.diminfo[0].shape = __pyx_pybuffernd_tau2.rcbuffer->pybuffer.shape[0];
 
-      /* "nfwfitter/deconvolvedlognormtools.pyx":334
+  /* "deconvolvedlognormtools.pyx":454
+ *     use precomputeGaussMix1D once and pdfGaussMix1D_cached.'''
  * 
- *         for j from nmasses > j >= 0:
- *             integrand[j] = 0.             # <<<<<<<<<<<<<<
+ *     evalpoints, evalindex, weightedpdfs = precomputeGaussMix1D(delta_mls, delta_masses, pdfs)             # <<<<<<<<<<<<<<
  * 
- *         for j from nmasses > j >= 0:
+ *     return pdfGaussMix1D_cached(evalpoints, evalindex, weightedpdfs, pis, mus, tau2)
  */
-      __pyx_t_14 = __pyx_v_j;
-      *__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_integrand.rcbuffer->pybuffer.buf, __pyx_t_14, __pyx_pybuffernd_integrand.diminfo[0].strides) = 0.;
+  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_precomputeGaussMix1D); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 454, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = NULL;
+  __pyx_t_4 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_4 = 1;
     }
-
-    /* "nfwfitter/deconvolvedlognormtools.pyx":336
- *             integrand[j] = 0.
- * 
- *         for j from nmasses > j >= 0:             # <<<<<<<<<<<<<<
- * 
- *             for k from ngauss > k >= 0:
- */
-    for (__pyx_v_j = __pyx_v_nmasses-1; __pyx_v_j >= 0; __pyx_v_j--) {
-
-      /* "nfwfitter/deconvolvedlognormtools.pyx":338
- *         for j from nmasses > j >= 0:
- * 
- *             for k from ngauss > k >= 0:             # <<<<<<<<<<<<<<
- * 
- *                 deltamass_mu2 = (delta_mls[i,j] - mus[k])**2
- */
-      for (__pyx_v_k = __pyx_v_ngauss-1; __pyx_v_k >= 0; __pyx_v_k--) {
-
-        /* "nfwfitter/deconvolvedlognormtools.pyx":340
- *             for k from ngauss > k >= 0:
- * 
- *                 deltamass_mu2 = (delta_mls[i,j] - mus[k])**2             # <<<<<<<<<<<<<<
- *                 gausseval = pis[k]*exp(-0.5*deltamass_mu2/tau2[k])*norms[k]
- *                 integrand[j] += gausseval
- */
-        __pyx_t_15 = __pyx_v_i;
-        __pyx_t_16 = __pyx_v_j;
-        __pyx_t_17 = __pyx_v_k;
-        __pyx_v_deltamass_mu2 = pow(((*__Pyx_BufPtrCContig2d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_delta_mls.rcbuffer->pybuffer.buf, __pyx_t_15, __pyx_pybuffernd_delta_mls.diminfo[0].strides, __pyx_t_16, __pyx_pybuffernd_delta_mls.diminfo[1].strides)) - (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_mus.rcbuffer->pybuffer.buf, __pyx_t_17, __pyx_pybuffernd_mus.diminfo[0].strides))), 2.0);
-
-        /* "nfwfitter/deconvolvedlognormtools.pyx":341
- * 
- *                 deltamass_mu2 = (delta_mls[i,j] - mus[k])**2
- *                 gausseval = pis[k]*exp(-0.5*deltamass_mu2/tau2[k])*norms[k]             # <<<<<<<<<<<<<<
- *                 integrand[j] += gausseval
- * 
- */
-        __pyx_t_18 = __pyx_v_k;
-        __pyx_t_10 = (-0.5 * __pyx_v_deltamass_mu2);
-        __pyx_t_19 = __pyx_v_k;
-        __pyx_t_9 = (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_tau2.rcbuffer->pybuffer.buf, __pyx_t_19, __pyx_pybuffernd_tau2.diminfo[0].strides));
-        if (unlikely(__pyx_t_9 == 0)) {
-          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-          __PYX_ERR(0, 341, __pyx_L1_error)
-        }
-        __pyx_t_20 = __pyx_v_k;
-        __pyx_v_gausseval = (((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_pis.rcbuffer->pybuffer.buf, __pyx_t_18, __pyx_pybuffernd_pis.diminfo[0].strides)) * exp((__pyx_t_10 / __pyx_t_9))) * (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_norms.rcbuffer->pybuffer.buf, __pyx_t_20, __pyx_pybuffernd_norms.diminfo[0].strides)));
-
-        /* "nfwfitter/deconvolvedlognormtools.pyx":342
- *                 deltamass_mu2 = (delta_mls[i,j] - mus[k])**2
- *                 gausseval = pis[k]*exp(-0.5*deltamass_mu2/tau2[k])*norms[k]
- *                 integrand[j] += gausseval             # <<<<<<<<<<<<<<
- * 
- *             integrand[j] *= pdfs[i,j]
- */
-        __pyx_t_21 = __pyx_v_j;
-        *__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_integrand.rcbuffer->pybuffer.buf, __pyx_t_21, __pyx_pybuffernd_integrand.diminfo[0].strides) += __pyx_v_gausseval;
-      }
-
-      /* "nfwfitter/deconvolvedlognormtools.pyx":344
- *                 integrand[j] += gausseval
- * 
- *             integrand[j] *= pdfs[i,j]             # <<<<<<<<<<<<<<
- * 
- *         #trapezoid rule
- */
-      __pyx_t_22 = __pyx_v_i;
-      __pyx_t_23 = __pyx_v_j;
-      __pyx_t_24 = __pyx_v_j;
-      *__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_integrand.rcbuffer->pybuffer.buf, __pyx_t_24, __pyx_pybuffernd_integrand.diminfo[0].strides) *= (*__Pyx_BufPtrCContig2d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_pdfs.rcbuffer->pybuffer.buf, __pyx_t_22, __pyx_pybuffernd_pdfs.diminfo[0].strides, __pyx_t_23, __pyx_pybuffernd_pdfs.diminfo[1].strides));
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[4] = {__pyx_t_3, ((PyObject *)__pyx_v_delta_mls), ((PyObject *)__pyx_v_delta_masses), ((PyObject *)__pyx_v_pdfs)};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 3+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 454, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[4] = {__pyx_t_3, ((PyObject *)__pyx_v_delta_mls), ((PyObject *)__pyx_v_delta_masses), ((PyObject *)__pyx_v_pdfs)};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 3+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 454, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else
+  #endif
+  {
+    __pyx_t_5 = PyTuple_New(3+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 454, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (__pyx_t_3) {
+      __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3); __pyx_t_3 = NULL;
+    }
+    __Pyx_INCREF(((PyObject *)__pyx_v_delta_mls));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_delta_mls));
+    PyTuple_SET_ITEM(__pyx_t_5, 0+__pyx_t_4, ((PyObject *)__pyx_v_delta_mls));
+    __Pyx_INCREF(((PyObject *)__pyx_v_delta_masses));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_delta_masses));
+    PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_4, ((PyObject *)__pyx_v_delta_masses));
+    __Pyx_INCREF(((PyObject *)__pyx_v_pdfs));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_pdfs));
+    PyTuple_SET_ITEM(__pyx_t_5, 2+__pyx_t_4, ((PyObject *)__pyx_v_pdfs));
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 454, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if ((likely(PyTuple_CheckExact(__pyx_t_1))) || (PyList_CheckExact(__pyx_t_1))) {
+    PyObject* sequence = __pyx_t_1;
+    #if !CYTHON_COMPILING_IN_PYPY
+    Py_ssize_t size = Py_SIZE(sequence);
+    #else
+    Py_ssize_t size = PySequence_Size(sequence);
+    #endif
+    if (unlikely(size != 3)) {
+      if (size > 3) __Pyx_RaiseTooManyValuesError(3);
+      else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+      __PYX_ERR(0, 454, __pyx_L1_error)
     }
-
-    /* "nfwfitter/deconvolvedlognormtools.pyx":347
- * 
- *         #trapezoid rule
- *         prob = 0.             # <<<<<<<<<<<<<<
- *         for j from nmasses-1 > j >= 0:
- *             prob += delta_masses[i,j]*(integrand[j+1] + integrand[j])
- */
-    __Pyx_INCREF(__pyx_float_0_);
-    __Pyx_XDECREF_SET(__pyx_v_prob, __pyx_float_0_);
-
-    /* "nfwfitter/deconvolvedlognormtools.pyx":348
- *         #trapezoid rule
- *         prob = 0.
- *         for j from nmasses-1 > j >= 0:             # <<<<<<<<<<<<<<
- *             prob += delta_masses[i,j]*(integrand[j+1] + integrand[j])
- *         prob *= 0.5
- */
-    for (__pyx_v_j = (__pyx_v_nmasses - 1)-1; __pyx_v_j >= 0; __pyx_v_j--) {
-
-      /* "nfwfitter/deconvolvedlognormtools.pyx":349
- *         prob = 0.
- *         for j from nmasses-1 > j >= 0:
- *             prob += delta_masses[i,j]*(integrand[j+1] + integrand[j])             # <<<<<<<<<<<<<<
- *         prob *= 0.5
- * 
- */
-      __pyx_t_25 = __pyx_v_i;
-      __pyx_t_26 = __pyx_v_j;
-      __pyx_t_27 = (__pyx_v_j + 1);
-      __pyx_t_28 = __pyx_v_j;
-      __pyx_t_1 = PyFloat_FromDouble(((*__Pyx_BufPtrCContig2d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_delta_masses.rcbuffer->pybuffer.buf, __pyx_t_25, __pyx_pybuffernd_delta_masses.diminfo[0].strides, __pyx_t_26, __pyx_pybuffernd_delta_masses.diminfo[1].strides)) * ((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_integrand.rcbuffer->pybuffer.buf, __pyx_t_27, __pyx_pybuffernd_integrand.diminfo[0].strides)) + (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_integrand.rcbuffer->pybuffer.buf, __pyx_t_28, __pyx_pybuffernd_integrand.diminfo[0].strides))))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 349, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_4 = PyNumber_InPlaceAdd(__pyx_v_prob, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 349, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF_SET(__pyx_v_prob, __pyx_t_4);
-      __pyx_t_4 = 0;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    if (likely(PyTuple_CheckExact(sequence))) {
+      __pyx_t_2 = PyTuple_GET_ITEM(sequence, 0); 
+      __pyx_t_5 = PyTuple_GET_ITEM(sequence, 1); 
+      __pyx_t_3 = PyTuple_GET_ITEM(sequence, 2); 
+    } else {
+      __pyx_t_2 = PyList_GET_ITEM(sequence, 0); 
+      __pyx_t_5 = PyList_GET_ITEM(sequence, 1); 
+      __pyx_t_3 = PyList_GET_ITEM(sequence, 2); 
     }
-
-    /* "nfwfitter/deconvolvedlognormtools.pyx":350
- *         for j from nmasses-1 > j >= 0:
- *             prob += delta_masses[i,j]*(integrand[j+1] + integrand[j])
- *         prob *= 0.5             # <<<<<<<<<<<<<<
- * 
- *         sumlogprob += log(prob)
- */
-    __pyx_t_4 = PyNumber_InPlaceMultiply(__pyx_v_prob, __pyx_float_0_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 350, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF_SET(__pyx_v_prob, __pyx_t_4);
-    __pyx_t_4 = 0;
-
-    /* "nfwfitter/deconvolvedlognormtools.pyx":352
- *         prob *= 0.5
- * 
- *         sumlogprob += log(prob)             # <<<<<<<<<<<<<<
- * 
- *     return sumlogprob
- */
-    __pyx_t_10 = __pyx_PyFloat_AsDouble(__pyx_v_prob); if (unlikely((__pyx_t_10 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 352, __pyx_L1_error)
-    __pyx_v_sumlogprob = (__pyx_v_sumlogprob + log(__pyx_t_10));
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_t_5);
+    __Pyx_INCREF(__pyx_t_3);
+    #else
+    __pyx_t_2 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 454, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_5 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 454, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 454, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    #endif
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  } else {
+    Py_ssize_t index = -1;
+    __pyx_t_6 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 454, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_7 = Py_TYPE(__pyx_t_6)->tp_iternext;
+    index = 0; __pyx_t_2 = __pyx_t_7(__pyx_t_6); if (unlikely(!__pyx_t_2)) goto __pyx_L3_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_2);
+    index = 1; __pyx_t_5 = __pyx_t_7(__pyx_t_6); if (unlikely(!__pyx_t_5)) goto __pyx_L3_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_5);
+    index = 2; __pyx_t_3 = __pyx_t_7(__pyx_t_6); if (unlikely(!__pyx_t_3)) goto __pyx_L3_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_3);
+    if (__Pyx_IternextUnpackEndCheck(__pyx_t_7(__pyx_t_6), 3) < 0) __PYX_ERR(0, 454, __pyx_L1_error)
+    __pyx_t_7 = NULL;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    goto __pyx_L4_unpacking_done;
+    __pyx_L3_unpacking_failed:;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_7 = NULL;
+    if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+    __PYX_ERR(0, 454, __pyx_L1_error)
+    __pyx_L4_unpacking_done:;
   }
+  __pyx_v_evalpoints = __pyx_t_2;
+  __pyx_t_2 = 0;
+  __pyx_v_evalindex = __pyx_t_5;
+  __pyx_t_5 = 0;
+  __pyx_v_weightedpdfs = __pyx_t_3;
+  __pyx_t_3 = 0;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":354
- *         sumlogprob += log(prob)
- * 
- *     return sumlogprob             # <<<<<<<<<<<<<<
+  /* "deconvolvedlognormtools.pyx":456
+ *     evalpoints, evalindex, weightedpdfs = precomputeGaussMix1D(delta_mls, delta_masses, pdfs)
  * 
+ *     return pdfGaussMix1D_cached(evalpoints, evalindex, weightedpdfs, pis, mus, tau2)             # <<<<<<<<<<<<<<
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_sumlogprob); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 354, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_r = __pyx_t_4;
+  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_pdfGaussMix1D_cached); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 456, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = NULL;
   __pyx_t_4 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_4 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[7] = {__pyx_t_5, __pyx_v_evalpoints, __pyx_v_evalindex, __pyx_v_weightedpdfs, ((PyObject *)__pyx_v_pis), ((PyObject *)__pyx_v_mus), ((PyObject *)__pyx_v_tau2)};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_4, 6+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 456, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[7] = {__pyx_t_5, __pyx_v_evalpoints, __pyx_v_evalindex, __pyx_v_weightedpdfs, ((PyObject *)__pyx_v_pis), ((PyObject *)__pyx_v_mus), ((PyObject *)__pyx_v_tau2)};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_4, 6+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 456, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else
+  #endif
+  {
+    __pyx_t_2 = PyTuple_New(6+__pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 456, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    if (__pyx_t_5) {
+      __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_5); __pyx_t_5 = NULL;
+    }
+    __Pyx_INCREF(__pyx_v_evalpoints);
+    __Pyx_GIVEREF(__pyx_v_evalpoints);
+    PyTuple_SET_ITEM(__pyx_t_2, 0+__pyx_t_4, __pyx_v_evalpoints);
+    __Pyx_INCREF(__pyx_v_evalindex);
+    __Pyx_GIVEREF(__pyx_v_evalindex);
+    PyTuple_SET_ITEM(__pyx_t_2, 1+__pyx_t_4, __pyx_v_evalindex);
+    __Pyx_INCREF(__pyx_v_weightedpdfs);
+    __Pyx_GIVEREF(__pyx_v_weightedpdfs);
+    PyTuple_SET_ITEM(__pyx_t_2, 2+__pyx_t_4, __pyx_v_weightedpdfs);
+    __Pyx_INCREF(((PyObject *)__pyx_v_pis));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_pis));
+    PyTuple_SET_ITEM(__pyx_t_2, 3+__pyx_t_4, ((PyObject *)__pyx_v_pis));
+    __Pyx_INCREF(((PyObject *)__pyx_v_mus));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_mus));
+    PyTuple_SET_ITEM(__pyx_t_2, 4+__pyx_t_4, ((PyObject *)__pyx_v_mus));
+    __Pyx_INCREF(((PyObject *)__pyx_v_tau2));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_tau2));
+    PyTuple_SET_ITEM(__pyx_t_2, 5+__pyx_t_4, ((PyObject *)__pyx_v_tau2));
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 456, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":286
- * @cython.boundscheck(False)
- * @cython.wraparound(False)
+  /* "deconvolvedlognormtools.pyx":445
+ * ###
+ * 
  * def pdfGaussMix1D(np.ndarray[np.double_t, ndim=2, mode='c'] delta_mls,             # <<<<<<<<<<<<<<
  *                   np.ndarray[np.double_t, ndim=2, mode='c'] delta_masses,
  *                   np.ndarray[np.double_t, ndim=2, mode='c'] pdfs,
@@ -5263,37 +7685,33 @@ static PyObject *__pyx_pf_9nfwfitter_23deconvolvedlognormtools_14pdfGaussMix1D(C
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
   { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
     __Pyx_PyThreadState_declare
     __Pyx_PyThreadState_assign
     __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_masses.rcbuffer->pybuffer);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_mls.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_integrand.rcbuffer->pybuffer);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_mus.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_norms.rcbuffer->pybuffer);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_pdfs.rcbuffer->pybuffer);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_pis.rcbuffer->pybuffer);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_tau2.rcbuffer->pybuffer);
   __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("nfwfitter.deconvolvedlognormtools.pdfGaussMix1D", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("deconvolvedlognormtools.pdfGaussMix1D", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   goto __pyx_L2;
   __pyx_L0:;
   __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_masses.rcbuffer->pybuffer);
   __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_delta_mls.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_integrand.rcbuffer->pybuffer);
   __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_mus.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_norms.rcbuffer->pybuffer);
   __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_pdfs.rcbuffer->pybuffer);
   __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_pis.rcbuffer->pybuffer);
   __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_tau2.rcbuffer->pybuffer);
   __pyx_L2:;
-  __Pyx_XDECREF((PyObject *)__pyx_v_norms);
-  __Pyx_XDECREF((PyObject *)__pyx_v_integrand);
-  __Pyx_XDECREF(__pyx_v_prob);
+  __Pyx_XDECREF(__pyx_v_evalpoints);
+  __Pyx_XDECREF(__pyx_v_evalindex);
+  __Pyx_XDECREF(__pyx_v_weightedpdfs);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
@@ -5468,7 +7886,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 218, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__23, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 218, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -5524,7 +7942,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  * 
  *             info.buf = PyArray_DATA(self)
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 222, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__24, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 222, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -5833,7 +8251,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 259, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__25, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 259, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -6648,7 +9066,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  * 
  *         if ((child.byteorder == c'>' and little_endian) or
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 799, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__26, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 799, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -6716,7 +9134,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  *             # One could encode it in the format string and have Cython
  *             # complain instead, BUT: < and > in format strings also imply
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 803, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__27, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 803, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -6825,7 +9243,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  * 
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  */
-        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__14, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 823, __pyx_L1_error)
+        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__28, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 823, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
         __Pyx_Raise(__pyx_t_4, 0, 0, 0);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -7506,7 +9924,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
  * 
  * cdef inline int import_umath() except -1:
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__15, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 989, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__29, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 989, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
@@ -7637,7 +10055,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
  * 
  * cdef inline int import_ufunc() except -1:
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__16, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 995, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__30, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 995, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
@@ -7765,7 +10183,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
  *     except Exception:
  *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__17, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 1001, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__31, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 1001, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
@@ -7843,20 +10261,33 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_RuntimeError, __pyx_k_RuntimeError, sizeof(__pyx_k_RuntimeError), 0, 0, 1, 1},
   {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
   {&__pyx_n_s_altintegral, __pyx_k_altintegral, sizeof(__pyx_k_altintegral), 0, 0, 1, 1},
-  {&__pyx_n_s_cdf, __pyx_k_cdf, sizeof(__pyx_k_cdf), 0, 0, 1, 1},
+  {&__pyx_n_s_amplitudes, __pyx_k_amplitudes, sizeof(__pyx_k_amplitudes), 0, 0, 1, 1},
+  {&__pyx_n_s_any, __pyx_k_any, sizeof(__pyx_k_any), 0, 0, 1, 1},
+  {&__pyx_n_s_ascontiguousarray, __pyx_k_ascontiguousarray, sizeof(__pyx_k_ascontiguousarray), 0, 0, 1, 1},
+  {&__pyx_n_s_checkPDFShapes, __pyx_k_checkPDFShapes, sizeof(__pyx_k_checkPDFShapes), 0, 0, 1, 1},
+  {&__pyx_n_s_checkSupport, __pyx_k_checkSupport, sizeof(__pyx_k_checkSupport), 0, 0, 1, 1},
+  {&__pyx_n_s_deconvolvedlognormtools, __pyx_k_deconvolvedlognormtools, sizeof(__pyx_k_deconvolvedlognormtools), 0, 0, 1, 1},
   {&__pyx_n_s_delta_logmls, __pyx_k_delta_logmls, sizeof(__pyx_k_delta_logmls), 0, 0, 1, 1},
+  {&__pyx_kp_s_delta_logmls_and_pdfs_have_diffe, __pyx_k_delta_logmls_and_pdfs_have_diffe, sizeof(__pyx_k_delta_logmls_and_pdfs_have_diffe), 0, 0, 1, 0},
+  {&__pyx_kp_s_delta_logmls_has_d_masses_grid_h, __pyx_k_delta_logmls_has_d_masses_grid_h, sizeof(__pyx_k_delta_logmls_has_d_masses_grid_h), 0, 0, 1, 0},
   {&__pyx_n_s_delta_masses, __pyx_k_delta_masses, sizeof(__pyx_k_delta_masses), 0, 0, 1, 1},
   {&__pyx_n_s_delta_mls, __pyx_k_delta_mls, sizeof(__pyx_k_delta_mls), 0, 0, 1, 1},
-  {&__pyx_n_s_deltamass_mu2, __pyx_k_deltamass_mu2, sizeof(__pyx_k_deltamass_mu2), 0, 0, 1, 1},
+  {&__pyx_n_s_deltamass_data, __pyx_k_deltamass_data, sizeof(__pyx_k_deltamass_data), 0, 0, 1, 1},
   {&__pyx_n_s_deltamasses, __pyx_k_deltamasses, sizeof(__pyx_k_deltamasses), 0, 0, 1, 1},
+  {&__pyx_kp_s_deltamasses_needs_at_least_d_ent, __pyx_k_deltamasses_needs_at_least_d_ent, sizeof(__pyx_k_deltamasses_needs_at_least_d_ent), 0, 0, 1, 0},
+  {&__pyx_n_s_dlm_data, __pyx_k_dlm_data, sizeof(__pyx_k_dlm_data), 0, 0, 1, 1},
+  {&__pyx_n_s_dtype, __pyx_k_dtype, sizeof(__pyx_k_dtype), 0, 0, 1, 1},
+  {&__pyx_n_s_dx, __pyx_k_dx, sizeof(__pyx_k_dx), 0, 0, 1, 1},
+  {&__pyx_n_s_evalindex, __pyx_k_evalindex, sizeof(__pyx_k_evalindex), 0, 0, 1, 1},
+  {&__pyx_n_s_evalpoints, __pyx_k_evalpoints, sizeof(__pyx_k_evalpoints), 0, 0, 1, 1},
   {&__pyx_n_s_fracoutliers, __pyx_k_fracoutliers, sizeof(__pyx_k_fracoutliers), 0, 0, 1, 1},
-  {&__pyx_n_s_gausseval, __pyx_k_gausseval, sizeof(__pyx_k_gausseval), 0, 0, 1, 1},
   {&__pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_k_home_avestruz_codes_clmassmod_n, sizeof(__pyx_k_home_avestruz_codes_clmassmod_n), 0, 0, 1, 0},
   {&__pyx_n_s_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 0, 1, 1},
   {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
   {&__pyx_n_s_inf, __pyx_k_inf, sizeof(__pyx_k_inf), 0, 0, 1, 1},
   {&__pyx_n_s_integral, __pyx_k_integral, sizeof(__pyx_k_integral), 0, 0, 1, 1},
-  {&__pyx_n_s_integrand, __pyx_k_integrand, sizeof(__pyx_k_integrand), 0, 0, 1, 1},
+  {&__pyx_n_s_intp, __pyx_k_intp, sizeof(__pyx_k_intp), 0, 0, 1, 1},
+  {&__pyx_n_s_intrinsicpdf, __pyx_k_intrinsicpdf, sizeof(__pyx_k_intrinsicpdf), 0, 0, 1, 1},
   {&__pyx_n_s_j, __pyx_k_j, sizeof(__pyx_k_j), 0, 0, 1, 1},
   {&__pyx_n_s_k, __pyx_k_k, sizeof(__pyx_k_k), 0, 0, 1, 1},
   {&__pyx_n_s_loglinearlike, __pyx_k_loglinearlike, sizeof(__pyx_k_loglinearlike), 0, 0, 1, 1},
@@ -7866,6 +10297,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
   {&__pyx_n_s_mcmcloglinearlike, __pyx_k_mcmcloglinearlike, sizeof(__pyx_k_mcmcloglinearlike), 0, 0, 1, 1},
   {&__pyx_n_s_merr, __pyx_k_merr, sizeof(__pyx_k_merr), 0, 0, 1, 1},
+  {&__pyx_n_s_ml_data, __pyx_k_ml_data, sizeof(__pyx_k_ml_data), 0, 0, 1, 1},
   {&__pyx_n_s_ml_int, __pyx_k_ml_int, sizeof(__pyx_k_ml_int), 0, 0, 1, 1},
   {&__pyx_n_s_ml_ints, __pyx_k_ml_ints, sizeof(__pyx_k_ml_ints), 0, 0, 1, 1},
   {&__pyx_n_s_mlens, __pyx_k_mlens, sizeof(__pyx_k_mlens), 0, 0, 1, 1},
@@ -7875,14 +10307,13 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_u_ndarray_is_not_C_contiguous, __pyx_k_ndarray_is_not_C_contiguous, sizeof(__pyx_k_ndarray_is_not_C_contiguous), 0, 1, 0, 0},
   {&__pyx_kp_u_ndarray_is_not_Fortran_contiguou, __pyx_k_ndarray_is_not_Fortran_contiguou, sizeof(__pyx_k_ndarray_is_not_Fortran_contiguou), 0, 1, 0, 0},
   {&__pyx_n_s_neg2sigma2, __pyx_k_neg2sigma2, sizeof(__pyx_k_neg2sigma2), 0, 0, 1, 1},
-  {&__pyx_n_s_nfwfitter_deconvolvedlognormtool, __pyx_k_nfwfitter_deconvolvedlognormtool, sizeof(__pyx_k_nfwfitter_deconvolvedlognormtool), 0, 0, 1, 1},
+  {&__pyx_n_s_neghalfinvtau2, __pyx_k_neghalfinvtau2, sizeof(__pyx_k_neghalfinvtau2), 0, 0, 1, 1},
   {&__pyx_n_s_ngauss, __pyx_k_ngauss, sizeof(__pyx_k_ngauss), 0, 0, 1, 1},
   {&__pyx_n_s_ngoodsamples, __pyx_k_ngoodsamples, sizeof(__pyx_k_ngoodsamples), 0, 0, 1, 1},
   {&__pyx_n_s_nmasses, __pyx_k_nmasses, sizeof(__pyx_k_nmasses), 0, 0, 1, 1},
-  {&__pyx_n_s_norm, __pyx_k_norm, sizeof(__pyx_k_norm), 0, 0, 1, 1},
   {&__pyx_n_s_normpart, __pyx_k_normpart, sizeof(__pyx_k_normpart), 0, 0, 1, 1},
-  {&__pyx_n_s_norms, __pyx_k_norms, sizeof(__pyx_k_norms), 0, 0, 1, 1},
   {&__pyx_n_s_np, __pyx_k_np, sizeof(__pyx_k_np), 0, 0, 1, 1},
+  {&__pyx_n_s_npoints, __pyx_k_npoints, sizeof(__pyx_k_npoints), 0, 0, 1, 1},
   {&__pyx_n_s_nsamples, __pyx_k_nsamples, sizeof(__pyx_k_nsamples), 0, 0, 1, 1},
   {&__pyx_n_s_numpy, __pyx_k_numpy, sizeof(__pyx_k_numpy), 0, 0, 1, 1},
   {&__pyx_kp_s_numpy_core_multiarray_failed_to, __pyx_k_numpy_core_multiarray_failed_to, sizeof(__pyx_k_numpy_core_multiarray_failed_to), 0, 0, 1, 0},
@@ -7893,36 +10324,53 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_outlierprob, __pyx_k_outlierprob, sizeof(__pyx_k_outlierprob), 0, 0, 1, 1},
   {&__pyx_n_s_pdf, __pyx_k_pdf, sizeof(__pyx_k_pdf), 0, 0, 1, 1},
   {&__pyx_n_s_pdfGaussMix1D, __pyx_k_pdfGaussMix1D, sizeof(__pyx_k_pdfGaussMix1D), 0, 0, 1, 1},
+  {&__pyx_n_s_pdfGaussMix1D_cached, __pyx_k_pdfGaussMix1D_cached, sizeof(__pyx_k_pdfGaussMix1D_cached), 0, 0, 1, 1},
+  {&__pyx_n_s_pdf_data, __pyx_k_pdf_data, sizeof(__pyx_k_pdf_data), 0, 0, 1, 1},
+  {&__pyx_kp_s_pdf_has_d_masses_grid_has_d, __pyx_k_pdf_has_d_masses_grid_has_d, sizeof(__pyx_k_pdf_has_d_masses_grid_has_d), 0, 0, 1, 0},
   {&__pyx_n_s_pdfintegral, __pyx_k_pdfintegral, sizeof(__pyx_k_pdfintegral), 0, 0, 1, 1},
   {&__pyx_n_s_pdfloglinearlike, __pyx_k_pdfloglinearlike, sizeof(__pyx_k_pdfloglinearlike), 0, 0, 1, 1},
   {&__pyx_n_s_pdfs, __pyx_k_pdfs, sizeof(__pyx_k_pdfs), 0, 0, 1, 1},
   {&__pyx_n_s_pi, __pyx_k_pi, sizeof(__pyx_k_pi), 0, 0, 1, 1},
   {&__pyx_n_s_pis, __pyx_k_pis, sizeof(__pyx_k_pis), 0, 0, 1, 1},
+  {&__pyx_n_s_precomputeGaussMix1D, __pyx_k_precomputeGaussMix1D, sizeof(__pyx_k_precomputeGaussMix1D), 0, 0, 1, 1},
   {&__pyx_n_s_prob, __pyx_k_prob, sizeof(__pyx_k_prob), 0, 0, 1, 1},
   {&__pyx_n_s_random, __pyx_k_random, sizeof(__pyx_k_random), 0, 0, 1, 1},
   {&__pyx_n_s_randomdeviates, __pyx_k_randomdeviates, sizeof(__pyx_k_randomdeviates), 0, 0, 1, 1},
   {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
+  {&__pyx_n_s_reshape, __pyx_k_reshape, sizeof(__pyx_k_reshape), 0, 0, 1, 1},
+  {&__pyx_n_s_return_inverse, __pyx_k_return_inverse, sizeof(__pyx_k_return_inverse), 0, 0, 1, 1},
   {&__pyx_n_s_scipy, __pyx_k_scipy, sizeof(__pyx_k_scipy), 0, 0, 1, 1},
   {&__pyx_n_s_scipy_stats, __pyx_k_scipy_stats, sizeof(__pyx_k_scipy_stats), 0, 0, 1, 1},
+  {&__pyx_n_s_shape, __pyx_k_shape, sizeof(__pyx_k_shape), 0, 0, 1, 1},
   {&__pyx_n_s_sigma, __pyx_k_sigma, sizeof(__pyx_k_sigma), 0, 0, 1, 1},
   {&__pyx_n_s_sigma2, __pyx_k_sigma2, sizeof(__pyx_k_sigma2), 0, 0, 1, 1},
   {&__pyx_n_s_sigmasqrt2pi, __pyx_k_sigmasqrt2pi, sizeof(__pyx_k_sigmasqrt2pi), 0, 0, 1, 1},
   {&__pyx_n_s_sqrt2pi, __pyx_k_sqrt2pi, sizeof(__pyx_k_sqrt2pi), 0, 0, 1, 1},
   {&__pyx_n_s_standard_normal, __pyx_k_standard_normal, sizeof(__pyx_k_standard_normal), 0, 0, 1, 1},
-  {&__pyx_n_s_stats, __pyx_k_stats, sizeof(__pyx_k_stats), 0, 0, 1, 1},
+  {&__pyx_n_s_start, __pyx_k_start, sizeof(__pyx_k_start), 0, 0, 1, 1},
+  {&__pyx_n_s_stop, __pyx_k_stop, sizeof(__pyx_k_stop), 0, 0, 1, 1},
   {&__pyx_n_s_sumlogprob, __pyx_k_sumlogprob, sizeof(__pyx_k_sumlogprob), 0, 0, 1, 1},
+  {&__pyx_kp_s_support_d_d_outside_of_the_mass, __pyx_k_support_d_d_outside_of_the_mass, sizeof(__pyx_k_support_d_d_outside_of_the_mass), 0, 0, 1, 0},
+  {&__pyx_n_s_supports, __pyx_k_supports, sizeof(__pyx_k_supports), 0, 0, 1, 1},
+  {&__pyx_kp_s_supports_must_satisfy_0_start_st, __pyx_k_supports_must_satisfy_0_start_st, sizeof(__pyx_k_supports_must_satisfy_0_start_st), 0, 0, 1, 0},
+  {&__pyx_kp_s_supports_should_be_d_2_is_d_d, __pyx_k_supports_should_be_d_2_is_d_d, sizeof(__pyx_k_supports_should_be_d_2_is_d_d), 0, 0, 1, 0},
   {&__pyx_n_s_tau, __pyx_k_tau, sizeof(__pyx_k_tau), 0, 0, 1, 1},
   {&__pyx_n_s_tau2, __pyx_k_tau2, sizeof(__pyx_k_tau2), 0, 0, 1, 1},
   {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
   {&__pyx_n_s_thesum, __pyx_k_thesum, sizeof(__pyx_k_thesum), 0, 0, 1, 1},
+  {&__pyx_n_s_trapezoidWeights, __pyx_k_trapezoidWeights, sizeof(__pyx_k_trapezoidWeights), 0, 0, 1, 1},
   {&__pyx_n_s_twopi, __pyx_k_twopi, sizeof(__pyx_k_twopi), 0, 0, 1, 1},
+  {&__pyx_n_s_unique, __pyx_k_unique, sizeof(__pyx_k_unique), 0, 0, 1, 1},
   {&__pyx_kp_u_unknown_dtype_code_in_numpy_pxd, __pyx_k_unknown_dtype_code_in_numpy_pxd, sizeof(__pyx_k_unknown_dtype_code_in_numpy_pxd), 0, 1, 0, 0},
+  {&__pyx_n_s_weightedpdfs, __pyx_k_weightedpdfs, sizeof(__pyx_k_weightedpdfs), 0, 0, 1, 1},
+  {&__pyx_n_s_weights, __pyx_k_weights, sizeof(__pyx_k_weights), 0, 0, 1, 1},
+  {&__pyx_n_s_x, __pyx_k_x, sizeof(__pyx_k_x), 0, 0, 1, 1},
   {&__pyx_n_s_zeroboundrenorm, __pyx_k_zeroboundrenorm, sizeof(__pyx_k_zeroboundrenorm), 0, 0, 1, 1},
   {&__pyx_n_s_zeros, __pyx_k_zeros, sizeof(__pyx_k_zeros), 0, 0, 1, 1},
   {0, 0, 0, 0, 0, 0, 0}
 };
 static int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(1, 218, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 148, __pyx_L1_error)
   __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(1, 231, __pyx_L1_error)
   __pyx_builtin_RuntimeError = __Pyx_GetBuiltinName(__pyx_n_s_RuntimeError); if (!__pyx_builtin_RuntimeError) __PYX_ERR(1, 799, __pyx_L1_error)
   __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_n_s_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(1, 989, __pyx_L1_error)
@@ -7935,93 +10383,151 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":155
+  /* "deconvolvedlognormtools.pyx":210
  * 
  * 
  *         prob = altintegral(ml_ints[i,:],             # <<<<<<<<<<<<<<
  *                            delta_logmls[i,:],
  *                            logmu,
  */
-  __pyx_slice_ = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice_)) __PYX_ERR(0, 155, __pyx_L1_error)
+  __pyx_slice_ = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice_)) __PYX_ERR(0, 210, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_slice_);
   __Pyx_GIVEREF(__pyx_slice_);
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":156
+  /* "deconvolvedlognormtools.pyx":211
  * 
  *         prob = altintegral(ml_ints[i,:],
  *                            delta_logmls[i,:],             # <<<<<<<<<<<<<<
  *                            logmu,
  *                            sigma)
  */
-  __pyx_slice__2 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__2)) __PYX_ERR(0, 156, __pyx_L1_error)
+  __pyx_slice__2 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__2)) __PYX_ERR(0, 211, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_slice__2);
   __Pyx_GIVEREF(__pyx_slice__2);
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":227
- *         prob = pdfintegral(ml_ints,
- *                            deltamasses,
- *                            delta_logmls[i,:],             # <<<<<<<<<<<<<<
- *                            pdfs[i,:],
- *                            logmu,
+  /* "deconvolvedlognormtools.pyx":282
+ *     if supports is None:
+ *         supports = np.zeros((nclusters, 2), dtype=np.intp)
+ *         supports[:,1] = nsamples             # <<<<<<<<<<<<<<
+ *     else:
+ *         if supports.shape[0] != nclusters or supports.shape[1] != 2:
  */
-  __pyx_slice__3 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__3)) __PYX_ERR(0, 227, __pyx_L1_error)
+  __pyx_slice__3 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__3)) __PYX_ERR(0, 282, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_slice__3);
   __Pyx_GIVEREF(__pyx_slice__3);
+  __pyx_tuple__4 = PyTuple_Pack(2, __pyx_slice__3, __pyx_int_1); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 282, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":228
- *                            deltamasses,
- *                            delta_logmls[i,:],
- *                            pdfs[i,:],             # <<<<<<<<<<<<<<
- *                            logmu,
- *                            sigma)
+  /* "deconvolvedlognormtools.pyx":286
+ *         if supports.shape[0] != nclusters or supports.shape[1] != 2:
+ *             raise ValueError('supports should be (%d, 2), is (%d, %d)' % (nclusters, supports.shape[0], supports.shape[1]))
+ *         if ((supports[:,0] < 0) | (supports[:,1] < supports[:,0]) | (supports[:,1] > nsamples)).any():             # <<<<<<<<<<<<<<
+ *             raise ValueError('supports must satisfy 0 <= start <= stop <= %d' % nsamples)
+ * 
  */
-  __pyx_slice__4 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__4)) __PYX_ERR(0, 228, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_slice__4);
-  __Pyx_GIVEREF(__pyx_slice__4);
+  __pyx_slice__5 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__5)) __PYX_ERR(0, 286, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_slice__5);
+  __Pyx_GIVEREF(__pyx_slice__5);
+  __pyx_tuple__6 = PyTuple_Pack(2, __pyx_slice__5, __pyx_int_0); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 286, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
+  __pyx_slice__7 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__7)) __PYX_ERR(0, 286, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_slice__7);
+  __Pyx_GIVEREF(__pyx_slice__7);
+  __pyx_tuple__8 = PyTuple_Pack(2, __pyx_slice__7, __pyx_int_1); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 286, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
+  __pyx_slice__9 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__9)) __PYX_ERR(0, 286, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_slice__9);
+  __Pyx_GIVEREF(__pyx_slice__9);
+  __pyx_tuple__10 = PyTuple_Pack(2, __pyx_slice__9, __pyx_int_0); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(0, 286, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__10);
+  __Pyx_GIVEREF(__pyx_tuple__10);
+  __pyx_slice__11 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__11)) __PYX_ERR(0, 286, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_slice__11);
+  __Pyx_GIVEREF(__pyx_slice__11);
+  __pyx_tuple__12 = PyTuple_Pack(2, __pyx_slice__11, __pyx_int_1); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(0, 286, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__12);
+  __Pyx_GIVEREF(__pyx_tuple__12);
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":264
+  /* "deconvolvedlognormtools.pyx":338
  * 
  * 
  *         prob = altintegral(ml_ints[i,:],             # <<<<<<<<<<<<<<
  *                            delta_logmls[i,:],
  *                            logmu,
  */
-  __pyx_slice__5 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__5)) __PYX_ERR(0, 264, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_slice__5);
-  __Pyx_GIVEREF(__pyx_slice__5);
+  __pyx_slice__13 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__13)) __PYX_ERR(0, 338, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_slice__13);
+  __Pyx_GIVEREF(__pyx_slice__13);
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":265
+  /* "deconvolvedlognormtools.pyx":339
  * 
  *         prob = altintegral(ml_ints[i,:],
  *                            delta_logmls[i,:],             # <<<<<<<<<<<<<<
  *                            logmu,
  *                            sigma)
  */
-  __pyx_slice__6 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__6)) __PYX_ERR(0, 265, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_slice__6);
-  __Pyx_GIVEREF(__pyx_slice__6);
+  __pyx_slice__14 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__14)) __PYX_ERR(0, 339, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_slice__14);
+  __Pyx_GIVEREF(__pyx_slice__14);
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":269
+  /* "deconvolvedlognormtools.pyx":343
  *                            sigma)
  * 
  *         outlierprob = altintegral(outlier_ml_ints[i,:],             # <<<<<<<<<<<<<<
  *                                   delta_logmls[i,:],
  *                                   logmu,
  */
-  __pyx_slice__7 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__7)) __PYX_ERR(0, 269, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_slice__7);
-  __Pyx_GIVEREF(__pyx_slice__7);
+  __pyx_slice__15 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__15)) __PYX_ERR(0, 343, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_slice__15);
+  __Pyx_GIVEREF(__pyx_slice__15);
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":270
+  /* "deconvolvedlognormtools.pyx":344
  * 
  *         outlierprob = altintegral(outlier_ml_ints[i,:],
  *                                   delta_logmls[i,:],             # <<<<<<<<<<<<<<
  *                                   logmu,
  *                                   sigma)
  */
-  __pyx_slice__8 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__8)) __PYX_ERR(0, 270, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_slice__8);
-  __Pyx_GIVEREF(__pyx_slice__8);
+  __pyx_slice__16 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__16)) __PYX_ERR(0, 344, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_slice__16);
+  __Pyx_GIVEREF(__pyx_slice__16);
+
+  /* "deconvolvedlognormtools.pyx":363
+ *     nclusters = delta_masses.shape[0]
+ *     weights = np.zeros((nclusters, delta_masses.shape[1]+1))
+ *     weights[:,:-1] += 0.5*delta_masses             # <<<<<<<<<<<<<<
+ *     weights[:,1:] += 0.5*delta_masses
+ * 
+ */
+  __pyx_slice__17 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__17)) __PYX_ERR(0, 363, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_slice__17);
+  __Pyx_GIVEREF(__pyx_slice__17);
+  __pyx_slice__18 = PySlice_New(Py_None, __pyx_int_neg_1, Py_None); if (unlikely(!__pyx_slice__18)) __PYX_ERR(0, 363, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_slice__18);
+  __Pyx_GIVEREF(__pyx_slice__18);
+  __pyx_tuple__19 = PyTuple_Pack(2, __pyx_slice__17, __pyx_slice__18); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(0, 363, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__19);
+  __Pyx_GIVEREF(__pyx_tuple__19);
+
+  /* "deconvolvedlognormtools.pyx":364
+ *     weights = np.zeros((nclusters, delta_masses.shape[1]+1))
+ *     weights[:,:-1] += 0.5*delta_masses
+ *     weights[:,1:] += 0.5*delta_masses             # <<<<<<<<<<<<<<
+ * 
+ *     return weights
+ */
+  __pyx_slice__20 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__20)) __PYX_ERR(0, 364, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_slice__20);
+  __Pyx_GIVEREF(__pyx_slice__20);
+  __pyx_slice__21 = PySlice_New(__pyx_int_1, Py_None, Py_None); if (unlikely(!__pyx_slice__21)) __PYX_ERR(0, 364, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_slice__21);
+  __Pyx_GIVEREF(__pyx_slice__21);
+  __pyx_tuple__22 = PyTuple_Pack(2, __pyx_slice__20, __pyx_slice__21); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(0, 364, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__22);
+  __Pyx_GIVEREF(__pyx_tuple__22);
 
   /* "../../anaconda2/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":218
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
@@ -8030,9 +10536,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  */
-  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_C_contiguous); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(1, 218, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__9);
-  __Pyx_GIVEREF(__pyx_tuple__9);
+  __pyx_tuple__23 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_C_contiguous); if (unlikely(!__pyx_tuple__23)) __PYX_ERR(1, 218, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__23);
+  __Pyx_GIVEREF(__pyx_tuple__23);
 
   /* "../../anaconda2/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":222
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
@@ -8041,9 +10547,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  *             info.buf = PyArray_DATA(self)
  */
-  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_Fortran_contiguou); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(1, 222, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__10);
-  __Pyx_GIVEREF(__pyx_tuple__10);
+  __pyx_tuple__24 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_Fortran_contiguou); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(1, 222, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__24);
+  __Pyx_GIVEREF(__pyx_tuple__24);
 
   /* "../../anaconda2/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":259
  *                 if ((descr.byteorder == c'>' and little_endian) or
@@ -8052,9 +10558,9 @@ static int __Pyx_InitCachedConstants(void) {
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"
  */
-  __pyx_tuple__11 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(1, 259, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__11);
-  __Pyx_GIVEREF(__pyx_tuple__11);
+  __pyx_tuple__25 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__25)) __PYX_ERR(1, 259, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__25);
+  __Pyx_GIVEREF(__pyx_tuple__25);
 
   /* "../../anaconda2/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":799
  * 
@@ -8063,9 +10569,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  *         if ((child.byteorder == c'>' and little_endian) or
  */
-  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(1, 799, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__12);
-  __Pyx_GIVEREF(__pyx_tuple__12);
+  __pyx_tuple__26 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor); if (unlikely(!__pyx_tuple__26)) __PYX_ERR(1, 799, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__26);
+  __Pyx_GIVEREF(__pyx_tuple__26);
 
   /* "../../anaconda2/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":803
  *         if ((child.byteorder == c'>' and little_endian) or
@@ -8074,9 +10580,9 @@ static int __Pyx_InitCachedConstants(void) {
  *             # One could encode it in the format string and have Cython
  *             # complain instead, BUT: < and > in format strings also imply
  */
-  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(1, 803, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__13);
-  __Pyx_GIVEREF(__pyx_tuple__13);
+  __pyx_tuple__27 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(1, 803, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__27);
+  __Pyx_GIVEREF(__pyx_tuple__27);
 
   /* "../../anaconda2/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":823
  *             t = child.type_num
@@ -8085,9 +10591,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  */
-  __pyx_tuple__14 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor_2); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(1, 823, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__14);
-  __Pyx_GIVEREF(__pyx_tuple__14);
+  __pyx_tuple__28 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor_2); if (unlikely(!__pyx_tuple__28)) __PYX_ERR(1, 823, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__28);
+  __Pyx_GIVEREF(__pyx_tuple__28);
 
   /* "../../anaconda2/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":989
  *         _import_array()
@@ -8096,9 +10602,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  * cdef inline int import_umath() except -1:
  */
-  __pyx_tuple__15 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_multiarray_failed_to); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(1, 989, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__15);
-  __Pyx_GIVEREF(__pyx_tuple__15);
+  __pyx_tuple__29 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_multiarray_failed_to); if (unlikely(!__pyx_tuple__29)) __PYX_ERR(1, 989, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__29);
+  __Pyx_GIVEREF(__pyx_tuple__29);
 
   /* "../../anaconda2/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":995
  *         _import_umath()
@@ -8107,114 +10613,174 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  * cdef inline int import_ufunc() except -1:
  */
-  __pyx_tuple__16 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(1, 995, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__16);
-  __Pyx_GIVEREF(__pyx_tuple__16);
+  __pyx_tuple__30 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__30)) __PYX_ERR(1, 995, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__30);
+  __Pyx_GIVEREF(__pyx_tuple__30);
 
   /* "../../anaconda2/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":1001
  *         _import_umath()
  *     except Exception:
  *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
  */
-  __pyx_tuple__17 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(1, 1001, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__17);
-  __Pyx_GIVEREF(__pyx_tuple__17);
+  __pyx_tuple__31 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__31)) __PYX_ERR(1, 1001, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__31);
+  __Pyx_GIVEREF(__pyx_tuple__31);
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":37
+  /* "deconvolvedlognormtools.pyx":41
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def integral(double mlens,             # <<<<<<<<<<<<<<
  *               double merr,
  *               double mtrue,
  */
-  __pyx_tuple__18 = PyTuple_Pack(12, __pyx_n_s_mlens, __pyx_n_s_merr, __pyx_n_s_mtrue, __pyx_n_s_logmu, __pyx_n_s_sigma, __pyx_n_s_i, __pyx_n_s_nsamples, __pyx_n_s_randomdeviates, __pyx_n_s_thesum, __pyx_n_s_logmtrue, __pyx_n_s_ml_int, __pyx_n_s_normpart); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(0, 37, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__18);
-  __Pyx_GIVEREF(__pyx_tuple__18);
-  __pyx_codeobj__19 = (PyObject*)__Pyx_PyCode_New(5, 0, 12, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_integral, 37, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__19)) __PYX_ERR(0, 37, __pyx_L1_error)
+  __pyx_tuple__32 = PyTuple_Pack(12, __pyx_n_s_mlens, __pyx_n_s_merr, __pyx_n_s_mtrue, __pyx_n_s_logmu, __pyx_n_s_sigma, __pyx_n_s_i, __pyx_n_s_nsamples, __pyx_n_s_randomdeviates, __pyx_n_s_thesum, __pyx_n_s_logmtrue, __pyx_n_s_ml_int, __pyx_n_s_normpart); if (unlikely(!__pyx_tuple__32)) __PYX_ERR(0, 41, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__32);
+  __Pyx_GIVEREF(__pyx_tuple__32);
+  __pyx_codeobj__33 = (PyObject*)__Pyx_PyCode_New(5, 0, 12, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__32, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_integral, 41, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__33)) __PYX_ERR(0, 41, __pyx_L1_error)
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":67
+  /* "deconvolvedlognormtools.pyx":71
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def altintegral(np.ndarray[np.double_t, ndim=1, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
  *                 np.ndarray[np.double_t, ndim=1, mode='c'] delta_logmls,
  *               double logmu,
  */
-  __pyx_tuple__20 = PyTuple_Pack(11, __pyx_n_s_ml_ints, __pyx_n_s_delta_logmls, __pyx_n_s_logmu, __pyx_n_s_sigma, __pyx_n_s_i, __pyx_n_s_nsamples, __pyx_n_s_thesum, __pyx_n_s_lognormpart, __pyx_n_s_sigma2, __pyx_n_s_sigmasqrt2pi, __pyx_n_s_neg2sigma2); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(0, 67, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__20);
-  __Pyx_GIVEREF(__pyx_tuple__20);
-  __pyx_codeobj__21 = (PyObject*)__Pyx_PyCode_New(4, 0, 11, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__20, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_altintegral, 67, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__21)) __PYX_ERR(0, 67, __pyx_L1_error)
+  __pyx_tuple__34 = PyTuple_Pack(11, __pyx_n_s_ml_ints, __pyx_n_s_delta_logmls, __pyx_n_s_logmu, __pyx_n_s_sigma, __pyx_n_s_i, __pyx_n_s_nsamples, __pyx_n_s_thesum, __pyx_n_s_lognormpart, __pyx_n_s_sigma2, __pyx_n_s_sigmasqrt2pi, __pyx_n_s_neg2sigma2); if (unlikely(!__pyx_tuple__34)) __PYX_ERR(0, 71, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__34);
+  __Pyx_GIVEREF(__pyx_tuple__34);
+  __pyx_codeobj__35 = (PyObject*)__Pyx_PyCode_New(4, 0, 11, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__34, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_altintegral, 71, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__35)) __PYX_ERR(0, 71, __pyx_L1_error)
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":96
- * @cython.boundscheck(False)
- * @cython.wraparound(False)
+  /* "deconvolvedlognormtools.pyx":143
+ * ###
+ * 
+ * def checkPDFShapes(ml_ints, deltamasses, delta_logmls, pdf):             # <<<<<<<<<<<<<<
+ *     '''The pdf integrals read these unchecked; make sure they fit the mass grid'''
+ * 
+ */
+  __pyx_tuple__36 = PyTuple_Pack(5, __pyx_n_s_ml_ints, __pyx_n_s_deltamasses, __pyx_n_s_delta_logmls, __pyx_n_s_pdf, __pyx_n_s_nsamples); if (unlikely(!__pyx_tuple__36)) __PYX_ERR(0, 143, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__36);
+  __Pyx_GIVEREF(__pyx_tuple__36);
+  __pyx_codeobj__37 = (PyObject*)__Pyx_PyCode_New(4, 0, 5, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__36, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_checkPDFShapes, 143, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__37)) __PYX_ERR(0, 143, __pyx_L1_error)
+
+  /* "deconvolvedlognormtools.pyx":154
+ *         raise ValueError('pdf has %d masses, grid has %d' % (pdf.shape[-1], nsamples))
+ * 
+ * def checkSupport(start, stop, nsamples):             # <<<<<<<<<<<<<<
+ * 
+ *     if not (0 <= start <= stop <= nsamples):
+ */
+  __pyx_tuple__38 = PyTuple_Pack(3, __pyx_n_s_start, __pyx_n_s_stop, __pyx_n_s_nsamples); if (unlikely(!__pyx_tuple__38)) __PYX_ERR(0, 154, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__38);
+  __Pyx_GIVEREF(__pyx_tuple__38);
+  __pyx_codeobj__39 = (PyObject*)__Pyx_PyCode_New(3, 0, 3, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__38, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_checkSupport, 154, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__39)) __PYX_ERR(0, 154, __pyx_L1_error)
+
+  /* "deconvolvedlognormtools.pyx":161
+ * ###
+ * 
  * def pdfintegral(np.ndarray[np.double_t, ndim=1, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
  *                 np.ndarray[np.double_t, ndim=1, mode='c'] deltamasses,
  *                 np.ndarray[np.double_t, ndim=1, mode='c'] delta_logmls,
  */
-  __pyx_tuple__22 = PyTuple_Pack(13, __pyx_n_s_ml_ints, __pyx_n_s_deltamasses, __pyx_n_s_delta_logmls, __pyx_n_s_pdf, __pyx_n_s_logmu, __pyx_n_s_sigma, __pyx_n_s_i, __pyx_n_s_nsamples, __pyx_n_s_thesum, __pyx_n_s_sigma2, __pyx_n_s_sigmasqrt2pi, __pyx_n_s_neg2sigma2, __pyx_n_s_lognormpart); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(0, 96, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__22);
-  __Pyx_GIVEREF(__pyx_tuple__22);
-  __pyx_codeobj__23 = (PyObject*)__Pyx_PyCode_New(6, 0, 13, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__22, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_pdfintegral, 96, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__23)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_tuple__40 = PyTuple_Pack(9, __pyx_n_s_ml_ints, __pyx_n_s_deltamasses, __pyx_n_s_delta_logmls, __pyx_n_s_pdf, __pyx_n_s_logmu, __pyx_n_s_sigma, __pyx_n_s_start, __pyx_n_s_stop, __pyx_n_s_nsamples); if (unlikely(!__pyx_tuple__40)) __PYX_ERR(0, 161, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__40);
+  __Pyx_GIVEREF(__pyx_tuple__40);
+  __pyx_codeobj__41 = (PyObject*)__Pyx_PyCode_New(8, 0, 9, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__40, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_pdfintegral, 161, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__41)) __PYX_ERR(0, 161, __pyx_L1_error)
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":137
+  /* "deconvolvedlognormtools.pyx":192
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def loglinearlike(np.ndarray[np.double_t, ndim=2, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
  *                   np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
  *                   double logmu,
  */
-  __pyx_tuple__24 = PyTuple_Pack(8, __pyx_n_s_ml_ints, __pyx_n_s_delta_logmls, __pyx_n_s_logmu, __pyx_n_s_sigma, __pyx_n_s_i, __pyx_n_s_nclusters, __pyx_n_s_sumlogprob, __pyx_n_s_prob); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(0, 137, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__24);
-  __Pyx_GIVEREF(__pyx_tuple__24);
-  __pyx_codeobj__25 = (PyObject*)__Pyx_PyCode_New(4, 0, 8, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__24, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_loglinearlike, 137, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__25)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __pyx_tuple__42 = PyTuple_Pack(8, __pyx_n_s_ml_ints, __pyx_n_s_delta_logmls, __pyx_n_s_logmu, __pyx_n_s_sigma, __pyx_n_s_i, __pyx_n_s_nclusters, __pyx_n_s_sumlogprob, __pyx_n_s_prob); if (unlikely(!__pyx_tuple__42)) __PYX_ERR(0, 192, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__42);
+  __Pyx_GIVEREF(__pyx_tuple__42);
+  __pyx_codeobj__43 = (PyObject*)__Pyx_PyCode_New(4, 0, 8, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__42, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_loglinearlike, 192, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__43)) __PYX_ERR(0, 192, __pyx_L1_error)
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":170
+  /* "deconvolvedlognormtools.pyx":225
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def mcmcloglinearlike(np.ndarray[np.double_t, ndim=2, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
  *                       np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
  *                       np.ndarray[np.int_t, ndim=1, mode='c'] ngoodsamples,
  */
-  __pyx_tuple__26 = PyTuple_Pack(10, __pyx_n_s_ml_ints, __pyx_n_s_delta_logmls, __pyx_n_s_ngoodsamples, __pyx_n_s_logmu, __pyx_n_s_sigma, __pyx_n_s_i, __pyx_n_s_nclusters, __pyx_n_s_nsamples, __pyx_n_s_sumlogprob, __pyx_n_s_prob); if (unlikely(!__pyx_tuple__26)) __PYX_ERR(0, 170, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__26);
-  __Pyx_GIVEREF(__pyx_tuple__26);
-  __pyx_codeobj__27 = (PyObject*)__Pyx_PyCode_New(5, 0, 10, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__26, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_mcmcloglinearlike, 170, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__27)) __PYX_ERR(0, 170, __pyx_L1_error)
+  __pyx_tuple__44 = PyTuple_Pack(10, __pyx_n_s_ml_ints, __pyx_n_s_delta_logmls, __pyx_n_s_ngoodsamples, __pyx_n_s_logmu, __pyx_n_s_sigma, __pyx_n_s_i, __pyx_n_s_nclusters, __pyx_n_s_nsamples, __pyx_n_s_sumlogprob, __pyx_n_s_prob); if (unlikely(!__pyx_tuple__44)) __PYX_ERR(0, 225, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__44);
+  __Pyx_GIVEREF(__pyx_tuple__44);
+  __pyx_codeobj__45 = (PyObject*)__Pyx_PyCode_New(5, 0, 10, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__44, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_mcmcloglinearlike, 225, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__45)) __PYX_ERR(0, 225, __pyx_L1_error)
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":206
+  /* "deconvolvedlognormtools.pyx":261
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def pdfloglinearlike(np.ndarray[np.double_t, ndim=1, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
  *                       np.ndarray[np.double_t, ndim=1, mode='c'] deltamasses,
  *                       np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
  */
-  __pyx_tuple__28 = PyTuple_Pack(10, __pyx_n_s_ml_ints, __pyx_n_s_deltamasses, __pyx_n_s_delta_logmls, __pyx_n_s_pdfs, __pyx_n_s_logmu, __pyx_n_s_sigma, __pyx_n_s_i, __pyx_n_s_nclusters, __pyx_n_s_sumlogprob, __pyx_n_s_prob); if (unlikely(!__pyx_tuple__28)) __PYX_ERR(0, 206, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__28);
-  __Pyx_GIVEREF(__pyx_tuple__28);
-  __pyx_codeobj__29 = (PyObject*)__Pyx_PyCode_New(6, 0, 10, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__28, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_pdfloglinearlike, 206, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__29)) __PYX_ERR(0, 206, __pyx_L1_error)
+  __pyx_tuple__46 = PyTuple_Pack(16, __pyx_n_s_ml_ints, __pyx_n_s_deltamasses, __pyx_n_s_delta_logmls, __pyx_n_s_pdfs, __pyx_n_s_logmu, __pyx_n_s_sigma, __pyx_n_s_supports, __pyx_n_s_i, __pyx_n_s_nclusters, __pyx_n_s_nsamples, __pyx_n_s_ml_data, __pyx_n_s_deltamass_data, __pyx_n_s_dlm_data, __pyx_n_s_pdf_data, __pyx_n_s_sumlogprob, __pyx_n_s_prob); if (unlikely(!__pyx_tuple__46)) __PYX_ERR(0, 261, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__46);
+  __Pyx_GIVEREF(__pyx_tuple__46);
+  __pyx_codeobj__47 = (PyObject*)__Pyx_PyCode_New(7, 0, 16, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__46, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_pdfloglinearlike, 261, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__47)) __PYX_ERR(0, 261, __pyx_L1_error)
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":243
+  /* "deconvolvedlognormtools.pyx":317
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def outlierloglinearlike(np.ndarray[np.double_t, ndim=2, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
  *                          np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
  *                          np.ndarray[np.double_t, ndim=2, mode='c'] outlier_ml_ints,
  */
-  __pyx_tuple__30 = PyTuple_Pack(12, __pyx_n_s_ml_ints, __pyx_n_s_delta_logmls, __pyx_n_s_outlier_ml_ints, __pyx_n_s_outlier_delta_logmls, __pyx_n_s_logmu, __pyx_n_s_sigma, __pyx_n_s_fracoutliers, __pyx_n_s_i, __pyx_n_s_nclusters, __pyx_n_s_sumlogprob, __pyx_n_s_prob, __pyx_n_s_outlierprob); if (unlikely(!__pyx_tuple__30)) __PYX_ERR(0, 243, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__30);
-  __Pyx_GIVEREF(__pyx_tuple__30);
-  __pyx_codeobj__31 = (PyObject*)__Pyx_PyCode_New(7, 0, 12, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__30, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_outlierloglinearlike, 243, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__31)) __PYX_ERR(0, 243, __pyx_L1_error)
+  __pyx_tuple__48 = PyTuple_Pack(12, __pyx_n_s_ml_ints, __pyx_n_s_delta_logmls, __pyx_n_s_outlier_ml_ints, __pyx_n_s_outlier_delta_logmls, __pyx_n_s_logmu, __pyx_n_s_sigma, __pyx_n_s_fracoutliers, __pyx_n_s_i, __pyx_n_s_nclusters, __pyx_n_s_sumlogprob, __pyx_n_s_prob, __pyx_n_s_outlierprob); if (unlikely(!__pyx_tuple__48)) __PYX_ERR(0, 317, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__48);
+  __Pyx_GIVEREF(__pyx_tuple__48);
+  __pyx_codeobj__49 = (PyObject*)__Pyx_PyCode_New(7, 0, 12, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__48, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_outlierloglinearlike, 317, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__49)) __PYX_ERR(0, 317, __pyx_L1_error)
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":286
- * @cython.boundscheck(False)
+  /* "deconvolvedlognormtools.pyx":358
+ * 
+ * 
+ * def trapezoidWeights(np.ndarray[np.double_t, ndim=2, mode='c'] delta_masses):             # <<<<<<<<<<<<<<
+ *     '''Per-node trapezoid weights; delta_masses is one shorter per row than the mass grid'''
+ * 
+ */
+  __pyx_tuple__50 = PyTuple_Pack(3, __pyx_n_s_delta_masses, __pyx_n_s_nclusters, __pyx_n_s_weights); if (unlikely(!__pyx_tuple__50)) __PYX_ERR(0, 358, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__50);
+  __Pyx_GIVEREF(__pyx_tuple__50);
+  __pyx_codeobj__51 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__50, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_trapezoidWeights, 358, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__51)) __PYX_ERR(0, 358, __pyx_L1_error)
+
+  /* "deconvolvedlognormtools.pyx":370
+ * ###
+ * 
+ * def precomputeGaussMix1D(np.ndarray[np.double_t, ndim=2, mode='c'] delta_mls,             # <<<<<<<<<<<<<<
+ *                          np.ndarray[np.double_t, ndim=2, mode='c'] delta_masses,
+ *                          np.ndarray[np.double_t, ndim=2, mode='c'] pdfs):
+ */
+  __pyx_tuple__52 = PyTuple_Pack(6, __pyx_n_s_delta_mls, __pyx_n_s_delta_masses, __pyx_n_s_pdfs, __pyx_n_s_evalpoints, __pyx_n_s_evalindex, __pyx_n_s_weightedpdfs); if (unlikely(!__pyx_tuple__52)) __PYX_ERR(0, 370, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__52);
+  __Pyx_GIVEREF(__pyx_tuple__52);
+  __pyx_codeobj__53 = (PyObject*)__Pyx_PyCode_New(3, 0, 6, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__52, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_precomputeGaussMix1D, 370, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__53)) __PYX_ERR(0, 370, __pyx_L1_error)
+
+  /* "deconvolvedlognormtools.pyx":389
  * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def pdfGaussMix1D_cached(np.ndarray[np.double_t, ndim=1, mode='c'] evalpoints,             # <<<<<<<<<<<<<<
+ *                          np.ndarray[np.intp_t, ndim=2, mode='c'] evalindex,
+ *                          np.ndarray[np.double_t, ndim=2, mode='c'] weightedpdfs,
+ */
+  __pyx_tuple__54 = PyTuple_Pack(23, __pyx_n_s_evalpoints, __pyx_n_s_evalindex, __pyx_n_s_weightedpdfs, __pyx_n_s_pis, __pyx_n_s_mus, __pyx_n_s_tau2, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_k, __pyx_n_s_nclusters, __pyx_n_s_nmasses, __pyx_n_s_npoints, __pyx_n_s_ngauss, __pyx_n_s_amplitudes, __pyx_n_s_neghalfinvtau2, __pyx_n_s_zeroboundrenorm, __pyx_n_s_tau, __pyx_n_s_intrinsicpdf, __pyx_n_s_x, __pyx_n_s_dx, __pyx_n_s_thesum, __pyx_n_s_sumlogprob, __pyx_n_s_prob); if (unlikely(!__pyx_tuple__54)) __PYX_ERR(0, 389, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__54);
+  __Pyx_GIVEREF(__pyx_tuple__54);
+  __pyx_codeobj__55 = (PyObject*)__Pyx_PyCode_New(6, 0, 23, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__54, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_pdfGaussMix1D_cached, 389, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__55)) __PYX_ERR(0, 389, __pyx_L1_error)
+
+  /* "deconvolvedlognormtools.pyx":445
+ * ###
+ * 
  * def pdfGaussMix1D(np.ndarray[np.double_t, ndim=2, mode='c'] delta_mls,             # <<<<<<<<<<<<<<
  *                   np.ndarray[np.double_t, ndim=2, mode='c'] delta_masses,
  *                   np.ndarray[np.double_t, ndim=2, mode='c'] pdfs,
  */
-  __pyx_tuple__32 = PyTuple_Pack(20, __pyx_n_s_delta_mls, __pyx_n_s_delta_masses, __pyx_n_s_pdfs, __pyx_n_s_pis, __pyx_n_s_mus, __pyx_n_s_tau2, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_nclusters, __pyx_n_s_ngauss, __pyx_n_s_nmasses, __pyx_n_s_norms, __pyx_n_s_zeroboundrenorm, __pyx_n_s_tau, __pyx_n_s_sumlogprob, __pyx_n_s_deltamass_mu2, __pyx_n_s_gausseval, __pyx_n_s_integrand, __pyx_n_s_k, __pyx_n_s_prob); if (unlikely(!__pyx_tuple__32)) __PYX_ERR(0, 286, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__32);
-  __Pyx_GIVEREF(__pyx_tuple__32);
-  __pyx_codeobj__33 = (PyObject*)__Pyx_PyCode_New(6, 0, 20, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__32, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_pdfGaussMix1D, 286, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__33)) __PYX_ERR(0, 286, __pyx_L1_error)
+  __pyx_tuple__56 = PyTuple_Pack(9, __pyx_n_s_delta_mls, __pyx_n_s_delta_masses, __pyx_n_s_pdfs, __pyx_n_s_pis, __pyx_n_s_mus, __pyx_n_s_tau2, __pyx_n_s_evalpoints, __pyx_n_s_evalindex, __pyx_n_s_weightedpdfs); if (unlikely(!__pyx_tuple__56)) __PYX_ERR(0, 445, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__56);
+  __Pyx_GIVEREF(__pyx_tuple__56);
+  __pyx_codeobj__57 = (PyObject*)__Pyx_PyCode_New(6, 0, 9, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__56, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_pdfGaussMix1D, 445, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__57)) __PYX_ERR(0, 445, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -8225,9 +10791,11 @@ static int __Pyx_InitCachedConstants(void) {
 static int __Pyx_InitGlobals(void) {
   if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
   __pyx_float_0_ = PyFloat_FromDouble(0.); if (unlikely(!__pyx_float_0_)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_float_1_ = PyFloat_FromDouble(1.); if (unlikely(!__pyx_float_1_)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_float_0_5 = PyFloat_FromDouble(0.5); if (unlikely(!__pyx_float_0_5)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_neg_1 = PyInt_FromLong(-1); if (unlikely(!__pyx_int_neg_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -8300,14 +10868,14 @@ PyMODINIT_FUNC PyInit_deconvolvedlognormtools(void)
   #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
   if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
-  if (__pyx_module_is_main_nfwfitter__deconvolvedlognormtools) {
+  if (__pyx_module_is_main_deconvolvedlognormtools) {
     if (PyObject_SetAttrString(__pyx_m, "__name__", __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   }
   #if PY_MAJOR_VERSION >= 3
   {
     PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
-    if (!PyDict_GetItemString(modules, "nfwfitter.deconvolvedlognormtools")) {
-      if (unlikely(PyDict_SetItemString(modules, "nfwfitter.deconvolvedlognormtools", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "deconvolvedlognormtools")) {
+      if (unlikely(PyDict_SetItemString(modules, "deconvolvedlognormtools", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
     }
   }
   #endif
@@ -8339,7 +10907,7 @@ PyMODINIT_FUNC PyInit_deconvolvedlognormtools(void)
   if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":14
+  /* "deconvolvedlognormtools.pyx":14
  * # cython: profile=False
  * 
  * import numpy as np             # <<<<<<<<<<<<<<
@@ -8351,7 +10919,7 @@ PyMODINIT_FUNC PyInit_deconvolvedlognormtools(void)
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_np, __pyx_t_1) < 0) __PYX_ERR(0, 14, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":18
+  /* "deconvolvedlognormtools.pyx":18
  * cimport cython
  * 
  * import scipy.stats             # <<<<<<<<<<<<<<
@@ -8363,143 +10931,231 @@ PyMODINIT_FUNC PyInit_deconvolvedlognormtools(void)
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_scipy, __pyx_t_1) < 0) __PYX_ERR(0, 18, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":26
- *     double sqrt(double)
+  /* "deconvolvedlognormtools.pyx":27
+ *     double erfc(double) nogil
  * 
  * sqrt2pi = sqrt(2*np.pi)             # <<<<<<<<<<<<<<
  * twopi = 2*np.pi
  * 
  */
-  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 26, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 27, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_pi); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 26, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_pi); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 27, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyNumber_Multiply(__pyx_int_2, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 26, __pyx_L1_error)
+  __pyx_t_1 = PyNumber_Multiply(__pyx_int_2, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 27, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_3 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_3 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 26, __pyx_L1_error)
+  __pyx_t_3 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_3 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 27, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyFloat_FromDouble(sqrt(__pyx_t_3)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 26, __pyx_L1_error)
+  __pyx_t_1 = PyFloat_FromDouble(sqrt(__pyx_t_3)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 27, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sqrt2pi, __pyx_t_1) < 0) __PYX_ERR(0, 26, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sqrt2pi, __pyx_t_1) < 0) __PYX_ERR(0, 27, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":27
+  /* "deconvolvedlognormtools.pyx":28
  * 
  * sqrt2pi = sqrt(2*np.pi)
  * twopi = 2*np.pi             # <<<<<<<<<<<<<<
  * 
+ * cdef double sqrt2 = sqrt(2.)
+ */
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 28, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_pi); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 28, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyNumber_Multiply(__pyx_int_2, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 28, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_twopi, __pyx_t_1) < 0) __PYX_ERR(0, 28, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "deconvolvedlognormtools.pyx":30
+ * twopi = 2*np.pi
+ * 
+ * cdef double sqrt2 = sqrt(2.)             # <<<<<<<<<<<<<<
+ * cdef double sqrt2pi_c = sqrt(2*np.pi)
  * 
  */
-  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 27, __pyx_L1_error)
+  __pyx_v_23deconvolvedlognormtools_sqrt2 = sqrt(2.);
+
+  /* "deconvolvedlognormtools.pyx":31
+ * 
+ * cdef double sqrt2 = sqrt(2.)
+ * cdef double sqrt2pi_c = sqrt(2*np.pi)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 31, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_pi); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 27, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_pi); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 31, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyNumber_Multiply(__pyx_int_2, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 27, __pyx_L1_error)
+  __pyx_t_1 = PyNumber_Multiply(__pyx_int_2, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 31, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_twopi, __pyx_t_1) < 0) __PYX_ERR(0, 27, __pyx_L1_error)
+  __pyx_t_3 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_3 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 31, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_23deconvolvedlognormtools_sqrt2pi_c = sqrt(__pyx_t_3);
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":37
+  /* "deconvolvedlognormtools.pyx":41
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def integral(double mlens,             # <<<<<<<<<<<<<<
  *               double merr,
  *               double mtrue,
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_9nfwfitter_23deconvolvedlognormtools_1integral, NULL, __pyx_n_s_nfwfitter_deconvolvedlognormtool); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 37, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_23deconvolvedlognormtools_1integral, NULL, __pyx_n_s_deconvolvedlognormtools); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 41, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_integral, __pyx_t_1) < 0) __PYX_ERR(0, 41, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "deconvolvedlognormtools.pyx":71
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def altintegral(np.ndarray[np.double_t, ndim=1, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
+ *                 np.ndarray[np.double_t, ndim=1, mode='c'] delta_logmls,
+ *               double logmu,
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_23deconvolvedlognormtools_3altintegral, NULL, __pyx_n_s_deconvolvedlognormtools); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 71, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_altintegral, __pyx_t_1) < 0) __PYX_ERR(0, 71, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "deconvolvedlognormtools.pyx":143
+ * ###
+ * 
+ * def checkPDFShapes(ml_ints, deltamasses, delta_logmls, pdf):             # <<<<<<<<<<<<<<
+ *     '''The pdf integrals read these unchecked; make sure they fit the mass grid'''
+ * 
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_23deconvolvedlognormtools_5checkPDFShapes, NULL, __pyx_n_s_deconvolvedlognormtools); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 143, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_integral, __pyx_t_1) < 0) __PYX_ERR(0, 37, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_checkPDFShapes, __pyx_t_1) < 0) __PYX_ERR(0, 143, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":67
- * @cython.boundscheck(False)
- * @cython.wraparound(False)
- * def altintegral(np.ndarray[np.double_t, ndim=1, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
- *                 np.ndarray[np.double_t, ndim=1, mode='c'] delta_logmls,
- *               double logmu,
+  /* "deconvolvedlognormtools.pyx":154
+ *         raise ValueError('pdf has %d masses, grid has %d' % (pdf.shape[-1], nsamples))
+ * 
+ * def checkSupport(start, stop, nsamples):             # <<<<<<<<<<<<<<
+ * 
+ *     if not (0 <= start <= stop <= nsamples):
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_9nfwfitter_23deconvolvedlognormtools_3altintegral, NULL, __pyx_n_s_nfwfitter_deconvolvedlognormtool); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 67, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_23deconvolvedlognormtools_7checkSupport, NULL, __pyx_n_s_deconvolvedlognormtools); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 154, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_altintegral, __pyx_t_1) < 0) __PYX_ERR(0, 67, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_checkSupport, __pyx_t_1) < 0) __PYX_ERR(0, 154, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":96
- * @cython.boundscheck(False)
- * @cython.wraparound(False)
+  /* "deconvolvedlognormtools.pyx":161
+ * ###
+ * 
  * def pdfintegral(np.ndarray[np.double_t, ndim=1, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
  *                 np.ndarray[np.double_t, ndim=1, mode='c'] deltamasses,
  *                 np.ndarray[np.double_t, ndim=1, mode='c'] delta_logmls,
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_9nfwfitter_23deconvolvedlognormtools_5pdfintegral, NULL, __pyx_n_s_nfwfitter_deconvolvedlognormtool); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_23deconvolvedlognormtools_9pdfintegral, NULL, __pyx_n_s_deconvolvedlognormtools); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 161, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pdfintegral, __pyx_t_1) < 0) __PYX_ERR(0, 96, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pdfintegral, __pyx_t_1) < 0) __PYX_ERR(0, 161, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":137
+  /* "deconvolvedlognormtools.pyx":192
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def loglinearlike(np.ndarray[np.double_t, ndim=2, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
  *                   np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
  *                   double logmu,
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_9nfwfitter_23deconvolvedlognormtools_7loglinearlike, NULL, __pyx_n_s_nfwfitter_deconvolvedlognormtool); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_23deconvolvedlognormtools_11loglinearlike, NULL, __pyx_n_s_deconvolvedlognormtools); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 192, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_loglinearlike, __pyx_t_1) < 0) __PYX_ERR(0, 137, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_loglinearlike, __pyx_t_1) < 0) __PYX_ERR(0, 192, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":170
+  /* "deconvolvedlognormtools.pyx":225
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def mcmcloglinearlike(np.ndarray[np.double_t, ndim=2, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
  *                       np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
  *                       np.ndarray[np.int_t, ndim=1, mode='c'] ngoodsamples,
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_9nfwfitter_23deconvolvedlognormtools_9mcmcloglinearlike, NULL, __pyx_n_s_nfwfitter_deconvolvedlognormtool); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 170, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_23deconvolvedlognormtools_13mcmcloglinearlike, NULL, __pyx_n_s_deconvolvedlognormtools); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 225, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_mcmcloglinearlike, __pyx_t_1) < 0) __PYX_ERR(0, 170, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_mcmcloglinearlike, __pyx_t_1) < 0) __PYX_ERR(0, 225, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":206
+  /* "deconvolvedlognormtools.pyx":261
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def pdfloglinearlike(np.ndarray[np.double_t, ndim=1, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
  *                       np.ndarray[np.double_t, ndim=1, mode='c'] deltamasses,
  *                       np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_9nfwfitter_23deconvolvedlognormtools_11pdfloglinearlike, NULL, __pyx_n_s_nfwfitter_deconvolvedlognormtool); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 206, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_23deconvolvedlognormtools_15pdfloglinearlike, NULL, __pyx_n_s_deconvolvedlognormtools); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 261, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pdfloglinearlike, __pyx_t_1) < 0) __PYX_ERR(0, 206, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pdfloglinearlike, __pyx_t_1) < 0) __PYX_ERR(0, 261, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":243
+  /* "deconvolvedlognormtools.pyx":317
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def outlierloglinearlike(np.ndarray[np.double_t, ndim=2, mode='c'] ml_ints,             # <<<<<<<<<<<<<<
  *                          np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
  *                          np.ndarray[np.double_t, ndim=2, mode='c'] outlier_ml_ints,
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_9nfwfitter_23deconvolvedlognormtools_13outlierloglinearlike, NULL, __pyx_n_s_nfwfitter_deconvolvedlognormtool); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 243, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_23deconvolvedlognormtools_17outlierloglinearlike, NULL, __pyx_n_s_deconvolvedlognormtools); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 317, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_outlierloglinearlike, __pyx_t_1) < 0) __PYX_ERR(0, 243, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_outlierloglinearlike, __pyx_t_1) < 0) __PYX_ERR(0, 317, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":286
- * @cython.boundscheck(False)
+  /* "deconvolvedlognormtools.pyx":358
+ * 
+ * 
+ * def trapezoidWeights(np.ndarray[np.double_t, ndim=2, mode='c'] delta_masses):             # <<<<<<<<<<<<<<
+ *     '''Per-node trapezoid weights; delta_masses is one shorter per row than the mass grid'''
+ * 
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_23deconvolvedlognormtools_19trapezoidWeights, NULL, __pyx_n_s_deconvolvedlognormtools); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 358, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_trapezoidWeights, __pyx_t_1) < 0) __PYX_ERR(0, 358, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "deconvolvedlognormtools.pyx":370
+ * ###
+ * 
+ * def precomputeGaussMix1D(np.ndarray[np.double_t, ndim=2, mode='c'] delta_mls,             # <<<<<<<<<<<<<<
+ *                          np.ndarray[np.double_t, ndim=2, mode='c'] delta_masses,
+ *                          np.ndarray[np.double_t, ndim=2, mode='c'] pdfs):
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_23deconvolvedlognormtools_21precomputeGaussMix1D, NULL, __pyx_n_s_deconvolvedlognormtools); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 370, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_precomputeGaussMix1D, __pyx_t_1) < 0) __PYX_ERR(0, 370, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "deconvolvedlognormtools.pyx":389
  * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def pdfGaussMix1D_cached(np.ndarray[np.double_t, ndim=1, mode='c'] evalpoints,             # <<<<<<<<<<<<<<
+ *                          np.ndarray[np.intp_t, ndim=2, mode='c'] evalindex,
+ *                          np.ndarray[np.double_t, ndim=2, mode='c'] weightedpdfs,
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_23deconvolvedlognormtools_23pdfGaussMix1D_cached, NULL, __pyx_n_s_deconvolvedlognormtools); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 389, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pdfGaussMix1D_cached, __pyx_t_1) < 0) __PYX_ERR(0, 389, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "deconvolvedlognormtools.pyx":445
+ * ###
+ * 
  * def pdfGaussMix1D(np.ndarray[np.double_t, ndim=2, mode='c'] delta_mls,             # <<<<<<<<<<<<<<
  *                   np.ndarray[np.double_t, ndim=2, mode='c'] delta_masses,
  *                   np.ndarray[np.double_t, ndim=2, mode='c'] pdfs,
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_9nfwfitter_23deconvolvedlognormtools_15pdfGaussMix1D, NULL, __pyx_n_s_nfwfitter_deconvolvedlognormtool); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 286, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_23deconvolvedlognormtools_25pdfGaussMix1D, NULL, __pyx_n_s_deconvolvedlognormtools); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 445, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pdfGaussMix1D, __pyx_t_1) < 0) __PYX_ERR(0, 286, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pdfGaussMix1D, __pyx_t_1) < 0) __PYX_ERR(0, 445, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "nfwfitter/deconvolvedlognormtools.pyx":1
+  /* "deconvolvedlognormtools.pyx":1
  * ################################             # <<<<<<<<<<<<<<
  * # Likelihood for lognormal scatter with normal noise
  * ################################
@@ -8525,11 +11181,11 @@ PyMODINIT_FUNC PyInit_deconvolvedlognormtools(void)
   __Pyx_XDECREF(__pyx_t_2);
   if (__pyx_m) {
     if (__pyx_d) {
-      __Pyx_AddTraceback("init nfwfitter.deconvolvedlognormtools", __pyx_clineno, __pyx_lineno, __pyx_filename);
+      __Pyx_AddTraceback("init deconvolvedlognormtools", __pyx_clineno, __pyx_lineno, __pyx_filename);
     }
     Py_DECREF(__pyx_m); __pyx_m = 0;
   } else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_ImportError, "init nfwfitter.deconvolvedlognormtools");
+    PyErr_SetString(PyExc_ImportError, "init deconvolvedlognormtools");
   }
   __pyx_L0:;
   __Pyx_RefNannyFinishContext();
@@ -8558,6 +11214,20 @@ end:
 }
 #endif
 
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
 /* RaiseArgTupleInvalid */
 static void __Pyx_RaiseArgtupleInvalid(
     const char* func_name,
@@ -8700,20 +11370,6 @@ bad:
     return -1;
 }
 
-/* GetBuiltinName */
-static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
-    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
-    if (unlikely(!result)) {
-        PyErr_Format(PyExc_NameError,
-#if PY_MAJOR_VERSION >= 3
-            "name '%U' is not defined", name);
-#else
-            "name '%.200s' is not defined", PyString_AS_STRING(name));
-#endif
-    }
-    return result;
-}
-
 /* GetModuleGlobalName */
 static CYTHON_INLINE PyObject *__Pyx_GetModuleGlobalName(PyObject *name) {
     PyObject *result;
@@ -9568,144 +12224,205 @@ static CYTHON_INLINE int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, in
     return 0;
 }
 
-/* PyFloatBinop */
+/* GetItemInt */
+      static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (!j) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    if (wraparound & unlikely(i < 0)) i += PyList_GET_SIZE(o);
+    if ((!boundscheck) || likely((0 <= i) & (i < PyList_GET_SIZE(o)))) {
+        PyObject *r = PyList_GET_ITEM(o, i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    if (wraparound & unlikely(i < 0)) i += PyTuple_GET_SIZE(o);
+    if ((!boundscheck) || likely((0 <= i) & (i < PyTuple_GET_SIZE(o)))) {
+        PyObject *r = PyTuple_GET_ITEM(o, i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     CYTHON_NCP_UNUSED int wraparound,
+                                                     CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((!boundscheck) || (likely((n >= 0) & (n < PyList_GET_SIZE(o))))) {
+            PyObject *r = PyList_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    else if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely((n >= 0) & (n < PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    } else {
+        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+        if (likely(m && m->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+                Py_ssize_t l = m->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return NULL;
+                    PyErr_Clear();
+                }
+            }
+            return m->sq_item(o, i);
+        }
+    }
+#else
+    if (is_list || PySequence_Check(o)) {
+        return PySequence_GetItem(o, i);
+    }
+#endif
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+}
+
+/* PyIntBinop */
       #if !CYTHON_COMPILING_IN_PYPY
-static PyObject* __Pyx_PyFloat_SubtractCObj(PyObject *op1, PyObject *op2, double floatval, CYTHON_UNUSED int inplace) {
-    const double a = floatval;
-    double b, result;
-    if (likely(PyFloat_CheckExact(op2))) {
-        b = PyFloat_AS_DOUBLE(op2);
-    } else
+static PyObject* __Pyx_PyInt_SubtractObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, CYTHON_UNUSED int inplace) {
     #if PY_MAJOR_VERSION < 3
-    if (likely(PyInt_CheckExact(op2))) {
-        b = (double) PyInt_AS_LONG(op2);
-    } else
+    if (likely(PyInt_CheckExact(op1))) {
+        const long b = intval;
+        long x;
+        long a = PyInt_AS_LONG(op1);
+            x = (long)((unsigned long)a - b);
+            if (likely((x^a) >= 0 || (x^~b) >= 0))
+                return PyInt_FromLong(x);
+            return PyLong_Type.tp_as_number->nb_subtract(op1, op2);
+    }
     #endif
-    if (likely(PyLong_CheckExact(op2))) {
-        #if CYTHON_USE_PYLONG_INTERNALS
-        const digit* digits = ((PyLongObject*)op2)->ob_digit;
-        const Py_ssize_t size = Py_SIZE(op2);
-        switch (size) {
-            case  0: b = 0.0; break;
-            case -1: b = -(double) digits[0]; break;
-            case  1: b = (double) digits[0]; break;
-            case -2:
-            case 2:
-                if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (1 * PyLong_SHIFT < 53))) {
-                    b = (double) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                    if ((8 * sizeof(unsigned long) < 53) || (2 * PyLong_SHIFT < 53) || (b < (double) (1L<<53))) {
-                        if (size == -2)
-                            b = -b;
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1))) {
+        const long b = intval;
+        long a, x;
+#ifdef HAVE_LONG_LONG
+        const PY_LONG_LONG llb = intval;
+        PY_LONG_LONG lla, llx;
+#endif
+        const digit* digits = ((PyLongObject*)op1)->ob_digit;
+        const Py_ssize_t size = Py_SIZE(op1);
+        if (likely(__Pyx_sst_abs(size) <= 1)) {
+            a = likely(size) ? digits[0] : 0;
+            if (size == -1) a = -a;
+        } else {
+            switch (size) {
+                case -2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
                         break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
                     }
-                }
-            case -3:
-            case 3:
-                if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (2 * PyLong_SHIFT < 53))) {
-                    b = (double) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                    if ((8 * sizeof(unsigned long) < 53) || (3 * PyLong_SHIFT < 53) || (b < (double) (1L<<53))) {
-                        if (size == -3)
-                            b = -b;
+                case 2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
                         break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
                     }
-                }
-            case -4:
-            case 4:
-                if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (3 * PyLong_SHIFT < 53))) {
-                    b = (double) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                    if ((8 * sizeof(unsigned long) < 53) || (4 * PyLong_SHIFT < 53) || (b < (double) (1L<<53))) {
-                        if (size == -4)
-                            b = -b;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
                         break;
-                    }
-                }
-            default:
-        #else
-        {
-        #endif
-            b = PyLong_AsDouble(op2);
-            if (unlikely(b == -1.0 && PyErr_Occurred())) return NULL;
-        }
-    } else {
-        return (inplace ? PyNumber_InPlaceSubtract : PyNumber_Subtract)(op1, op2);
-    }
-        PyFPE_START_PROTECT("subtract", return NULL)
-        result = a - b;
-        PyFPE_END_PROTECT(result)
-        return PyFloat_FromDouble(result);
-}
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
 #endif
-
-/* PyFloatBinop */
-        #if !CYTHON_COMPILING_IN_PYPY
-static PyObject* __Pyx_PyFloat_DivideCObj(PyObject *op1, PyObject *op2, double floatval, CYTHON_UNUSED int inplace) {
-    const double a = floatval;
-    double b, result;
-    if (likely(PyFloat_CheckExact(op2))) {
-        b = PyFloat_AS_DOUBLE(op2);
-    } else
-    #if PY_MAJOR_VERSION < 3
-    if (likely(PyInt_CheckExact(op2))) {
-        b = (double) PyInt_AS_LONG(op2);
-    } else
-    #endif
-    if (likely(PyLong_CheckExact(op2))) {
-        #if CYTHON_USE_PYLONG_INTERNALS
-        const digit* digits = ((PyLongObject*)op2)->ob_digit;
-        const Py_ssize_t size = Py_SIZE(op2);
-        switch (size) {
-            case  0: b = 0.0; break;
-            case -1: b = -(double) digits[0]; break;
-            case  1: b = (double) digits[0]; break;
-            case -2:
-            case 2:
-                if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (1 * PyLong_SHIFT < 53))) {
-                    b = (double) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                    if ((8 * sizeof(unsigned long) < 53) || (2 * PyLong_SHIFT < 53) || (b < (double) (1L<<53))) {
-                        if (size == -2)
-                            b = -b;
+                    }
+                case 3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
                         break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
                     }
-                }
-            case -3:
-            case 3:
-                if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (2 * PyLong_SHIFT < 53))) {
-                    b = (double) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                    if ((8 * sizeof(unsigned long) < 53) || (3 * PyLong_SHIFT < 53) || (b < (double) (1L<<53))) {
-                        if (size == -3)
-                            b = -b;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
                         break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
                     }
-                }
-            case -4:
-            case 4:
-                if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (3 * PyLong_SHIFT < 53))) {
-                    b = (double) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                    if ((8 * sizeof(unsigned long) < 53) || (4 * PyLong_SHIFT < 53) || (b < (double) (1L<<53))) {
-                        if (size == -4)
-                            b = -b;
+                case 4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
                         break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
                     }
-                }
-            default:
-        #else
-        {
-        #endif
-            b = PyLong_AsDouble(op2);
-            if (unlikely(b == -1.0 && PyErr_Occurred())) return NULL;
+                default: return PyLong_Type.tp_as_number->nb_subtract(op1, op2);
+            }
         }
-    } else {
-        return (inplace ? __Pyx_PyNumber_InPlaceDivide(op1, op2) : __Pyx_PyNumber_Divide(op1, op2));
+                x = a - b;
+            return PyLong_FromLong(x);
+#ifdef HAVE_LONG_LONG
+        long_long:
+                llx = lla - llb;
+            return PyLong_FromLongLong(llx);
+#endif
+        
+        
     }
-        PyFPE_START_PROTECT("divide", return NULL)
-        result = a / b;
-        PyFPE_END_PROTECT(result)
-        return PyFloat_FromDouble(result);
+    #endif
+    if (PyFloat_CheckExact(op1)) {
+        const long b = intval;
+        double a = PyFloat_AS_DOUBLE(op1);
+            double result;
+            PyFPE_START_PROTECT("subtract", return NULL)
+            result = ((double)a) - (double)b;
+            PyFPE_END_PROTECT(result)
+            return PyFloat_FromDouble(result);
+    }
+    return (inplace ? PyNumber_InPlaceSubtract : PyNumber_Subtract)(op1, op2);
 }
 #endif
 
 /* RaiseException */
-          #if PY_MAJOR_VERSION < 3
+      #if PY_MAJOR_VERSION < 3
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
                         CYTHON_UNUSED PyObject *cause) {
     __Pyx_PyThreadState_declare
@@ -9867,26 +12584,100 @@ bad:
 }
 #endif
 
+/* BufferFallbackError */
+        static void __Pyx_RaiseBufferFallbackError(void) {
+  PyErr_SetString(PyExc_ValueError,
+     "Buffer acquisition failed on assignment; and then reacquiring the old buffer failed too!");
+}
+
+/* PyObjectCallNoArg */
+        #if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, NULL, 0);
+    }
+#endif
+#ifdef __Pyx_CyFunction_USED
+    if (likely(PyCFunction_Check(func) || PyObject_TypeCheck(func, __pyx_CyFunctionType))) {
+#else
+    if (likely(PyCFunction_Check(func))) {
+#endif
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
+            return __Pyx_PyObject_CallMethO(func, NULL);
+        }
+    }
+    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
+}
+#endif
+
 /* RaiseTooManyValuesToUnpack */
-            static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
+          static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
     PyErr_Format(PyExc_ValueError,
                  "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
 }
 
 /* RaiseNeedMoreValuesToUnpack */
-            static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
+          static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
     PyErr_Format(PyExc_ValueError,
                  "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
                  index, (index == 1) ? "" : "s");
 }
 
+/* IterFinish */
+          static CYTHON_INLINE int __Pyx_IterFinish(void) {
+#if CYTHON_FAST_THREAD_STATE
+    PyThreadState *tstate = PyThreadState_GET();
+    PyObject* exc_type = tstate->curexc_type;
+    if (unlikely(exc_type)) {
+        if (likely(exc_type == PyExc_StopIteration) || PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration)) {
+            PyObject *exc_value, *exc_tb;
+            exc_value = tstate->curexc_value;
+            exc_tb = tstate->curexc_traceback;
+            tstate->curexc_type = 0;
+            tstate->curexc_value = 0;
+            tstate->curexc_traceback = 0;
+            Py_DECREF(exc_type);
+            Py_XDECREF(exc_value);
+            Py_XDECREF(exc_tb);
+            return 0;
+        } else {
+            return -1;
+        }
+    }
+    return 0;
+#else
+    if (unlikely(PyErr_Occurred())) {
+        if (likely(PyErr_ExceptionMatches(PyExc_StopIteration))) {
+            PyErr_Clear();
+            return 0;
+        } else {
+            return -1;
+        }
+    }
+    return 0;
+#endif
+}
+
+/* UnpackItemEndCheck */
+          static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
+    if (unlikely(retval)) {
+        Py_DECREF(retval);
+        __Pyx_RaiseTooManyValuesError(expected);
+        return -1;
+    } else {
+        return __Pyx_IterFinish();
+    }
+    return 0;
+}
+
 /* RaiseNoneIterError */
-            static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
+          static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
 }
 
 /* SaveResetException */
-            #if CYTHON_FAST_THREAD_STATE
+          #if CYTHON_FAST_THREAD_STATE
 static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
     *type = tstate->exc_type;
     *value = tstate->exc_value;
@@ -9910,7 +12701,7 @@ static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject
 #endif
 
 /* PyErrExceptionMatches */
-            #if CYTHON_FAST_THREAD_STATE
+          #if CYTHON_FAST_THREAD_STATE
 static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
     PyObject *exc_type = tstate->curexc_type;
     if (exc_type == err) return 1;
@@ -9920,7 +12711,7 @@ static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tsta
 #endif
 
 /* GetException */
-            #if CYTHON_FAST_THREAD_STATE
+          #if CYTHON_FAST_THREAD_STATE
 static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
 #else
 static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb) {
@@ -9981,7 +12772,7 @@ bad:
 }
 
 /* Import */
-              static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+            static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
     PyObject *empty_list = 0;
     PyObject *module = 0;
     PyObject *global_dict = 0;
@@ -10055,7 +12846,7 @@ bad:
 }
 
 /* CodeObjectCache */
-              static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+            static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
     int start = 0, mid = 0, end = count - 1;
     if (end >= 0 && code_line > entries[end].code_line) {
         return count;
@@ -10135,7 +12926,7 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
 }
 
 /* AddTraceback */
-              #include "compile.h"
+            #include "compile.h"
 #include "frameobject.h"
 #include "traceback.h"
 static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
@@ -10236,8 +13027,70 @@ static void __Pyx_ReleaseBuffer(Py_buffer *view) {
 #endif
 
 
-              /* Declarations */
-              #if CYTHON_CCOMPLEX
+            /* CIntToPy */
+            static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+    const long neg_one = (long) -1, const_zero = (long) 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+            static CYTHON_INLINE PyObject* __Pyx_PyInt_From_Py_intptr_t(Py_intptr_t value) {
+    const Py_intptr_t neg_one = (Py_intptr_t) -1, const_zero = (Py_intptr_t) 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(Py_intptr_t) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(Py_intptr_t) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(Py_intptr_t) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(Py_intptr_t) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(Py_intptr_t) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(Py_intptr_t),
+                                     little, !is_unsigned);
+    }
+}
+
+/* Declarations */
+            #if CYTHON_CCOMPLEX
   #ifdef __cplusplus
     static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
       return ::std::complex< float >(x, y);
@@ -10257,7 +13110,7 @@ static void __Pyx_ReleaseBuffer(Py_buffer *view) {
 #endif
 
 /* Arithmetic */
-              #if CYTHON_CCOMPLEX
+            #if CYTHON_CCOMPLEX
 #else
     static CYTHON_INLINE int __Pyx_c_eq_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
        return (a.real == b.real) && (a.imag == b.imag);
@@ -10392,7 +13245,7 @@ static void __Pyx_ReleaseBuffer(Py_buffer *view) {
 #endif
 
 /* Declarations */
-              #if CYTHON_CCOMPLEX
+            #if CYTHON_CCOMPLEX
   #ifdef __cplusplus
     static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
       return ::std::complex< double >(x, y);
@@ -10412,7 +13265,7 @@ static void __Pyx_ReleaseBuffer(Py_buffer *view) {
 #endif
 
 /* Arithmetic */
-              #if CYTHON_CCOMPLEX
+            #if CYTHON_CCOMPLEX
 #else
     static CYTHON_INLINE int __Pyx_c_eq_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
        return (a.real == b.real) && (a.imag == b.imag);
@@ -10547,7 +13400,7 @@ static void __Pyx_ReleaseBuffer(Py_buffer *view) {
 #endif
 
 /* CIntToPy */
-              static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+            static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
     const int neg_one = (int) -1, const_zero = (int) 0;
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
@@ -10578,7 +13431,7 @@ static void __Pyx_ReleaseBuffer(Py_buffer *view) {
 }
 
 /* CIntFromPyVerify */
-              #define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+            #define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
     __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
 #define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
     __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
@@ -10600,7 +13453,7 @@ static void __Pyx_ReleaseBuffer(Py_buffer *view) {
     }
 
 /* CIntToPy */
-              static CYTHON_INLINE PyObject* __Pyx_PyInt_From_enum__NPY_TYPES(enum NPY_TYPES value) {
+            static CYTHON_INLINE PyObject* __Pyx_PyInt_From_enum__NPY_TYPES(enum NPY_TYPES value) {
     const enum NPY_TYPES neg_one = (enum NPY_TYPES) -1, const_zero = (enum NPY_TYPES) 0;
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
@@ -10631,7 +13484,7 @@ static void __Pyx_ReleaseBuffer(Py_buffer *view) {
 }
 
 /* CIntFromPy */
-              static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+            static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
     const int neg_one = (int) -1, const_zero = (int) 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
@@ -10819,39 +13672,8 @@ raise_neg_overflow:
     return (int) -1;
 }
 
-/* CIntToPy */
-              static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
-    const long neg_one = (long) -1, const_zero = (long) 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (is_unsigned) {
-        if (sizeof(long) < sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(long) <= sizeof(unsigned long)) {
-            return PyLong_FromUnsignedLong((unsigned long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
-            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
-#endif
-        }
-    } else {
-        if (sizeof(long) <= sizeof(long)) {
-            return PyInt_FromLong((long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
-            return PyLong_FromLongLong((PY_LONG_LONG) value);
-#endif
-        }
-    }
-    {
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&value;
-        return _PyLong_FromByteArray(bytes, sizeof(long),
-                                     little, !is_unsigned);
-    }
-}
-
 /* CIntFromPy */
-              static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+            static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
     const long neg_one = (long) -1, const_zero = (long) 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
@@ -11040,7 +13862,7 @@ raise_neg_overflow:
 }
 
 /* CheckBinaryVersion */
-              static int __Pyx_check_binary_version(void) {
+            static int __Pyx_check_binary_version(void) {
     char ctversion[4], rtversion[4];
     PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
     PyOS_snprintf(rtversion, 4, "%s", Py_GetVersion());
@@ -11056,7 +13878,7 @@ raise_neg_overflow:
 }
 
 /* ModuleImport */
-              #ifndef __PYX_HAVE_RT_ImportModule
+            #ifndef __PYX_HAVE_RT_ImportModule
 #define __PYX_HAVE_RT_ImportModule
 static PyObject *__Pyx_ImportModule(const char *name) {
     PyObject *py_name = 0;
@@ -11074,7 +13896,7 @@ bad:
 #endif
 
 /* TypeImport */
-              #ifndef __PYX_HAVE_RT_ImportType
+            #ifndef __PYX_HAVE_RT_ImportType
 #define __PYX_HAVE_RT_ImportType
 static PyTypeObject *__Pyx_ImportType(const char *module_name, const char *class_name,
     size_t size, int strict)
@@ -11139,7 +13961,7 @@ bad:
 #endif
 
 /* InitStrings */
-              static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+            static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
     while (t->p) {
         #if PY_MAJOR_VERSION < 3
         if (t->is_unicode) {
@@ -19,13 +19,17 @@ import scipy.stats
 
 
 cdef extern from "math.h":
-    double exp(double)
-    double log(double)
-    double sqrt(double)
+    double exp(double) nogil
+    double log(double) nogil
+    double sqrt(double) nogil
+    double erfc(double) nogil
 
 sqrt2pi = sqrt(2*np.pi)
 twopi = 2*np.pi
 
+cdef double sqrt2 = sqrt(2.)
+cdef double sqrt2pi_c = sqrt(2*np.pi)
+
 
 
 
@@ -93,39 +97,90 @@ def altintegral(np.ndarray[np.double_t, ndim=1, mode='c'] ml_ints,
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
+@cython.cdivision(True)
+cdef double pdfintegral_support(double * ml_ints,
+                                double * deltamasses,
+                                double * delta_logmls,
+                                double * pdf,
+                                Py_ssize_t nsamples,
+                                Py_ssize_t start,
+                                Py_ssize_t stop,
+                                double logmu, 
+                                double sigma) nogil:
+    ### trapezoid integral, where pdf is zero outside of [start, stop).
+    ### Only the segments touching the support are visited.
+
+    cdef Py_ssize_t i, first, last
+    cdef double thesum = 0.
+    cdef double neg2sigma2 = -2*(sigma**2)
+    cdef double sigmasqrt2pi = sigma*sqrt2pi_c
+    cdef double integrand, previntegrand
+
+    if stop <= start:
+        return 0.
+
+    integrand = exp((delta_logmls[start]-logmu)**2/neg2sigma2)/(sigmasqrt2pi*ml_ints[start])*pdf[start]
+
+    if start == 0:
+        thesum += 0.5*ml_ints[0]*integrand  #ml_ints[0] is deltamasses[-1]; integrand @ ml=0 is 0
+    else:
+        thesum += 0.5*deltamasses[start-1]*integrand  #left neighbour is outside the support
+
+    for i from start+1 <= i < stop:
+
+        previntegrand = integrand
+        integrand = exp((delta_logmls[i]-logmu)**2/neg2sigma2)/(sigmasqrt2pi*ml_ints[i])*pdf[i]
+
+        thesum += 0.5*deltamasses[i-1]*(integrand + previntegrand)
+
+    if stop < nsamples:
+        thesum += 0.5*deltamasses[stop-1]*integrand
+
+    return thesum
+
+###
+
+def checkPDFShapes(ml_ints, deltamasses, delta_logmls, pdf):
+    '''The pdf integrals read these unchecked; make sure they fit the mass grid'''
+
+    nsamples = ml_ints.shape[0]
+    if deltamasses.shape[0] < nsamples - 1:
+        raise ValueError('deltamasses needs at least %d entries, has %d' % (nsamples - 1, deltamasses.shape[0]))
+    if delta_logmls.shape[-1] != nsamples:
+        raise ValueError('delta_logmls has %d masses, grid has %d' % (delta_logmls.shape[-1], nsamples))
+    if pdf.shape[-1] != nsamples:
+        raise ValueError('pdf has %d masses, grid has %d' % (pdf.shape[-1], nsamples))
+
+def checkSupport(start, stop, nsamples):
+
+    if not (0 <= start <= stop <= nsamples):
+        raise ValueError('support [%d, %d) outside of the mass grid [0, %d)' % (start, stop, nsamples))
+
+###
+
 def pdfintegral(np.ndarray[np.double_t, ndim=1, mode='c'] ml_ints,
                 np.ndarray[np.double_t, ndim=1, mode='c'] deltamasses,
                 np.ndarray[np.double_t, ndim=1, mode='c'] delta_logmls,
                 np.ndarray[np.double_t, ndim=1, mode='c'] pdf,
                 double logmu, 
-                double sigma):
+                double sigma,
+                Py_ssize_t start = 0,
+                Py_ssize_t stop = -1):
     ### assumes that ml_ints = 0 is not included
     ### but that there is an implicit ml_ints = 0 calculation.
     ### deltamasses should be one less in length than ml_ints
+    ### pdf is taken to be zero outside of [start, stop); stop=-1 means the end of the grid
 
-    cdef Py_ssize_t i, nsamples
-    nsamples = ml_ints.shape[0]
-
-    cdef double thesum
-    thesum = 0.
-
-    cdef double sigma2, sigmasqrt2pi
-    neg2sigma2 = -2*(sigma**2)
-    sigmasqrt2pi = sigma*sqrt2pi
-
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] lognormpart = np.zeros(nsamples)
-
-    lognormpart[0] = exp((delta_logmls[0]-logmu)**2/neg2sigma2)/(sigmasqrt2pi*ml_ints[0])
-    thesum += 0.5*ml_ints[0]*lognormpart[0]*pdf[0]  #ml_ints[0] is deltamasses[-1]; integrand @ ml=0 is 0
-
-    for i from 1 <= i < nsamples:
+    checkPDFShapes(ml_ints, deltamasses, delta_logmls, pdf)
 
-        lognormpart[i] = exp((delta_logmls[i]-logmu)**2/neg2sigma2)/(sigmasqrt2pi*ml_ints[i])
+    cdef Py_ssize_t nsamples = ml_ints.shape[0]
+    if stop == -1:
+        stop = nsamples
+    checkSupport(start, stop, nsamples)
 
-        thesum += 0.5*deltamasses[i-1]*(lognormpart[i]*pdf[i] + lognormpart[i-1]*pdf[i-1])
-
-
-    return thesum
+    return pdfintegral_support(<double *> ml_ints.data, <double *> deltamasses.data,
+                               <double *> delta_logmls.data, <double *> pdf.data,
+                               nsamples, start, stop, logmu, sigma)
 
 
 
@@ -208,30 +263,49 @@ def pdfloglinearlike(np.ndarray[np.double_t, ndim=1, mode='c'] ml_ints,
                       np.ndarray[np.double_t, ndim=2, mode='c'] delta_logmls,
                       np.ndarray[np.double_t, ndim=2, mode='c'] pdfs,
                       double logmu, 
-                      double sigma):
+                      double sigma,
+                      np.ndarray[np.intp_t, ndim=2, mode='c'] supports = None):
+    ### supports, if given, is (nclusters x 2) [start, stop) of each nonzero pdf
 
 
-    cdef Py_ssize_t i, nclusters
+    checkPDFShapes(ml_ints, deltamasses, delta_logmls, pdfs)
+    if delta_logmls.shape[0] != pdfs.shape[0]:
+        raise ValueError('delta_logmls and pdfs have different numbers of clusters (%d, %d)' % \
+                             (delta_logmls.shape[0], pdfs.shape[0]))
+
+    cdef Py_ssize_t i, nclusters, nsamples
     nclusters = pdfs.shape[0]
+    nsamples = ml_ints.shape[0]
 
+    if supports is None:
+        supports = np.zeros((nclusters, 2), dtype=np.intp)
+        supports[:,1] = nsamples
+    else:
+        if supports.shape[0] != nclusters or supports.shape[1] != 2:
+            raise ValueError('supports should be (%d, 2), is (%d, %d)' % (nclusters, supports.shape[0], supports.shape[1]))
+        if ((supports[:,0] < 0) | (supports[:,1] < supports[:,0]) | (supports[:,1] > nsamples)).any():
+            raise ValueError('supports must satisfy 0 <= start <= stop <= %d' % nsamples)
+
+    cdef double * ml_data = <double *> ml_ints.data
+    cdef double * deltamass_data = <double *> deltamasses.data
+    cdef double * dlm_data = <double *> delta_logmls.data
+    cdef double * pdf_data = <double *> pdfs.data
 
     cdef double sumlogprob = 0.
     cdef double prob = 0.
 
-    
-
-    for i from nclusters > i >= 0:
+    with nogil:
+        for i from nclusters > i >= 0:
         
-        prob = pdfintegral(ml_ints,
-                           deltamasses,
-                           delta_logmls[i,:],
-                           pdfs[i,:],
-                           logmu,
-                           sigma)
+            prob = pdfintegral_support(ml_data, deltamass_data,
+                                       dlm_data + i*nsamples,
+                                       pdf_data + i*nsamples,
+                                       nsamples,
+                                       supports[i,0], supports[i,1],
+                                       logmu,
+                                       sigma)
 
-
-
-        sumlogprob += log(prob)
+            sumlogprob += log(prob)
 
     return sumlogprob
 
@@ -281,75 +355,102 @@ def outlierloglinearlike(np.ndarray[np.double_t, ndim=2, mode='c'] ml_ints,
 ###########
 
 
-@cython.boundscheck(False)
-@cython.wraparound(False)
-def pdfGaussMix1D(np.ndarray[np.double_t, ndim=2, mode='c'] delta_mls,
-                  np.ndarray[np.double_t, ndim=2, mode='c'] delta_masses,
-                  np.ndarray[np.double_t, ndim=2, mode='c'] pdfs,
-                  np.ndarray[np.double_t, ndim=1, mode='c'] pis,
-                  np.ndarray[np.double_t, ndim=1, mode='c'] mus,
-                  np.ndarray[np.double_t, ndim=1, mode='c'] tau2):
-                  
+def trapezoidWeights(np.ndarray[np.double_t, ndim=2, mode='c'] delta_masses):
+    '''Per-node trapezoid weights; delta_masses is one shorter per row than the mass grid'''
 
+    nclusters = delta_masses.shape[0]
+    weights = np.zeros((nclusters, delta_masses.shape[1]+1))
+    weights[:,:-1] += 0.5*delta_masses
+    weights[:,1:] += 0.5*delta_masses
 
-    cdef Py_ssize_t i, j, nclusters, ngauss, nmasses
-    nclusters = pdfs.shape[0]
-    ngauss = pis.shape[0]
-    nmasses = delta_mls.shape[1]
-
-    ### build intrinsic pdf
-
-    #normalization
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] norms = np.zeros(ngauss)
-    cdef double zeroboundrenorm
-    cdef double tau
-    for j from ngauss > j >= 0:
-        tau = sqrt(tau2[j])
-        zeroboundrenorm = 1. - scipy.stats.norm.cdf(-mus[j]/tau)
+    return weights
+
+###
+
+def precomputeGaussMix1D(np.ndarray[np.double_t, ndim=2, mode='c'] delta_mls,
+                         np.ndarray[np.double_t, ndim=2, mode='c'] delta_masses,
+                         np.ndarray[np.double_t, ndim=2, mode='c'] pdfs):
+    '''Fixed inputs for pdfGaussMix1D_cached.
+    Returns (evalpoints, evalindex, weightedpdfs): the distinct delta_ml values,
+    each node's index into them, and pdfs times trapezoid weights.'''
+
+    evalpoints, evalindex = np.unique(delta_mls, return_inverse=True)
+    evalindex = np.ascontiguousarray(evalindex.reshape(np.shape(delta_mls)), dtype=np.intp)
+
+    weightedpdfs = np.ascontiguousarray(pdfs*trapezoidWeights(delta_masses))
+
+    return evalpoints, evalindex, weightedpdfs
+
+###
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def pdfGaussMix1D_cached(np.ndarray[np.double_t, ndim=1, mode='c'] evalpoints,
+                         np.ndarray[np.intp_t, ndim=2, mode='c'] evalindex,
+                         np.ndarray[np.double_t, ndim=2, mode='c'] weightedpdfs,
+                         np.ndarray[np.double_t, ndim=1, mode='c'] pis,
+                         np.ndarray[np.double_t, ndim=1, mode='c'] mus,
+                         np.ndarray[np.double_t, ndim=1, mode='c'] tau2):
+
+    cdef Py_ssize_t i, j, k
+    cdef Py_ssize_t nclusters = weightedpdfs.shape[0]
+    cdef Py_ssize_t nmasses = weightedpdfs.shape[1]
+    cdef Py_ssize_t npoints = evalpoints.shape[0]
+    cdef Py_ssize_t ngauss = pis.shape[0]
+
+    ### mixture weights, truncated at 0 and renormalized
+
+    cdef np.ndarray[np.double_t, ndim=1, mode='c'] amplitudes = np.zeros(ngauss)
+    cdef np.ndarray[np.double_t, ndim=1, mode='c'] neghalfinvtau2 = np.zeros(ngauss)
+    cdef double zeroboundrenorm, tau
+    for k from 0 <= k < ngauss:
+        tau = sqrt(tau2[k])
+        zeroboundrenorm = 0.5*erfc(-mus[k]/(tau*sqrt2))
         if zeroboundrenorm < 1e-4:  #avoid divide by 0 by making it zero probability
             return -np.inf
-        norms[j] = 1./(zeroboundrenorm*sqrt2pi*tau)   #truncate at 0, boost normalization
+        amplitudes[k] = pis[k]/(zeroboundrenorm*sqrt2pi_c*tau)
+        neghalfinvtau2[k] = -0.5/tau2[k]
 
+    ### intrinsic pdf at every distinct evaluation point (points x components, dotted with amplitudes)
 
-    
-#    #exponentials
-#    cdef np.ndarray[np.double_t, ndim=1, mode='c'] intrinsicpdf = np.zeros(nmasses)
-
-#    for i from nmasses > i >= 0:
-#        for j from ngauss > j >= 0:
-#            deltamass_mu2 = (deltamasses[i] - mus[j])**2
-#            gausseval = pis[j]*exp(-0.5*deltamass_mu2/tau2[j])*norms[j]
-#            intrinsicpdf[i] = intrinsicpdf[i] + gausseval
-#            
-            
-    ### convolve with pdfs
+    cdef np.ndarray[np.double_t, ndim=1, mode='c'] intrinsicpdf = np.zeros(npoints)
+    cdef double x, dx, thesum
 
-    cdef double sumlogprob = 0.
-    cdef double deltamass_mu2, gausseval   
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] integrand = np.zeros(nmasses)
+    with nogil:
+        for i from 0 <= i < npoints:
+            x = evalpoints[i]
+            thesum = 0.
+            for k from 0 <= k < ngauss:
+                dx = x - mus[k]
+                thesum += amplitudes[k]*exp(neghalfinvtau2[k]*dx*dx)
+            intrinsicpdf[i] = thesum
 
-    for i from nclusters > i >= 0:
+    ### convolve with each halo's pdf
 
-        for j from nmasses > j >= 0:
-            integrand[j] = 0.
-        
-        for j from nmasses > j >= 0:
+    cdef double sumlogprob = 0.
+    cdef double prob
 
-            for k from ngauss > k >= 0:
+    with nogil:
+        for i from 0 <= i < nclusters:
+            prob = 0.
+            for j from 0 <= j < nmasses:
+                prob += weightedpdfs[i,j]*intrinsicpdf[evalindex[i,j]]
+            sumlogprob += log(prob)
 
-                deltamass_mu2 = (delta_mls[i,j] - mus[k])**2
-                gausseval = pis[k]*exp(-0.5*deltamass_mu2/tau2[k])*norms[k]
-                integrand[j] += gausseval
+    return sumlogprob
 
-            integrand[j] *= pdfs[i,j]
-            
-        #trapezoid rule
-        prob = 0.
-        for j from nmasses-1 > j >= 0:
-            prob += delta_masses[i,j]*(integrand[j+1] + integrand[j])
-        prob *= 0.5
+###
 
-        sumlogprob += log(prob)
+def pdfGaussMix1D(np.ndarray[np.double_t, ndim=2, mode='c'] delta_mls,
+                  np.ndarray[np.double_t, ndim=2, mode='c'] delta_masses,
+                  np.ndarray[np.double_t, ndim=2, mode='c'] pdfs,
+                  np.ndarray[np.double_t, ndim=1, mode='c'] pis,
+                  np.ndarray[np.double_t, ndim=1, mode='c'] mus,
+                  np.ndarray[np.double_t, ndim=1, mode='c'] tau2):
+    '''Gaussian mixture convolved with per-halo pdfs. For repeated calls on the same halos,
+    use precomputeGaussMix1D once and pdfGaussMix1D_cached.'''
 
-    return sumlogprob
+    evalpoints, evalindex, weightedpdfs = precomputeGaussMix1D(delta_mls, delta_masses, pdfs)
 
+    return pdfGaussMix1D_cached(evalpoints, evalindex, weightedpdfs, pis, mus, tau2)
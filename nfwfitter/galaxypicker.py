@@ -41,7 +41,7 @@ class DensityPicker(GalaxyPicker):
 
         self.nperarcmin = config['nperarcmin']
 
-    def mask(self, sim):
+    def targetNumber(self, sim):
 
         x_arcmin = sim.x_arcmin
         y_arcmin = sim.y_arcmin
@@ -69,14 +69,56 @@ class DensityPicker(GalaxyPicker):
         if targetnumber > availablenumber:
             raise InsufficientGalaxiesException
 
+        return targetnumber, availablenumber
+
+    def mask(self, sim):
+
+        targetnumber, availablenumber = self.targetNumber(sim)
+
         accept = float(targetnumber) / availablenumber
 
-        randomthrow = np.random.random(len(x_arcmin))
+        randomthrow = np.random.random(availablenumber)
 
         selected = randomthrow < accept
 
         return selected
 
+###
+
+def sampleIndices(availablenumber, targetnumber):
+    '''Uniformly draw targetnumber distinct indices from range(availablenumber), returned sorted.
+    Memory scales with targetnumber, not availablenumber.'''
+
+    if 2*targetnumber > availablenumber:
+        #dense selection; rejection of repeats would stall
+        return np.sort(np.random.permutation(availablenumber)[:targetnumber])
+
+    selected = np.unique(np.random.randint(0, availablenumber, targetnumber))
+    while len(selected) < targetnumber:
+        extra = np.random.randint(0, availablenumber, targetnumber - len(selected))
+        selected = np.unique(np.hstack([selected, extra]))
+
+    return selected
+
+###
+
+class StreamingDensityPicker(DensityPicker):
+    '''Same galaxy statistics as DensityPicker, but draws the selected pixel indices directly
+    instead of throwing a random number for every pixel. Only the selected rows are gathered
+    from the input catalog, so with lazily loaded maps (eg readMXXL with mxxl_memmap = True)
+    the full maps are never materialized.'''
+
+    def mask(self, sim):
+
+        targetnumber, availablenumber = self.targetNumber(sim)
+
+        accept = float(targetnumber) / availablenumber
+
+        #binomial number of hits, as for the per-pixel random throw in DensityPicker
+        nselected = np.random.binomial(availablenumber, accept)
+
+        return sampleIndices(availablenumber, nselected)
+
 ################################################
 #####################
 
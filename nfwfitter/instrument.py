@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+#######################
+# Per stage wall time, cpu time and memory for nfwfit runs.
+# runNFWFit_Preloaded writes one sidecar (<output>.timing, json) per fit when instrumented;
+# run this file on a set of sidecars to summarize where the time goes, per config and stage.
+#######################
+
+import os, sys, time, json, socket, resource, contextlib, argparse
+import numpy as np
+
+#######################
+
+pagesize = resource.getpagesize()
+
+def currentRSS():
+    '''Resident set size in MB (0 where /proc is unavailable)'''
+
+    try:
+        with open('/proc/self/statm') as input:
+            return int(input.read().split()[1])*pagesize/2.**20
+    except (IOError, IndexError, ValueError):
+        return 0.
+
+def peakRSS():
+    '''Peak resident set size of this process so far, in MB'''
+
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        return maxrss/2.**20
+    return maxrss/2.**10
+
+###
+
+def cpuTime():
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+#######################
+
+@contextlib.contextmanager
+def noTimer():
+    yield
+
+def stage(timer, name):
+    '''timer.stage(name), or a do nothing context if timer is None'''
+
+    if timer is None:
+        return noTimer()
+    return timer.stage(name)
+
+#######################
+
+class StageTimer(object):
+    '''Records wall time, cpu time, RSS change and peak RSS for each stage run under it.
+    Stages can nest; nested stage names are joined with dots.'''
+
+    def __init__(self, **info):
+
+        self.info = dict(host = socket.gethostname(), pid = os.getpid())
+        self.info.update(info)
+        self.stages = []
+        self.path = []
+        self.started = time.time()
+
+    @contextlib.contextmanager
+    def stage(self, name):
+
+        self.path.append(name)
+        record = dict(stage = '.'.join(self.path))
+        self.stages.append(record)
+
+        rss = currentRSS()
+        wall = time.time()
+        cpu = cpuTime()
+        try:
+            yield
+        finally:
+            record['wall'] = time.time() - wall
+            record['cpu'] = cpuTime() - cpu
+            record['rss'] = currentRSS()
+            record['rss_delta'] = record['rss'] - rss
+            record['peak_rss'] = peakRSS()
+            self.path.pop()
+
+    def summary(self):
+
+        return dict(info = self.info,
+                    total_wall = time.time() - self.started,
+                    stages = self.stages)
+
+    def write(self, filename):
+
+        with open(filename, 'w') as output:
+            json.dump(self.summary(), output, indent = 1)
+
+#######################
+
+def timingFile(outputname):
+
+    return '%s.timing' % outputname
+
+###
+
+def readTimings(files):
+
+    timings = []
+    for filename in files:
+        with open(filename) as input:
+            timings.append(json.load(input))
+
+    return timings
+
+###
+
+def aggregate(timings, groupby = 'config'):
+    '''{(group, stage) : dict(n, wall, cpu per call (median, mean, total), max peak_rss, mean rss_delta)}'''
+
+    collected = {}
+    for timing in timings:
+        group = timing['info'].get(groupby, '')
+        for record in timing['stages']:
+            if 'wall' not in record:
+                continue
+            collected.setdefault((group, record['stage']), []).append(record)
+
+    summary = {}
+    for key, records in collected.iteritems():
+        wall = np.array([x['wall'] for x in records])
+        cpu = np.array([x['cpu'] for x in records])
+        summary[key] = dict(n = len(records),
+                            wall_median = np.median(wall), wall_mean = np.mean(wall), wall_total = np.sum(wall),
+                            cpu_mean = np.mean(cpu), cpu_total = np.sum(cpu),
+                            rss_delta_mean = np.mean([x['rss_delta'] for x in records]),
+                            peak_rss = np.max([x['peak_rss'] for x in records]))
+
+    return summary
+
+###
+
+def printSummary(summary):
+
+    print '%-20s %-32s %6s %10s %10s %11s %9s %9s' % ('group', 'stage', 'n', 'med wall s', 'mean cpu s',
+                                                     'total wall h', 'dRSS MB', 'peak MB')
+    for group, stagename in sorted(summary.keys(), key = lambda x: (x[0], -summary[x]['wall_total'])):
+        entry = summary[(group, stagename)]
+        print '%-20s %-32s %6d %10.3f %10.3f %11.3f %9.1f %9.1f' % (group, stagename, entry['n'],
+                                                                   entry['wall_median'], entry['cpu_mean'],
+                                                                   entry['wall_total']/3600.,
+                                                                   entry['rss_delta_mean'], entry['peak_rss'])
+
+#######################
+
+def main(argv = sys.argv[1:]):
+
+    parser = argparse.ArgumentParser(description = 'Summarize nfwfit .timing sidecar files')
+    parser.add_argument('timingfiles', nargs = '+')
+    parser.add_argument('--groupby', default = 'config', help = 'info field to group by (config, simtype, host)')
+    args = parser.parse_args(argv)
+
+    printSummary(aggregate(readTimings(args.timingfiles), args.groupby))
+
+#######################
+
+if __name__ == '__main__':
+
+    main()
@@ -0,0 +1,362 @@
+#!/usr/bin/env python
+#######################
+# A shared, on disk queue of shell commands, for running many nfwfit / rundln jobs.
+# Workers (launched any number of times, on any node that sees the queue file) pull
+# the next task when a process slot frees up, so slow halos don't leave runners idle.
+# Tasks whose outputs already exist are skipped; failed tasks are retried.
+#######################
+
+import os, sys, time, json, socket, sqlite3, subprocess, argparse, tempfile, shutil, unittest
+import multiprocessing
+
+#######################
+
+schema = '''create table if not exists tasks (
+   id integer primary key,
+   command text unique,
+   outputs text,
+   logbase text,
+   status text default 'pending',
+   attempts integer default 0,
+   host text,
+   pid integer,
+   started real,
+   finished real,
+   walltime real,
+   cputime real,
+   returncode integer
+)'''
+
+###
+
+def outputsExist(outputs):
+
+    return len(outputs) > 0 and all([os.path.exists(x) for x in outputs])
+
+#######################
+
+class JobQueue(object):
+    '''Tasks are shell commands with a list of output files that mark them done.
+    Status moves pending -> running -> done | failed. Claims take a write lock on
+    the database, so any number of worker processes can share one queue file.'''
+
+    def __init__(self, dbfile, timeout = 600.):
+
+        self.dbfile = dbfile
+        self.db = sqlite3.connect(dbfile, timeout = timeout, isolation_level = None)
+        self.db.execute(schema)
+
+    def close(self):
+
+        self.db.close()
+
+    ###
+
+    def add(self, command, outputs, logbase = None):
+        '''Queue a command, unless it is already queued'''
+
+        self.db.execute('insert or ignore into tasks (command, outputs, logbase) values (?, ?, ?)',
+                        (command, json.dumps(list(outputs)), logbase))
+
+    def addMany(self, tasks):
+        '''tasks: list of (command, outputs, logbase)'''
+
+        self.db.execute('begin immediate')
+        try:
+            for command, outputs, logbase in tasks:
+                self.add(command, outputs, logbase)
+            self.db.execute('commit')
+        except:
+            self.db.execute('rollback')
+            raise
+
+    ###
+
+    def claim(self, maxattempts = 3):
+        '''Mark the next runnable task as running on this host and return (id, command, outputs, logbase),
+        or None if there is nothing left to run. Tasks with all outputs present are marked done instead.'''
+
+        while True:
+
+            self.db.execute('begin immediate')
+            try:
+                row = self.db.execute('''select id, command, outputs, logbase from tasks
+                                         where status = 'pending' or (status = 'failed' and attempts < ?)
+                                         order by attempts, id limit 1''', (maxattempts,)).fetchone()
+                if row is None:
+                    self.db.execute('commit')
+                    return None
+
+                taskid, command, outputs, logbase = row
+                outputs = json.loads(outputs)
+
+                if outputsExist(outputs):
+                    self.db.execute("update tasks set status = 'done' where id = ?", (taskid,))
+                    self.db.execute('commit')
+                    continue
+
+                self.db.execute('''update tasks set status = 'running', attempts = attempts + 1,
+                                   host = ?, pid = ?, started = ?, finished = null, returncode = null
+                                   where id = ?''',
+                                (socket.gethostname(), os.getpid(), time.time(), taskid))
+                self.db.execute('commit')
+
+            except:
+                self.db.execute('rollback')
+                raise
+
+            return taskid, command, outputs, logbase
+
+    def finish(self, taskid, outputs, returncode, walltime, cputime):
+        '''A task is done only if it exited cleanly and wrote its outputs'''
+
+        status = 'failed'
+        if returncode == 0 and (len(outputs) == 0 or outputsExist(outputs)):
+            status = 'done'
+
+        self.db.execute('''update tasks set status = ?, finished = ?, walltime = ?, cputime = ?, returncode = ?
+                           where id = ?''',
+                        (status, time.time(), walltime, cputime, returncode, taskid))
+
+    ###
+
+    def requeue(self, failed = True, stale = None):
+        '''Send failed tasks back to pending (with a fresh attempt count), and tasks
+        that have been running longer than stale seconds (eg their worker was killed)'''
+
+        nfailed, nstale = 0, 0
+        self.db.execute('begin immediate')
+        if failed:
+            nfailed = self.db.execute("update tasks set status = 'pending', attempts = 0 where status = 'failed'").rowcount
+        if stale is not None:
+            nstale = self.db.execute("update tasks set status = 'pending' where status = 'running' and started < ?",
+                                     (time.time() - stale,)).rowcount
+        self.db.execute('commit')
+
+        return nfailed, nstale
+
+    ###
+
+    def counts(self):
+
+        return dict(self.db.execute('select status, count(*) from tasks group by status').fetchall())
+
+    def timings(self):
+        '''(command, host, walltime, cputime) for every finished task'''
+
+        return self.db.execute('''select command, host, walltime, cputime from tasks
+                                  where walltime is not null order by walltime desc''').fetchall()
+
+#######################
+
+def runTask(command, logbase = None):
+    '''Run a shell command, returning (returncode, walltime, cputime of the children)'''
+
+    stdout, stderr = None, None
+    if logbase is not None:
+        stdout = open('%s.stdout' % logbase, 'w')
+        stderr = open('%s.stderr' % logbase, 'w')
+
+    start = time.time()
+    startcpu = os.times()
+    try:
+        returncode = subprocess.call(command, shell = True, stdout = stdout, stderr = stderr)
+    finally:
+        if logbase is not None:
+            stdout.close()
+            stderr.close()
+    endcpu = os.times()
+
+    cputime = (endcpu[2] - startcpu[2]) + (endcpu[3] - startcpu[3])
+
+    return returncode, time.time() - start, cputime
+
+###
+
+def workerLoop(dbfile, maxattempts = 3):
+    '''Claim and run tasks until the queue is empty. Returns the number of tasks run.'''
+
+    queue = JobQueue(dbfile)
+
+    nrun = 0
+    while True:
+        task = queue.claim(maxattempts)
+        if task is None:
+            break
+
+        taskid, command, outputs, logbase = task
+        print '%s: starting %s' % (time.ctime(), command)
+        sys.stdout.flush()
+
+        returncode, walltime, cputime = runTask(command, logbase)
+        queue.finish(taskid, outputs, returncode, walltime, cputime)
+        nrun += 1
+
+        print '%s: finished %s (exit %d, %.1f s)' % (time.ctime(), command, returncode, walltime)
+        sys.stdout.flush()
+
+    queue.close()
+
+    return nrun
+
+###
+
+def runWorkers(dbfile, nprocs = None, maxattempts = 3):
+    '''Run nprocs local worker processes against the queue; returns when it is drained'''
+
+    if nprocs is None:
+        nprocs = multiprocessing.cpu_count()
+
+    if nprocs == 1:
+        return workerLoop(dbfile, maxattempts)
+
+    pool = multiprocessing.Pool(nprocs)
+    try:
+        nrun = pool.map(_workerLoopStar, [(dbfile, maxattempts)]*nprocs, chunksize = 1)
+    finally:
+        pool.close()
+        pool.join()
+
+    return sum(nrun)
+
+def _workerLoopStar(args):
+
+    return workerLoop(*args)
+
+#######################
+
+def printStatus(queue, ntimes = 10):
+
+    counts = queue.counts()
+    for status in 'pending running done failed'.split():
+        print '%8s %d' % (status, counts.get(status, 0))
+
+    timings = queue.timings()
+    if len(timings) > 0:
+        walltimes = [x[2] for x in timings]
+        print 'Wall time per task: total %.1f h, mean %.1f s, max %.1f s' % (sum(walltimes)/3600.,
+                                                                             sum(walltimes)/len(walltimes),
+                                                                             max(walltimes))
+        print 'Slowest:'
+        for command, host, walltime, cputime in timings[:ntimes]:
+            print '  %8.1f s  %8.1f cpu s  %s  %s' % (walltime, cputime, host, command)
+
+#######################
+
+def main(argv = sys.argv[1:]):
+
+    parser = argparse.ArgumentParser(description = 'Run or inspect a shared job queue')
+    parser.add_argument('action', choices = ['work', 'status', 'requeue'])
+    parser.add_argument('queuefile')
+    parser.add_argument('--nprocs', type = int, default = None,
+                        help = 'worker processes on this node (default: number of cpus)')
+    parser.add_argument('--maxattempts', type = int, default = 3,
+                        help = 'times to try a task before leaving it failed')
+    parser.add_argument('--stale', type = float, default = None,
+                        help = 'requeue: also requeue tasks running for longer than this many seconds')
+    args = parser.parse_args(argv)
+
+    if args.action == 'work':
+        nrun = runWorkers(args.queuefile, args.nprocs, args.maxattempts)
+        print 'Ran %d tasks' % nrun
+
+    elif args.action == 'status':
+        printStatus(JobQueue(args.queuefile))
+
+    elif args.action == 'requeue':
+        nfailed, nstale = JobQueue(args.queuefile).requeue(stale = args.stale)
+        print 'Requeued %d failed and %d stale tasks' % (nfailed, nstale)
+
+#######################
+
+class TestJobQueue(unittest.TestCase):
+
+    def setUp(self):
+
+        self.tempdir = tempfile.mkdtemp()
+        self.queuefile = os.path.join(self.tempdir, 'queue.db')
+        self.queue = JobQueue(self.queuefile)
+
+    def tearDown(self):
+
+        self.queue.close()
+        shutil.rmtree(self.tempdir)
+
+    def path(self, name):
+
+        return os.path.join(self.tempdir, name)
+
+    def work(self, maxattempts = 3):
+
+        stdout = sys.stdout
+        sys.stdout = open(os.devnull, 'w')
+        try:
+            return workerLoop(self.queuefile, maxattempts)
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+
+    def status(self, command):
+
+        return self.queue.db.execute('select status, attempts from tasks where command = ?', (command,)).fetchone()
+
+    def testClaimFinish(self):
+
+        self.queue.addMany([('touch %s' % self.path('a'), [self.path('a')], None),
+                            ('touch %s' % self.path('b'), [self.path('b')], None)])
+        self.queue.add('touch %s' % self.path('a'), [self.path('a')])    #already queued
+
+        taskid, command, outputs, logbase = self.queue.claim()
+        self.assertEqual(command, 'touch %s' % self.path('a'))
+        self.assertEqual(self.status(command), ('running', 1))
+
+        self.queue.finish(taskid, outputs, 0, 0., 0.)    #exited cleanly, but no output
+        self.assertEqual(self.status(command), ('failed', 1))
+
+        self.assertEqual(self.work(), 2)
+        self.assertEqual(self.queue.counts(), {'done' : 2})
+        self.assertTrue(os.path.exists(self.path('a')) and os.path.exists(self.path('b')))
+        self.assertEqual(self.queue.claim(), None)
+
+    def testSkipsExistingOutputs(self):
+
+        open(self.path('exists'), 'w').close()
+        command = 'touch %s; false' % self.path('ran')
+        self.queue.add(command, [self.path('exists')])
+
+        self.assertEqual(self.queue.claim(), None)
+        self.assertEqual(self.status(command), ('done', 0))
+        self.assertFalse(os.path.exists(self.path('ran')))
+
+    def testRetryAndRequeue(self):
+
+        self.queue.add('false', [])
+        self.queue.add('true', [])
+
+        self.assertEqual(self.work(maxattempts = 3), 4)
+        self.assertEqual(self.status('false'), ('failed', 3))
+        self.assertEqual(self.status('true'), ('done', 1))
+
+        self.assertEqual(self.queue.requeue(), (1, 0))
+        self.assertEqual(self.status('false'), ('pending', 0))
+
+        taskid, command, outputs, logbase = self.queue.claim()
+        self.assertEqual(self.queue.requeue(failed = False, stale = 1000.), (0, 0))
+        self.queue.db.execute('update tasks set started = ? where id = ?', (time.time() - 100., taskid))
+        self.assertEqual(self.queue.requeue(failed = False, stale = 10.), (0, 1))
+        self.assertEqual(self.status('false'), ('pending', 1))
+
+#######################
+
+def test():
+
+    testcases = [TestJobQueue]
+    suite = unittest.TestSuite(map(unittest.TestLoader().loadTestsFromTestCase,
+                                   testcases))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+#######################
+
+if __name__ == '__main__':
+
+    main()
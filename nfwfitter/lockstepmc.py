@@ -0,0 +1,237 @@
+'''
+Slice sample many independent posteriors in lockstep.
+
+Every chain takes the step of mymc.Slice under a MultiDimUpdater: a random direction scaled
+by the chain's adapted covariance, stepping out, then shrinking in. The chains move together
+as arrays, so each loop makes one call to a batched log posterior for all chains still working.
+'''
+
+############
+
+import unittest
+import numpy as np
+
+############
+
+class LockstepSlice(object):
+    '''Constructor arguments:
+     1* logposterior(x, rows): x is a (len(rows) x nparams) array of positions for the chains
+        numbered in rows. Returns (log posterior, likelihood) arrays of length len(rows),
+        with -inf for zero probability. The likelihood is recorded alongside the chain.
+     2* (nchains x nparams) initial step widths
+     3  number of steps between adaptations, and
+     4  number of steps before the first one, as for mymc.Updater
+     5  width_factor and maxiter, as for mymc.Slice
+    '''
+
+    def __init__(self, logposterior, widths, adapt_every = 100, adapt_starting = 100,
+                 width_factor = 2.4, maxiter = 100):
+
+        self.logposterior = logposterior
+        self.widths = np.array(widths, dtype=np.float64)
+        self.nchains, self.nparams = self.widths.shape
+        self.basis = np.tile(np.eye(self.nparams), (self.nchains, 1, 1))
+
+        self.adapt = adapt_every > 0
+        self.adapt_every = adapt_every
+        self.adapt_start = max(1, adapt_starting)
+        self.width_fac = width_factor
+        self.maxiter = maxiter
+
+        self.count = 0
+        self.means = np.zeros((self.nchains, self.nparams))
+        self.covariances = np.zeros((self.nchains, self.nparams, self.nparams))
+
+    ###
+
+    def evaluate(self, x, rows):
+
+        logp, likelihood = self.logposterior(x, rows)
+
+        return np.asarray(logp, dtype=np.float64), np.asarray(likelihood, dtype=np.float64)
+
+    ###
+
+    def start(self, x0):
+
+        self.x = np.array(x0, dtype=np.float64)
+        assert(self.x.shape == (self.nchains, self.nparams))
+
+        self.logp, self.likelihood = self.evaluate(self.x, np.arange(self.nchains))
+        if not np.all(np.isfinite(self.logp)):
+            raise ValueError('Chains %s start at zero probability' % np.nonzero(np.logical_not(np.isfinite(self.logp)))[0])
+
+    ###
+
+    def chooseDirections(self):
+        '''Random unit directions in each chain's scaled eigenbasis, with their widths'''
+
+        u = np.random.standard_normal((self.nchains, self.nparams))
+        u /= np.sqrt(np.sum(u**2, axis=1))[:,None]
+
+        directions = np.einsum('nij,nj->ni', self.basis, self.widths*u)
+        width = np.sqrt(np.sum(directions**2, axis=1))
+
+        return directions/width[:,None], width
+
+    ###
+
+    def step(self):
+
+        if self.adapt and self.count >= self.adapt_start and self.count % self.adapt_every == 0:
+            self.doAdapt()
+
+        directions, width = self.chooseDirections()
+        origin = self.x.copy()
+
+        def position(rows, t):
+            return origin[rows] + (t*width[rows])[:,None]*directions[rows]
+
+        z = self.logp - np.random.exponential(size=self.nchains)   # log level of each slice
+        L = -self.width_fac*np.random.random_sample(self.nchains)   # edges, in units of width
+        R = L + self.width_fac
+
+        for edge, sign in ((L, -1.), (R, 1.)):
+            active = np.arange(self.nchains)
+            for i in range(self.maxiter):
+                if len(active) == 0:
+                    break
+                lnew, ignore = self.evaluate(position(active, edge[active]), active)
+                active = active[lnew > z[active]]
+                edge[active] += sign*self.width_fac
+
+        #chains that exhaust the stepping in loop stay put
+        active = np.arange(self.nchains)
+        for i in range(self.maxiter):
+            if len(active) == 0:
+                break
+            t = L[active] + (R[active] - L[active])*np.random.random_sample(len(active))
+            xnew = position(active, t)
+            lnew, likenew = self.evaluate(xnew, active)
+
+            accepted = lnew >= z[active]
+            rows = active[accepted]
+            self.x[rows] = xnew[accepted]
+            self.logp[rows] = lnew[accepted]
+            self.likelihood[rows] = likenew[accepted]
+
+            rejected = np.logical_not(accepted)
+            active, t = active[rejected], t[rejected]
+            left = t < 0
+            L[active[left]] = t[left]
+            R[active[np.logical_not(left)]] = t[np.logical_not(left)]
+
+        self.accumulate()
+
+    ###
+
+    def accumulate(self):
+        '''One-pass (Welford) update of each chain's mean and (count-1)*covariance'''
+
+        self.count += 1
+        if self.adapt:
+            d = self.x - self.means
+            self.means += d / self.count
+            self.covariances += (self.count - 1.0)/self.count * d[:,:,None]*d[:,None,:]
+
+    ###
+
+    def doAdapt(self):
+
+        evals, basis = np.linalg.eigh(self.covariances / (self.count - 1.0))
+
+        #leave chains with a degenerate covariance on their old proposal
+        ok = np.all(evals > 0, axis=1)
+        self.basis[ok] = basis[ok]
+        self.widths[ok] = np.sqrt(evals[ok])
+
+    ###
+
+    def __call__(self, x0, nsamples, burn = 0, thin = 1, stop = None, check_every = 500, min_iterations = 1000):
+        '''Run every chain from x0 for nsamples steps. Returns the kept positions,
+        (nkept x nchains x nparams), and their likelihoods, (nkept x nchains).
+        If given, stop(positions kept so far) is called every check_every steps, from
+        min_iterations on; the chains end early when it returns True (see mymc.Engine).'''
+
+        self.start(x0)
+
+        nkept = len(range(burn, nsamples, thin))
+        samples = np.zeros((nkept, self.nchains, self.nparams))
+        likelihoods = np.zeros((nkept, self.nchains))
+
+        j = 0
+        for i in range(nsamples):
+            self.step()
+            if i >= burn and (i - burn) % thin == 0:
+                samples[j] = self.x
+                likelihoods[j] = self.likelihood
+                j += 1
+            if stop is not None and i + 1 >= min_iterations and (i + 1) % check_every == 0 and stop(samples[:j]):
+                break
+
+        return samples[:j], likelihoods[:j]
+
+############
+
+class TestLockstepSlice(unittest.TestCase):
+
+    #a different 2d gaussian for each chain
+    means = np.array([[-1., 1.], [10., 0.], [0., -5.]])
+    covariances = np.array([[[4., 4.5], [4.5, 9.]],
+                            [[0.01, 0.], [0., 1.]],
+                            [[1., -0.9], [-0.9, 1.]]])
+
+    def logPosterior(self, x, rows):
+
+        d = x - self.means[rows]
+        logp = -0.5*np.einsum('ni,nij,nj->n', d, np.linalg.inv(self.covariances[rows]), d)
+
+        return logp, logp
+
+    def runChains(self, chains, nsamples = 20000, burn = 1000):
+
+        np.random.seed(5)
+        sampler = LockstepSlice(lambda x, rows: self.logPosterior(x, chains[rows]), np.ones((len(chains), 2)))
+        samples, likelihoods = sampler(self.means[chains] + 1., nsamples, burn = burn)
+
+        return samples
+
+    def testMoments(self):
+
+        lockstep = self.runChains(np.arange(3))
+        single = self.runChains(np.array([2]))[:,0]
+
+        for i, samples in [(0, lockstep[:,0]), (1, lockstep[:,1]), (2, lockstep[:,2]), (2, single)]:
+            sigmas = np.sqrt(np.diag(self.covariances[i]))
+            self.assertTrue((np.abs(np.mean(samples, axis=0) - self.means[i]) < 0.1*sigmas).all())
+            samplecovar = np.cov(samples, rowvar=False)
+            self.assertTrue((np.abs(np.diag(samplecovar)/sigmas**2 - 1) < 0.1).all())
+            self.assertAlmostEqual(samplecovar[0,1]/np.prod(np.sqrt(np.diag(samplecovar))),
+                                   self.covariances[i,0,1]/np.prod(sigmas), delta = 0.05)
+
+    def testBurnThinStop(self):
+
+        np.random.seed(5)
+        sampler = LockstepSlice(lambda x, rows: self.logPosterior(x, rows), np.ones((3, 2)))
+        samples, likelihoods = sampler(self.means + 1., 1000, burn = 200, thin = 4)
+        self.assertEqual(samples.shape, (200, 3, 2))
+        self.assertEqual(likelihoods.shape, (200, 3))
+
+        samples, likelihoods = sampler(self.means + 1., 1000, stop = lambda kept: len(kept) >= 300,
+                                       check_every = 100, min_iterations = 200)
+        self.assertEqual(len(samples), 300)
+
+############
+
+def test():
+
+    testcases = [TestLockstepSlice]
+    suite = unittest.TestSuite(map(unittest.TestLoader().loadTestsFromTestCase,
+                                   testcases))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+############
+
+if __name__ == '__main__':
+
+    test()
@@ -3,11 +3,15 @@
 A module for Markov Chain Monte Carlo. See help() and example().
 """
 
+import copy
 import csv
 import cPickle as pickle
 import glob
+import multiprocessing
 import numpy as np
+import os
 import sys
+import unittest
 try:
     from mpi4py import MPI
 except ImportError:
@@ -68,6 +72,7 @@ Finally, the ChiSquareLikelihood class may simplify the setup of least-squares s
 Communication between parallel chains can significantly speed up convergence. In parallel mode, adaptive Updaters use information from all running chains to tune their proposals, rather than only from their own chain. The Gelman-Rubin convergence criterion (ratio of inter- to intra-chain variances) for each free parameter is also calculated. Parallelization is implemented in two ways; see ?Updater for instructions on using each.
   1. Via MPI (using mpi4py). MPI adaptations are synchronous: when a chain reaches a communication point, it stops until all chains have caught up. All Updaters in a given chain should use the same communicator (at least, there's no advantage in doing otherwise). (This could be made safely asynchronous using shared memory, although I'm not sure that would be an improvement.)
   2. Via the filesystem. When a chain adapts, it will write its covariance information to a file. It will then read in any information from other chains that is present in similar files, and incorporate it when tuning. This process is asynchronous; chains will not wait for one another, they will simply adapt using whatever information has been shared at the time. The global variables parallel_filename_base and parallel_filename_ext can be used to customize the prefix and suffix of the files written.
+  3. Via shared memory, for chains running as processes on one machine (e.g. started with multiprocessing). This works like the filesystem version, asynchronously, but without files; see ?SharedExchange.
 
 
 The definition of an MCMC iteration in this implementation can be a little confusing. As far as an MultiDim updater object's 'count' attribute (controling the timing of adaptations, for example) is concerned, an iteration corresponds to one proposal along some direction. For Cartesian updaters, each iteration corresponds to a separate proposal for all of the Parameters in the Updater's ParameterSpace. (This disparity is unfortunate, but ensures that the count attribute is the correct value to use when, e.g., calculating chain vairnaces on the fly.) In either case, the Updater's rate attribute determines how many of these iterations occur each time the updater is called by the Engine (default=1). However, as far as the Engine is concerned, an iteration corresponds to a loop over all loaded Updaters. So if there are two MultiDim updaters, u1 and u2, with rates set to 1 and 2, and the Engine's updater list is [u2, u1, u2] (repetition is perfectly allowed, and sometimes desirable), then each iteration of the Engine actually corresponds to 1*u1.rate + 2*u2.rate = 5 proposals. However, if u1 is instead a Cartesian updater controlling 3 Parameters, then each engine iteration implies 7 proposals. The chain is stored to the Backends after each Engine iteration. The upshot of all this is that there's lots of flexibility to sample parameters at different rates and/or thin the chain as it's being run, at the expense of a little complexity.
@@ -132,10 +137,12 @@ class postgetter:
 class ParameterSpace(list):
     """
     Class to define sets of parameters (parameter spaces); inherits list. To sample the parameter space, attribute log_posterior must be set to a function of one argument that evaluates the *complete* posterior likelihood, including priors and parameters not in this ParameterSpace.
+    Optionally, log_posterior_batch(positions, struct) evaluates the same posterior at many points at once, without setting the Parameters; positions has one row of values (in the order of this ParameterSpace) per point. BatchSlice uses it when present.
     """
-    def __init__(self, parameterList=[], log_posterior=None):
+    def __init__(self, parameterList=[], log_posterior=None, log_posterior_batch=None):
         list.__init__(self, parameterList)
         self.log_posterior = log_posterior
+        self.log_posterior_batch = log_posterior_batch
     def __str__(self):
         st = ''
         for p in self:
@@ -165,6 +172,47 @@ class ParameterSpace(list):
         
 
 
+class SharedExchange:
+    """
+    Shared memory through which chains running as processes on one machine exchange adaptation information (parallelization option 3).
+    Constructor arguments:
+     1* number of chains.
+     2* list of the number of parameters in each adaptive Updater, in the order the Updaters are given to the Engine.
+    Construct it in the parent process, before the chain processes are started. In chain i, pass exchange.chain(i) as the parallel argument of its Updaters. When a chain adapts, it posts its means and covariances and combines them with whatever the other chains have posted so far; chains never wait for one another.
+    """
+    def __init__(self, nchains, sizes):
+        self.nchains = nchains
+        self.sizes = list(sizes)
+        self.rank = None
+        self.lock = multiprocessing.Lock()
+        self.counts = [multiprocessing.RawArray('d', nchains) for n in self.sizes]
+        self.means = [multiprocessing.RawArray('d', nchains*n) for n in self.sizes]
+        self.moments = [multiprocessing.RawArray('d', nchains*n*n) for n in self.sizes]
+    def chain(self, rank):
+        c = copy.copy(self)
+        c.rank = rank
+        return c
+    def arrays(self, index):
+        n = self.sizes[index]
+        return (np.frombuffer(self.counts[index]),
+                np.frombuffer(self.means[index]).reshape((self.nchains, n)),
+                np.frombuffer(self.moments[index]).reshape((self.nchains, n, n)))
+    def put(self, index, bits):
+        counts, means, moments = self.arrays(index)
+        if 'covariances' in bits:
+            moment = bits['covariances']
+        else:
+            moment = np.diag(bits['variances'])
+        with self.lock:
+            counts[self.rank] = bits['count']
+            means[self.rank] = bits['means']
+            moments[self.rank] = moment
+    def get(self, index):
+        counts, means, moments = self.arrays(index)
+        with self.lock:
+            return [{'count': counts[i], 'means': means[i].copy(), 'covariances': moments[i].copy(), 'variances': moments[i].diagonal().copy()} for i in range(self.nchains) if counts[i] > 0]
+
+
 class Updater:
     """
     Abstract base class for updaters. Do not instantiate directly.
@@ -192,6 +240,8 @@ class Updater:
         self.count = 0
         if self.adapt:
             self.R = None
+            self.block = np.zeros((self.adapt_every, len(self.space)))
+            self.nblock = 0
         self.rate = 1
     def restore(self, filename):
         f = open(filename, 'rb')
@@ -208,6 +258,29 @@ class Updater:
         # todo: prevent direct assignment bypassing this
         self.step = step
         self.step.updater = self        
+    def store_sample(self):
+        # the running moments are only updated a block at a time; see flush_block
+        self.block[self.nblock] = [p() for p in self.space]
+        self.nblock += 1
+        if self.nblock == len(self.block):
+            self.flush_block()
+    def flush_block(self):
+        # merge the stored block into the running means and (n-1)*covariance, using the
+        # pairwise update of Chan, Golub and LeVeque
+        if not self.adapt or self.nblock == 0:
+            return
+        block = self.block[:self.nblock]
+        nb = float(self.nblock)
+        n0 = self.count - nb
+        blockmean = block.mean(axis=0)
+        d = block - blockmean
+        delta = blockmean - self.means
+        self.means = self.means + delta * nb / (n0 + nb)
+        self.add_scatter( np.dot(d.T, d) + np.outer(delta, delta) * n0 * nb / (n0 + nb) )
+        self.nblock = 0
+    def gatherShared(self):
+        self.exchange.put(self.index, self.saveBits())
+        return self.combine(self.exchange.get(self.index))
 
 class CartesianUpdater(Updater):
     """
@@ -218,7 +291,10 @@ class CartesianUpdater(Updater):
         if self.adapt:
             self.means = np.zeros(len(self.space))
             self.variances = np.zeros(len(self.space))
-            if parallel is not None:
+            if isinstance(parallel, SharedExchange):
+                self.exchange = parallel
+                self.gatherAdapt = self.gatherShared
+            elif parallel is not None:
                 mpi = False
                 try:
                     if isinstance(parallel, MPI.Comm):
@@ -243,15 +319,15 @@ class CartesianUpdater(Updater):
             self.choose_direction(j)
             self.origin = self.space[self.current_direction]()
             self.step(struct)
-            self.accumulate()
+        self.accumulate()
     def accumulate(self):
         if self.adapt:
-            # Golub, Chan and Levesque one-pass mean and variance algorithm
-            d = self.space[self.current_direction]() - self.means[self.current_direction]
-            self.means[self.current_direction] += d / self.count
-            # this is actually (n-1) times the variance (below)
-            self.variances[self.current_direction] += (self.count-1.0)/self.count * d**2
+            self.store_sample()
+    def add_scatter(self, scatter):
+        # this is actually (n-1) times the variance (below)
+        self.variances += scatter.diagonal()
     def do_adapt(self, struct):
+        self.flush_block()
         stdevs = self.gatherAdapt()
         for i, p in enumerate(self.space):
             if stdevs[i] != 0.0:
@@ -290,8 +366,8 @@ class CartesianUpdater(Updater):
 #            self.R = np.sqrt( (self.count-1.0)/self.count + B/(self.count*W) )
         return np.sqrt( (moment2 - moment1**2/total) / (total - 1.0) )
     def gatherMPI(self):
-        alls = self.saveBits()
-        alls = self.comm.allgather(alls)
+        return self.combine(self.comm.allgather(self.saveBits()))
+    def combine(self, alls):
         total = 0
         moment1 = np.zeros(len(self.space))
         moment2 = np.zeros(len(self.space))
@@ -317,8 +393,14 @@ class CartesianUpdater(Updater):
     def move(self, x):
         p = self.space[self.current_direction]
         p.set(self.origin + x * p.width)
+    def positions(self, xs):
+        # parameter values after move(x), for each x in xs, without moving
+        values = np.tile(np.array([p() for p in self.space], dtype=float), (len(xs), 1))
+        values[:, self.current_direction] = self.origin + np.asarray(xs) * self.space[self.current_direction].width
+        return values
     def restoreBits(self, s):
         self.count = s['count']
+        self.nblock = 0
         if s['type'] == 'Cartesian':
             for i, p in enumerate(self.space):
                 p.width = s['widths'][i]
@@ -333,6 +415,7 @@ class CartesianUpdater(Updater):
             raise Exception('CartesianUpdater.restoreBits: error restoring updater state -- unknown updater type')
     def saveBits(self):
         if self.adapt:
+            self.flush_block()
             return {'type': 'Cartesian', 'count': self.count, 'means': self.means, 'variances': self.variances, 'widths': [p.width for p in self.space]}
         else:
             return None
@@ -458,7 +541,10 @@ class MultiDimUpdater(Updater):
             self.means = np.zeros(len(self.space))
             self.d = np.zeros(len(self.space))
             self.covariances = np.zeros((len(self.space), len(self.space)))
-            if parallel is not None:
+            if isinstance(parallel, SharedExchange):
+                self.exchange = parallel
+                self.gatherAdapt = self.gatherShared
+            elif parallel is not None:
                 mpi = False
                 try:
                     if isinstance(parallel, MPI.Comm):
@@ -488,13 +574,11 @@ class MultiDimUpdater(Updater):
     def accumulate(self):
         self.count += 1
         if self.adapt:
-            for i, p in enumerate(self.space):
-                self.d[i] = p() - self.means[i];
-                self.means[i] += self.d[i] / self.count;
-                for j in range(i+1):
-                    self.covariances[i,j] += (self.count-1.0)/self.count * self.d[i] * self.d[j]
-                    # don't need anything in the upper triangle
+            self.store_sample()
+    def add_scatter(self, scatter):
+        self.covariances += scatter
     def do_adapt(self, struct):
+        self.flush_block()
         cov = self.gatherAdapt()
         if self.set_covariance(cov) and not self.onAdapt is None:
             self.onAdapt(struct)
@@ -530,8 +614,8 @@ class MultiDimUpdater(Updater):
             self.R = np.sqrt( (self.count-1.0)/self.count + B/(self.count*W) )
         return (moment2 - np.outer(moment1/total, moment1)) / (total - 1.0)
     def gatherMPI(self):
-        alls = self.saveBits()
-        alls = self.comm.allgather(alls)
+        return self.combine(self.comm.allgather(self.saveBits()))
+    def combine(self, alls):
         total = 0
         moment1 = np.zeros(len(self.space))
         moment2 = np.zeros( (len(self.space), len(self.space)) )
@@ -557,8 +641,12 @@ class MultiDimUpdater(Updater):
     def move(self, x):
         for i, p in enumerate(self.space):
             p.set(self.origin[i] + x * self.current_direction[i] * self.width)
+    def positions(self, xs):
+        # parameter values after move(x), for each x in xs, without moving
+        return np.asarray(self.origin, dtype=float)[None,:] + np.asarray(xs)[:,None] * self.current_direction[None,:] * self.width
     def restoreBits(self, s):
         self.count = s['count']
+        self.nblock = 0
         if s['type'] == 'Cartesian':
             self.means = s['means']
             self.covariances = np.eye(len(self.space), len(self.space)) * s['variances']
@@ -573,6 +661,7 @@ class MultiDimUpdater(Updater):
             raise Exception('MultiDimUpdater.restoreBits: error restoring updater state -- unknown updater type')
     def saveBits(self):
         if self.adapt:
+            self.flush_block()
             return {'type': 'MultiDim', 'count': self.count, 'means': self.means, 'covariances': self.covariances, 'widths': self.widths, 'basis': self.basis}
         else:
             return None
@@ -872,6 +961,69 @@ class Slice(Step):
         if self.obnoxious:
             print 'Slice: completed'
 
+class BatchSlice(Slice):
+    """
+    Slice step that evaluates its trial points in batches: both stepping-out directions together, then several shrinkage candidates at a time. Batches go through the ParameterSpace's log_posterior_batch if it has one, and are evaluated one point at a time otherwise.
+    The chain is the same as for Slice. Stepping-out edges past the first one outside the slice are not used. Shrinkage candidates are uniform over the bracket they were drawn from, so those that land outside the bracket after an earlier rejection are skipped, and the rest are uniform over the shrunken bracket.
+    Constructor arguments: as for Slice, plus
+     5. number of trial points per batch (in each stepping-out direction, and for shrinkage).
+    """
+    def __init__(self, width_factor=2.4, maxiter=100, quiet=True, obnoxious=False, batch_size=4):
+        Slice.__init__(self, width_factor, maxiter, quiet, obnoxious)
+        self.batch_size = batch_size
+    def evaluate(self, xs, struct):
+        space = self.updater.space
+        if space.log_posterior_batch is not None:
+            return np.asarray(space.log_posterior_batch(self.updater.positions(xs), struct), dtype=float)
+        lnews = np.zeros(len(xs))
+        for i, x in enumerate(xs):
+            self.updater.move(x)
+            lnews[i] = space.log_posterior(struct)
+        return lnews
+    def __call__(self, struct):
+        if self.updater.engine.current_logP is None:
+            self.updater.engine.current_logP = self.updater.space.log_posterior(struct)
+        z = self.updater.engine.current_logP - np.random.exponential() # log level of slice
+        nb = self.batch_size
+        offsets = self.width_fac * np.arange(nb)
+        L = -self.width_fac * np.random.random_sample()                # left edge of the slice
+        edges = {-1: L, 1: L + self.width_fac}                           # left & right
+        done = {-1: False, 1: False}
+        n = 0
+        while n < self.maxiter and not (done[-1] and done[1]):
+            sides = [side for side in (-1, 1) if not done[side]]
+            lnew = self.evaluate(np.concatenate([edges[side] + side*offsets for side in sides]), struct)
+            for k, side in enumerate(sides):
+                outside = np.nonzero(lnew[k*nb:(k+1)*nb] <= z)[0]
+                if len(outside) > 0:
+                    edges[side] += side * offsets[outside[0]]
+                    done[side] = True
+                else:
+                    edges[side] += side * self.width_fac * nb
+            n += nb
+        if not self.quiet and not (done[-1] and done[1]):
+            print "BatchSlice(): warning -- exhausted stepping out loop"
+        L, R = edges[-1], edges[1]
+        n = 0
+        while n < self.maxiter:
+            xs = L + (R - L) * np.random.random_sample(nb)
+            lnew = self.evaluate(xs, struct)
+            for x1, l1 in zip(xs, lnew):
+                if x1 <= L or x1 >= R:
+                    continue
+                n += 1
+                if l1 >= z:
+                    self.updater.move(x1)
+                    self.updater.engine.current_logP = l1
+                    return
+                if x1 < 0:
+                    L = x1
+                else:
+                    R = x1
+        if not self.quiet:
+            print "BatchSlice(): warning -- exhausted stepping in loop"
+        self.updater.move(0.0)
+
 class Metropolis(Step):
     """
     Class implementing the Metropolis (*not* Metropolis-Hastings) proposal algorithm.
@@ -1054,6 +1206,92 @@ class dictBackend(dict, Backend):
 
 
 
+def autocorrelation_time(x, c=5.0):
+    """
+    Integrated autocorrelation time of a 1D chain: the autocorrelation function is estimated by FFT, and summed out to Sokal's adaptive window (the first lag M with M >= c*tau(M)).
+    """
+    x = np.asarray(x, dtype=float)
+    n = len(x)
+    if n < 2:
+        return 1.0
+    x = x - x.mean()
+    nfft = 2**int(np.ceil(np.log2(2*n)))
+    f = np.fft.rfft(x, nfft)
+    acf = np.fft.irfft(f * np.conjugate(f), nfft)[:n]
+    if acf[0] <= 0.0:
+        return 1.0
+    taus = 2.0 * np.cumsum(acf / acf[0]) - 1.0
+    window = np.arange(n) >= c * taus
+    if window.any():
+        m = np.argmax(window)
+    else:
+        m = n - 1
+    return max(1.0, taus[m])
+
+def effective_sample_size(x):
+    return len(x) / autocorrelation_time(x)
+
+def split_rhat(x):
+    """
+    Gelman-Rubin R for a single chain, treating its two halves as separate chains.
+    """
+    n = len(x) // 2
+    halves = np.array([x[:n], x[n:2*n]], dtype=float)
+    W = halves.var(axis=1, ddof=1).mean()
+    B = n * halves.mean(axis=1).var(ddof=1)
+    if W <= 0.0:
+        if B > 0.0:
+            return np.inf
+        return 1.0
+    return np.sqrt( ((n-1.0)/n * W + B/n) / W )
+
+class ConvergenceMonitor:
+    """
+    Stops an Engine once its chain has converged; pass it as the Engine's convergence argument.
+    Constructor arguments:
+     1* sequence of Parameters to monitor (usually the free parameters).
+     2  target effective number of samples after burn-in, for every monitored Parameter.
+     3  largest acceptable Gelman-Rubin R. The split-chain R of each Parameter is always checked; for parallel chains, so is the R computed by adaptive Updaters.
+     4  number of iterations before the first check.
+     5  number of iterations between checks.
+     6  fraction of the chain discarded as burn-in.
+    The monitor keeps its own copy of the monitored values. After each check, burn (iterations), thin, ess (per Parameter) and rhat (the worst R) describe the chain, and converged says whether the targets were met. The suggested thinning is half the longest autocorrelation time.
+    """
+    def __init__(self, parameters, target_ess=1000.0, target_rhat=1.01, min_iterations=1000, check_every=500, burn_fraction=0.5):
+        self.parameters = list(parameters)
+        self.target_ess = target_ess
+        self.target_rhat = target_rhat
+        self.min_iterations = min_iterations
+        self.check_every = check_every
+        self.burn_fraction = burn_fraction
+        self.history = []
+        self.burn = 0
+        self.thin = 1
+        self.ess = None
+        self.rhat = None
+        self.converged = False
+    def __call__(self, engine):
+        self.history.append([p() for p in self.parameters])
+        n = len(self.history)
+        if n < self.min_iterations or n % self.check_every != 0:
+            return False
+        return self.check(engine)
+    def check(self, engine=None):
+        chain = np.array(self.history, dtype=float)
+        self.burn = int(self.burn_fraction * len(chain))
+        chain = chain[self.burn:]
+        taus = np.array([autocorrelation_time(chain[:,i]) for i in range(chain.shape[1])])
+        self.ess = len(chain) / taus
+        self.thin = max(1, int(taus.max() / 2.0))
+        self.rhat = max([split_rhat(chain[:,i]) for i in range(chain.shape[1])])
+        if engine is not None:
+            for updater in engine:
+                R = getattr(updater, 'R', None)
+                if R is not None:
+                    self.rhat = max(self.rhat, np.max(R))
+        self.converged = bool(self.ess.min() >= self.target_ess and self.rhat <= self.target_rhat)
+        return self.converged
+
 class Engine(list):
     """
     Class to organize Updaters of ParameterSpaces and run the MCMC (inherits list).
@@ -1061,18 +1299,20 @@ class Engine(list):
      1. sequence of Updater objects. If Updaters are added any other way, the register_updater( ) method must be used.
      2. a ParameterSpace of Parameters whose values are to be stored at each step. This need not be the same as the ParameterSpace(s) referred to by the Updaters.
      3. a function of one argument to be called after each step (i.e. each time that each Updater has been called).
+     4. a function of one argument, the Engine, called after each step and after the Backends; the chain stops early if it returns True. See ConvergenceMonitor.
     To run a chain, use the () method. Arguments:
      1. number of iterations (every Updater is called for a single iteration).
      2. an object that is passed to the log_posterior, Updater.on_adapt, and on_step functions.
      3. a sequence of Backend objects where the chain is to be stored.
     """
     # todo: make sure directly assigned Updaters get registered
-    def __init__(self, updaterList=[], parameterspace_to_track=None, on_step=None):
+    def __init__(self, updaterList=[], parameterspace_to_track=None, on_step=None, convergence=None):
         list.__init__(self, updaterList)
         for i, updater in enumerate(self):
             self.register_updater(updater, i)
         self.space = parameterspace_to_track
         self.onStep = on_step
+        self.convergence = convergence
         self.count = 0
         self.current_logP = None
     def __setitem__(self, key, value):
@@ -1092,6 +1332,8 @@ class Engine(list):
                 if not self.space is None:
                     for backend in backends:
                         backend(self.space)
+                if not self.convergence is None and self.convergence(self):
+                    break
         except KeyboardInterrupt:
             print "Interrupted by keyboard with count = " + str(self.count)
     def register_updater(self, updater, index):
@@ -1216,3 +1458,54 @@ class ChiSquareLikelihood:
 # Todo:
 # 1. An Updater class that simply goes through an existing sequence, for importance sampling.
 
+
+########################################
+
+class TestBatchSlice(unittest.TestCase):
+
+    mean = np.array([-1., 1.])
+    covariance = np.array([[4., 4.5], [4.5, 9.]])   # s(x)=2, s(y)=3, correlation 0.75
+
+    def logPosterior(self, positions):
+        d = positions - self.mean
+        return -0.5*np.sum(np.dot(d, np.linalg.inv(self.covariance))*d, axis=1)
+
+    def runChain(self, step, nsamples, batch = True, seed = 3):
+        x = Parameter(0., 1., 'x')
+        y = Parameter(0., 1., 'y')
+        post = lambda struct: self.logPosterior(np.array([[x(), y()]]))[0]
+        postbatch = None
+        if batch:
+            postbatch = lambda positions, struct: self.logPosterior(positions)
+        space = ParameterSpace([x, y], post, postbatch)
+        np.random.seed(seed)
+        updater = MultiDimRotationUpdater(space, step, 100, 100)
+        engine = Engine([updater], space)
+        chain = dictBackend()
+        stdout = sys.stdout
+        sys.stdout = open(os.devnull, 'w')
+        try:
+            engine(nsamples, None, [chain])
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+        return np.column_stack([chain['x'], chain['y']])
+
+    def testBatchMatchesScalar(self):
+        batched = self.runChain(BatchSlice(), 500, batch = True)
+        scalar = self.runChain(BatchSlice(), 500, batch = False)
+        self.assertTrue((batched == scalar).all())
+
+    def testTargetCovariance(self):
+        for step in (Slice(), BatchSlice()):
+            samples = self.runChain(step, 20000)[1000:]
+            self.assertTrue((np.abs(np.mean(samples, axis=0) - self.mean) < 0.2*np.sqrt(np.diag(self.covariance))).all())
+            self.assertTrue((np.abs(np.cov(samples, rowvar=False)/self.covariance - 1) < 0.1).all())
+
+def test():
+    testcases = [TestBatchSlice]
+    suite = unittest.TestSuite(map(unittest.TestLoader().loadTestsFromTestCase, testcases))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+if __name__ == '__main__':
+    test()
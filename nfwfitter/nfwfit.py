@@ -5,17 +5,23 @@
 # Options to explore radial fit range, mass-concentration relation, and binning scheme in fits.
 ########################
 
-import cPickle, sys, os
+import cPickle, sys, os, unittest
 import numpy as np
 import astropy.io.fits as pyfits
 import nfwutils, bashreader, ldac
 import nfwmodeltools as tools
 import varcontainer
 import pymc
+import mymc
 import pymc_mymcmc_adapter as pma
+import lockstepmc
 import scipy.integrate
+import scipy.optimize
 import profilebuilder
+import rngstreams
+import instrument
 import simutils
+import catalog
 
 
 #######################
@@ -140,6 +146,104 @@ class NFW_Model(object):
         parts['data'] = data
 
         return pymc.Model(parts)
+
+    def massBounds(self):
+        '''Prior range of the sampled mass parameter (scaled or log mass, per massprior), 
+        and a function converting sampled values to masses'''
+
+        if self.massprior == 'linear':
+            return self.m200_low/self.massScale, self.m200_high/self.massScale, lambda value : self.massScale*value
+
+        return np.log(self.m200_low), np.log(self.m200_high), np.exp
+
+    def massStart(self):
+
+        if self.massprior == 'linear':
+            return self.guess()[0]
+
+        low, high, tomass = self.massBounds()
+        return np.random.uniform(low, high)
+
+    def massParameter(self, name):
+        '''mymc Parameter for the mass, in the units of massprior, with a random start; 
+        and functions to convert its value to a mass and to get its log prior'''
+
+        low, high, tomass = self.massBounds()
+        start = self.massStart()
+        if self.massprior == 'linear':
+            param = mymc.Parameter(start, 0.1*np.abs(start), 'scaled%s' % name)
+        else:
+            param = mymc.Parameter(start, 0.1*np.abs(start), 'log%s' % name.capitalize())
+
+        lognorm = -np.log(high - low)
+        def logprior(value):
+            if value < low or value > high:
+                return -np.inf
+            return lognorm
+
+        return param, tomass, logprior
+
+    def makeNativeModel(self, profile, delta = 200):
+        '''Same posterior as makeMCMCModel, as a pma.NativeModel that mymc samples without pymc'''
+
+        self.setData(profile.beta_s, profile.beta_s2, profile.zcluster, zlens = profile.zlens)
+
+        massparam, tomass, masslogprior = self.massParameter('mdelta')
+
+        cstart = np.random.uniform(self.c200_low, self.c200_high)
+        cparam = mymc.Parameter(cstart, 0.1*cstart, 'cdelta')
+        clognorm = -np.log(self.c200_high - self.c200_low)
+
+        data = [np.ascontiguousarray(x, dtype=np.float64) for x in 
+                (profile.r_mpc, profile.ghat, profile.sigma_ghat, profile.beta_s, profile.beta_s2)]
+        rho_c, rho_c_over_sigma_c = self.rho_c, self.rho_c_over_sigma_c
+
+        mlow, mhigh = self.massBounds()[:2]
+        lognorm = -np.log(mhigh - mlow) + clognorm
+
+        #the profile, repeated once per trial point, for each batch size seen
+        tiles = {}
+        def tiled(n):
+            if n not in tiles:
+                tiles[n] = [np.repeat(x[None,:], n, axis=0) for x in data] + \
+                    [rho_c*np.ones(n), rho_c_over_sigma_c*np.ones(n), float(delta)]
+            return tiles[n]
+
+        def logposterior_batch(values):
+
+            mdelta = tomass(values[massparam.name])
+            cdelta = values['cdelta']
+
+            likelihood = np.empty(len(mdelta))
+            likelihood.fill(-np.inf)
+            inprior = (values[massparam.name] >= mlow) & (values[massparam.name] <= mhigh) & \
+                (cdelta >= self.c200_low) & (cdelta <= self.c200_high)
+
+            ninprior = np.count_nonzero(inprior)
+            if ninprior > 0:
+                likelihood[inprior] = tools.shearprofile_like_lockstep(mdelta[inprior], cdelta[inprior], *tiled(ninprior))
+
+            return lognorm + likelihood, dict(mdelta = mdelta, likelihood = likelihood)
+
+        def logposterior(values):
+
+            mdelta = tomass(values[massparam.name])
+            cdelta = values['cdelta']
+            derived = dict(mdelta = mdelta, likelihood = -np.inf)
+
+            logprior = masslogprior(values[massparam.name])
+            if not np.isfinite(logprior) or cdelta < self.c200_low or cdelta > self.c200_high:
+                return -np.inf, derived
+
+            try:
+                derived['likelihood'] = tools.shearprofile_like(mdelta, cdelta, *(data + [rho_c, rho_c_over_sigma_c, delta]))
+            except (ValueError, ZeroDivisionError):
+                return -np.inf, derived
+
+            return logprior + clognorm + derived['likelihood'], derived
+
+        return pma.NativeModel([massparam, cparam], logposterior, ['mdelta', 'likelihood'], 
+                               logposterior_batch = logposterior_batch)
             
 
 
@@ -267,6 +371,39 @@ class NFW_MC_Model(NFW_Model):
 
         return pymc.Model(parts)
 
+    def makeNativeModel(self, profile, delta = 200):
+        '''Same posterior as makeMCMCModel, as a pma.NativeModel that mymc samples without pymc'''
+
+        self.setData(profile.beta_s, profile.beta_s2, profile.zcluster, zlens = profile.zlens)
+
+        massparam, tomass, masslogprior = self.massParameter('m200')
+
+        data = [np.ascontiguousarray(x, dtype=np.float64) for x in 
+                (profile.r_mpc, profile.ghat, profile.sigma_ghat, profile.beta_s, profile.beta_s2)]
+        rho_c, rho_c_over_sigma_c = self.rho_c, self.rho_c_over_sigma_c
+
+        def logposterior(values):
+
+            m200 = tomass(values[massparam.name])
+            derived = dict(m200 = m200, c200 = np.nan, likelihood = -np.inf)
+
+            logprior = masslogprior(values[massparam.name])
+            if not np.isfinite(logprior):
+                return -np.inf, derived
+
+            c200 = self.massconRelation(m200*nfwutils.global_cosmology.h, self.zcluster, self.overdensity)
+            derived['c200'] = c200
+            if not np.isfinite(c200):
+                return -np.inf, derived
+
+            derived['likelihood'] = tools.shearprofile_like(m200, c200, *(data + [rho_c, rho_c_over_sigma_c, 200.]))
+            if not np.isfinite(derived['likelihood']):
+                return -np.inf, derived
+
+            return logprior + derived['likelihood'], derived
+
+        return pma.NativeModel([massparam], logposterior, ['m200', 'c200', 'likelihood'])
+
 
 
     def __call__(self, x, m200):
@@ -276,10 +413,175 @@ class NFW_MC_Model(NFW_Model):
         return super(NFW_MC_Model, self).__call__(x, m200, c200)
 
 ###############################
+# Maximum likelihood fits with analytic gradients
+###############################
+
+class MaxLikeFitter(object):
+    '''Maximum likelihood fit of a binned shear profile, for NFW_Model (m200, c200) or NFW_MC_Model (m200),
+    with analytic gradients of the likelihood. Mass is fit in log space and only positive masses are allowed.
+    One fitter is reused for any number of profiles; see fitProfiles.
+
+    minChisqMethod returns ({'m200' : , ['c200' : ]}, {'m200' : (low, high), ...}) in model units (m200/massScale),
+    errors from the inverse Fisher matrix at the best fit, or None if the fit failed.'''
+
+    def __init__(self):
+        self.output_type = 'maxlike'
+
+    def configure(self, config):
+
+        self.model = config['model']
+        self.fitconcentration = not isinstance(self.model, NFW_MC_Model)
+
+    def verifyfit(self, sim, profile, fitvals, outputname, raiseException = True):
+
+        if fitvals is None:
+            if raiseException:
+                dump(sim, profile, fitvals, outputname)
+                raise FailedFitException
+            return False
+
+        return True
+
+    def concentration(self, logm):
+
+        return self.model.massconRelation(np.exp(logm)*nfwutils.global_cosmology.h, self.model.zcluster, self.model.overdensity)
+
+    def loglikeGrad(self, params, r_mpc, ghat, sigma_ghat, beta_s, beta_s2):
+        '''log likelihood, gradient and Fisher matrix in the fit parameters ((log m, c) or (log m,))'''
+
+        logm = params[0]
+        if self.fitconcentration:
+            c = params[1]
+        else:
+            c = self.concentration(logm)
+        if not (np.isfinite(c) and c > 0):
+            return -np.inf, np.zeros(len(params)), np.zeros((len(params), len(params)))
+
+        loglike, grad, fisher = tools.shearprofile_like_grad(np.exp(logm), c, r_mpc, ghat, sigma_ghat, beta_s, beta_s2,
+                                                             self.model.rho_c, self.model.rho_c_over_sigma_c,
+                                                             float(self.model.overdensity))
+
+        if not self.fitconcentration:
+            #chain rule through the mass-concentration relation
+            step = 1e-3
+            dc_dlogm = (self.concentration(logm + step) - self.concentration(logm - step))/(2*step)
+            jac = np.array([1., dc_dlogm])
+            grad = np.array([np.dot(jac, grad)])
+            fisher = np.array([[np.dot(jac, np.dot(fisher, jac))]])
+
+        return loglike, grad, fisher
+
+    def bounds(self):
+
+        bounds = [(np.log(self.model.m200_low), np.log(self.model.m200_high))]
+        if self.fitconcentration:
+            bounds.append((self.model.c200_low, self.model.c200_high))
+        return bounds
+
+    def fit(self, r_mpc, ghat, sigma_ghat, beta_s, beta_s2, guess = None):
+        '''Best fit parameters and covariance, in (log m200, [c200]); None if the fit fails.
+        Data must already be set on the model.'''
+
+        data = tuple(np.ascontiguousarray(x, dtype=np.float64) for x in (r_mpc, ghat, sigma_ghat, beta_s, beta_s2))
+
+        def negloglike(params):
+            loglike, grad, fisher = self.loglikeGrad(params, *data)
+            if not np.isfinite(loglike):
+                return np.inf, np.zeros_like(params)
+            return -loglike, -grad
+
+        if guess is None:
+            starts = [[np.log(5e14), 4.], [np.log(2e15), 4.], [np.log(1e14), 4.]]
+        else:
+            starts = [[np.log(guess[0]*self.model.massScale)] + list(guess[1:2]) + [4.]]
+
+        #every start is run; the converged fit with the highest likelihood wins
+        best = None
+        for start in starts:
+            start = np.array(start[:len(self.bounds())])
+            result = scipy.optimize.minimize(negloglike, start, jac = True, method = 'L-BFGS-B', 
+                                             bounds = self.bounds())
+            if result.success and (best is None or result.fun < best.fun):
+                best = result
+
+        if best is None:
+            return None
+
+        loglike, grad, fisher = self.loglikeGrad(best.x, *data)
+        try:
+            covar = np.linalg.inv(fisher)
+        except np.linalg.LinAlgError:
+            return None
+
+        return best.x, covar
+
+    def minChisqMethod(self, r_mpc, ghat, sigma_ghat, beta_s, beta_s2, zcluster, zlens = None, 
+                       guess = None, useSimplex = False):
+
+        r_mpc = np.asarray(r_mpc, dtype=np.float64)
+        beta_s = beta_s*np.ones_like(r_mpc)
+        beta_s2 = beta_s2*np.ones_like(r_mpc)
+
+        self.model.setData(beta_s, beta_s2, zcluster, zlens = zlens)
+
+        fitres = self.fit(r_mpc, ghat, sigma_ghat, beta_s, beta_s2, guess = guess)
+        if fitres is None:
+            return None
+
+        params, covar = fitres
+
+        m200 = np.exp(params[0])/self.model.massScale
+        m200err = m200*np.sqrt(covar[0,0])
+        values = {'m200' : m200}
+        errs = {'m200' : (-m200err, m200err)}
+        if self.fitconcentration:
+            c200err = np.sqrt(covar[1,1])
+            values['c200'] = params[1]
+            errs['c200'] = (-c200err, c200err)
+
+        return values, errs
+
+    def fitProfiles(self, r_mpcs, ghats, sigma_ghats, beta_s, beta_s2, zcluster, zlens = None):
+        '''Back to back fits of many profiles at one redshift. Returns m200 (Msun), m200 errors, and a mask of good fits.'''
+
+        nprofiles = len(ghats)
+        masses = np.zeros(nprofiles)
+        errs = np.zeros(nprofiles)
+        mask = np.zeros(nprofiles, dtype=bool)
+
+        for i in range(nprofiles):
+            fitres = self.minChisqMethod(r_mpcs[i], ghats[i], sigma_ghats[i], beta_s, beta_s2, zcluster, zlens = zlens)
+            if fitres is None:
+                continue
+            masses[i] = fitres[0]['m200']*self.model.massScale
+            errs[i] = fitres[1]['m200'][1]*self.model.massScale
+            mask[i] = True
+
+        return masses, errs, mask
+
+    def __call__(self, profile):
+
+        return self.minChisqMethod(profile.r_mpc, profile.ghat, profile.sigma_ghat,
+                                   profile.beta_s, profile.beta_s2, profile.zcluster, zlens = profile.zlens)
+
+###
+
+def buildFitter(config):
+
+    fitter = MaxLikeFitter()
+    fitter.configure(config)
+
+    return fitter
+
+###############################
 
 
 class MCMCFitter(object):
 
+    #without a target ESS, chains keep every thin'th sample after a fixed burn-in
+    burn = 5000
+    thin = 2
+
     def __init__( self ) :
         self.output_type = 'mcmc'
     
@@ -291,6 +593,23 @@ class MCMCFitter(object):
         if 'nsamples' in config:
             self.nsamples = config['nsamples']
 
+        #sample the model's native log posterior, unless the pymc graph is asked for
+        self.usepymc = False
+        if 'mcmc_usepymc' in config:
+            self.usepymc = config['mcmc_usepymc']
+
+        #with a target ESS, chains stop once converged (nsamples is then a maximum), 
+        # and burn-in & thinning are picked from the chain instead of fixed at 5000 & 2.
+        self.target_ess = None
+        if 'mcmc_target_ess' in config:
+            self.target_ess = config['mcmc_target_ess']
+        self.target_rhat = 1.01
+        if 'mcmc_target_rhat' in config:
+            self.target_rhat = config['mcmc_target_rhat']
+
+        if self.target_ess is None and self.nsamples <= self.burn:
+            raise ValueError('nsamples (%d) must be larger than the burn-in (%d)' % (self.nsamples, self.burn))
+
     def verifyfit(self, sim, profile, fitvals, outputname, raiseException = True):
         '''Not implemented yet for MCMCs - see PDFScanner for the version in 1-d'''
 
@@ -305,51 +624,367 @@ class MCMCFitter(object):
 
         for delta in self.deltas:
 
-            mcmc_model = None
-            for i in range(20):
-                try:
+            chains[delta] = self.fitDelta(profile, delta)
+
+        return chains
+
+    def fitDelta(self, profile, delta):
+
+        mcmc_model = None
+        for i in range(20):
+            try:
+                if self.usepymc:
                     mcmc_model = self.model.makeMCMCModel(profile, delta = delta)
                     break
-                except pymc.ZeroProbability:
-                    pass
-            if mcmc_model is None:
+                mcmc_model = self.model.makeNativeModel(profile, delta = delta)
+                if np.isfinite(mcmc_model.posterior()):
+                    break
+                mcmc_model = None
+            except pymc.ZeroProbability:
+                pass
+        if mcmc_model is None:
+            raise pymc.ZeroProbability
+        # This sets up Adam Mantz's version of an MCMC sampler for production code calculations.
+        # This is stored in mymcmc_adapter.py (converts to talk with other MCMC code)
+        # Imported as pma above.
+        
+        manager = varcontainer.VarContainer()
+        options = varcontainer.VarContainer()
+        manager.options = options
+
+        options.singlecore = True
+        options.adapt_every = 100
+        options.adapt_after = 100
+        options.nsamples = self.nsamples
+        options.target_ess = self.target_ess
+        options.target_rhat = self.target_rhat
+        manager.model = mcmc_model
+
+        runner = pma.MyMCMemRunner()
+        runner.run(manager)
+        runner.finalize(manager)
+
+        burn, thin = self.burn, self.thin
+        if manager.convergence is not None:
+            #the chain may have stopped at nsamples, between checks
+            manager.convergence.check(manager.engine)
+            burn, thin = manager.convergence.burn, manager.convergence.thin
+
+        reducedchain = dict(cdelta = np.hstack(manager.chain['cdelta'][burn::thin]).astype(np.float32),
+                            mdelta = np.hstack(manager.chain['mdelta'][burn::thin]).astype(np.float32),
+                            likelihood = np.hstack(manager.chain['likelihood'][burn::thin]).astype(np.float32))
+
+        if manager.convergence is not None:
+            reducedchain.update(burn = burn, thin = thin, 
+                                ess = manager.convergence.ess.min(),
+                                rhat = manager.convergence.rhat,
+                                converged = manager.convergence.converged)
+
+        return reducedchain
+
+
+##########
+
+class LockstepMCMCFitter(MCMCFitter):
+    '''MCMCFitter for many NFW_Model profiles per process. The profiles' chains advance together
+    (lockstepmc.LockstepSlice), with one shearprofile_like_lockstep call per slice loop for all of them.
+
+    Call with a list of profiles, which may differ in redshift and binning; returns a list with 
+    MCMCFitter's output for each.'''
+
+    def configure(self, config):
+
+        super(LockstepMCMCFitter, self).configure(config)
+
+        assert(not isinstance(self.model, NFW_MC_Model))
+
+    def fitDeltaMany(self, data, delta):
+
+        mlow, mhigh, tomass = self.model.massBounds()
+        clow, chigh = self.model.c200_low, self.model.c200_high
+
+        nprofiles = len(data['rho_c'])
+
+        def logposterior(x, rows):
+
+            logp = np.zeros(len(rows))
+            likelihood = np.zeros(len(rows))
+            logp[:] = -np.inf
+            likelihood[:] = -np.inf
+
+            inprior = (x[:,0] >= mlow) & (x[:,0] <= mhigh) & (x[:,1] >= clow) & (x[:,1] <= chigh)
+            if not np.any(inprior):
+                return logp, likelihood
+
+            rows = rows[inprior]
+            likelihood[inprior] = tools.shearprofile_like_lockstep(np.ascontiguousarray(tomass(x[inprior,0])),
+                                                                   np.ascontiguousarray(x[inprior,1]),
+                                                                   *[np.ascontiguousarray(data[key][rows]) for key in 
+                                                                     'r_mpc ghat sigma_ghat beta_s beta_s2 rho_c rho_c_over_sigma_c'.split()] + [float(delta)])
+            logp[inprior] = likelihood[inprior]
+
+            return logp, likelihood
+
+        x0 = np.zeros((nprofiles, 2))
+        for i in range(nprofiles):
+            for j in range(20):
+                x0[i] = (self.model.massStart(), np.random.uniform(clow, chigh))
+                if np.isfinite(logposterior(x0[i:i+1], np.array([i]))[0][0]):
+                    break
+            else:
                 raise pymc.ZeroProbability
-            # This sets up Adam Mantz's version of an MCMC sampler for production code calculations.
-            # This is stored in mymcmc_adapter.py (converts to talk with other MCMC code)
-            # Imported as pma above.
-            
-            manager = varcontainer.VarContainer()
-            options = varcontainer.VarContainer()
-            manager.options = options
 
-            options.singlecore = True
-            options.adapt_every = 100
-            options.adapt_after = 100
-            options.nsamples = self.nsamples
-            manager.model = mcmc_model
+        sampler = lockstepmc.LockstepSlice(logposterior, 0.1*np.abs(x0), adapt_every = 100, adapt_starting = 100)
+
+        if self.target_ess is None:
+            samples, likelihoods = sampler(x0, self.nsamples, burn = self.burn, thin = self.thin)
+
+            return [dict(cdelta = samples[:,i,1].astype(np.float32),
+                         mdelta = tomass(samples[:,i,0]).astype(np.float32),
+                         likelihood = likelihoods[:,i].astype(np.float32)) for i in range(nprofiles)]
+
+        #as MCMCFitter.fitDelta: a convergence monitor per chain picks its burn-in and thinning,
+        # and the chains stop once all have converged (nsamples is then a maximum)
+        monitors = [mymc.ConvergenceMonitor([], self.target_ess, self.target_rhat) for i in range(nprofiles)]
+
+        def checkChains(samples):
+            for i, monitor in enumerate(monitors):
+                monitor.history = samples[:,i]
+                monitor.check()
+            return all([monitor.converged for monitor in monitors])
+
+        samples, likelihoods = sampler(x0, self.nsamples, stop = checkChains,
+                                       check_every = monitors[0].check_every,
+                                       min_iterations = monitors[0].min_iterations)
+        checkChains(samples)    #the chains may have stopped at nsamples, between checks
+
+        chains = []
+        for i, monitor in enumerate(monitors):
+            burn, thin = monitor.burn, monitor.thin
+            chains.append(dict(cdelta = samples[burn::thin,i,1].astype(np.float32),
+                               mdelta = tomass(samples[burn::thin,i,0]).astype(np.float32),
+                               likelihood = likelihoods[burn::thin,i].astype(np.float32),
+                               burn = burn, thin = thin, ess = monitor.ess.min(), rhat = monitor.rhat,
+                               converged = monitor.converged))
 
-            runner = pma.MyMCMemRunner()
-            runner.run(manager)
-            runner.finalize(manager)
+        return chains
+
+    def padProfiles(self, profiles):
+        '''(nprofiles x maxbins) profile arrays, padded with empty bins, plus per profile densities'''
+
+        nprofiles = len(profiles)
+        nbins = max([len(profile.r_mpc) for profile in profiles])
+
+        data = {}
+        for key, fill in (('r_mpc', 1.), ('ghat', 0.), ('sigma_ghat', 0.), ('beta_s', 1.), ('beta_s2', 1.)):
+            data[key] = fill*np.ones((nprofiles, nbins))
+        data['rho_c'] = np.zeros(nprofiles)
+        data['rho_c_over_sigma_c'] = np.zeros(nprofiles)
+
+        for i, profile in enumerate(profiles):
+
+            n = len(profile.r_mpc)
+            for key in 'r_mpc ghat sigma_ghat beta_s beta_s2'.split():
+                data[key][i,:n] = getattr(profile, key)
 
-            reducedchain = dict(cdelta = np.hstack(manager.chain['cdelta'][5000::2]).astype(np.float32),
-                                mdelta = np.hstack(manager.chain['mdelta'][5000::2]).astype(np.float32),
-                                likelihood = np.hstack(manager.chain['likelihood'][5000::2]).astype(np.float32))
+            self.model.setData(profile.beta_s, profile.beta_s2, profile.zcluster, zlens = profile.zlens)
+            data['rho_c'][i] = self.model.rho_c
+            data['rho_c_over_sigma_c'][i] = self.model.rho_c_over_sigma_c
 
-            chains[delta] = reducedchain
+        return data
+
+    def __call__(self, profiles):
+
+        data = self.padProfiles(profiles)
+
+        chains = [{} for profile in profiles]
+
+        for delta in self.deltas:
 
+            for i, chain in enumerate(self.fitDeltaMany(data, delta)):
+                chains[i][delta] = chain
 
         return chains
 
 
 ##########
 
+class LaplaceFitter(MCMCFitter):
+    '''Normal approximation to the NFW_Model posterior in (log mdelta, cdelta) about its mode, 
+    importance resampled and returned in MCMCFitter's reduced chain format (mdelta, cdelta, likelihood).
+
+    For each delta, falls back to the MCMC chain if the mode sits on a prior boundary, the Fisher 
+    matrix is not positive definite, or the importance weights are too uneven.
+
+    Config:
+       laplace_nsamples    -- samples per reduced chain (default 2500, what MCMCFitter keeps)
+       laplace_minessfrac  -- minimum effective sample size, as a fraction of the proposals drawn (default 0.5)
+    '''
+
+    def configure(self, config):
+
+        super(LaplaceFitter, self).configure(config)
+
+        #importance weighting needs the full (m,c) likelihood
+        assert(not isinstance(self.model, NFW_MC_Model))
+
+        self.nlaplacesamples = 2500
+        if 'laplace_nsamples' in config:
+            self.nlaplacesamples = config['laplace_nsamples']
+        self.minessfrac = 0.5
+        if 'laplace_minessfrac' in config:
+            self.minessfrac = config['laplace_minessfrac']
+
+        self.nfallbacks = 0
+
+    def bounds(self):
+
+        return np.array([[np.log(self.model.m200_low), np.log(self.model.m200_high)],
+                         [self.model.c200_low, self.model.c200_high]])
+
+    def logPrior(self, logm):
+        '''log prior density in (log m, c), up to a constant, inside the bounds'''
+
+        if self.model.massprior == 'linear':
+            return logm   #uniform in m
+        return np.zeros_like(logm)
+
+    def findMode(self, profile, delta):
+        '''Posterior mode and Fisher matrix in (log mdelta, cdelta), or None'''
+
+        data = tuple(np.ascontiguousarray(x, dtype=np.float64) for x in 
+                     (profile.r_mpc, profile.ghat, profile.sigma_ghat, profile.beta_s, profile.beta_s2))
+        linearprior = float(self.model.massprior == 'linear')
+
+        def neglogpost(params):
+            loglike, grad, fisher = tools.shearprofile_like_grad(np.exp(params[0]), params[1], *(data + 
+                                                                 (self.model.rho_c, self.model.rho_c_over_sigma_c, float(delta))))
+            if not np.isfinite(loglike):
+                return np.inf, np.zeros(2)
+            return -(loglike + linearprior*params[0]), -(grad + np.array([linearprior, 0.]))
+
+        #every start is run; the converged fit with the highest posterior wins
+        bounds = self.bounds()
+        best = None
+        for start in ([np.log(5e14), 4.], [np.log(2e15), 4.], [np.log(1e14), 4.]):
+            result = scipy.optimize.minimize(neglogpost, start, jac = True, method = 'L-BFGS-B', bounds = bounds)
+            if result.success and (best is None or result.fun < best.fun):
+                best = result
+        if best is None:
+            return None
+
+        mode = best.x
+        if np.any(np.abs(mode - bounds[:,0]) < 1e-6) or np.any(np.abs(mode - bounds[:,1]) < 1e-6):
+            return None
+
+        loglike, grad, fisher = tools.shearprofile_like_grad(np.exp(mode[0]), mode[1], *(data + 
+                                                             (self.model.rho_c, self.model.rho_c_over_sigma_c, float(delta))))
+        if not np.all(np.linalg.eigvalsh(fisher) > 0):
+            return None
+
+        return mode, fisher
+
+    def laplaceSamples(self, profile, delta):
+        '''Reduced chain from importance resampling the normal approximation, or None if diagnostics fail'''
+
+        modefit = self.findMode(profile, delta)
+        if modefit is None:
+            return None
+        mode, fisher = modefit
+
+        #slightly widened proposal, so the tails are covered
+        covar = 1.2**2*np.linalg.inv(fisher)
+        nproposals = 4*self.nlaplacesamples
+        proposals = np.random.multivariate_normal(mode, covar, nproposals)
+
+        bounds = self.bounds()
+        inprior = np.logical_and(np.all(proposals > bounds[:,0], axis=1), np.all(proposals < bounds[:,1], axis=1))
+        proposals = proposals[inprior]
+        if len(proposals) == 0:
+            return None
+
+        mdelta = np.ascontiguousarray(np.exp(proposals[:,0]))
+        cdelta = np.ascontiguousarray(proposals[:,1])
+
+        as2d = lambda x : np.ascontiguousarray(np.atleast_2d(x), dtype=np.float64)
+        gamma_inf, kappa_inf = tools.nfwTemplates(mdelta, cdelta, np.ascontiguousarray(profile.r_mpc, dtype=np.float64),
+                                                  self.model.rho_c, self.model.rho_c_over_sigma_c, float(delta))
+        loglikes = tools.shearprofile_like_batch(gamma_inf, kappa_inf, as2d(profile.ghat), as2d(profile.sigma_ghat),
+                                                 as2d(profile.beta_s), as2d(profile.beta_s2))[0]
+
+        offsets = proposals - mode
+        logproposal = -0.5*np.sum(np.dot(offsets, np.linalg.inv(covar))*offsets, axis=1)
+        logweights = loglikes + self.logPrior(proposals[:,0]) - logproposal
+        weights = np.exp(logweights - np.max(logweights))
+        weights = weights / np.sum(weights)
+
+        essfrac = 1./np.sum(weights**2)/nproposals
+        if not (essfrac >= self.minessfrac):
+            return None
+
+        picks = np.random.choice(len(weights), self.nlaplacesamples, p = weights)
+
+        return dict(cdelta = cdelta[picks].astype(np.float32),
+                    mdelta = mdelta[picks].astype(np.float32),
+                    likelihood = loglikes[picks].astype(np.float32))
+
+    def fitDelta(self, profile, delta):
+
+        self.model.setData(profile.beta_s, profile.beta_s2, profile.zcluster, zlens = profile.zlens)
+
+        reducedchain = self.laplaceSamples(profile, delta)
+        if reducedchain is None:
+            print 'Laplace approximation failed for delta %d; running MCMC' % delta
+            self.nfallbacks += 1
+            reducedchain = super(LaplaceFitter, self).fitDelta(profile, delta)
+
+        return reducedchain
+
+
+##########
+
 
 
 #######
         
 class BadPDFException(Exception): pass
 
+def compactPDF(pdf, tolerance):
+    '''A pdf on a mass grid, truncated to the contiguous nodes around the peak that are
+    at least tolerance*peak, plus one node on each side. Values are stored as float32;
+    every node outside [start, start+len(values)) is zero. Plain data, so .out files
+    unpickle without nfwfit, however the fit was run.'''
+
+    nmasses = len(pdf)
+
+    peak = np.argmax(pdf)
+    belowtol = np.nonzero(pdf < tolerance*pdf[peak])[0]
+    lowerbelow = belowtol[belowtol < peak]
+    upperbelow = belowtol[belowtol > peak]
+
+    start = 0
+    if len(lowerbelow) > 0:
+        start = int(lowerbelow[-1])
+    stop = nmasses
+    if len(upperbelow) > 0:
+        stop = int(upperbelow[0]) + 1
+
+    return dict(start = start, values = np.array(pdf[start:stop], dtype=np.float32),
+                nmasses = nmasses, tolerance = tolerance)
+
+###
+
+def expandPDF(pdf):
+    '''Full-grid float64 pdf from either storage format'''
+
+    if isinstance(pdf, dict):
+        fullpdf = np.zeros(pdf['nmasses'])
+        fullpdf[pdf['start']:pdf['start'] + len(pdf['values'])] = pdf['values']
+        return fullpdf
+    return pdf
+
+###
+
 class PDFScanner(object):
 
     def __init__(self) :
@@ -366,13 +1001,20 @@ class PDFScanner(object):
         if 'scanpdf_minmass' in config:
             self.masses = np.arange(config['scanpdf_minmass'], config['scanpdf_maxmass'], config['scanpdf_massstep'])
 
+        #if set, pdfs are saved compacted (see compactPDF), truncated below this fraction of the peak
+        self.pdftolerance = None
+        if 'scanpdf_tolerance' in config:
+            self.pdftolerance = config['scanpdf_tolerance']
+
+        self._massgrids = {}
+
     def verifyfit(self, sim, profile, fitvals, outputname, raiseException = True):
         '''Raises FailedFitException and dumps intermediates to pkl file if verify failes'''
 
         masses, pdfs = fitvals
 
         for delta in pdfs.keys():
-            maxpos = np.argmax(pdfs[delta])
+            maxpos = np.argmax(expandPDF(pdfs[delta]))
             if maxpos == 0 or maxpos == (len(masses)-1):
             
                 if raiseException:
@@ -383,6 +1025,38 @@ class PDFScanner(object):
         return True
 
 
+    def massGrid(self, delta, zcluster):
+        '''M200 and c200 at each scanned Mdelta. Depends only on the mass grid and redshift, so is cached.'''
+
+        if not hasattr(self, '_massgrids'):
+            self._massgrids = {}
+
+        key = (delta, zcluster, nfwutils.cosmologyKey())
+        if key in self._massgrids:
+            return self._massgrids[key]
+
+        masses = self.masses
+
+        if delta == 200:
+            workingmasses = masses
+            c200s = np.array([self.model.massconRelation(np.abs(curm)*nfwutils.global_cosmology.h, 
+                                                  zcluster, float(delta)) for curm in workingmasses])
+        elif delta != 200:
+            workingmasses = np.zeros_like(masses)
+            c200s = np.zeros_like(masses)
+            for i, curm in enumerate(masses):
+                c200 = self.model.massconRelation(np.abs(curm)*nfwutils.global_cosmology.h, 
+                                                  zcluster, float(delta))
+                rscale = nfwutils.rscaleConstM(np.abs(curm), c200, zcluster, float(delta))
+                m200 = nfwutils.Mdelta(rscale, c200, zcluster, 200)
+                if curm < 0:
+                    m200 = -m200
+                workingmasses[i] = m200
+                c200s[i] = c200
+
+        self._massgrids[key] = (workingmasses, c200s)
+
+        return workingmasses, c200s
 
             
 
@@ -403,22 +1077,7 @@ class PDFScanner(object):
 
             logprob = np.zeros(len(masses))
 
-            if delta == 200:
-                workingmasses = masses
-                c200s = np.array([self.model.massconRelation(np.abs(curm)*nfwutils.global_cosmology.h, 
-                                                      profile.zcluster, float(delta)) for curm in workingmasses])
-            elif delta != 200:
-                workingmasses = np.zeros_like(masses)
-                c200s = np.zeros_like(masses)
-                for i, curm in enumerate(masses):
-                    c200 = self.model.massconRelation(np.abs(curm)*nfwutils.global_cosmology.h, 
-                                                      profile.zcluster, float(delta))
-                    rscale = nfwutils.rscaleConstM(np.abs(curm), c200, profile.zcluster, float(delta))
-                    m200 = nfwutils.Mdelta(rscale, c200, profile.zcluster, 200)
-                    if curm < 0:
-                        m200 = -m200
-                    workingmasses[i] = m200
-                    c200s[i] = c200
+            workingmasses, c200s = self.massGrid(delta, profile.zcluster)
 
             for i in range(len(workingmasses)):
                 mass = workingmasses[i]
@@ -445,6 +1104,146 @@ class PDFScanner(object):
             if np.any(np.logical_not(np.isfinite(pdf))):
                 raise BadPDFException
 
+            if self.pdftolerance is not None:
+                pdfs[delta] = compactPDF(pdf, self.pdftolerance)
+
+        return (masses, pdfs)
+
+    #######
+
+
+def stackProfiles(profiles):
+    '''Combine single profiles with the same number of bins and the same redshifts
+    into one catalog of (nprofiles x nbins) arrays, for BatchPDFScanner.'''
+
+    stack = catalog.Catalog()
+    for col in 'r_mpc ghat sigma_ghat beta_s beta_s2'.split():
+        setattr(stack, col, np.vstack([getattr(profile, col) for profile in profiles]).astype(np.float64))
+
+    zclusters = set([profile.zcluster for profile in profiles])
+    zlenses = set([profile.zlens for profile in profiles])
+    assert(len(zclusters) == 1 and len(zlenses) == 1)
+    stack.zcluster = zclusters.pop()
+    stack.zlens = zlenses.pop()
+
+    return stack
+
+###
+
+class BatchPDFScanner(PDFScanner):
+    '''PDFScanner for a stack of profiles that share redshifts, eg many noise or miscentering 
+    realizations of one halo (profilebuilder.MultiCenterProfileBuilder) or a set built by stackProfiles.
+
+    NFW shear and convergence templates are evaluated once per scanned mass. If every profile has
+    the same radial bins, they are evaluated at those bins; otherwise (eg the per-center mean radii
+    of MultiCenterProfileBuilder) on scanpdf_templateradii log-spaced radii spanning all profiles,
+    and interpolated to each profile's bins. Bins flagged with sigma_ghat <= 0 are ignored.
+    Returns (masses, pdfs) with pdfs[delta] an (nprofiles x nmasses) array; scanpdf_tolerance is not applied.'''
+
+    def configure(self, config):
+
+        super(BatchPDFScanner, self).configure(config)
+
+        self.ntemplateradii = 256
+        if 'scanpdf_templateradii' in config:
+            self.ntemplateradii = config['scanpdf_templateradii']
+
+    def verifyfit(self, sim, profile, fitvals, outputname, raiseException = True):
+
+        masses, pdfs = fitvals
+
+        for delta in pdfs.keys():
+            maxpos = np.argmax(pdfs[delta], axis=1)
+            if np.any(np.logical_or(maxpos == 0, maxpos == (len(masses)-1))):
+
+                if raiseException:
+                    dump(sim, profile, fitvals, outputname)
+                    raise FailedFitException
+                return False
+
+        return True
+
+    def __call__(self, profiles):
+
+        #only want to define a scan for a 1d model at this point.
+        assert(isinstance(self.model, NFW_MC_Model))
+
+        ghat = np.atleast_2d(profiles.ghat).astype(np.float64)
+        sigma_ghat = np.atleast_2d(profiles.sigma_ghat).astype(np.float64)
+        beta_s = np.atleast_2d(profiles.beta_s).astype(np.float64)
+        beta_s2 = np.atleast_2d(profiles.beta_s2).astype(np.float64)
+        r_mpc = np.atleast_2d(profiles.r_mpc).astype(np.float64)
+        if r_mpc.shape[0] == 1:
+            r_mpc = np.repeat(r_mpc, ghat.shape[0], axis=0)
+
+        #flagged bins carry no information; give them a harmless radius & beta
+        flagged = sigma_ghat <= 0
+        beta_s = np.where(flagged, 1., beta_s)
+        beta_s2 = np.where(flagged, 1., beta_s2)
+
+        #group profiles with identical radial bins; each group shares one interpolation
+        radiigroups = {}
+        for i, radii in enumerate(r_mpc):
+            radiigroups.setdefault(np.where(flagged[i], 0., radii).tostring(), []).append(i)
+
+        if len(radiigroups) == 1:
+            rows = radiigroups.values()[0]
+            templateradii = np.ascontiguousarray(np.where(flagged[rows[0]], 1., r_mpc[rows[0]]))
+        else:
+            used = r_mpc[np.logical_not(flagged)]
+            rmin, rmax = 1., 1.
+            if len(used) > 0:
+                rmin, rmax = used.min(), used.max()
+            templateradii = np.logspace(np.log10(rmin), np.log10(max(rmax, 1.01*rmin)), self.ntemplateradii)
+
+        self.model.setData(beta_s, beta_s2, profiles.zcluster, zlens = profiles.zlens)
+
+        pdfs = {}
+
+        masses = self.masses
+
+        for delta in self.deltas:
+
+            workingmasses, c200s = self.massGrid(delta, profiles.zcluster)
+            workingmasses = np.ascontiguousarray(workingmasses, dtype=np.float64)
+            c200s = np.ascontiguousarray(c200s, dtype=np.float64)
+
+            logprob = np.zeros((len(ghat), len(masses)))
+
+            gamma_grid, kappa_grid = tools.nfwTemplates(workingmasses, c200s, templateradii,
+                                                        self.model.rho_c,
+                                                        self.model.rho_c_over_sigma_c,
+                                                        200.)
+
+            for rows in radiigroups.itervalues():
+
+                rows = np.array(rows)
+
+                if len(radiigroups) == 1:
+                    gamma_inf, kappa_inf = gamma_grid, kappa_grid
+                else:
+                    #linear in log radius; flagged bins are clipped to the grid, and skipped anyway
+                    radii = np.where(flagged[rows[0]], templateradii[0], r_mpc[rows[0]])
+                    pos = np.clip(np.log(radii/templateradii[0])/np.log(templateradii[1]/templateradii[0]),
+                                  0, len(templateradii) - 1)
+                    index = np.minimum(pos.astype(np.int), len(templateradii) - 2)
+                    weight = pos - index
+                    gamma_inf = np.ascontiguousarray(gamma_grid[:,index]*(1-weight) + gamma_grid[:,index+1]*weight)
+                    kappa_inf = np.ascontiguousarray(kappa_grid[:,index]*(1-weight) + kappa_grid[:,index+1]*weight)
+
+                logprob[rows] = tools.shearprofile_like_batch(gamma_inf, kappa_inf,
+                                                              np.ascontiguousarray(ghat[rows]),
+                                                              np.ascontiguousarray(sigma_ghat[rows]),
+                                                              np.ascontiguousarray(beta_s[rows]),
+                                                              np.ascontiguousarray(beta_s2[rows]))
+
+            pdf = np.exp(logprob - np.max(logprob, axis=1)[:,None])
+            pdf = pdf/scipy.integrate.trapz(pdf, masses, axis=1)[:,None]
+            pdfs[delta] = pdf
+
+            if np.any(np.logical_not(np.isfinite(pdf))):
+                raise BadPDFException
+
         return (masses, pdfs)
 
     #######
@@ -533,26 +1332,279 @@ def preloadNFWFit(configname):
 
 
 
+def configName(config):
+    '''Configs live one per directory; name them by it'''
+
+    if '__file__' not in config:
+        return ''
+
+    return os.path.basename(os.path.dirname(os.path.abspath(config['__file__'])))
+
+###
+
+def haloStreams(catalogname, config):
+    '''Random streams for one halo and config, if the config sets rngseed (else None, and
+    everything draws from np.random as before). Keyed on (rngseed, halo, config, rngrealization),
+    so a fit is reproducible however jobs are split between processes.'''
+
+    if 'rngseed' not in config:
+        return None
+
+    realization = 0
+    if 'rngrealization' in config:
+        realization = config['rngrealization']
+
+    return rngstreams.RNGStreams(config['rngseed']).child(os.path.basename(catalogname), configName(config), realization)
+
+###
+
+def fitTimer(simreader, catalogname, config):
+    '''An instrument.StageTimer if the config sets instrument = True or NFWFIT_INSTRUMENT
+    is in the environment, else None (no timing)'''
+
+    if not (('instrument' in config and config['instrument']) or 'NFWFIT_INSTRUMENT' in os.environ):
+        return None
+
+    return instrument.StageTimer(catalog = os.path.basename(catalogname),
+                                 config = configName(config),
+                                 simtype = simreader.__class__.__name__)
+
+###
+
 def runNFWFit_Preloaded(simreader, catalogname, config, outputname):
 
-    sim = simreader.load(catalogname)
+    timer = fitTimer(simreader, catalogname, config)
+
+    with instrument.stage(timer, 'load'):
+        sim = simreader.load(catalogname)
 
     profilebuilder = config['profilebuilder']
     fitter = config['fitter']
 
-    profile = profilebuilder(sim)
+    streams = haloStreams(catalogname, config)
+
+    with instrument.stage(timer, 'profilebuilder'):
+        profile = profilebuilder(sim, streams, timer)
+
+    with rngstreams.stage(streams, 'fitter'), instrument.stage(timer, 'fitter'):
+        fitvals = fitter(profile)
 
-    fitvals = fitter(profile)
+    with instrument.stage(timer, 'verifyfit'):
+        fitter.verifyfit(sim, profile, fitvals, outputname)
 
-    fitter.verifyfit(sim, profile, fitvals, outputname)
+    with instrument.stage(timer, 'savefit'):
+        savefit(fitvals, outputname)
 
-    savefit(fitvals, outputname)
+    if timer is not None:
+        timer.write(instrument.timingFile(outputname))
 
 ############################
 
 
 class FailedCreationException(Exception): pass
 
+############################
+
+def perfectProfile(m200, c200, zcluster, r_mpc, sigma = 0.01, beta = 0.5):
+    '''Noiseless binned profile of an NFW halo, for tests. r_mpc may be (nprofiles x nbins).'''
+
+    import nfwnoise
+
+    profile = catalog.Catalog()
+    profile.r_mpc = np.array(r_mpc, dtype=np.float64)
+    profile.beta_s = beta*np.ones(profile.r_mpc.shape)
+    profile.beta_s2 = profile.beta_s**2
+    profile.sigma_ghat = sigma*np.ones(profile.r_mpc.shape)
+    profile.ghat = nfwnoise.createPerfectProfile(m200, c200, zcluster, profile.r_mpc.flatten(),
+                                                 profile.beta_s.flatten()).reshape(profile.r_mpc.shape)
+    profile.zcluster = zcluster
+    profile.zlens = zcluster
+
+    return profile
+
+###
+
+class TestBatchPDFScanner(unittest.TestCase):
+
+    def setUp(self):
+
+        import basicMassCon
+
+        self.model = NFW_MC_Model()
+        self.config = dict(model = self.model, massconRelation = basicMassCon.Duffy(),
+                           scanpdf_minmass = 1e14, scanpdf_maxmass = 2e15, scanpdf_massstep = 2e13)
+        self.model.configure(self.config)
+
+    def stackedProfiles(self, nprofiles):
+        '''Profiles with slightly different radii in every bin, like MultiCenterProfileBuilder's mean radii'''
+
+        rng = np.random.RandomState(3)
+        radii = np.linspace(0.5, 2.5, 10)[None,:] + 0.05*rng.uniform(-1, 1, (nprofiles, 10))
+        profile = perfectProfile(5e14, 4., 0.3, radii, sigma = 0.02)
+        profile.ghat = profile.ghat + 0.02*rng.standard_normal(radii.shape)
+        profile.sigma_ghat[:,-1] = -1    #flagged, empty bin
+
+        return profile
+
+    def makeScanner(self, scannerclass):
+
+        scanner = scannerclass()
+        scanner.configure(self.config)
+        scanner.deltas = [200]
+
+        return scanner
+
+    def testMatchesSingleScans(self):
+
+        profiles = self.stackedProfiles(5)
+        masses, pdfs = self.makeScanner(BatchPDFScanner)(profiles)
+
+        scanner = self.makeScanner(PDFScanner)
+        for i in range(5):
+            single = catalog.Catalog()
+            for col in 'r_mpc ghat sigma_ghat beta_s beta_s2'.split():
+                setattr(single, col, getattr(profiles, col)[i,:-1])
+            single.zcluster = profiles.zcluster
+            single.zlens = profiles.zlens
+
+            singlemasses, singlepdfs = scanner(single)
+            self.assertTrue(np.allclose(pdfs[200][i], expandPDF(singlepdfs[200]),
+                                        rtol = 1e-4, atol = 1e-6*np.max(pdfs[200][i])))
+
+    def testTemplatesIndependentOfStackSize(self):
+
+        ncalls = []
+        nfwTemplates = tools.nfwTemplates
+        for nprofiles in [2, 20]:
+            calls = []
+            def countingTemplates(*args):
+                calls.append(len(args[2]))
+                return nfwTemplates(*args)
+            tools.nfwTemplates = countingTemplates
+            try:
+                self.makeScanner(BatchPDFScanner)(self.stackedProfiles(nprofiles))
+            finally:
+                tools.nfwTemplates = nfwTemplates
+            ncalls.append(calls)
+
+        self.assertEqual(ncalls[0], ncalls[1])
+        self.assertEqual(len(ncalls[0]), 1)
+
+###
+
+class TestMaxLikeFitter(unittest.TestCase):
+
+    def testRecoversPerfectProfile(self):
+
+        model = NFW_Model()
+        model.configure({})
+        fitter = MaxLikeFitter()
+        fitter.configure(dict(model = model))
+
+        for m200, c200 in [(8e14, 6.), (2e14, 3.)]:
+            profile = perfectProfile(m200, c200, 0.3, np.linspace(0.25, 3., 15))
+
+            values, errs = fitter(profile)
+
+            self.assertAlmostEqual(values['m200']*model.massScale/m200, 1., places = 4)
+            self.assertAlmostEqual(values['c200']/c200, 1., places = 3)
+
+###
+
+class TestLaplaceFitter(unittest.TestCase):
+
+    def setUp(self):
+
+        np.random.seed(11)
+        self.model = NFW_Model()
+        config = dict(model = self.model, nsamples = 6000)
+        self.model.configure(config)
+        self.fitter = LaplaceFitter()
+        self.fitter.configure(config)
+
+    def fitDelta(self, profile):
+
+        stdout = sys.stdout
+        sys.stdout = open(os.devnull, 'w')
+        try:
+            return self.fitter.fitDelta(profile, 200)
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+
+    def testFallsBackAtLowSN(self):
+
+        profile = perfectProfile(6e14, 5., 0.3, np.linspace(0.25, 3., 15), sigma = 3.)
+
+        chain = self.fitDelta(profile)
+
+        self.assertEqual(self.fitter.nfallbacks, 1)
+        self.assertTrue(len(chain['mdelta']) > 0)
+
+    def testMatchesNormalApproximationAtHighSN(self):
+
+        profile = perfectProfile(6e14, 5., 0.3, np.linspace(0.25, 3., 15), sigma = 0.002)
+
+        chain = self.fitDelta(profile)
+        self.assertEqual(self.fitter.nfallbacks, 0)
+        self.assertEqual(len(chain['mdelta']), self.fitter.nlaplacesamples)
+
+        mode, fisher = self.fitter.findMode(profile, 200)
+        covar = np.linalg.inv(fisher)
+        sigmas = np.sqrt(np.diag(covar))
+
+        samples = np.column_stack([np.log(chain['mdelta'].astype(np.float64)), chain['cdelta']])
+        samplecovar = np.cov(samples, rowvar = False)
+        samplesigmas = np.sqrt(np.diag(samplecovar))
+
+        #the posterior is slightly skewed, so its mean sits ~0.1 sigma from the mode
+        self.assertTrue((np.abs(np.mean(samples, axis=0) - mode) < 0.25*sigmas).all())
+        self.assertTrue((np.abs(samplesigmas/sigmas - 1) < 0.1).all())
+        self.assertAlmostEqual(samplecovar[0,1]/np.prod(samplesigmas), covar[0,1]/np.prod(sigmas), delta = 0.05)
+
+###
+
+class TestLockstepMCMCFitter(unittest.TestCase):
+
+    def testPaddedBins(self):
+
+        model = NFW_Model()
+        config = dict(model = model, nsamples = 6000)
+        model.configure(config)
+        fitter = LockstepMCMCFitter()
+        fitter.configure(config)
+
+        np.random.seed(2)
+        profiles = []
+        for nbins, zcluster in [(8, 0.25), (15, 0.5), (4, 0.3)]:
+            profile = perfectProfile(5e14, 4., zcluster, np.linspace(0.3, 2.5, nbins), sigma = 0.03)
+            profile.ghat = profile.ghat + 0.03*np.random.standard_normal(nbins)
+            profiles.append(profile)
+
+        data = fitter.padProfiles(profiles)
+        self.assertEqual(data['ghat'].shape, (3, 15))
+
+        mdelta = np.array([3e14, 8e14, 1.5e15])
+        cdelta = np.array([3., 5., 7.])
+        lockstep = tools.shearprofile_like_lockstep(mdelta, cdelta,
+                                                    *[data[key] for key in 'r_mpc ghat sigma_ghat beta_s beta_s2 rho_c rho_c_over_sigma_c'.split()] + [200.])
+
+        for i, profile in enumerate(profiles):
+            model.setData(profile.beta_s, profile.beta_s2, profile.zcluster, zlens = profile.zlens)
+            single = tools.shearprofile_like(mdelta[i], cdelta[i], profile.r_mpc, profile.ghat, profile.sigma_ghat,
+                                             profile.beta_s, profile.beta_s2, model.rho_c, model.rho_c_over_sigma_c, 200.)
+            self.assertAlmostEqual(lockstep[i], single, places = 8)
+
+###
+
+def test():
+
+    testcases = [TestBatchPDFScanner, TestMaxLikeFitter, TestLaplaceFitter, TestLockstepMCMCFitter]
+    suite = unittest.TestSuite(map(unittest.TestLoader().loadTestsFromTestCase,
+                                   testcases))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+############################
 
 if __name__ == '__main__':
 
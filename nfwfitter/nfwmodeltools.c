@@ -442,8 +442,8 @@ static CYTHON_INLINE float __PYX_NAN() {
   #endif
 #endif
 
-#define __PYX_HAVE__nfwfitter__nfwmodeltools
-#define __PYX_HAVE_API__nfwfitter__nfwmodeltools
+#define __PYX_HAVE__nfwmodeltools
+#define __PYX_HAVE_API__nfwmodeltools
 #include <string.h>
 #include <stdio.h>
 #include <stdlib.h>
@@ -897,14 +897,14 @@ typedef npy_double __pyx_t_5numpy_double_t;
  */
 typedef npy_longdouble __pyx_t_5numpy_longdouble_t;
 
-/* "nfwfitter/nfwmodeltools.pyx":37
+/* "nfwmodeltools.pyx":38
  * 
  * DTYPE = np.double
  * ctypedef np.double_t DTYPE_T             # <<<<<<<<<<<<<<
  * 
  * #########################
  */
-typedef __pyx_t_5numpy_double_t __pyx_t_9nfwfitter_13nfwmodeltools_DTYPE_T;
+typedef __pyx_t_5numpy_double_t __pyx_t_13nfwmodeltools_DTYPE_T;
 /* Declarations.proto */
 #if CYTHON_CCOMPLEX
   #ifdef __cplusplus
@@ -931,7 +931,7 @@ static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(do
 
 
 /*--- Type declarations ---*/
-struct __pyx_obj_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs;
+struct __pyx_obj_13nfwmodeltools___pyx_scope_struct__rdelta2rs;
 
 /* "../../anaconda2/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":764
  * ctypedef npy_longdouble longdouble_t
@@ -968,28 +968,28 @@ typedef npy_clongdouble __pyx_t_5numpy_clongdouble_t;
  * cdef inline object PyArray_MultiIterNew1(a):
  */
 typedef npy_cdouble __pyx_t_5numpy_complex_t;
-struct __pyx_opt_args_9nfwfitter_13nfwmodeltools_deltaC;
+struct __pyx_opt_args_13nfwmodeltools_deltaC;
 
-/* "nfwfitter/nfwmodeltools.pyx":46
+/* "nfwmodeltools.pyx":47
  * ############################
  * 
- * cdef double deltaC(double c, double delta = 200.):             # <<<<<<<<<<<<<<
+ * cdef double deltaC(double c, double delta = 200.) nogil:             # <<<<<<<<<<<<<<
  *     return (delta/3.) * c**3 / (log(1+c) - c/(1+c))
  * 
  */
-struct __pyx_opt_args_9nfwfitter_13nfwmodeltools_deltaC {
+struct __pyx_opt_args_13nfwmodeltools_deltaC {
   int __pyx_n;
   double delta;
 };
 
-/* "nfwfitter/nfwmodeltools.pyx":186
+/* "nfwmodeltools.pyx":187
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def rdelta2rs(double rdelta,             # <<<<<<<<<<<<<<
  *               double c200,
  *               double delta):
  */
-struct __pyx_obj_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs {
+struct __pyx_obj_13nfwmodeltools___pyx_scope_struct__rdelta2rs {
   PyObject_HEAD
   double __pyx_v_delta;
   double __pyx_v_delta_c;
@@ -1060,6 +1060,30 @@ struct __pyx_obj_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs {
 #define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
 #define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
 
+/* PyObjectGetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* ForceInitThreads.proto */
+#ifndef __PYX_FORCE_INIT_THREADS
+  #define __PYX_FORCE_INIT_THREADS 0
+#endif
+
 /* PyThreadStateGet.proto */
 #if CYTHON_FAST_THREAD_STATE
 #define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
@@ -1114,25 +1138,6 @@ static void __Pyx_BufFmt_Init(__Pyx_BufFmt_Context* ctx,
                               __Pyx_BufFmt_StackElem* stack,
                               __Pyx_TypeInfo* type); // PROTO
 
-/* PyObjectGetAttrStr.proto */
-#if CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
-    PyTypeObject* tp = Py_TYPE(obj);
-    if (likely(tp->tp_getattro))
-        return tp->tp_getattro(obj, attr_name);
-#if PY_MAJOR_VERSION < 3
-    if (likely(tp->tp_getattr))
-        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
-#endif
-    return PyObject_GetAttr(obj, attr_name);
-}
-#else
-#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
-#endif
-
-/* GetBuiltinName.proto */
-static PyObject *__Pyx_GetBuiltinName(PyObject *name);
-
 /* GetModuleGlobalName.proto */
 static CYTHON_INLINE PyObject *__Pyx_GetModuleGlobalName(PyObject *name);
 
@@ -1241,9 +1246,50 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObjec
 /* BufferFallbackError.proto */
 static void __Pyx_RaiseBufferFallbackError(void);
 
+/* SetItemInt.proto */
+#define __Pyx_SetItemInt(o, i, v, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_SetItemInt_Fast(o, (Py_ssize_t)i, v, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list assignment index out of range"), -1) :\
+               __Pyx_SetItemInt_Generic(o, to_py_func(i), v)))
+static CYTHON_INLINE int __Pyx_SetItemInt_Generic(PyObject *o, PyObject *j, PyObject *v);
+static CYTHON_INLINE int __Pyx_SetItemInt_Fast(PyObject *o, Py_ssize_t i, PyObject *v,
+                                               int is_list, int wraparound, int boundscheck);
+
+/* GetItemInt.proto */
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
+               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int is_list, int wraparound, int boundscheck);
+
+#define __Pyx_BufPtrCContig2d(type, buf, i0, s0, i1, s1) ((type)((char*)buf + i0 * s0) + i1)
 /* RaiseException.proto */
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
 
+/* PyFloatBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyFloat_DivideObjC(PyObject *op1, PyObject *op2, double floatval, int inplace);
+#else
+#define __Pyx_PyFloat_DivideObjC(op1, op2, floatval, inplace)\
+    ((inplace ? __Pyx_PyNumber_InPlaceDivide(op1, op2) : __Pyx_PyNumber_Divide(op1, op2)))
+    #endif
+
 /* DictGetItem.proto */
 #if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
 static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key) {
@@ -1522,19 +1568,23 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *, cha
 
 /* Module declarations from 'cython' */
 
-/* Module declarations from 'nfwfitter.nfwmodeltools' */
-static PyTypeObject *__pyx_ptype_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs = 0;
-static double __pyx_f_9nfwfitter_13nfwmodeltools_deltaC(double, struct __pyx_opt_args_9nfwfitter_13nfwmodeltools_deltaC *__pyx_optional_args); /*proto*/
+/* Module declarations from 'nfwmodeltools' */
+static PyTypeObject *__pyx_ptype_13nfwmodeltools___pyx_scope_struct__rdelta2rs = 0;
+static double __pyx_v_13nfwmodeltools_logsqrt2pi_c;
+static double __pyx_f_13nfwmodeltools_deltaC(double, struct __pyx_opt_args_13nfwmodeltools_deltaC *__pyx_optional_args); /*proto*/
+static CYTHON_INLINE void __pyx_f_13nfwmodeltools_nfwProfileDerivs(double, double *, double *, double *, double *); /*proto*/
 static __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5numpy_double_t = { "double_t", NULL, sizeof(__pyx_t_5numpy_double_t), { 0 }, 0, 'R', 0, 0 };
-static __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_9nfwfitter_13nfwmodeltools_DTYPE_T = { "DTYPE_T", NULL, sizeof(__pyx_t_9nfwfitter_13nfwmodeltools_DTYPE_T), { 0 }, 0, 'R', 0, 0 };
-#define __Pyx_MODULE_NAME "nfwfitter.nfwmodeltools"
-int __pyx_module_is_main_nfwfitter__nfwmodeltools = 0;
+static __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_13nfwmodeltools_DTYPE_T = { "DTYPE_T", NULL, sizeof(__pyx_t_13nfwmodeltools_DTYPE_T), { 0 }, 0, 'R', 0, 0 };
+#define __Pyx_MODULE_NAME "nfwmodeltools"
+int __pyx_module_is_main_nfwmodeltools = 0;
 
-/* Implementation of 'nfwfitter.nfwmodeltools' */
+/* Implementation of 'nfwmodeltools' */
 static PyObject *__pyx_builtin_ValueError;
 static PyObject *__pyx_builtin_range;
 static PyObject *__pyx_builtin_RuntimeError;
 static PyObject *__pyx_builtin_ImportError;
+static const char __pyx_k_G[] = "G";
+static const char __pyx_k_K[] = "K";
 static const char __pyx_k_R[] = "R";
 static const char __pyx_k_a[] = "a";
 static const char __pyx_k_b[] = "b";
@@ -1543,27 +1593,43 @@ static const char __pyx_k_f[] = "f";
 static const char __pyx_k_g[] = "g";
 static const char __pyx_k_i[] = "i";
 static const char __pyx_k_j[] = "j";
+static const char __pyx_k_m[] = "m";
+static const char __pyx_k_p[] = "p";
 static const char __pyx_k_r[] = "r";
 static const char __pyx_k_s[] = "s";
 static const char __pyx_k_x[] = "x";
+static const char __pyx_k_dG[] = "dG";
+static const char __pyx_k_dK[] = "dK";
+static const char __pyx_k_ks[] = "ks";
+static const char __pyx_k_mc[] = "mc";
 static const char __pyx_k_np[] = "np";
 static const char __pyx_k_pi[] = "pi";
 static const char __pyx_k_rs[] = "rs";
 static const char __pyx_k_x0[] = "x0";
 static const char __pyx_k_amp[] = "amp";
+static const char __pyx_k_dg0[] = "dg0";
+static const char __pyx_k_dg1[] = "dg1";
 static const char __pyx_k_log[] = "log";
 static const char __pyx_k_c200[] = "c200";
 static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_norm[] = "norm";
 static const char __pyx_k_npos[] = "npos";
+static const char __pyx_k_sign[] = "sign";
 static const char __pyx_k_sqrt[] = "sqrt";
 static const char __pyx_k_test[] = "__test__";
 static const char __pyx_k_DTYPE[] = "DTYPE";
+static const char __pyx_k_array[] = "array";
 static const char __pyx_k_delta[] = "delta";
+static const char __pyx_k_denom[] = "denom";
 static const char __pyx_k_dtype[] = "dtype";
+static const char __pyx_k_gamma[] = "gamma";
+static const char __pyx_k_grad0[] = "grad0";
+static const char __pyx_k_grad1[] = "grad1";
 static const char __pyx_k_kappa[] = "kappa";
 static const char __pyx_k_nbins[] = "nbins";
 static const char __pyx_k_numpy[] = "numpy";
 static const char __pyx_k_range[] = "range";
+static const char __pyx_k_resid[] = "resid";
 static const char __pyx_k_rho_c[] = "rho_c";
 static const char __pyx_k_scipy[] = "scipy";
 static const char __pyx_k_zeros[] = "zeros";
@@ -1574,6 +1640,8 @@ static const char __pyx_k_cvs_id[] = "__cvs_id__";
 static const char __pyx_k_double[] = "double";
 static const char __pyx_k_gtilde[] = "gtilde";
 static const char __pyx_k_import[] = "__import__";
+static const char __pyx_k_invsig[] = "invsig";
+static const char __pyx_k_invvar[] = "invvar";
 static const char __pyx_k_mdelta[] = "mdelta";
 static const char __pyx_k_modelg[] = "modelg";
 static const char __pyx_k_modsig[] = "modsig";
@@ -1581,35 +1649,56 @@ static const char __pyx_k_rdelta[] = "rdelta";
 static const char __pyx_k_rscale[] = "rscale";
 static const char __pyx_k_avebeta[] = "avebeta";
 static const char __pyx_k_delta_c[] = "delta_c";
+static const char __pyx_k_dgamma0[] = "dgamma0";
+static const char __pyx_k_dgamma1[] = "dgamma1";
+static const char __pyx_k_dkappa0[] = "dkappa0";
+static const char __pyx_k_dkappa1[] = "dkappa1";
+static const char __pyx_k_dlnx_dc[] = "dlnx_dc";
 static const char __pyx_k_float64[] = "float64";
 static const char __pyx_k_logProb[] = "logProb";
+static const char __pyx_k_nmasses[] = "nmasses";
+static const char __pyx_k_nmodels[] = "nmodels";
 static const char __pyx_k_NFWKappa[] = "NFWKappa";
 static const char __pyx_k_NFWShear[] = "NFWShear";
 static const char __pyx_k_avebeta2[] = "avebeta2";
 static const char __pyx_k_avekappa[] = "avekappa";
+static const char __pyx_k_dlnks_dc[] = "dlnks_dc";
+static const char __pyx_k_fisher00[] = "fisher00";
+static const char __pyx_k_fisher01[] = "fisher01";
+static const char __pyx_k_fisher11[] = "fisher11";
 static const char __pyx_k_nfwutils[] = "nfwutils";
 static const char __pyx_k_optimize[] = "optimize";
 static const char __pyx_k_betaratio[] = "betaratio";
 static const char __pyx_k_bin_r_mpc[] = "bin_r_mpc";
 static const char __pyx_k_bin_shear[] = "bin_shear";
+static const char __pyx_k_dlnx_dlnm[] = "dlnx_dlnm";
 static const char __pyx_k_gamma_inf[] = "gamma_inf";
 static const char __pyx_k_kappa_inf[] = "kappa_inf";
 static const char __pyx_k_massdelta[] = "massdelta";
+static const char __pyx_k_nprofiles[] = "nprofiles";
 static const char __pyx_k_rdelta2rs[] = "rdelta2rs";
 static const char __pyx_k_ValueError[] = "ValueError";
+static const char __pyx_k_curlogprob[] = "curlogprob";
+static const char __pyx_k_dlnks_dlnm[] = "dlnks_dlnm";
 static const char __pyx_k_logsqrt2pi[] = "logsqrt2pi";
 static const char __pyx_k_ImportError[] = "ImportError";
 static const char __pyx_k_massInsideR[] = "massInsideR";
 static const char __pyx_k_RuntimeError[] = "RuntimeError";
 static const char __pyx_k_bin_shearerr[] = "bin_shearerr";
+static const char __pyx_k_nfwTemplates[] = "nfwTemplates";
 static const char __pyx_k_rscaleConstM[] = "rscaleConstM";
 static const char __pyx_k_concentration[] = "concentration";
+static const char __pyx_k_fourpi_over_3[] = "fourpi_over_3";
+static const char __pyx_k_nfwmodeltools[] = "nfwmodeltools";
 static const char __pyx_k_scipy_optimize[] = "scipy.optimize";
 static const char __pyx_k_aveEnclosedKappa[] = "aveEnclosedKappa";
 static const char __pyx_k_shearprofile_like[] = "shearprofile_like";
 static const char __pyx_k_rdelta2rs_locals_f[] = "rdelta2rs.<locals>.f";
 static const char __pyx_k_rho_c_over_sigma_c[] = "rho_c_over_sigma_c";
-static const char __pyx_k_nfwfitter_nfwmodeltools[] = "nfwfitter.nfwmodeltools";
+static const char __pyx_k_shearprofile_like_grad[] = "shearprofile_like_grad";
+static const char __pyx_k_mdelta_must_be_positive[] = "mdelta must be positive";
+static const char __pyx_k_shearprofile_like_batch[] = "shearprofile_like_batch";
+static const char __pyx_k_shearprofile_like_lockstep[] = "shearprofile_like_lockstep";
 static const char __pyx_k_ndarray_is_not_C_contiguous[] = "ndarray is not C contiguous";
 static const char __pyx_k_Id_nfwmodeltools_pyx_v_1_5_2011[] = "$Id: nfwmodeltools.pyx,v 1.5 2011-02-09 01:59:14 dapple Exp $";
 static const char __pyx_k_home_avestruz_codes_clmassmod_n[] = "/home/avestruz/codes/clmassmod/nfwfitter/nfwmodeltools.pyx";
@@ -1623,8 +1712,10 @@ static const char __pyx_k_Format_string_allocated_too_shor_2[] = "Format string
 static PyObject *__pyx_n_s_DTYPE;
 static PyObject *__pyx_kp_u_Format_string_allocated_too_shor;
 static PyObject *__pyx_kp_u_Format_string_allocated_too_shor_2;
+static PyObject *__pyx_n_s_G;
 static PyObject *__pyx_kp_s_Id_nfwmodeltools_pyx_v_1_5_2011;
 static PyObject *__pyx_n_s_ImportError;
+static PyObject *__pyx_n_s_K;
 static PyObject *__pyx_n_s_NFWKappa;
 static PyObject *__pyx_n_s_NFWShear;
 static PyObject *__pyx_kp_u_Non_native_byte_order_not_suppor;
@@ -1633,6 +1724,7 @@ static PyObject *__pyx_n_s_RuntimeError;
 static PyObject *__pyx_n_s_ValueError;
 static PyObject *__pyx_n_s_a;
 static PyObject *__pyx_n_s_amp;
+static PyObject *__pyx_n_s_array;
 static PyObject *__pyx_n_s_aveEnclosedKappa;
 static PyObject *__pyx_n_s_avebeta;
 static PyObject *__pyx_n_s_avebeta2;
@@ -1648,48 +1740,82 @@ static PyObject *__pyx_n_s_c200;
 static PyObject *__pyx_n_s_cdelta;
 static PyObject *__pyx_n_s_concentration;
 static PyObject *__pyx_n_s_curbin;
+static PyObject *__pyx_n_s_curlogprob;
 static PyObject *__pyx_n_s_cvs_id;
+static PyObject *__pyx_n_s_dG;
+static PyObject *__pyx_n_s_dK;
 static PyObject *__pyx_n_s_delta;
 static PyObject *__pyx_n_s_delta_c;
+static PyObject *__pyx_n_s_denom;
+static PyObject *__pyx_n_s_dg0;
+static PyObject *__pyx_n_s_dg1;
+static PyObject *__pyx_n_s_dgamma0;
+static PyObject *__pyx_n_s_dgamma1;
+static PyObject *__pyx_n_s_dkappa0;
+static PyObject *__pyx_n_s_dkappa1;
+static PyObject *__pyx_n_s_dlnks_dc;
+static PyObject *__pyx_n_s_dlnks_dlnm;
+static PyObject *__pyx_n_s_dlnx_dc;
+static PyObject *__pyx_n_s_dlnx_dlnm;
 static PyObject *__pyx_n_s_double;
 static PyObject *__pyx_n_s_dtype;
 static PyObject *__pyx_n_s_f;
+static PyObject *__pyx_n_s_fisher00;
+static PyObject *__pyx_n_s_fisher01;
+static PyObject *__pyx_n_s_fisher11;
 static PyObject *__pyx_n_s_float64;
+static PyObject *__pyx_n_s_fourpi_over_3;
 static PyObject *__pyx_n_s_g;
+static PyObject *__pyx_n_s_gamma;
 static PyObject *__pyx_n_s_gamma_inf;
+static PyObject *__pyx_n_s_grad0;
+static PyObject *__pyx_n_s_grad1;
 static PyObject *__pyx_n_s_gtilde;
 static PyObject *__pyx_kp_s_home_avestruz_codes_clmassmod_n;
 static PyObject *__pyx_n_s_i;
 static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_s_invsig;
+static PyObject *__pyx_n_s_invvar;
 static PyObject *__pyx_n_s_j;
 static PyObject *__pyx_n_s_kappa;
 static PyObject *__pyx_n_s_kappa_inf;
+static PyObject *__pyx_n_s_ks;
 static PyObject *__pyx_n_s_log;
 static PyObject *__pyx_n_s_logProb;
 static PyObject *__pyx_n_s_logsqrt2pi;
+static PyObject *__pyx_n_s_m;
 static PyObject *__pyx_n_s_main;
 static PyObject *__pyx_n_s_massInsideR;
 static PyObject *__pyx_n_s_massdelta;
+static PyObject *__pyx_n_s_mc;
 static PyObject *__pyx_n_s_mdelta;
+static PyObject *__pyx_kp_s_mdelta_must_be_positive;
 static PyObject *__pyx_n_s_modelg;
 static PyObject *__pyx_n_s_modsig;
 static PyObject *__pyx_n_s_nbins;
 static PyObject *__pyx_kp_u_ndarray_is_not_C_contiguous;
 static PyObject *__pyx_kp_u_ndarray_is_not_Fortran_contiguou;
-static PyObject *__pyx_n_s_nfwfitter_nfwmodeltools;
+static PyObject *__pyx_n_s_nfwTemplates;
+static PyObject *__pyx_n_s_nfwmodeltools;
 static PyObject *__pyx_n_s_nfwutils;
+static PyObject *__pyx_n_s_nmasses;
+static PyObject *__pyx_n_s_nmodels;
+static PyObject *__pyx_n_s_norm;
 static PyObject *__pyx_n_s_np;
 static PyObject *__pyx_n_s_npos;
+static PyObject *__pyx_n_s_nprofiles;
 static PyObject *__pyx_n_s_numpy;
 static PyObject *__pyx_kp_s_numpy_core_multiarray_failed_to;
 static PyObject *__pyx_kp_s_numpy_core_umath_failed_to_impor;
 static PyObject *__pyx_n_s_optimize;
+static PyObject *__pyx_n_s_p;
 static PyObject *__pyx_n_s_pi;
 static PyObject *__pyx_n_s_r;
 static PyObject *__pyx_n_s_range;
 static PyObject *__pyx_n_s_rdelta;
 static PyObject *__pyx_n_s_rdelta2rs;
 static PyObject *__pyx_n_s_rdelta2rs_locals_f;
+static PyObject *__pyx_n_s_resid;
 static PyObject *__pyx_n_s_rho_c;
 static PyObject *__pyx_n_s_rho_c_over_sigma_c;
 static PyObject *__pyx_n_s_rs;
@@ -1699,25 +1825,35 @@ static PyObject *__pyx_n_s_s;
 static PyObject *__pyx_n_s_scipy;
 static PyObject *__pyx_n_s_scipy_optimize;
 static PyObject *__pyx_n_s_shearprofile_like;
+static PyObject *__pyx_n_s_shearprofile_like_batch;
+static PyObject *__pyx_n_s_shearprofile_like_grad;
+static PyObject *__pyx_n_s_shearprofile_like_lockstep;
+static PyObject *__pyx_n_s_sign;
 static PyObject *__pyx_n_s_sqrt;
 static PyObject *__pyx_n_s_test;
 static PyObject *__pyx_kp_u_unknown_dtype_code_in_numpy_pxd;
 static PyObject *__pyx_n_s_x;
 static PyObject *__pyx_n_s_x0;
 static PyObject *__pyx_n_s_zeros;
-static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_r, double __pyx_v_concentration, double __pyx_v_rs, double __pyx_v_rho_c_over_sigma_c, double __pyx_v_delta); /* proto */
-static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_r, double __pyx_v_concentration, double __pyx_v_rs, double __pyx_v_rho_c_over_sigma_c, double __pyx_v_delta); /* proto */
-static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_r, double __pyx_v_concentration, double __pyx_v_rs, double __pyx_v_rho_c_over_sigma_c, double __pyx_v_delta); /* proto */
-static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_9rdelta2rs_f(PyObject *__pyx_self, PyObject *__pyx_v_x); /* proto */
-static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_6rdelta2rs(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_rdelta, double __pyx_v_c200, double __pyx_v_delta); /* proto */
-static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_8rscaleConstM(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_mdelta, double __pyx_v_c, double __pyx_v_rho_c, double __pyx_v_delta); /* proto */
-static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_10massInsideR(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_rs, double __pyx_v_c, double __pyx_v_R, double __pyx_v_rho_c); /* proto */
-static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_mdelta, double __pyx_v_cdelta, PyArrayObject *__pyx_v_bin_r_mpc, PyArrayObject *__pyx_v_bin_shear, PyArrayObject *__pyx_v_bin_shearerr, PyArrayObject *__pyx_v_avebeta, PyArrayObject *__pyx_v_avebeta2, double __pyx_v_rho_c, double __pyx_v_rho_c_over_sigma_c, double __pyx_v_massdelta); /* proto */
+static PyObject *__pyx_pf_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_r, double __pyx_v_concentration, double __pyx_v_rs, double __pyx_v_rho_c_over_sigma_c, double __pyx_v_delta); /* proto */
+static PyObject *__pyx_pf_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_r, double __pyx_v_concentration, double __pyx_v_rs, double __pyx_v_rho_c_over_sigma_c, double __pyx_v_delta); /* proto */
+static PyObject *__pyx_pf_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_r, double __pyx_v_concentration, double __pyx_v_rs, double __pyx_v_rho_c_over_sigma_c, double __pyx_v_delta); /* proto */
+static PyObject *__pyx_pf_13nfwmodeltools_9rdelta2rs_f(PyObject *__pyx_self, PyObject *__pyx_v_x); /* proto */
+static PyObject *__pyx_pf_13nfwmodeltools_6rdelta2rs(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_rdelta, double __pyx_v_c200, double __pyx_v_delta); /* proto */
+static PyObject *__pyx_pf_13nfwmodeltools_8rscaleConstM(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_mdelta, double __pyx_v_c, double __pyx_v_rho_c, double __pyx_v_delta); /* proto */
+static PyObject *__pyx_pf_13nfwmodeltools_10massInsideR(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_rs, double __pyx_v_c, double __pyx_v_R, double __pyx_v_rho_c); /* proto */
+static PyObject *__pyx_pf_13nfwmodeltools_12shearprofile_like(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_mdelta, double __pyx_v_cdelta, PyArrayObject *__pyx_v_bin_r_mpc, PyArrayObject *__pyx_v_bin_shear, PyArrayObject *__pyx_v_bin_shearerr, PyArrayObject *__pyx_v_avebeta, PyArrayObject *__pyx_v_avebeta2, double __pyx_v_rho_c, double __pyx_v_rho_c_over_sigma_c, double __pyx_v_massdelta); /* proto */
+static PyObject *__pyx_pf_13nfwmodeltools_14nfwTemplates(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_mdelta, PyArrayObject *__pyx_v_cdelta, PyArrayObject *__pyx_v_bin_r_mpc, double __pyx_v_rho_c, double __pyx_v_rho_c_over_sigma_c, double __pyx_v_massdelta); /* proto */
+static PyObject *__pyx_pf_13nfwmodeltools_16shearprofile_like_batch(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_gamma_inf, PyArrayObject *__pyx_v_kappa_inf, PyArrayObject *__pyx_v_bin_shear, PyArrayObject *__pyx_v_bin_shearerr, PyArrayObject *__pyx_v_avebeta, PyArrayObject *__pyx_v_avebeta2); /* proto */
+static PyObject *__pyx_pf_13nfwmodeltools_18shearprofile_like_grad(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_mdelta, double __pyx_v_cdelta, PyArrayObject *__pyx_v_bin_r_mpc, PyArrayObject *__pyx_v_bin_shear, PyArrayObject *__pyx_v_bin_shearerr, PyArrayObject *__pyx_v_avebeta, PyArrayObject *__pyx_v_avebeta2, double __pyx_v_rho_c, double __pyx_v_rho_c_over_sigma_c, double __pyx_v_massdelta); /* proto */
+static PyObject *__pyx_pf_13nfwmodeltools_20shearprofile_like_lockstep(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_mdelta, PyArrayObject *__pyx_v_cdelta, PyArrayObject *__pyx_v_bin_r_mpc, PyArrayObject *__pyx_v_bin_shear, PyArrayObject *__pyx_v_bin_shearerr, PyArrayObject *__pyx_v_avebeta, PyArrayObject *__pyx_v_avebeta2, PyArrayObject *__pyx_v_rho_c, PyArrayObject *__pyx_v_rho_c_over_sigma_c, double __pyx_v_massdelta); /* proto */
 static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /* proto */
 static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info); /* proto */
-static PyObject *__pyx_tp_new_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_13nfwmodeltools___pyx_scope_struct__rdelta2rs(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_float__5;
 static PyObject *__pyx_float_0_;
+static PyObject *__pyx_float_3_;
+static PyObject *__pyx_float_4_;
 static PyObject *__pyx_float_0_1;
 static PyObject *__pyx_int_1;
 static PyObject *__pyx_int_2;
@@ -1734,46 +1870,53 @@ static PyObject *__pyx_tuple__9;
 static PyObject *__pyx_tuple__10;
 static PyObject *__pyx_tuple__11;
 static PyObject *__pyx_tuple__12;
-static PyObject *__pyx_tuple__14;
-static PyObject *__pyx_tuple__16;
-static PyObject *__pyx_tuple__18;
-static PyObject *__pyx_tuple__20;
-static PyObject *__pyx_tuple__22;
-static PyObject *__pyx_tuple__24;
+static PyObject *__pyx_tuple__13;
+static PyObject *__pyx_tuple__15;
+static PyObject *__pyx_tuple__17;
+static PyObject *__pyx_tuple__19;
+static PyObject *__pyx_tuple__21;
+static PyObject *__pyx_tuple__23;
+static PyObject *__pyx_tuple__25;
+static PyObject *__pyx_tuple__27;
+static PyObject *__pyx_tuple__29;
+static PyObject *__pyx_tuple__31;
+static PyObject *__pyx_tuple__33;
 static PyObject *__pyx_codeobj__2;
-static PyObject *__pyx_codeobj__13;
-static PyObject *__pyx_codeobj__15;
-static PyObject *__pyx_codeobj__17;
-static PyObject *__pyx_codeobj__19;
-static PyObject *__pyx_codeobj__21;
-static PyObject *__pyx_codeobj__23;
-static PyObject *__pyx_codeobj__25;
-
-/* "nfwfitter/nfwmodeltools.pyx":46
+static PyObject *__pyx_codeobj__14;
+static PyObject *__pyx_codeobj__16;
+static PyObject *__pyx_codeobj__18;
+static PyObject *__pyx_codeobj__20;
+static PyObject *__pyx_codeobj__22;
+static PyObject *__pyx_codeobj__24;
+static PyObject *__pyx_codeobj__26;
+static PyObject *__pyx_codeobj__28;
+static PyObject *__pyx_codeobj__30;
+static PyObject *__pyx_codeobj__32;
+static PyObject *__pyx_codeobj__34;
+
+/* "nfwmodeltools.pyx":47
  * ############################
  * 
- * cdef double deltaC(double c, double delta = 200.):             # <<<<<<<<<<<<<<
+ * cdef double deltaC(double c, double delta = 200.) nogil:             # <<<<<<<<<<<<<<
  *     return (delta/3.) * c**3 / (log(1+c) - c/(1+c))
  * 
  */
 
-static double __pyx_f_9nfwfitter_13nfwmodeltools_deltaC(double __pyx_v_c, struct __pyx_opt_args_9nfwfitter_13nfwmodeltools_deltaC *__pyx_optional_args) {
+static double __pyx_f_13nfwmodeltools_deltaC(double __pyx_v_c, struct __pyx_opt_args_13nfwmodeltools_deltaC *__pyx_optional_args) {
   double __pyx_v_delta = ((double)200.);
   double __pyx_r;
-  __Pyx_RefNannyDeclarations
   double __pyx_t_1;
   double __pyx_t_2;
   double __pyx_t_3;
-  __Pyx_RefNannySetupContext("deltaC", 0);
   if (__pyx_optional_args) {
     if (__pyx_optional_args->__pyx_n > 0) {
       __pyx_v_delta = __pyx_optional_args->delta;
     }
   }
 
-  /* "nfwfitter/nfwmodeltools.pyx":47
+  /* "nfwmodeltools.pyx":48
  * 
- * cdef double deltaC(double c, double delta = 200.):
+ * cdef double deltaC(double c, double delta = 200.) nogil:
  *     return (delta/3.) * c**3 / (log(1+c) - c/(1+c))             # <<<<<<<<<<<<<<
  * 
  * ##############
@@ -1781,35 +1924,46 @@ static double __pyx_f_9nfwfitter_13nfwmodeltools_deltaC(double __pyx_v_c, struct
   __pyx_t_1 = ((__pyx_v_delta / 3.) * pow(__pyx_v_c, 3.0));
   __pyx_t_2 = (1.0 + __pyx_v_c);
   if (unlikely(__pyx_t_2 == 0)) {
+    #ifdef WITH_THREAD
+    PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
+    #endif
     PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-    __PYX_ERR(0, 47, __pyx_L1_error)
+    #ifdef WITH_THREAD
+    PyGILState_Release(__pyx_gilstate_save);
+    #endif
+    __PYX_ERR(0, 48, __pyx_L1_error)
   }
   __pyx_t_3 = (log((1.0 + __pyx_v_c)) - (__pyx_v_c / __pyx_t_2));
   if (unlikely(__pyx_t_3 == 0)) {
+    #ifdef WITH_THREAD
+    PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
+    #endif
     PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-    __PYX_ERR(0, 47, __pyx_L1_error)
+    #ifdef WITH_THREAD
+    PyGILState_Release(__pyx_gilstate_save);
+    #endif
+    __PYX_ERR(0, 48, __pyx_L1_error)
   }
   __pyx_r = (__pyx_t_1 / __pyx_t_3);
   goto __pyx_L0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":46
+  /* "nfwmodeltools.pyx":47
  * ############################
  * 
- * cdef double deltaC(double c, double delta = 200.):             # <<<<<<<<<<<<<<
+ * cdef double deltaC(double c, double delta = 200.) nogil:             # <<<<<<<<<<<<<<
  *     return (delta/3.) * c**3 / (log(1+c) - c/(1+c))
  * 
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_WriteUnraisable("nfwfitter.nfwmodeltools.deltaC", __pyx_clineno, __pyx_lineno, __pyx_filename, 0, 0);
+  __Pyx_WriteUnraisable("nfwmodeltools.deltaC", __pyx_clineno, __pyx_lineno, __pyx_filename, 0, 1);
   __pyx_r = 0;
   __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "nfwfitter/nfwmodeltools.pyx":54
+/* "nfwmodeltools.pyx":55
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def NFWShear(np.ndarray[np.double_t, ndim=1, mode='c'] r,             # <<<<<<<<<<<<<<
@@ -1818,9 +1972,9 @@ static double __pyx_f_9nfwfitter_13nfwmodeltools_deltaC(double __pyx_v_c, struct
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_1NFWShear(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_9nfwfitter_13nfwmodeltools_1NFWShear = {"NFWShear", (PyCFunction)__pyx_pw_9nfwfitter_13nfwmodeltools_1NFWShear, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_1NFWShear(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_13nfwmodeltools_1NFWShear(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_13nfwmodeltools_1NFWShear = {"NFWShear", (PyCFunction)__pyx_pw_13nfwmodeltools_1NFWShear, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_13nfwmodeltools_1NFWShear(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyArrayObject *__pyx_v_r = 0;
   double __pyx_v_concentration;
   double __pyx_v_rs;
@@ -1852,17 +2006,17 @@ static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_1NFWShear(PyObject *__pyx_s
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_concentration)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("NFWShear", 0, 4, 5, 1); __PYX_ERR(0, 54, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("NFWShear", 0, 4, 5, 1); __PYX_ERR(0, 55, __pyx_L3_error)
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_rs)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("NFWShear", 0, 4, 5, 2); __PYX_ERR(0, 54, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("NFWShear", 0, 4, 5, 2); __PYX_ERR(0, 55, __pyx_L3_error)
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_rho_c_over_sigma_c)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("NFWShear", 0, 4, 5, 3); __PYX_ERR(0, 54, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("NFWShear", 0, 4, 5, 3); __PYX_ERR(0, 55, __pyx_L3_error)
         }
         case  4:
         if (kw_args > 0) {
@@ -1871,7 +2025,7 @@ static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_1NFWShear(PyObject *__pyx_s
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "NFWShear") < 0)) __PYX_ERR(0, 54, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "NFWShear") < 0)) __PYX_ERR(0, 55, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -1885,25 +2039,25 @@ static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_1NFWShear(PyObject *__pyx_s
       }
     }
     __pyx_v_r = ((PyArrayObject *)values[0]);
-    __pyx_v_concentration = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_concentration == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 55, __pyx_L3_error)
-    __pyx_v_rs = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_rs == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 56, __pyx_L3_error)
-    __pyx_v_rho_c_over_sigma_c = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_rho_c_over_sigma_c == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 57, __pyx_L3_error)
+    __pyx_v_concentration = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_concentration == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 56, __pyx_L3_error)
+    __pyx_v_rs = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_rs == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 57, __pyx_L3_error)
+    __pyx_v_rho_c_over_sigma_c = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_rho_c_over_sigma_c == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 58, __pyx_L3_error)
     if (values[4]) {
-      __pyx_v_delta = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_delta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 58, __pyx_L3_error)
+      __pyx_v_delta = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_delta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 59, __pyx_L3_error)
     } else {
       __pyx_v_delta = ((double)200.);
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("NFWShear", 0, 4, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 54, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("NFWShear", 0, 4, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 55, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("nfwfitter.nfwmodeltools.NFWShear", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("nfwmodeltools.NFWShear", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_r), __pyx_ptype_5numpy_ndarray, 1, "r", 0))) __PYX_ERR(0, 54, __pyx_L1_error)
-  __pyx_r = __pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(__pyx_self, __pyx_v_r, __pyx_v_concentration, __pyx_v_rs, __pyx_v_rho_c_over_sigma_c, __pyx_v_delta);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_r), __pyx_ptype_5numpy_ndarray, 1, "r", 0))) __PYX_ERR(0, 55, __pyx_L1_error)
+  __pyx_r = __pyx_pf_13nfwmodeltools_NFWShear(__pyx_self, __pyx_v_r, __pyx_v_concentration, __pyx_v_rs, __pyx_v_rho_c_over_sigma_c, __pyx_v_delta);
 
   /* function exit code */
   goto __pyx_L0;
@@ -1914,7 +2068,7 @@ static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_1NFWShear(PyObject *__pyx_s
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_r, double __pyx_v_concentration, double __pyx_v_rs, double __pyx_v_rho_c_over_sigma_c, double __pyx_v_delta) {
+static PyObject *__pyx_pf_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_r, double __pyx_v_concentration, double __pyx_v_rs, double __pyx_v_rho_c_over_sigma_c, double __pyx_v_delta) {
   double __pyx_v_delta_c;
   double __pyx_v_amp;
   double __pyx_v_x;
@@ -1931,7 +2085,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyOb
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   double __pyx_t_1;
-  struct __pyx_opt_args_9nfwfitter_13nfwmodeltools_deltaC __pyx_t_2;
+  struct __pyx_opt_args_13nfwmodeltools_deltaC __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
@@ -1961,11 +2115,11 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyOb
   __pyx_pybuffernd_r.rcbuffer = &__pyx_pybuffer_r;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_r.rcbuffer->pybuffer, (PyObject*)__pyx_v_r, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 54, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_r.rcbuffer->pybuffer, (PyObject*)__pyx_v_r, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 55, __pyx_L1_error)
   }
   __pyx_pybuffernd_r.diminfo[0].strides = __pyx_pybuffernd_r.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_r.diminfo[0].shape = __pyx_pybuffernd_r.rcbuffer->pybuffer.shape[0];
 
-  /* "nfwfitter/nfwmodeltools.pyx":60
+  /* "nfwmodeltools.pyx":61
  *              double delta = 200.):
  * 
  *     cdef double delta_c = deltaC(concentration, delta = delta)             # <<<<<<<<<<<<<<
@@ -1974,10 +2128,10 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyOb
  */
   __pyx_t_2.__pyx_n = 1;
   __pyx_t_2.delta = __pyx_v_delta;
-  __pyx_t_1 = __pyx_f_9nfwfitter_13nfwmodeltools_deltaC(__pyx_v_concentration, &__pyx_t_2); 
+  __pyx_t_1 = __pyx_f_13nfwmodeltools_deltaC(__pyx_v_concentration, &__pyx_t_2); 
   __pyx_v_delta_c = __pyx_t_1;
 
-  /* "nfwfitter/nfwmodeltools.pyx":61
+  /* "nfwmodeltools.pyx":62
  * 
  *     cdef double delta_c = deltaC(concentration, delta = delta)
  *     cdef double amp = rs*delta_c*rho_c_over_sigma_c             # <<<<<<<<<<<<<<
@@ -1986,7 +2140,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyOb
  */
   __pyx_v_amp = ((__pyx_v_rs * __pyx_v_delta_c) * __pyx_v_rho_c_over_sigma_c);
 
-  /* "nfwfitter/nfwmodeltools.pyx":65
+  /* "nfwmodeltools.pyx":66
  *     cdef double x,a,b,c
  *     cdef Py_ssize_t i, npos
  *     npos = r.shape[0]             # <<<<<<<<<<<<<<
@@ -1995,46 +2149,46 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyOb
  */
   __pyx_v_npos = (__pyx_v_r->dimensions[0]);
 
-  /* "nfwfitter/nfwmodeltools.pyx":66
+  /* "nfwmodeltools.pyx":67
  *     cdef Py_ssize_t i, npos
  *     npos = r.shape[0]
  *     cdef np.ndarray[np.double_t, ndim=1, mode='c'] g = np.zeros(r.shape[0], dtype=np.float64)             # <<<<<<<<<<<<<<
  * 
  *     for i from npos > i >= 0:
  */
-  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 66, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 67, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_zeros); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 66, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_zeros); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 67, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyInt_From_Py_intptr_t((__pyx_v_r->dimensions[0])); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 66, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyInt_From_Py_intptr_t((__pyx_v_r->dimensions[0])); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 67, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 66, __pyx_L1_error)
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 67, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_GIVEREF(__pyx_t_3);
   PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
   __pyx_t_3 = 0;
-  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 66, __pyx_L1_error)
+  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 67, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 66, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 67, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_float64); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 66, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_float64); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 67, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_dtype, __pyx_t_7) < 0) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_dtype, __pyx_t_7) < 0) __PYX_ERR(0, 67, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_5, __pyx_t_3); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 66, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_5, __pyx_t_3); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 67, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (!(likely(((__pyx_t_7) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_7, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (!(likely(((__pyx_t_7) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_7, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 67, __pyx_L1_error)
   __pyx_t_8 = ((PyArrayObject *)__pyx_t_7);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_g.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_g = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_g.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 66, __pyx_L1_error)
+      __PYX_ERR(0, 67, __pyx_L1_error)
     } else {__pyx_pybuffernd_g.diminfo[0].strides = __pyx_pybuffernd_g.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_g.diminfo[0].shape = __pyx_pybuffernd_g.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -2042,7 +2196,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyOb
   __pyx_v_g = ((PyArrayObject *)__pyx_t_7);
   __pyx_t_7 = 0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":68
+  /* "nfwmodeltools.pyx":69
  *     cdef np.ndarray[np.double_t, ndim=1, mode='c'] g = np.zeros(r.shape[0], dtype=np.float64)
  * 
  *     for i from npos > i >= 0:             # <<<<<<<<<<<<<<
@@ -2051,7 +2205,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyOb
  */
   for (__pyx_v_i = __pyx_v_npos-1; __pyx_v_i >= 0; __pyx_v_i--) {
 
-    /* "nfwfitter/nfwmodeltools.pyx":70
+    /* "nfwmodeltools.pyx":71
  *     for i from npos > i >= 0:
  * 
  *         x = r[i]/rs             # <<<<<<<<<<<<<<
@@ -2062,11 +2216,11 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyOb
     __pyx_t_10 = (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_r.rcbuffer->pybuffer.buf, __pyx_t_9, __pyx_pybuffernd_r.diminfo[0].strides));
     if (unlikely(__pyx_v_rs == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 70, __pyx_L1_error)
+      __PYX_ERR(0, 71, __pyx_L1_error)
     }
     __pyx_v_x = (__pyx_t_10 / __pyx_v_rs);
 
-    /* "nfwfitter/nfwmodeltools.pyx":72
+    /* "nfwmodeltools.pyx":73
  *         x = r[i]/rs
  * 
  *         if x < 1:             # <<<<<<<<<<<<<<
@@ -2076,7 +2230,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyOb
     __pyx_t_11 = ((__pyx_v_x < 1.0) != 0);
     if (__pyx_t_11) {
 
-      /* "nfwfitter/nfwmodeltools.pyx":74
+      /* "nfwmodeltools.pyx":75
  *         if x < 1:
  * 
  *             a = atanh(sqrt((1-x)/(1+x)))             # <<<<<<<<<<<<<<
@@ -2087,11 +2241,11 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyOb
       __pyx_t_12 = (1.0 + __pyx_v_x);
       if (unlikely(__pyx_t_12 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 74, __pyx_L1_error)
+        __PYX_ERR(0, 75, __pyx_L1_error)
       }
       __pyx_v_a = atanh(sqrt((__pyx_t_1 / __pyx_t_12)));
 
-      /* "nfwfitter/nfwmodeltools.pyx":75
+      /* "nfwmodeltools.pyx":76
  * 
  *             a = atanh(sqrt((1-x)/(1+x)))
  *             b = sqrt(1-x**2)             # <<<<<<<<<<<<<<
@@ -2100,7 +2254,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyOb
  */
       __pyx_v_b = sqrt((1.0 - pow(__pyx_v_x, 2.0)));
 
-      /* "nfwfitter/nfwmodeltools.pyx":76
+      /* "nfwmodeltools.pyx":77
  *             a = atanh(sqrt((1-x)/(1+x)))
  *             b = sqrt(1-x**2)
  *             c = (x**2) - 1             # <<<<<<<<<<<<<<
@@ -2109,7 +2263,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyOb
  */
       __pyx_v_c = (pow(__pyx_v_x, 2.0) - 1.0);
 
-      /* "nfwfitter/nfwmodeltools.pyx":78
+      /* "nfwmodeltools.pyx":79
  *             c = (x**2) - 1
  * 
  *             g[i] = 8*a/(b*x**2) + 4*log(x/2)/x**2 - 2/c + 4*a/(b*c)             # <<<<<<<<<<<<<<
@@ -2120,28 +2274,28 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyOb
       __pyx_t_1 = (__pyx_v_b * pow(__pyx_v_x, 2.0));
       if (unlikely(__pyx_t_1 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 78, __pyx_L1_error)
+        __PYX_ERR(0, 79, __pyx_L1_error)
       }
       __pyx_t_13 = (4.0 * log((__pyx_v_x / 2.0)));
       __pyx_t_14 = pow(__pyx_v_x, 2.0);
       if (unlikely(__pyx_t_14 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 78, __pyx_L1_error)
+        __PYX_ERR(0, 79, __pyx_L1_error)
       }
       if (unlikely(__pyx_v_c == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 78, __pyx_L1_error)
+        __PYX_ERR(0, 79, __pyx_L1_error)
       }
       __pyx_t_15 = (4.0 * __pyx_v_a);
       __pyx_t_16 = (__pyx_v_b * __pyx_v_c);
       if (unlikely(__pyx_t_16 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 78, __pyx_L1_error)
+        __PYX_ERR(0, 79, __pyx_L1_error)
       }
       __pyx_t_17 = __pyx_v_i;
       *__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_g.rcbuffer->pybuffer.buf, __pyx_t_17, __pyx_pybuffernd_g.diminfo[0].strides) = ((((__pyx_t_12 / __pyx_t_1) + (__pyx_t_13 / __pyx_t_14)) - (2.0 / __pyx_v_c)) + (__pyx_t_15 / __pyx_t_16));
 
-      /* "nfwfitter/nfwmodeltools.pyx":72
+      /* "nfwmodeltools.pyx":73
  *         x = r[i]/rs
  * 
  *         if x < 1:             # <<<<<<<<<<<<<<
@@ -2151,7 +2305,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyOb
       goto __pyx_L5;
     }
 
-    /* "nfwfitter/nfwmodeltools.pyx":80
+    /* "nfwmodeltools.pyx":81
  *             g[i] = 8*a/(b*x**2) + 4*log(x/2)/x**2 - 2/c + 4*a/(b*c)
  * 
  *         elif x > 1:             # <<<<<<<<<<<<<<
@@ -2161,7 +2315,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyOb
     __pyx_t_11 = ((__pyx_v_x > 1.0) != 0);
     if (__pyx_t_11) {
 
-      /* "nfwfitter/nfwmodeltools.pyx":82
+      /* "nfwmodeltools.pyx":83
  *         elif x > 1:
  * 
  *             a = atan(sqrt((x-1)/(1+x)))             # <<<<<<<<<<<<<<
@@ -2172,11 +2326,11 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyOb
       __pyx_t_15 = (1.0 + __pyx_v_x);
       if (unlikely(__pyx_t_15 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 82, __pyx_L1_error)
+        __PYX_ERR(0, 83, __pyx_L1_error)
       }
       __pyx_v_a = atan(sqrt((__pyx_t_16 / __pyx_t_15)));
 
-      /* "nfwfitter/nfwmodeltools.pyx":83
+      /* "nfwmodeltools.pyx":84
  * 
  *             a = atan(sqrt((x-1)/(1+x)))
  *             b = sqrt(x**2-1)             # <<<<<<<<<<<<<<
@@ -2185,7 +2339,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyOb
  */
       __pyx_v_b = sqrt((pow(__pyx_v_x, 2.0) - 1.0));
 
-      /* "nfwfitter/nfwmodeltools.pyx":85
+      /* "nfwmodeltools.pyx":86
  *             b = sqrt(x**2-1)
  * 
  *             g[i] = 8*a/(b*x**2) + 4*log(x/2)/x**2 - 2/b**2 + 4*a/b**3             # <<<<<<<<<<<<<<
@@ -2196,29 +2350,29 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyOb
       __pyx_t_16 = (__pyx_v_b * pow(__pyx_v_x, 2.0));
       if (unlikely(__pyx_t_16 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 85, __pyx_L1_error)
+        __PYX_ERR(0, 86, __pyx_L1_error)
       }
       __pyx_t_14 = (4.0 * log((__pyx_v_x / 2.0)));
       __pyx_t_13 = pow(__pyx_v_x, 2.0);
       if (unlikely(__pyx_t_13 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 85, __pyx_L1_error)
+        __PYX_ERR(0, 86, __pyx_L1_error)
       }
       __pyx_t_1 = pow(__pyx_v_b, 2.0);
       if (unlikely(__pyx_t_1 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 85, __pyx_L1_error)
+        __PYX_ERR(0, 86, __pyx_L1_error)
       }
       __pyx_t_12 = (4.0 * __pyx_v_a);
       __pyx_t_18 = pow(__pyx_v_b, 3.0);
       if (unlikely(__pyx_t_18 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 85, __pyx_L1_error)
+        __PYX_ERR(0, 86, __pyx_L1_error)
       }
       __pyx_t_19 = __pyx_v_i;
       *__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_g.rcbuffer->pybuffer.buf, __pyx_t_19, __pyx_pybuffernd_g.diminfo[0].strides) = ((((__pyx_t_15 / __pyx_t_16) + (__pyx_t_14 / __pyx_t_13)) - (2.0 / __pyx_t_1)) + (__pyx_t_12 / __pyx_t_18));
 
-      /* "nfwfitter/nfwmodeltools.pyx":80
+      /* "nfwmodeltools.pyx":81
  *             g[i] = 8*a/(b*x**2) + 4*log(x/2)/x**2 - 2/c + 4*a/(b*c)
  * 
  *         elif x > 1:             # <<<<<<<<<<<<<<
@@ -2228,7 +2382,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyOb
       goto __pyx_L5;
     }
 
-    /* "nfwfitter/nfwmodeltools.pyx":89
+    /* "nfwmodeltools.pyx":90
  *         else:
  * 
  *             g[i] = 10./3 + 4*log(.5)             # <<<<<<<<<<<<<<
@@ -2242,7 +2396,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyOb
     __pyx_L5:;
   }
 
-  /* "nfwfitter/nfwmodeltools.pyx":91
+  /* "nfwmodeltools.pyx":92
  *             g[i] = 10./3 + 4*log(.5)
  * 
  *     return amp*g             # <<<<<<<<<<<<<<
@@ -2250,16 +2404,16 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyOb
  * ###################
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_7 = PyFloat_FromDouble(__pyx_v_amp); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 91, __pyx_L1_error)
+  __pyx_t_7 = PyFloat_FromDouble(__pyx_v_amp); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 92, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_3 = PyNumber_Multiply(__pyx_t_7, ((PyObject *)__pyx_v_g)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 91, __pyx_L1_error)
+  __pyx_t_3 = PyNumber_Multiply(__pyx_t_7, ((PyObject *)__pyx_v_g)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 92, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
   __pyx_r = __pyx_t_3;
   __pyx_t_3 = 0;
   goto __pyx_L0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":54
+  /* "nfwmodeltools.pyx":55
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def NFWShear(np.ndarray[np.double_t, ndim=1, mode='c'] r,             # <<<<<<<<<<<<<<
@@ -2281,7 +2435,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyOb
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_g.rcbuffer->pybuffer);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_r.rcbuffer->pybuffer);
   __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("nfwfitter.nfwmodeltools.NFWShear", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("nfwmodeltools.NFWShear", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   goto __pyx_L2;
   __pyx_L0:;
@@ -2294,7 +2448,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyOb
   return __pyx_r;
 }
 
-/* "nfwfitter/nfwmodeltools.pyx":97
+/* "nfwmodeltools.pyx":98
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def NFWKappa(np.ndarray[np.double_t, ndim=1, mode='c'] r,             # <<<<<<<<<<<<<<
@@ -2303,9 +2457,9 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_NFWShear(CYTHON_UNUSED PyOb
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_3NFWKappa(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_9nfwfitter_13nfwmodeltools_3NFWKappa = {"NFWKappa", (PyCFunction)__pyx_pw_9nfwfitter_13nfwmodeltools_3NFWKappa, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_3NFWKappa(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_13nfwmodeltools_3NFWKappa(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_13nfwmodeltools_3NFWKappa = {"NFWKappa", (PyCFunction)__pyx_pw_13nfwmodeltools_3NFWKappa, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_13nfwmodeltools_3NFWKappa(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyArrayObject *__pyx_v_r = 0;
   double __pyx_v_concentration;
   double __pyx_v_rs;
@@ -2337,17 +2491,17 @@ static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_3NFWKappa(PyObject *__pyx_s
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_concentration)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("NFWKappa", 0, 4, 5, 1); __PYX_ERR(0, 97, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("NFWKappa", 0, 4, 5, 1); __PYX_ERR(0, 98, __pyx_L3_error)
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_rs)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("NFWKappa", 0, 4, 5, 2); __PYX_ERR(0, 97, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("NFWKappa", 0, 4, 5, 2); __PYX_ERR(0, 98, __pyx_L3_error)
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_rho_c_over_sigma_c)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("NFWKappa", 0, 4, 5, 3); __PYX_ERR(0, 97, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("NFWKappa", 0, 4, 5, 3); __PYX_ERR(0, 98, __pyx_L3_error)
         }
         case  4:
         if (kw_args > 0) {
@@ -2356,7 +2510,7 @@ static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_3NFWKappa(PyObject *__pyx_s
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "NFWKappa") < 0)) __PYX_ERR(0, 97, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "NFWKappa") < 0)) __PYX_ERR(0, 98, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -2370,25 +2524,25 @@ static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_3NFWKappa(PyObject *__pyx_s
       }
     }
     __pyx_v_r = ((PyArrayObject *)values[0]);
-    __pyx_v_concentration = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_concentration == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 98, __pyx_L3_error)
-    __pyx_v_rs = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_rs == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 99, __pyx_L3_error)
-    __pyx_v_rho_c_over_sigma_c = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_rho_c_over_sigma_c == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 100, __pyx_L3_error)
+    __pyx_v_concentration = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_concentration == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 99, __pyx_L3_error)
+    __pyx_v_rs = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_rs == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 100, __pyx_L3_error)
+    __pyx_v_rho_c_over_sigma_c = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_rho_c_over_sigma_c == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 101, __pyx_L3_error)
     if (values[4]) {
-      __pyx_v_delta = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_delta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 101, __pyx_L3_error)
+      __pyx_v_delta = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_delta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 102, __pyx_L3_error)
     } else {
       __pyx_v_delta = ((double)200.);
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("NFWKappa", 0, 4, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 97, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("NFWKappa", 0, 4, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 98, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("nfwfitter.nfwmodeltools.NFWKappa", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("nfwmodeltools.NFWKappa", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_r), __pyx_ptype_5numpy_ndarray, 1, "r", 0))) __PYX_ERR(0, 97, __pyx_L1_error)
-  __pyx_r = __pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(__pyx_self, __pyx_v_r, __pyx_v_concentration, __pyx_v_rs, __pyx_v_rho_c_over_sigma_c, __pyx_v_delta);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_r), __pyx_ptype_5numpy_ndarray, 1, "r", 0))) __PYX_ERR(0, 98, __pyx_L1_error)
+  __pyx_r = __pyx_pf_13nfwmodeltools_2NFWKappa(__pyx_self, __pyx_v_r, __pyx_v_concentration, __pyx_v_rs, __pyx_v_rho_c_over_sigma_c, __pyx_v_delta);
 
   /* function exit code */
   goto __pyx_L0;
@@ -2399,7 +2553,7 @@ static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_3NFWKappa(PyObject *__pyx_s
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_r, double __pyx_v_concentration, double __pyx_v_rs, double __pyx_v_rho_c_over_sigma_c, double __pyx_v_delta) {
+static PyObject *__pyx_pf_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_r, double __pyx_v_concentration, double __pyx_v_rs, double __pyx_v_rho_c_over_sigma_c, double __pyx_v_delta) {
   double __pyx_v_delta_c;
   double __pyx_v_amp;
   Py_ssize_t __pyx_v_i;
@@ -2416,7 +2570,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyO
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   double __pyx_t_1;
-  struct __pyx_opt_args_9nfwfitter_13nfwmodeltools_deltaC __pyx_t_2;
+  struct __pyx_opt_args_13nfwmodeltools_deltaC __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
@@ -2441,11 +2595,11 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyO
   __pyx_pybuffernd_r.rcbuffer = &__pyx_pybuffer_r;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_r.rcbuffer->pybuffer, (PyObject*)__pyx_v_r, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 97, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_r.rcbuffer->pybuffer, (PyObject*)__pyx_v_r, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 98, __pyx_L1_error)
   }
   __pyx_pybuffernd_r.diminfo[0].strides = __pyx_pybuffernd_r.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_r.diminfo[0].shape = __pyx_pybuffernd_r.rcbuffer->pybuffer.shape[0];
 
-  /* "nfwfitter/nfwmodeltools.pyx":104
+  /* "nfwmodeltools.pyx":105
  * 
  * 
  *     cdef double delta_c = deltaC(concentration, delta = delta)             # <<<<<<<<<<<<<<
@@ -2454,10 +2608,10 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyO
  */
   __pyx_t_2.__pyx_n = 1;
   __pyx_t_2.delta = __pyx_v_delta;
-  __pyx_t_1 = __pyx_f_9nfwfitter_13nfwmodeltools_deltaC(__pyx_v_concentration, &__pyx_t_2); 
+  __pyx_t_1 = __pyx_f_13nfwmodeltools_deltaC(__pyx_v_concentration, &__pyx_t_2); 
   __pyx_v_delta_c = __pyx_t_1;
 
-  /* "nfwfitter/nfwmodeltools.pyx":105
+  /* "nfwmodeltools.pyx":106
  * 
  *     cdef double delta_c = deltaC(concentration, delta = delta)
  *     cdef double amp = 2*rs*delta_c*rho_c_over_sigma_c             # <<<<<<<<<<<<<<
@@ -2466,7 +2620,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyO
  */
   __pyx_v_amp = (((2.0 * __pyx_v_rs) * __pyx_v_delta_c) * __pyx_v_rho_c_over_sigma_c);
 
-  /* "nfwfitter/nfwmodeltools.pyx":108
+  /* "nfwmodeltools.pyx":109
  * 
  *     cdef Py_ssize_t i, npos
  *     npos = r.shape[0]             # <<<<<<<<<<<<<<
@@ -2475,46 +2629,46 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyO
  */
   __pyx_v_npos = (__pyx_v_r->dimensions[0]);
 
-  /* "nfwfitter/nfwmodeltools.pyx":109
+  /* "nfwmodeltools.pyx":110
  *     cdef Py_ssize_t i, npos
  *     npos = r.shape[0]
  *     cdef np.ndarray[np.double_t, ndim=1, mode='c'] kappa = np.zeros(npos, dtype=np.float64)             # <<<<<<<<<<<<<<
  * 
  *     cdef double x, a,b,c
  */
-  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 109, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 110, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_zeros); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 109, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_zeros); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 110, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_npos); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 109, __pyx_L1_error)
+  __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_npos); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 110, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 109, __pyx_L1_error)
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 110, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_GIVEREF(__pyx_t_3);
   PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
   __pyx_t_3 = 0;
-  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 109, __pyx_L1_error)
+  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 110, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 109, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 110, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_float64); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 109, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_float64); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 110, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_dtype, __pyx_t_7) < 0) __PYX_ERR(0, 109, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_dtype, __pyx_t_7) < 0) __PYX_ERR(0, 110, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_5, __pyx_t_3); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 109, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_5, __pyx_t_3); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 110, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (!(likely(((__pyx_t_7) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_7, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 109, __pyx_L1_error)
+  if (!(likely(((__pyx_t_7) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_7, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 110, __pyx_L1_error)
   __pyx_t_8 = ((PyArrayObject *)__pyx_t_7);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_kappa.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_kappa = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_kappa.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 109, __pyx_L1_error)
+      __PYX_ERR(0, 110, __pyx_L1_error)
     } else {__pyx_pybuffernd_kappa.diminfo[0].strides = __pyx_pybuffernd_kappa.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_kappa.diminfo[0].shape = __pyx_pybuffernd_kappa.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -2522,7 +2676,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyO
   __pyx_v_kappa = ((PyArrayObject *)__pyx_t_7);
   __pyx_t_7 = 0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":113
+  /* "nfwmodeltools.pyx":114
  *     cdef double x, a,b,c
  * 
  *     for i from npos > i >= 0:             # <<<<<<<<<<<<<<
@@ -2531,7 +2685,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyO
  */
   for (__pyx_v_i = __pyx_v_npos-1; __pyx_v_i >= 0; __pyx_v_i--) {
 
-    /* "nfwfitter/nfwmodeltools.pyx":115
+    /* "nfwmodeltools.pyx":116
  *     for i from npos > i >= 0:
  * 
  *         x = r[i]/rs             # <<<<<<<<<<<<<<
@@ -2542,11 +2696,11 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyO
     __pyx_t_10 = (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_r.rcbuffer->pybuffer.buf, __pyx_t_9, __pyx_pybuffernd_r.diminfo[0].strides));
     if (unlikely(__pyx_v_rs == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 115, __pyx_L1_error)
+      __PYX_ERR(0, 116, __pyx_L1_error)
     }
     __pyx_v_x = (__pyx_t_10 / __pyx_v_rs);
 
-    /* "nfwfitter/nfwmodeltools.pyx":117
+    /* "nfwmodeltools.pyx":118
  *         x = r[i]/rs
  * 
  *         if x < 1:             # <<<<<<<<<<<<<<
@@ -2556,7 +2710,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyO
     __pyx_t_11 = ((__pyx_v_x < 1.0) != 0);
     if (__pyx_t_11) {
 
-      /* "nfwfitter/nfwmodeltools.pyx":119
+      /* "nfwmodeltools.pyx":120
  *         if x < 1:
  * 
  *             a = atanh(sqrt((1-x)/(1+x)))             # <<<<<<<<<<<<<<
@@ -2567,11 +2721,11 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyO
       __pyx_t_12 = (1.0 + __pyx_v_x);
       if (unlikely(__pyx_t_12 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 119, __pyx_L1_error)
+        __PYX_ERR(0, 120, __pyx_L1_error)
       }
       __pyx_v_a = atanh(sqrt((__pyx_t_1 / __pyx_t_12)));
 
-      /* "nfwfitter/nfwmodeltools.pyx":120
+      /* "nfwmodeltools.pyx":121
  * 
  *             a = atanh(sqrt((1-x)/(1+x)))
  *             b = sqrt(1-x**2)             # <<<<<<<<<<<<<<
@@ -2580,7 +2734,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyO
  */
       __pyx_v_b = sqrt((1.0 - pow(__pyx_v_x, 2.0)));
 
-      /* "nfwfitter/nfwmodeltools.pyx":121
+      /* "nfwmodeltools.pyx":122
  *             a = atanh(sqrt((1-x)/(1+x)))
  *             b = sqrt(1-x**2)
  *             c = 1./(x**2 - 1)             # <<<<<<<<<<<<<<
@@ -2590,11 +2744,11 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyO
       __pyx_t_12 = (pow(__pyx_v_x, 2.0) - 1.0);
       if (unlikely(__pyx_t_12 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 121, __pyx_L1_error)
+        __PYX_ERR(0, 122, __pyx_L1_error)
       }
       __pyx_v_c = (1. / __pyx_t_12);
 
-      /* "nfwfitter/nfwmodeltools.pyx":122
+      /* "nfwmodeltools.pyx":123
  *             b = sqrt(1-x**2)
  *             c = 1./(x**2 - 1)
  *             kappa[i] = c*(1 - 2.*a/b)             # <<<<<<<<<<<<<<
@@ -2604,12 +2758,12 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyO
       __pyx_t_12 = (2. * __pyx_v_a);
       if (unlikely(__pyx_v_b == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 122, __pyx_L1_error)
+        __PYX_ERR(0, 123, __pyx_L1_error)
       }
       __pyx_t_13 = __pyx_v_i;
       *__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_kappa.rcbuffer->pybuffer.buf, __pyx_t_13, __pyx_pybuffernd_kappa.diminfo[0].strides) = (__pyx_v_c * (1.0 - (__pyx_t_12 / __pyx_v_b)));
 
-      /* "nfwfitter/nfwmodeltools.pyx":117
+      /* "nfwmodeltools.pyx":118
  *         x = r[i]/rs
  * 
  *         if x < 1:             # <<<<<<<<<<<<<<
@@ -2619,7 +2773,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyO
       goto __pyx_L5;
     }
 
-    /* "nfwfitter/nfwmodeltools.pyx":124
+    /* "nfwmodeltools.pyx":125
  *             kappa[i] = c*(1 - 2.*a/b)
  * 
  *         elif x > 1:             # <<<<<<<<<<<<<<
@@ -2629,7 +2783,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyO
     __pyx_t_11 = ((__pyx_v_x > 1.0) != 0);
     if (__pyx_t_11) {
 
-      /* "nfwfitter/nfwmodeltools.pyx":125
+      /* "nfwmodeltools.pyx":126
  * 
  *         elif x > 1:
  *             a = atan(sqrt((x-1)/(1+x)))             # <<<<<<<<<<<<<<
@@ -2640,11 +2794,11 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyO
       __pyx_t_1 = (1.0 + __pyx_v_x);
       if (unlikely(__pyx_t_1 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 125, __pyx_L1_error)
+        __PYX_ERR(0, 126, __pyx_L1_error)
       }
       __pyx_v_a = atan(sqrt((__pyx_t_12 / __pyx_t_1)));
 
-      /* "nfwfitter/nfwmodeltools.pyx":126
+      /* "nfwmodeltools.pyx":127
  *         elif x > 1:
  *             a = atan(sqrt((x-1)/(1+x)))
  *             b = sqrt(x**2-1)             # <<<<<<<<<<<<<<
@@ -2653,7 +2807,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyO
  */
       __pyx_v_b = sqrt((pow(__pyx_v_x, 2.0) - 1.0));
 
-      /* "nfwfitter/nfwmodeltools.pyx":127
+      /* "nfwmodeltools.pyx":128
  *             a = atan(sqrt((x-1)/(1+x)))
  *             b = sqrt(x**2-1)
  *             c = 1./(x**2 - 1)             # <<<<<<<<<<<<<<
@@ -2663,11 +2817,11 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyO
       __pyx_t_1 = (pow(__pyx_v_x, 2.0) - 1.0);
       if (unlikely(__pyx_t_1 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 127, __pyx_L1_error)
+        __PYX_ERR(0, 128, __pyx_L1_error)
       }
       __pyx_v_c = (1. / __pyx_t_1);
 
-      /* "nfwfitter/nfwmodeltools.pyx":128
+      /* "nfwmodeltools.pyx":129
  *             b = sqrt(x**2-1)
  *             c = 1./(x**2 - 1)
  *             kappa[i] = c*(1 - 2.*a/b)             # <<<<<<<<<<<<<<
@@ -2677,12 +2831,12 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyO
       __pyx_t_1 = (2. * __pyx_v_a);
       if (unlikely(__pyx_v_b == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 128, __pyx_L1_error)
+        __PYX_ERR(0, 129, __pyx_L1_error)
       }
       __pyx_t_14 = __pyx_v_i;
       *__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_kappa.rcbuffer->pybuffer.buf, __pyx_t_14, __pyx_pybuffernd_kappa.diminfo[0].strides) = (__pyx_v_c * (1.0 - (__pyx_t_1 / __pyx_v_b)));
 
-      /* "nfwfitter/nfwmodeltools.pyx":124
+      /* "nfwmodeltools.pyx":125
  *             kappa[i] = c*(1 - 2.*a/b)
  * 
  *         elif x > 1:             # <<<<<<<<<<<<<<
@@ -2692,7 +2846,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyO
       goto __pyx_L5;
     }
 
-    /* "nfwfitter/nfwmodeltools.pyx":131
+    /* "nfwmodeltools.pyx":132
  * 
  *         else:
  *             kappa[i] = 1./3.             # <<<<<<<<<<<<<<
@@ -2706,7 +2860,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyO
     __pyx_L5:;
   }
 
-  /* "nfwfitter/nfwmodeltools.pyx":133
+  /* "nfwmodeltools.pyx":134
  *             kappa[i] = 1./3.
  * 
  *     return kappa*amp             # <<<<<<<<<<<<<<
@@ -2714,16 +2868,16 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyO
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_7 = PyFloat_FromDouble(__pyx_v_amp); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 133, __pyx_L1_error)
+  __pyx_t_7 = PyFloat_FromDouble(__pyx_v_amp); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 134, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_3 = PyNumber_Multiply(((PyObject *)__pyx_v_kappa), __pyx_t_7); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 133, __pyx_L1_error)
+  __pyx_t_3 = PyNumber_Multiply(((PyObject *)__pyx_v_kappa), __pyx_t_7); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 134, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
   __pyx_r = __pyx_t_3;
   __pyx_t_3 = 0;
   goto __pyx_L0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":97
+  /* "nfwmodeltools.pyx":98
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def NFWKappa(np.ndarray[np.double_t, ndim=1, mode='c'] r,             # <<<<<<<<<<<<<<
@@ -2745,7 +2899,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyO
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_kappa.rcbuffer->pybuffer);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_r.rcbuffer->pybuffer);
   __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("nfwfitter.nfwmodeltools.NFWKappa", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("nfwmodeltools.NFWKappa", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   goto __pyx_L2;
   __pyx_L0:;
@@ -2758,7 +2912,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyO
   return __pyx_r;
 }
 
-/* "nfwfitter/nfwmodeltools.pyx":140
+/* "nfwmodeltools.pyx":141
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def aveEnclosedKappa(np.ndarray[np.double_t, ndim=1, mode='c'] r,             # <<<<<<<<<<<<<<
@@ -2767,9 +2921,9 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_2NFWKappa(CYTHON_UNUSED PyO
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_5aveEnclosedKappa(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_9nfwfitter_13nfwmodeltools_5aveEnclosedKappa = {"aveEnclosedKappa", (PyCFunction)__pyx_pw_9nfwfitter_13nfwmodeltools_5aveEnclosedKappa, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_5aveEnclosedKappa(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_13nfwmodeltools_5aveEnclosedKappa(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_13nfwmodeltools_5aveEnclosedKappa = {"aveEnclosedKappa", (PyCFunction)__pyx_pw_13nfwmodeltools_5aveEnclosedKappa, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_13nfwmodeltools_5aveEnclosedKappa(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyArrayObject *__pyx_v_r = 0;
   double __pyx_v_concentration;
   double __pyx_v_rs;
@@ -2801,17 +2955,17 @@ static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_5aveEnclosedKappa(PyObject
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_concentration)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("aveEnclosedKappa", 0, 4, 5, 1); __PYX_ERR(0, 140, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("aveEnclosedKappa", 0, 4, 5, 1); __PYX_ERR(0, 141, __pyx_L3_error)
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_rs)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("aveEnclosedKappa", 0, 4, 5, 2); __PYX_ERR(0, 140, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("aveEnclosedKappa", 0, 4, 5, 2); __PYX_ERR(0, 141, __pyx_L3_error)
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_rho_c_over_sigma_c)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("aveEnclosedKappa", 0, 4, 5, 3); __PYX_ERR(0, 140, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("aveEnclosedKappa", 0, 4, 5, 3); __PYX_ERR(0, 141, __pyx_L3_error)
         }
         case  4:
         if (kw_args > 0) {
@@ -2820,7 +2974,7 @@ static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_5aveEnclosedKappa(PyObject
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "aveEnclosedKappa") < 0)) __PYX_ERR(0, 140, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "aveEnclosedKappa") < 0)) __PYX_ERR(0, 141, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -2834,25 +2988,25 @@ static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_5aveEnclosedKappa(PyObject
       }
     }
     __pyx_v_r = ((PyArrayObject *)values[0]);
-    __pyx_v_concentration = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_concentration == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 141, __pyx_L3_error)
-    __pyx_v_rs = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_rs == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 142, __pyx_L3_error)
-    __pyx_v_rho_c_over_sigma_c = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_rho_c_over_sigma_c == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 143, __pyx_L3_error)
+    __pyx_v_concentration = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_concentration == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 142, __pyx_L3_error)
+    __pyx_v_rs = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_rs == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 143, __pyx_L3_error)
+    __pyx_v_rho_c_over_sigma_c = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_rho_c_over_sigma_c == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 144, __pyx_L3_error)
     if (values[4]) {
-      __pyx_v_delta = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_delta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 144, __pyx_L3_error)
+      __pyx_v_delta = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_delta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 145, __pyx_L3_error)
     } else {
       __pyx_v_delta = ((double)200.);
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("aveEnclosedKappa", 0, 4, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 140, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("aveEnclosedKappa", 0, 4, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 141, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("nfwfitter.nfwmodeltools.aveEnclosedKappa", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("nfwmodeltools.aveEnclosedKappa", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_r), __pyx_ptype_5numpy_ndarray, 1, "r", 0))) __PYX_ERR(0, 140, __pyx_L1_error)
-  __pyx_r = __pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(__pyx_self, __pyx_v_r, __pyx_v_concentration, __pyx_v_rs, __pyx_v_rho_c_over_sigma_c, __pyx_v_delta);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_r), __pyx_ptype_5numpy_ndarray, 1, "r", 0))) __PYX_ERR(0, 141, __pyx_L1_error)
+  __pyx_r = __pyx_pf_13nfwmodeltools_4aveEnclosedKappa(__pyx_self, __pyx_v_r, __pyx_v_concentration, __pyx_v_rs, __pyx_v_rho_c_over_sigma_c, __pyx_v_delta);
 
   /* function exit code */
   goto __pyx_L0;
@@ -2863,7 +3017,7 @@ static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_5aveEnclosedKappa(PyObject
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_r, double __pyx_v_concentration, double __pyx_v_rs, double __pyx_v_rho_c_over_sigma_c, double __pyx_v_delta) {
+static PyObject *__pyx_pf_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_r, double __pyx_v_concentration, double __pyx_v_rs, double __pyx_v_rho_c_over_sigma_c, double __pyx_v_delta) {
   double __pyx_v_delta_c;
   double __pyx_v_amp;
   Py_ssize_t __pyx_v_i;
@@ -2880,7 +3034,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UN
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   double __pyx_t_1;
-  struct __pyx_opt_args_9nfwfitter_13nfwmodeltools_deltaC __pyx_t_2;
+  struct __pyx_opt_args_13nfwmodeltools_deltaC __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
@@ -2905,11 +3059,11 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UN
   __pyx_pybuffernd_r.rcbuffer = &__pyx_pybuffer_r;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_r.rcbuffer->pybuffer, (PyObject*)__pyx_v_r, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 140, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_r.rcbuffer->pybuffer, (PyObject*)__pyx_v_r, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 141, __pyx_L1_error)
   }
   __pyx_pybuffernd_r.diminfo[0].strides = __pyx_pybuffernd_r.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_r.diminfo[0].shape = __pyx_pybuffernd_r.rcbuffer->pybuffer.shape[0];
 
-  /* "nfwfitter/nfwmodeltools.pyx":146
+  /* "nfwmodeltools.pyx":147
  *                      double delta = 200.):
  * 
  *     cdef double delta_c = deltaC(concentration, delta = delta)             # <<<<<<<<<<<<<<
@@ -2918,10 +3072,10 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UN
  */
   __pyx_t_2.__pyx_n = 1;
   __pyx_t_2.delta = __pyx_v_delta;
-  __pyx_t_1 = __pyx_f_9nfwfitter_13nfwmodeltools_deltaC(__pyx_v_concentration, &__pyx_t_2); 
+  __pyx_t_1 = __pyx_f_13nfwmodeltools_deltaC(__pyx_v_concentration, &__pyx_t_2); 
   __pyx_v_delta_c = __pyx_t_1;
 
-  /* "nfwfitter/nfwmodeltools.pyx":147
+  /* "nfwmodeltools.pyx":148
  * 
  *     cdef double delta_c = deltaC(concentration, delta = delta)
  *     cdef double amp = 4*rs*delta_c*rho_c_over_sigma_c             # <<<<<<<<<<<<<<
@@ -2930,7 +3084,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UN
  */
   __pyx_v_amp = (((4.0 * __pyx_v_rs) * __pyx_v_delta_c) * __pyx_v_rho_c_over_sigma_c);
 
-  /* "nfwfitter/nfwmodeltools.pyx":150
+  /* "nfwmodeltools.pyx":151
  * 
  *     cdef Py_ssize_t i, npos
  *     npos = r.shape[0]             # <<<<<<<<<<<<<<
@@ -2939,46 +3093,46 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UN
  */
   __pyx_v_npos = (__pyx_v_r->dimensions[0]);
 
-  /* "nfwfitter/nfwmodeltools.pyx":151
+  /* "nfwmodeltools.pyx":152
  *     cdef Py_ssize_t i, npos
  *     npos = r.shape[0]
  *     cdef np.ndarray[np.double_t, ndim=1, mode='c'] avekappa = np.zeros(npos, dtype=np.float64)             # <<<<<<<<<<<<<<
  * 
  *     cdef double x, a,b,c
  */
-  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 151, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 152, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_zeros); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 151, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_zeros); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 152, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_npos); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 151, __pyx_L1_error)
+  __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_npos); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 152, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 151, __pyx_L1_error)
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 152, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_GIVEREF(__pyx_t_3);
   PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
   __pyx_t_3 = 0;
-  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 151, __pyx_L1_error)
+  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 152, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 151, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 152, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_float64); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 151, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_float64); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 152, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_dtype, __pyx_t_7) < 0) __PYX_ERR(0, 151, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_dtype, __pyx_t_7) < 0) __PYX_ERR(0, 152, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_5, __pyx_t_3); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 151, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_5, __pyx_t_3); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 152, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (!(likely(((__pyx_t_7) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_7, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 151, __pyx_L1_error)
+  if (!(likely(((__pyx_t_7) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_7, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 152, __pyx_L1_error)
   __pyx_t_8 = ((PyArrayObject *)__pyx_t_7);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_avekappa.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_avekappa = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_avekappa.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 151, __pyx_L1_error)
+      __PYX_ERR(0, 152, __pyx_L1_error)
     } else {__pyx_pybuffernd_avekappa.diminfo[0].strides = __pyx_pybuffernd_avekappa.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_avekappa.diminfo[0].shape = __pyx_pybuffernd_avekappa.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -2986,7 +3140,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UN
   __pyx_v_avekappa = ((PyArrayObject *)__pyx_t_7);
   __pyx_t_7 = 0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":155
+  /* "nfwmodeltools.pyx":156
  *     cdef double x, a,b,c
  * 
  *     for i from npos > i >= 0:             # <<<<<<<<<<<<<<
@@ -2995,7 +3149,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UN
  */
   for (__pyx_v_i = __pyx_v_npos-1; __pyx_v_i >= 0; __pyx_v_i--) {
 
-    /* "nfwfitter/nfwmodeltools.pyx":157
+    /* "nfwmodeltools.pyx":158
  *     for i from npos > i >= 0:
  * 
  *         x = r[i]/rs             # <<<<<<<<<<<<<<
@@ -3006,11 +3160,11 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UN
     __pyx_t_10 = (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_r.rcbuffer->pybuffer.buf, __pyx_t_9, __pyx_pybuffernd_r.diminfo[0].strides));
     if (unlikely(__pyx_v_rs == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 157, __pyx_L1_error)
+      __PYX_ERR(0, 158, __pyx_L1_error)
     }
     __pyx_v_x = (__pyx_t_10 / __pyx_v_rs);
 
-    /* "nfwfitter/nfwmodeltools.pyx":159
+    /* "nfwmodeltools.pyx":160
  *         x = r[i]/rs
  * 
  *         if x < 1:             # <<<<<<<<<<<<<<
@@ -3020,7 +3174,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UN
     __pyx_t_11 = ((__pyx_v_x < 1.0) != 0);
     if (__pyx_t_11) {
 
-      /* "nfwfitter/nfwmodeltools.pyx":161
+      /* "nfwmodeltools.pyx":162
  *         if x < 1:
  * 
  *             a = atanh(sqrt((1-x)/(1+x)))             # <<<<<<<<<<<<<<
@@ -3031,11 +3185,11 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UN
       __pyx_t_12 = (1.0 + __pyx_v_x);
       if (unlikely(__pyx_t_12 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 161, __pyx_L1_error)
+        __PYX_ERR(0, 162, __pyx_L1_error)
       }
       __pyx_v_a = atanh(sqrt((__pyx_t_1 / __pyx_t_12)));
 
-      /* "nfwfitter/nfwmodeltools.pyx":162
+      /* "nfwmodeltools.pyx":163
  * 
  *             a = atanh(sqrt((1-x)/(1+x)))
  *             b = sqrt(1-x**2)             # <<<<<<<<<<<<<<
@@ -3044,7 +3198,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UN
  */
       __pyx_v_b = sqrt((1.0 - pow(__pyx_v_x, 2.0)));
 
-      /* "nfwfitter/nfwmodeltools.pyx":163
+      /* "nfwmodeltools.pyx":164
  *             a = atanh(sqrt((1-x)/(1+x)))
  *             b = sqrt(1-x**2)
  *             c = log(x/2.)             # <<<<<<<<<<<<<<
@@ -3053,7 +3207,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UN
  */
       __pyx_v_c = log((__pyx_v_x / 2.));
 
-      /* "nfwfitter/nfwmodeltools.pyx":164
+      /* "nfwmodeltools.pyx":165
  *             b = sqrt(1-x**2)
  *             c = log(x/2.)
  *             avekappa[i] = (2*a/b + c)/(x**2)             # <<<<<<<<<<<<<<
@@ -3063,18 +3217,18 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UN
       __pyx_t_12 = (2.0 * __pyx_v_a);
       if (unlikely(__pyx_v_b == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 164, __pyx_L1_error)
+        __PYX_ERR(0, 165, __pyx_L1_error)
       }
       __pyx_t_1 = ((__pyx_t_12 / __pyx_v_b) + __pyx_v_c);
       __pyx_t_12 = pow(__pyx_v_x, 2.0);
       if (unlikely(__pyx_t_12 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 164, __pyx_L1_error)
+        __PYX_ERR(0, 165, __pyx_L1_error)
       }
       __pyx_t_13 = __pyx_v_i;
       *__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_avekappa.rcbuffer->pybuffer.buf, __pyx_t_13, __pyx_pybuffernd_avekappa.diminfo[0].strides) = (__pyx_t_1 / __pyx_t_12);
 
-      /* "nfwfitter/nfwmodeltools.pyx":159
+      /* "nfwmodeltools.pyx":160
  *         x = r[i]/rs
  * 
  *         if x < 1:             # <<<<<<<<<<<<<<
@@ -3084,7 +3238,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UN
       goto __pyx_L5;
     }
 
-    /* "nfwfitter/nfwmodeltools.pyx":166
+    /* "nfwmodeltools.pyx":167
  *             avekappa[i] = (2*a/b + c)/(x**2)
  * 
  *         elif x > 1:             # <<<<<<<<<<<<<<
@@ -3094,7 +3248,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UN
     __pyx_t_11 = ((__pyx_v_x > 1.0) != 0);
     if (__pyx_t_11) {
 
-      /* "nfwfitter/nfwmodeltools.pyx":167
+      /* "nfwmodeltools.pyx":168
  * 
  *         elif x > 1:
  *             a = atan(sqrt((x-1)/(1+x)))             # <<<<<<<<<<<<<<
@@ -3105,11 +3259,11 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UN
       __pyx_t_1 = (1.0 + __pyx_v_x);
       if (unlikely(__pyx_t_1 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 167, __pyx_L1_error)
+        __PYX_ERR(0, 168, __pyx_L1_error)
       }
       __pyx_v_a = atan(sqrt((__pyx_t_12 / __pyx_t_1)));
 
-      /* "nfwfitter/nfwmodeltools.pyx":168
+      /* "nfwmodeltools.pyx":169
  *         elif x > 1:
  *             a = atan(sqrt((x-1)/(1+x)))
  *             b = sqrt(x**2-1)             # <<<<<<<<<<<<<<
@@ -3118,7 +3272,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UN
  */
       __pyx_v_b = sqrt((pow(__pyx_v_x, 2.0) - 1.0));
 
-      /* "nfwfitter/nfwmodeltools.pyx":169
+      /* "nfwmodeltools.pyx":170
  *             a = atan(sqrt((x-1)/(1+x)))
  *             b = sqrt(x**2-1)
  *             c = log(x/2.)             # <<<<<<<<<<<<<<
@@ -3127,7 +3281,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UN
  */
       __pyx_v_c = log((__pyx_v_x / 2.));
 
-      /* "nfwfitter/nfwmodeltools.pyx":170
+      /* "nfwmodeltools.pyx":171
  *             b = sqrt(x**2-1)
  *             c = log(x/2.)
  *             avekappa[i] = (2*a/b + c)/(x**2)             # <<<<<<<<<<<<<<
@@ -3137,18 +3291,18 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UN
       __pyx_t_1 = (2.0 * __pyx_v_a);
       if (unlikely(__pyx_v_b == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 170, __pyx_L1_error)
+        __PYX_ERR(0, 171, __pyx_L1_error)
       }
       __pyx_t_12 = ((__pyx_t_1 / __pyx_v_b) + __pyx_v_c);
       __pyx_t_1 = pow(__pyx_v_x, 2.0);
       if (unlikely(__pyx_t_1 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 170, __pyx_L1_error)
+        __PYX_ERR(0, 171, __pyx_L1_error)
       }
       __pyx_t_14 = __pyx_v_i;
       *__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_avekappa.rcbuffer->pybuffer.buf, __pyx_t_14, __pyx_pybuffernd_avekappa.diminfo[0].strides) = (__pyx_t_12 / __pyx_t_1);
 
-      /* "nfwfitter/nfwmodeltools.pyx":166
+      /* "nfwmodeltools.pyx":167
  *             avekappa[i] = (2*a/b + c)/(x**2)
  * 
  *         elif x > 1:             # <<<<<<<<<<<<<<
@@ -3158,7 +3312,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UN
       goto __pyx_L5;
     }
 
-    /* "nfwfitter/nfwmodeltools.pyx":173
+    /* "nfwmodeltools.pyx":174
  * 
  *         else:
  *             avekappa[i] = 1 + log(0.5)             # <<<<<<<<<<<<<<
@@ -3172,7 +3326,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UN
     __pyx_L5:;
   }
 
-  /* "nfwfitter/nfwmodeltools.pyx":175
+  /* "nfwmodeltools.pyx":176
  *             avekappa[i] = 1 + log(0.5)
  * 
  *     return avekappa*amp             # <<<<<<<<<<<<<<
@@ -3180,16 +3334,16 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UN
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_7 = PyFloat_FromDouble(__pyx_v_amp); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 175, __pyx_L1_error)
+  __pyx_t_7 = PyFloat_FromDouble(__pyx_v_amp); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 176, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_3 = PyNumber_Multiply(((PyObject *)__pyx_v_avekappa), __pyx_t_7); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 175, __pyx_L1_error)
+  __pyx_t_3 = PyNumber_Multiply(((PyObject *)__pyx_v_avekappa), __pyx_t_7); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 176, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
   __pyx_r = __pyx_t_3;
   __pyx_t_3 = 0;
   goto __pyx_L0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":140
+  /* "nfwmodeltools.pyx":141
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def aveEnclosedKappa(np.ndarray[np.double_t, ndim=1, mode='c'] r,             # <<<<<<<<<<<<<<
@@ -3211,7 +3365,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UN
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_avekappa.rcbuffer->pybuffer);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_r.rcbuffer->pybuffer);
   __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("nfwfitter.nfwmodeltools.aveEnclosedKappa", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("nfwmodeltools.aveEnclosedKappa", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   goto __pyx_L2;
   __pyx_L0:;
@@ -3224,7 +3378,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UN
   return __pyx_r;
 }
 
-/* "nfwfitter/nfwmodeltools.pyx":186
+/* "nfwmodeltools.pyx":187
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def rdelta2rs(double rdelta,             # <<<<<<<<<<<<<<
@@ -3233,9 +3387,9 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_4aveEnclosedKappa(CYTHON_UN
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_7rdelta2rs(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_9nfwfitter_13nfwmodeltools_7rdelta2rs = {"rdelta2rs", (PyCFunction)__pyx_pw_9nfwfitter_13nfwmodeltools_7rdelta2rs, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_7rdelta2rs(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_13nfwmodeltools_7rdelta2rs(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_13nfwmodeltools_7rdelta2rs = {"rdelta2rs", (PyCFunction)__pyx_pw_13nfwmodeltools_7rdelta2rs, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_13nfwmodeltools_7rdelta2rs(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   double __pyx_v_rdelta;
   double __pyx_v_c200;
   double __pyx_v_delta;
@@ -3263,16 +3417,16 @@ static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_7rdelta2rs(PyObject *__pyx_
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_c200)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("rdelta2rs", 1, 3, 3, 1); __PYX_ERR(0, 186, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("rdelta2rs", 1, 3, 3, 1); __PYX_ERR(0, 187, __pyx_L3_error)
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_delta)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("rdelta2rs", 1, 3, 3, 2); __PYX_ERR(0, 186, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("rdelta2rs", 1, 3, 3, 2); __PYX_ERR(0, 187, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "rdelta2rs") < 0)) __PYX_ERR(0, 186, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "rdelta2rs") < 0)) __PYX_ERR(0, 187, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
@@ -3281,26 +3435,26 @@ static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_7rdelta2rs(PyObject *__pyx_
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
       values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
     }
-    __pyx_v_rdelta = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_rdelta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 186, __pyx_L3_error)
-    __pyx_v_c200 = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_c200 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 187, __pyx_L3_error)
-    __pyx_v_delta = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_delta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 188, __pyx_L3_error)
+    __pyx_v_rdelta = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_rdelta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 187, __pyx_L3_error)
+    __pyx_v_c200 = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_c200 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 188, __pyx_L3_error)
+    __pyx_v_delta = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_delta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 189, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("rdelta2rs", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 186, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("rdelta2rs", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 187, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("nfwfitter.nfwmodeltools.rdelta2rs", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("nfwmodeltools.rdelta2rs", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9nfwfitter_13nfwmodeltools_6rdelta2rs(__pyx_self, __pyx_v_rdelta, __pyx_v_c200, __pyx_v_delta);
+  __pyx_r = __pyx_pf_13nfwmodeltools_6rdelta2rs(__pyx_self, __pyx_v_rdelta, __pyx_v_c200, __pyx_v_delta);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "nfwfitter/nfwmodeltools.pyx":193
+/* "nfwmodeltools.pyx":194
  * 
  *     # x = r_delta / rs
  *     def f(x):             # <<<<<<<<<<<<<<
@@ -3309,22 +3463,22 @@ static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_7rdelta2rs(PyObject *__pyx_
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_9rdelta2rs_1f(PyObject *__pyx_self, PyObject *__pyx_v_x); /*proto*/
-static PyMethodDef __pyx_mdef_9nfwfitter_13nfwmodeltools_9rdelta2rs_1f = {"f", (PyCFunction)__pyx_pw_9nfwfitter_13nfwmodeltools_9rdelta2rs_1f, METH_O, 0};
-static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_9rdelta2rs_1f(PyObject *__pyx_self, PyObject *__pyx_v_x) {
+static PyObject *__pyx_pw_13nfwmodeltools_9rdelta2rs_1f(PyObject *__pyx_self, PyObject *__pyx_v_x); /*proto*/
+static PyMethodDef __pyx_mdef_13nfwmodeltools_9rdelta2rs_1f = {"f", (PyCFunction)__pyx_pw_13nfwmodeltools_9rdelta2rs_1f, METH_O, 0};
+static PyObject *__pyx_pw_13nfwmodeltools_9rdelta2rs_1f(PyObject *__pyx_self, PyObject *__pyx_v_x) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("f (wrapper)", 0);
-  __pyx_r = __pyx_pf_9nfwfitter_13nfwmodeltools_9rdelta2rs_f(__pyx_self, ((PyObject *)__pyx_v_x));
+  __pyx_r = __pyx_pf_13nfwmodeltools_9rdelta2rs_f(__pyx_self, ((PyObject *)__pyx_v_x));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_9rdelta2rs_f(PyObject *__pyx_self, PyObject *__pyx_v_x) {
-  struct __pyx_obj_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs *__pyx_cur_scope;
-  struct __pyx_obj_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs *__pyx_outer_scope;
+static PyObject *__pyx_pf_13nfwmodeltools_9rdelta2rs_f(PyObject *__pyx_self, PyObject *__pyx_v_x) {
+  struct __pyx_obj_13nfwmodeltools___pyx_scope_struct__rdelta2rs *__pyx_cur_scope;
+  struct __pyx_obj_13nfwmodeltools___pyx_scope_struct__rdelta2rs *__pyx_outer_scope;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -3333,10 +3487,10 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_9rdelta2rs_f(PyObject *__py
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
   __Pyx_RefNannySetupContext("f", 0);
-  __pyx_outer_scope = (struct __pyx_obj_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs *) __Pyx_CyFunction_GetClosure(__pyx_self);
+  __pyx_outer_scope = (struct __pyx_obj_13nfwmodeltools___pyx_scope_struct__rdelta2rs *) __Pyx_CyFunction_GetClosure(__pyx_self);
   __pyx_cur_scope = __pyx_outer_scope;
 
-  /* "nfwfitter/nfwmodeltools.pyx":195
+  /* "nfwmodeltools.pyx":196
  *     def f(x):
  * 
  *         return 3*delta_c*(log(1+x) - (x/(1+x)))/x**3 - delta             # <<<<<<<<<<<<<<
@@ -3344,36 +3498,36 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_9rdelta2rs_f(PyObject *__py
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyFloat_FromDouble((3.0 * __pyx_cur_scope->__pyx_v_delta_c)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 195, __pyx_L1_error)
+  __pyx_t_1 = PyFloat_FromDouble((3.0 * __pyx_cur_scope->__pyx_v_delta_c)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 196, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyInt_AddCObj(__pyx_int_1, __pyx_v_x, 1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 195, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_AddCObj(__pyx_int_1, __pyx_v_x, 1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 196, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_3 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 195, __pyx_L1_error)
+  __pyx_t_3 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_3 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 196, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyFloat_FromDouble(log(__pyx_t_3)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 195, __pyx_L1_error)
+  __pyx_t_2 = PyFloat_FromDouble(log(__pyx_t_3)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 196, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = __Pyx_PyInt_AddCObj(__pyx_int_1, __pyx_v_x, 1, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 195, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyInt_AddCObj(__pyx_int_1, __pyx_v_x, 1, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 196, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyNumber_Divide(__pyx_v_x, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 195, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyNumber_Divide(__pyx_v_x, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 196, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = PyNumber_Subtract(__pyx_t_2, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 195, __pyx_L1_error)
+  __pyx_t_4 = PyNumber_Subtract(__pyx_t_2, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 196, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = PyNumber_Multiply(__pyx_t_1, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 195, __pyx_L1_error)
+  __pyx_t_5 = PyNumber_Multiply(__pyx_t_1, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 196, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = PyNumber_Power(__pyx_v_x, __pyx_int_3, Py_None); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 195, __pyx_L1_error)
+  __pyx_t_4 = PyNumber_Power(__pyx_v_x, __pyx_int_3, Py_None); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 196, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_1 = __Pyx_PyNumber_Divide(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 195, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyNumber_Divide(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 196, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = PyFloat_FromDouble(__pyx_cur_scope->__pyx_v_delta); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 195, __pyx_L1_error)
+  __pyx_t_4 = PyFloat_FromDouble(__pyx_cur_scope->__pyx_v_delta); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 196, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = PyNumber_Subtract(__pyx_t_1, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 195, __pyx_L1_error)
+  __pyx_t_5 = PyNumber_Subtract(__pyx_t_1, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 196, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -3381,7 +3535,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_9rdelta2rs_f(PyObject *__py
   __pyx_t_5 = 0;
   goto __pyx_L0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":193
+  /* "nfwmodeltools.pyx":194
  * 
  *     # x = r_delta / rs
  *     def f(x):             # <<<<<<<<<<<<<<
@@ -3395,7 +3549,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_9rdelta2rs_f(PyObject *__py
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("nfwfitter.nfwmodeltools.rdelta2rs.f", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("nfwmodeltools.rdelta2rs.f", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -3403,7 +3557,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_9rdelta2rs_f(PyObject *__py
   return __pyx_r;
 }
 
-/* "nfwfitter/nfwmodeltools.pyx":186
+/* "nfwmodeltools.pyx":187
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def rdelta2rs(double rdelta,             # <<<<<<<<<<<<<<
@@ -3411,8 +3565,8 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_9rdelta2rs_f(PyObject *__py
  *               double delta):
  */
 
-static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_6rdelta2rs(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_rdelta, double __pyx_v_c200, double __pyx_v_delta) {
-  struct __pyx_obj_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs *__pyx_cur_scope;
+static PyObject *__pyx_pf_13nfwmodeltools_6rdelta2rs(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_rdelta, double __pyx_v_c200, double __pyx_v_delta) {
+  struct __pyx_obj_13nfwmodeltools___pyx_scope_struct__rdelta2rs *__pyx_cur_scope;
   PyObject *__pyx_v_f = 0;
   PyObject *__pyx_v_x0 = NULL;
   double __pyx_v_rs;
@@ -3425,50 +3579,50 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_6rdelta2rs(CYTHON_UNUSED Py
   PyObject *__pyx_t_5 = NULL;
   double __pyx_t_6;
   __Pyx_RefNannySetupContext("rdelta2rs", 0);
-  __pyx_cur_scope = (struct __pyx_obj_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs *)__pyx_tp_new_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs(__pyx_ptype_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs, __pyx_empty_tuple, NULL);
+  __pyx_cur_scope = (struct __pyx_obj_13nfwmodeltools___pyx_scope_struct__rdelta2rs *)__pyx_tp_new_13nfwmodeltools___pyx_scope_struct__rdelta2rs(__pyx_ptype_13nfwmodeltools___pyx_scope_struct__rdelta2rs, __pyx_empty_tuple, NULL);
   if (unlikely(!__pyx_cur_scope)) {
-    __pyx_cur_scope = ((struct __pyx_obj_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs *)Py_None);
+    __pyx_cur_scope = ((struct __pyx_obj_13nfwmodeltools___pyx_scope_struct__rdelta2rs *)Py_None);
     __Pyx_INCREF(Py_None);
-    __PYX_ERR(0, 186, __pyx_L1_error)
+    __PYX_ERR(0, 187, __pyx_L1_error)
   } else {
     __Pyx_GOTREF(__pyx_cur_scope);
   }
   __pyx_cur_scope->__pyx_v_delta = __pyx_v_delta;
 
-  /* "nfwfitter/nfwmodeltools.pyx":190
+  /* "nfwmodeltools.pyx":191
  *               double delta):
  * 
  *     cdef double delta_c = deltaC(c200)             # <<<<<<<<<<<<<<
  * 
  *     # x = r_delta / rs
  */
-  __pyx_cur_scope->__pyx_v_delta_c = __pyx_f_9nfwfitter_13nfwmodeltools_deltaC(__pyx_v_c200, NULL);
+  __pyx_cur_scope->__pyx_v_delta_c = __pyx_f_13nfwmodeltools_deltaC(__pyx_v_c200, NULL);
 
-  /* "nfwfitter/nfwmodeltools.pyx":193
+  /* "nfwmodeltools.pyx":194
  * 
  *     # x = r_delta / rs
  *     def f(x):             # <<<<<<<<<<<<<<
  * 
  *         return 3*delta_c*(log(1+x) - (x/(1+x)))/x**3 - delta
  */
-  __pyx_t_1 = __Pyx_CyFunction_NewEx(&__pyx_mdef_9nfwfitter_13nfwmodeltools_9rdelta2rs_1f, 0, __pyx_n_s_rdelta2rs_locals_f, ((PyObject*)__pyx_cur_scope), __pyx_n_s_nfwfitter_nfwmodeltools, __pyx_d, ((PyObject *)__pyx_codeobj__2)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 193, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_CyFunction_NewEx(&__pyx_mdef_13nfwmodeltools_9rdelta2rs_1f, 0, __pyx_n_s_rdelta2rs_locals_f, ((PyObject*)__pyx_cur_scope), __pyx_n_s_nfwmodeltools, __pyx_d, ((PyObject *)__pyx_codeobj__2)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 194, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_f = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":198
+  /* "nfwmodeltools.pyx":199
  * 
  * 
  *     x0 = scipy.optimize.brenth(f, 0.1, 20)             # <<<<<<<<<<<<<<
  * 
  *     cdef double rs = rdelta / x0
  */
-  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_scipy); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 198, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_scipy); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 199, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_optimize); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 198, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_optimize); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 199, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_brenth); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 198, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_brenth); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 199, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_t_3 = NULL;
@@ -3486,7 +3640,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_6rdelta2rs(CYTHON_UNUSED Py
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[4] = {__pyx_t_3, __pyx_v_f, __pyx_float_0_1, __pyx_int_20};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 3+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 198, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 3+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 199, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_GOTREF(__pyx_t_1);
   } else
@@ -3494,13 +3648,13 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_6rdelta2rs(CYTHON_UNUSED Py
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[4] = {__pyx_t_3, __pyx_v_f, __pyx_float_0_1, __pyx_int_20};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 3+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 198, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 3+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 199, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_GOTREF(__pyx_t_1);
   } else
   #endif
   {
-    __pyx_t_5 = PyTuple_New(3+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 198, __pyx_L1_error)
+    __pyx_t_5 = PyTuple_New(3+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 199, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     if (__pyx_t_3) {
       __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3); __pyx_t_3 = NULL;
@@ -3514,7 +3668,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_6rdelta2rs(CYTHON_UNUSED Py
     __Pyx_INCREF(__pyx_int_20);
     __Pyx_GIVEREF(__pyx_int_20);
     PyTuple_SET_ITEM(__pyx_t_5, 2+__pyx_t_4, __pyx_int_20);
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 198, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 199, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   }
@@ -3522,23 +3676,23 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_6rdelta2rs(CYTHON_UNUSED Py
   __pyx_v_x0 = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":200
+  /* "nfwmodeltools.pyx":201
  *     x0 = scipy.optimize.brenth(f, 0.1, 20)
  * 
  *     cdef double rs = rdelta / x0             # <<<<<<<<<<<<<<
  * 
  *     return rs
  */
-  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_rdelta); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 200, __pyx_L1_error)
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_rdelta); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 201, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyNumber_Divide(__pyx_t_1, __pyx_v_x0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 200, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyNumber_Divide(__pyx_t_1, __pyx_v_x0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 201, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_6 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 200, __pyx_L1_error)
+  __pyx_t_6 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 201, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_rs = __pyx_t_6;
 
-  /* "nfwfitter/nfwmodeltools.pyx":202
+  /* "nfwmodeltools.pyx":203
  *     cdef double rs = rdelta / x0
  * 
  *     return rs             # <<<<<<<<<<<<<<
@@ -3546,13 +3700,13 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_6rdelta2rs(CYTHON_UNUSED Py
  * #####################
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_rs); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 202, __pyx_L1_error)
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_rs); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 203, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":186
+  /* "nfwmodeltools.pyx":187
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def rdelta2rs(double rdelta,             # <<<<<<<<<<<<<<
@@ -3566,7 +3720,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_6rdelta2rs(CYTHON_UNUSED Py
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("nfwfitter.nfwmodeltools.rdelta2rs", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("nfwmodeltools.rdelta2rs", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XDECREF(__pyx_v_f);
@@ -3577,7 +3731,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_6rdelta2rs(CYTHON_UNUSED Py
   return __pyx_r;
 }
 
-/* "nfwfitter/nfwmodeltools.pyx":209
+/* "nfwmodeltools.pyx":210
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def rscaleConstM(double mdelta,             # <<<<<<<<<<<<<<
@@ -3586,9 +3740,9 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_6rdelta2rs(CYTHON_UNUSED Py
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_9rscaleConstM(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_9nfwfitter_13nfwmodeltools_9rscaleConstM = {"rscaleConstM", (PyCFunction)__pyx_pw_9nfwfitter_13nfwmodeltools_9rscaleConstM, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_9rscaleConstM(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_13nfwmodeltools_9rscaleConstM(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_13nfwmodeltools_9rscaleConstM = {"rscaleConstM", (PyCFunction)__pyx_pw_13nfwmodeltools_9rscaleConstM, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_13nfwmodeltools_9rscaleConstM(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   double __pyx_v_mdelta;
   double __pyx_v_c;
   double __pyx_v_rho_c;
@@ -3618,21 +3772,21 @@ static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_9rscaleConstM(PyObject *__p
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_c)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("rscaleConstM", 1, 4, 4, 1); __PYX_ERR(0, 209, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("rscaleConstM", 1, 4, 4, 1); __PYX_ERR(0, 210, __pyx_L3_error)
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_rho_c)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("rscaleConstM", 1, 4, 4, 2); __PYX_ERR(0, 209, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("rscaleConstM", 1, 4, 4, 2); __PYX_ERR(0, 210, __pyx_L3_error)
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_delta)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("rscaleConstM", 1, 4, 4, 3); __PYX_ERR(0, 209, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("rscaleConstM", 1, 4, 4, 3); __PYX_ERR(0, 210, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "rscaleConstM") < 0)) __PYX_ERR(0, 209, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "rscaleConstM") < 0)) __PYX_ERR(0, 210, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
       goto __pyx_L5_argtuple_error;
@@ -3642,27 +3796,27 @@ static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_9rscaleConstM(PyObject *__p
       values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
       values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
     }
-    __pyx_v_mdelta = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_mdelta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 209, __pyx_L3_error)
-    __pyx_v_c = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_c == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 210, __pyx_L3_error)
-    __pyx_v_rho_c = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_rho_c == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 211, __pyx_L3_error)
-    __pyx_v_delta = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_delta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 212, __pyx_L3_error)
+    __pyx_v_mdelta = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_mdelta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 210, __pyx_L3_error)
+    __pyx_v_c = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_c == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 211, __pyx_L3_error)
+    __pyx_v_rho_c = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_rho_c == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 212, __pyx_L3_error)
+    __pyx_v_delta = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_delta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 213, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("rscaleConstM", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 209, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("rscaleConstM", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 210, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("nfwfitter.nfwmodeltools.rscaleConstM", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("nfwmodeltools.rscaleConstM", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9nfwfitter_13nfwmodeltools_8rscaleConstM(__pyx_self, __pyx_v_mdelta, __pyx_v_c, __pyx_v_rho_c, __pyx_v_delta);
+  __pyx_r = __pyx_pf_13nfwmodeltools_8rscaleConstM(__pyx_self, __pyx_v_mdelta, __pyx_v_c, __pyx_v_rho_c, __pyx_v_delta);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_8rscaleConstM(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_mdelta, double __pyx_v_c, double __pyx_v_rho_c, double __pyx_v_delta) {
+static PyObject *__pyx_pf_13nfwmodeltools_8rscaleConstM(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_mdelta, double __pyx_v_c, double __pyx_v_rho_c, double __pyx_v_delta) {
   double __pyx_v_rdelta;
   double __pyx_v_rs;
   PyObject *__pyx_r = NULL;
@@ -3678,60 +3832,60 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_8rscaleConstM(CYTHON_UNUSED
   PyObject *__pyx_t_9 = NULL;
   __Pyx_RefNannySetupContext("rscaleConstM", 0);
 
-  /* "nfwfitter/nfwmodeltools.pyx":214
+  /* "nfwmodeltools.pyx":215
  *                  double delta):
  * 
  *     cdef double rdelta = (3*mdelta/(4*delta*np.pi*rho_c))**(1./3.)             # <<<<<<<<<<<<<<
  * 
  *     cdef double rs = rdelta2rs(rdelta, c, delta)
  */
-  __pyx_t_1 = PyFloat_FromDouble((3.0 * __pyx_v_mdelta)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 214, __pyx_L1_error)
+  __pyx_t_1 = PyFloat_FromDouble((3.0 * __pyx_v_mdelta)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 215, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyFloat_FromDouble((4.0 * __pyx_v_delta)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 214, __pyx_L1_error)
+  __pyx_t_2 = PyFloat_FromDouble((4.0 * __pyx_v_delta)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 215, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 214, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 215, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_pi); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 214, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_pi); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 215, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyNumber_Multiply(__pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 214, __pyx_L1_error)
+  __pyx_t_3 = PyNumber_Multiply(__pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 215, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_rho_c); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 214, __pyx_L1_error)
+  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_rho_c); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 215, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_2 = PyNumber_Multiply(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 214, __pyx_L1_error)
+  __pyx_t_2 = PyNumber_Multiply(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 215, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyNumber_Divide(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 214, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyNumber_Divide(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 215, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyFloat_FromDouble((1. / 3.)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 214, __pyx_L1_error)
+  __pyx_t_2 = PyFloat_FromDouble((1. / 3.)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 215, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = PyNumber_Power(__pyx_t_4, __pyx_t_2, Py_None); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 214, __pyx_L1_error)
+  __pyx_t_1 = PyNumber_Power(__pyx_t_4, __pyx_t_2, Py_None); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 215, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_5 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_5 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 214, __pyx_L1_error)
+  __pyx_t_5 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_5 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 215, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_rdelta = __pyx_t_5;
 
-  /* "nfwfitter/nfwmodeltools.pyx":216
+  /* "nfwmodeltools.pyx":217
  *     cdef double rdelta = (3*mdelta/(4*delta*np.pi*rho_c))**(1./3.)
  * 
  *     cdef double rs = rdelta2rs(rdelta, c, delta)             # <<<<<<<<<<<<<<
  * 
  *     return rs
  */
-  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_rdelta2rs); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_rdelta2rs); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 217, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_rdelta); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_rdelta); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 217, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_c); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_c); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 217, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_6 = PyFloat_FromDouble(__pyx_v_delta); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __pyx_t_6 = PyFloat_FromDouble(__pyx_v_delta); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 217, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __pyx_t_7 = NULL;
   __pyx_t_8 = 0;
@@ -3748,7 +3902,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_8rscaleConstM(CYTHON_UNUSED
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[4] = {__pyx_t_7, __pyx_t_4, __pyx_t_3, __pyx_t_6};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 3+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 216, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 3+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 217, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -3759,7 +3913,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_8rscaleConstM(CYTHON_UNUSED
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[4] = {__pyx_t_7, __pyx_t_4, __pyx_t_3, __pyx_t_6};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 3+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 216, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 3+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 217, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -3768,7 +3922,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_8rscaleConstM(CYTHON_UNUSED
   } else
   #endif
   {
-    __pyx_t_9 = PyTuple_New(3+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 216, __pyx_L1_error)
+    __pyx_t_9 = PyTuple_New(3+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 217, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_9);
     if (__pyx_t_7) {
       __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_7); __pyx_t_7 = NULL;
@@ -3782,16 +3936,16 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_8rscaleConstM(CYTHON_UNUSED
     __pyx_t_4 = 0;
     __pyx_t_3 = 0;
     __pyx_t_6 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 216, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 217, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_5 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_5 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 216, __pyx_L1_error)
+  __pyx_t_5 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_5 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 217, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_rs = __pyx_t_5;
 
-  /* "nfwfitter/nfwmodeltools.pyx":218
+  /* "nfwmodeltools.pyx":219
  *     cdef double rs = rdelta2rs(rdelta, c, delta)
  * 
  *     return rs             # <<<<<<<<<<<<<<
@@ -3799,13 +3953,13 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_8rscaleConstM(CYTHON_UNUSED
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_rs); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 218, __pyx_L1_error)
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_rs); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 219, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":209
+  /* "nfwmodeltools.pyx":210
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def rscaleConstM(double mdelta,             # <<<<<<<<<<<<<<
@@ -3822,7 +3976,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_8rscaleConstM(CYTHON_UNUSED
   __Pyx_XDECREF(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_7);
   __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_AddTraceback("nfwfitter.nfwmodeltools.rscaleConstM", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("nfwmodeltools.rscaleConstM", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -3830,7 +3984,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_8rscaleConstM(CYTHON_UNUSED
   return __pyx_r;
 }
 
-/* "nfwfitter/nfwmodeltools.pyx":225
+/* "nfwmodeltools.pyx":226
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def massInsideR(double rs,             # <<<<<<<<<<<<<<
@@ -3839,9 +3993,9 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_8rscaleConstM(CYTHON_UNUSED
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_11massInsideR(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_9nfwfitter_13nfwmodeltools_11massInsideR = {"massInsideR", (PyCFunction)__pyx_pw_9nfwfitter_13nfwmodeltools_11massInsideR, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_11massInsideR(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_13nfwmodeltools_11massInsideR(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_13nfwmodeltools_11massInsideR = {"massInsideR", (PyCFunction)__pyx_pw_13nfwmodeltools_11massInsideR, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_13nfwmodeltools_11massInsideR(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   double __pyx_v_rs;
   double __pyx_v_c;
   double __pyx_v_R;
@@ -3871,21 +4025,21 @@ static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_11massInsideR(PyObject *__p
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_c)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("massInsideR", 1, 4, 4, 1); __PYX_ERR(0, 225, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("massInsideR", 1, 4, 4, 1); __PYX_ERR(0, 226, __pyx_L3_error)
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_R)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("massInsideR", 1, 4, 4, 2); __PYX_ERR(0, 225, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("massInsideR", 1, 4, 4, 2); __PYX_ERR(0, 226, __pyx_L3_error)
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_rho_c)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("massInsideR", 1, 4, 4, 3); __PYX_ERR(0, 225, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("massInsideR", 1, 4, 4, 3); __PYX_ERR(0, 226, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "massInsideR") < 0)) __PYX_ERR(0, 225, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "massInsideR") < 0)) __PYX_ERR(0, 226, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
       goto __pyx_L5_argtuple_error;
@@ -3895,27 +4049,27 @@ static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_11massInsideR(PyObject *__p
       values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
       values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
     }
-    __pyx_v_rs = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_rs == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 225, __pyx_L3_error)
-    __pyx_v_c = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_c == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 226, __pyx_L3_error)
-    __pyx_v_R = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_R == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 227, __pyx_L3_error)
-    __pyx_v_rho_c = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_rho_c == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 228, __pyx_L3_error)
+    __pyx_v_rs = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_rs == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 226, __pyx_L3_error)
+    __pyx_v_c = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_c == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 227, __pyx_L3_error)
+    __pyx_v_R = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_R == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 228, __pyx_L3_error)
+    __pyx_v_rho_c = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_rho_c == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 229, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("massInsideR", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 225, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("massInsideR", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 226, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("nfwfitter.nfwmodeltools.massInsideR", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("nfwmodeltools.massInsideR", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9nfwfitter_13nfwmodeltools_10massInsideR(__pyx_self, __pyx_v_rs, __pyx_v_c, __pyx_v_R, __pyx_v_rho_c);
+  __pyx_r = __pyx_pf_13nfwmodeltools_10massInsideR(__pyx_self, __pyx_v_rs, __pyx_v_c, __pyx_v_R, __pyx_v_rho_c);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_10massInsideR(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_rs, double __pyx_v_c, double __pyx_v_R, double __pyx_v_rho_c) {
+static PyObject *__pyx_pf_13nfwmodeltools_10massInsideR(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_rs, double __pyx_v_c, double __pyx_v_R, double __pyx_v_rho_c) {
   double __pyx_v_x;
   double __pyx_v_delta_c;
   double __pyx_v_massInsideR;
@@ -3927,7 +4081,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_10massInsideR(CYTHON_UNUSED
   PyObject *__pyx_t_4 = NULL;
   __Pyx_RefNannySetupContext("massInsideR", 0);
 
-  /* "nfwfitter/nfwmodeltools.pyx":230
+  /* "nfwmodeltools.pyx":231
  *                 double rho_c):
  * 
  *     cdef double x = R/rs             # <<<<<<<<<<<<<<
@@ -3936,20 +4090,20 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_10massInsideR(CYTHON_UNUSED
  */
   if (unlikely(__pyx_v_rs == 0)) {
     PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-    __PYX_ERR(0, 230, __pyx_L1_error)
+    __PYX_ERR(0, 231, __pyx_L1_error)
   }
   __pyx_v_x = (__pyx_v_R / __pyx_v_rs);
 
-  /* "nfwfitter/nfwmodeltools.pyx":231
+  /* "nfwmodeltools.pyx":232
  * 
  *     cdef double x = R/rs
  *     cdef double delta_c = deltaC(c)             # <<<<<<<<<<<<<<
  * 
  *     cdef double massInsideR = (log(1+x) - (x/(1+x)))*4*np.pi*delta_c*rho_c*rs**3
  */
-  __pyx_v_delta_c = __pyx_f_9nfwfitter_13nfwmodeltools_deltaC(__pyx_v_c, NULL);
+  __pyx_v_delta_c = __pyx_f_13nfwmodeltools_deltaC(__pyx_v_c, NULL);
 
-  /* "nfwfitter/nfwmodeltools.pyx":233
+  /* "nfwmodeltools.pyx":234
  *     cdef double delta_c = deltaC(c)
  * 
  *     cdef double massInsideR = (log(1+x) - (x/(1+x)))*4*np.pi*delta_c*rho_c*rs**3             # <<<<<<<<<<<<<<
@@ -3959,42 +4113,42 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_10massInsideR(CYTHON_UNUSED
   __pyx_t_1 = (1.0 + __pyx_v_x);
   if (unlikely(__pyx_t_1 == 0)) {
     PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-    __PYX_ERR(0, 233, __pyx_L1_error)
+    __PYX_ERR(0, 234, __pyx_L1_error)
   }
-  __pyx_t_2 = PyFloat_FromDouble(((log((1.0 + __pyx_v_x)) - (__pyx_v_x / __pyx_t_1)) * 4.0)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 233, __pyx_L1_error)
+  __pyx_t_2 = PyFloat_FromDouble(((log((1.0 + __pyx_v_x)) - (__pyx_v_x / __pyx_t_1)) * 4.0)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 234, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 233, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 234, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_pi); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 233, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_pi); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 234, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyNumber_Multiply(__pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 233, __pyx_L1_error)
+  __pyx_t_3 = PyNumber_Multiply(__pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 234, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_delta_c); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 233, __pyx_L1_error)
+  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_delta_c); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 234, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_2 = PyNumber_Multiply(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 233, __pyx_L1_error)
+  __pyx_t_2 = PyNumber_Multiply(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 234, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_rho_c); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 233, __pyx_L1_error)
+  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_rho_c); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 234, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_3 = PyNumber_Multiply(__pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 233, __pyx_L1_error)
+  __pyx_t_3 = PyNumber_Multiply(__pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 234, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = PyFloat_FromDouble(pow(__pyx_v_rs, 3.0)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 233, __pyx_L1_error)
+  __pyx_t_4 = PyFloat_FromDouble(pow(__pyx_v_rs, 3.0)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 234, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_2 = PyNumber_Multiply(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 233, __pyx_L1_error)
+  __pyx_t_2 = PyNumber_Multiply(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 234, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_1 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 233, __pyx_L1_error)
+  __pyx_t_1 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 234, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_massInsideR = __pyx_t_1;
 
-  /* "nfwfitter/nfwmodeltools.pyx":236
+  /* "nfwmodeltools.pyx":237
  * 
  * 
  *     return massInsideR             # <<<<<<<<<<<<<<
@@ -4002,13 +4156,13 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_10massInsideR(CYTHON_UNUSED
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_massInsideR); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 236, __pyx_L1_error)
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_massInsideR); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 237, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":225
+  /* "nfwmodeltools.pyx":226
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def massInsideR(double rs,             # <<<<<<<<<<<<<<
@@ -4021,7 +4175,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_10massInsideR(CYTHON_UNUSED
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("nfwfitter.nfwmodeltools.massInsideR", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("nfwmodeltools.massInsideR", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -4029,7 +4183,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_10massInsideR(CYTHON_UNUSED
   return __pyx_r;
 }
 
-/* "nfwfitter/nfwmodeltools.pyx":246
+/* "nfwmodeltools.pyx":247
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def shearprofile_like(double mdelta,             # <<<<<<<<<<<<<<
@@ -4038,10 +4192,10 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_10massInsideR(CYTHON_UNUSED
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_13shearprofile_like(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_9nfwfitter_13nfwmodeltools_12shearprofile_like[] = "Likelihood function - e.g. m200c, c200c, note: beta=D_ls/D_s is\nlensing quantity describing geometry, sigma_c is the critical density\nfor lensing\n\n    ";
-static PyMethodDef __pyx_mdef_9nfwfitter_13nfwmodeltools_13shearprofile_like = {"shearprofile_like", (PyCFunction)__pyx_pw_9nfwfitter_13nfwmodeltools_13shearprofile_like, METH_VARARGS|METH_KEYWORDS, __pyx_doc_9nfwfitter_13nfwmodeltools_12shearprofile_like};
-static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_13shearprofile_like(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_13nfwmodeltools_13shearprofile_like(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_13nfwmodeltools_12shearprofile_like[] = "Likelihood function - e.g. m200c, c200c, note: beta=D_ls/D_s is\nlensing quantity describing geometry, sigma_c is the critical density\nfor lensing\n\n    Note: whatever we set massdelta to be, c will be the corresponding overdensity\n    ";
+static PyMethodDef __pyx_mdef_13nfwmodeltools_13shearprofile_like = {"shearprofile_like", (PyCFunction)__pyx_pw_13nfwmodeltools_13shearprofile_like, METH_VARARGS|METH_KEYWORDS, __pyx_doc_13nfwmodeltools_12shearprofile_like};
+static PyObject *__pyx_pw_13nfwmodeltools_13shearprofile_like(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   double __pyx_v_mdelta;
   double __pyx_v_cdelta;
   PyArrayObject *__pyx_v_bin_r_mpc = 0;
@@ -4083,51 +4237,51 @@ static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_13shearprofile_like(PyObjec
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_cdelta)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("shearprofile_like", 1, 10, 10, 1); __PYX_ERR(0, 246, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like", 1, 10, 10, 1); __PYX_ERR(0, 247, __pyx_L3_error)
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_bin_r_mpc)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("shearprofile_like", 1, 10, 10, 2); __PYX_ERR(0, 246, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like", 1, 10, 10, 2); __PYX_ERR(0, 247, __pyx_L3_error)
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_bin_shear)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("shearprofile_like", 1, 10, 10, 3); __PYX_ERR(0, 246, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like", 1, 10, 10, 3); __PYX_ERR(0, 247, __pyx_L3_error)
         }
         case  4:
         if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_bin_shearerr)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("shearprofile_like", 1, 10, 10, 4); __PYX_ERR(0, 246, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like", 1, 10, 10, 4); __PYX_ERR(0, 247, __pyx_L3_error)
         }
         case  5:
         if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_avebeta)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("shearprofile_like", 1, 10, 10, 5); __PYX_ERR(0, 246, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like", 1, 10, 10, 5); __PYX_ERR(0, 247, __pyx_L3_error)
         }
         case  6:
         if (likely((values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_avebeta2)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("shearprofile_like", 1, 10, 10, 6); __PYX_ERR(0, 246, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like", 1, 10, 10, 6); __PYX_ERR(0, 247, __pyx_L3_error)
         }
         case  7:
         if (likely((values[7] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_rho_c)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("shearprofile_like", 1, 10, 10, 7); __PYX_ERR(0, 246, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like", 1, 10, 10, 7); __PYX_ERR(0, 247, __pyx_L3_error)
         }
         case  8:
         if (likely((values[8] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_rho_c_over_sigma_c)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("shearprofile_like", 1, 10, 10, 8); __PYX_ERR(0, 246, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like", 1, 10, 10, 8); __PYX_ERR(0, 247, __pyx_L3_error)
         }
         case  9:
         if (likely((values[9] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_massdelta)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("shearprofile_like", 1, 10, 10, 9); __PYX_ERR(0, 246, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like", 1, 10, 10, 9); __PYX_ERR(0, 247, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "shearprofile_like") < 0)) __PYX_ERR(0, 246, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "shearprofile_like") < 0)) __PYX_ERR(0, 247, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 10) {
       goto __pyx_L5_argtuple_error;
@@ -4143,31 +4297,31 @@ static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_13shearprofile_like(PyObjec
       values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
       values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
     }
-    __pyx_v_mdelta = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_mdelta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 246, __pyx_L3_error)
-    __pyx_v_cdelta = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_cdelta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 247, __pyx_L3_error)
+    __pyx_v_mdelta = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_mdelta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 247, __pyx_L3_error)
+    __pyx_v_cdelta = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_cdelta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 248, __pyx_L3_error)
     __pyx_v_bin_r_mpc = ((PyArrayObject *)values[2]);
     __pyx_v_bin_shear = ((PyArrayObject *)values[3]);
     __pyx_v_bin_shearerr = ((PyArrayObject *)values[4]);
     __pyx_v_avebeta = ((PyArrayObject *)values[5]);
     __pyx_v_avebeta2 = ((PyArrayObject *)values[6]);
-    __pyx_v_rho_c = __pyx_PyFloat_AsDouble(values[7]); if (unlikely((__pyx_v_rho_c == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 253, __pyx_L3_error)
-    __pyx_v_rho_c_over_sigma_c = __pyx_PyFloat_AsDouble(values[8]); if (unlikely((__pyx_v_rho_c_over_sigma_c == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 254, __pyx_L3_error)
-    __pyx_v_massdelta = __pyx_PyFloat_AsDouble(values[9]); if (unlikely((__pyx_v_massdelta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 255, __pyx_L3_error)
+    __pyx_v_rho_c = __pyx_PyFloat_AsDouble(values[7]); if (unlikely((__pyx_v_rho_c == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 254, __pyx_L3_error)
+    __pyx_v_rho_c_over_sigma_c = __pyx_PyFloat_AsDouble(values[8]); if (unlikely((__pyx_v_rho_c_over_sigma_c == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 255, __pyx_L3_error)
+    __pyx_v_massdelta = __pyx_PyFloat_AsDouble(values[9]); if (unlikely((__pyx_v_massdelta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 256, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("shearprofile_like", 1, 10, 10, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 246, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("shearprofile_like", 1, 10, 10, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 247, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("nfwfitter.nfwmodeltools.shearprofile_like", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("nfwmodeltools.shearprofile_like", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bin_r_mpc), __pyx_ptype_5numpy_ndarray, 0, "bin_r_mpc", 0))) __PYX_ERR(0, 248, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bin_shear), __pyx_ptype_5numpy_ndarray, 0, "bin_shear", 0))) __PYX_ERR(0, 249, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bin_shearerr), __pyx_ptype_5numpy_ndarray, 0, "bin_shearerr", 0))) __PYX_ERR(0, 250, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_avebeta), __pyx_ptype_5numpy_ndarray, 1, "avebeta", 0))) __PYX_ERR(0, 251, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_avebeta2), __pyx_ptype_5numpy_ndarray, 1, "avebeta2", 0))) __PYX_ERR(0, 252, __pyx_L1_error)
-  __pyx_r = __pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(__pyx_self, __pyx_v_mdelta, __pyx_v_cdelta, __pyx_v_bin_r_mpc, __pyx_v_bin_shear, __pyx_v_bin_shearerr, __pyx_v_avebeta, __pyx_v_avebeta2, __pyx_v_rho_c, __pyx_v_rho_c_over_sigma_c, __pyx_v_massdelta);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bin_r_mpc), __pyx_ptype_5numpy_ndarray, 0, "bin_r_mpc", 0))) __PYX_ERR(0, 249, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bin_shear), __pyx_ptype_5numpy_ndarray, 0, "bin_shear", 0))) __PYX_ERR(0, 250, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bin_shearerr), __pyx_ptype_5numpy_ndarray, 0, "bin_shearerr", 0))) __PYX_ERR(0, 251, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_avebeta), __pyx_ptype_5numpy_ndarray, 1, "avebeta", 0))) __PYX_ERR(0, 252, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_avebeta2), __pyx_ptype_5numpy_ndarray, 1, "avebeta2", 0))) __PYX_ERR(0, 253, __pyx_L1_error)
+  __pyx_r = __pyx_pf_13nfwmodeltools_12shearprofile_like(__pyx_self, __pyx_v_mdelta, __pyx_v_cdelta, __pyx_v_bin_r_mpc, __pyx_v_bin_shear, __pyx_v_bin_shearerr, __pyx_v_avebeta, __pyx_v_avebeta2, __pyx_v_rho_c, __pyx_v_rho_c_over_sigma_c, __pyx_v_massdelta);
 
   /* function exit code */
   goto __pyx_L0;
@@ -4178,7 +4332,7 @@ static PyObject *__pyx_pw_9nfwfitter_13nfwmodeltools_13shearprofile_like(PyObjec
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_mdelta, double __pyx_v_cdelta, PyArrayObject *__pyx_v_bin_r_mpc, PyArrayObject *__pyx_v_bin_shear, PyArrayObject *__pyx_v_bin_shearerr, PyArrayObject *__pyx_v_avebeta, PyArrayObject *__pyx_v_avebeta2, double __pyx_v_rho_c, double __pyx_v_rho_c_over_sigma_c, double __pyx_v_massdelta) {
+static PyObject *__pyx_pf_13nfwmodeltools_12shearprofile_like(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_mdelta, double __pyx_v_cdelta, PyArrayObject *__pyx_v_bin_r_mpc, PyArrayObject *__pyx_v_bin_shear, PyArrayObject *__pyx_v_bin_shearerr, PyArrayObject *__pyx_v_avebeta, PyArrayObject *__pyx_v_avebeta2, double __pyx_v_rho_c, double __pyx_v_rho_c_over_sigma_c, double __pyx_v_massdelta) {
   Py_ssize_t __pyx_v_nbins;
   PyArrayObject *__pyx_v_gamma_inf = 0;
   PyArrayObject *__pyx_v_kappa_inf = 0;
@@ -4190,7 +4344,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
   double __pyx_v_modelg;
   PyObject *__pyx_v_modsig = 0;
   Py_ssize_t __pyx_v_i;
-  __pyx_t_9nfwfitter_13nfwmodeltools_DTYPE_T __pyx_v_logProb;
+  __pyx_t_13nfwmodeltools_DTYPE_T __pyx_v_logProb;
   double __pyx_v_betaratio;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_avebeta;
   __Pyx_Buffer __pyx_pybuffer_avebeta;
@@ -4227,9 +4381,9 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
   __pyx_t_5numpy_double_t __pyx_t_17;
   Py_ssize_t __pyx_t_18;
   Py_ssize_t __pyx_t_19;
-  __pyx_t_9nfwfitter_13nfwmodeltools_DTYPE_T __pyx_t_20;
+  __pyx_t_13nfwmodeltools_DTYPE_T __pyx_t_20;
   Py_ssize_t __pyx_t_21;
-  __pyx_t_9nfwfitter_13nfwmodeltools_DTYPE_T __pyx_t_22;
+  __pyx_t_13nfwmodeltools_DTYPE_T __pyx_t_22;
   Py_ssize_t __pyx_t_23;
   Py_ssize_t __pyx_t_24;
   __Pyx_RefNannySetupContext("shearprofile_like", 0);
@@ -4263,31 +4417,31 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
   __pyx_pybuffernd_avebeta2.rcbuffer = &__pyx_pybuffer_avebeta2;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_bin_r_mpc.rcbuffer->pybuffer, (PyObject*)__pyx_v_bin_r_mpc, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 246, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_bin_r_mpc.rcbuffer->pybuffer, (PyObject*)__pyx_v_bin_r_mpc, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 247, __pyx_L1_error)
   }
   __pyx_pybuffernd_bin_r_mpc.diminfo[0].strides = __pyx_pybuffernd_bin_r_mpc.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_bin_r_mpc.diminfo[0].shape = __pyx_pybuffernd_bin_r_mpc.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_bin_shear.rcbuffer->pybuffer, (PyObject*)__pyx_v_bin_shear, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 246, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_bin_shear.rcbuffer->pybuffer, (PyObject*)__pyx_v_bin_shear, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 247, __pyx_L1_error)
   }
   __pyx_pybuffernd_bin_shear.diminfo[0].strides = __pyx_pybuffernd_bin_shear.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_bin_shear.diminfo[0].shape = __pyx_pybuffernd_bin_shear.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer, (PyObject*)__pyx_v_bin_shearerr, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 246, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer, (PyObject*)__pyx_v_bin_shearerr, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 247, __pyx_L1_error)
   }
   __pyx_pybuffernd_bin_shearerr.diminfo[0].strides = __pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_bin_shearerr.diminfo[0].shape = __pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_avebeta.rcbuffer->pybuffer, (PyObject*)__pyx_v_avebeta, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 246, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_avebeta.rcbuffer->pybuffer, (PyObject*)__pyx_v_avebeta, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 247, __pyx_L1_error)
   }
   __pyx_pybuffernd_avebeta.diminfo[0].strides = __pyx_pybuffernd_avebeta.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_avebeta.diminfo[0].shape = __pyx_pybuffernd_avebeta.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_avebeta2.rcbuffer->pybuffer, (PyObject*)__pyx_v_avebeta2, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 246, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_avebeta2.rcbuffer->pybuffer, (PyObject*)__pyx_v_avebeta2, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 247, __pyx_L1_error)
   }
   __pyx_pybuffernd_avebeta2.diminfo[0].strides = __pyx_pybuffernd_avebeta2.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_avebeta2.diminfo[0].shape = __pyx_pybuffernd_avebeta2.rcbuffer->pybuffer.shape[0];
 
-  /* "nfwfitter/nfwmodeltools.pyx":263
+  /* "nfwmodeltools.pyx":265
  *     '''
  * 
  *     cdef Py_ssize_t nbins = bin_r_mpc.shape[0]             # <<<<<<<<<<<<<<
@@ -4296,7 +4450,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
  */
   __pyx_v_nbins = (__pyx_v_bin_r_mpc->dimensions[0]);
 
-  /* "nfwfitter/nfwmodeltools.pyx":269
+  /* "nfwmodeltools.pyx":271
  *     cdef double rscale
  * 
  *     if mdelta == 0:             # <<<<<<<<<<<<<<
@@ -4306,19 +4460,19 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
   __pyx_t_1 = ((__pyx_v_mdelta == 0.0) != 0);
   if (__pyx_t_1) {
 
-    /* "nfwfitter/nfwmodeltools.pyx":270
+    /* "nfwmodeltools.pyx":272
  * 
  *     if mdelta == 0:
  *         gamma_inf = np.zeros(nbins)             # <<<<<<<<<<<<<<
  *         kappa_inf = np.zeros(nbins)
  *     else:
  */
-    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 270, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 272, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_zeros); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 270, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_zeros); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 272, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_nbins); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 270, __pyx_L1_error)
+    __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_nbins); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 272, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_5 = NULL;
     if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
@@ -4331,14 +4485,14 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
       }
     }
     if (!__pyx_t_5) {
-      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 270, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 272, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __Pyx_GOTREF(__pyx_t_2);
     } else {
       #if CYTHON_FAST_PYCALL
       if (PyFunction_Check(__pyx_t_4)) {
         PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_t_3};
-        __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 270, __pyx_L1_error)
+        __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 272, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
         __Pyx_GOTREF(__pyx_t_2);
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -4347,34 +4501,34 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
       #if CYTHON_FAST_PYCCALL
       if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
         PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_t_3};
-        __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 270, __pyx_L1_error)
+        __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 272, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
         __Pyx_GOTREF(__pyx_t_2);
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       } else
       #endif
       {
-        __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 270, __pyx_L1_error)
+        __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 272, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_6);
         __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5); __pyx_t_5 = NULL;
         __Pyx_GIVEREF(__pyx_t_3);
         PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_t_3);
         __pyx_t_3 = 0;
-        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 270, __pyx_L1_error)
+        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 272, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
         __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
       }
     }
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 270, __pyx_L1_error)
+    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 272, __pyx_L1_error)
     __pyx_t_7 = ((PyArrayObject *)__pyx_t_2);
     {
       __Pyx_BufFmt_StackElem __pyx_stack[1];
       __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer);
-      __pyx_t_8 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_9nfwfitter_13nfwmodeltools_DTYPE_T, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack);
+      __pyx_t_8 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_13nfwmodeltools_DTYPE_T, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack);
       if (unlikely(__pyx_t_8 < 0)) {
         PyErr_Fetch(&__pyx_t_9, &__pyx_t_10, &__pyx_t_11);
-        if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer, (PyObject*)__pyx_v_gamma_inf, &__Pyx_TypeInfo_nn___pyx_t_9nfwfitter_13nfwmodeltools_DTYPE_T, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+        if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer, (PyObject*)__pyx_v_gamma_inf, &__Pyx_TypeInfo_nn___pyx_t_13nfwmodeltools_DTYPE_T, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
           Py_XDECREF(__pyx_t_9); Py_XDECREF(__pyx_t_10); Py_XDECREF(__pyx_t_11);
           __Pyx_RaiseBufferFallbackError();
         } else {
@@ -4382,25 +4536,25 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
         }
       }
       __pyx_pybuffernd_gamma_inf.diminfo[0].strides = __pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_gamma_inf.diminfo[0].shape = __pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer.shape[0];
-      if (unlikely(__pyx_t_8 < 0)) __PYX_ERR(0, 270, __pyx_L1_error)
+      if (unlikely(__pyx_t_8 < 0)) __PYX_ERR(0, 272, __pyx_L1_error)
     }
     __pyx_t_7 = 0;
     __pyx_v_gamma_inf = ((PyArrayObject *)__pyx_t_2);
     __pyx_t_2 = 0;
 
-    /* "nfwfitter/nfwmodeltools.pyx":271
+    /* "nfwmodeltools.pyx":273
  *     if mdelta == 0:
  *         gamma_inf = np.zeros(nbins)
  *         kappa_inf = np.zeros(nbins)             # <<<<<<<<<<<<<<
  *     else:
  * 
  */
-    __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 271, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 273, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_zeros); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 271, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_zeros); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 273, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = PyInt_FromSsize_t(__pyx_v_nbins); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 271, __pyx_L1_error)
+    __pyx_t_4 = PyInt_FromSsize_t(__pyx_v_nbins); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 273, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_t_3 = NULL;
     if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
@@ -4413,14 +4567,14 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
       }
     }
     if (!__pyx_t_3) {
-      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 271, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 273, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       __Pyx_GOTREF(__pyx_t_2);
     } else {
       #if CYTHON_FAST_PYCALL
       if (PyFunction_Check(__pyx_t_6)) {
         PyObject *__pyx_temp[2] = {__pyx_t_3, __pyx_t_4};
-        __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 271, __pyx_L1_error)
+        __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 273, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
         __Pyx_GOTREF(__pyx_t_2);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -4429,34 +4583,34 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
       #if CYTHON_FAST_PYCCALL
       if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
         PyObject *__pyx_temp[2] = {__pyx_t_3, __pyx_t_4};
-        __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 271, __pyx_L1_error)
+        __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 273, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
         __Pyx_GOTREF(__pyx_t_2);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       } else
       #endif
       {
-        __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 271, __pyx_L1_error)
+        __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 273, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
         __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3); __pyx_t_3 = NULL;
         __Pyx_GIVEREF(__pyx_t_4);
         PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_t_4);
         __pyx_t_4 = 0;
-        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_5, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 271, __pyx_L1_error)
+        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_5, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 273, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       }
     }
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 271, __pyx_L1_error)
+    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 273, __pyx_L1_error)
     __pyx_t_12 = ((PyArrayObject *)__pyx_t_2);
     {
       __Pyx_BufFmt_StackElem __pyx_stack[1];
       __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer);
-      __pyx_t_8 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer, (PyObject*)__pyx_t_12, &__Pyx_TypeInfo_nn___pyx_t_9nfwfitter_13nfwmodeltools_DTYPE_T, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack);
+      __pyx_t_8 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer, (PyObject*)__pyx_t_12, &__Pyx_TypeInfo_nn___pyx_t_13nfwmodeltools_DTYPE_T, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack);
       if (unlikely(__pyx_t_8 < 0)) {
         PyErr_Fetch(&__pyx_t_11, &__pyx_t_10, &__pyx_t_9);
-        if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer, (PyObject*)__pyx_v_kappa_inf, &__Pyx_TypeInfo_nn___pyx_t_9nfwfitter_13nfwmodeltools_DTYPE_T, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+        if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer, (PyObject*)__pyx_v_kappa_inf, &__Pyx_TypeInfo_nn___pyx_t_13nfwmodeltools_DTYPE_T, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
           Py_XDECREF(__pyx_t_11); Py_XDECREF(__pyx_t_10); Py_XDECREF(__pyx_t_9);
           __Pyx_RaiseBufferFallbackError();
         } else {
@@ -4464,13 +4618,13 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
         }
       }
       __pyx_pybuffernd_kappa_inf.diminfo[0].strides = __pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_kappa_inf.diminfo[0].shape = __pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer.shape[0];
-      if (unlikely(__pyx_t_8 < 0)) __PYX_ERR(0, 271, __pyx_L1_error)
+      if (unlikely(__pyx_t_8 < 0)) __PYX_ERR(0, 273, __pyx_L1_error)
     }
     __pyx_t_12 = 0;
     __pyx_v_kappa_inf = ((PyArrayObject *)__pyx_t_2);
     __pyx_t_2 = 0;
 
-    /* "nfwfitter/nfwmodeltools.pyx":269
+    /* "nfwmodeltools.pyx":271
  *     cdef double rscale
  * 
  *     if mdelta == 0:             # <<<<<<<<<<<<<<
@@ -4480,7 +4634,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
     goto __pyx_L3;
   }
 
-  /* "nfwfitter/nfwmodeltools.pyx":274
+  /* "nfwmodeltools.pyx":276
  *     else:
  * 
  *         rdelta = (3*abs(mdelta)/(4*massdelta*np.pi*rho_c))**(1./3.)             # <<<<<<<<<<<<<<
@@ -4488,70 +4642,70 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
  *         # Expected gamma for source at infinite redshift
  */
   /*else*/ {
-    __pyx_t_2 = PyFloat_FromDouble((3.0 * fabs(__pyx_v_mdelta))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 274, __pyx_L1_error)
+    __pyx_t_2 = PyFloat_FromDouble((3.0 * fabs(__pyx_v_mdelta))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 276, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_6 = PyFloat_FromDouble((4.0 * __pyx_v_massdelta)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 274, __pyx_L1_error)
+    __pyx_t_6 = PyFloat_FromDouble((4.0 * __pyx_v_massdelta)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 276, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 274, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 276, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_pi); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 274, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_pi); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 276, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_5 = PyNumber_Multiply(__pyx_t_6, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 274, __pyx_L1_error)
+    __pyx_t_5 = PyNumber_Multiply(__pyx_t_6, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 276, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = PyFloat_FromDouble(__pyx_v_rho_c); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 274, __pyx_L1_error)
+    __pyx_t_4 = PyFloat_FromDouble(__pyx_v_rho_c); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 276, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_6 = PyNumber_Multiply(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 274, __pyx_L1_error)
+    __pyx_t_6 = PyNumber_Multiply(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 276, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = __Pyx_PyNumber_Divide(__pyx_t_2, __pyx_t_6); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 274, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyNumber_Divide(__pyx_t_2, __pyx_t_6); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 276, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_6 = PyFloat_FromDouble((1. / 3.)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 274, __pyx_L1_error)
+    __pyx_t_6 = PyFloat_FromDouble((1. / 3.)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 276, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_2 = PyNumber_Power(__pyx_t_4, __pyx_t_6, Py_None); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 274, __pyx_L1_error)
+    __pyx_t_2 = PyNumber_Power(__pyx_t_4, __pyx_t_6, Py_None); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 276, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     __pyx_v_rdelta = __pyx_t_2;
     __pyx_t_2 = 0;
 
-    /* "nfwfitter/nfwmodeltools.pyx":275
+    /* "nfwmodeltools.pyx":277
  * 
  *         rdelta = (3*abs(mdelta)/(4*massdelta*np.pi*rho_c))**(1./3.)
  *         rscale = rdelta / cdelta             # <<<<<<<<<<<<<<
  *         # Expected gamma for source at infinite redshift
  *         gamma_inf = NFWShear(bin_r_mpc, cdelta, rscale, rho_c_over_sigma_c, delta = massdelta)
  */
-    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_cdelta); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 275, __pyx_L1_error)
+    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_cdelta); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 277, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_6 = __Pyx_PyNumber_Divide(__pyx_v_rdelta, __pyx_t_2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 275, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyNumber_Divide(__pyx_v_rdelta, __pyx_t_2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 277, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_13 = __pyx_PyFloat_AsDouble(__pyx_t_6); if (unlikely((__pyx_t_13 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 275, __pyx_L1_error)
+    __pyx_t_13 = __pyx_PyFloat_AsDouble(__pyx_t_6); if (unlikely((__pyx_t_13 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 277, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     __pyx_v_rscale = __pyx_t_13;
 
-    /* "nfwfitter/nfwmodeltools.pyx":277
+    /* "nfwmodeltools.pyx":279
  *         rscale = rdelta / cdelta
  *         # Expected gamma for source at infinite redshift
  *         gamma_inf = NFWShear(bin_r_mpc, cdelta, rscale, rho_c_over_sigma_c, delta = massdelta)             # <<<<<<<<<<<<<<
  *         kappa_inf = NFWKappa(bin_r_mpc, cdelta, rscale, rho_c_over_sigma_c, delta = massdelta)
  * 
  */
-    __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_NFWShear); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 277, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_NFWShear); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 279, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_cdelta); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 277, __pyx_L1_error)
+    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_cdelta); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 279, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_4 = PyFloat_FromDouble(__pyx_v_rscale); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 277, __pyx_L1_error)
+    __pyx_t_4 = PyFloat_FromDouble(__pyx_v_rscale); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 279, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = PyFloat_FromDouble(__pyx_v_rho_c_over_sigma_c); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 277, __pyx_L1_error)
+    __pyx_t_5 = PyFloat_FromDouble(__pyx_v_rho_c_over_sigma_c); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 279, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_3 = PyTuple_New(4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 277, __pyx_L1_error)
+    __pyx_t_3 = PyTuple_New(4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 279, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_INCREF(((PyObject *)__pyx_v_bin_r_mpc));
     __Pyx_GIVEREF(((PyObject *)__pyx_v_bin_r_mpc));
@@ -4565,26 +4719,26 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
     __pyx_t_2 = 0;
     __pyx_t_4 = 0;
     __pyx_t_5 = 0;
-    __pyx_t_5 = PyDict_New(); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 277, __pyx_L1_error)
+    __pyx_t_5 = PyDict_New(); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 279, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_4 = PyFloat_FromDouble(__pyx_v_massdelta); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 277, __pyx_L1_error)
+    __pyx_t_4 = PyFloat_FromDouble(__pyx_v_massdelta); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 279, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_delta, __pyx_t_4) < 0) __PYX_ERR(0, 277, __pyx_L1_error)
+    if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_delta, __pyx_t_4) < 0) __PYX_ERR(0, 279, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 277, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 279, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 277, __pyx_L1_error)
+    if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 279, __pyx_L1_error)
     __pyx_t_7 = ((PyArrayObject *)__pyx_t_4);
     {
       __Pyx_BufFmt_StackElem __pyx_stack[1];
       __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer);
-      __pyx_t_8 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_9nfwfitter_13nfwmodeltools_DTYPE_T, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack);
+      __pyx_t_8 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_13nfwmodeltools_DTYPE_T, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack);
       if (unlikely(__pyx_t_8 < 0)) {
         PyErr_Fetch(&__pyx_t_9, &__pyx_t_10, &__pyx_t_11);
-        if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer, (PyObject*)__pyx_v_gamma_inf, &__Pyx_TypeInfo_nn___pyx_t_9nfwfitter_13nfwmodeltools_DTYPE_T, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+        if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer, (PyObject*)__pyx_v_gamma_inf, &__Pyx_TypeInfo_nn___pyx_t_13nfwmodeltools_DTYPE_T, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
           Py_XDECREF(__pyx_t_9); Py_XDECREF(__pyx_t_10); Py_XDECREF(__pyx_t_11);
           __Pyx_RaiseBufferFallbackError();
         } else {
@@ -4592,28 +4746,28 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
         }
       }
       __pyx_pybuffernd_gamma_inf.diminfo[0].strides = __pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_gamma_inf.diminfo[0].shape = __pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer.shape[0];
-      if (unlikely(__pyx_t_8 < 0)) __PYX_ERR(0, 277, __pyx_L1_error)
+      if (unlikely(__pyx_t_8 < 0)) __PYX_ERR(0, 279, __pyx_L1_error)
     }
     __pyx_t_7 = 0;
     __pyx_v_gamma_inf = ((PyArrayObject *)__pyx_t_4);
     __pyx_t_4 = 0;
 
-    /* "nfwfitter/nfwmodeltools.pyx":278
+    /* "nfwmodeltools.pyx":280
  *         # Expected gamma for source at infinite redshift
  *         gamma_inf = NFWShear(bin_r_mpc, cdelta, rscale, rho_c_over_sigma_c, delta = massdelta)
  *         kappa_inf = NFWKappa(bin_r_mpc, cdelta, rscale, rho_c_over_sigma_c, delta = massdelta)             # <<<<<<<<<<<<<<
  * 
  *     if mdelta < 0.:
  */
-    __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_NFWKappa); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 278, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_NFWKappa); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 280, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = PyFloat_FromDouble(__pyx_v_cdelta); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 278, __pyx_L1_error)
+    __pyx_t_5 = PyFloat_FromDouble(__pyx_v_cdelta); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 280, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_3 = PyFloat_FromDouble(__pyx_v_rscale); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 278, __pyx_L1_error)
+    __pyx_t_3 = PyFloat_FromDouble(__pyx_v_rscale); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 280, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_6 = PyFloat_FromDouble(__pyx_v_rho_c_over_sigma_c); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 278, __pyx_L1_error)
+    __pyx_t_6 = PyFloat_FromDouble(__pyx_v_rho_c_over_sigma_c); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 280, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_2 = PyTuple_New(4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 278, __pyx_L1_error)
+    __pyx_t_2 = PyTuple_New(4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 280, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_INCREF(((PyObject *)__pyx_v_bin_r_mpc));
     __Pyx_GIVEREF(((PyObject *)__pyx_v_bin_r_mpc));
@@ -4627,26 +4781,26 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
     __pyx_t_5 = 0;
     __pyx_t_3 = 0;
     __pyx_t_6 = 0;
-    __pyx_t_6 = PyDict_New(); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 278, __pyx_L1_error)
+    __pyx_t_6 = PyDict_New(); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 280, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_3 = PyFloat_FromDouble(__pyx_v_massdelta); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 278, __pyx_L1_error)
+    __pyx_t_3 = PyFloat_FromDouble(__pyx_v_massdelta); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 280, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_delta, __pyx_t_3) < 0) __PYX_ERR(0, 278, __pyx_L1_error)
+    if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_delta, __pyx_t_3) < 0) __PYX_ERR(0, 280, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_2, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 278, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_2, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 280, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 278, __pyx_L1_error)
+    if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 280, __pyx_L1_error)
     __pyx_t_12 = ((PyArrayObject *)__pyx_t_3);
     {
       __Pyx_BufFmt_StackElem __pyx_stack[1];
       __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer);
-      __pyx_t_8 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer, (PyObject*)__pyx_t_12, &__Pyx_TypeInfo_nn___pyx_t_9nfwfitter_13nfwmodeltools_DTYPE_T, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack);
+      __pyx_t_8 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer, (PyObject*)__pyx_t_12, &__Pyx_TypeInfo_nn___pyx_t_13nfwmodeltools_DTYPE_T, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack);
       if (unlikely(__pyx_t_8 < 0)) {
         PyErr_Fetch(&__pyx_t_11, &__pyx_t_10, &__pyx_t_9);
-        if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer, (PyObject*)__pyx_v_kappa_inf, &__Pyx_TypeInfo_nn___pyx_t_9nfwfitter_13nfwmodeltools_DTYPE_T, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+        if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer, (PyObject*)__pyx_v_kappa_inf, &__Pyx_TypeInfo_nn___pyx_t_13nfwmodeltools_DTYPE_T, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
           Py_XDECREF(__pyx_t_11); Py_XDECREF(__pyx_t_10); Py_XDECREF(__pyx_t_9);
           __Pyx_RaiseBufferFallbackError();
         } else {
@@ -4654,7 +4808,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
         }
       }
       __pyx_pybuffernd_kappa_inf.diminfo[0].strides = __pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_kappa_inf.diminfo[0].shape = __pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer.shape[0];
-      if (unlikely(__pyx_t_8 < 0)) __PYX_ERR(0, 278, __pyx_L1_error)
+      if (unlikely(__pyx_t_8 < 0)) __PYX_ERR(0, 280, __pyx_L1_error)
     }
     __pyx_t_12 = 0;
     __pyx_v_kappa_inf = ((PyArrayObject *)__pyx_t_3);
@@ -4662,7 +4816,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
   }
   __pyx_L3:;
 
-  /* "nfwfitter/nfwmodeltools.pyx":280
+  /* "nfwmodeltools.pyx":282
  *         kappa_inf = NFWKappa(bin_r_mpc, cdelta, rscale, rho_c_over_sigma_c, delta = massdelta)
  * 
  *     if mdelta < 0.:             # <<<<<<<<<<<<<<
@@ -4672,24 +4826,24 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
   __pyx_t_1 = ((__pyx_v_mdelta < 0.) != 0);
   if (__pyx_t_1) {
 
-    /* "nfwfitter/nfwmodeltools.pyx":281
+    /* "nfwmodeltools.pyx":283
  * 
  *     if mdelta < 0.:
  *         gamma_inf = -gamma_inf             # <<<<<<<<<<<<<<
  * 
  * 
  */
-    __pyx_t_3 = PyNumber_Negative(((PyObject *)__pyx_v_gamma_inf)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 281, __pyx_L1_error)
+    __pyx_t_3 = PyNumber_Negative(((PyObject *)__pyx_v_gamma_inf)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 283, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 281, __pyx_L1_error)
+    if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 283, __pyx_L1_error)
     __pyx_t_7 = ((PyArrayObject *)__pyx_t_3);
     {
       __Pyx_BufFmt_StackElem __pyx_stack[1];
       __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer);
-      __pyx_t_8 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_9nfwfitter_13nfwmodeltools_DTYPE_T, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack);
+      __pyx_t_8 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_13nfwmodeltools_DTYPE_T, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack);
       if (unlikely(__pyx_t_8 < 0)) {
         PyErr_Fetch(&__pyx_t_9, &__pyx_t_10, &__pyx_t_11);
-        if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer, (PyObject*)__pyx_v_gamma_inf, &__Pyx_TypeInfo_nn___pyx_t_9nfwfitter_13nfwmodeltools_DTYPE_T, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+        if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer, (PyObject*)__pyx_v_gamma_inf, &__Pyx_TypeInfo_nn___pyx_t_13nfwmodeltools_DTYPE_T, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
           Py_XDECREF(__pyx_t_9); Py_XDECREF(__pyx_t_10); Py_XDECREF(__pyx_t_11);
           __Pyx_RaiseBufferFallbackError();
         } else {
@@ -4697,13 +4851,13 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
         }
       }
       __pyx_pybuffernd_gamma_inf.diminfo[0].strides = __pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_gamma_inf.diminfo[0].shape = __pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer.shape[0];
-      if (unlikely(__pyx_t_8 < 0)) __PYX_ERR(0, 281, __pyx_L1_error)
+      if (unlikely(__pyx_t_8 < 0)) __PYX_ERR(0, 283, __pyx_L1_error)
     }
     __pyx_t_7 = 0;
     __Pyx_DECREF_SET(__pyx_v_gamma_inf, ((PyArrayObject *)__pyx_t_3));
     __pyx_t_3 = 0;
 
-    /* "nfwfitter/nfwmodeltools.pyx":280
+    /* "nfwmodeltools.pyx":282
  *         kappa_inf = NFWKappa(bin_r_mpc, cdelta, rscale, rho_c_over_sigma_c, delta = massdelta)
  * 
  *     if mdelta < 0.:             # <<<<<<<<<<<<<<
@@ -4712,7 +4866,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
  */
   }
 
-  /* "nfwfitter/nfwmodeltools.pyx":284
+  /* "nfwmodeltools.pyx":286
  * 
  * 
  *     cdef int curbin = 0             # <<<<<<<<<<<<<<
@@ -4721,7 +4875,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
  */
   __pyx_v_curbin = 0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":285
+  /* "nfwmodeltools.pyx":287
  * 
  *     cdef int curbin = 0
  *     cdef double gtilde = 0.             # <<<<<<<<<<<<<<
@@ -4730,7 +4884,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
  */
   __pyx_v_gtilde = 0.;
 
-  /* "nfwfitter/nfwmodeltools.pyx":286
+  /* "nfwmodeltools.pyx":288
  *     cdef int curbin = 0
  *     cdef double gtilde = 0.
  *     cdef double delta = 0.             # <<<<<<<<<<<<<<
@@ -4739,7 +4893,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
  */
   __pyx_v_delta = 0.;
 
-  /* "nfwfitter/nfwmodeltools.pyx":287
+  /* "nfwmodeltools.pyx":289
  *     cdef double gtilde = 0.
  *     cdef double delta = 0.
  *     cdef double modelg = 0.             # <<<<<<<<<<<<<<
@@ -4748,7 +4902,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
  */
   __pyx_v_modelg = 0.;
 
-  /* "nfwfitter/nfwmodeltools.pyx":288
+  /* "nfwmodeltools.pyx":290
  *     cdef double delta = 0.
  *     cdef double modelg = 0.
  *     cdef modsig = 0.             # <<<<<<<<<<<<<<
@@ -4758,7 +4912,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
   __Pyx_INCREF(__pyx_float_0_);
   __pyx_v_modsig = __pyx_float_0_;
 
-  /* "nfwfitter/nfwmodeltools.pyx":291
+  /* "nfwmodeltools.pyx":293
  * 
  *     cdef Py_ssize_t i, j, s
  *     cdef DTYPE_T logProb = 0.             # <<<<<<<<<<<<<<
@@ -4767,7 +4921,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
  */
   __pyx_v_logProb = 0.;
 
-  /* "nfwfitter/nfwmodeltools.pyx":297
+  /* "nfwmodeltools.pyx":299
  * 
  *     # calculate logprob, which we want to maximize (same as minimizing chi squared)
  *     for i from nbins > i >= 0:             # <<<<<<<<<<<<<<
@@ -4776,7 +4930,7 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
  */
   for (__pyx_v_i = __pyx_v_nbins-1; __pyx_v_i >= 0; __pyx_v_i--) {
 
-    /* "nfwfitter/nfwmodeltools.pyx":299
+    /* "nfwmodeltools.pyx":301
  *     for i from nbins > i >= 0:
  * 
  *         betaratio = avebeta2[i]/avebeta[i]             # <<<<<<<<<<<<<<
@@ -4789,122 +4943,3450 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
     __pyx_t_17 = (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_avebeta.rcbuffer->pybuffer.buf, __pyx_t_16, __pyx_pybuffernd_avebeta.diminfo[0].strides));
     if (unlikely(__pyx_t_17 == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 299, __pyx_L1_error)
+      __PYX_ERR(0, 301, __pyx_L1_error)
     }
     __pyx_v_betaratio = (__pyx_t_15 / __pyx_t_17);
 
-    /* "nfwfitter/nfwmodeltools.pyx":301
- *         betaratio = avebeta2[i]/avebeta[i]
- *         # Model prediction of shear
- *         modelg = (avebeta[i]*gamma_inf[i] / (1 - betaratio*kappa_inf[i]))             # <<<<<<<<<<<<<<
+    /* "nfwmodeltools.pyx":303
+ *         betaratio = avebeta2[i]/avebeta[i]
+ *         # Model prediction of shear
+ *         modelg = (avebeta[i]*gamma_inf[i] / (1 - betaratio*kappa_inf[i]))             # <<<<<<<<<<<<<<
+ * 
+ *         delta = bin_shear[i] - modelg
+ */
+    __pyx_t_18 = __pyx_v_i;
+    __pyx_t_19 = __pyx_v_i;
+    __pyx_t_20 = ((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_avebeta.rcbuffer->pybuffer.buf, __pyx_t_18, __pyx_pybuffernd_avebeta.diminfo[0].strides)) * (*__Pyx_BufPtrCContig1d(__pyx_t_13nfwmodeltools_DTYPE_T *, __pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer.buf, __pyx_t_19, __pyx_pybuffernd_gamma_inf.diminfo[0].strides)));
+    __pyx_t_21 = __pyx_v_i;
+    __pyx_t_22 = (1.0 - (__pyx_v_betaratio * (*__Pyx_BufPtrCContig1d(__pyx_t_13nfwmodeltools_DTYPE_T *, __pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer.buf, __pyx_t_21, __pyx_pybuffernd_kappa_inf.diminfo[0].strides))));
+    if (unlikely(__pyx_t_22 == 0)) {
+      PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+      __PYX_ERR(0, 303, __pyx_L1_error)
+    }
+    __pyx_v_modelg = (__pyx_t_20 / __pyx_t_22);
+
+    /* "nfwmodeltools.pyx":305
+ *         modelg = (avebeta[i]*gamma_inf[i] / (1 - betaratio*kappa_inf[i]))
+ * 
+ *         delta = bin_shear[i] - modelg             # <<<<<<<<<<<<<<
+ * 
+ *         modsig = bin_shearerr[i]
+ */
+    __pyx_t_23 = __pyx_v_i;
+    __pyx_v_delta = ((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_bin_shear.rcbuffer->pybuffer.buf, __pyx_t_23, __pyx_pybuffernd_bin_shear.diminfo[0].strides)) - __pyx_v_modelg);
+
+    /* "nfwmodeltools.pyx":307
+ *         delta = bin_shear[i] - modelg
+ * 
+ *         modsig = bin_shearerr[i]             # <<<<<<<<<<<<<<
+ *         # Log of a gaussian prob: Chi squared term plus normalization term
+ *         logProb = logProb -.5*(delta/modsig)**2  - logsqrt2pi - log(modsig)
+ */
+    __pyx_t_24 = __pyx_v_i;
+    __pyx_t_3 = PyFloat_FromDouble((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer.buf, __pyx_t_24, __pyx_pybuffernd_bin_shearerr.diminfo[0].strides))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 307, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF_SET(__pyx_v_modsig, __pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "nfwmodeltools.pyx":309
+ *         modsig = bin_shearerr[i]
+ *         # Log of a gaussian prob: Chi squared term plus normalization term
+ *         logProb = logProb -.5*(delta/modsig)**2  - logsqrt2pi - log(modsig)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+    __pyx_t_3 = PyFloat_FromDouble(__pyx_v_logProb); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 309, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_6 = PyFloat_FromDouble(__pyx_v_delta); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 309, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_2 = __Pyx_PyNumber_Divide(__pyx_t_6, __pyx_v_modsig); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 309, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_6 = PyNumber_Power(__pyx_t_2, __pyx_int_2, Py_None); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 309, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyNumber_Multiply(__pyx_float__5, __pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 309, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_6 = PyNumber_Subtract(__pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 309, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_logsqrt2pi); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 309, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyNumber_Subtract(__pyx_t_6, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 309, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_13 = __pyx_PyFloat_AsDouble(__pyx_v_modsig); if (unlikely((__pyx_t_13 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 309, __pyx_L1_error)
+    __pyx_t_2 = PyFloat_FromDouble(log(__pyx_t_13)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 309, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_6 = PyNumber_Subtract(__pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 309, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_22 = __pyx_PyFloat_AsDouble(__pyx_t_6); if (unlikely((__pyx_t_22 == ((npy_double)-1)) && PyErr_Occurred())) __PYX_ERR(0, 309, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_v_logProb = __pyx_t_22;
+  }
+
+  /* "nfwmodeltools.pyx":312
+ * 
+ * 
+ *     return logProb             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_6 = PyFloat_FromDouble(__pyx_v_logProb); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 312, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_r = __pyx_t_6;
+  __pyx_t_6 = 0;
+  goto __pyx_L0;
+
+  /* "nfwmodeltools.pyx":247
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def shearprofile_like(double mdelta,             # <<<<<<<<<<<<<<
+ *                       double cdelta,
+ *                       np.ndarray[np.double_t, ndim=1, mode='c'] bin_r_mpc not None,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_avebeta.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_avebeta2.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bin_r_mpc.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bin_shear.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("nfwmodeltools.shearprofile_like", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_avebeta.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_avebeta2.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bin_r_mpc.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bin_shear.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_gamma_inf);
+  __Pyx_XDECREF((PyObject *)__pyx_v_kappa_inf);
+  __Pyx_XDECREF(__pyx_v_rdelta);
+  __Pyx_XDECREF(__pyx_v_modsig);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nfwmodeltools.pyx":324
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def nfwTemplates(np.ndarray[np.double_t, ndim=1, mode='c'] mdelta not None,             # <<<<<<<<<<<<<<
+ *                  np.ndarray[np.double_t, ndim=1, mode='c'] cdelta not None,
+ *                  np.ndarray[np.double_t, ndim=1, mode='c'] bin_r_mpc not None,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_13nfwmodeltools_15nfwTemplates(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_13nfwmodeltools_14nfwTemplates[] = "Shear and convergence for a source at infinite redshift, for each (mdelta, cdelta) pair,\n    as (nmasses x nbins) arrays. Same conventions as shearprofile_like: negative masses flip the \n    sign of the shear, zero mass gives zero signal.";
+static PyMethodDef __pyx_mdef_13nfwmodeltools_15nfwTemplates = {"nfwTemplates", (PyCFunction)__pyx_pw_13nfwmodeltools_15nfwTemplates, METH_VARARGS|METH_KEYWORDS, __pyx_doc_13nfwmodeltools_14nfwTemplates};
+static PyObject *__pyx_pw_13nfwmodeltools_15nfwTemplates(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_mdelta = 0;
+  PyArrayObject *__pyx_v_cdelta = 0;
+  PyArrayObject *__pyx_v_bin_r_mpc = 0;
+  double __pyx_v_rho_c;
+  double __pyx_v_rho_c_over_sigma_c;
+  double __pyx_v_massdelta;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("nfwTemplates (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_mdelta,&__pyx_n_s_cdelta,&__pyx_n_s_bin_r_mpc,&__pyx_n_s_rho_c,&__pyx_n_s_rho_c_over_sigma_c,&__pyx_n_s_massdelta,0};
+    PyObject* values[6] = {0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_mdelta)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_cdelta)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("nfwTemplates", 1, 6, 6, 1); __PYX_ERR(0, 324, __pyx_L3_error)
+        }
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_bin_r_mpc)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("nfwTemplates", 1, 6, 6, 2); __PYX_ERR(0, 324, __pyx_L3_error)
+        }
+        case  3:
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_rho_c)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("nfwTemplates", 1, 6, 6, 3); __PYX_ERR(0, 324, __pyx_L3_error)
+        }
+        case  4:
+        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_rho_c_over_sigma_c)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("nfwTemplates", 1, 6, 6, 4); __PYX_ERR(0, 324, __pyx_L3_error)
+        }
+        case  5:
+        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_massdelta)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("nfwTemplates", 1, 6, 6, 5); __PYX_ERR(0, 324, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "nfwTemplates") < 0)) __PYX_ERR(0, 324, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 6) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+    }
+    __pyx_v_mdelta = ((PyArrayObject *)values[0]);
+    __pyx_v_cdelta = ((PyArrayObject *)values[1]);
+    __pyx_v_bin_r_mpc = ((PyArrayObject *)values[2]);
+    __pyx_v_rho_c = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_rho_c == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 327, __pyx_L3_error)
+    __pyx_v_rho_c_over_sigma_c = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_rho_c_over_sigma_c == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 328, __pyx_L3_error)
+    __pyx_v_massdelta = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_massdelta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 329, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("nfwTemplates", 1, 6, 6, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 324, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nfwmodeltools.nfwTemplates", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_mdelta), __pyx_ptype_5numpy_ndarray, 0, "mdelta", 0))) __PYX_ERR(0, 324, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_cdelta), __pyx_ptype_5numpy_ndarray, 0, "cdelta", 0))) __PYX_ERR(0, 325, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bin_r_mpc), __pyx_ptype_5numpy_ndarray, 0, "bin_r_mpc", 0))) __PYX_ERR(0, 326, __pyx_L1_error)
+  __pyx_r = __pyx_pf_13nfwmodeltools_14nfwTemplates(__pyx_self, __pyx_v_mdelta, __pyx_v_cdelta, __pyx_v_bin_r_mpc, __pyx_v_rho_c, __pyx_v_rho_c_over_sigma_c, __pyx_v_massdelta);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_13nfwmodeltools_14nfwTemplates(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_mdelta, PyArrayObject *__pyx_v_cdelta, PyArrayObject *__pyx_v_bin_r_mpc, double __pyx_v_rho_c, double __pyx_v_rho_c_over_sigma_c, double __pyx_v_massdelta) {
+  Py_ssize_t __pyx_v_nmasses;
+  Py_ssize_t __pyx_v_nbins;
+  PyArrayObject *__pyx_v_gamma_inf = 0;
+  PyArrayObject *__pyx_v_kappa_inf = 0;
+  Py_ssize_t __pyx_v_m;
+  double __pyx_v_rdelta;
+  double __pyx_v_rscale;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_bin_r_mpc;
+  __Pyx_Buffer __pyx_pybuffer_bin_r_mpc;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_cdelta;
+  __Pyx_Buffer __pyx_pybuffer_cdelta;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_gamma_inf;
+  __Pyx_Buffer __pyx_pybuffer_gamma_inf;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_kappa_inf;
+  __Pyx_Buffer __pyx_pybuffer_kappa_inf;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_mdelta;
+  __Pyx_Buffer __pyx_pybuffer_mdelta;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyArrayObject *__pyx_t_6 = NULL;
+  PyArrayObject *__pyx_t_7 = NULL;
+  Py_ssize_t __pyx_t_8;
+  Py_ssize_t __pyx_t_9;
+  int __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  double __pyx_t_12;
+  Py_ssize_t __pyx_t_13;
+  __pyx_t_5numpy_double_t __pyx_t_14;
+  Py_ssize_t __pyx_t_15;
+  Py_ssize_t __pyx_t_16;
+  Py_ssize_t __pyx_t_17;
+  __Pyx_RefNannySetupContext("nfwTemplates", 0);
+  __pyx_pybuffer_gamma_inf.pybuffer.buf = NULL;
+  __pyx_pybuffer_gamma_inf.refcount = 0;
+  __pyx_pybuffernd_gamma_inf.data = NULL;
+  __pyx_pybuffernd_gamma_inf.rcbuffer = &__pyx_pybuffer_gamma_inf;
+  __pyx_pybuffer_kappa_inf.pybuffer.buf = NULL;
+  __pyx_pybuffer_kappa_inf.refcount = 0;
+  __pyx_pybuffernd_kappa_inf.data = NULL;
+  __pyx_pybuffernd_kappa_inf.rcbuffer = &__pyx_pybuffer_kappa_inf;
+  __pyx_pybuffer_mdelta.pybuffer.buf = NULL;
+  __pyx_pybuffer_mdelta.refcount = 0;
+  __pyx_pybuffernd_mdelta.data = NULL;
+  __pyx_pybuffernd_mdelta.rcbuffer = &__pyx_pybuffer_mdelta;
+  __pyx_pybuffer_cdelta.pybuffer.buf = NULL;
+  __pyx_pybuffer_cdelta.refcount = 0;
+  __pyx_pybuffernd_cdelta.data = NULL;
+  __pyx_pybuffernd_cdelta.rcbuffer = &__pyx_pybuffer_cdelta;
+  __pyx_pybuffer_bin_r_mpc.pybuffer.buf = NULL;
+  __pyx_pybuffer_bin_r_mpc.refcount = 0;
+  __pyx_pybuffernd_bin_r_mpc.data = NULL;
+  __pyx_pybuffernd_bin_r_mpc.rcbuffer = &__pyx_pybuffer_bin_r_mpc;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_mdelta.rcbuffer->pybuffer, (PyObject*)__pyx_v_mdelta, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 324, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_mdelta.diminfo[0].strides = __pyx_pybuffernd_mdelta.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_mdelta.diminfo[0].shape = __pyx_pybuffernd_mdelta.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_cdelta.rcbuffer->pybuffer, (PyObject*)__pyx_v_cdelta, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 324, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_cdelta.diminfo[0].strides = __pyx_pybuffernd_cdelta.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_cdelta.diminfo[0].shape = __pyx_pybuffernd_cdelta.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_bin_r_mpc.rcbuffer->pybuffer, (PyObject*)__pyx_v_bin_r_mpc, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 324, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_bin_r_mpc.diminfo[0].strides = __pyx_pybuffernd_bin_r_mpc.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_bin_r_mpc.diminfo[0].shape = __pyx_pybuffernd_bin_r_mpc.rcbuffer->pybuffer.shape[0];
+
+  /* "nfwmodeltools.pyx":335
+ *     sign of the shear, zero mass gives zero signal.'''
+ * 
+ *     cdef Py_ssize_t nmasses = mdelta.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t nbins = bin_r_mpc.shape[0]
+ * 
+ */
+  __pyx_v_nmasses = (__pyx_v_mdelta->dimensions[0]);
+
+  /* "nfwmodeltools.pyx":336
+ * 
+ *     cdef Py_ssize_t nmasses = mdelta.shape[0]
+ *     cdef Py_ssize_t nbins = bin_r_mpc.shape[0]             # <<<<<<<<<<<<<<
+ * 
+ *     cdef np.ndarray[DTYPE_T, ndim=2, mode='c'] gamma_inf = np.zeros((nmasses, nbins), dtype=np.float64)
+ */
+  __pyx_v_nbins = (__pyx_v_bin_r_mpc->dimensions[0]);
+
+  /* "nfwmodeltools.pyx":338
+ *     cdef Py_ssize_t nbins = bin_r_mpc.shape[0]
+ * 
+ *     cdef np.ndarray[DTYPE_T, ndim=2, mode='c'] gamma_inf = np.zeros((nmasses, nbins), dtype=np.float64)             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[DTYPE_T, ndim=2, mode='c'] kappa_inf = np.zeros((nmasses, nbins), dtype=np.float64)
+ * 
+ */
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 338, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_zeros); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 338, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyInt_FromSsize_t(__pyx_v_nmasses); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 338, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_nbins); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 338, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 338, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_3);
+  __pyx_t_1 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 338, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = PyDict_New(); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 338, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 338, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_float64); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 338, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_5) < 0) __PYX_ERR(0, 338, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 338, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 338, __pyx_L1_error)
+  __pyx_t_6 = ((PyArrayObject *)__pyx_t_5);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer, (PyObject*)__pyx_t_6, &__Pyx_TypeInfo_nn___pyx_t_13nfwmodeltools_DTYPE_T, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) {
+      __pyx_v_gamma_inf = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 338, __pyx_L1_error)
+    } else {__pyx_pybuffernd_gamma_inf.diminfo[0].strides = __pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_gamma_inf.diminfo[0].shape = __pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_gamma_inf.diminfo[1].strides = __pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_gamma_inf.diminfo[1].shape = __pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer.shape[1];
+    }
+  }
+  __pyx_t_6 = 0;
+  __pyx_v_gamma_inf = ((PyArrayObject *)__pyx_t_5);
+  __pyx_t_5 = 0;
+
+  /* "nfwmodeltools.pyx":339
+ * 
+ *     cdef np.ndarray[DTYPE_T, ndim=2, mode='c'] gamma_inf = np.zeros((nmasses, nbins), dtype=np.float64)
+ *     cdef np.ndarray[DTYPE_T, ndim=2, mode='c'] kappa_inf = np.zeros((nmasses, nbins), dtype=np.float64)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef Py_ssize_t m
+ */
+  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 339, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_zeros); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 339, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = PyInt_FromSsize_t(__pyx_v_nmasses); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 339, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_nbins); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 339, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 339, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_3);
+  __pyx_t_5 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 339, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 339, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 339, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_float64); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 339, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_1) < 0) __PYX_ERR(0, 339, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 339, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 339, __pyx_L1_error)
+  __pyx_t_7 = ((PyArrayObject *)__pyx_t_1);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_13nfwmodeltools_DTYPE_T, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) {
+      __pyx_v_kappa_inf = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 339, __pyx_L1_error)
+    } else {__pyx_pybuffernd_kappa_inf.diminfo[0].strides = __pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_kappa_inf.diminfo[0].shape = __pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_kappa_inf.diminfo[1].strides = __pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_kappa_inf.diminfo[1].shape = __pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer.shape[1];
+    }
+  }
+  __pyx_t_7 = 0;
+  __pyx_v_kappa_inf = ((PyArrayObject *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "nfwmodeltools.pyx":344
+ *     cdef double rdelta, rscale
+ * 
+ *     for m from 0 <= m < nmasses:             # <<<<<<<<<<<<<<
+ * 
+ *         if mdelta[m] == 0:
+ */
+  __pyx_t_8 = __pyx_v_nmasses;
+  for (__pyx_v_m = 0; __pyx_v_m < __pyx_t_8; __pyx_v_m++) {
+
+    /* "nfwmodeltools.pyx":346
+ *     for m from 0 <= m < nmasses:
+ * 
+ *         if mdelta[m] == 0:             # <<<<<<<<<<<<<<
+ *             continue
+ * 
+ */
+    __pyx_t_9 = __pyx_v_m;
+    __pyx_t_10 = (((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_mdelta.rcbuffer->pybuffer.buf, __pyx_t_9, __pyx_pybuffernd_mdelta.diminfo[0].strides)) == 0.0) != 0);
+    if (__pyx_t_10) {
+
+      /* "nfwmodeltools.pyx":347
+ * 
+ *         if mdelta[m] == 0:
+ *             continue             # <<<<<<<<<<<<<<
+ * 
+ *         rdelta = (3*abs(mdelta[m])/(4*massdelta*np.pi*rho_c))**(1./3.)
+ */
+      goto __pyx_L3_continue;
+
+      /* "nfwmodeltools.pyx":346
+ *     for m from 0 <= m < nmasses:
+ * 
+ *         if mdelta[m] == 0:             # <<<<<<<<<<<<<<
+ *             continue
+ * 
+ */
+    }
+
+    /* "nfwmodeltools.pyx":349
+ *             continue
+ * 
+ *         rdelta = (3*abs(mdelta[m])/(4*massdelta*np.pi*rho_c))**(1./3.)             # <<<<<<<<<<<<<<
+ *         rscale = rdelta / cdelta[m]
+ * 
+ */
+    __pyx_t_11 = __pyx_v_m;
+    __pyx_t_1 = PyFloat_FromDouble((3.0 * fabs((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_mdelta.rcbuffer->pybuffer.buf, __pyx_t_11, __pyx_pybuffernd_mdelta.diminfo[0].strides))))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 349, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyFloat_FromDouble((4.0 * __pyx_v_massdelta)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 349, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 349, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_pi); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 349, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyNumber_Multiply(__pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 349, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyFloat_FromDouble(__pyx_v_rho_c); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 349, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_2 = PyNumber_Multiply(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 349, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = __Pyx_PyNumber_Divide(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 349, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyFloat_FromDouble((1. / 3.)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 349, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_1 = PyNumber_Power(__pyx_t_4, __pyx_t_2, Py_None); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 349, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_12 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_12 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 349, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_v_rdelta = __pyx_t_12;
+
+    /* "nfwmodeltools.pyx":350
+ * 
+ *         rdelta = (3*abs(mdelta[m])/(4*massdelta*np.pi*rho_c))**(1./3.)
+ *         rscale = rdelta / cdelta[m]             # <<<<<<<<<<<<<<
+ * 
+ *         gamma_inf[m] = NFWShear(bin_r_mpc, cdelta[m], rscale, rho_c_over_sigma_c, delta = massdelta)
+ */
+    __pyx_t_13 = __pyx_v_m;
+    __pyx_t_14 = (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_cdelta.rcbuffer->pybuffer.buf, __pyx_t_13, __pyx_pybuffernd_cdelta.diminfo[0].strides));
+    if (unlikely(__pyx_t_14 == 0)) {
+      PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+      __PYX_ERR(0, 350, __pyx_L1_error)
+    }
+    __pyx_v_rscale = (__pyx_v_rdelta / __pyx_t_14);
+
+    /* "nfwmodeltools.pyx":352
+ *         rscale = rdelta / cdelta[m]
+ * 
+ *         gamma_inf[m] = NFWShear(bin_r_mpc, cdelta[m], rscale, rho_c_over_sigma_c, delta = massdelta)             # <<<<<<<<<<<<<<
+ *         kappa_inf[m] = NFWKappa(bin_r_mpc, cdelta[m], rscale, rho_c_over_sigma_c, delta = massdelta)
+ * 
+ */
+    __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_NFWShear); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 352, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_15 = __pyx_v_m;
+    __pyx_t_2 = PyFloat_FromDouble((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_cdelta.rcbuffer->pybuffer.buf, __pyx_t_15, __pyx_pybuffernd_cdelta.diminfo[0].strides))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 352, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = PyFloat_FromDouble(__pyx_v_rscale); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 352, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = PyFloat_FromDouble(__pyx_v_rho_c_over_sigma_c); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 352, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_5 = PyTuple_New(4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 352, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_INCREF(((PyObject *)__pyx_v_bin_r_mpc));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_bin_r_mpc));
+    PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_v_bin_r_mpc));
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_5, 2, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_5, 3, __pyx_t_3);
+    __pyx_t_2 = 0;
+    __pyx_t_4 = 0;
+    __pyx_t_3 = 0;
+    __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 352, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = PyFloat_FromDouble(__pyx_v_massdelta); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 352, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_delta, __pyx_t_4) < 0) __PYX_ERR(0, 352, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_5, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 352, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(__Pyx_SetItemInt(((PyObject *)__pyx_v_gamma_inf), __pyx_v_m, __pyx_t_4, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0) < 0)) __PYX_ERR(0, 352, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "nfwmodeltools.pyx":353
+ * 
+ *         gamma_inf[m] = NFWShear(bin_r_mpc, cdelta[m], rscale, rho_c_over_sigma_c, delta = massdelta)
+ *         kappa_inf[m] = NFWKappa(bin_r_mpc, cdelta[m], rscale, rho_c_over_sigma_c, delta = massdelta)             # <<<<<<<<<<<<<<
+ * 
+ *         if mdelta[m] < 0.:
+ */
+    __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_NFWKappa); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 353, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_16 = __pyx_v_m;
+    __pyx_t_3 = PyFloat_FromDouble((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_cdelta.rcbuffer->pybuffer.buf, __pyx_t_16, __pyx_pybuffernd_cdelta.diminfo[0].strides))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 353, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_5 = PyFloat_FromDouble(__pyx_v_rscale); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 353, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_1 = PyFloat_FromDouble(__pyx_v_rho_c_over_sigma_c); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 353, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 353, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF(((PyObject *)__pyx_v_bin_r_mpc));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_bin_r_mpc));
+    PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_bin_r_mpc));
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_2, 2, __pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_2, 3, __pyx_t_1);
+    __pyx_t_3 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_1 = 0;
+    __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 353, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = PyFloat_FromDouble(__pyx_v_massdelta); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 353, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_delta, __pyx_t_5) < 0) __PYX_ERR(0, 353, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_2, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 353, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (unlikely(__Pyx_SetItemInt(((PyObject *)__pyx_v_kappa_inf), __pyx_v_m, __pyx_t_5, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0) < 0)) __PYX_ERR(0, 353, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "nfwmodeltools.pyx":355
+ *         kappa_inf[m] = NFWKappa(bin_r_mpc, cdelta[m], rscale, rho_c_over_sigma_c, delta = massdelta)
+ * 
+ *         if mdelta[m] < 0.:             # <<<<<<<<<<<<<<
+ *             gamma_inf[m] = -gamma_inf[m]
+ * 
+ */
+    __pyx_t_17 = __pyx_v_m;
+    __pyx_t_10 = (((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_mdelta.rcbuffer->pybuffer.buf, __pyx_t_17, __pyx_pybuffernd_mdelta.diminfo[0].strides)) < 0.) != 0);
+    if (__pyx_t_10) {
+
+      /* "nfwmodeltools.pyx":356
+ * 
+ *         if mdelta[m] < 0.:
+ *             gamma_inf[m] = -gamma_inf[m]             # <<<<<<<<<<<<<<
+ * 
+ *     return gamma_inf, kappa_inf
+ */
+      __pyx_t_5 = __Pyx_GetItemInt(((PyObject *)__pyx_v_gamma_inf), __pyx_v_m, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 356, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_1 = PyNumber_Negative(__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 356, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(__Pyx_SetItemInt(((PyObject *)__pyx_v_gamma_inf), __pyx_v_m, __pyx_t_1, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0) < 0)) __PYX_ERR(0, 356, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+      /* "nfwmodeltools.pyx":355
+ *         kappa_inf[m] = NFWKappa(bin_r_mpc, cdelta[m], rscale, rho_c_over_sigma_c, delta = massdelta)
+ * 
+ *         if mdelta[m] < 0.:             # <<<<<<<<<<<<<<
+ *             gamma_inf[m] = -gamma_inf[m]
+ * 
+ */
+    }
+    __pyx_L3_continue:;
+  }
+
+  /* "nfwmodeltools.pyx":358
+ *             gamma_inf[m] = -gamma_inf[m]
+ * 
+ *     return gamma_inf, kappa_inf             # <<<<<<<<<<<<<<
+ * 
+ * #######################
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 358, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(((PyObject *)__pyx_v_gamma_inf));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_gamma_inf));
+  PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_v_gamma_inf));
+  __Pyx_INCREF(((PyObject *)__pyx_v_kappa_inf));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_kappa_inf));
+  PyTuple_SET_ITEM(__pyx_t_1, 1, ((PyObject *)__pyx_v_kappa_inf));
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "nfwmodeltools.pyx":324
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def nfwTemplates(np.ndarray[np.double_t, ndim=1, mode='c'] mdelta not None,             # <<<<<<<<<<<<<<
+ *                  np.ndarray[np.double_t, ndim=1, mode='c'] cdelta not None,
+ *                  np.ndarray[np.double_t, ndim=1, mode='c'] bin_r_mpc not None,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bin_r_mpc.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_cdelta.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_mdelta.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("nfwmodeltools.nfwTemplates", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bin_r_mpc.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_cdelta.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_mdelta.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_gamma_inf);
+  __Pyx_XDECREF((PyObject *)__pyx_v_kappa_inf);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nfwmodeltools.pyx":364
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def shearprofile_like_batch(np.ndarray[np.double_t, ndim=2, mode='c'] gamma_inf not None,             # <<<<<<<<<<<<<<
+ *                             np.ndarray[np.double_t, ndim=2, mode='c'] kappa_inf not None,
+ *                             np.ndarray[np.double_t, ndim=2, mode='c'] bin_shear not None,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_13nfwmodeltools_17shearprofile_like_batch(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_13nfwmodeltools_16shearprofile_like_batch[] = "Log likelihood of shearprofile_like for every (profile, model) pair, as (nprofiles x nmodels).\n\n    gamma_inf, kappa_inf are (nmodels x nbins) templates from nfwTemplates. Profile arrays are\n    (nprofiles x nbins). Bins with bin_shearerr <= 0 are empty and are skipped.";
+static PyMethodDef __pyx_mdef_13nfwmodeltools_17shearprofile_like_batch = {"shearprofile_like_batch", (PyCFunction)__pyx_pw_13nfwmodeltools_17shearprofile_like_batch, METH_VARARGS|METH_KEYWORDS, __pyx_doc_13nfwmodeltools_16shearprofile_like_batch};
+static PyObject *__pyx_pw_13nfwmodeltools_17shearprofile_like_batch(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_gamma_inf = 0;
+  PyArrayObject *__pyx_v_kappa_inf = 0;
+  PyArrayObject *__pyx_v_bin_shear = 0;
+  PyArrayObject *__pyx_v_bin_shearerr = 0;
+  PyArrayObject *__pyx_v_avebeta = 0;
+  PyArrayObject *__pyx_v_avebeta2 = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("shearprofile_like_batch (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_gamma_inf,&__pyx_n_s_kappa_inf,&__pyx_n_s_bin_shear,&__pyx_n_s_bin_shearerr,&__pyx_n_s_avebeta,&__pyx_n_s_avebeta2,0};
+    PyObject* values[6] = {0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_gamma_inf)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_kappa_inf)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like_batch", 1, 6, 6, 1); __PYX_ERR(0, 364, __pyx_L3_error)
+        }
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_bin_shear)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like_batch", 1, 6, 6, 2); __PYX_ERR(0, 364, __pyx_L3_error)
+        }
+        case  3:
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_bin_shearerr)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like_batch", 1, 6, 6, 3); __PYX_ERR(0, 364, __pyx_L3_error)
+        }
+        case  4:
+        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_avebeta)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like_batch", 1, 6, 6, 4); __PYX_ERR(0, 364, __pyx_L3_error)
+        }
+        case  5:
+        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_avebeta2)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like_batch", 1, 6, 6, 5); __PYX_ERR(0, 364, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "shearprofile_like_batch") < 0)) __PYX_ERR(0, 364, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 6) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+    }
+    __pyx_v_gamma_inf = ((PyArrayObject *)values[0]);
+    __pyx_v_kappa_inf = ((PyArrayObject *)values[1]);
+    __pyx_v_bin_shear = ((PyArrayObject *)values[2]);
+    __pyx_v_bin_shearerr = ((PyArrayObject *)values[3]);
+    __pyx_v_avebeta = ((PyArrayObject *)values[4]);
+    __pyx_v_avebeta2 = ((PyArrayObject *)values[5]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("shearprofile_like_batch", 1, 6, 6, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 364, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nfwmodeltools.shearprofile_like_batch", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_gamma_inf), __pyx_ptype_5numpy_ndarray, 0, "gamma_inf", 0))) __PYX_ERR(0, 364, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_kappa_inf), __pyx_ptype_5numpy_ndarray, 0, "kappa_inf", 0))) __PYX_ERR(0, 365, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bin_shear), __pyx_ptype_5numpy_ndarray, 0, "bin_shear", 0))) __PYX_ERR(0, 366, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bin_shearerr), __pyx_ptype_5numpy_ndarray, 0, "bin_shearerr", 0))) __PYX_ERR(0, 367, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_avebeta), __pyx_ptype_5numpy_ndarray, 0, "avebeta", 0))) __PYX_ERR(0, 368, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_avebeta2), __pyx_ptype_5numpy_ndarray, 0, "avebeta2", 0))) __PYX_ERR(0, 369, __pyx_L1_error)
+  __pyx_r = __pyx_pf_13nfwmodeltools_16shearprofile_like_batch(__pyx_self, __pyx_v_gamma_inf, __pyx_v_kappa_inf, __pyx_v_bin_shear, __pyx_v_bin_shearerr, __pyx_v_avebeta, __pyx_v_avebeta2);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_13nfwmodeltools_16shearprofile_like_batch(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_gamma_inf, PyArrayObject *__pyx_v_kappa_inf, PyArrayObject *__pyx_v_bin_shear, PyArrayObject *__pyx_v_bin_shearerr, PyArrayObject *__pyx_v_avebeta, PyArrayObject *__pyx_v_avebeta2) {
+  Py_ssize_t __pyx_v_nmodels;
+  Py_ssize_t __pyx_v_nprofiles;
+  Py_ssize_t __pyx_v_nbins;
+  PyArrayObject *__pyx_v_logProb = 0;
+  PyArrayObject *__pyx_v_betaratio = 0;
+  PyArrayObject *__pyx_v_invsig = 0;
+  Py_ssize_t __pyx_v_p;
+  Py_ssize_t __pyx_v_m;
+  Py_ssize_t __pyx_v_i;
+  double __pyx_v_norm;
+  double __pyx_v_modelg;
+  double __pyx_v_delta;
+  double __pyx_v_curlogprob;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_avebeta;
+  __Pyx_Buffer __pyx_pybuffer_avebeta;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_avebeta2;
+  __Pyx_Buffer __pyx_pybuffer_avebeta2;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_betaratio;
+  __Pyx_Buffer __pyx_pybuffer_betaratio;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_bin_shear;
+  __Pyx_Buffer __pyx_pybuffer_bin_shear;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_bin_shearerr;
+  __Pyx_Buffer __pyx_pybuffer_bin_shearerr;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_gamma_inf;
+  __Pyx_Buffer __pyx_pybuffer_gamma_inf;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_invsig;
+  __Pyx_Buffer __pyx_pybuffer_invsig;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_kappa_inf;
+  __Pyx_Buffer __pyx_pybuffer_kappa_inf;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_logProb;
+  __Pyx_Buffer __pyx_pybuffer_logProb;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyArrayObject *__pyx_t_6 = NULL;
+  PyArrayObject *__pyx_t_7 = NULL;
+  PyArrayObject *__pyx_t_8 = NULL;
+  Py_ssize_t __pyx_t_9;
+  Py_ssize_t __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  int __pyx_t_13;
+  Py_ssize_t __pyx_t_14;
+  Py_ssize_t __pyx_t_15;
+  __pyx_t_5numpy_double_t __pyx_t_16;
+  Py_ssize_t __pyx_t_17;
+  Py_ssize_t __pyx_t_18;
+  __pyx_t_5numpy_double_t __pyx_t_19;
+  Py_ssize_t __pyx_t_20;
+  Py_ssize_t __pyx_t_21;
+  Py_ssize_t __pyx_t_22;
+  Py_ssize_t __pyx_t_23;
+  Py_ssize_t __pyx_t_24;
+  Py_ssize_t __pyx_t_25;
+  double __pyx_t_26;
+  Py_ssize_t __pyx_t_27;
+  Py_ssize_t __pyx_t_28;
+  Py_ssize_t __pyx_t_29;
+  Py_ssize_t __pyx_t_30;
+  Py_ssize_t __pyx_t_31;
+  Py_ssize_t __pyx_t_32;
+  Py_ssize_t __pyx_t_33;
+  Py_ssize_t __pyx_t_34;
+  Py_ssize_t __pyx_t_35;
+  Py_ssize_t __pyx_t_36;
+  Py_ssize_t __pyx_t_37;
+  Py_ssize_t __pyx_t_38;
+  Py_ssize_t __pyx_t_39;
+  Py_ssize_t __pyx_t_40;
+  Py_ssize_t __pyx_t_41;
+  __Pyx_RefNannySetupContext("shearprofile_like_batch", 0);
+  __pyx_pybuffer_logProb.pybuffer.buf = NULL;
+  __pyx_pybuffer_logProb.refcount = 0;
+  __pyx_pybuffernd_logProb.data = NULL;
+  __pyx_pybuffernd_logProb.rcbuffer = &__pyx_pybuffer_logProb;
+  __pyx_pybuffer_betaratio.pybuffer.buf = NULL;
+  __pyx_pybuffer_betaratio.refcount = 0;
+  __pyx_pybuffernd_betaratio.data = NULL;
+  __pyx_pybuffernd_betaratio.rcbuffer = &__pyx_pybuffer_betaratio;
+  __pyx_pybuffer_invsig.pybuffer.buf = NULL;
+  __pyx_pybuffer_invsig.refcount = 0;
+  __pyx_pybuffernd_invsig.data = NULL;
+  __pyx_pybuffernd_invsig.rcbuffer = &__pyx_pybuffer_invsig;
+  __pyx_pybuffer_gamma_inf.pybuffer.buf = NULL;
+  __pyx_pybuffer_gamma_inf.refcount = 0;
+  __pyx_pybuffernd_gamma_inf.data = NULL;
+  __pyx_pybuffernd_gamma_inf.rcbuffer = &__pyx_pybuffer_gamma_inf;
+  __pyx_pybuffer_kappa_inf.pybuffer.buf = NULL;
+  __pyx_pybuffer_kappa_inf.refcount = 0;
+  __pyx_pybuffernd_kappa_inf.data = NULL;
+  __pyx_pybuffernd_kappa_inf.rcbuffer = &__pyx_pybuffer_kappa_inf;
+  __pyx_pybuffer_bin_shear.pybuffer.buf = NULL;
+  __pyx_pybuffer_bin_shear.refcount = 0;
+  __pyx_pybuffernd_bin_shear.data = NULL;
+  __pyx_pybuffernd_bin_shear.rcbuffer = &__pyx_pybuffer_bin_shear;
+  __pyx_pybuffer_bin_shearerr.pybuffer.buf = NULL;
+  __pyx_pybuffer_bin_shearerr.refcount = 0;
+  __pyx_pybuffernd_bin_shearerr.data = NULL;
+  __pyx_pybuffernd_bin_shearerr.rcbuffer = &__pyx_pybuffer_bin_shearerr;
+  __pyx_pybuffer_avebeta.pybuffer.buf = NULL;
+  __pyx_pybuffer_avebeta.refcount = 0;
+  __pyx_pybuffernd_avebeta.data = NULL;
+  __pyx_pybuffernd_avebeta.rcbuffer = &__pyx_pybuffer_avebeta;
+  __pyx_pybuffer_avebeta2.pybuffer.buf = NULL;
+  __pyx_pybuffer_avebeta2.refcount = 0;
+  __pyx_pybuffernd_avebeta2.data = NULL;
+  __pyx_pybuffernd_avebeta2.rcbuffer = &__pyx_pybuffer_avebeta2;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer, (PyObject*)__pyx_v_gamma_inf, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 364, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_gamma_inf.diminfo[0].strides = __pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_gamma_inf.diminfo[0].shape = __pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_gamma_inf.diminfo[1].strides = __pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_gamma_inf.diminfo[1].shape = __pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer, (PyObject*)__pyx_v_kappa_inf, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 364, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_kappa_inf.diminfo[0].strides = __pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_kappa_inf.diminfo[0].shape = __pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_kappa_inf.diminfo[1].strides = __pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_kappa_inf.diminfo[1].shape = __pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_bin_shear.rcbuffer->pybuffer, (PyObject*)__pyx_v_bin_shear, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 364, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_bin_shear.diminfo[0].strides = __pyx_pybuffernd_bin_shear.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_bin_shear.diminfo[0].shape = __pyx_pybuffernd_bin_shear.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_bin_shear.diminfo[1].strides = __pyx_pybuffernd_bin_shear.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_bin_shear.diminfo[1].shape = __pyx_pybuffernd_bin_shear.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer, (PyObject*)__pyx_v_bin_shearerr, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 364, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_bin_shearerr.diminfo[0].strides = __pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_bin_shearerr.diminfo[0].shape = __pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_bin_shearerr.diminfo[1].strides = __pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_bin_shearerr.diminfo[1].shape = __pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_avebeta.rcbuffer->pybuffer, (PyObject*)__pyx_v_avebeta, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 364, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_avebeta.diminfo[0].strides = __pyx_pybuffernd_avebeta.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_avebeta.diminfo[0].shape = __pyx_pybuffernd_avebeta.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_avebeta.diminfo[1].strides = __pyx_pybuffernd_avebeta.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_avebeta.diminfo[1].shape = __pyx_pybuffernd_avebeta.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_avebeta2.rcbuffer->pybuffer, (PyObject*)__pyx_v_avebeta2, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 364, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_avebeta2.diminfo[0].strides = __pyx_pybuffernd_avebeta2.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_avebeta2.diminfo[0].shape = __pyx_pybuffernd_avebeta2.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_avebeta2.diminfo[1].strides = __pyx_pybuffernd_avebeta2.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_avebeta2.diminfo[1].shape = __pyx_pybuffernd_avebeta2.rcbuffer->pybuffer.shape[1];
+
+  /* "nfwmodeltools.pyx":376
+ *     (nprofiles x nbins). Bins with bin_shearerr <= 0 are empty and are skipped.'''
+ * 
+ *     cdef Py_ssize_t nmodels = gamma_inf.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t nprofiles = bin_shear.shape[0]
+ *     cdef Py_ssize_t nbins = bin_shear.shape[1]
+ */
+  __pyx_v_nmodels = (__pyx_v_gamma_inf->dimensions[0]);
+
+  /* "nfwmodeltools.pyx":377
+ * 
+ *     cdef Py_ssize_t nmodels = gamma_inf.shape[0]
+ *     cdef Py_ssize_t nprofiles = bin_shear.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t nbins = bin_shear.shape[1]
+ * 
+ */
+  __pyx_v_nprofiles = (__pyx_v_bin_shear->dimensions[0]);
+
+  /* "nfwmodeltools.pyx":378
+ *     cdef Py_ssize_t nmodels = gamma_inf.shape[0]
+ *     cdef Py_ssize_t nprofiles = bin_shear.shape[0]
+ *     cdef Py_ssize_t nbins = bin_shear.shape[1]             # <<<<<<<<<<<<<<
+ * 
+ *     assert(gamma_inf.shape[1] == nbins)
+ */
+  __pyx_v_nbins = (__pyx_v_bin_shear->dimensions[1]);
+
+  /* "nfwmodeltools.pyx":380
+ *     cdef Py_ssize_t nbins = bin_shear.shape[1]
+ * 
+ *     assert(gamma_inf.shape[1] == nbins)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef np.ndarray[DTYPE_T, ndim=2, mode='c'] logProb = np.zeros((nprofiles, nmodels), dtype=np.float64)
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(!Py_OptimizeFlag)) {
+    if (unlikely(!(((__pyx_v_gamma_inf->dimensions[1]) == __pyx_v_nbins) != 0))) {
+      PyErr_SetNone(PyExc_AssertionError);
+      __PYX_ERR(0, 380, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "nfwmodeltools.pyx":382
+ *     assert(gamma_inf.shape[1] == nbins)
+ * 
+ *     cdef np.ndarray[DTYPE_T, ndim=2, mode='c'] logProb = np.zeros((nprofiles, nmodels), dtype=np.float64)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef np.ndarray[DTYPE_T, ndim=1, mode='c'] betaratio = np.zeros(nbins, dtype=np.float64)
+ */
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 382, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_zeros); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 382, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyInt_FromSsize_t(__pyx_v_nprofiles); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 382, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_nmodels); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 382, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 382, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_3);
+  __pyx_t_1 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 382, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = PyDict_New(); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 382, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 382, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_float64); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 382, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_5) < 0) __PYX_ERR(0, 382, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 382, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 382, __pyx_L1_error)
+  __pyx_t_6 = ((PyArrayObject *)__pyx_t_5);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_logProb.rcbuffer->pybuffer, (PyObject*)__pyx_t_6, &__Pyx_TypeInfo_nn___pyx_t_13nfwmodeltools_DTYPE_T, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS| PyBUF_WRITABLE, 2, 0, __pyx_stack) == -1)) {
+      __pyx_v_logProb = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_logProb.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 382, __pyx_L1_error)
+    } else {__pyx_pybuffernd_logProb.diminfo[0].strides = __pyx_pybuffernd_logProb.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_logProb.diminfo[0].shape = __pyx_pybuffernd_logProb.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_logProb.diminfo[1].strides = __pyx_pybuffernd_logProb.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_logProb.diminfo[1].shape = __pyx_pybuffernd_logProb.rcbuffer->pybuffer.shape[1];
+    }
+  }
+  __pyx_t_6 = 0;
+  __pyx_v_logProb = ((PyArrayObject *)__pyx_t_5);
+  __pyx_t_5 = 0;
+
+  /* "nfwmodeltools.pyx":384
+ *     cdef np.ndarray[DTYPE_T, ndim=2, mode='c'] logProb = np.zeros((nprofiles, nmodels), dtype=np.float64)
+ * 
+ *     cdef np.ndarray[DTYPE_T, ndim=1, mode='c'] betaratio = np.zeros(nbins, dtype=np.float64)             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[DTYPE_T, ndim=1, mode='c'] invsig = np.zeros(nbins, dtype=np.float64)
+ * 
+ */
+  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 384, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_zeros); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 384, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = PyInt_FromSsize_t(__pyx_v_nbins); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 384, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 384, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_5 = PyDict_New(); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 384, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 384, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_float64); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 384, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_dtype, __pyx_t_1) < 0) __PYX_ERR(0, 384, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 384, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 384, __pyx_L1_error)
+  __pyx_t_7 = ((PyArrayObject *)__pyx_t_1);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_betaratio.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_13nfwmodeltools_DTYPE_T, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_betaratio = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_betaratio.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 384, __pyx_L1_error)
+    } else {__pyx_pybuffernd_betaratio.diminfo[0].strides = __pyx_pybuffernd_betaratio.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_betaratio.diminfo[0].shape = __pyx_pybuffernd_betaratio.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_7 = 0;
+  __pyx_v_betaratio = ((PyArrayObject *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "nfwmodeltools.pyx":385
+ * 
+ *     cdef np.ndarray[DTYPE_T, ndim=1, mode='c'] betaratio = np.zeros(nbins, dtype=np.float64)
+ *     cdef np.ndarray[DTYPE_T, ndim=1, mode='c'] invsig = np.zeros(nbins, dtype=np.float64)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef Py_ssize_t p, m, i
+ */
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 385, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_zeros); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 385, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyInt_FromSsize_t(__pyx_v_nbins); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 385, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 385, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 385, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 385, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_float64); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 385, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_2) < 0) __PYX_ERR(0, 385, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 385, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 385, __pyx_L1_error)
+  __pyx_t_8 = ((PyArrayObject *)__pyx_t_2);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_invsig.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_13nfwmodeltools_DTYPE_T, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_invsig = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_invsig.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 385, __pyx_L1_error)
+    } else {__pyx_pybuffernd_invsig.diminfo[0].strides = __pyx_pybuffernd_invsig.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_invsig.diminfo[0].shape = __pyx_pybuffernd_invsig.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_8 = 0;
+  __pyx_v_invsig = ((PyArrayObject *)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "nfwmodeltools.pyx":390
+ *     cdef double norm, modelg, delta, curlogprob
+ * 
+ *     for p from 0 <= p < nprofiles:             # <<<<<<<<<<<<<<
+ * 
+ *         norm = 0.
+ */
+  __pyx_t_9 = __pyx_v_nprofiles;
+  for (__pyx_v_p = 0; __pyx_v_p < __pyx_t_9; __pyx_v_p++) {
+
+    /* "nfwmodeltools.pyx":392
+ *     for p from 0 <= p < nprofiles:
+ * 
+ *         norm = 0.             # <<<<<<<<<<<<<<
+ *         for i from 0 <= i < nbins:
+ *             if bin_shearerr[p,i] > 0:
+ */
+    __pyx_v_norm = 0.;
+
+    /* "nfwmodeltools.pyx":393
+ * 
+ *         norm = 0.
+ *         for i from 0 <= i < nbins:             # <<<<<<<<<<<<<<
+ *             if bin_shearerr[p,i] > 0:
+ *                 betaratio[i] = avebeta2[p,i]/avebeta[p,i]
+ */
+    __pyx_t_10 = __pyx_v_nbins;
+    for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_10; __pyx_v_i++) {
+
+      /* "nfwmodeltools.pyx":394
+ *         norm = 0.
+ *         for i from 0 <= i < nbins:
+ *             if bin_shearerr[p,i] > 0:             # <<<<<<<<<<<<<<
+ *                 betaratio[i] = avebeta2[p,i]/avebeta[p,i]
+ *                 invsig[i] = 1./bin_shearerr[p,i]
+ */
+      __pyx_t_11 = __pyx_v_p;
+      __pyx_t_12 = __pyx_v_i;
+      __pyx_t_13 = (((*__Pyx_BufPtrCContig2d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer.buf, __pyx_t_11, __pyx_pybuffernd_bin_shearerr.diminfo[0].strides, __pyx_t_12, __pyx_pybuffernd_bin_shearerr.diminfo[1].strides)) > 0.0) != 0);
+      if (__pyx_t_13) {
+
+        /* "nfwmodeltools.pyx":395
+ *         for i from 0 <= i < nbins:
+ *             if bin_shearerr[p,i] > 0:
+ *                 betaratio[i] = avebeta2[p,i]/avebeta[p,i]             # <<<<<<<<<<<<<<
+ *                 invsig[i] = 1./bin_shearerr[p,i]
+ *                 norm = norm - logsqrt2pi - log(bin_shearerr[p,i])
+ */
+        __pyx_t_14 = __pyx_v_p;
+        __pyx_t_15 = __pyx_v_i;
+        __pyx_t_16 = (*__Pyx_BufPtrCContig2d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_avebeta2.rcbuffer->pybuffer.buf, __pyx_t_14, __pyx_pybuffernd_avebeta2.diminfo[0].strides, __pyx_t_15, __pyx_pybuffernd_avebeta2.diminfo[1].strides));
+        __pyx_t_17 = __pyx_v_p;
+        __pyx_t_18 = __pyx_v_i;
+        __pyx_t_19 = (*__Pyx_BufPtrCContig2d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_avebeta.rcbuffer->pybuffer.buf, __pyx_t_17, __pyx_pybuffernd_avebeta.diminfo[0].strides, __pyx_t_18, __pyx_pybuffernd_avebeta.diminfo[1].strides));
+        if (unlikely(__pyx_t_19 == 0)) {
+          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+          __PYX_ERR(0, 395, __pyx_L1_error)
+        }
+        __pyx_t_20 = __pyx_v_i;
+        *__Pyx_BufPtrCContig1d(__pyx_t_13nfwmodeltools_DTYPE_T *, __pyx_pybuffernd_betaratio.rcbuffer->pybuffer.buf, __pyx_t_20, __pyx_pybuffernd_betaratio.diminfo[0].strides) = (__pyx_t_16 / __pyx_t_19);
+
+        /* "nfwmodeltools.pyx":396
+ *             if bin_shearerr[p,i] > 0:
+ *                 betaratio[i] = avebeta2[p,i]/avebeta[p,i]
+ *                 invsig[i] = 1./bin_shearerr[p,i]             # <<<<<<<<<<<<<<
+ *                 norm = norm - logsqrt2pi - log(bin_shearerr[p,i])
+ *             else:
+ */
+        __pyx_t_21 = __pyx_v_p;
+        __pyx_t_22 = __pyx_v_i;
+        __pyx_t_19 = (*__Pyx_BufPtrCContig2d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer.buf, __pyx_t_21, __pyx_pybuffernd_bin_shearerr.diminfo[0].strides, __pyx_t_22, __pyx_pybuffernd_bin_shearerr.diminfo[1].strides));
+        if (unlikely(__pyx_t_19 == 0)) {
+          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+          __PYX_ERR(0, 396, __pyx_L1_error)
+        }
+        __pyx_t_23 = __pyx_v_i;
+        *__Pyx_BufPtrCContig1d(__pyx_t_13nfwmodeltools_DTYPE_T *, __pyx_pybuffernd_invsig.rcbuffer->pybuffer.buf, __pyx_t_23, __pyx_pybuffernd_invsig.diminfo[0].strides) = (1. / __pyx_t_19);
+
+        /* "nfwmodeltools.pyx":397
+ *                 betaratio[i] = avebeta2[p,i]/avebeta[p,i]
+ *                 invsig[i] = 1./bin_shearerr[p,i]
+ *                 norm = norm - logsqrt2pi - log(bin_shearerr[p,i])             # <<<<<<<<<<<<<<
+ *             else:
+ *                 invsig[i] = 0.
+ */
+        __pyx_t_2 = PyFloat_FromDouble(__pyx_v_norm); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 397, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_logsqrt2pi); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 397, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __pyx_t_3 = PyNumber_Subtract(__pyx_t_2, __pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 397, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __pyx_t_24 = __pyx_v_p;
+        __pyx_t_25 = __pyx_v_i;
+        __pyx_t_1 = PyFloat_FromDouble(log((*__Pyx_BufPtrCContig2d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer.buf, __pyx_t_24, __pyx_pybuffernd_bin_shearerr.diminfo[0].strides, __pyx_t_25, __pyx_pybuffernd_bin_shearerr.diminfo[1].strides)))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 397, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __pyx_t_2 = PyNumber_Subtract(__pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 397, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __pyx_t_26 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_26 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 397, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __pyx_v_norm = __pyx_t_26;
+
+        /* "nfwmodeltools.pyx":394
+ *         norm = 0.
+ *         for i from 0 <= i < nbins:
+ *             if bin_shearerr[p,i] > 0:             # <<<<<<<<<<<<<<
+ *                 betaratio[i] = avebeta2[p,i]/avebeta[p,i]
+ *                 invsig[i] = 1./bin_shearerr[p,i]
+ */
+        goto __pyx_L7;
+      }
+
+      /* "nfwmodeltools.pyx":399
+ *                 norm = norm - logsqrt2pi - log(bin_shearerr[p,i])
+ *             else:
+ *                 invsig[i] = 0.             # <<<<<<<<<<<<<<
+ * 
+ *         for m from 0 <= m < nmodels:
+ */
+      /*else*/ {
+        __pyx_t_27 = __pyx_v_i;
+        *__Pyx_BufPtrCContig1d(__pyx_t_13nfwmodeltools_DTYPE_T *, __pyx_pybuffernd_invsig.rcbuffer->pybuffer.buf, __pyx_t_27, __pyx_pybuffernd_invsig.diminfo[0].strides) = 0.;
+      }
+      __pyx_L7:;
+    }
+
+    /* "nfwmodeltools.pyx":401
+ *                 invsig[i] = 0.
+ * 
+ *         for m from 0 <= m < nmodels:             # <<<<<<<<<<<<<<
+ * 
+ *             curlogprob = norm
+ */
+    __pyx_t_10 = __pyx_v_nmodels;
+    for (__pyx_v_m = 0; __pyx_v_m < __pyx_t_10; __pyx_v_m++) {
+
+      /* "nfwmodeltools.pyx":403
+ *         for m from 0 <= m < nmodels:
+ * 
+ *             curlogprob = norm             # <<<<<<<<<<<<<<
+ *             for i from 0 <= i < nbins:
+ *                 if invsig[i] == 0.:
+ */
+      __pyx_v_curlogprob = __pyx_v_norm;
+
+      /* "nfwmodeltools.pyx":404
+ * 
+ *             curlogprob = norm
+ *             for i from 0 <= i < nbins:             # <<<<<<<<<<<<<<
+ *                 if invsig[i] == 0.:
+ *                     continue
+ */
+      __pyx_t_28 = __pyx_v_nbins;
+      for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_28; __pyx_v_i++) {
+
+        /* "nfwmodeltools.pyx":405
+ *             curlogprob = norm
+ *             for i from 0 <= i < nbins:
+ *                 if invsig[i] == 0.:             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 modelg = avebeta[p,i]*gamma_inf[m,i] / (1 - betaratio[i]*kappa_inf[m,i])
+ */
+        __pyx_t_29 = __pyx_v_i;
+        __pyx_t_13 = (((*__Pyx_BufPtrCContig1d(__pyx_t_13nfwmodeltools_DTYPE_T *, __pyx_pybuffernd_invsig.rcbuffer->pybuffer.buf, __pyx_t_29, __pyx_pybuffernd_invsig.diminfo[0].strides)) == 0.) != 0);
+        if (__pyx_t_13) {
+
+          /* "nfwmodeltools.pyx":406
+ *             for i from 0 <= i < nbins:
+ *                 if invsig[i] == 0.:
+ *                     continue             # <<<<<<<<<<<<<<
+ *                 modelg = avebeta[p,i]*gamma_inf[m,i] / (1 - betaratio[i]*kappa_inf[m,i])
+ *                 delta = (bin_shear[p,i] - modelg)*invsig[i]
+ */
+          goto __pyx_L10_continue;
+
+          /* "nfwmodeltools.pyx":405
+ *             curlogprob = norm
+ *             for i from 0 <= i < nbins:
+ *                 if invsig[i] == 0.:             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 modelg = avebeta[p,i]*gamma_inf[m,i] / (1 - betaratio[i]*kappa_inf[m,i])
+ */
+        }
+
+        /* "nfwmodeltools.pyx":407
+ *                 if invsig[i] == 0.:
+ *                     continue
+ *                 modelg = avebeta[p,i]*gamma_inf[m,i] / (1 - betaratio[i]*kappa_inf[m,i])             # <<<<<<<<<<<<<<
+ *                 delta = (bin_shear[p,i] - modelg)*invsig[i]
+ *                 curlogprob = curlogprob - .5*delta*delta
+ */
+        __pyx_t_30 = __pyx_v_p;
+        __pyx_t_31 = __pyx_v_i;
+        __pyx_t_32 = __pyx_v_m;
+        __pyx_t_33 = __pyx_v_i;
+        __pyx_t_19 = ((*__Pyx_BufPtrCContig2d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_avebeta.rcbuffer->pybuffer.buf, __pyx_t_30, __pyx_pybuffernd_avebeta.diminfo[0].strides, __pyx_t_31, __pyx_pybuffernd_avebeta.diminfo[1].strides)) * (*__Pyx_BufPtrCContig2d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer.buf, __pyx_t_32, __pyx_pybuffernd_gamma_inf.diminfo[0].strides, __pyx_t_33, __pyx_pybuffernd_gamma_inf.diminfo[1].strides)));
+        __pyx_t_34 = __pyx_v_i;
+        __pyx_t_35 = __pyx_v_m;
+        __pyx_t_36 = __pyx_v_i;
+        __pyx_t_16 = (1.0 - ((*__Pyx_BufPtrCContig1d(__pyx_t_13nfwmodeltools_DTYPE_T *, __pyx_pybuffernd_betaratio.rcbuffer->pybuffer.buf, __pyx_t_34, __pyx_pybuffernd_betaratio.diminfo[0].strides)) * (*__Pyx_BufPtrCContig2d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer.buf, __pyx_t_35, __pyx_pybuffernd_kappa_inf.diminfo[0].strides, __pyx_t_36, __pyx_pybuffernd_kappa_inf.diminfo[1].strides))));
+        if (unlikely(__pyx_t_16 == 0)) {
+          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+          __PYX_ERR(0, 407, __pyx_L1_error)
+        }
+        __pyx_v_modelg = (__pyx_t_19 / __pyx_t_16);
+
+        /* "nfwmodeltools.pyx":408
+ *                     continue
+ *                 modelg = avebeta[p,i]*gamma_inf[m,i] / (1 - betaratio[i]*kappa_inf[m,i])
+ *                 delta = (bin_shear[p,i] - modelg)*invsig[i]             # <<<<<<<<<<<<<<
+ *                 curlogprob = curlogprob - .5*delta*delta
+ * 
+ */
+        __pyx_t_37 = __pyx_v_p;
+        __pyx_t_38 = __pyx_v_i;
+        __pyx_t_39 = __pyx_v_i;
+        __pyx_v_delta = (((*__Pyx_BufPtrCContig2d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_bin_shear.rcbuffer->pybuffer.buf, __pyx_t_37, __pyx_pybuffernd_bin_shear.diminfo[0].strides, __pyx_t_38, __pyx_pybuffernd_bin_shear.diminfo[1].strides)) - __pyx_v_modelg) * (*__Pyx_BufPtrCContig1d(__pyx_t_13nfwmodeltools_DTYPE_T *, __pyx_pybuffernd_invsig.rcbuffer->pybuffer.buf, __pyx_t_39, __pyx_pybuffernd_invsig.diminfo[0].strides)));
+
+        /* "nfwmodeltools.pyx":409
+ *                 modelg = avebeta[p,i]*gamma_inf[m,i] / (1 - betaratio[i]*kappa_inf[m,i])
+ *                 delta = (bin_shear[p,i] - modelg)*invsig[i]
+ *                 curlogprob = curlogprob - .5*delta*delta             # <<<<<<<<<<<<<<
+ * 
+ *             logProb[p,m] = curlogprob
+ */
+        __pyx_v_curlogprob = (__pyx_v_curlogprob - ((.5 * __pyx_v_delta) * __pyx_v_delta));
+        __pyx_L10_continue:;
+      }
+
+      /* "nfwmodeltools.pyx":411
+ *                 curlogprob = curlogprob - .5*delta*delta
+ * 
+ *             logProb[p,m] = curlogprob             # <<<<<<<<<<<<<<
+ * 
+ *     return logProb
+ */
+      __pyx_t_40 = __pyx_v_p;
+      __pyx_t_41 = __pyx_v_m;
+      *__Pyx_BufPtrCContig2d(__pyx_t_13nfwmodeltools_DTYPE_T *, __pyx_pybuffernd_logProb.rcbuffer->pybuffer.buf, __pyx_t_40, __pyx_pybuffernd_logProb.diminfo[0].strides, __pyx_t_41, __pyx_pybuffernd_logProb.diminfo[1].strides) = __pyx_v_curlogprob;
+    }
+  }
+
+  /* "nfwmodeltools.pyx":413
+ *             logProb[p,m] = curlogprob
+ * 
+ *     return logProb             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_logProb));
+  __pyx_r = ((PyObject *)__pyx_v_logProb);
+  goto __pyx_L0;
+
+  /* "nfwmodeltools.pyx":364
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def shearprofile_like_batch(np.ndarray[np.double_t, ndim=2, mode='c'] gamma_inf not None,             # <<<<<<<<<<<<<<
+ *                             np.ndarray[np.double_t, ndim=2, mode='c'] kappa_inf not None,
+ *                             np.ndarray[np.double_t, ndim=2, mode='c'] bin_shear not None,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_avebeta.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_avebeta2.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_betaratio.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bin_shear.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_invsig.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_logProb.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("nfwmodeltools.shearprofile_like_batch", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_avebeta.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_avebeta2.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_betaratio.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bin_shear.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_invsig.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_logProb.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_logProb);
+  __Pyx_XDECREF((PyObject *)__pyx_v_betaratio);
+  __Pyx_XDECREF((PyObject *)__pyx_v_invsig);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nfwmodeltools.pyx":423
+ * 
+ * @cython.cdivision(True)
+ * cdef inline void nfwProfileDerivs(double x, double * G, double * dG, double * K, double * dK) nogil:             # <<<<<<<<<<<<<<
+ *     '''Dimensionless shear G = 4E - 2Kf and convergence K = 2Kf at x = r/rs, and d/dx of both.
+ *     E = (F + ln(x/2))/x^2, Kf = (1 - F)/(x^2 - 1), with F = 2a/b sharing the atanh/atan term.'''
+ */
+
+static CYTHON_INLINE void __pyx_f_13nfwmodeltools_nfwProfileDerivs(double __pyx_v_x, double *__pyx_v_G, double *__pyx_v_dG, double *__pyx_v_K, double *__pyx_v_dK) {
+  double __pyx_v_a;
+  double __pyx_v_b;
+  double __pyx_v_F;
+  double __pyx_v_dF;
+  double __pyx_v_Kf;
+  double __pyx_v_dKf;
+  double __pyx_v_E;
+  double __pyx_v_dE;
+  double __pyx_v_e;
+  double __pyx_v_x2m1;
+  int __pyx_t_1;
+
+  /* "nfwmodeltools.pyx":428
+ * 
+ *     cdef double a, b, F, dF, Kf, dKf, E, dE
+ *     cdef double e = x - 1.             # <<<<<<<<<<<<<<
+ *     cdef double x2m1 = x*x - 1.
+ * 
+ */
+  __pyx_v_e = (__pyx_v_x - 1.);
+
+  /* "nfwmodeltools.pyx":429
+ *     cdef double a, b, F, dF, Kf, dKf, E, dE
+ *     cdef double e = x - 1.
+ *     cdef double x2m1 = x*x - 1.             # <<<<<<<<<<<<<<
+ * 
+ *     if fabs(e) < 1e-4:
+ */
+  __pyx_v_x2m1 = ((__pyx_v_x * __pyx_v_x) - 1.);
+
+  /* "nfwmodeltools.pyx":431
+ *     cdef double x2m1 = x*x - 1.
+ * 
+ *     if fabs(e) < 1e-4:             # <<<<<<<<<<<<<<
+ *         #series about x = 1
+ *         F = 1. - 2.*e/3. + 7.*e*e/15.
+ */
+  __pyx_t_1 = ((fabs(__pyx_v_e) < 1e-4) != 0);
+  if (__pyx_t_1) {
+
+    /* "nfwmodeltools.pyx":433
+ *     if fabs(e) < 1e-4:
+ *         #series about x = 1
+ *         F = 1. - 2.*e/3. + 7.*e*e/15.             # <<<<<<<<<<<<<<
+ *         dF = -2./3. + 14.*e/15.
+ *         Kf = 1./3. - 0.4*e
+ */
+    __pyx_v_F = ((1. - ((2. * __pyx_v_e) / 3.)) + (((7. * __pyx_v_e) * __pyx_v_e) / 15.));
+
+    /* "nfwmodeltools.pyx":434
+ *         #series about x = 1
+ *         F = 1. - 2.*e/3. + 7.*e*e/15.
+ *         dF = -2./3. + 14.*e/15.             # <<<<<<<<<<<<<<
+ *         Kf = 1./3. - 0.4*e
+ *         dKf = -0.4
+ */
+    __pyx_v_dF = ((-2. / 3.) + ((14. * __pyx_v_e) / 15.));
+
+    /* "nfwmodeltools.pyx":435
+ *         F = 1. - 2.*e/3. + 7.*e*e/15.
+ *         dF = -2./3. + 14.*e/15.
+ *         Kf = 1./3. - 0.4*e             # <<<<<<<<<<<<<<
+ *         dKf = -0.4
+ *     else:
+ */
+    __pyx_v_Kf = ((1. / 3.) - (0.4 * __pyx_v_e));
+
+    /* "nfwmodeltools.pyx":436
+ *         dF = -2./3. + 14.*e/15.
+ *         Kf = 1./3. - 0.4*e
+ *         dKf = -0.4             # <<<<<<<<<<<<<<
+ *     else:
+ *         if x < 1:
+ */
+    __pyx_v_dKf = -0.4;
+
+    /* "nfwmodeltools.pyx":431
+ *     cdef double x2m1 = x*x - 1.
+ * 
+ *     if fabs(e) < 1e-4:             # <<<<<<<<<<<<<<
+ *         #series about x = 1
+ *         F = 1. - 2.*e/3. + 7.*e*e/15.
+ */
+    goto __pyx_L3;
+  }
+
+  /* "nfwmodeltools.pyx":438
+ *         dKf = -0.4
+ *     else:
+ *         if x < 1:             # <<<<<<<<<<<<<<
+ *             a = atanh(sqrt((1-x)/(1+x)))
+ *             b = sqrt(1-x*x)
+ */
+  /*else*/ {
+    __pyx_t_1 = ((__pyx_v_x < 1.0) != 0);
+    if (__pyx_t_1) {
+
+      /* "nfwmodeltools.pyx":439
+ *     else:
+ *         if x < 1:
+ *             a = atanh(sqrt((1-x)/(1+x)))             # <<<<<<<<<<<<<<
+ *             b = sqrt(1-x*x)
+ *         else:
+ */
+      __pyx_v_a = atanh(sqrt(((1.0 - __pyx_v_x) / (1.0 + __pyx_v_x))));
+
+      /* "nfwmodeltools.pyx":440
+ *         if x < 1:
+ *             a = atanh(sqrt((1-x)/(1+x)))
+ *             b = sqrt(1-x*x)             # <<<<<<<<<<<<<<
+ *         else:
+ *             a = atan(sqrt((x-1)/(1+x)))
+ */
+      __pyx_v_b = sqrt((1.0 - (__pyx_v_x * __pyx_v_x)));
+
+      /* "nfwmodeltools.pyx":438
+ *         dKf = -0.4
+ *     else:
+ *         if x < 1:             # <<<<<<<<<<<<<<
+ *             a = atanh(sqrt((1-x)/(1+x)))
+ *             b = sqrt(1-x*x)
+ */
+      goto __pyx_L4;
+    }
+
+    /* "nfwmodeltools.pyx":442
+ *             b = sqrt(1-x*x)
+ *         else:
+ *             a = atan(sqrt((x-1)/(1+x)))             # <<<<<<<<<<<<<<
+ *             b = sqrt(x*x-1)
+ *         F = 2*a/b
+ */
+    /*else*/ {
+      __pyx_v_a = atan(sqrt(((__pyx_v_x - 1.0) / (1.0 + __pyx_v_x))));
+
+      /* "nfwmodeltools.pyx":443
+ *         else:
+ *             a = atan(sqrt((x-1)/(1+x)))
+ *             b = sqrt(x*x-1)             # <<<<<<<<<<<<<<
+ *         F = 2*a/b
+ *         dF = (1. - x*x*F)/(x*x2m1)
+ */
+      __pyx_v_b = sqrt(((__pyx_v_x * __pyx_v_x) - 1.0));
+    }
+    __pyx_L4:;
+
+    /* "nfwmodeltools.pyx":444
+ *             a = atan(sqrt((x-1)/(1+x)))
+ *             b = sqrt(x*x-1)
+ *         F = 2*a/b             # <<<<<<<<<<<<<<
+ *         dF = (1. - x*x*F)/(x*x2m1)
+ *         Kf = (1. - F)/x2m1
+ */
+    __pyx_v_F = ((2.0 * __pyx_v_a) / __pyx_v_b);
+
+    /* "nfwmodeltools.pyx":445
+ *             b = sqrt(x*x-1)
+ *         F = 2*a/b
+ *         dF = (1. - x*x*F)/(x*x2m1)             # <<<<<<<<<<<<<<
+ *         Kf = (1. - F)/x2m1
+ *         dKf = (-dF*x2m1 - 2.*x*(1. - F))/(x2m1*x2m1)
+ */
+    __pyx_v_dF = ((1. - ((__pyx_v_x * __pyx_v_x) * __pyx_v_F)) / (__pyx_v_x * __pyx_v_x2m1));
+
+    /* "nfwmodeltools.pyx":446
+ *         F = 2*a/b
+ *         dF = (1. - x*x*F)/(x*x2m1)
+ *         Kf = (1. - F)/x2m1             # <<<<<<<<<<<<<<
+ *         dKf = (-dF*x2m1 - 2.*x*(1. - F))/(x2m1*x2m1)
+ * 
+ */
+    __pyx_v_Kf = ((1. - __pyx_v_F) / __pyx_v_x2m1);
+
+    /* "nfwmodeltools.pyx":447
+ *         dF = (1. - x*x*F)/(x*x2m1)
+ *         Kf = (1. - F)/x2m1
+ *         dKf = (-dF*x2m1 - 2.*x*(1. - F))/(x2m1*x2m1)             # <<<<<<<<<<<<<<
+ * 
+ *     E = (F + log(x/2.))/(x*x)
+ */
+    __pyx_v_dKf = ((((-__pyx_v_dF) * __pyx_v_x2m1) - ((2. * __pyx_v_x) * (1. - __pyx_v_F))) / (__pyx_v_x2m1 * __pyx_v_x2m1));
+  }
+  __pyx_L3:;
+
+  /* "nfwmodeltools.pyx":449
+ *         dKf = (-dF*x2m1 - 2.*x*(1. - F))/(x2m1*x2m1)
+ * 
+ *     E = (F + log(x/2.))/(x*x)             # <<<<<<<<<<<<<<
+ *     dE = (dF + 1./x)/(x*x) - 2.*E/x
+ * 
+ */
+  __pyx_v_E = ((__pyx_v_F + log((__pyx_v_x / 2.))) / (__pyx_v_x * __pyx_v_x));
+
+  /* "nfwmodeltools.pyx":450
+ * 
+ *     E = (F + log(x/2.))/(x*x)
+ *     dE = (dF + 1./x)/(x*x) - 2.*E/x             # <<<<<<<<<<<<<<
+ * 
+ *     G[0] = 4.*E - 2.*Kf
+ */
+  __pyx_v_dE = (((__pyx_v_dF + (1. / __pyx_v_x)) / (__pyx_v_x * __pyx_v_x)) - ((2. * __pyx_v_E) / __pyx_v_x));
+
+  /* "nfwmodeltools.pyx":452
+ *     dE = (dF + 1./x)/(x*x) - 2.*E/x
+ * 
+ *     G[0] = 4.*E - 2.*Kf             # <<<<<<<<<<<<<<
+ *     dG[0] = 4.*dE - 2.*dKf
+ *     K[0] = 2.*Kf
+ */
+  (__pyx_v_G[0]) = ((4. * __pyx_v_E) - (2. * __pyx_v_Kf));
+
+  /* "nfwmodeltools.pyx":453
+ * 
+ *     G[0] = 4.*E - 2.*Kf
+ *     dG[0] = 4.*dE - 2.*dKf             # <<<<<<<<<<<<<<
+ *     K[0] = 2.*Kf
+ *     dK[0] = 2.*dKf
+ */
+  (__pyx_v_dG[0]) = ((4. * __pyx_v_dE) - (2. * __pyx_v_dKf));
+
+  /* "nfwmodeltools.pyx":454
+ *     G[0] = 4.*E - 2.*Kf
+ *     dG[0] = 4.*dE - 2.*dKf
+ *     K[0] = 2.*Kf             # <<<<<<<<<<<<<<
+ *     dK[0] = 2.*dKf
+ * 
+ */
+  (__pyx_v_K[0]) = (2. * __pyx_v_Kf);
+
+  /* "nfwmodeltools.pyx":455
+ *     dG[0] = 4.*dE - 2.*dKf
+ *     K[0] = 2.*Kf
+ *     dK[0] = 2.*dKf             # <<<<<<<<<<<<<<
+ * 
+ * ###
+ */
+  (__pyx_v_dK[0]) = (2. * __pyx_v_dKf);
+
+  /* "nfwmodeltools.pyx":423
+ * 
+ * @cython.cdivision(True)
+ * cdef inline void nfwProfileDerivs(double x, double * G, double * dG, double * K, double * dK) nogil:             # <<<<<<<<<<<<<<
+ *     '''Dimensionless shear G = 4E - 2Kf and convergence K = 2Kf at x = r/rs, and d/dx of both.
+ *     E = (F + ln(x/2))/x^2, Kf = (1 - F)/(x^2 - 1), with F = 2a/b sharing the atanh/atan term.'''
+ */
+
+  /* function exit code */
+}
+
+/* "nfwmodeltools.pyx":462
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def shearprofile_like_grad(double mdelta,             # <<<<<<<<<<<<<<
+ *                            double cdelta,
+ *                            np.ndarray[np.double_t, ndim=1, mode='c'] bin_r_mpc not None,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_13nfwmodeltools_19shearprofile_like_grad(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_13nfwmodeltools_18shearprofile_like_grad[] = "shearprofile_like, its gradient with respect to (log mdelta, cdelta), and the Fisher matrix\n    (the expected value of minus the Hessian) in the same parameters. mdelta must be positive.\n\n    Returns (logProb, grad, fisher).";
+static PyMethodDef __pyx_mdef_13nfwmodeltools_19shearprofile_like_grad = {"shearprofile_like_grad", (PyCFunction)__pyx_pw_13nfwmodeltools_19shearprofile_like_grad, METH_VARARGS|METH_KEYWORDS, __pyx_doc_13nfwmodeltools_18shearprofile_like_grad};
+static PyObject *__pyx_pw_13nfwmodeltools_19shearprofile_like_grad(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  double __pyx_v_mdelta;
+  double __pyx_v_cdelta;
+  PyArrayObject *__pyx_v_bin_r_mpc = 0;
+  PyArrayObject *__pyx_v_bin_shear = 0;
+  PyArrayObject *__pyx_v_bin_shearerr = 0;
+  PyArrayObject *__pyx_v_avebeta = 0;
+  PyArrayObject *__pyx_v_avebeta2 = 0;
+  double __pyx_v_rho_c;
+  double __pyx_v_rho_c_over_sigma_c;
+  double __pyx_v_massdelta;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("shearprofile_like_grad (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_mdelta,&__pyx_n_s_cdelta,&__pyx_n_s_bin_r_mpc,&__pyx_n_s_bin_shear,&__pyx_n_s_bin_shearerr,&__pyx_n_s_avebeta,&__pyx_n_s_avebeta2,&__pyx_n_s_rho_c,&__pyx_n_s_rho_c_over_sigma_c,&__pyx_n_s_massdelta,0};
+    PyObject* values[10] = {0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_mdelta)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_cdelta)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like_grad", 1, 10, 10, 1); __PYX_ERR(0, 462, __pyx_L3_error)
+        }
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_bin_r_mpc)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like_grad", 1, 10, 10, 2); __PYX_ERR(0, 462, __pyx_L3_error)
+        }
+        case  3:
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_bin_shear)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like_grad", 1, 10, 10, 3); __PYX_ERR(0, 462, __pyx_L3_error)
+        }
+        case  4:
+        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_bin_shearerr)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like_grad", 1, 10, 10, 4); __PYX_ERR(0, 462, __pyx_L3_error)
+        }
+        case  5:
+        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_avebeta)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like_grad", 1, 10, 10, 5); __PYX_ERR(0, 462, __pyx_L3_error)
+        }
+        case  6:
+        if (likely((values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_avebeta2)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like_grad", 1, 10, 10, 6); __PYX_ERR(0, 462, __pyx_L3_error)
+        }
+        case  7:
+        if (likely((values[7] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_rho_c)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like_grad", 1, 10, 10, 7); __PYX_ERR(0, 462, __pyx_L3_error)
+        }
+        case  8:
+        if (likely((values[8] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_rho_c_over_sigma_c)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like_grad", 1, 10, 10, 8); __PYX_ERR(0, 462, __pyx_L3_error)
+        }
+        case  9:
+        if (likely((values[9] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_massdelta)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like_grad", 1, 10, 10, 9); __PYX_ERR(0, 462, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "shearprofile_like_grad") < 0)) __PYX_ERR(0, 462, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 10) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+    }
+    __pyx_v_mdelta = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_mdelta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 462, __pyx_L3_error)
+    __pyx_v_cdelta = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_cdelta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 463, __pyx_L3_error)
+    __pyx_v_bin_r_mpc = ((PyArrayObject *)values[2]);
+    __pyx_v_bin_shear = ((PyArrayObject *)values[3]);
+    __pyx_v_bin_shearerr = ((PyArrayObject *)values[4]);
+    __pyx_v_avebeta = ((PyArrayObject *)values[5]);
+    __pyx_v_avebeta2 = ((PyArrayObject *)values[6]);
+    __pyx_v_rho_c = __pyx_PyFloat_AsDouble(values[7]); if (unlikely((__pyx_v_rho_c == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 469, __pyx_L3_error)
+    __pyx_v_rho_c_over_sigma_c = __pyx_PyFloat_AsDouble(values[8]); if (unlikely((__pyx_v_rho_c_over_sigma_c == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 470, __pyx_L3_error)
+    __pyx_v_massdelta = __pyx_PyFloat_AsDouble(values[9]); if (unlikely((__pyx_v_massdelta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 471, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("shearprofile_like_grad", 1, 10, 10, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 462, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nfwmodeltools.shearprofile_like_grad", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bin_r_mpc), __pyx_ptype_5numpy_ndarray, 0, "bin_r_mpc", 0))) __PYX_ERR(0, 464, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bin_shear), __pyx_ptype_5numpy_ndarray, 0, "bin_shear", 0))) __PYX_ERR(0, 465, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bin_shearerr), __pyx_ptype_5numpy_ndarray, 0, "bin_shearerr", 0))) __PYX_ERR(0, 466, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_avebeta), __pyx_ptype_5numpy_ndarray, 0, "avebeta", 0))) __PYX_ERR(0, 467, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_avebeta2), __pyx_ptype_5numpy_ndarray, 0, "avebeta2", 0))) __PYX_ERR(0, 468, __pyx_L1_error)
+  __pyx_r = __pyx_pf_13nfwmodeltools_18shearprofile_like_grad(__pyx_self, __pyx_v_mdelta, __pyx_v_cdelta, __pyx_v_bin_r_mpc, __pyx_v_bin_shear, __pyx_v_bin_shearerr, __pyx_v_avebeta, __pyx_v_avebeta2, __pyx_v_rho_c, __pyx_v_rho_c_over_sigma_c, __pyx_v_massdelta);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_13nfwmodeltools_18shearprofile_like_grad(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_mdelta, double __pyx_v_cdelta, PyArrayObject *__pyx_v_bin_r_mpc, PyArrayObject *__pyx_v_bin_shear, PyArrayObject *__pyx_v_bin_shearerr, PyArrayObject *__pyx_v_avebeta, PyArrayObject *__pyx_v_avebeta2, double __pyx_v_rho_c, double __pyx_v_rho_c_over_sigma_c, double __pyx_v_massdelta) {
+  Py_ssize_t __pyx_v_nbins;
+  double __pyx_v_rdelta;
+  double __pyx_v_rs;
+  double __pyx_v_mc;
+  double __pyx_v_ks;
+  double __pyx_v_dlnks_dlnm;
+  double __pyx_v_dlnks_dc;
+  double __pyx_v_dlnx_dlnm;
+  double __pyx_v_dlnx_dc;
+  double __pyx_v_logProb;
+  double __pyx_v_grad0;
+  double __pyx_v_grad1;
+  double __pyx_v_fisher00;
+  double __pyx_v_fisher01;
+  double __pyx_v_fisher11;
+  Py_ssize_t __pyx_v_i;
+  double __pyx_v_x;
+  double __pyx_v_G;
+  double __pyx_v_dG;
+  double __pyx_v_K;
+  double __pyx_v_dK;
+  double __pyx_v_gamma;
+  double __pyx_v_kappa;
+  double __pyx_v_dgamma0;
+  double __pyx_v_dgamma1;
+  double __pyx_v_dkappa0;
+  double __pyx_v_dkappa1;
+  double __pyx_v_betaratio;
+  double __pyx_v_denom;
+  double __pyx_v_modelg;
+  double __pyx_v_dg0;
+  double __pyx_v_dg1;
+  double __pyx_v_invvar;
+  double __pyx_v_resid;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_avebeta;
+  __Pyx_Buffer __pyx_pybuffer_avebeta;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_avebeta2;
+  __Pyx_Buffer __pyx_pybuffer_avebeta2;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_bin_r_mpc;
+  __Pyx_Buffer __pyx_pybuffer_bin_r_mpc;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_bin_shear;
+  __Pyx_Buffer __pyx_pybuffer_bin_shear;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_bin_shearerr;
+  __Pyx_Buffer __pyx_pybuffer_bin_shearerr;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  double __pyx_t_6;
+  struct __pyx_opt_args_13nfwmodeltools_deltaC __pyx_t_7;
+  Py_ssize_t __pyx_t_8;
+  Py_ssize_t __pyx_t_9;
+  Py_ssize_t __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  Py_ssize_t __pyx_t_13;
+  Py_ssize_t __pyx_t_14;
+  Py_ssize_t __pyx_t_15;
+  Py_ssize_t __pyx_t_16;
+  Py_ssize_t __pyx_t_17;
+  Py_ssize_t __pyx_t_18;
+  PyObject *__pyx_t_19 = NULL;
+  PyObject *__pyx_t_20 = NULL;
+  PyObject *__pyx_t_21 = NULL;
+  PyObject *__pyx_t_22 = NULL;
+  __Pyx_RefNannySetupContext("shearprofile_like_grad", 0);
+  __pyx_pybuffer_bin_r_mpc.pybuffer.buf = NULL;
+  __pyx_pybuffer_bin_r_mpc.refcount = 0;
+  __pyx_pybuffernd_bin_r_mpc.data = NULL;
+  __pyx_pybuffernd_bin_r_mpc.rcbuffer = &__pyx_pybuffer_bin_r_mpc;
+  __pyx_pybuffer_bin_shear.pybuffer.buf = NULL;
+  __pyx_pybuffer_bin_shear.refcount = 0;
+  __pyx_pybuffernd_bin_shear.data = NULL;
+  __pyx_pybuffernd_bin_shear.rcbuffer = &__pyx_pybuffer_bin_shear;
+  __pyx_pybuffer_bin_shearerr.pybuffer.buf = NULL;
+  __pyx_pybuffer_bin_shearerr.refcount = 0;
+  __pyx_pybuffernd_bin_shearerr.data = NULL;
+  __pyx_pybuffernd_bin_shearerr.rcbuffer = &__pyx_pybuffer_bin_shearerr;
+  __pyx_pybuffer_avebeta.pybuffer.buf = NULL;
+  __pyx_pybuffer_avebeta.refcount = 0;
+  __pyx_pybuffernd_avebeta.data = NULL;
+  __pyx_pybuffernd_avebeta.rcbuffer = &__pyx_pybuffer_avebeta;
+  __pyx_pybuffer_avebeta2.pybuffer.buf = NULL;
+  __pyx_pybuffer_avebeta2.refcount = 0;
+  __pyx_pybuffernd_avebeta2.data = NULL;
+  __pyx_pybuffernd_avebeta2.rcbuffer = &__pyx_pybuffer_avebeta2;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_bin_r_mpc.rcbuffer->pybuffer, (PyObject*)__pyx_v_bin_r_mpc, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 462, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_bin_r_mpc.diminfo[0].strides = __pyx_pybuffernd_bin_r_mpc.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_bin_r_mpc.diminfo[0].shape = __pyx_pybuffernd_bin_r_mpc.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_bin_shear.rcbuffer->pybuffer, (PyObject*)__pyx_v_bin_shear, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 462, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_bin_shear.diminfo[0].strides = __pyx_pybuffernd_bin_shear.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_bin_shear.diminfo[0].shape = __pyx_pybuffernd_bin_shear.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer, (PyObject*)__pyx_v_bin_shearerr, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 462, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_bin_shearerr.diminfo[0].strides = __pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_bin_shearerr.diminfo[0].shape = __pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_avebeta.rcbuffer->pybuffer, (PyObject*)__pyx_v_avebeta, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 462, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_avebeta.diminfo[0].strides = __pyx_pybuffernd_avebeta.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_avebeta.diminfo[0].shape = __pyx_pybuffernd_avebeta.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_avebeta2.rcbuffer->pybuffer, (PyObject*)__pyx_v_avebeta2, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 462, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_avebeta2.diminfo[0].strides = __pyx_pybuffernd_avebeta2.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_avebeta2.diminfo[0].shape = __pyx_pybuffernd_avebeta2.rcbuffer->pybuffer.shape[0];
+
+  /* "nfwmodeltools.pyx":478
+ *     Returns (logProb, grad, fisher).'''
+ * 
+ *     if mdelta <= 0:             # <<<<<<<<<<<<<<
+ *         raise ValueError('mdelta must be positive')
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_mdelta <= 0.0) != 0);
+  if (__pyx_t_1) {
+
+    /* "nfwmodeltools.pyx":479
+ * 
+ *     if mdelta <= 0:
+ *         raise ValueError('mdelta must be positive')             # <<<<<<<<<<<<<<
+ * 
+ *     cdef Py_ssize_t nbins = bin_r_mpc.shape[0]
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 479, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 479, __pyx_L1_error)
+
+    /* "nfwmodeltools.pyx":478
+ *     Returns (logProb, grad, fisher).'''
+ * 
+ *     if mdelta <= 0:             # <<<<<<<<<<<<<<
+ *         raise ValueError('mdelta must be positive')
+ * 
+ */
+  }
+
+  /* "nfwmodeltools.pyx":481
+ *         raise ValueError('mdelta must be positive')
+ * 
+ *     cdef Py_ssize_t nbins = bin_r_mpc.shape[0]             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double rdelta = (3*mdelta/(4*massdelta*np.pi*rho_c))**(1./3.)
+ */
+  __pyx_v_nbins = (__pyx_v_bin_r_mpc->dimensions[0]);
+
+  /* "nfwmodeltools.pyx":483
+ *     cdef Py_ssize_t nbins = bin_r_mpc.shape[0]
+ * 
+ *     cdef double rdelta = (3*mdelta/(4*massdelta*np.pi*rho_c))**(1./3.)             # <<<<<<<<<<<<<<
+ *     cdef double rs = rdelta / cdelta
+ *     cdef double mc = log(1. + cdelta) - cdelta/(1. + cdelta)
+ */
+  __pyx_t_2 = PyFloat_FromDouble((3.0 * __pyx_v_mdelta)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 483, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyFloat_FromDouble((4.0 * __pyx_v_massdelta)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 483, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 483, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_pi); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 483, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = PyNumber_Multiply(__pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 483, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_rho_c); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 483, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_3 = PyNumber_Multiply(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 483, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyNumber_Divide(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 483, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyFloat_FromDouble((1. / 3.)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 483, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = PyNumber_Power(__pyx_t_5, __pyx_t_3, Py_None); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 483, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_6 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 483, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_rdelta = __pyx_t_6;
+
+  /* "nfwmodeltools.pyx":484
+ * 
+ *     cdef double rdelta = (3*mdelta/(4*massdelta*np.pi*rho_c))**(1./3.)
+ *     cdef double rs = rdelta / cdelta             # <<<<<<<<<<<<<<
+ *     cdef double mc = log(1. + cdelta) - cdelta/(1. + cdelta)
+ *     cdef double ks = rs*deltaC(cdelta, delta = massdelta)*rho_c_over_sigma_c
+ */
+  __pyx_v_rs = (__pyx_v_rdelta / __pyx_v_cdelta);
+
+  /* "nfwmodeltools.pyx":485
+ *     cdef double rdelta = (3*mdelta/(4*massdelta*np.pi*rho_c))**(1./3.)
+ *     cdef double rs = rdelta / cdelta
+ *     cdef double mc = log(1. + cdelta) - cdelta/(1. + cdelta)             # <<<<<<<<<<<<<<
+ *     cdef double ks = rs*deltaC(cdelta, delta = massdelta)*rho_c_over_sigma_c
+ * 
+ */
+  __pyx_v_mc = (log((1. + __pyx_v_cdelta)) - (__pyx_v_cdelta / (1. + __pyx_v_cdelta)));
+
+  /* "nfwmodeltools.pyx":486
+ *     cdef double rs = rdelta / cdelta
+ *     cdef double mc = log(1. + cdelta) - cdelta/(1. + cdelta)
+ *     cdef double ks = rs*deltaC(cdelta, delta = massdelta)*rho_c_over_sigma_c             # <<<<<<<<<<<<<<
+ * 
+ *     #d ln ks and d ln x with respect to (ln M, c)
+ */
+  __pyx_t_7.__pyx_n = 1;
+  __pyx_t_7.delta = __pyx_v_massdelta;
+  __pyx_t_6 = __pyx_f_13nfwmodeltools_deltaC(__pyx_v_cdelta, &__pyx_t_7); 
+  __pyx_v_ks = ((__pyx_v_rs * __pyx_t_6) * __pyx_v_rho_c_over_sigma_c);
+
+  /* "nfwmodeltools.pyx":489
+ * 
+ *     #d ln ks and d ln x with respect to (ln M, c)
+ *     cdef double dlnks_dlnm = 1./3.             # <<<<<<<<<<<<<<
+ *     cdef double dlnks_dc = 2./cdelta - (cdelta/((1. + cdelta)*(1. + cdelta)))/mc
+ *     cdef double dlnx_dlnm = -1./3.
+ */
+  __pyx_v_dlnks_dlnm = (1. / 3.);
+
+  /* "nfwmodeltools.pyx":490
+ *     #d ln ks and d ln x with respect to (ln M, c)
+ *     cdef double dlnks_dlnm = 1./3.
+ *     cdef double dlnks_dc = 2./cdelta - (cdelta/((1. + cdelta)*(1. + cdelta)))/mc             # <<<<<<<<<<<<<<
+ *     cdef double dlnx_dlnm = -1./3.
+ *     cdef double dlnx_dc = 1./cdelta
+ */
+  __pyx_v_dlnks_dc = ((2. / __pyx_v_cdelta) - ((__pyx_v_cdelta / ((1. + __pyx_v_cdelta) * (1. + __pyx_v_cdelta))) / __pyx_v_mc));
+
+  /* "nfwmodeltools.pyx":491
+ *     cdef double dlnks_dlnm = 1./3.
+ *     cdef double dlnks_dc = 2./cdelta - (cdelta/((1. + cdelta)*(1. + cdelta)))/mc
+ *     cdef double dlnx_dlnm = -1./3.             # <<<<<<<<<<<<<<
+ *     cdef double dlnx_dc = 1./cdelta
+ * 
+ */
+  __pyx_v_dlnx_dlnm = (-1. / 3.);
+
+  /* "nfwmodeltools.pyx":492
+ *     cdef double dlnks_dc = 2./cdelta - (cdelta/((1. + cdelta)*(1. + cdelta)))/mc
+ *     cdef double dlnx_dlnm = -1./3.
+ *     cdef double dlnx_dc = 1./cdelta             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double logProb = 0.
+ */
+  __pyx_v_dlnx_dc = (1. / __pyx_v_cdelta);
+
+  /* "nfwmodeltools.pyx":494
+ *     cdef double dlnx_dc = 1./cdelta
+ * 
+ *     cdef double logProb = 0.             # <<<<<<<<<<<<<<
+ *     cdef double grad0 = 0., grad1 = 0.
+ *     cdef double fisher00 = 0., fisher01 = 0., fisher11 = 0.
+ */
+  __pyx_v_logProb = 0.;
+
+  /* "nfwmodeltools.pyx":495
+ * 
+ *     cdef double logProb = 0.
+ *     cdef double grad0 = 0., grad1 = 0.             # <<<<<<<<<<<<<<
+ *     cdef double fisher00 = 0., fisher01 = 0., fisher11 = 0.
+ * 
+ */
+  __pyx_v_grad0 = 0.;
+  __pyx_v_grad1 = 0.;
+
+  /* "nfwmodeltools.pyx":496
+ *     cdef double logProb = 0.
+ *     cdef double grad0 = 0., grad1 = 0.
+ *     cdef double fisher00 = 0., fisher01 = 0., fisher11 = 0.             # <<<<<<<<<<<<<<
+ * 
+ *     cdef Py_ssize_t i
+ */
+  __pyx_v_fisher00 = 0.;
+  __pyx_v_fisher01 = 0.;
+  __pyx_v_fisher11 = 0.;
+
+  /* "nfwmodeltools.pyx":503
+ *     cdef double betaratio, denom, modelg, dg0, dg1, invvar, resid
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i from 0 <= i < nbins:
+ * 
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "nfwmodeltools.pyx":504
+ * 
+ *     with nogil:
+ *         for i from 0 <= i < nbins:             # <<<<<<<<<<<<<<
+ * 
+ *             x = bin_r_mpc[i]/rs
+ */
+        __pyx_t_8 = __pyx_v_nbins;
+        for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_8; __pyx_v_i++) {
+
+          /* "nfwmodeltools.pyx":506
+ *         for i from 0 <= i < nbins:
+ * 
+ *             x = bin_r_mpc[i]/rs             # <<<<<<<<<<<<<<
+ *             nfwProfileDerivs(x, &G, &dG, &K, &dK)
+ * 
+ */
+          __pyx_t_9 = __pyx_v_i;
+          __pyx_v_x = ((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_bin_r_mpc.rcbuffer->pybuffer.buf, __pyx_t_9, __pyx_pybuffernd_bin_r_mpc.diminfo[0].strides)) / __pyx_v_rs);
+
+          /* "nfwmodeltools.pyx":507
+ * 
+ *             x = bin_r_mpc[i]/rs
+ *             nfwProfileDerivs(x, &G, &dG, &K, &dK)             # <<<<<<<<<<<<<<
+ * 
+ *             gamma = ks*G
+ */
+          __pyx_f_13nfwmodeltools_nfwProfileDerivs(__pyx_v_x, (&__pyx_v_G), (&__pyx_v_dG), (&__pyx_v_K), (&__pyx_v_dK));
+
+          /* "nfwmodeltools.pyx":509
+ *             nfwProfileDerivs(x, &G, &dG, &K, &dK)
+ * 
+ *             gamma = ks*G             # <<<<<<<<<<<<<<
+ *             kappa = ks*K
+ *             dgamma0 = dlnks_dlnm*gamma + dlnx_dlnm*ks*x*dG
+ */
+          __pyx_v_gamma = (__pyx_v_ks * __pyx_v_G);
+
+          /* "nfwmodeltools.pyx":510
+ * 
+ *             gamma = ks*G
+ *             kappa = ks*K             # <<<<<<<<<<<<<<
+ *             dgamma0 = dlnks_dlnm*gamma + dlnx_dlnm*ks*x*dG
+ *             dgamma1 = dlnks_dc*gamma + dlnx_dc*ks*x*dG
+ */
+          __pyx_v_kappa = (__pyx_v_ks * __pyx_v_K);
+
+          /* "nfwmodeltools.pyx":511
+ *             gamma = ks*G
+ *             kappa = ks*K
+ *             dgamma0 = dlnks_dlnm*gamma + dlnx_dlnm*ks*x*dG             # <<<<<<<<<<<<<<
+ *             dgamma1 = dlnks_dc*gamma + dlnx_dc*ks*x*dG
+ *             dkappa0 = dlnks_dlnm*kappa + dlnx_dlnm*ks*x*dK
+ */
+          __pyx_v_dgamma0 = ((__pyx_v_dlnks_dlnm * __pyx_v_gamma) + (((__pyx_v_dlnx_dlnm * __pyx_v_ks) * __pyx_v_x) * __pyx_v_dG));
+
+          /* "nfwmodeltools.pyx":512
+ *             kappa = ks*K
+ *             dgamma0 = dlnks_dlnm*gamma + dlnx_dlnm*ks*x*dG
+ *             dgamma1 = dlnks_dc*gamma + dlnx_dc*ks*x*dG             # <<<<<<<<<<<<<<
+ *             dkappa0 = dlnks_dlnm*kappa + dlnx_dlnm*ks*x*dK
+ *             dkappa1 = dlnks_dc*kappa + dlnx_dc*ks*x*dK
+ */
+          __pyx_v_dgamma1 = ((__pyx_v_dlnks_dc * __pyx_v_gamma) + (((__pyx_v_dlnx_dc * __pyx_v_ks) * __pyx_v_x) * __pyx_v_dG));
+
+          /* "nfwmodeltools.pyx":513
+ *             dgamma0 = dlnks_dlnm*gamma + dlnx_dlnm*ks*x*dG
+ *             dgamma1 = dlnks_dc*gamma + dlnx_dc*ks*x*dG
+ *             dkappa0 = dlnks_dlnm*kappa + dlnx_dlnm*ks*x*dK             # <<<<<<<<<<<<<<
+ *             dkappa1 = dlnks_dc*kappa + dlnx_dc*ks*x*dK
+ * 
+ */
+          __pyx_v_dkappa0 = ((__pyx_v_dlnks_dlnm * __pyx_v_kappa) + (((__pyx_v_dlnx_dlnm * __pyx_v_ks) * __pyx_v_x) * __pyx_v_dK));
+
+          /* "nfwmodeltools.pyx":514
+ *             dgamma1 = dlnks_dc*gamma + dlnx_dc*ks*x*dG
+ *             dkappa0 = dlnks_dlnm*kappa + dlnx_dlnm*ks*x*dK
+ *             dkappa1 = dlnks_dc*kappa + dlnx_dc*ks*x*dK             # <<<<<<<<<<<<<<
+ * 
+ *             betaratio = avebeta2[i]/avebeta[i]
+ */
+          __pyx_v_dkappa1 = ((__pyx_v_dlnks_dc * __pyx_v_kappa) + (((__pyx_v_dlnx_dc * __pyx_v_ks) * __pyx_v_x) * __pyx_v_dK));
+
+          /* "nfwmodeltools.pyx":516
+ *             dkappa1 = dlnks_dc*kappa + dlnx_dc*ks*x*dK
+ * 
+ *             betaratio = avebeta2[i]/avebeta[i]             # <<<<<<<<<<<<<<
+ *             denom = 1. - betaratio*kappa
+ *             modelg = avebeta[i]*gamma/denom
+ */
+          __pyx_t_10 = __pyx_v_i;
+          __pyx_t_11 = __pyx_v_i;
+          __pyx_v_betaratio = ((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_avebeta2.rcbuffer->pybuffer.buf, __pyx_t_10, __pyx_pybuffernd_avebeta2.diminfo[0].strides)) / (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_avebeta.rcbuffer->pybuffer.buf, __pyx_t_11, __pyx_pybuffernd_avebeta.diminfo[0].strides)));
+
+          /* "nfwmodeltools.pyx":517
+ * 
+ *             betaratio = avebeta2[i]/avebeta[i]
+ *             denom = 1. - betaratio*kappa             # <<<<<<<<<<<<<<
+ *             modelg = avebeta[i]*gamma/denom
+ *             dg0 = avebeta[i]*(dgamma0 + gamma*betaratio*dkappa0/denom)/denom
+ */
+          __pyx_v_denom = (1. - (__pyx_v_betaratio * __pyx_v_kappa));
+
+          /* "nfwmodeltools.pyx":518
+ *             betaratio = avebeta2[i]/avebeta[i]
+ *             denom = 1. - betaratio*kappa
+ *             modelg = avebeta[i]*gamma/denom             # <<<<<<<<<<<<<<
+ *             dg0 = avebeta[i]*(dgamma0 + gamma*betaratio*dkappa0/denom)/denom
+ *             dg1 = avebeta[i]*(dgamma1 + gamma*betaratio*dkappa1/denom)/denom
+ */
+          __pyx_t_12 = __pyx_v_i;
+          __pyx_v_modelg = (((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_avebeta.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_avebeta.diminfo[0].strides)) * __pyx_v_gamma) / __pyx_v_denom);
+
+          /* "nfwmodeltools.pyx":519
+ *             denom = 1. - betaratio*kappa
+ *             modelg = avebeta[i]*gamma/denom
+ *             dg0 = avebeta[i]*(dgamma0 + gamma*betaratio*dkappa0/denom)/denom             # <<<<<<<<<<<<<<
+ *             dg1 = avebeta[i]*(dgamma1 + gamma*betaratio*dkappa1/denom)/denom
+ * 
+ */
+          __pyx_t_13 = __pyx_v_i;
+          __pyx_v_dg0 = (((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_avebeta.rcbuffer->pybuffer.buf, __pyx_t_13, __pyx_pybuffernd_avebeta.diminfo[0].strides)) * (__pyx_v_dgamma0 + (((__pyx_v_gamma * __pyx_v_betaratio) * __pyx_v_dkappa0) / __pyx_v_denom))) / __pyx_v_denom);
+
+          /* "nfwmodeltools.pyx":520
+ *             modelg = avebeta[i]*gamma/denom
+ *             dg0 = avebeta[i]*(dgamma0 + gamma*betaratio*dkappa0/denom)/denom
+ *             dg1 = avebeta[i]*(dgamma1 + gamma*betaratio*dkappa1/denom)/denom             # <<<<<<<<<<<<<<
+ * 
+ *             invvar = 1./(bin_shearerr[i]*bin_shearerr[i])
+ */
+          __pyx_t_14 = __pyx_v_i;
+          __pyx_v_dg1 = (((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_avebeta.rcbuffer->pybuffer.buf, __pyx_t_14, __pyx_pybuffernd_avebeta.diminfo[0].strides)) * (__pyx_v_dgamma1 + (((__pyx_v_gamma * __pyx_v_betaratio) * __pyx_v_dkappa1) / __pyx_v_denom))) / __pyx_v_denom);
+
+          /* "nfwmodeltools.pyx":522
+ *             dg1 = avebeta[i]*(dgamma1 + gamma*betaratio*dkappa1/denom)/denom
+ * 
+ *             invvar = 1./(bin_shearerr[i]*bin_shearerr[i])             # <<<<<<<<<<<<<<
+ *             resid = bin_shear[i] - modelg
+ * 
+ */
+          __pyx_t_15 = __pyx_v_i;
+          __pyx_t_16 = __pyx_v_i;
+          __pyx_v_invvar = (1. / ((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer.buf, __pyx_t_15, __pyx_pybuffernd_bin_shearerr.diminfo[0].strides)) * (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer.buf, __pyx_t_16, __pyx_pybuffernd_bin_shearerr.diminfo[0].strides))));
+
+          /* "nfwmodeltools.pyx":523
+ * 
+ *             invvar = 1./(bin_shearerr[i]*bin_shearerr[i])
+ *             resid = bin_shear[i] - modelg             # <<<<<<<<<<<<<<
+ * 
+ *             logProb += -.5*resid*resid*invvar - logsqrt2pi_c - log(bin_shearerr[i])
+ */
+          __pyx_t_17 = __pyx_v_i;
+          __pyx_v_resid = ((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_bin_shear.rcbuffer->pybuffer.buf, __pyx_t_17, __pyx_pybuffernd_bin_shear.diminfo[0].strides)) - __pyx_v_modelg);
+
+          /* "nfwmodeltools.pyx":525
+ *             resid = bin_shear[i] - modelg
+ * 
+ *             logProb += -.5*resid*resid*invvar - logsqrt2pi_c - log(bin_shearerr[i])             # <<<<<<<<<<<<<<
+ *             grad0 += dg0*resid*invvar
+ *             grad1 += dg1*resid*invvar
+ */
+          __pyx_t_18 = __pyx_v_i;
+          __pyx_v_logProb = (__pyx_v_logProb + (((((-.5 * __pyx_v_resid) * __pyx_v_resid) * __pyx_v_invvar) - __pyx_v_13nfwmodeltools_logsqrt2pi_c) - log((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer.buf, __pyx_t_18, __pyx_pybuffernd_bin_shearerr.diminfo[0].strides)))));
+
+          /* "nfwmodeltools.pyx":526
+ * 
+ *             logProb += -.5*resid*resid*invvar - logsqrt2pi_c - log(bin_shearerr[i])
+ *             grad0 += dg0*resid*invvar             # <<<<<<<<<<<<<<
+ *             grad1 += dg1*resid*invvar
+ *             fisher00 += dg0*dg0*invvar
+ */
+          __pyx_v_grad0 = (__pyx_v_grad0 + ((__pyx_v_dg0 * __pyx_v_resid) * __pyx_v_invvar));
+
+          /* "nfwmodeltools.pyx":527
+ *             logProb += -.5*resid*resid*invvar - logsqrt2pi_c - log(bin_shearerr[i])
+ *             grad0 += dg0*resid*invvar
+ *             grad1 += dg1*resid*invvar             # <<<<<<<<<<<<<<
+ *             fisher00 += dg0*dg0*invvar
+ *             fisher01 += dg0*dg1*invvar
+ */
+          __pyx_v_grad1 = (__pyx_v_grad1 + ((__pyx_v_dg1 * __pyx_v_resid) * __pyx_v_invvar));
+
+          /* "nfwmodeltools.pyx":528
+ *             grad0 += dg0*resid*invvar
+ *             grad1 += dg1*resid*invvar
+ *             fisher00 += dg0*dg0*invvar             # <<<<<<<<<<<<<<
+ *             fisher01 += dg0*dg1*invvar
+ *             fisher11 += dg1*dg1*invvar
+ */
+          __pyx_v_fisher00 = (__pyx_v_fisher00 + ((__pyx_v_dg0 * __pyx_v_dg0) * __pyx_v_invvar));
+
+          /* "nfwmodeltools.pyx":529
+ *             grad1 += dg1*resid*invvar
+ *             fisher00 += dg0*dg0*invvar
+ *             fisher01 += dg0*dg1*invvar             # <<<<<<<<<<<<<<
+ *             fisher11 += dg1*dg1*invvar
+ * 
+ */
+          __pyx_v_fisher01 = (__pyx_v_fisher01 + ((__pyx_v_dg0 * __pyx_v_dg1) * __pyx_v_invvar));
+
+          /* "nfwmodeltools.pyx":530
+ *             fisher00 += dg0*dg0*invvar
+ *             fisher01 += dg0*dg1*invvar
+ *             fisher11 += dg1*dg1*invvar             # <<<<<<<<<<<<<<
+ * 
+ *     return (logProb,
+ */
+          __pyx_v_fisher11 = (__pyx_v_fisher11 + ((__pyx_v_dg1 * __pyx_v_dg1) * __pyx_v_invvar));
+        }
+      }
+
+      /* "nfwmodeltools.pyx":503
+ *     cdef double betaratio, denom, modelg, dg0, dg1, invvar, resid
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i from 0 <= i < nbins:
+ * 
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L6;
+        }
+        __pyx_L6:;
+      }
+  }
+
+  /* "nfwmodeltools.pyx":532
+ *             fisher11 += dg1*dg1*invvar
+ * 
+ *     return (logProb,             # <<<<<<<<<<<<<<
+ *             np.array([grad0, grad1]),
+ *             np.array([[fisher00, fisher01], [fisher01, fisher11]]))
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_logProb); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 532, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+
+  /* "nfwmodeltools.pyx":533
+ * 
+ *     return (logProb,
+ *             np.array([grad0, grad1]),             # <<<<<<<<<<<<<<
+ *             np.array([[fisher00, fisher01], [fisher01, fisher11]]))
+ * 
+ */
+  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 533, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_array); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 533, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_grad0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 533, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_19 = PyFloat_FromDouble(__pyx_v_grad1); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 533, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_19);
+  __pyx_t_20 = PyList_New(2); if (unlikely(!__pyx_t_20)) __PYX_ERR(0, 533, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_20);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyList_SET_ITEM(__pyx_t_20, 0, __pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_19);
+  PyList_SET_ITEM(__pyx_t_20, 1, __pyx_t_19);
+  __pyx_t_5 = 0;
+  __pyx_t_19 = 0;
+  __pyx_t_19 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_19 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_19)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_19);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  if (!__pyx_t_19) {
+    __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_20); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 533, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_20); __pyx_t_20 = 0;
+    __Pyx_GOTREF(__pyx_t_3);
+  } else {
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_19, __pyx_t_20};
+      __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 533, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_19); __pyx_t_19 = 0;
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_20); __pyx_t_20 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_19, __pyx_t_20};
+      __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 533, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_19); __pyx_t_19 = 0;
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_20); __pyx_t_20 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 533, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_GIVEREF(__pyx_t_19); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_19); __pyx_t_19 = NULL;
+      __Pyx_GIVEREF(__pyx_t_20);
+      PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_t_20);
+      __pyx_t_20 = 0;
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_5, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 533, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "nfwmodeltools.pyx":534
+ *     return (logProb,
+ *             np.array([grad0, grad1]),
+ *             np.array([[fisher00, fisher01], [fisher01, fisher11]]))             # <<<<<<<<<<<<<<
+ * 
+ * ######################
+ */
+  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 534, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_20 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_array); if (unlikely(!__pyx_t_20)) __PYX_ERR(0, 534, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_20);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_fisher00); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 534, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_19 = PyFloat_FromDouble(__pyx_v_fisher01); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 534, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_19);
+  __pyx_t_21 = PyList_New(2); if (unlikely(!__pyx_t_21)) __PYX_ERR(0, 534, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_21);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyList_SET_ITEM(__pyx_t_21, 0, __pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_19);
+  PyList_SET_ITEM(__pyx_t_21, 1, __pyx_t_19);
+  __pyx_t_5 = 0;
+  __pyx_t_19 = 0;
+  __pyx_t_19 = PyFloat_FromDouble(__pyx_v_fisher01); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 534, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_19);
+  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_fisher11); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 534, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_22 = PyList_New(2); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 534, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_22);
+  __Pyx_GIVEREF(__pyx_t_19);
+  PyList_SET_ITEM(__pyx_t_22, 0, __pyx_t_19);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyList_SET_ITEM(__pyx_t_22, 1, __pyx_t_5);
+  __pyx_t_19 = 0;
+  __pyx_t_5 = 0;
+  __pyx_t_5 = PyList_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 534, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_21);
+  PyList_SET_ITEM(__pyx_t_5, 0, __pyx_t_21);
+  __Pyx_GIVEREF(__pyx_t_22);
+  PyList_SET_ITEM(__pyx_t_5, 1, __pyx_t_22);
+  __pyx_t_21 = 0;
+  __pyx_t_22 = 0;
+  __pyx_t_22 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_20))) {
+    __pyx_t_22 = PyMethod_GET_SELF(__pyx_t_20);
+    if (likely(__pyx_t_22)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_20);
+      __Pyx_INCREF(__pyx_t_22);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_20, function);
+    }
+  }
+  if (!__pyx_t_22) {
+    __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_20, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 534, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_GOTREF(__pyx_t_4);
+  } else {
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_20)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_22, __pyx_t_5};
+      __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_20, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 534, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_22); __pyx_t_22 = 0;
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_20)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_22, __pyx_t_5};
+      __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_20, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 534, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_22); __pyx_t_22 = 0;
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_21 = PyTuple_New(1+1); if (unlikely(!__pyx_t_21)) __PYX_ERR(0, 534, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_21);
+      __Pyx_GIVEREF(__pyx_t_22); PyTuple_SET_ITEM(__pyx_t_21, 0, __pyx_t_22); __pyx_t_22 = NULL;
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_21, 0+1, __pyx_t_5);
+      __pyx_t_5 = 0;
+      __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_20, __pyx_t_21, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 534, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_21); __pyx_t_21 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_20); __pyx_t_20 = 0;
+
+  /* "nfwmodeltools.pyx":532
+ *             fisher11 += dg1*dg1*invvar
+ * 
+ *     return (logProb,             # <<<<<<<<<<<<<<
+ *             np.array([grad0, grad1]),
+ *             np.array([[fisher00, fisher01], [fisher01, fisher11]]))
+ */
+  __pyx_t_20 = PyTuple_New(3); if (unlikely(!__pyx_t_20)) __PYX_ERR(0, 532, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_20);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_20, 0, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_20, 1, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_20, 2, __pyx_t_4);
+  __pyx_t_2 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_4 = 0;
+  __pyx_r = __pyx_t_20;
+  __pyx_t_20 = 0;
+  goto __pyx_L0;
+
+  /* "nfwmodeltools.pyx":462
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def shearprofile_like_grad(double mdelta,             # <<<<<<<<<<<<<<
+ *                            double cdelta,
+ *                            np.ndarray[np.double_t, ndim=1, mode='c'] bin_r_mpc not None,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_19);
+  __Pyx_XDECREF(__pyx_t_20);
+  __Pyx_XDECREF(__pyx_t_21);
+  __Pyx_XDECREF(__pyx_t_22);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_avebeta.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_avebeta2.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bin_r_mpc.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bin_shear.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("nfwmodeltools.shearprofile_like_grad", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_avebeta.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_avebeta2.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bin_r_mpc.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bin_shear.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nfwmodeltools.pyx":543
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def shearprofile_like_lockstep(np.ndarray[np.double_t, ndim=1, mode='c'] mdelta not None,             # <<<<<<<<<<<<<<
+ *                                np.ndarray[np.double_t, ndim=1, mode='c'] cdelta not None,
+ *                                np.ndarray[np.double_t, ndim=2, mode='c'] bin_r_mpc not None,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_13nfwmodeltools_21shearprofile_like_lockstep(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_13nfwmodeltools_20shearprofile_like_lockstep[] = "shearprofile_like of profile p at (mdelta[p], cdelta[p]), for every p at once. \n    Profile arrays are (nprofiles x nbins); rho_c and rho_c_over_sigma_c are per profile.\n    Bins with bin_shearerr <= 0 are padding and are skipped. Returns nprofiles log likelihoods.";
+static PyMethodDef __pyx_mdef_13nfwmodeltools_21shearprofile_like_lockstep = {"shearprofile_like_lockstep", (PyCFunction)__pyx_pw_13nfwmodeltools_21shearprofile_like_lockstep, METH_VARARGS|METH_KEYWORDS, __pyx_doc_13nfwmodeltools_20shearprofile_like_lockstep};
+static PyObject *__pyx_pw_13nfwmodeltools_21shearprofile_like_lockstep(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_mdelta = 0;
+  PyArrayObject *__pyx_v_cdelta = 0;
+  PyArrayObject *__pyx_v_bin_r_mpc = 0;
+  PyArrayObject *__pyx_v_bin_shear = 0;
+  PyArrayObject *__pyx_v_bin_shearerr = 0;
+  PyArrayObject *__pyx_v_avebeta = 0;
+  PyArrayObject *__pyx_v_avebeta2 = 0;
+  PyArrayObject *__pyx_v_rho_c = 0;
+  PyArrayObject *__pyx_v_rho_c_over_sigma_c = 0;
+  double __pyx_v_massdelta;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("shearprofile_like_lockstep (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_mdelta,&__pyx_n_s_cdelta,&__pyx_n_s_bin_r_mpc,&__pyx_n_s_bin_shear,&__pyx_n_s_bin_shearerr,&__pyx_n_s_avebeta,&__pyx_n_s_avebeta2,&__pyx_n_s_rho_c,&__pyx_n_s_rho_c_over_sigma_c,&__pyx_n_s_massdelta,0};
+    PyObject* values[10] = {0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_mdelta)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_cdelta)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like_lockstep", 1, 10, 10, 1); __PYX_ERR(0, 543, __pyx_L3_error)
+        }
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_bin_r_mpc)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like_lockstep", 1, 10, 10, 2); __PYX_ERR(0, 543, __pyx_L3_error)
+        }
+        case  3:
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_bin_shear)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like_lockstep", 1, 10, 10, 3); __PYX_ERR(0, 543, __pyx_L3_error)
+        }
+        case  4:
+        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_bin_shearerr)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like_lockstep", 1, 10, 10, 4); __PYX_ERR(0, 543, __pyx_L3_error)
+        }
+        case  5:
+        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_avebeta)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like_lockstep", 1, 10, 10, 5); __PYX_ERR(0, 543, __pyx_L3_error)
+        }
+        case  6:
+        if (likely((values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_avebeta2)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like_lockstep", 1, 10, 10, 6); __PYX_ERR(0, 543, __pyx_L3_error)
+        }
+        case  7:
+        if (likely((values[7] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_rho_c)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like_lockstep", 1, 10, 10, 7); __PYX_ERR(0, 543, __pyx_L3_error)
+        }
+        case  8:
+        if (likely((values[8] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_rho_c_over_sigma_c)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like_lockstep", 1, 10, 10, 8); __PYX_ERR(0, 543, __pyx_L3_error)
+        }
+        case  9:
+        if (likely((values[9] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_massdelta)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("shearprofile_like_lockstep", 1, 10, 10, 9); __PYX_ERR(0, 543, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "shearprofile_like_lockstep") < 0)) __PYX_ERR(0, 543, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 10) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+    }
+    __pyx_v_mdelta = ((PyArrayObject *)values[0]);
+    __pyx_v_cdelta = ((PyArrayObject *)values[1]);
+    __pyx_v_bin_r_mpc = ((PyArrayObject *)values[2]);
+    __pyx_v_bin_shear = ((PyArrayObject *)values[3]);
+    __pyx_v_bin_shearerr = ((PyArrayObject *)values[4]);
+    __pyx_v_avebeta = ((PyArrayObject *)values[5]);
+    __pyx_v_avebeta2 = ((PyArrayObject *)values[6]);
+    __pyx_v_rho_c = ((PyArrayObject *)values[7]);
+    __pyx_v_rho_c_over_sigma_c = ((PyArrayObject *)values[8]);
+    __pyx_v_massdelta = __pyx_PyFloat_AsDouble(values[9]); if (unlikely((__pyx_v_massdelta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 552, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("shearprofile_like_lockstep", 1, 10, 10, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 543, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nfwmodeltools.shearprofile_like_lockstep", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_mdelta), __pyx_ptype_5numpy_ndarray, 0, "mdelta", 0))) __PYX_ERR(0, 543, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_cdelta), __pyx_ptype_5numpy_ndarray, 0, "cdelta", 0))) __PYX_ERR(0, 544, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bin_r_mpc), __pyx_ptype_5numpy_ndarray, 0, "bin_r_mpc", 0))) __PYX_ERR(0, 545, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bin_shear), __pyx_ptype_5numpy_ndarray, 0, "bin_shear", 0))) __PYX_ERR(0, 546, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bin_shearerr), __pyx_ptype_5numpy_ndarray, 0, "bin_shearerr", 0))) __PYX_ERR(0, 547, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_avebeta), __pyx_ptype_5numpy_ndarray, 0, "avebeta", 0))) __PYX_ERR(0, 548, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_avebeta2), __pyx_ptype_5numpy_ndarray, 0, "avebeta2", 0))) __PYX_ERR(0, 549, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_rho_c), __pyx_ptype_5numpy_ndarray, 0, "rho_c", 0))) __PYX_ERR(0, 550, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_rho_c_over_sigma_c), __pyx_ptype_5numpy_ndarray, 0, "rho_c_over_sigma_c", 0))) __PYX_ERR(0, 551, __pyx_L1_error)
+  __pyx_r = __pyx_pf_13nfwmodeltools_20shearprofile_like_lockstep(__pyx_self, __pyx_v_mdelta, __pyx_v_cdelta, __pyx_v_bin_r_mpc, __pyx_v_bin_shear, __pyx_v_bin_shearerr, __pyx_v_avebeta, __pyx_v_avebeta2, __pyx_v_rho_c, __pyx_v_rho_c_over_sigma_c, __pyx_v_massdelta);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_13nfwmodeltools_20shearprofile_like_lockstep(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_mdelta, PyArrayObject *__pyx_v_cdelta, PyArrayObject *__pyx_v_bin_r_mpc, PyArrayObject *__pyx_v_bin_shear, PyArrayObject *__pyx_v_bin_shearerr, PyArrayObject *__pyx_v_avebeta, PyArrayObject *__pyx_v_avebeta2, PyArrayObject *__pyx_v_rho_c, PyArrayObject *__pyx_v_rho_c_over_sigma_c, double __pyx_v_massdelta) {
+  Py_ssize_t __pyx_v_nprofiles;
+  Py_ssize_t __pyx_v_nbins;
+  PyArrayObject *__pyx_v_logProb = 0;
+  Py_ssize_t __pyx_v_p;
+  Py_ssize_t __pyx_v_i;
+  double __pyx_v_rs;
+  double __pyx_v_ks;
+  double __pyx_v_sign;
+  double __pyx_v_curlogprob;
+  double __pyx_v_x;
+  double __pyx_v_G;
+  double __pyx_v_dG;
+  double __pyx_v_K;
+  double __pyx_v_dK;
+  double __pyx_v_modelg;
+  double __pyx_v_delta;
+  double __pyx_v_fourpi_over_3;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_avebeta;
+  __Pyx_Buffer __pyx_pybuffer_avebeta;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_avebeta2;
+  __Pyx_Buffer __pyx_pybuffer_avebeta2;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_bin_r_mpc;
+  __Pyx_Buffer __pyx_pybuffer_bin_r_mpc;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_bin_shear;
+  __Pyx_Buffer __pyx_pybuffer_bin_shear;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_bin_shearerr;
+  __Pyx_Buffer __pyx_pybuffer_bin_shearerr;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_cdelta;
+  __Pyx_Buffer __pyx_pybuffer_cdelta;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_logProb;
+  __Pyx_Buffer __pyx_pybuffer_logProb;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_mdelta;
+  __Pyx_Buffer __pyx_pybuffer_mdelta;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_rho_c;
+  __Pyx_Buffer __pyx_pybuffer_rho_c;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_rho_c_over_sigma_c;
+  __Pyx_Buffer __pyx_pybuffer_rho_c_over_sigma_c;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyArrayObject *__pyx_t_8 = NULL;
+  double __pyx_t_9;
+  Py_ssize_t __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  Py_ssize_t __pyx_t_13;
+  Py_ssize_t __pyx_t_14;
+  Py_ssize_t __pyx_t_15;
+  Py_ssize_t __pyx_t_16;
+  struct __pyx_opt_args_13nfwmodeltools_deltaC __pyx_t_17;
+  Py_ssize_t __pyx_t_18;
+  Py_ssize_t __pyx_t_19;
+  Py_ssize_t __pyx_t_20;
+  Py_ssize_t __pyx_t_21;
+  Py_ssize_t __pyx_t_22;
+  Py_ssize_t __pyx_t_23;
+  Py_ssize_t __pyx_t_24;
+  Py_ssize_t __pyx_t_25;
+  Py_ssize_t __pyx_t_26;
+  Py_ssize_t __pyx_t_27;
+  Py_ssize_t __pyx_t_28;
+  Py_ssize_t __pyx_t_29;
+  Py_ssize_t __pyx_t_30;
+  Py_ssize_t __pyx_t_31;
+  Py_ssize_t __pyx_t_32;
+  Py_ssize_t __pyx_t_33;
+  Py_ssize_t __pyx_t_34;
+  Py_ssize_t __pyx_t_35;
+  Py_ssize_t __pyx_t_36;
+  Py_ssize_t __pyx_t_37;
+  __Pyx_RefNannySetupContext("shearprofile_like_lockstep", 0);
+  __pyx_pybuffer_logProb.pybuffer.buf = NULL;
+  __pyx_pybuffer_logProb.refcount = 0;
+  __pyx_pybuffernd_logProb.data = NULL;
+  __pyx_pybuffernd_logProb.rcbuffer = &__pyx_pybuffer_logProb;
+  __pyx_pybuffer_mdelta.pybuffer.buf = NULL;
+  __pyx_pybuffer_mdelta.refcount = 0;
+  __pyx_pybuffernd_mdelta.data = NULL;
+  __pyx_pybuffernd_mdelta.rcbuffer = &__pyx_pybuffer_mdelta;
+  __pyx_pybuffer_cdelta.pybuffer.buf = NULL;
+  __pyx_pybuffer_cdelta.refcount = 0;
+  __pyx_pybuffernd_cdelta.data = NULL;
+  __pyx_pybuffernd_cdelta.rcbuffer = &__pyx_pybuffer_cdelta;
+  __pyx_pybuffer_bin_r_mpc.pybuffer.buf = NULL;
+  __pyx_pybuffer_bin_r_mpc.refcount = 0;
+  __pyx_pybuffernd_bin_r_mpc.data = NULL;
+  __pyx_pybuffernd_bin_r_mpc.rcbuffer = &__pyx_pybuffer_bin_r_mpc;
+  __pyx_pybuffer_bin_shear.pybuffer.buf = NULL;
+  __pyx_pybuffer_bin_shear.refcount = 0;
+  __pyx_pybuffernd_bin_shear.data = NULL;
+  __pyx_pybuffernd_bin_shear.rcbuffer = &__pyx_pybuffer_bin_shear;
+  __pyx_pybuffer_bin_shearerr.pybuffer.buf = NULL;
+  __pyx_pybuffer_bin_shearerr.refcount = 0;
+  __pyx_pybuffernd_bin_shearerr.data = NULL;
+  __pyx_pybuffernd_bin_shearerr.rcbuffer = &__pyx_pybuffer_bin_shearerr;
+  __pyx_pybuffer_avebeta.pybuffer.buf = NULL;
+  __pyx_pybuffer_avebeta.refcount = 0;
+  __pyx_pybuffernd_avebeta.data = NULL;
+  __pyx_pybuffernd_avebeta.rcbuffer = &__pyx_pybuffer_avebeta;
+  __pyx_pybuffer_avebeta2.pybuffer.buf = NULL;
+  __pyx_pybuffer_avebeta2.refcount = 0;
+  __pyx_pybuffernd_avebeta2.data = NULL;
+  __pyx_pybuffernd_avebeta2.rcbuffer = &__pyx_pybuffer_avebeta2;
+  __pyx_pybuffer_rho_c.pybuffer.buf = NULL;
+  __pyx_pybuffer_rho_c.refcount = 0;
+  __pyx_pybuffernd_rho_c.data = NULL;
+  __pyx_pybuffernd_rho_c.rcbuffer = &__pyx_pybuffer_rho_c;
+  __pyx_pybuffer_rho_c_over_sigma_c.pybuffer.buf = NULL;
+  __pyx_pybuffer_rho_c_over_sigma_c.refcount = 0;
+  __pyx_pybuffernd_rho_c_over_sigma_c.data = NULL;
+  __pyx_pybuffernd_rho_c_over_sigma_c.rcbuffer = &__pyx_pybuffer_rho_c_over_sigma_c;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_mdelta.rcbuffer->pybuffer, (PyObject*)__pyx_v_mdelta, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 543, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_mdelta.diminfo[0].strides = __pyx_pybuffernd_mdelta.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_mdelta.diminfo[0].shape = __pyx_pybuffernd_mdelta.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_cdelta.rcbuffer->pybuffer, (PyObject*)__pyx_v_cdelta, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 543, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_cdelta.diminfo[0].strides = __pyx_pybuffernd_cdelta.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_cdelta.diminfo[0].shape = __pyx_pybuffernd_cdelta.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_bin_r_mpc.rcbuffer->pybuffer, (PyObject*)__pyx_v_bin_r_mpc, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 543, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_bin_r_mpc.diminfo[0].strides = __pyx_pybuffernd_bin_r_mpc.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_bin_r_mpc.diminfo[0].shape = __pyx_pybuffernd_bin_r_mpc.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_bin_r_mpc.diminfo[1].strides = __pyx_pybuffernd_bin_r_mpc.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_bin_r_mpc.diminfo[1].shape = __pyx_pybuffernd_bin_r_mpc.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_bin_shear.rcbuffer->pybuffer, (PyObject*)__pyx_v_bin_shear, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 543, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_bin_shear.diminfo[0].strides = __pyx_pybuffernd_bin_shear.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_bin_shear.diminfo[0].shape = __pyx_pybuffernd_bin_shear.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_bin_shear.diminfo[1].strides = __pyx_pybuffernd_bin_shear.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_bin_shear.diminfo[1].shape = __pyx_pybuffernd_bin_shear.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer, (PyObject*)__pyx_v_bin_shearerr, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 543, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_bin_shearerr.diminfo[0].strides = __pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_bin_shearerr.diminfo[0].shape = __pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_bin_shearerr.diminfo[1].strides = __pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_bin_shearerr.diminfo[1].shape = __pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_avebeta.rcbuffer->pybuffer, (PyObject*)__pyx_v_avebeta, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 543, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_avebeta.diminfo[0].strides = __pyx_pybuffernd_avebeta.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_avebeta.diminfo[0].shape = __pyx_pybuffernd_avebeta.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_avebeta.diminfo[1].strides = __pyx_pybuffernd_avebeta.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_avebeta.diminfo[1].shape = __pyx_pybuffernd_avebeta.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_avebeta2.rcbuffer->pybuffer, (PyObject*)__pyx_v_avebeta2, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 543, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_avebeta2.diminfo[0].strides = __pyx_pybuffernd_avebeta2.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_avebeta2.diminfo[0].shape = __pyx_pybuffernd_avebeta2.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_avebeta2.diminfo[1].strides = __pyx_pybuffernd_avebeta2.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_avebeta2.diminfo[1].shape = __pyx_pybuffernd_avebeta2.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_rho_c.rcbuffer->pybuffer, (PyObject*)__pyx_v_rho_c, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 543, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_rho_c.diminfo[0].strides = __pyx_pybuffernd_rho_c.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_rho_c.diminfo[0].shape = __pyx_pybuffernd_rho_c.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_rho_c_over_sigma_c.rcbuffer->pybuffer, (PyObject*)__pyx_v_rho_c_over_sigma_c, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 543, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_rho_c_over_sigma_c.diminfo[0].strides = __pyx_pybuffernd_rho_c_over_sigma_c.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_rho_c_over_sigma_c.diminfo[0].shape = __pyx_pybuffernd_rho_c_over_sigma_c.rcbuffer->pybuffer.shape[0];
+
+  /* "nfwmodeltools.pyx":558
+ *     Bins with bin_shearerr <= 0 are padding and are skipped. Returns nprofiles log likelihoods.'''
+ * 
+ *     cdef Py_ssize_t nprofiles = bin_shear.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t nbins = bin_shear.shape[1]
+ * 
+ */
+  __pyx_v_nprofiles = (__pyx_v_bin_shear->dimensions[0]);
+
+  /* "nfwmodeltools.pyx":559
+ * 
+ *     cdef Py_ssize_t nprofiles = bin_shear.shape[0]
+ *     cdef Py_ssize_t nbins = bin_shear.shape[1]             # <<<<<<<<<<<<<<
+ * 
+ *     assert(mdelta.shape[0] == nprofiles and cdelta.shape[0] == nprofiles)
+ */
+  __pyx_v_nbins = (__pyx_v_bin_shear->dimensions[1]);
+
+  /* "nfwmodeltools.pyx":561
+ *     cdef Py_ssize_t nbins = bin_shear.shape[1]
+ * 
+ *     assert(mdelta.shape[0] == nprofiles and cdelta.shape[0] == nprofiles)             # <<<<<<<<<<<<<<
+ *     assert(rho_c.shape[0] == nprofiles and rho_c_over_sigma_c.shape[0] == nprofiles)
+ * 
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(!Py_OptimizeFlag)) {
+    __pyx_t_2 = (((__pyx_v_mdelta->dimensions[0]) == __pyx_v_nprofiles) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L3_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_cdelta->dimensions[0]) == __pyx_v_nprofiles) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L3_bool_binop_done:;
+    if (unlikely(!__pyx_t_1)) {
+      PyErr_SetNone(PyExc_AssertionError);
+      __PYX_ERR(0, 561, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "nfwmodeltools.pyx":562
+ * 
+ *     assert(mdelta.shape[0] == nprofiles and cdelta.shape[0] == nprofiles)
+ *     assert(rho_c.shape[0] == nprofiles and rho_c_over_sigma_c.shape[0] == nprofiles)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef np.ndarray[DTYPE_T, ndim=1, mode='c'] logProb = np.zeros(nprofiles, dtype=np.float64)
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(!Py_OptimizeFlag)) {
+    __pyx_t_2 = (((__pyx_v_rho_c->dimensions[0]) == __pyx_v_nprofiles) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L5_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_rho_c_over_sigma_c->dimensions[0]) == __pyx_v_nprofiles) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L5_bool_binop_done:;
+    if (unlikely(!__pyx_t_1)) {
+      PyErr_SetNone(PyExc_AssertionError);
+      __PYX_ERR(0, 562, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "nfwmodeltools.pyx":564
+ *     assert(rho_c.shape[0] == nprofiles and rho_c_over_sigma_c.shape[0] == nprofiles)
+ * 
+ *     cdef np.ndarray[DTYPE_T, ndim=1, mode='c'] logProb = np.zeros(nprofiles, dtype=np.float64)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef Py_ssize_t p, i
+ */
+  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 564, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_zeros); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 564, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_nprofiles); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 564, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 564, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 564, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 564, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_float64); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 564, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_dtype, __pyx_t_7) < 0) __PYX_ERR(0, 564, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_5, __pyx_t_3); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 564, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (!(likely(((__pyx_t_7) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_7, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 564, __pyx_L1_error)
+  __pyx_t_8 = ((PyArrayObject *)__pyx_t_7);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_logProb.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_13nfwmodeltools_DTYPE_T, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_logProb = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_logProb.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 564, __pyx_L1_error)
+    } else {__pyx_pybuffernd_logProb.diminfo[0].strides = __pyx_pybuffernd_logProb.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_logProb.diminfo[0].shape = __pyx_pybuffernd_logProb.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_8 = 0;
+  __pyx_v_logProb = ((PyArrayObject *)__pyx_t_7);
+  __pyx_t_7 = 0;
+
+  /* "nfwmodeltools.pyx":569
+ *     cdef double rs, ks, sign, curlogprob
+ *     cdef double x, G, dG, K, dK, modelg, delta
+ *     cdef double fourpi_over_3 = 4.*np.pi/3.             # <<<<<<<<<<<<<<
+ * 
+ *     with nogil:
+ */
+  __pyx_t_7 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 569, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_n_s_pi); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 569, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyNumber_Multiply(__pyx_float_4_, __pyx_t_3); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 569, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyFloat_DivideObjC(__pyx_t_7, __pyx_float_3_, 3., 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 569, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_9 = __pyx_PyFloat_AsDouble(__pyx_t_3); if (unlikely((__pyx_t_9 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 569, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_fourpi_over_3 = __pyx_t_9;
+
+  /* "nfwmodeltools.pyx":571
+ *     cdef double fourpi_over_3 = 4.*np.pi/3.
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for p from 0 <= p < nprofiles:
+ * 
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "nfwmodeltools.pyx":572
+ * 
+ *     with nogil:
+ *         for p from 0 <= p < nprofiles:             # <<<<<<<<<<<<<<
+ * 
+ *             sign = 1.
+ */
+        __pyx_t_10 = __pyx_v_nprofiles;
+        for (__pyx_v_p = 0; __pyx_v_p < __pyx_t_10; __pyx_v_p++) {
+
+          /* "nfwmodeltools.pyx":574
+ *         for p from 0 <= p < nprofiles:
+ * 
+ *             sign = 1.             # <<<<<<<<<<<<<<
+ *             if mdelta[p] < 0:
+ *                 sign = -1.
+ */
+          __pyx_v_sign = 1.;
+
+          /* "nfwmodeltools.pyx":575
+ * 
+ *             sign = 1.
+ *             if mdelta[p] < 0:             # <<<<<<<<<<<<<<
+ *                 sign = -1.
+ * 
+ */
+          __pyx_t_11 = __pyx_v_p;
+          __pyx_t_1 = (((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_mdelta.rcbuffer->pybuffer.buf, __pyx_t_11, __pyx_pybuffernd_mdelta.diminfo[0].strides)) < 0.0) != 0);
+          if (__pyx_t_1) {
+
+            /* "nfwmodeltools.pyx":576
+ *             sign = 1.
+ *             if mdelta[p] < 0:
+ *                 sign = -1.             # <<<<<<<<<<<<<<
+ * 
+ *             if mdelta[p] != 0:
+ */
+            __pyx_v_sign = -1.;
+
+            /* "nfwmodeltools.pyx":575
+ * 
+ *             sign = 1.
+ *             if mdelta[p] < 0:             # <<<<<<<<<<<<<<
+ *                 sign = -1.
+ * 
+ */
+          }
+
+          /* "nfwmodeltools.pyx":578
+ *                 sign = -1.
+ * 
+ *             if mdelta[p] != 0:             # <<<<<<<<<<<<<<
+ *                 rs = (fabs(mdelta[p])/(fourpi_over_3*massdelta*rho_c[p]))**(1./3.) / cdelta[p]
+ *                 ks = rs*deltaC(cdelta[p], massdelta)*rho_c_over_sigma_c[p]
+ */
+          __pyx_t_12 = __pyx_v_p;
+          __pyx_t_1 = (((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_mdelta.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_mdelta.diminfo[0].strides)) != 0.0) != 0);
+          if (__pyx_t_1) {
+
+            /* "nfwmodeltools.pyx":579
+ * 
+ *             if mdelta[p] != 0:
+ *                 rs = (fabs(mdelta[p])/(fourpi_over_3*massdelta*rho_c[p]))**(1./3.) / cdelta[p]             # <<<<<<<<<<<<<<
+ *                 ks = rs*deltaC(cdelta[p], massdelta)*rho_c_over_sigma_c[p]
+ * 
+ */
+            __pyx_t_13 = __pyx_v_p;
+            __pyx_t_14 = __pyx_v_p;
+            __pyx_t_15 = __pyx_v_p;
+            __pyx_v_rs = (pow((fabs((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_mdelta.rcbuffer->pybuffer.buf, __pyx_t_13, __pyx_pybuffernd_mdelta.diminfo[0].strides))) / ((__pyx_v_fourpi_over_3 * __pyx_v_massdelta) * (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_rho_c.rcbuffer->pybuffer.buf, __pyx_t_14, __pyx_pybuffernd_rho_c.diminfo[0].strides)))), ((__pyx_t_5numpy_double_t)(1. / 3.))) / (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_cdelta.rcbuffer->pybuffer.buf, __pyx_t_15, __pyx_pybuffernd_cdelta.diminfo[0].strides)));
+
+            /* "nfwmodeltools.pyx":580
+ *             if mdelta[p] != 0:
+ *                 rs = (fabs(mdelta[p])/(fourpi_over_3*massdelta*rho_c[p]))**(1./3.) / cdelta[p]
+ *                 ks = rs*deltaC(cdelta[p], massdelta)*rho_c_over_sigma_c[p]             # <<<<<<<<<<<<<<
+ * 
+ *             curlogprob = 0.
+ */
+            __pyx_t_16 = __pyx_v_p;
+            __pyx_t_17.__pyx_n = 1;
+            __pyx_t_17.delta = __pyx_v_massdelta;
+            __pyx_t_9 = __pyx_f_13nfwmodeltools_deltaC((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_cdelta.rcbuffer->pybuffer.buf, __pyx_t_16, __pyx_pybuffernd_cdelta.diminfo[0].strides)), &__pyx_t_17); 
+            __pyx_t_18 = __pyx_v_p;
+            __pyx_v_ks = ((__pyx_v_rs * __pyx_t_9) * (*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_rho_c_over_sigma_c.rcbuffer->pybuffer.buf, __pyx_t_18, __pyx_pybuffernd_rho_c_over_sigma_c.diminfo[0].strides)));
+
+            /* "nfwmodeltools.pyx":578
+ *                 sign = -1.
+ * 
+ *             if mdelta[p] != 0:             # <<<<<<<<<<<<<<
+ *                 rs = (fabs(mdelta[p])/(fourpi_over_3*massdelta*rho_c[p]))**(1./3.) / cdelta[p]
+ *                 ks = rs*deltaC(cdelta[p], massdelta)*rho_c_over_sigma_c[p]
+ */
+          }
+
+          /* "nfwmodeltools.pyx":582
+ *                 ks = rs*deltaC(cdelta[p], massdelta)*rho_c_over_sigma_c[p]
+ * 
+ *             curlogprob = 0.             # <<<<<<<<<<<<<<
+ *             for i from 0 <= i < nbins:
+ * 
+ */
+          __pyx_v_curlogprob = 0.;
+
+          /* "nfwmodeltools.pyx":583
+ * 
+ *             curlogprob = 0.
+ *             for i from 0 <= i < nbins:             # <<<<<<<<<<<<<<
+ * 
+ *                 if bin_shearerr[p,i] <= 0:
+ */
+          __pyx_t_19 = __pyx_v_nbins;
+          for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_19; __pyx_v_i++) {
+
+            /* "nfwmodeltools.pyx":585
+ *             for i from 0 <= i < nbins:
+ * 
+ *                 if bin_shearerr[p,i] <= 0:             # <<<<<<<<<<<<<<
+ *                     continue
+ * 
+ */
+            __pyx_t_20 = __pyx_v_p;
+            __pyx_t_21 = __pyx_v_i;
+            __pyx_t_1 = (((*__Pyx_BufPtrCContig2d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer.buf, __pyx_t_20, __pyx_pybuffernd_bin_shearerr.diminfo[0].strides, __pyx_t_21, __pyx_pybuffernd_bin_shearerr.diminfo[1].strides)) <= 0.0) != 0);
+            if (__pyx_t_1) {
+
+              /* "nfwmodeltools.pyx":586
+ * 
+ *                 if bin_shearerr[p,i] <= 0:
+ *                     continue             # <<<<<<<<<<<<<<
+ * 
+ *                 modelg = 0.
+ */
+              goto __pyx_L14_continue;
+
+              /* "nfwmodeltools.pyx":585
+ *             for i from 0 <= i < nbins:
+ * 
+ *                 if bin_shearerr[p,i] <= 0:             # <<<<<<<<<<<<<<
+ *                     continue
+ * 
+ */
+            }
+
+            /* "nfwmodeltools.pyx":588
+ *                     continue
+ * 
+ *                 modelg = 0.             # <<<<<<<<<<<<<<
+ *                 if mdelta[p] != 0:
+ *                     x = bin_r_mpc[p,i]/rs
+ */
+            __pyx_v_modelg = 0.;
+
+            /* "nfwmodeltools.pyx":589
+ * 
+ *                 modelg = 0.
+ *                 if mdelta[p] != 0:             # <<<<<<<<<<<<<<
+ *                     x = bin_r_mpc[p,i]/rs
+ *                     nfwProfileDerivs(x, &G, &dG, &K, &dK)
+ */
+            __pyx_t_22 = __pyx_v_p;
+            __pyx_t_1 = (((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_mdelta.rcbuffer->pybuffer.buf, __pyx_t_22, __pyx_pybuffernd_mdelta.diminfo[0].strides)) != 0.0) != 0);
+            if (__pyx_t_1) {
+
+              /* "nfwmodeltools.pyx":590
+ *                 modelg = 0.
+ *                 if mdelta[p] != 0:
+ *                     x = bin_r_mpc[p,i]/rs             # <<<<<<<<<<<<<<
+ *                     nfwProfileDerivs(x, &G, &dG, &K, &dK)
+ *                     modelg = avebeta[p,i]*sign*ks*G / (1 - (avebeta2[p,i]/avebeta[p,i])*ks*K)
+ */
+              __pyx_t_23 = __pyx_v_p;
+              __pyx_t_24 = __pyx_v_i;
+              __pyx_v_x = ((*__Pyx_BufPtrCContig2d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_bin_r_mpc.rcbuffer->pybuffer.buf, __pyx_t_23, __pyx_pybuffernd_bin_r_mpc.diminfo[0].strides, __pyx_t_24, __pyx_pybuffernd_bin_r_mpc.diminfo[1].strides)) / __pyx_v_rs);
+
+              /* "nfwmodeltools.pyx":591
+ *                 if mdelta[p] != 0:
+ *                     x = bin_r_mpc[p,i]/rs
+ *                     nfwProfileDerivs(x, &G, &dG, &K, &dK)             # <<<<<<<<<<<<<<
+ *                     modelg = avebeta[p,i]*sign*ks*G / (1 - (avebeta2[p,i]/avebeta[p,i])*ks*K)
+ * 
+ */
+              __pyx_f_13nfwmodeltools_nfwProfileDerivs(__pyx_v_x, (&__pyx_v_G), (&__pyx_v_dG), (&__pyx_v_K), (&__pyx_v_dK));
+
+              /* "nfwmodeltools.pyx":592
+ *                     x = bin_r_mpc[p,i]/rs
+ *                     nfwProfileDerivs(x, &G, &dG, &K, &dK)
+ *                     modelg = avebeta[p,i]*sign*ks*G / (1 - (avebeta2[p,i]/avebeta[p,i])*ks*K)             # <<<<<<<<<<<<<<
+ * 
+ *                 delta = (bin_shear[p,i] - modelg)/bin_shearerr[p,i]
+ */
+              __pyx_t_25 = __pyx_v_p;
+              __pyx_t_26 = __pyx_v_i;
+              __pyx_t_27 = __pyx_v_p;
+              __pyx_t_28 = __pyx_v_i;
+              __pyx_t_29 = __pyx_v_p;
+              __pyx_t_30 = __pyx_v_i;
+              __pyx_v_modelg = (((((*__Pyx_BufPtrCContig2d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_avebeta.rcbuffer->pybuffer.buf, __pyx_t_25, __pyx_pybuffernd_avebeta.diminfo[0].strides, __pyx_t_26, __pyx_pybuffernd_avebeta.diminfo[1].strides)) * __pyx_v_sign) * __pyx_v_ks) * __pyx_v_G) / (1.0 - ((((*__Pyx_BufPtrCContig2d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_avebeta2.rcbuffer->pybuffer.buf, __pyx_t_27, __pyx_pybuffernd_avebeta2.diminfo[0].strides, __pyx_t_28, __pyx_pybuffernd_avebeta2.diminfo[1].strides)) / (*__Pyx_BufPtrCContig2d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_avebeta.rcbuffer->pybuffer.buf, __pyx_t_29, __pyx_pybuffernd_avebeta.diminfo[0].strides, __pyx_t_30, __pyx_pybuffernd_avebeta.diminfo[1].strides))) * __pyx_v_ks) * __pyx_v_K)));
+
+              /* "nfwmodeltools.pyx":589
  * 
- *         delta = bin_shear[i] - modelg
+ *                 modelg = 0.
+ *                 if mdelta[p] != 0:             # <<<<<<<<<<<<<<
+ *                     x = bin_r_mpc[p,i]/rs
+ *                     nfwProfileDerivs(x, &G, &dG, &K, &dK)
  */
-    __pyx_t_18 = __pyx_v_i;
-    __pyx_t_19 = __pyx_v_i;
-    __pyx_t_20 = ((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_avebeta.rcbuffer->pybuffer.buf, __pyx_t_18, __pyx_pybuffernd_avebeta.diminfo[0].strides)) * (*__Pyx_BufPtrCContig1d(__pyx_t_9nfwfitter_13nfwmodeltools_DTYPE_T *, __pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer.buf, __pyx_t_19, __pyx_pybuffernd_gamma_inf.diminfo[0].strides)));
-    __pyx_t_21 = __pyx_v_i;
-    __pyx_t_22 = (1.0 - (__pyx_v_betaratio * (*__Pyx_BufPtrCContig1d(__pyx_t_9nfwfitter_13nfwmodeltools_DTYPE_T *, __pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer.buf, __pyx_t_21, __pyx_pybuffernd_kappa_inf.diminfo[0].strides))));
-    if (unlikely(__pyx_t_22 == 0)) {
-      PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 301, __pyx_L1_error)
-    }
-    __pyx_v_modelg = (__pyx_t_20 / __pyx_t_22);
+            }
 
-    /* "nfwfitter/nfwmodeltools.pyx":303
- *         modelg = (avebeta[i]*gamma_inf[i] / (1 - betaratio*kappa_inf[i]))
+            /* "nfwmodeltools.pyx":594
+ *                     modelg = avebeta[p,i]*sign*ks*G / (1 - (avebeta2[p,i]/avebeta[p,i])*ks*K)
  * 
- *         delta = bin_shear[i] - modelg             # <<<<<<<<<<<<<<
+ *                 delta = (bin_shear[p,i] - modelg)/bin_shearerr[p,i]             # <<<<<<<<<<<<<<
+ *                 curlogprob = curlogprob - .5*delta*delta - logsqrt2pi_c - log(bin_shearerr[p,i])
  * 
- *         modsig = bin_shearerr[i]
  */
-    __pyx_t_23 = __pyx_v_i;
-    __pyx_v_delta = ((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_bin_shear.rcbuffer->pybuffer.buf, __pyx_t_23, __pyx_pybuffernd_bin_shear.diminfo[0].strides)) - __pyx_v_modelg);
+            __pyx_t_31 = __pyx_v_p;
+            __pyx_t_32 = __pyx_v_i;
+            __pyx_t_33 = __pyx_v_p;
+            __pyx_t_34 = __pyx_v_i;
+            __pyx_v_delta = (((*__Pyx_BufPtrCContig2d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_bin_shear.rcbuffer->pybuffer.buf, __pyx_t_31, __pyx_pybuffernd_bin_shear.diminfo[0].strides, __pyx_t_32, __pyx_pybuffernd_bin_shear.diminfo[1].strides)) - __pyx_v_modelg) / (*__Pyx_BufPtrCContig2d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer.buf, __pyx_t_33, __pyx_pybuffernd_bin_shearerr.diminfo[0].strides, __pyx_t_34, __pyx_pybuffernd_bin_shearerr.diminfo[1].strides)));
 
-    /* "nfwfitter/nfwmodeltools.pyx":305
- *         delta = bin_shear[i] - modelg
+            /* "nfwmodeltools.pyx":595
  * 
- *         modsig = bin_shearerr[i]             # <<<<<<<<<<<<<<
- *         # Log of a gaussian prob: Chi squared term plus normalization term
- *         logProb = logProb -.5*(delta/modsig)**2  - logsqrt2pi - log(modsig)
+ *                 delta = (bin_shear[p,i] - modelg)/bin_shearerr[p,i]
+ *                 curlogprob = curlogprob - .5*delta*delta - logsqrt2pi_c - log(bin_shearerr[p,i])             # <<<<<<<<<<<<<<
+ * 
+ *             logProb[p] = curlogprob
  */
-    __pyx_t_24 = __pyx_v_i;
-    __pyx_t_3 = PyFloat_FromDouble((*__Pyx_BufPtrCContig1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer.buf, __pyx_t_24, __pyx_pybuffernd_bin_shearerr.diminfo[0].strides))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 305, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF_SET(__pyx_v_modsig, __pyx_t_3);
-    __pyx_t_3 = 0;
+            __pyx_t_35 = __pyx_v_p;
+            __pyx_t_36 = __pyx_v_i;
+            __pyx_v_curlogprob = (((__pyx_v_curlogprob - ((.5 * __pyx_v_delta) * __pyx_v_delta)) - __pyx_v_13nfwmodeltools_logsqrt2pi_c) - log((*__Pyx_BufPtrCContig2d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer.buf, __pyx_t_35, __pyx_pybuffernd_bin_shearerr.diminfo[0].strides, __pyx_t_36, __pyx_pybuffernd_bin_shearerr.diminfo[1].strides))));
+            __pyx_L14_continue:;
+          }
 
-    /* "nfwfitter/nfwmodeltools.pyx":307
- *         modsig = bin_shearerr[i]
- *         # Log of a gaussian prob: Chi squared term plus normalization term
- *         logProb = logProb -.5*(delta/modsig)**2  - logsqrt2pi - log(modsig)             # <<<<<<<<<<<<<<
+          /* "nfwmodeltools.pyx":597
+ *                 curlogprob = curlogprob - .5*delta*delta - logsqrt2pi_c - log(bin_shearerr[p,i])
  * 
+ *             logProb[p] = curlogprob             # <<<<<<<<<<<<<<
  * 
+ *     return logProb
  */
-    __pyx_t_3 = PyFloat_FromDouble(__pyx_v_logProb); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 307, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_6 = PyFloat_FromDouble(__pyx_v_delta); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 307, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_2 = __Pyx_PyNumber_Divide(__pyx_t_6, __pyx_v_modsig); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 307, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_6 = PyNumber_Power(__pyx_t_2, __pyx_int_2, Py_None); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 307, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_2 = PyNumber_Multiply(__pyx_float__5, __pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 307, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_6 = PyNumber_Subtract(__pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 307, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_logsqrt2pi); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 307, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyNumber_Subtract(__pyx_t_6, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 307, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_13 = __pyx_PyFloat_AsDouble(__pyx_v_modsig); if (unlikely((__pyx_t_13 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 307, __pyx_L1_error)
-    __pyx_t_2 = PyFloat_FromDouble(log(__pyx_t_13)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 307, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_6 = PyNumber_Subtract(__pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 307, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_22 = __pyx_PyFloat_AsDouble(__pyx_t_6); if (unlikely((__pyx_t_22 == ((npy_double)-1)) && PyErr_Occurred())) __PYX_ERR(0, 307, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_v_logProb = __pyx_t_22;
-  }
+          __pyx_t_37 = __pyx_v_p;
+          *__Pyx_BufPtrCContig1d(__pyx_t_13nfwmodeltools_DTYPE_T *, __pyx_pybuffernd_logProb.rcbuffer->pybuffer.buf, __pyx_t_37, __pyx_pybuffernd_logProb.diminfo[0].strides) = __pyx_v_curlogprob;
+        }
+      }
 
-  /* "nfwfitter/nfwmodeltools.pyx":310
- * 
+      /* "nfwmodeltools.pyx":571
+ *     cdef double fourpi_over_3 = 4.*np.pi/3.
  * 
- *     return logProb             # <<<<<<<<<<<<<<
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for p from 0 <= p < nprofiles:
  * 
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L9;
+        }
+        __pyx_L9:;
+      }
+  }
+
+  /* "nfwmodeltools.pyx":599
+ *             logProb[p] = curlogprob
  * 
+ *     return logProb             # <<<<<<<<<<<<<<
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_6 = PyFloat_FromDouble(__pyx_v_logProb); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 310, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_r = __pyx_t_6;
-  __pyx_t_6 = 0;
+  __Pyx_INCREF(((PyObject *)__pyx_v_logProb));
+  __pyx_r = ((PyObject *)__pyx_v_logProb);
   goto __pyx_L0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":246
- * @cython.boundscheck(False)
+  /* "nfwmodeltools.pyx":543
  * @cython.wraparound(False)
- * def shearprofile_like(double mdelta,             # <<<<<<<<<<<<<<
- *                       double cdelta,
- *                       np.ndarray[np.double_t, ndim=1, mode='c'] bin_r_mpc not None,
+ * @cython.cdivision(True)
+ * def shearprofile_like_lockstep(np.ndarray[np.double_t, ndim=1, mode='c'] mdelta not None,             # <<<<<<<<<<<<<<
+ *                                np.ndarray[np.double_t, ndim=1, mode='c'] cdelta not None,
+ *                                np.ndarray[np.double_t, ndim=2, mode='c'] bin_r_mpc not None,
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
   { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
     __Pyx_PyThreadState_declare
     __Pyx_PyThreadState_assign
@@ -4914,10 +8396,13 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bin_r_mpc.rcbuffer->pybuffer);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bin_shear.rcbuffer->pybuffer);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_cdelta.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_logProb.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_mdelta.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_rho_c.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_rho_c_over_sigma_c.rcbuffer->pybuffer);
   __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("nfwfitter.nfwmodeltools.shearprofile_like", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("nfwmodeltools.shearprofile_like_lockstep", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   goto __pyx_L2;
   __pyx_L0:;
@@ -4926,13 +8411,13 @@ static PyObject *__pyx_pf_9nfwfitter_13nfwmodeltools_12shearprofile_like(CYTHON_
   __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bin_r_mpc.rcbuffer->pybuffer);
   __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bin_shear.rcbuffer->pybuffer);
   __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bin_shearerr.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_gamma_inf.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_kappa_inf.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_cdelta.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_logProb.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_mdelta.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_rho_c.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_rho_c_over_sigma_c.rcbuffer->pybuffer);
   __pyx_L2:;
-  __Pyx_XDECREF((PyObject *)__pyx_v_gamma_inf);
-  __Pyx_XDECREF((PyObject *)__pyx_v_kappa_inf);
-  __Pyx_XDECREF(__pyx_v_rdelta);
-  __Pyx_XDECREF(__pyx_v_modsig);
+  __Pyx_XDECREF((PyObject *)__pyx_v_logProb);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
@@ -5107,7 +8592,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 218, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 218, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -5163,7 +8648,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  * 
  *             info.buf = PyArray_DATA(self)
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 222, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 222, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -5472,7 +8957,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 259, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 259, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -6287,7 +9772,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  * 
  *         if ((child.byteorder == c'>' and little_endian) or
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 799, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 799, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -6355,7 +9840,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  *             # One could encode it in the format string and have Cython
  *             # complain instead, BUT: < and > in format strings also imply
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 803, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 803, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -6464,7 +9949,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  * 
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  */
-        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 823, __pyx_L1_error)
+        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 823, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
         __Pyx_Raise(__pyx_t_4, 0, 0, 0);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -7145,7 +10630,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
  * 
  * cdef inline int import_umath() except -1:
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 989, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 989, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
@@ -7276,7 +10761,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
  * 
  * cdef inline int import_ufunc() except -1:
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 995, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 995, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
@@ -7404,7 +10889,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
  *     except Exception:
  *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 1001, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 1001, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
@@ -7452,14 +10937,14 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
   return __pyx_r;
 }
 
-static struct __pyx_obj_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs *__pyx_freelist_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs[8];
-static int __pyx_freecount_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs = 0;
+static struct __pyx_obj_13nfwmodeltools___pyx_scope_struct__rdelta2rs *__pyx_freelist_13nfwmodeltools___pyx_scope_struct__rdelta2rs[8];
+static int __pyx_freecount_13nfwmodeltools___pyx_scope_struct__rdelta2rs = 0;
 
-static PyObject *__pyx_tp_new_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+static PyObject *__pyx_tp_new_13nfwmodeltools___pyx_scope_struct__rdelta2rs(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
   PyObject *o;
-  if (CYTHON_COMPILING_IN_CPYTHON && likely((__pyx_freecount_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs > 0) & (t->tp_basicsize == sizeof(struct __pyx_obj_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs)))) {
-    o = (PyObject*)__pyx_freelist_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs[--__pyx_freecount_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs];
-    memset(o, 0, sizeof(struct __pyx_obj_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs));
+  if (CYTHON_COMPILING_IN_CPYTHON && likely((__pyx_freecount_13nfwmodeltools___pyx_scope_struct__rdelta2rs > 0) & (t->tp_basicsize == sizeof(struct __pyx_obj_13nfwmodeltools___pyx_scope_struct__rdelta2rs)))) {
+    o = (PyObject*)__pyx_freelist_13nfwmodeltools___pyx_scope_struct__rdelta2rs[--__pyx_freecount_13nfwmodeltools___pyx_scope_struct__rdelta2rs];
+    memset(o, 0, sizeof(struct __pyx_obj_13nfwmodeltools___pyx_scope_struct__rdelta2rs));
     (void) PyObject_INIT(o, t);
   } else {
     o = (*t->tp_alloc)(t, 0);
@@ -7468,20 +10953,20 @@ static PyObject *__pyx_tp_new_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rde
   return o;
 }
 
-static void __pyx_tp_dealloc_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs(PyObject *o) {
-  if (CYTHON_COMPILING_IN_CPYTHON && ((__pyx_freecount_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs < 8) & (Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs)))) {
-    __pyx_freelist_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs[__pyx_freecount_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs++] = ((struct __pyx_obj_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs *)o);
+static void __pyx_tp_dealloc_13nfwmodeltools___pyx_scope_struct__rdelta2rs(PyObject *o) {
+  if (CYTHON_COMPILING_IN_CPYTHON && ((__pyx_freecount_13nfwmodeltools___pyx_scope_struct__rdelta2rs < 8) & (Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_13nfwmodeltools___pyx_scope_struct__rdelta2rs)))) {
+    __pyx_freelist_13nfwmodeltools___pyx_scope_struct__rdelta2rs[__pyx_freecount_13nfwmodeltools___pyx_scope_struct__rdelta2rs++] = ((struct __pyx_obj_13nfwmodeltools___pyx_scope_struct__rdelta2rs *)o);
   } else {
     (*Py_TYPE(o)->tp_free)(o);
   }
 }
 
-static PyTypeObject __pyx_type_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs = {
+static PyTypeObject __pyx_type_13nfwmodeltools___pyx_scope_struct__rdelta2rs = {
   PyVarObject_HEAD_INIT(0, 0)
-  "nfwfitter.nfwmodeltools.__pyx_scope_struct__rdelta2rs", /*tp_name*/
-  sizeof(struct __pyx_obj_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs), /*tp_basicsize*/
+  "nfwmodeltools.__pyx_scope_struct__rdelta2rs", /*tp_name*/
+  sizeof(struct __pyx_obj_13nfwmodeltools___pyx_scope_struct__rdelta2rs), /*tp_basicsize*/
   0, /*tp_itemsize*/
-  __pyx_tp_dealloc_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs, /*tp_dealloc*/
+  __pyx_tp_dealloc_13nfwmodeltools___pyx_scope_struct__rdelta2rs, /*tp_dealloc*/
   0, /*tp_print*/
   0, /*tp_getattr*/
   0, /*tp_setattr*/
@@ -7519,7 +11004,7 @@ static PyTypeObject __pyx_type_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rd
   0, /*tp_dictoffset*/
   0, /*tp_init*/
   0, /*tp_alloc*/
-  __pyx_tp_new_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs, /*tp_new*/
+  __pyx_tp_new_13nfwmodeltools___pyx_scope_struct__rdelta2rs, /*tp_new*/
   0, /*tp_free*/
   0, /*tp_is_gc*/
   0, /*tp_bases*/
@@ -7560,8 +11045,10 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_DTYPE, __pyx_k_DTYPE, sizeof(__pyx_k_DTYPE), 0, 0, 1, 1},
   {&__pyx_kp_u_Format_string_allocated_too_shor, __pyx_k_Format_string_allocated_too_shor, sizeof(__pyx_k_Format_string_allocated_too_shor), 0, 1, 0, 0},
   {&__pyx_kp_u_Format_string_allocated_too_shor_2, __pyx_k_Format_string_allocated_too_shor_2, sizeof(__pyx_k_Format_string_allocated_too_shor_2), 0, 1, 0, 0},
+  {&__pyx_n_s_G, __pyx_k_G, sizeof(__pyx_k_G), 0, 0, 1, 1},
   {&__pyx_kp_s_Id_nfwmodeltools_pyx_v_1_5_2011, __pyx_k_Id_nfwmodeltools_pyx_v_1_5_2011, sizeof(__pyx_k_Id_nfwmodeltools_pyx_v_1_5_2011), 0, 0, 1, 0},
   {&__pyx_n_s_ImportError, __pyx_k_ImportError, sizeof(__pyx_k_ImportError), 0, 0, 1, 1},
+  {&__pyx_n_s_K, __pyx_k_K, sizeof(__pyx_k_K), 0, 0, 1, 1},
   {&__pyx_n_s_NFWKappa, __pyx_k_NFWKappa, sizeof(__pyx_k_NFWKappa), 0, 0, 1, 1},
   {&__pyx_n_s_NFWShear, __pyx_k_NFWShear, sizeof(__pyx_k_NFWShear), 0, 0, 1, 1},
   {&__pyx_kp_u_Non_native_byte_order_not_suppor, __pyx_k_Non_native_byte_order_not_suppor, sizeof(__pyx_k_Non_native_byte_order_not_suppor), 0, 1, 0, 0},
@@ -7570,6 +11057,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
   {&__pyx_n_s_a, __pyx_k_a, sizeof(__pyx_k_a), 0, 0, 1, 1},
   {&__pyx_n_s_amp, __pyx_k_amp, sizeof(__pyx_k_amp), 0, 0, 1, 1},
+  {&__pyx_n_s_array, __pyx_k_array, sizeof(__pyx_k_array), 0, 0, 1, 1},
   {&__pyx_n_s_aveEnclosedKappa, __pyx_k_aveEnclosedKappa, sizeof(__pyx_k_aveEnclosedKappa), 0, 0, 1, 1},
   {&__pyx_n_s_avebeta, __pyx_k_avebeta, sizeof(__pyx_k_avebeta), 0, 0, 1, 1},
   {&__pyx_n_s_avebeta2, __pyx_k_avebeta2, sizeof(__pyx_k_avebeta2), 0, 0, 1, 1},
@@ -7585,48 +11073,82 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_cdelta, __pyx_k_cdelta, sizeof(__pyx_k_cdelta), 0, 0, 1, 1},
   {&__pyx_n_s_concentration, __pyx_k_concentration, sizeof(__pyx_k_concentration), 0, 0, 1, 1},
   {&__pyx_n_s_curbin, __pyx_k_curbin, sizeof(__pyx_k_curbin), 0, 0, 1, 1},
+  {&__pyx_n_s_curlogprob, __pyx_k_curlogprob, sizeof(__pyx_k_curlogprob), 0, 0, 1, 1},
   {&__pyx_n_s_cvs_id, __pyx_k_cvs_id, sizeof(__pyx_k_cvs_id), 0, 0, 1, 1},
+  {&__pyx_n_s_dG, __pyx_k_dG, sizeof(__pyx_k_dG), 0, 0, 1, 1},
+  {&__pyx_n_s_dK, __pyx_k_dK, sizeof(__pyx_k_dK), 0, 0, 1, 1},
   {&__pyx_n_s_delta, __pyx_k_delta, sizeof(__pyx_k_delta), 0, 0, 1, 1},
   {&__pyx_n_s_delta_c, __pyx_k_delta_c, sizeof(__pyx_k_delta_c), 0, 0, 1, 1},
+  {&__pyx_n_s_denom, __pyx_k_denom, sizeof(__pyx_k_denom), 0, 0, 1, 1},
+  {&__pyx_n_s_dg0, __pyx_k_dg0, sizeof(__pyx_k_dg0), 0, 0, 1, 1},
+  {&__pyx_n_s_dg1, __pyx_k_dg1, sizeof(__pyx_k_dg1), 0, 0, 1, 1},
+  {&__pyx_n_s_dgamma0, __pyx_k_dgamma0, sizeof(__pyx_k_dgamma0), 0, 0, 1, 1},
+  {&__pyx_n_s_dgamma1, __pyx_k_dgamma1, sizeof(__pyx_k_dgamma1), 0, 0, 1, 1},
+  {&__pyx_n_s_dkappa0, __pyx_k_dkappa0, sizeof(__pyx_k_dkappa0), 0, 0, 1, 1},
+  {&__pyx_n_s_dkappa1, __pyx_k_dkappa1, sizeof(__pyx_k_dkappa1), 0, 0, 1, 1},
+  {&__pyx_n_s_dlnks_dc, __pyx_k_dlnks_dc, sizeof(__pyx_k_dlnks_dc), 0, 0, 1, 1},
+  {&__pyx_n_s_dlnks_dlnm, __pyx_k_dlnks_dlnm, sizeof(__pyx_k_dlnks_dlnm), 0, 0, 1, 1},
+  {&__pyx_n_s_dlnx_dc, __pyx_k_dlnx_dc, sizeof(__pyx_k_dlnx_dc), 0, 0, 1, 1},
+  {&__pyx_n_s_dlnx_dlnm, __pyx_k_dlnx_dlnm, sizeof(__pyx_k_dlnx_dlnm), 0, 0, 1, 1},
   {&__pyx_n_s_double, __pyx_k_double, sizeof(__pyx_k_double), 0, 0, 1, 1},
   {&__pyx_n_s_dtype, __pyx_k_dtype, sizeof(__pyx_k_dtype), 0, 0, 1, 1},
   {&__pyx_n_s_f, __pyx_k_f, sizeof(__pyx_k_f), 0, 0, 1, 1},
+  {&__pyx_n_s_fisher00, __pyx_k_fisher00, sizeof(__pyx_k_fisher00), 0, 0, 1, 1},
+  {&__pyx_n_s_fisher01, __pyx_k_fisher01, sizeof(__pyx_k_fisher01), 0, 0, 1, 1},
+  {&__pyx_n_s_fisher11, __pyx_k_fisher11, sizeof(__pyx_k_fisher11), 0, 0, 1, 1},
   {&__pyx_n_s_float64, __pyx_k_float64, sizeof(__pyx_k_float64), 0, 0, 1, 1},
+  {&__pyx_n_s_fourpi_over_3, __pyx_k_fourpi_over_3, sizeof(__pyx_k_fourpi_over_3), 0, 0, 1, 1},
   {&__pyx_n_s_g, __pyx_k_g, sizeof(__pyx_k_g), 0, 0, 1, 1},
+  {&__pyx_n_s_gamma, __pyx_k_gamma, sizeof(__pyx_k_gamma), 0, 0, 1, 1},
   {&__pyx_n_s_gamma_inf, __pyx_k_gamma_inf, sizeof(__pyx_k_gamma_inf), 0, 0, 1, 1},
+  {&__pyx_n_s_grad0, __pyx_k_grad0, sizeof(__pyx_k_grad0), 0, 0, 1, 1},
+  {&__pyx_n_s_grad1, __pyx_k_grad1, sizeof(__pyx_k_grad1), 0, 0, 1, 1},
   {&__pyx_n_s_gtilde, __pyx_k_gtilde, sizeof(__pyx_k_gtilde), 0, 0, 1, 1},
   {&__pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_k_home_avestruz_codes_clmassmod_n, sizeof(__pyx_k_home_avestruz_codes_clmassmod_n), 0, 0, 1, 0},
   {&__pyx_n_s_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 0, 1, 1},
   {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_s_invsig, __pyx_k_invsig, sizeof(__pyx_k_invsig), 0, 0, 1, 1},
+  {&__pyx_n_s_invvar, __pyx_k_invvar, sizeof(__pyx_k_invvar), 0, 0, 1, 1},
   {&__pyx_n_s_j, __pyx_k_j, sizeof(__pyx_k_j), 0, 0, 1, 1},
   {&__pyx_n_s_kappa, __pyx_k_kappa, sizeof(__pyx_k_kappa), 0, 0, 1, 1},
   {&__pyx_n_s_kappa_inf, __pyx_k_kappa_inf, sizeof(__pyx_k_kappa_inf), 0, 0, 1, 1},
+  {&__pyx_n_s_ks, __pyx_k_ks, sizeof(__pyx_k_ks), 0, 0, 1, 1},
   {&__pyx_n_s_log, __pyx_k_log, sizeof(__pyx_k_log), 0, 0, 1, 1},
   {&__pyx_n_s_logProb, __pyx_k_logProb, sizeof(__pyx_k_logProb), 0, 0, 1, 1},
   {&__pyx_n_s_logsqrt2pi, __pyx_k_logsqrt2pi, sizeof(__pyx_k_logsqrt2pi), 0, 0, 1, 1},
+  {&__pyx_n_s_m, __pyx_k_m, sizeof(__pyx_k_m), 0, 0, 1, 1},
   {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
   {&__pyx_n_s_massInsideR, __pyx_k_massInsideR, sizeof(__pyx_k_massInsideR), 0, 0, 1, 1},
   {&__pyx_n_s_massdelta, __pyx_k_massdelta, sizeof(__pyx_k_massdelta), 0, 0, 1, 1},
+  {&__pyx_n_s_mc, __pyx_k_mc, sizeof(__pyx_k_mc), 0, 0, 1, 1},
   {&__pyx_n_s_mdelta, __pyx_k_mdelta, sizeof(__pyx_k_mdelta), 0, 0, 1, 1},
+  {&__pyx_kp_s_mdelta_must_be_positive, __pyx_k_mdelta_must_be_positive, sizeof(__pyx_k_mdelta_must_be_positive), 0, 0, 1, 0},
   {&__pyx_n_s_modelg, __pyx_k_modelg, sizeof(__pyx_k_modelg), 0, 0, 1, 1},
   {&__pyx_n_s_modsig, __pyx_k_modsig, sizeof(__pyx_k_modsig), 0, 0, 1, 1},
   {&__pyx_n_s_nbins, __pyx_k_nbins, sizeof(__pyx_k_nbins), 0, 0, 1, 1},
   {&__pyx_kp_u_ndarray_is_not_C_contiguous, __pyx_k_ndarray_is_not_C_contiguous, sizeof(__pyx_k_ndarray_is_not_C_contiguous), 0, 1, 0, 0},
   {&__pyx_kp_u_ndarray_is_not_Fortran_contiguou, __pyx_k_ndarray_is_not_Fortran_contiguou, sizeof(__pyx_k_ndarray_is_not_Fortran_contiguou), 0, 1, 0, 0},
-  {&__pyx_n_s_nfwfitter_nfwmodeltools, __pyx_k_nfwfitter_nfwmodeltools, sizeof(__pyx_k_nfwfitter_nfwmodeltools), 0, 0, 1, 1},
+  {&__pyx_n_s_nfwTemplates, __pyx_k_nfwTemplates, sizeof(__pyx_k_nfwTemplates), 0, 0, 1, 1},
+  {&__pyx_n_s_nfwmodeltools, __pyx_k_nfwmodeltools, sizeof(__pyx_k_nfwmodeltools), 0, 0, 1, 1},
   {&__pyx_n_s_nfwutils, __pyx_k_nfwutils, sizeof(__pyx_k_nfwutils), 0, 0, 1, 1},
+  {&__pyx_n_s_nmasses, __pyx_k_nmasses, sizeof(__pyx_k_nmasses), 0, 0, 1, 1},
+  {&__pyx_n_s_nmodels, __pyx_k_nmodels, sizeof(__pyx_k_nmodels), 0, 0, 1, 1},
+  {&__pyx_n_s_norm, __pyx_k_norm, sizeof(__pyx_k_norm), 0, 0, 1, 1},
   {&__pyx_n_s_np, __pyx_k_np, sizeof(__pyx_k_np), 0, 0, 1, 1},
   {&__pyx_n_s_npos, __pyx_k_npos, sizeof(__pyx_k_npos), 0, 0, 1, 1},
+  {&__pyx_n_s_nprofiles, __pyx_k_nprofiles, sizeof(__pyx_k_nprofiles), 0, 0, 1, 1},
   {&__pyx_n_s_numpy, __pyx_k_numpy, sizeof(__pyx_k_numpy), 0, 0, 1, 1},
   {&__pyx_kp_s_numpy_core_multiarray_failed_to, __pyx_k_numpy_core_multiarray_failed_to, sizeof(__pyx_k_numpy_core_multiarray_failed_to), 0, 0, 1, 0},
   {&__pyx_kp_s_numpy_core_umath_failed_to_impor, __pyx_k_numpy_core_umath_failed_to_impor, sizeof(__pyx_k_numpy_core_umath_failed_to_impor), 0, 0, 1, 0},
   {&__pyx_n_s_optimize, __pyx_k_optimize, sizeof(__pyx_k_optimize), 0, 0, 1, 1},
+  {&__pyx_n_s_p, __pyx_k_p, sizeof(__pyx_k_p), 0, 0, 1, 1},
   {&__pyx_n_s_pi, __pyx_k_pi, sizeof(__pyx_k_pi), 0, 0, 1, 1},
   {&__pyx_n_s_r, __pyx_k_r, sizeof(__pyx_k_r), 0, 0, 1, 1},
   {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
   {&__pyx_n_s_rdelta, __pyx_k_rdelta, sizeof(__pyx_k_rdelta), 0, 0, 1, 1},
   {&__pyx_n_s_rdelta2rs, __pyx_k_rdelta2rs, sizeof(__pyx_k_rdelta2rs), 0, 0, 1, 1},
   {&__pyx_n_s_rdelta2rs_locals_f, __pyx_k_rdelta2rs_locals_f, sizeof(__pyx_k_rdelta2rs_locals_f), 0, 0, 1, 1},
+  {&__pyx_n_s_resid, __pyx_k_resid, sizeof(__pyx_k_resid), 0, 0, 1, 1},
   {&__pyx_n_s_rho_c, __pyx_k_rho_c, sizeof(__pyx_k_rho_c), 0, 0, 1, 1},
   {&__pyx_n_s_rho_c_over_sigma_c, __pyx_k_rho_c_over_sigma_c, sizeof(__pyx_k_rho_c_over_sigma_c), 0, 0, 1, 1},
   {&__pyx_n_s_rs, __pyx_k_rs, sizeof(__pyx_k_rs), 0, 0, 1, 1},
@@ -7636,6 +11158,10 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_scipy, __pyx_k_scipy, sizeof(__pyx_k_scipy), 0, 0, 1, 1},
   {&__pyx_n_s_scipy_optimize, __pyx_k_scipy_optimize, sizeof(__pyx_k_scipy_optimize), 0, 0, 1, 1},
   {&__pyx_n_s_shearprofile_like, __pyx_k_shearprofile_like, sizeof(__pyx_k_shearprofile_like), 0, 0, 1, 1},
+  {&__pyx_n_s_shearprofile_like_batch, __pyx_k_shearprofile_like_batch, sizeof(__pyx_k_shearprofile_like_batch), 0, 0, 1, 1},
+  {&__pyx_n_s_shearprofile_like_grad, __pyx_k_shearprofile_like_grad, sizeof(__pyx_k_shearprofile_like_grad), 0, 0, 1, 1},
+  {&__pyx_n_s_shearprofile_like_lockstep, __pyx_k_shearprofile_like_lockstep, sizeof(__pyx_k_shearprofile_like_lockstep), 0, 0, 1, 1},
+  {&__pyx_n_s_sign, __pyx_k_sign, sizeof(__pyx_k_sign), 0, 0, 1, 1},
   {&__pyx_n_s_sqrt, __pyx_k_sqrt, sizeof(__pyx_k_sqrt), 0, 0, 1, 1},
   {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
   {&__pyx_kp_u_unknown_dtype_code_in_numpy_pxd, __pyx_k_unknown_dtype_code_in_numpy_pxd, sizeof(__pyx_k_unknown_dtype_code_in_numpy_pxd), 0, 1, 0, 0},
@@ -7645,7 +11171,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {0, 0, 0, 0, 0, 0, 0}
 };
 static int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(1, 218, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 479, __pyx_L1_error)
   __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(1, 231, __pyx_L1_error)
   __pyx_builtin_RuntimeError = __Pyx_GetBuiltinName(__pyx_n_s_RuntimeError); if (!__pyx_builtin_RuntimeError) __PYX_ERR(1, 799, __pyx_L1_error)
   __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_n_s_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(1, 989, __pyx_L1_error)
@@ -7658,17 +11184,28 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "nfwfitter/nfwmodeltools.pyx":193
+  /* "nfwmodeltools.pyx":194
  * 
  *     # x = r_delta / rs
  *     def f(x):             # <<<<<<<<<<<<<<
  * 
  *         return 3*delta_c*(log(1+x) - (x/(1+x)))/x**3 - delta
  */
-  __pyx_tuple_ = PyTuple_Pack(1, __pyx_n_s_x); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 193, __pyx_L1_error)
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_n_s_x); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 194, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple_);
   __Pyx_GIVEREF(__pyx_tuple_);
-  __pyx_codeobj__2 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple_, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_f, 193, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__2)) __PYX_ERR(0, 193, __pyx_L1_error)
+  __pyx_codeobj__2 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple_, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_f, 194, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__2)) __PYX_ERR(0, 194, __pyx_L1_error)
+
+  /* "nfwmodeltools.pyx":479
+ * 
+ *     if mdelta <= 0:
+ *         raise ValueError('mdelta must be positive')             # <<<<<<<<<<<<<<
+ * 
+ *     cdef Py_ssize_t nbins = bin_r_mpc.shape[0]
+ */
+  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_s_mdelta_must_be_positive); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 479, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
 
   /* "../../anaconda2/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":218
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
@@ -7677,9 +11214,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  */
-  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_C_contiguous); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(1, 218, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__3);
-  __Pyx_GIVEREF(__pyx_tuple__3);
+  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_C_contiguous); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(1, 218, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
 
   /* "../../anaconda2/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":222
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
@@ -7688,9 +11225,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  *             info.buf = PyArray_DATA(self)
  */
-  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_Fortran_contiguou); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(1, 222, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__4);
-  __Pyx_GIVEREF(__pyx_tuple__4);
+  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_Fortran_contiguou); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(1, 222, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
 
   /* "../../anaconda2/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":259
  *                 if ((descr.byteorder == c'>' and little_endian) or
@@ -7699,9 +11236,9 @@ static int __Pyx_InitCachedConstants(void) {
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"
  */
-  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(1, 259, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__5);
-  __Pyx_GIVEREF(__pyx_tuple__5);
+  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(1, 259, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
 
   /* "../../anaconda2/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":799
  * 
@@ -7710,9 +11247,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  *         if ((child.byteorder == c'>' and little_endian) or
  */
-  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(1, 799, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__6);
-  __Pyx_GIVEREF(__pyx_tuple__6);
+  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(1, 799, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
 
   /* "../../anaconda2/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":803
  *         if ((child.byteorder == c'>' and little_endian) or
@@ -7721,9 +11258,9 @@ static int __Pyx_InitCachedConstants(void) {
  *             # One could encode it in the format string and have Cython
  *             # complain instead, BUT: < and > in format strings also imply
  */
-  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(1, 803, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__7);
-  __Pyx_GIVEREF(__pyx_tuple__7);
+  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(1, 803, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
 
   /* "../../anaconda2/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":823
  *             t = child.type_num
@@ -7732,9 +11269,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  */
-  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor_2); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(1, 823, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__8);
-  __Pyx_GIVEREF(__pyx_tuple__8);
+  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor_2); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(1, 823, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__9);
+  __Pyx_GIVEREF(__pyx_tuple__9);
 
   /* "../../anaconda2/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":989
  *         _import_array()
@@ -7743,9 +11280,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  * cdef inline int import_umath() except -1:
  */
-  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_multiarray_failed_to); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(1, 989, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__9);
-  __Pyx_GIVEREF(__pyx_tuple__9);
+  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_multiarray_failed_to); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(1, 989, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__10);
+  __Pyx_GIVEREF(__pyx_tuple__10);
 
   /* "../../anaconda2/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":995
  *         _import_umath()
@@ -7754,102 +11291,150 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  * cdef inline int import_ufunc() except -1:
  */
-  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(1, 995, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__10);
-  __Pyx_GIVEREF(__pyx_tuple__10);
+  __pyx_tuple__11 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(1, 995, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__11);
+  __Pyx_GIVEREF(__pyx_tuple__11);
 
   /* "../../anaconda2/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":1001
  *         _import_umath()
  *     except Exception:
  *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
  */
-  __pyx_tuple__11 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(1, 1001, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__11);
-  __Pyx_GIVEREF(__pyx_tuple__11);
+  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(1, 1001, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__12);
+  __Pyx_GIVEREF(__pyx_tuple__12);
 
-  /* "nfwfitter/nfwmodeltools.pyx":54
+  /* "nfwmodeltools.pyx":55
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def NFWShear(np.ndarray[np.double_t, ndim=1, mode='c'] r,             # <<<<<<<<<<<<<<
  *               double concentration,
  *               double rs,
  */
-  __pyx_tuple__12 = PyTuple_Pack(14, __pyx_n_s_r, __pyx_n_s_concentration, __pyx_n_s_rs, __pyx_n_s_rho_c_over_sigma_c, __pyx_n_s_delta, __pyx_n_s_delta_c, __pyx_n_s_amp, __pyx_n_s_x, __pyx_n_s_a, __pyx_n_s_b, __pyx_n_s_c, __pyx_n_s_i, __pyx_n_s_npos, __pyx_n_s_g); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(0, 54, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__12);
-  __Pyx_GIVEREF(__pyx_tuple__12);
-  __pyx_codeobj__13 = (PyObject*)__Pyx_PyCode_New(5, 0, 14, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__12, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_NFWShear, 54, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__13)) __PYX_ERR(0, 54, __pyx_L1_error)
+  __pyx_tuple__13 = PyTuple_Pack(14, __pyx_n_s_r, __pyx_n_s_concentration, __pyx_n_s_rs, __pyx_n_s_rho_c_over_sigma_c, __pyx_n_s_delta, __pyx_n_s_delta_c, __pyx_n_s_amp, __pyx_n_s_x, __pyx_n_s_a, __pyx_n_s_b, __pyx_n_s_c, __pyx_n_s_i, __pyx_n_s_npos, __pyx_n_s_g); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(0, 55, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__13);
+  __Pyx_GIVEREF(__pyx_tuple__13);
+  __pyx_codeobj__14 = (PyObject*)__Pyx_PyCode_New(5, 0, 14, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_NFWShear, 55, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__14)) __PYX_ERR(0, 55, __pyx_L1_error)
 
-  /* "nfwfitter/nfwmodeltools.pyx":97
+  /* "nfwmodeltools.pyx":98
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def NFWKappa(np.ndarray[np.double_t, ndim=1, mode='c'] r,             # <<<<<<<<<<<<<<
  *               double concentration,
  *               double rs,
  */
-  __pyx_tuple__14 = PyTuple_Pack(14, __pyx_n_s_r, __pyx_n_s_concentration, __pyx_n_s_rs, __pyx_n_s_rho_c_over_sigma_c, __pyx_n_s_delta, __pyx_n_s_delta_c, __pyx_n_s_amp, __pyx_n_s_i, __pyx_n_s_npos, __pyx_n_s_kappa, __pyx_n_s_x, __pyx_n_s_a, __pyx_n_s_b, __pyx_n_s_c); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(0, 97, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__14);
-  __Pyx_GIVEREF(__pyx_tuple__14);
-  __pyx_codeobj__15 = (PyObject*)__Pyx_PyCode_New(5, 0, 14, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__14, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_NFWKappa, 97, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__15)) __PYX_ERR(0, 97, __pyx_L1_error)
+  __pyx_tuple__15 = PyTuple_Pack(14, __pyx_n_s_r, __pyx_n_s_concentration, __pyx_n_s_rs, __pyx_n_s_rho_c_over_sigma_c, __pyx_n_s_delta, __pyx_n_s_delta_c, __pyx_n_s_amp, __pyx_n_s_i, __pyx_n_s_npos, __pyx_n_s_kappa, __pyx_n_s_x, __pyx_n_s_a, __pyx_n_s_b, __pyx_n_s_c); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(0, 98, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__15);
+  __Pyx_GIVEREF(__pyx_tuple__15);
+  __pyx_codeobj__16 = (PyObject*)__Pyx_PyCode_New(5, 0, 14, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__15, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_NFWKappa, 98, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__16)) __PYX_ERR(0, 98, __pyx_L1_error)
 
-  /* "nfwfitter/nfwmodeltools.pyx":140
+  /* "nfwmodeltools.pyx":141
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def aveEnclosedKappa(np.ndarray[np.double_t, ndim=1, mode='c'] r,             # <<<<<<<<<<<<<<
  *                      double concentration,
  *                      double rs,
  */
-  __pyx_tuple__16 = PyTuple_Pack(14, __pyx_n_s_r, __pyx_n_s_concentration, __pyx_n_s_rs, __pyx_n_s_rho_c_over_sigma_c, __pyx_n_s_delta, __pyx_n_s_delta_c, __pyx_n_s_amp, __pyx_n_s_i, __pyx_n_s_npos, __pyx_n_s_avekappa, __pyx_n_s_x, __pyx_n_s_a, __pyx_n_s_b, __pyx_n_s_c); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(0, 140, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__16);
-  __Pyx_GIVEREF(__pyx_tuple__16);
-  __pyx_codeobj__17 = (PyObject*)__Pyx_PyCode_New(5, 0, 14, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__16, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_aveEnclosedKappa, 140, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__17)) __PYX_ERR(0, 140, __pyx_L1_error)
+  __pyx_tuple__17 = PyTuple_Pack(14, __pyx_n_s_r, __pyx_n_s_concentration, __pyx_n_s_rs, __pyx_n_s_rho_c_over_sigma_c, __pyx_n_s_delta, __pyx_n_s_delta_c, __pyx_n_s_amp, __pyx_n_s_i, __pyx_n_s_npos, __pyx_n_s_avekappa, __pyx_n_s_x, __pyx_n_s_a, __pyx_n_s_b, __pyx_n_s_c); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(0, 141, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__17);
+  __Pyx_GIVEREF(__pyx_tuple__17);
+  __pyx_codeobj__18 = (PyObject*)__Pyx_PyCode_New(5, 0, 14, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__17, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_aveEnclosedKappa, 141, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__18)) __PYX_ERR(0, 141, __pyx_L1_error)
 
-  /* "nfwfitter/nfwmodeltools.pyx":186
+  /* "nfwmodeltools.pyx":187
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def rdelta2rs(double rdelta,             # <<<<<<<<<<<<<<
  *               double c200,
  *               double delta):
  */
-  __pyx_tuple__18 = PyTuple_Pack(8, __pyx_n_s_rdelta, __pyx_n_s_c200, __pyx_n_s_delta, __pyx_n_s_delta_c, __pyx_n_s_f, __pyx_n_s_f, __pyx_n_s_x0, __pyx_n_s_rs); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(0, 186, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__18);
-  __Pyx_GIVEREF(__pyx_tuple__18);
-  __pyx_codeobj__19 = (PyObject*)__Pyx_PyCode_New(3, 0, 8, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_rdelta2rs, 186, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__19)) __PYX_ERR(0, 186, __pyx_L1_error)
+  __pyx_tuple__19 = PyTuple_Pack(8, __pyx_n_s_rdelta, __pyx_n_s_c200, __pyx_n_s_delta, __pyx_n_s_delta_c, __pyx_n_s_f, __pyx_n_s_f, __pyx_n_s_x0, __pyx_n_s_rs); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(0, 187, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__19);
+  __Pyx_GIVEREF(__pyx_tuple__19);
+  __pyx_codeobj__20 = (PyObject*)__Pyx_PyCode_New(3, 0, 8, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__19, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_rdelta2rs, 187, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__20)) __PYX_ERR(0, 187, __pyx_L1_error)
 
-  /* "nfwfitter/nfwmodeltools.pyx":209
+  /* "nfwmodeltools.pyx":210
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def rscaleConstM(double mdelta,             # <<<<<<<<<<<<<<
  *                  double c,
  *                  double rho_c,
  */
-  __pyx_tuple__20 = PyTuple_Pack(6, __pyx_n_s_mdelta, __pyx_n_s_c, __pyx_n_s_rho_c, __pyx_n_s_delta, __pyx_n_s_rdelta, __pyx_n_s_rs); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(0, 209, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__20);
-  __Pyx_GIVEREF(__pyx_tuple__20);
-  __pyx_codeobj__21 = (PyObject*)__Pyx_PyCode_New(4, 0, 6, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__20, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_rscaleConstM, 209, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__21)) __PYX_ERR(0, 209, __pyx_L1_error)
+  __pyx_tuple__21 = PyTuple_Pack(6, __pyx_n_s_mdelta, __pyx_n_s_c, __pyx_n_s_rho_c, __pyx_n_s_delta, __pyx_n_s_rdelta, __pyx_n_s_rs); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(0, 210, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__21);
+  __Pyx_GIVEREF(__pyx_tuple__21);
+  __pyx_codeobj__22 = (PyObject*)__Pyx_PyCode_New(4, 0, 6, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__21, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_rscaleConstM, 210, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__22)) __PYX_ERR(0, 210, __pyx_L1_error)
 
-  /* "nfwfitter/nfwmodeltools.pyx":225
+  /* "nfwmodeltools.pyx":226
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def massInsideR(double rs,             # <<<<<<<<<<<<<<
  *                 double c,
  *                 double R,
  */
-  __pyx_tuple__22 = PyTuple_Pack(7, __pyx_n_s_rs, __pyx_n_s_c, __pyx_n_s_R, __pyx_n_s_rho_c, __pyx_n_s_x, __pyx_n_s_delta_c, __pyx_n_s_massInsideR); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(0, 225, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__22);
-  __Pyx_GIVEREF(__pyx_tuple__22);
-  __pyx_codeobj__23 = (PyObject*)__Pyx_PyCode_New(4, 0, 7, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__22, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_massInsideR, 225, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__23)) __PYX_ERR(0, 225, __pyx_L1_error)
+  __pyx_tuple__23 = PyTuple_Pack(7, __pyx_n_s_rs, __pyx_n_s_c, __pyx_n_s_R, __pyx_n_s_rho_c, __pyx_n_s_x, __pyx_n_s_delta_c, __pyx_n_s_massInsideR); if (unlikely(!__pyx_tuple__23)) __PYX_ERR(0, 226, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__23);
+  __Pyx_GIVEREF(__pyx_tuple__23);
+  __pyx_codeobj__24 = (PyObject*)__Pyx_PyCode_New(4, 0, 7, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__23, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_massInsideR, 226, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__24)) __PYX_ERR(0, 226, __pyx_L1_error)
 
-  /* "nfwfitter/nfwmodeltools.pyx":246
+  /* "nfwmodeltools.pyx":247
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def shearprofile_like(double mdelta,             # <<<<<<<<<<<<<<
  *                       double cdelta,
  *                       np.ndarray[np.double_t, ndim=1, mode='c'] bin_r_mpc not None,
  */
-  __pyx_tuple__24 = PyTuple_Pack(25, __pyx_n_s_mdelta, __pyx_n_s_cdelta, __pyx_n_s_bin_r_mpc, __pyx_n_s_bin_shear, __pyx_n_s_bin_shearerr, __pyx_n_s_avebeta, __pyx_n_s_avebeta2, __pyx_n_s_rho_c, __pyx_n_s_rho_c_over_sigma_c, __pyx_n_s_massdelta, __pyx_n_s_nbins, __pyx_n_s_gamma_inf, __pyx_n_s_kappa_inf, __pyx_n_s_rscale, __pyx_n_s_rdelta, __pyx_n_s_curbin, __pyx_n_s_gtilde, __pyx_n_s_delta, __pyx_n_s_modelg, __pyx_n_s_modsig, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_s, __pyx_n_s_logProb, __pyx_n_s_betaratio); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(0, 246, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__24);
-  __Pyx_GIVEREF(__pyx_tuple__24);
-  __pyx_codeobj__25 = (PyObject*)__Pyx_PyCode_New(10, 0, 25, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__24, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_shearprofile_like, 246, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__25)) __PYX_ERR(0, 246, __pyx_L1_error)
+  __pyx_tuple__25 = PyTuple_Pack(25, __pyx_n_s_mdelta, __pyx_n_s_cdelta, __pyx_n_s_bin_r_mpc, __pyx_n_s_bin_shear, __pyx_n_s_bin_shearerr, __pyx_n_s_avebeta, __pyx_n_s_avebeta2, __pyx_n_s_rho_c, __pyx_n_s_rho_c_over_sigma_c, __pyx_n_s_massdelta, __pyx_n_s_nbins, __pyx_n_s_gamma_inf, __pyx_n_s_kappa_inf, __pyx_n_s_rscale, __pyx_n_s_rdelta, __pyx_n_s_curbin, __pyx_n_s_gtilde, __pyx_n_s_delta, __pyx_n_s_modelg, __pyx_n_s_modsig, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_s, __pyx_n_s_logProb, __pyx_n_s_betaratio); if (unlikely(!__pyx_tuple__25)) __PYX_ERR(0, 247, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__25);
+  __Pyx_GIVEREF(__pyx_tuple__25);
+  __pyx_codeobj__26 = (PyObject*)__Pyx_PyCode_New(10, 0, 25, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__25, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_shearprofile_like, 247, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__26)) __PYX_ERR(0, 247, __pyx_L1_error)
+
+  /* "nfwmodeltools.pyx":324
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def nfwTemplates(np.ndarray[np.double_t, ndim=1, mode='c'] mdelta not None,             # <<<<<<<<<<<<<<
+ *                  np.ndarray[np.double_t, ndim=1, mode='c'] cdelta not None,
+ *                  np.ndarray[np.double_t, ndim=1, mode='c'] bin_r_mpc not None,
+ */
+  __pyx_tuple__27 = PyTuple_Pack(13, __pyx_n_s_mdelta, __pyx_n_s_cdelta, __pyx_n_s_bin_r_mpc, __pyx_n_s_rho_c, __pyx_n_s_rho_c_over_sigma_c, __pyx_n_s_massdelta, __pyx_n_s_nmasses, __pyx_n_s_nbins, __pyx_n_s_gamma_inf, __pyx_n_s_kappa_inf, __pyx_n_s_m, __pyx_n_s_rdelta, __pyx_n_s_rscale); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(0, 324, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__27);
+  __Pyx_GIVEREF(__pyx_tuple__27);
+  __pyx_codeobj__28 = (PyObject*)__Pyx_PyCode_New(6, 0, 13, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__27, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_nfwTemplates, 324, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__28)) __PYX_ERR(0, 324, __pyx_L1_error)
+
+  /* "nfwmodeltools.pyx":364
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def shearprofile_like_batch(np.ndarray[np.double_t, ndim=2, mode='c'] gamma_inf not None,             # <<<<<<<<<<<<<<
+ *                             np.ndarray[np.double_t, ndim=2, mode='c'] kappa_inf not None,
+ *                             np.ndarray[np.double_t, ndim=2, mode='c'] bin_shear not None,
+ */
+  __pyx_tuple__29 = PyTuple_Pack(19, __pyx_n_s_gamma_inf, __pyx_n_s_kappa_inf, __pyx_n_s_bin_shear, __pyx_n_s_bin_shearerr, __pyx_n_s_avebeta, __pyx_n_s_avebeta2, __pyx_n_s_nmodels, __pyx_n_s_nprofiles, __pyx_n_s_nbins, __pyx_n_s_logProb, __pyx_n_s_betaratio, __pyx_n_s_invsig, __pyx_n_s_p, __pyx_n_s_m, __pyx_n_s_i, __pyx_n_s_norm, __pyx_n_s_modelg, __pyx_n_s_delta, __pyx_n_s_curlogprob); if (unlikely(!__pyx_tuple__29)) __PYX_ERR(0, 364, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__29);
+  __Pyx_GIVEREF(__pyx_tuple__29);
+  __pyx_codeobj__30 = (PyObject*)__Pyx_PyCode_New(6, 0, 19, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__29, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_shearprofile_like_batch, 364, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__30)) __PYX_ERR(0, 364, __pyx_L1_error)
+
+  /* "nfwmodeltools.pyx":462
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def shearprofile_like_grad(double mdelta,             # <<<<<<<<<<<<<<
+ *                            double cdelta,
+ *                            np.ndarray[np.double_t, ndim=1, mode='c'] bin_r_mpc not None,
+ */
+  __pyx_tuple__31 = PyTuple_Pack(44, __pyx_n_s_mdelta, __pyx_n_s_cdelta, __pyx_n_s_bin_r_mpc, __pyx_n_s_bin_shear, __pyx_n_s_bin_shearerr, __pyx_n_s_avebeta, __pyx_n_s_avebeta2, __pyx_n_s_rho_c, __pyx_n_s_rho_c_over_sigma_c, __pyx_n_s_massdelta, __pyx_n_s_nbins, __pyx_n_s_rdelta, __pyx_n_s_rs, __pyx_n_s_mc, __pyx_n_s_ks, __pyx_n_s_dlnks_dlnm, __pyx_n_s_dlnks_dc, __pyx_n_s_dlnx_dlnm, __pyx_n_s_dlnx_dc, __pyx_n_s_logProb, __pyx_n_s_grad0, __pyx_n_s_grad1, __pyx_n_s_fisher00, __pyx_n_s_fisher01, __pyx_n_s_fisher11, __pyx_n_s_i, __pyx_n_s_x, __pyx_n_s_G, __pyx_n_s_dG, __pyx_n_s_K, __pyx_n_s_dK, __pyx_n_s_gamma, __pyx_n_s_kappa, __pyx_n_s_dgamma0, __pyx_n_s_dgamma1, __pyx_n_s_dkappa0, __pyx_n_s_dkappa1, __pyx_n_s_betaratio, __pyx_n_s_denom, __pyx_n_s_modelg, __pyx_n_s_dg0, __pyx_n_s_dg1, __pyx_n_s_invvar, __pyx_n_s_resid); if (unlikely(!__pyx_tuple__31)) __PYX_ERR(0, 462, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__31);
+  __Pyx_GIVEREF(__pyx_tuple__31);
+  __pyx_codeobj__32 = (PyObject*)__Pyx_PyCode_New(10, 0, 44, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__31, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_shearprofile_like_grad, 462, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__32)) __PYX_ERR(0, 462, __pyx_L1_error)
+
+  /* "nfwmodeltools.pyx":543
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def shearprofile_like_lockstep(np.ndarray[np.double_t, ndim=1, mode='c'] mdelta not None,             # <<<<<<<<<<<<<<
+ *                                np.ndarray[np.double_t, ndim=1, mode='c'] cdelta not None,
+ *                                np.ndarray[np.double_t, ndim=2, mode='c'] bin_r_mpc not None,
+ */
+  __pyx_tuple__33 = PyTuple_Pack(27, __pyx_n_s_mdelta, __pyx_n_s_cdelta, __pyx_n_s_bin_r_mpc, __pyx_n_s_bin_shear, __pyx_n_s_bin_shearerr, __pyx_n_s_avebeta, __pyx_n_s_avebeta2, __pyx_n_s_rho_c, __pyx_n_s_rho_c_over_sigma_c, __pyx_n_s_massdelta, __pyx_n_s_nprofiles, __pyx_n_s_nbins, __pyx_n_s_logProb, __pyx_n_s_p, __pyx_n_s_i, __pyx_n_s_rs, __pyx_n_s_ks, __pyx_n_s_sign, __pyx_n_s_curlogprob, __pyx_n_s_x, __pyx_n_s_G, __pyx_n_s_dG, __pyx_n_s_K, __pyx_n_s_dK, __pyx_n_s_modelg, __pyx_n_s_delta, __pyx_n_s_fourpi_over_3); if (unlikely(!__pyx_tuple__33)) __PYX_ERR(0, 543, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__33);
+  __Pyx_GIVEREF(__pyx_tuple__33);
+  __pyx_codeobj__34 = (PyObject*)__Pyx_PyCode_New(10, 0, 27, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__33, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_avestruz_codes_clmassmod_n, __pyx_n_s_shearprofile_like_lockstep, 543, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__34)) __PYX_ERR(0, 543, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -7861,6 +11446,8 @@ static int __Pyx_InitGlobals(void) {
   if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
   __pyx_float__5 = PyFloat_FromDouble(.5); if (unlikely(!__pyx_float__5)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_float_0_ = PyFloat_FromDouble(0.); if (unlikely(!__pyx_float_0_)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_3_ = PyFloat_FromDouble(3.); if (unlikely(!__pyx_float_3_)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_4_ = PyFloat_FromDouble(4.); if (unlikely(!__pyx_float_4_)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_float_0_1 = PyFloat_FromDouble(0.1); if (unlikely(!__pyx_float_0_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) __PYX_ERR(0, 1, __pyx_L1_error)
@@ -7886,6 +11473,7 @@ PyMODINIT_FUNC PyInit_nfwmodeltools(void)
   PyObject *__pyx_t_5 = NULL;
   PyObject *__pyx_t_6 = NULL;
   PyObject *__pyx_t_7 = NULL;
+  double __pyx_t_8;
   __Pyx_RefNannyDeclarations
   #if CYTHON_REFNANNY
   __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
@@ -7942,14 +11530,14 @@ PyMODINIT_FUNC PyInit_nfwmodeltools(void)
   #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
   if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
-  if (__pyx_module_is_main_nfwfitter__nfwmodeltools) {
+  if (__pyx_module_is_main_nfwmodeltools) {
     if (PyObject_SetAttrString(__pyx_m, "__name__", __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   }
   #if PY_MAJOR_VERSION >= 3
   {
     PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
-    if (!PyDict_GetItemString(modules, "nfwfitter.nfwmodeltools")) {
-      if (unlikely(PyDict_SetItemString(modules, "nfwfitter.nfwmodeltools", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "nfwmodeltools")) {
+      if (unlikely(PyDict_SetItemString(modules, "nfwmodeltools", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
     }
   }
   #endif
@@ -7961,9 +11549,9 @@ PyMODINIT_FUNC PyInit_nfwmodeltools(void)
   /*--- Variable export code ---*/
   /*--- Function export code ---*/
   /*--- Type init code ---*/
-  if (PyType_Ready(&__pyx_type_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs) < 0) __PYX_ERR(0, 186, __pyx_L1_error)
-  __pyx_type_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs.tp_print = 0;
-  __pyx_ptype_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs = &__pyx_type_9nfwfitter_13nfwmodeltools___pyx_scope_struct__rdelta2rs;
+  if (PyType_Ready(&__pyx_type_13nfwmodeltools___pyx_scope_struct__rdelta2rs) < 0) __PYX_ERR(0, 187, __pyx_L1_error)
+  __pyx_type_13nfwmodeltools___pyx_scope_struct__rdelta2rs.tp_print = 0;
+  __pyx_ptype_13nfwmodeltools___pyx_scope_struct__rdelta2rs = &__pyx_type_13nfwmodeltools___pyx_scope_struct__rdelta2rs;
   /*--- Type import code ---*/
   __pyx_ptype_7cpython_4type_type = __Pyx_ImportType(__Pyx_BUILTIN_MODULE_NAME, "type", 
   #if CYTHON_COMPILING_IN_PYPY
@@ -7984,7 +11572,7 @@ PyMODINIT_FUNC PyInit_nfwmodeltools(void)
   if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
 
-  /* "nfwfitter/nfwmodeltools.pyx":11
+  /* "nfwmodeltools.pyx":11
  * # cython: profile=False
  * 
  * import numpy as np             # <<<<<<<<<<<<<<
@@ -7996,7 +11584,7 @@ PyMODINIT_FUNC PyInit_nfwmodeltools(void)
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_np, __pyx_t_1) < 0) __PYX_ERR(0, 11, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":15
+  /* "nfwmodeltools.pyx":15
  * cimport cython
  * 
  * import scipy.optimize             # <<<<<<<<<<<<<<
@@ -8008,7 +11596,7 @@ PyMODINIT_FUNC PyInit_nfwmodeltools(void)
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_scipy, __pyx_t_1) < 0) __PYX_ERR(0, 15, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":17
+  /* "nfwmodeltools.pyx":17
  * import scipy.optimize
  * 
  * import nfwutils             # <<<<<<<<<<<<<<
@@ -8020,38 +11608,38 @@ PyMODINIT_FUNC PyInit_nfwmodeltools(void)
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_nfwutils, __pyx_t_1) < 0) __PYX_ERR(0, 17, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":30
+  /* "nfwmodeltools.pyx":31
  * ########################
  * 
  * __cvs_id__ = "$Id: nfwmodeltools.pyx,v 1.5 2011-02-09 01:59:14 dapple Exp $"             # <<<<<<<<<<<<<<
  * 
  * #########################
  */
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_cvs_id, __pyx_kp_s_Id_nfwmodeltools_pyx_v_1_5_2011) < 0) __PYX_ERR(0, 30, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_cvs_id, __pyx_kp_s_Id_nfwmodeltools_pyx_v_1_5_2011) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
 
-  /* "nfwfitter/nfwmodeltools.pyx":34
+  /* "nfwmodeltools.pyx":35
  * #########################
  * 
  * logsqrt2pi = np.log(np.sqrt(2*np.pi))             # <<<<<<<<<<<<<<
  * 
  * DTYPE = np.double
  */
-  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 34, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 35, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_log); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 34, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_log); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 35, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 34, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 35, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_sqrt); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 34, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_sqrt); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 35, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 34, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 35, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_pi); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 34, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_pi); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 35, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = PyNumber_Multiply(__pyx_int_2, __pyx_t_6); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 34, __pyx_L1_error)
+  __pyx_t_4 = PyNumber_Multiply(__pyx_int_2, __pyx_t_6); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 35, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   __pyx_t_6 = NULL;
@@ -8065,14 +11653,14 @@ PyMODINIT_FUNC PyInit_nfwmodeltools(void)
     }
   }
   if (!__pyx_t_6) {
-    __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 34, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 35, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_GOTREF(__pyx_t_2);
   } else {
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_5)) {
       PyObject *__pyx_temp[2] = {__pyx_t_6, __pyx_t_4};
-      __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 34, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 35, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -8081,20 +11669,20 @@ PyMODINIT_FUNC PyInit_nfwmodeltools(void)
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
       PyObject *__pyx_temp[2] = {__pyx_t_6, __pyx_t_4};
-      __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 34, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 35, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     } else
     #endif
     {
-      __pyx_t_7 = PyTuple_New(1+1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 34, __pyx_L1_error)
+      __pyx_t_7 = PyTuple_New(1+1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 35, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_7);
       __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_6); __pyx_t_6 = NULL;
       __Pyx_GIVEREF(__pyx_t_4);
       PyTuple_SET_ITEM(__pyx_t_7, 0+1, __pyx_t_4);
       __pyx_t_4 = 0;
-      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 34, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 35, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
     }
@@ -8111,14 +11699,14 @@ PyMODINIT_FUNC PyInit_nfwmodeltools(void)
     }
   }
   if (!__pyx_t_5) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 34, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 35, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_GOTREF(__pyx_t_1);
   } else {
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_3)) {
       PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_t_2};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 34, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 35, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -8127,128 +11715,195 @@ PyMODINIT_FUNC PyInit_nfwmodeltools(void)
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
       PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_t_2};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 34, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 35, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     } else
     #endif
     {
-      __pyx_t_7 = PyTuple_New(1+1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 34, __pyx_L1_error)
+      __pyx_t_7 = PyTuple_New(1+1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 35, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_7);
       __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
       __Pyx_GIVEREF(__pyx_t_2);
       PyTuple_SET_ITEM(__pyx_t_7, 0+1, __pyx_t_2);
       __pyx_t_2 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 34, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 35, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
     }
   }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_logsqrt2pi, __pyx_t_1) < 0) __PYX_ERR(0, 34, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_logsqrt2pi, __pyx_t_1) < 0) __PYX_ERR(0, 35, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":36
+  /* "nfwmodeltools.pyx":37
  * logsqrt2pi = np.log(np.sqrt(2*np.pi))
  * 
  * DTYPE = np.double             # <<<<<<<<<<<<<<
  * ctypedef np.double_t DTYPE_T
  * 
  */
-  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 36, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 37, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_double); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 36, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_double); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 37, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_DTYPE, __pyx_t_3) < 0) __PYX_ERR(0, 36, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_DTYPE, __pyx_t_3) < 0) __PYX_ERR(0, 37, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":54
+  /* "nfwmodeltools.pyx":55
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def NFWShear(np.ndarray[np.double_t, ndim=1, mode='c'] r,             # <<<<<<<<<<<<<<
  *               double concentration,
  *               double rs,
  */
-  __pyx_t_3 = PyCFunction_NewEx(&__pyx_mdef_9nfwfitter_13nfwmodeltools_1NFWShear, NULL, __pyx_n_s_nfwfitter_nfwmodeltools); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 54, __pyx_L1_error)
+  __pyx_t_3 = PyCFunction_NewEx(&__pyx_mdef_13nfwmodeltools_1NFWShear, NULL, __pyx_n_s_nfwmodeltools); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 55, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_NFWShear, __pyx_t_3) < 0) __PYX_ERR(0, 54, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_NFWShear, __pyx_t_3) < 0) __PYX_ERR(0, 55, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":97
+  /* "nfwmodeltools.pyx":98
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def NFWKappa(np.ndarray[np.double_t, ndim=1, mode='c'] r,             # <<<<<<<<<<<<<<
  *               double concentration,
  *               double rs,
  */
-  __pyx_t_3 = PyCFunction_NewEx(&__pyx_mdef_9nfwfitter_13nfwmodeltools_3NFWKappa, NULL, __pyx_n_s_nfwfitter_nfwmodeltools); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 97, __pyx_L1_error)
+  __pyx_t_3 = PyCFunction_NewEx(&__pyx_mdef_13nfwmodeltools_3NFWKappa, NULL, __pyx_n_s_nfwmodeltools); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 98, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_NFWKappa, __pyx_t_3) < 0) __PYX_ERR(0, 97, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_NFWKappa, __pyx_t_3) < 0) __PYX_ERR(0, 98, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":140
+  /* "nfwmodeltools.pyx":141
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def aveEnclosedKappa(np.ndarray[np.double_t, ndim=1, mode='c'] r,             # <<<<<<<<<<<<<<
  *                      double concentration,
  *                      double rs,
  */
-  __pyx_t_3 = PyCFunction_NewEx(&__pyx_mdef_9nfwfitter_13nfwmodeltools_5aveEnclosedKappa, NULL, __pyx_n_s_nfwfitter_nfwmodeltools); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 140, __pyx_L1_error)
+  __pyx_t_3 = PyCFunction_NewEx(&__pyx_mdef_13nfwmodeltools_5aveEnclosedKappa, NULL, __pyx_n_s_nfwmodeltools); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 141, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_aveEnclosedKappa, __pyx_t_3) < 0) __PYX_ERR(0, 140, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_aveEnclosedKappa, __pyx_t_3) < 0) __PYX_ERR(0, 141, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":186
+  /* "nfwmodeltools.pyx":187
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def rdelta2rs(double rdelta,             # <<<<<<<<<<<<<<
  *               double c200,
  *               double delta):
  */
-  __pyx_t_3 = PyCFunction_NewEx(&__pyx_mdef_9nfwfitter_13nfwmodeltools_7rdelta2rs, NULL, __pyx_n_s_nfwfitter_nfwmodeltools); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 186, __pyx_L1_error)
+  __pyx_t_3 = PyCFunction_NewEx(&__pyx_mdef_13nfwmodeltools_7rdelta2rs, NULL, __pyx_n_s_nfwmodeltools); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 187, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_rdelta2rs, __pyx_t_3) < 0) __PYX_ERR(0, 186, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_rdelta2rs, __pyx_t_3) < 0) __PYX_ERR(0, 187, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":209
+  /* "nfwmodeltools.pyx":210
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def rscaleConstM(double mdelta,             # <<<<<<<<<<<<<<
  *                  double c,
  *                  double rho_c,
  */
-  __pyx_t_3 = PyCFunction_NewEx(&__pyx_mdef_9nfwfitter_13nfwmodeltools_9rscaleConstM, NULL, __pyx_n_s_nfwfitter_nfwmodeltools); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 209, __pyx_L1_error)
+  __pyx_t_3 = PyCFunction_NewEx(&__pyx_mdef_13nfwmodeltools_9rscaleConstM, NULL, __pyx_n_s_nfwmodeltools); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 210, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_rscaleConstM, __pyx_t_3) < 0) __PYX_ERR(0, 209, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_rscaleConstM, __pyx_t_3) < 0) __PYX_ERR(0, 210, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":225
+  /* "nfwmodeltools.pyx":226
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def massInsideR(double rs,             # <<<<<<<<<<<<<<
  *                 double c,
  *                 double R,
  */
-  __pyx_t_3 = PyCFunction_NewEx(&__pyx_mdef_9nfwfitter_13nfwmodeltools_11massInsideR, NULL, __pyx_n_s_nfwfitter_nfwmodeltools); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 225, __pyx_L1_error)
+  __pyx_t_3 = PyCFunction_NewEx(&__pyx_mdef_13nfwmodeltools_11massInsideR, NULL, __pyx_n_s_nfwmodeltools); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 226, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_massInsideR, __pyx_t_3) < 0) __PYX_ERR(0, 225, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_massInsideR, __pyx_t_3) < 0) __PYX_ERR(0, 226, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":246
+  /* "nfwmodeltools.pyx":247
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * def shearprofile_like(double mdelta,             # <<<<<<<<<<<<<<
  *                       double cdelta,
  *                       np.ndarray[np.double_t, ndim=1, mode='c'] bin_r_mpc not None,
  */
-  __pyx_t_3 = PyCFunction_NewEx(&__pyx_mdef_9nfwfitter_13nfwmodeltools_13shearprofile_like, NULL, __pyx_n_s_nfwfitter_nfwmodeltools); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 246, __pyx_L1_error)
+  __pyx_t_3 = PyCFunction_NewEx(&__pyx_mdef_13nfwmodeltools_13shearprofile_like, NULL, __pyx_n_s_nfwmodeltools); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 247, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_shearprofile_like, __pyx_t_3) < 0) __PYX_ERR(0, 247, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "nfwmodeltools.pyx":324
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def nfwTemplates(np.ndarray[np.double_t, ndim=1, mode='c'] mdelta not None,             # <<<<<<<<<<<<<<
+ *                  np.ndarray[np.double_t, ndim=1, mode='c'] cdelta not None,
+ *                  np.ndarray[np.double_t, ndim=1, mode='c'] bin_r_mpc not None,
+ */
+  __pyx_t_3 = PyCFunction_NewEx(&__pyx_mdef_13nfwmodeltools_15nfwTemplates, NULL, __pyx_n_s_nfwmodeltools); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 324, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_nfwTemplates, __pyx_t_3) < 0) __PYX_ERR(0, 324, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "nfwmodeltools.pyx":364
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def shearprofile_like_batch(np.ndarray[np.double_t, ndim=2, mode='c'] gamma_inf not None,             # <<<<<<<<<<<<<<
+ *                             np.ndarray[np.double_t, ndim=2, mode='c'] kappa_inf not None,
+ *                             np.ndarray[np.double_t, ndim=2, mode='c'] bin_shear not None,
+ */
+  __pyx_t_3 = PyCFunction_NewEx(&__pyx_mdef_13nfwmodeltools_17shearprofile_like_batch, NULL, __pyx_n_s_nfwmodeltools); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 364, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_shearprofile_like_batch, __pyx_t_3) < 0) __PYX_ERR(0, 364, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "nfwmodeltools.pyx":420
+ * ######################
+ * 
+ * cdef double logsqrt2pi_c = log(sqrt(2*np.pi))             # <<<<<<<<<<<<<<
+ * 
+ * @cython.cdivision(True)
+ */
+  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 420, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_pi); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 420, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyNumber_Multiply(__pyx_int_2, __pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 420, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_t_3); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 420, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_13nfwmodeltools_logsqrt2pi_c = log(sqrt(__pyx_t_8));
+
+  /* "nfwmodeltools.pyx":462
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def shearprofile_like_grad(double mdelta,             # <<<<<<<<<<<<<<
+ *                            double cdelta,
+ *                            np.ndarray[np.double_t, ndim=1, mode='c'] bin_r_mpc not None,
+ */
+  __pyx_t_3 = PyCFunction_NewEx(&__pyx_mdef_13nfwmodeltools_19shearprofile_like_grad, NULL, __pyx_n_s_nfwmodeltools); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 462, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_shearprofile_like_grad, __pyx_t_3) < 0) __PYX_ERR(0, 462, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "nfwmodeltools.pyx":543
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def shearprofile_like_lockstep(np.ndarray[np.double_t, ndim=1, mode='c'] mdelta not None,             # <<<<<<<<<<<<<<
+ *                                np.ndarray[np.double_t, ndim=1, mode='c'] cdelta not None,
+ *                                np.ndarray[np.double_t, ndim=2, mode='c'] bin_r_mpc not None,
+ */
+  __pyx_t_3 = PyCFunction_NewEx(&__pyx_mdef_13nfwmodeltools_21shearprofile_like_lockstep, NULL, __pyx_n_s_nfwmodeltools); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 543, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_shearprofile_like, __pyx_t_3) < 0) __PYX_ERR(0, 246, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_shearprofile_like_lockstep, __pyx_t_3) < 0) __PYX_ERR(0, 543, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "nfwfitter/nfwmodeltools.pyx":1
+  /* "nfwmodeltools.pyx":1
  * ##########################             # <<<<<<<<<<<<<<
  * # Implements an NFW model for investigation
  * # of redshift and contamination effects
@@ -8279,11 +11934,11 @@ PyMODINIT_FUNC PyInit_nfwmodeltools(void)
   __Pyx_XDECREF(__pyx_t_7);
   if (__pyx_m) {
     if (__pyx_d) {
-      __Pyx_AddTraceback("init nfwfitter.nfwmodeltools", __pyx_clineno, __pyx_lineno, __pyx_filename);
+      __Pyx_AddTraceback("init nfwmodeltools", __pyx_clineno, __pyx_lineno, __pyx_filename);
     }
     Py_DECREF(__pyx_m); __pyx_m = 0;
   } else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_ImportError, "init nfwfitter.nfwmodeltools");
+    PyErr_SetString(PyExc_ImportError, "init nfwmodeltools");
   }
   __pyx_L0:;
   __Pyx_RefNannyFinishContext();
@@ -8312,6 +11967,20 @@ end:
 }
 #endif
 
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
 /* PyErrFetchRestore */
 #if CYTHON_FAST_THREAD_STATE
 static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
@@ -9097,20 +12766,6 @@ static CYTHON_INLINE void __Pyx_SafeReleaseBuffer(Py_buffer* info) {
   __Pyx_ReleaseBuffer(info);
 }
 
-/* GetBuiltinName */
-  static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
-    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
-    if (unlikely(!result)) {
-        PyErr_Format(PyExc_NameError,
-#if PY_MAJOR_VERSION >= 3
-            "name '%U' is not defined", name);
-#else
-            "name '%.200s' is not defined", PyString_AS_STRING(name));
-#endif
-    }
-    return result;
-}
-
 /* GetModuleGlobalName */
   static CYTHON_INLINE PyObject *__Pyx_GetModuleGlobalName(PyObject *name) {
     PyObject *result;
@@ -10108,8 +13763,137 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObjec
      "Buffer acquisition failed on assignment; and then reacquiring the old buffer failed too!");
 }
 
+/* SetItemInt */
+          static CYTHON_INLINE int __Pyx_SetItemInt_Generic(PyObject *o, PyObject *j, PyObject *v) {
+    int r;
+    if (!j) return -1;
+    r = PyObject_SetItem(o, j, v);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE int __Pyx_SetItemInt_Fast(PyObject *o, Py_ssize_t i, PyObject *v, int is_list,
+                                               CYTHON_NCP_UNUSED int wraparound, CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = (!wraparound) ? i : ((likely(i >= 0)) ? i : i + PyList_GET_SIZE(o));
+        if ((!boundscheck) || likely((n >= 0) & (n < PyList_GET_SIZE(o)))) {
+            PyObject* old = PyList_GET_ITEM(o, n);
+            Py_INCREF(v);
+            PyList_SET_ITEM(o, n, v);
+            Py_DECREF(old);
+            return 1;
+        }
+    } else {
+        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+        if (likely(m && m->sq_ass_item)) {
+            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+                Py_ssize_t l = m->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return -1;
+                    PyErr_Clear();
+                }
+            }
+            return m->sq_ass_item(o, i, v);
+        }
+    }
+#else
+#if CYTHON_COMPILING_IN_PYPY
+    if (is_list || (PySequence_Check(o) && !PyDict_Check(o))) {
+#else
+    if (is_list || PySequence_Check(o)) {
+#endif
+        return PySequence_SetItem(o, i, v);
+    }
+#endif
+    return __Pyx_SetItemInt_Generic(o, PyInt_FromSsize_t(i), v);
+}
+
+/* GetItemInt */
+            static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (!j) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    if (wraparound & unlikely(i < 0)) i += PyList_GET_SIZE(o);
+    if ((!boundscheck) || likely((0 <= i) & (i < PyList_GET_SIZE(o)))) {
+        PyObject *r = PyList_GET_ITEM(o, i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    if (wraparound & unlikely(i < 0)) i += PyTuple_GET_SIZE(o);
+    if ((!boundscheck) || likely((0 <= i) & (i < PyTuple_GET_SIZE(o)))) {
+        PyObject *r = PyTuple_GET_ITEM(o, i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     CYTHON_NCP_UNUSED int wraparound,
+                                                     CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((!boundscheck) || (likely((n >= 0) & (n < PyList_GET_SIZE(o))))) {
+            PyObject *r = PyList_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    else if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely((n >= 0) & (n < PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    } else {
+        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+        if (likely(m && m->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+                Py_ssize_t l = m->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return NULL;
+                    PyErr_Clear();
+                }
+            }
+            return m->sq_item(o, i);
+        }
+    }
+#else
+    if (is_list || PySequence_Check(o)) {
+        return PySequence_GetItem(o, i);
+    }
+#endif
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+}
+
 /* RaiseException */
-          #if PY_MAJOR_VERSION < 3
+            #if PY_MAJOR_VERSION < 3
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
                         CYTHON_UNUSED PyObject *cause) {
     __Pyx_PyThreadState_declare
@@ -10271,26 +14055,94 @@ bad:
 }
 #endif
 
+/* PyFloatBinop */
+              #if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyFloat_DivideObjC(PyObject *op1, PyObject *op2, double floatval, CYTHON_UNUSED int inplace) {
+    const double b = floatval;
+    double a, result;
+    if (likely(PyFloat_CheckExact(op1))) {
+        a = PyFloat_AS_DOUBLE(op1);
+    } else
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op1))) {
+        a = (double) PyInt_AS_LONG(op1);
+    } else
+    #endif
+    if (likely(PyLong_CheckExact(op1))) {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        const digit* digits = ((PyLongObject*)op1)->ob_digit;
+        const Py_ssize_t size = Py_SIZE(op1);
+        switch (size) {
+            case  0: a = 0.0; break;
+            case -1: a = -(double) digits[0]; break;
+            case  1: a = (double) digits[0]; break;
+            case -2:
+            case 2:
+                if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (1 * PyLong_SHIFT < 53))) {
+                    a = (double) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if ((8 * sizeof(unsigned long) < 53) || (2 * PyLong_SHIFT < 53) || (a < (double) (1L<<53))) {
+                        if (size == -2)
+                            a = -a;
+                        break;
+                    }
+                }
+            case -3:
+            case 3:
+                if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (2 * PyLong_SHIFT < 53))) {
+                    a = (double) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if ((8 * sizeof(unsigned long) < 53) || (3 * PyLong_SHIFT < 53) || (a < (double) (1L<<53))) {
+                        if (size == -3)
+                            a = -a;
+                        break;
+                    }
+                }
+            case -4:
+            case 4:
+                if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (3 * PyLong_SHIFT < 53))) {
+                    a = (double) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if ((8 * sizeof(unsigned long) < 53) || (4 * PyLong_SHIFT < 53) || (a < (double) (1L<<53))) {
+                        if (size == -4)
+                            a = -a;
+                        break;
+                    }
+                }
+            default:
+        #else
+        {
+        #endif
+            a = PyLong_AsDouble(op1);
+            if (unlikely(a == -1.0 && PyErr_Occurred())) return NULL;
+        }
+    } else {
+        return (inplace ? __Pyx_PyNumber_InPlaceDivide(op1, op2) : __Pyx_PyNumber_Divide(op1, op2));
+    }
+        PyFPE_START_PROTECT("divide", return NULL)
+        result = a / b;
+        PyFPE_END_PROTECT(result)
+        return PyFloat_FromDouble(result);
+}
+#endif
+
 /* RaiseTooManyValuesToUnpack */
-            static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
+                static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
     PyErr_Format(PyExc_ValueError,
                  "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
 }
 
 /* RaiseNeedMoreValuesToUnpack */
-            static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
+                static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
     PyErr_Format(PyExc_ValueError,
                  "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
                  index, (index == 1) ? "" : "s");
 }
 
 /* RaiseNoneIterError */
-            static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
+                static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
 }
 
 /* SaveResetException */
-            #if CYTHON_FAST_THREAD_STATE
+                #if CYTHON_FAST_THREAD_STATE
 static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
     *type = tstate->exc_type;
     *value = tstate->exc_value;
@@ -10314,7 +14166,7 @@ static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject
 #endif
 
 /* PyErrExceptionMatches */
-            #if CYTHON_FAST_THREAD_STATE
+                #if CYTHON_FAST_THREAD_STATE
 static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
     PyObject *exc_type = tstate->curexc_type;
     if (exc_type == err) return 1;
@@ -10324,7 +14176,7 @@ static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tsta
 #endif
 
 /* GetException */
-            #if CYTHON_FAST_THREAD_STATE
+                #if CYTHON_FAST_THREAD_STATE
 static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
 #else
 static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb) {
@@ -10385,7 +14237,7 @@ bad:
 }
 
 /* Import */
-              static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+                  static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
     PyObject *empty_list = 0;
     PyObject *module = 0;
     PyObject *global_dict = 0;
@@ -10459,7 +14311,7 @@ bad:
 }
 
 /* CodeObjectCache */
-              static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+                  static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
     int start = 0, mid = 0, end = count - 1;
     if (end >= 0 && code_line > entries[end].code_line) {
         return count;
@@ -10539,7 +14391,7 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
 }
 
 /* AddTraceback */
-              #include "compile.h"
+                  #include "compile.h"
 #include "frameobject.h"
 #include "traceback.h"
 static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
@@ -10640,8 +14492,8 @@ static void __Pyx_ReleaseBuffer(Py_buffer *view) {
 #endif
 
 
-              /* CIntToPy */
-              static CYTHON_INLINE PyObject* __Pyx_PyInt_From_Py_intptr_t(Py_intptr_t value) {
+                  /* CIntToPy */
+                  static CYTHON_INLINE PyObject* __Pyx_PyInt_From_Py_intptr_t(Py_intptr_t value) {
     const Py_intptr_t neg_one = (Py_intptr_t) -1, const_zero = (Py_intptr_t) 0;
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
@@ -10672,7 +14524,7 @@ static void __Pyx_ReleaseBuffer(Py_buffer *view) {
 }
 
 /* Declarations */
-              #if CYTHON_CCOMPLEX
+                  #if CYTHON_CCOMPLEX
   #ifdef __cplusplus
     static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
       return ::std::complex< float >(x, y);
@@ -10692,7 +14544,7 @@ static void __Pyx_ReleaseBuffer(Py_buffer *view) {
 #endif
 
 /* Arithmetic */
-              #if CYTHON_CCOMPLEX
+                  #if CYTHON_CCOMPLEX
 #else
     static CYTHON_INLINE int __Pyx_c_eq_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
        return (a.real == b.real) && (a.imag == b.imag);
@@ -10827,7 +14679,7 @@ static void __Pyx_ReleaseBuffer(Py_buffer *view) {
 #endif
 
 /* Declarations */
-              #if CYTHON_CCOMPLEX
+                  #if CYTHON_CCOMPLEX
   #ifdef __cplusplus
     static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
       return ::std::complex< double >(x, y);
@@ -10847,7 +14699,7 @@ static void __Pyx_ReleaseBuffer(Py_buffer *view) {
 #endif
 
 /* Arithmetic */
-              #if CYTHON_CCOMPLEX
+                  #if CYTHON_CCOMPLEX
 #else
     static CYTHON_INLINE int __Pyx_c_eq_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
        return (a.real == b.real) && (a.imag == b.imag);
@@ -10982,7 +14834,7 @@ static void __Pyx_ReleaseBuffer(Py_buffer *view) {
 #endif
 
 /* CIntToPy */
-              static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+                  static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
     const int neg_one = (int) -1, const_zero = (int) 0;
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
@@ -11013,7 +14865,7 @@ static void __Pyx_ReleaseBuffer(Py_buffer *view) {
 }
 
 /* CIntFromPyVerify */
-              #define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+                  #define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
     __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
 #define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
     __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
@@ -11035,7 +14887,7 @@ static void __Pyx_ReleaseBuffer(Py_buffer *view) {
     }
 
 /* CIntToPy */
-              static CYTHON_INLINE PyObject* __Pyx_PyInt_From_enum__NPY_TYPES(enum NPY_TYPES value) {
+                  static CYTHON_INLINE PyObject* __Pyx_PyInt_From_enum__NPY_TYPES(enum NPY_TYPES value) {
     const enum NPY_TYPES neg_one = (enum NPY_TYPES) -1, const_zero = (enum NPY_TYPES) 0;
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
@@ -11066,7 +14918,7 @@ static void __Pyx_ReleaseBuffer(Py_buffer *view) {
 }
 
 /* CIntFromPy */
-              static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+                  static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
     const int neg_one = (int) -1, const_zero = (int) 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
@@ -11255,7 +15107,7 @@ raise_neg_overflow:
 }
 
 /* CIntToPy */
-              static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+                  static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
     const long neg_one = (long) -1, const_zero = (long) 0;
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
@@ -11286,7 +15138,7 @@ raise_neg_overflow:
 }
 
 /* CIntFromPy */
-              static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+                  static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
     const long neg_one = (long) -1, const_zero = (long) 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
@@ -11475,7 +15327,7 @@ raise_neg_overflow:
 }
 
 /* CheckBinaryVersion */
-              static int __Pyx_check_binary_version(void) {
+                  static int __Pyx_check_binary_version(void) {
     char ctversion[4], rtversion[4];
     PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
     PyOS_snprintf(rtversion, 4, "%s", Py_GetVersion());
@@ -11491,7 +15343,7 @@ raise_neg_overflow:
 }
 
 /* ModuleImport */
-              #ifndef __PYX_HAVE_RT_ImportModule
+                  #ifndef __PYX_HAVE_RT_ImportModule
 #define __PYX_HAVE_RT_ImportModule
 static PyObject *__Pyx_ImportModule(const char *name) {
     PyObject *py_name = 0;
@@ -11509,7 +15361,7 @@ bad:
 #endif
 
 /* TypeImport */
-              #ifndef __PYX_HAVE_RT_ImportType
+                  #ifndef __PYX_HAVE_RT_ImportType
 #define __PYX_HAVE_RT_ImportType
 static PyTypeObject *__Pyx_ImportType(const char *module_name, const char *class_name,
     size_t size, int strict)
@@ -11574,7 +15426,7 @@ bad:
 #endif
 
 /* InitStrings */
-              static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+                  static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
     while (t->p) {
         #if PY_MAJOR_VERSION < 3
         if (t->is_unicode) {
@@ -17,11 +17,12 @@ import scipy.optimize
 import nfwutils
 
 cdef extern from "math.h":
-    double exp(double)
-    double log(double)
-    double atanh(double)
-    double sqrt(double)
-    double atan(double)
+    double exp(double) nogil
+    double log(double) nogil
+    double atanh(double) nogil
+    double sqrt(double) nogil
+    double atan(double) nogil
+    double fabs(double) nogil
 
 
 
@@ -43,7 +44,7 @@ ctypedef np.double_t DTYPE_T
 # NFW Profile
 ############################
 
-cdef double deltaC(double c, double delta = 200.):
+cdef double deltaC(double c, double delta = 200.) nogil:
     return (delta/3.) * c**3 / (log(1+c) - c/(1+c))
 
 ##############
@@ -312,3 +313,287 @@ for lensing
     
     
                       
+
+
+######################
+# Batched likelihoods: many profiles sharing radial bins & redshift
+######################
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def nfwTemplates(np.ndarray[np.double_t, ndim=1, mode='c'] mdelta not None,
+                 np.ndarray[np.double_t, ndim=1, mode='c'] cdelta not None,
+                 np.ndarray[np.double_t, ndim=1, mode='c'] bin_r_mpc not None,
+                 double rho_c,
+                 double rho_c_over_sigma_c,
+                 double massdelta):
+
+    '''Shear and convergence for a source at infinite redshift, for each (mdelta, cdelta) pair,
+    as (nmasses x nbins) arrays. Same conventions as shearprofile_like: negative masses flip the 
+    sign of the shear, zero mass gives zero signal.'''
+
+    cdef Py_ssize_t nmasses = mdelta.shape[0]
+    cdef Py_ssize_t nbins = bin_r_mpc.shape[0]
+
+    cdef np.ndarray[DTYPE_T, ndim=2, mode='c'] gamma_inf = np.zeros((nmasses, nbins), dtype=np.float64)
+    cdef np.ndarray[DTYPE_T, ndim=2, mode='c'] kappa_inf = np.zeros((nmasses, nbins), dtype=np.float64)
+
+    cdef Py_ssize_t m
+    cdef double rdelta, rscale
+
+    for m from 0 <= m < nmasses:
+
+        if mdelta[m] == 0:
+            continue
+
+        rdelta = (3*abs(mdelta[m])/(4*massdelta*np.pi*rho_c))**(1./3.)
+        rscale = rdelta / cdelta[m]
+
+        gamma_inf[m] = NFWShear(bin_r_mpc, cdelta[m], rscale, rho_c_over_sigma_c, delta = massdelta)
+        kappa_inf[m] = NFWKappa(bin_r_mpc, cdelta[m], rscale, rho_c_over_sigma_c, delta = massdelta)
+
+        if mdelta[m] < 0.:
+            gamma_inf[m] = -gamma_inf[m]
+
+    return gamma_inf, kappa_inf
+
+#######################
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def shearprofile_like_batch(np.ndarray[np.double_t, ndim=2, mode='c'] gamma_inf not None,
+                            np.ndarray[np.double_t, ndim=2, mode='c'] kappa_inf not None,
+                            np.ndarray[np.double_t, ndim=2, mode='c'] bin_shear not None,
+                            np.ndarray[np.double_t, ndim=2, mode='c'] bin_shearerr not None,
+                            np.ndarray[np.double_t, ndim=2, mode='c'] avebeta not None,
+                            np.ndarray[np.double_t, ndim=2, mode='c'] avebeta2 not None):
+
+    '''Log likelihood of shearprofile_like for every (profile, model) pair, as (nprofiles x nmodels).
+
+    gamma_inf, kappa_inf are (nmodels x nbins) templates from nfwTemplates. Profile arrays are
+    (nprofiles x nbins). Bins with bin_shearerr <= 0 are empty and are skipped.'''
+
+    cdef Py_ssize_t nmodels = gamma_inf.shape[0]
+    cdef Py_ssize_t nprofiles = bin_shear.shape[0]
+    cdef Py_ssize_t nbins = bin_shear.shape[1]
+
+    assert(gamma_inf.shape[1] == nbins)
+
+    cdef np.ndarray[DTYPE_T, ndim=2, mode='c'] logProb = np.zeros((nprofiles, nmodels), dtype=np.float64)
+
+    cdef np.ndarray[DTYPE_T, ndim=1, mode='c'] betaratio = np.zeros(nbins, dtype=np.float64)
+    cdef np.ndarray[DTYPE_T, ndim=1, mode='c'] invsig = np.zeros(nbins, dtype=np.float64)
+
+    cdef Py_ssize_t p, m, i
+    cdef double norm, modelg, delta, curlogprob
+
+    for p from 0 <= p < nprofiles:
+
+        norm = 0.
+        for i from 0 <= i < nbins:
+            if bin_shearerr[p,i] > 0:
+                betaratio[i] = avebeta2[p,i]/avebeta[p,i]
+                invsig[i] = 1./bin_shearerr[p,i]
+                norm = norm - logsqrt2pi - log(bin_shearerr[p,i])
+            else:
+                invsig[i] = 0.
+
+        for m from 0 <= m < nmodels:
+
+            curlogprob = norm
+            for i from 0 <= i < nbins:
+                if invsig[i] == 0.:
+                    continue
+                modelg = avebeta[p,i]*gamma_inf[m,i] / (1 - betaratio[i]*kappa_inf[m,i])
+                delta = (bin_shear[p,i] - modelg)*invsig[i]
+                curlogprob = curlogprob - .5*delta*delta
+
+            logProb[p,m] = curlogprob
+
+    return logProb
+
+
+######################
+# Likelihood gradients, for Newton-type fits and Laplace approximations
+######################
+
+cdef double logsqrt2pi_c = log(sqrt(2*np.pi))
+
+@cython.cdivision(True)
+cdef inline void nfwProfileDerivs(double x, double * G, double * dG, double * K, double * dK) nogil:
+    '''Dimensionless shear G = 4E - 2Kf and convergence K = 2Kf at x = r/rs, and d/dx of both.
+    E = (F + ln(x/2))/x^2, Kf = (1 - F)/(x^2 - 1), with F = 2a/b sharing the atanh/atan term.'''
+
+    cdef double a, b, F, dF, Kf, dKf, E, dE
+    cdef double e = x - 1.
+    cdef double x2m1 = x*x - 1.
+
+    if fabs(e) < 1e-4:
+        #series about x = 1
+        F = 1. - 2.*e/3. + 7.*e*e/15.
+        dF = -2./3. + 14.*e/15.
+        Kf = 1./3. - 0.4*e
+        dKf = -0.4
+    else:
+        if x < 1:
+            a = atanh(sqrt((1-x)/(1+x)))
+            b = sqrt(1-x*x)
+        else:
+            a = atan(sqrt((x-1)/(1+x)))
+            b = sqrt(x*x-1)
+        F = 2*a/b
+        dF = (1. - x*x*F)/(x*x2m1)
+        Kf = (1. - F)/x2m1
+        dKf = (-dF*x2m1 - 2.*x*(1. - F))/(x2m1*x2m1)
+
+    E = (F + log(x/2.))/(x*x)
+    dE = (dF + 1./x)/(x*x) - 2.*E/x
+
+    G[0] = 4.*E - 2.*Kf
+    dG[0] = 4.*dE - 2.*dKf
+    K[0] = 2.*Kf
+    dK[0] = 2.*dKf
+
+###
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def shearprofile_like_grad(double mdelta,
+                           double cdelta,
+                           np.ndarray[np.double_t, ndim=1, mode='c'] bin_r_mpc not None,
+                           np.ndarray[np.double_t, ndim=1, mode='c'] bin_shear not None,
+                           np.ndarray[np.double_t, ndim=1, mode='c'] bin_shearerr not None,
+                           np.ndarray[np.double_t, ndim=1, mode='c'] avebeta not None,
+                           np.ndarray[np.double_t, ndim=1, mode='c'] avebeta2 not None,
+                           double rho_c,
+                           double rho_c_over_sigma_c,
+                           double massdelta):
+
+    '''shearprofile_like, its gradient with respect to (log mdelta, cdelta), and the Fisher matrix
+    (the expected value of minus the Hessian) in the same parameters. mdelta must be positive.
+
+    Returns (logProb, grad, fisher).'''
+
+    if mdelta <= 0:
+        raise ValueError('mdelta must be positive')
+
+    cdef Py_ssize_t nbins = bin_r_mpc.shape[0]
+
+    cdef double rdelta = (3*mdelta/(4*massdelta*np.pi*rho_c))**(1./3.)
+    cdef double rs = rdelta / cdelta
+    cdef double mc = log(1. + cdelta) - cdelta/(1. + cdelta)
+    cdef double ks = rs*deltaC(cdelta, delta = massdelta)*rho_c_over_sigma_c
+
+    #d ln ks and d ln x with respect to (ln M, c)
+    cdef double dlnks_dlnm = 1./3.
+    cdef double dlnks_dc = 2./cdelta - (cdelta/((1. + cdelta)*(1. + cdelta)))/mc
+    cdef double dlnx_dlnm = -1./3.
+    cdef double dlnx_dc = 1./cdelta
+
+    cdef double logProb = 0.
+    cdef double grad0 = 0., grad1 = 0.
+    cdef double fisher00 = 0., fisher01 = 0., fisher11 = 0.
+
+    cdef Py_ssize_t i
+    cdef double x, G, dG, K, dK
+    cdef double gamma, kappa, dgamma0, dgamma1, dkappa0, dkappa1
+    cdef double betaratio, denom, modelg, dg0, dg1, invvar, resid
+
+    with nogil:
+        for i from 0 <= i < nbins:
+
+            x = bin_r_mpc[i]/rs
+            nfwProfileDerivs(x, &G, &dG, &K, &dK)
+
+            gamma = ks*G
+            kappa = ks*K
+            dgamma0 = dlnks_dlnm*gamma + dlnx_dlnm*ks*x*dG
+            dgamma1 = dlnks_dc*gamma + dlnx_dc*ks*x*dG
+            dkappa0 = dlnks_dlnm*kappa + dlnx_dlnm*ks*x*dK
+            dkappa1 = dlnks_dc*kappa + dlnx_dc*ks*x*dK
+
+            betaratio = avebeta2[i]/avebeta[i]
+            denom = 1. - betaratio*kappa
+            modelg = avebeta[i]*gamma/denom
+            dg0 = avebeta[i]*(dgamma0 + gamma*betaratio*dkappa0/denom)/denom
+            dg1 = avebeta[i]*(dgamma1 + gamma*betaratio*dkappa1/denom)/denom
+
+            invvar = 1./(bin_shearerr[i]*bin_shearerr[i])
+            resid = bin_shear[i] - modelg
+
+            logProb += -.5*resid*resid*invvar - logsqrt2pi_c - log(bin_shearerr[i])
+            grad0 += dg0*resid*invvar
+            grad1 += dg1*resid*invvar
+            fisher00 += dg0*dg0*invvar
+            fisher01 += dg0*dg1*invvar
+            fisher11 += dg1*dg1*invvar
+
+    return (logProb, 
+            np.array([grad0, grad1]), 
+            np.array([[fisher00, fisher01], [fisher01, fisher11]]))
+
+######################
+# Lockstep likelihoods: many profiles, each at its own model
+######################
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def shearprofile_like_lockstep(np.ndarray[np.double_t, ndim=1, mode='c'] mdelta not None,
+                               np.ndarray[np.double_t, ndim=1, mode='c'] cdelta not None,
+                               np.ndarray[np.double_t, ndim=2, mode='c'] bin_r_mpc not None,
+                               np.ndarray[np.double_t, ndim=2, mode='c'] bin_shear not None,
+                               np.ndarray[np.double_t, ndim=2, mode='c'] bin_shearerr not None,
+                               np.ndarray[np.double_t, ndim=2, mode='c'] avebeta not None,
+                               np.ndarray[np.double_t, ndim=2, mode='c'] avebeta2 not None,
+                               np.ndarray[np.double_t, ndim=1, mode='c'] rho_c not None,
+                               np.ndarray[np.double_t, ndim=1, mode='c'] rho_c_over_sigma_c not None,
+                               double massdelta):
+
+    '''shearprofile_like of profile p at (mdelta[p], cdelta[p]), for every p at once. 
+    Profile arrays are (nprofiles x nbins); rho_c and rho_c_over_sigma_c are per profile.
+    Bins with bin_shearerr <= 0 are padding and are skipped. Returns nprofiles log likelihoods.'''
+
+    cdef Py_ssize_t nprofiles = bin_shear.shape[0]
+    cdef Py_ssize_t nbins = bin_shear.shape[1]
+
+    assert(mdelta.shape[0] == nprofiles and cdelta.shape[0] == nprofiles)
+    assert(rho_c.shape[0] == nprofiles and rho_c_over_sigma_c.shape[0] == nprofiles)
+
+    cdef np.ndarray[DTYPE_T, ndim=1, mode='c'] logProb = np.zeros(nprofiles, dtype=np.float64)
+
+    cdef Py_ssize_t p, i
+    cdef double rs, ks, sign, curlogprob
+    cdef double x, G, dG, K, dK, modelg, delta
+    cdef double fourpi_over_3 = 4.*np.pi/3.
+
+    with nogil:
+        for p from 0 <= p < nprofiles:
+
+            sign = 1.
+            if mdelta[p] < 0:
+                sign = -1.
+
+            if mdelta[p] != 0:
+                rs = (fabs(mdelta[p])/(fourpi_over_3*massdelta*rho_c[p]))**(1./3.) / cdelta[p]
+                ks = rs*deltaC(cdelta[p], massdelta)*rho_c_over_sigma_c[p]
+
+            curlogprob = 0.
+            for i from 0 <= i < nbins:
+
+                if bin_shearerr[p,i] <= 0:
+                    continue
+
+                modelg = 0.
+                if mdelta[p] != 0:
+                    x = bin_r_mpc[p,i]/rs
+                    nfwProfileDerivs(x, &G, &dG, &K, &dK)
+                    modelg = avebeta[p,i]*sign*ks*G / (1 - (avebeta2[p,i]/avebeta[p,i])*ks*K)
+
+                delta = (bin_shear[p,i] - modelg)/bin_shearerr[p,i]
+                curlogprob = curlogprob - .5*delta*delta - logsqrt2pi_c - log(bin_shearerr[p,i])
+
+            logProb[p] = curlogprob
+
+    return logProb
@@ -111,34 +111,9 @@ def fitClusterSet(config, zcluster, r_mpcs, beta_s, shearprofiles, shearerrs):
 
     fitter = nfwfit.buildFitter(config)
 
-    fitMasses = np.zeros(len(shearprofiles))
-    fitErrs = np.zeros(len(shearprofiles))
-    mask = np.ones(len(shearprofiles))
+    fitMasses, fitErrs, mask = fitter.fitProfiles(r_mpcs, shearprofiles, shearerrs, beta_s, beta_s**2, zcluster)
 
-    for i in range(len(shearprofiles)):
-
-        fitres = fitter.minChisqMethod(r_mpcs[i], shearprofiles[i], shearerrs[i], beta_s, beta_s**2, zcluster)
-        if fitres is None:
-            fitres = fitter.minChisqMethod(r_mpcs[i], shearprofiles[i], shearerrs[i], beta_s, beta_s**2, 
-                                           zcluster, useSimplex=True)
-
-        if fitres is None:
-            mask[i] = 0
-        else:
-
-            
-
-            fitMasses[i] = fitres[0]['m200']*fitter.model.massScale
-#            fitMasses[i] = nfwutils.Mdelta(fitres[0]['rscale'], 4.0, zcluster, 200.)
-            asymerrs = fitres[1]['m200']
-            try:
-                fitErrs[i] = fitter.model.massScale*(asymerrs[1] - asymerrs[0])/2.
-            except TypeError:
-                fitErrs[i] = asymerrs
-#
-#    mask = (mask == 1)
-
-    return fitMasses, fitErrs, mask
+    return fitMasses, fitErrs, mask.astype(np.float64)
 
 #    return fitMasses, mask
 
@@ -332,14 +307,26 @@ def calcMassUncert(config, r_mpc, beta_s, zcluster, shearprofiles, shearerr,
                    testmasses = np.arange(-5.02e15, 5e15, 5e13)):
 
     likelihood = Likelihood(config)
+    likelihood.bindData(r_mpc, shearprofiles[0], shearerr, beta_s, zcluster)
 
     nclusters = len(shearprofiles)
 
     testconcens = np.linspace(1.1, 19.9, 100)
     CGrid, MGrid = np.meshgrid(testconcens, testmasses)
-    logprobgrid = np.zeros_like(CGrid)
-    probgrid = np.zeros_like(logprobgrid)
-    margprobgrid = np.zeros_like(testmasses)
+
+    #the model grid is the same for every cluster; evaluate it once
+    gamma_inf, kappa_inf = tools.nfwTemplates(np.ascontiguousarray(MGrid.flatten(), dtype=np.float64),
+                                              np.ascontiguousarray(CGrid.flatten(), dtype=np.float64),
+                                              np.ascontiguousarray(r_mpc, dtype=np.float64),
+                                              likelihood.rho_c,
+                                              likelihood.rho_c_over_sigma_c,
+                                              200.)
+
+    nbins = len(r_mpc)
+    binshape = (1, nbins)
+    bin_shearerr = np.ascontiguousarray(np.broadcast_to(shearerr, binshape), dtype=np.float64)
+    avebeta = np.ascontiguousarray(np.broadcast_to(likelihood.beta_s, binshape), dtype=np.float64)
+    avebeta2 = np.ascontiguousarray(np.broadcast_to(likelihood.beta_s2, binshape), dtype=np.float64)
 
     massprobs = np.zeros((nclusters, len(testmasses)))
 
@@ -347,15 +334,15 @@ def calcMassUncert(config, r_mpc, beta_s, zcluster, shearprofiles, shearerr,
 
     for curcluster in range(nclusters):
 
-        likelihood.bindData(r_mpc, shearprofiles[curcluster], shearerr, beta_s, zcluster)
+        bin_shear = np.ascontiguousarray(np.reshape(shearprofiles[curcluster], binshape), dtype=np.float64)
 
-        for i in range(logprobgrid.shape[0]):
-            for j in range(logprobgrid.shape[1]):
-                logprobgrid[i,j] = likelihood(MGrid[i,j], CGrid[i,j])
+        logprobgrid = tools.shearprofile_like_batch(gamma_inf, kappa_inf, 
+                                                    bin_shear, bin_shearerr, 
+                                                    avebeta, avebeta2)[0].reshape(CGrid.shape)
 
-        probgrid[:] = np.exp(logprobgrid - np.max(logprobgrid))
+        probgrid = np.exp(logprobgrid - np.max(logprobgrid))
         probgrid /= np.sum(probgrid)
-        margprobgrid[:] = np.sum(probgrid, axis=1)
+        margprobgrid = np.sum(probgrid, axis=1)
         
         massprobs[curcluster,:] = margprobgrid
 
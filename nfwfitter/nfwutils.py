@@ -183,6 +183,12 @@ std_cosmology = CosmologySingleton(isMutable = False)
 global_cosmology = CosmologySingleton()
 
 
+def cosmologyKey(cosmology = global_cosmology):
+    '''Hashable summary of a cosmology, for caches that must not be reused across cosmologies'''
+
+    return (cosmology.omega_m, cosmology.omega_l, cosmology.omega_r, cosmology.h, cosmology.w, cosmology.G)
+
+
 ##################################
 
 def deltaC(c, delta = 200.):
@@ -1,9 +1,14 @@
 ''' Set of utilities that read in simulation files and output shear profiles'''
 ##########################
 
+import unittest
 import numpy as np
 
 import nfwutils
+import catalog
+import basicBinning
+import rngstreams
+import instrument
 
 #########################
 
@@ -27,14 +32,20 @@ class ProfileBuilder(object):
         self.binnoiser = config['binnoiser']
 
 
-    def __call__(self, sim):
+    def prepareGalaxies(self, sim, streams = None, timer = None):
+        '''Rescale, select, assign betas and add shape noise. Everything before centering.
+        If given, each stage draws from its own stream of an rngstreams.RNGStreams,
+        and is timed by an instrument.StageTimer.'''
 
-        rescaledsim = self.rescalecluster(sim)
+        with rngstreams.stage(streams, 'rescalecluster'), instrument.stage(timer, 'rescalecluster'):
+            rescaledsim = self.rescalecluster(sim)
 
-        galaxies = self.galaxypicker(rescaledsim)
+        with rngstreams.stage(streams, 'galaxypicker'), instrument.stage(timer, 'galaxypicker'):
+            galaxies = self.galaxypicker(rescaledsim)
 
 
-        galaxies3d = self.betacalcer(galaxies)
+        with rngstreams.stage(streams, 'betacalcer'), instrument.stage(timer, 'betacalcer'):
+            galaxies3d = self.betacalcer(galaxies)
 
 
 
@@ -51,10 +62,18 @@ class ProfileBuilder(object):
         verifyShear(galaxies_noarcs, 'g2')
 
         
-        noisygalaxies = self.shearnoiser(galaxies_noarcs)
+        with rngstreams.stage(streams, 'shearnoiser'), instrument.stage(timer, 'shearnoiser'):
+            noisygalaxies = self.shearnoiser(galaxies_noarcs)
 
+        return noisygalaxies
 
-        centeroffsetx, centeroffsety = self.centergenerator(noisygalaxies)
+
+    def __call__(self, sim, streams = None, timer = None):
+
+        noisygalaxies = self.prepareGalaxies(sim, streams, timer)
+
+        with rngstreams.stage(streams, 'centergenerator'), instrument.stage(timer, 'centergenerator'):
+            centeroffsetx, centeroffsety = self.centergenerator(noisygalaxies)
         print 'Center Offset:', centeroffsetx, centeroffsety
 
         delta_x = noisygalaxies.x_arcmin - centeroffsetx
@@ -91,7 +110,8 @@ class ProfileBuilder(object):
 
         
         
-        profile = self.binner(noisygalaxies)
+        with rngstreams.stage(streams, 'binner'), instrument.stage(timer, 'binner'):
+            profile = self.binner(noisygalaxies)
 
 
 
@@ -101,7 +121,8 @@ class ProfileBuilder(object):
         cleanprofile.zcluster = noisygalaxies.zcluster
         cleanprofile.zlens = noisygalaxies.zlens
 
-        noisyprofile = self.binnoiser(cleanprofile)
+        with rngstreams.stage(streams, 'binnoiser'), instrument.stage(timer, 'binnoiser'):
+            noisyprofile = self.binnoiser(cleanprofile)
 
 
 
@@ -110,4 +131,185 @@ class ProfileBuilder(object):
 
     
 
+#####
+
+
+class MultiCenterProfileBuilder(ProfileBuilder):
+    '''Builds shear profiles for many center realizations of the same halo.
+
+    Rescaling, galaxy selection, betas and shape noise are done once; then ncenters offsets
+    are drawn from the centergenerator and all tangential shear profiles are binned together,
+    in blocks of centers so that at most multicenter_blocksize (galaxy x center) elements
+    are in memory at a time. Profiles are binned as GaussianFixedBins does, so the binner
+    must be one (with binEdges and shapenoise); bootstrapped errors are not reproduced.
+
+    Returns a catalog with one row per center, holding (ncenters x nbins) profile arrays
+    (empty bins flagged with sigma_ghat = -1). Use unstack to get individual profiles.'''
+
+    def configure(self, config):
+
+        super(MultiCenterProfileBuilder, self).configure(config)
+
+        if not isinstance(self.binner, basicBinning.GaussianFixedBins) or getattr(self.binner, 'shapenoise', None) is None:
+            raise ValueError('MultiCenterProfileBuilder needs a GaussianFixedBins binner with shapenoise, not %s' % \
+                                 self.binner.__class__.__name__)
+
+        self.ncenters = config['ncenters']
+        self.blocksize = 4000000
+        if 'multicenter_blocksize' in config:
+            self.blocksize = config['multicenter_blocksize']
+
+    def __call__(self, sim, streams = None, timer = None):
+
+        noisygalaxies = self.prepareGalaxies(sim, streams, timer)
+
+        with rngstreams.stage(streams, 'centergenerator'), instrument.stage(timer, 'centergenerator'):
+            centeroffsetx, centeroffsety = self.centergenerator.draw(self.ncenters, noisygalaxies.zlens)
+
+        profileCol = self.binner.profileCol
+        binedges = self.binner.binEdges()
+        shapenoise = self.binner.shapenoise
+
+        x_arcmin = noisygalaxies.x_arcmin
+        y_arcmin = noisygalaxies.y_arcmin
+        g1 = noisygalaxies.g1
+        g2 = noisygalaxies.g2
+        arcmin2mpc = nfwutils.global_cosmology.angulardist(noisygalaxies.zlens)*np.pi/(180.*60)
+
+        centersperblock = max(1, int(self.blocksize / max(len(noisygalaxies), 1)))
+
+        blocks = []
+        for start in range(0, self.ncenters, centersperblock):
+            stop = min(start + centersperblock, self.ncenters)
+
+            delta_x = x_arcmin[None,:] - centeroffsetx[start:stop,None]
+            delta_y = y_arcmin[None,:] - centeroffsety[start:stop,None]
+            r_arcmin = np.sqrt(delta_x**2 + delta_y**2)
+
+            # cos(2phi), sin(2phi) are scale free, so work in arcmin
+            cos2phi = (delta_x**2 - delta_y**2)/r_arcmin**2
+            sin2phi = 2.0*delta_x*delta_y/r_arcmin**2
+
+            E = -(g1*cos2phi + g2*sin2phi)
+
+            if profileCol == 'r_mpc':
+                radii = r_arcmin*arcmin2mpc
+            else:
+                radii = r_arcmin
+
+            blocks.append(basicBinning.stackedFixedBins(binedges, radii, E, 
+                                                        noisygalaxies.beta_s, 
+                                                        shapenoise = shapenoise))
+
+        profiles = catalog.Catalog()
+        setattr(profiles, profileCol, np.vstack([block['radii'] for block in blocks]))
+        for col in 'ghat sigma_ghat beta_s beta_s2 ngals'.split():
+            setattr(profiles, col, np.vstack([block[col] for block in blocks]))
+        profiles.centeroffsetx = centeroffsetx
+        profiles.centeroffsety = centeroffsety
+        profiles.zcluster = noisygalaxies.zcluster
+        profiles.zlens = noisygalaxies.zlens
+
+        return profiles
+
+    def unstack(self, profiles, streams = None):
+        '''Split stacked profiles into the single center profiles that ProfileBuilder would return'''
+
+        singles = []
+        for i in range(len(profiles)):
+
+            profile = catalog.Catalog()
+            for col in [self.binner.profileCol, 'ghat', 'sigma_ghat', 'beta_s', 'beta_s2', 'ngals']:
+                setattr(profile, col, getattr(profiles, col)[i])
+
+            cleanprofile = profile.filter(profile.sigma_ghat > 0)
+            cleanprofile.zcluster = profiles.zcluster
+            cleanprofile.zlens = profiles.zlens
+
+            with rngstreams.stage(streams, 'binnoiser'):
+                singles.append(self.binnoiser(cleanprofile))
+
+        return singles
+
+#########################
+
+class TestMultiCenterProfileBuilder(unittest.TestCase):
+
+    def setUp(self):
+
+        import rescalecluster, galaxypicker, betacalcer, shearnoiser, centergenerator, binnoiser
+
+        class ListOffsets(centergenerator.CenterGenerator):
+            def __init__(self, offsetx, offsety):
+                self.offsetx, self.offsety = np.array(offsetx), np.array(offsety)
+            def draw(self, n, zlens):
+                return self.offsetx[:n], self.offsety[:n]
+        self.ListOffsets = ListOffsets
+
+        rng = np.random.RandomState(7)
+        ngals = 2000
+        self.sim = catalog.Catalog()
+        self.sim.x_arcmin = rng.uniform(-10, 10, ngals)
+        self.sim.y_arcmin = rng.uniform(-10, 10, ngals)
+        self.sim.gamma1_inf = 0.05*rng.standard_normal(ngals)
+        self.sim.gamma2_inf = 0.05*rng.standard_normal(ngals)
+        self.sim.kappa_inf = 0.1*np.ones(ngals)
+        self.sim.zcluster = 0.3
+
+        self.offsetx = [0., 0.5, -1.2]
+        self.offsety = [0., 0.3, 0.8]
+
+        binner = basicBinning.GaussianFixedBins()
+        binner.configure(dict(profileMin = 0.1, profileMax = 2.5, profilecol = 'r_mpc',
+                              binspacing = 'linear', nbins = 12, shapenoise = 0.25))
+
+        self.config = dict(rescalecluster = rescalecluster.NoRedshiftRescaling(),
+                           galaxypicker = galaxypicker.AllGalaxyPicker(),
+                           betacalcer = betacalcer.InfiniteRedshift(),
+                           shearnoiser = shearnoiser.NoNoise(),
+                           centergenerator = ListOffsets(self.offsetx, self.offsety),
+                           binner = binner,
+                           binnoiser = binnoiser.NoBinNoise(),
+                           ncenters = len(self.offsetx),
+                           multicenter_blocksize = 4000)
+
+    def testUnstackMatchesSingleCenter(self):
+
+        builder = MultiCenterProfileBuilder()
+        builder.configure(self.config)
+        stacked = builder.unstack(builder(self.sim.copy()))
+
+        for i in range(len(self.offsetx)):
+            config = dict(self.config)
+            config['centergenerator'] = self.ListOffsets([self.offsetx[i]], [self.offsety[i]])
+            single = ProfileBuilder()
+            single.configure(config)
+            profile = single(self.sim.copy())
+
+            for col in 'r_mpc ghat sigma_ghat beta_s beta_s2 ngals'.split():
+                self.assertTrue(np.allclose(getattr(stacked[i], col), getattr(profile, col), rtol = 1e-10, atol = 0))
+
+    def testRejectsOtherBinners(self):
+
+        binner = basicBinning.BootstrapFixedBins()
+        binner.configure(dict(profileMin = 0.1, profileMax = 2.5, profilecol = 'r_mpc',
+                              binspacing = 'linear', nbins = 12))
+        config = dict(self.config)
+        config['binner'] = binner
+
+        self.assertRaises(ValueError, MultiCenterProfileBuilder().configure, config)
+
+#########################
+
+def test():
+
+    testcases = [TestMultiCenterProfileBuilder]
+    suite = unittest.TestSuite(map(unittest.TestLoader().loadTestsFromTestCase,
+                                   testcases))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+#########################
+
+if __name__ == '__main__':
 
+    test()
@@ -10,7 +10,7 @@ try:
 except ImportError:
     pass
 import pymc, mymc
-import cPickle, os
+import cPickle, os, tempfile, time
 import load_chains
 import csv, sys
 
@@ -96,8 +96,81 @@ class DerivedFunction(mymc.DerivedParameter):
         
 #################################
 
+class NativeModel(object):
+    '''A posterior that mymc samples directly, without going through a pymc graph.
+
+    parameters is a list of mymc.Parameters. logposterior(values) takes a dict of parameter name to value,
+    and returns (log posterior, dict of derived values); the derived dict must include 'likelihood'.
+    Return -inf for zero probability. Evaluations are cached by parameter values, so the derived values 
+    of the current state are looked up, not recomputed, when the chain is written.
+
+    logposterior_batch, if given, is the same function taking a dict of arrays and returning arrays;
+    it lets mymc.BatchSlice evaluate many trial points per call.'''
+
+    maxcache = 1000
+
+    def __init__(self, parameters, logposterior, derivednames, logposterior_batch = None):
+
+        self.parameters = sorted(parameters, key = operator.attrgetter('name'))
+        self.logposterior = logposterior
+        self.logposterior_batch = logposterior_batch
+        self.derivednames = sorted(derivednames)
+        self._cache = {}
+
+    def evaluate(self):
+
+        key = tuple([p() for p in self.parameters])
+        if key not in self._cache:
+            if len(self._cache) >= self.maxcache:
+                self._cache.clear()
+            self._cache[key] = self.logposterior(dict([(p.name, p()) for p in self.parameters])) + (None,)
+        return self._cache[key]
+
+    def posterior(self, thing = None):
+
+        return self.evaluate()[0]
+
+    def posterior_batch(self, positions, thing = None):
+
+        logps, derived = self.logposterior_batch(dict([(p.name, positions[:,i]) for i, p in enumerate(self.parameters)]))
+
+        #batch entries share the derived arrays, with their row
+        if len(self._cache) + len(positions) > self.maxcache:
+            self._cache.clear()
+        for i, position in enumerate(positions):
+            self._cache[tuple(position)] = (logps[i], derived, i)
+
+        return logps
+
+    def derived(self, name):
+
+        logp, derived, row = self.evaluate()
+        if row is None:
+            return derived[name]
+        return derived[name][row]
+
+    def spaces(self):
+
+        posterior_batch = None
+        if self.logposterior_batch is not None:
+            posterior_batch = self.posterior_batch
+
+        space = mymc.ParameterSpace(self.parameters, self.posterior, posterior_batch)
+
+        deterministics = [DerivedFunction(self.derived, name, name) for name in self.derivednames]
+        deterministics.append(DerivedFunction(self.posterior, 'posterior', None))
+
+        trace = mymc.ParameterSpace(deterministics + self.parameters)
+
+        return space, trace
+
+#################################
+
 def wrapModel(model):
 
+    if isinstance(model, NativeModel):
+        return model.spaces()
+
     parameters = []
     deterministics = []
     
@@ -175,8 +248,91 @@ def wrapModel(model):
 
 #################################
 
+def atomicPickle(obj, filename):
+    '''Write then rename, so filename always holds either the old or the new complete pickle'''
+
+    handle, tmpname = tempfile.mkstemp(dir = os.path.dirname(os.path.abspath(filename)), suffix = '.tmp')
+    with os.fdopen(handle, 'wb') as output:
+        cPickle.dump(obj, output, -1)
+        output.flush()
+        os.fsync(output.fileno())
+    os.rename(tmpname, filename)
+
+###
+
+class CheckpointBackend(mymc.Backend):
+    '''Saves what a MyMCRunner chain needs to resume: the number of samples written, the parameter values,
+    the updater's adaptation state, the numpy RNG state, and the length of the text chain. List it after
+    the chain's text backend, so a checkpoint never refers to rows that have not been written.
+
+    A checkpoint is taken every `every` samples or `seconds` seconds, whichever comes first. 
+    on_checkpoint, if given, is called with the chain and checkpoint filenames after each one.'''
+
+    def __init__(self, filename, chainfile, space, updater, count = 0, every = 1000, seconds = 600., on_checkpoint = None):
+
+        self.filename = filename
+        self.chainfile = chainfile
+        self.space = space
+        self.updater = updater
+        self.count = count
+        self.every = every
+        self.seconds = seconds
+        self.on_checkpoint = on_checkpoint
+        self.lasttime = time.time()
+
+    def __call__(self, trace):
+
+        self.count += 1
+        if self.count % self.every == 0 or time.time() - self.lasttime > self.seconds:
+            self.save()
+
+    def save(self):
+
+        self.chainfile.flush()
+        os.fsync(self.chainfile.fileno())
+
+        atomicPickle(dict(count = self.count,
+                          position = dict([(p.name, p()) for p in self.space]),
+                          bits = self.updater.saveBits(),
+                          rng = np.random.get_state(),
+                          chainlength = self.chainfile.tell()), self.filename)
+
+        self.lasttime = time.time()
+
+        if self.on_checkpoint is not None:
+            self.on_checkpoint([self.chainfile.name, self.filename])
+
+###
+
+def optionValue(options, name, default):
+    '''options may be a VarContainer or parsed command line options; unset or None gives default'''
+
+    if isinstance(options, dict):
+        value = options.get(name, None)
+    else:
+        value = getattr(options, name, None)
+
+    if value is None:
+        return default
+    return value
+
+###
+
+def loadCheckpoint(filename):
+
+    with open(filename, 'rb') as input:
+        return cPickle.load(input)
+
+#################################
+
 
 class MyMCRunner(object):
+    '''Runs a chain to text files. With options.restore, a chain is resumed from its checkpoint 
+    (see CheckpointBackend) and continued until it holds options.nsamples samples; older outputs without 
+    a checkpoint are restarted from their last row and adaptation state, for another options.nsamples.
+
+    Optional options: checkpoint_every (samples, default 1000) and checkpoint_seconds (default 600).
+    Optional manager.on_checkpoint: passed to CheckpointBackend.'''
 
     def run(self, manager):
 
@@ -196,15 +352,39 @@ class MyMCRunner(object):
         space, trace = wrapModel(manager.model)
         
         step = mymc.Slice()
+        if space.log_posterior_batch is not None:
+            step = mymc.BatchSlice()
 
 
         updater = mymc.MultiDimRotationUpdater(space, step, options.adapt_every, options.adapt_after, parallel = parallel)
 
         bitsfile = '%s.bits.%d' % (options.outputFile, manager.mpi_rank)
         chainfile = '%s.chain.%d' % (options.outputFile, manager.mpi_rank)
+        checkpointfile = '%s.ckpt.%d' % (options.outputFile, manager.mpi_rank)
 
         writeHeader = True
-        if options.restore is True:
+        nsamples = options.nsamples
+        startcount = 0
+        if options.restore is True and os.path.exists(checkpointfile) and os.path.exists(chainfile):
+
+            checkpoint = loadCheckpoint(checkpointfile)
+
+            if checkpoint['bits'] is not None:
+                updater.restoreBits(checkpoint['bits'])
+            for param in space:
+                param.set(checkpoint['position'][param.name])
+            np.random.set_state(checkpoint['rng'])
+
+            #drop rows written after the checkpoint; they will be drawn again
+            with open(chainfile, 'r+') as chain:
+                chain.truncate(checkpoint['chainlength'])
+
+            writeHeader = False
+            startcount = checkpoint['count']
+            nsamples = max(0, options.nsamples - startcount)
+            print 'Resuming from checkpoint at sample %d' % startcount
+
+        elif options.restore is True:
 
 
             
@@ -236,13 +416,17 @@ class MyMCRunner(object):
         manager.chainfile = open(chainfile, 'a')
         manager.textout = mymc.headerTextBackend(manager.chainfile, trace, writeHeader=writeHeader)
 
-
-
-
+        manager.checkpointer = CheckpointBackend(checkpointfile, manager.chainfile, space, updater, 
+                                                 count = startcount,
+                                                 every = optionValue(options, 'checkpoint_every', 1000), 
+                                                 seconds = optionValue(options, 'checkpoint_seconds', 600.),
+                                                 on_checkpoint = optionValue(manager, 'on_checkpoint', None))
         
-        backends = [manager.textout]
+        backends = [manager.textout, manager.checkpointer]
 
-        manager.engine(options.nsamples, None, backends)
+        manager.engine(nsamples, None, backends)
+
+        manager.checkpointer.save()
                                      
         with open(bitsfile, 'wb') as output:
             cPickle.dump(updater.saveBits(), output)
@@ -265,6 +449,10 @@ class MyMCRunner(object):
         parser.add_option('--singlecore', default = False,
                           action = 'store_true',
                           help='Turn off MPI for test runs on single machines')
+        parser.add_option('--checkpointevery', dest='checkpoint_every',
+                          help = 'Checkpoint the chain every X samples', default = 1000, type='int')
+        parser.add_option('--checkpointseconds', dest='checkpoint_seconds',
+                          help = 'Checkpoint the chain at least every X seconds', default = 600., type='float')
 
 
 
@@ -303,13 +491,21 @@ class MyMCMemRunner(object):
         space, trace = wrapModel(manager.model)
         
         step = mymc.Slice()
+        if space.log_posterior_batch is not None:
+            step = mymc.BatchSlice()
 
         if len(space) == 1:
             updater = mymc.CartesianSequentialUpdater(space, step, options.adapt_every, options.adapt_after, parallel = parallel)
         else:
             updater = mymc.MultiDimRotationUpdater(space, step, options.adapt_every, options.adapt_after, parallel = parallel)
 
-        manager.engine = mymc.Engine([updater], trace)
+        #options.target_ess turns options.nsamples into a maximum; see mymc.ConvergenceMonitor
+        manager.convergence = None
+        if 'target_ess' in options and options.target_ess is not None:
+            manager.convergence = mymc.ConvergenceMonitor(space, options.target_ess, options.target_rhat,
+                                                          min_iterations = 2*options.adapt_after)
+
+        manager.engine = mymc.Engine([updater], trace, convergence = manager.convergence)
 
         manager.chain = mymc.dictBackend()
 
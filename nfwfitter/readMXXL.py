@@ -15,9 +15,10 @@ import catalog
 
 class MXXLBinary(object):
 
-    def __init__(self, filename):
+    def __init__(self, filename, memmap = False):
 
         self.filename = filename
+        self.memmap = memmap
         self.parseBinary()
 
     ####
@@ -53,7 +54,27 @@ class MXXLBinary(object):
             self.npixels = binaryutils.readArray(input, 'i', (2,))
 
             #float  mass_density[N_pixels[0] * N_pixels[1]]; // surface mass density (in simulation units, i.e. 10^10 M_solar/h per comoving (Mpc/h)^2)
-            self.data = binaryutils.readArray(input, 'f', self.npixels)
+            if self.memmap:
+                #flattened, read only; pixels are paged in as they are indexed
+                self.data = np.memmap(self.filename, dtype = np.float32, mode = 'r',
+                                      offset = input.tell(), 
+                                      shape = (self.npixels[0]*self.npixels[1],))
+            else:
+                self.data = binaryutils.readArray(input, 'f', self.npixels)
+
+    def gridAxes(self):
+        '''Pixel center coordinates along each axis, as 1d arrays'''
+
+        gridDelta = (self.upper_bound - self.lower_bound)/(self.npixels)  # grid delta in arcsec
+
+        deltaX1_arcmin = (self.lower_bound[0] + (np.arange(self.npixels[0]) + 0.5)*gridDelta[0])/60.
+        deltaX2_arcmin = (self.lower_bound[1] + (np.arange(self.npixels[1]) + 0.5)*gridDelta[1])/60.
+
+        dL = nfwutils.global_cosmology.angulardist(self.redshift)
+
+        deltaX1_mpc = (deltaX1_arcmin * dL * np.pi)/(180.*60)
+        deltaX2_mpc = (deltaX2_arcmin * dL * np.pi)/(180.*60)
+        return (deltaX1_mpc, deltaX2_mpc), (deltaX1_arcmin, deltaX2_arcmin)
 
     def grid(self):
 
@@ -85,6 +106,16 @@ class MXXLSimReader(object):
 
         self._sim = None
         self._filebase = None
+        self.memmap = False
+
+    #########
+
+    def configure(self, config):
+
+        #memory map the shear & convergence maps; only pixels selected downstream
+        # (eg by galaxypicker.StreamingDensityPicker) are ever read
+        if 'mxxl_memmap' in config:
+            self.memmap = config['mxxl_memmap']
 
     #########
 
@@ -97,7 +128,7 @@ class MXXLSimReader(object):
     def load(self, filebase):
 
         if self._sim is None or self._filebase != filebase:
-            self._sim = MXXLSim(filebase)
+            self._sim = MXXLSim(filebase, memmap = self.memmap)
             self._filebase = filebase
         
         return self._sim.copy()
@@ -110,7 +141,7 @@ class MXXLSim(catalog.Catalog):
 
     #########
 
-    def __init__(self, filebase):
+    def __init__(self, filebase, memmap = False):
 
         print 'Loading %s' % filebase
 
@@ -124,13 +155,16 @@ class MXXLSim(catalog.Catalog):
         gamma2file = '{0}.shear_2_map'.format(filebase)
         answerfile = '{0}.answer'.format(filebase)
 
-        kappa = MXXLBinary(kappafile)
-        gamma1 = MXXLBinary(gamma1file)
-        gamma2 = MXXLBinary(gamma2file)
+        kappa = MXXLBinary(kappafile, memmap = memmap)
+        gamma1 = MXXLBinary(gamma1file, memmap = memmap)
+        gamma2 = MXXLBinary(gamma2file, memmap = memmap)
 
 
         self.zcluster = kappa.redshift
 
+        if memmap:
+            self._setLazyColumns(kappa, gamma1, gamma2)
+            return
 
         delta_mpc, delta_arcmin = kappa.grid()
         delta_mpc = [x.flatten() for x in delta_mpc]
@@ -151,6 +185,22 @@ class MXXLSim(catalog.Catalog):
         self.gamma2_inf = beta_inf*gamma2.data.flatten() # Shear wrt 45 deg
         self.kappa_inf = beta_inf*kappa.data.flatten()
 
+    def _setLazyColumns(self, kappa, gamma1, gamma2):
+
+        axes_mpc, axes_arcmin = kappa.gridAxes()
+        shape = kappa.npixels
+
+        self.x_mpc = catalog.LazyColumn(catalog.GridCoordinate(axes_mpc[0], shape, 0))
+        self.y_mpc = catalog.LazyColumn(catalog.GridCoordinate(axes_mpc[1], shape, 1))
+        self.x_arcmin = catalog.LazyColumn(catalog.GridCoordinate(axes_arcmin[0], shape, 0))
+        self.y_arcmin = catalog.LazyColumn(catalog.GridCoordinate(axes_arcmin[1], shape, 1))
+
+        beta_inf = nfwutils.global_cosmology.beta([1e6], self.zcluster)
+
+        self.gamma1_inf = catalog.LazyColumn(gamma1.data, beta_inf)
+        self.gamma2_inf = catalog.LazyColumn(gamma2.data, beta_inf)
+        self.kappa_inf = catalog.LazyColumn(kappa.data, beta_inf)
+
     def reshape_components(self) :
         import numpy as np
         for component in [ self.gamma1_inf, self.gamma2_inf, self.kappa_inf ] :
@@ -0,0 +1,157 @@
+'''
+Reproducible, independent random number streams for pipeline stages.
+
+Stages draw from the global np.random state. A stream is a np.random.RandomState seeded
+from a hash of a master seed and a key, eg (halo, config, realization, stage), so what a
+stage draws does not depend on which other stages ran before it, in which order or process.
+`with streams.use(key):` swaps a stream into np.random for the block, and saves its state
+back afterwards, so existing code runs on the stream unchanged.
+'''
+
+###########
+
+import contextlib, hashlib, unittest
+import numpy as np
+
+###########
+
+def streamSeed(*key):
+    '''RandomState seed (8 32-bit words) from a SHA-256 of the key'''
+
+    digest = hashlib.sha256('\x00'.join([str(k) for k in key])).digest()
+
+    return np.frombuffer(digest, dtype='<u4').astype(np.uint32)
+
+###
+
+@contextlib.contextmanager
+def noStream():
+    yield
+
+def stage(streams, name):
+    '''streams.use(name), or a do nothing context if streams is None (ie draw from np.random as usual)'''
+
+    if streams is None:
+        return noStream()
+    return streams.use(name)
+
+###########
+
+class RNGStreams(object):
+    '''Streams for keys below a prefix. The prefix starts with the master seed; child() extends it.'''
+
+    def __init__(self, seed, *prefix):
+
+        self.prefix = (seed,) + tuple(prefix)
+        self._states = {}
+
+    def child(self, *key):
+
+        return RNGStreams(*(self.prefix + tuple(key)))
+
+    def stream(self, *key):
+        '''A new RandomState for key; the same prefix and key always give the same draws'''
+
+        return np.random.RandomState(streamSeed(*(self.prefix + tuple(key))))
+
+    @contextlib.contextmanager
+    def use(self, *key):
+        '''Run a block with np.random drawing from the stream for key.
+        Using the same key again continues the stream where it left off.'''
+
+        if key in self._states:
+            state = self._states[key]
+        else:
+            state = self.stream(*key).get_state()
+
+        saved = np.random.get_state()
+        np.random.set_state(state)
+        try:
+            yield
+        finally:
+            self._states[key] = np.random.get_state()
+            np.random.set_state(saved)
+
+###########
+
+class TestRNGStreams(unittest.TestCase):
+
+    def testReproducible(self):
+
+        a = RNGStreams(42).child('halo1', 'config')
+        b = RNGStreams(42).child('halo1', 'config')
+
+        with a.use('noise'):
+            x = np.random.standard_normal(10)
+        with b.use('noise'):
+            y = np.random.standard_normal(10)
+
+        self.assertTrue((x == y).all())
+
+    def testIndependentOfOrder(self):
+
+        a = RNGStreams(42)
+        b = RNGStreams(42)
+
+        with a.use('centers'):
+            np.random.uniform(size=5)
+        with a.use('noise'):
+            x = np.random.uniform(size=5)
+
+        with b.use('noise'):
+            y = np.random.uniform(size=5)
+
+        self.assertTrue((x == y).all())
+
+    def testKeysDiffer(self):
+
+        streams = RNGStreams(42)
+
+        self.assertFalse((streams.stream('halo1').uniform(size=5) == streams.stream('halo2').uniform(size=5)).any())
+        self.assertFalse((RNGStreams(1).stream('a').uniform(size=5) == RNGStreams(2).stream('a').uniform(size=5)).any())
+
+    def testContinues(self):
+
+        streams = RNGStreams(42)
+        with streams.use('noise'):
+            x1 = np.random.uniform(size=3)
+        with streams.use('noise'):
+            x2 = np.random.uniform(size=3)
+
+        self.assertTrue((np.hstack([x1, x2]) == streams.stream('noise').uniform(size=6)).all())
+
+    def testGlobalStateRestored(self):
+
+        np.random.seed(5)
+        expected = np.random.uniform(size=3)
+
+        np.random.seed(5)
+        with RNGStreams(42).use('noise'):
+            np.random.uniform(size=100)
+        self.assertTrue((np.random.uniform(size=3) == expected).all())
+
+    def testNoStream(self):
+
+        np.random.seed(5)
+        expected = np.random.uniform(size=3)
+
+        np.random.seed(5)
+        with stage(None, 'noise'):
+            x = np.random.uniform(size=3)
+
+        self.assertTrue((x == expected).all())
+
+###########
+
+def test():
+
+    testcases = [TestRNGStreams]
+    suite = unittest.TestSuite(map(unittest.TestLoader().loadTestsFromTestCase,
+                                   testcases))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+###########
+
+if __name__ == '__main__':
+
+    test()
@@ -3,7 +3,7 @@
 # Run dln fit for one mass bin of one noise sim
 ###########################
 
-import sys, re
+import sys, re, os, glob, tempfile, zlib, hashlib
 import random
 import deconvolvedlognorm as dln
 import nfwfit
@@ -228,17 +228,109 @@ def defineMassEdges(simtype, delta):
 
 #########
 
+def cachedPosteriorName(chaindir, delta, massbin, maxsamples):
+
+    return '%s/dlnsamples.delta%d.bin%d.max%d.pkl' % (chaindir, delta, massbin, maxsamples)
+
+###
+
+def chainFingerprint(chaindir):
+    '''Hash of the names, sizes and modification times of the fits in chaindir;
+    changes whenever a fit is added, removed or rerun in place'''
+
+    fingerprint = hashlib.sha1()
+    for outfile in sorted(glob.glob('%s/*.out' % chaindir)):
+        stat = os.stat(outfile)
+        fingerprint.update('%s %d %r\n' % (os.path.basename(outfile), stat.st_size, stat.st_mtime))
+
+    return fingerprint.hexdigest()
+
+###
+
+def loadCachedPosteriors(simtype, chaindir, simreader, delta, massbin, selector, pdftype, model,
+                         maxsamples = 2000, maxhalos = 1000):
+    '''Halos for one mass bin, ready to hand to a dln model builder. 
+
+    The first call for a (chaindir, delta, massbin, maxsamples) loads the posteriors,
+    downsamples to maxhalos and, for mcmc output, builds the subsampled sample matrices,
+    all with a seed fixed by the cache key. The result is pickled next to the chains,
+    so later runs of any bias model on the bin skip the loading and preprocessing.
+    The cache is rebuilt if any chain file is added, removed or rewritten (see chainFingerprint).'''
+
+    cachefile = cachedPosteriorName(chaindir, delta, massbin, maxsamples)
+    fingerprint = chainFingerprint(chaindir)
+
+    if os.path.exists(cachefile):
+        with open(cachefile, 'rb') as input:
+            cached = cPickle.load(input)
+        if cached.get('fingerprint') == fingerprint:
+            return cached['halos']
+        print 'Stale posterior cache, rebuilding: ', cachefile
+
+    rng = np.random.RandomState(zlib.crc32('%d %d %d' % (delta, massbin, maxsamples)) & 0xffffffff)
+
+    if pdftype == 'pdf':
+        halos = dln.loadPosteriors(chaindir, simtype, simreader, delta, selector,
+                                   reader = dln.PDFReader, model = model)
+    elif pdftype == 'mcmc':
+        halos = dln.loadPosteriors(chaindir, simtype, simreader, delta, selector,
+                                   reader = dln.MCMCReader,
+                                   cprior = 100.)
+
+    halos.sort(key = lambda halo: halo['id'])  #glob order is not reproducible
+
+    if len(halos) > maxhalos:
+        print 'Down sampling'
+        halos = [halos[i] for i in sorted(rng.permutation(len(halos))[:maxhalos])]
+
+    if pdftype == 'mcmc':
+        halos = dln.buildSampleMatrices(halos, maxsamples, seed = rng.randint(2**31))
+
+    #write then rename, so a concurrent reader never sees a partial file
+    handle, tmpname = tempfile.mkstemp(dir = chaindir, suffix = '.tmp')
+    with os.fdopen(handle, 'wb') as output:
+        cPickle.dump(dict(fingerprint = fingerprint, halos = halos), output, -1)
+    os.rename(tmpname, cachefile)
+
+    return halos
+
+###
+
+def nHalos(halos):
+
+    if isinstance(halos, dict):
+        return len(halos['ids'])
+    return len(halos)
+
+###
+
+def doneMarker(outfile):
+    '''Marks the bin as finished (for job queues and checkRunDlnOutput). Kept apart from
+    outfile itself, which plotsimdistros.gatherChainFiles would pick up as a chain.'''
+
+    return '%s.done' % outfile
+
+def writeDoneMarker(outfile, status):
+    '''the results are in outfile.massrange and the outfile.debug chains'''
+
+    with open(doneMarker(outfile), 'w') as output:
+        output.write('%s\n' % status)
+
+#########
+
     
 
-def run(simtype, chaindir, outfile, delta, modelname, massbin=0, sigmapriorfile = None):
+def run(simtype, chaindir, outfile, delta, modelname, massbin=0, sigmapriorfile = None, usecache = False):
     '''
     simtype: something like mxxl41, 
     chaindir: output from nfwfit
-    outfile: output of the map step, 
+    outfile: base name for the outputs; outfile.done is written last, as a marker that the bin finished, 
     delta: overdensity (e.g. 200)
     modelname: function name of model, e.g. buildMCMCModel
     massbin: the index of the massbin that we are running (bins are defined above), depends on mass range, simtype, and overdensity 
 
+    usecache: load the bin through loadCachedPosteriors instead of from scratch
+
     Note - pdftype: either 'pdf' or 'mcmc' --> format of output of map step determined in config file
 
     '''
@@ -257,7 +349,12 @@ def run(simtype, chaindir, outfile, delta, modelname, massbin=0, sigmapriorfile
 
     isPDF = False
 
-    if pdftype == 'pdf':
+    if usecache:
+        isPDF = pdftype == 'pdf'
+        halos = loadCachedPosteriors(simtype, chaindir, simreader, delta, massbin, selector,
+                                     pdftype, model)
+
+    elif pdftype == 'pdf':
         isPDF = True
         halos = dln.loadPosteriors(chaindir, simtype, simreader, delta, selector,
                                    reader = dln.PDFReader, model = model)
@@ -268,10 +365,12 @@ def run(simtype, chaindir, outfile, delta, modelname, massbin=0, sigmapriorfile
         
         
 
-    if len(halos) < 10:
+    if nHalos(halos) < 10:
+        print 'Too few halos in bin: ', nHalos(halos)
+        writeDoneMarker(outfile, 'skipped: %d halos' % nHalos(halos))
         sys.exit(0)
 
-    if len(halos) > 1000:
+    if nHalos(halos) > 1000:
         # Should be sufficient - some mass bins have ~7000.
         print 'Down sampling'
         halos = random.sample(halos, 1000)
@@ -319,6 +418,8 @@ def run(simtype, chaindir, outfile, delta, modelname, massbin=0, sigmapriorfile
     #dln.memsample(model, 10000, outputFile = outfile)
     dln.sample(model, outfile+'.debug', 1000, tempoutputdir='./debug/', singlecore=True)
 
+    writeDoneMarker(outfile, 'done')
+
 
 
 if __name__ == '__main__':
@@ -326,6 +427,12 @@ if __name__ == '__main__':
     massbin = 0
     sigmaprior = None
 
+    #--cache (or DLN_POSTERIOR_CACHE in the environment) loads the bin through loadCachedPosteriors
+    usecache = 'DLN_POSTERIOR_CACHE' in os.environ
+    if '--cache' in sys.argv:
+        sys.argv.remove('--cache')
+        usecache = True
+
     simtype=sys.argv[1]
     chaindir=sys.argv[2]
     outfile=sys.argv[3]
@@ -338,8 +445,9 @@ if __name__ == '__main__':
     print 'Called with:', dict(modelname=modelname, simtype=simtype, chaindir=chaindir, 
                                outfile=outfile, delta=delta, 
                                massbin=massbin,
-                               sigmapriorfile = sigmaprior)
+                               sigmapriorfile = sigmaprior,
+                               usecache = usecache)
 
     
-    run(simtype, chaindir, outfile, delta, modelname, massbin, sigmaprior)
+    run(simtype, chaindir, outfile, delta, modelname, massbin, sigmaprior, usecache)
         
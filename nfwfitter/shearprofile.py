@@ -29,41 +29,70 @@ class Profile(object):
 ##################################################
 
 def bootstrapshearprofile(x,y,e1,e2,sigma2,range,bins=30,center=(5000,5000),
-                          wcs=False, logbin=False):
+                          wcs=False, logbin=False, nbootstraps=1000, blocksize=20000000):
 
-    profiles = [ shearprofile(x,y,e1,e2,sigma2,range,bins,center,wcs,logbin) ]
+    rbin, index, goodentry, E, B = _tangentialshear(x,y,e1,e2,range,bins,center,wcs,logbin)
 
+    errors = (sigma2 is not None)
+    values = _binvalues(E, B, sigma2)
+
+    profile = _profilefromsums(errors, *[bincount(index[goodentry], weights = val[goodentry], 
+                                                  minlength = bins) for val in values])
+
+    # Each bootstrap realization is a multinomial weight (number of draws) per galaxy.
+    # Only galaxies that land in a bin matter; sort those by bin so that per-bin sums 
+    # are differences of cumulative sums over contiguous columns.
     nelements = len(x)
-    for i in xrange(1000):
-        asample = random.randint(0,nelements,nelements)
-        profiles.append(shearprofile(x[asample], y[asample],e1[asample],e2[asample],sigma2[asample],range,bins,center,wcs,logbin))
+    good = flatnonzero(goodentry)
+    order = good[argsort(index[good], kind='mergesort')]
+    binends = searchsorted(index[order], arange(bins+1))
+    sortedvalues = [val[order] for val in values]
+    pvals = ones(nelements)/nelements
+
+    bootE = [profile.E[None,:]]
+    bootB = [profile.B[None,:]]
+
+    nperblock = max(1, int(blocksize / max(nelements, 1)))
+    for start in xrange(0, nbootstraps, nperblock):
+        nboots = min(nperblock, nbootstraps - start)
+
+        weights = random.multinomial(nelements, pvals, size=nboots)[:,order]
+
+        sums = []
+        for val in sortedvalues:
+            cumulative = zeros((nboots, len(order)+1))
+            cumsum(weights*val, axis=1, out=cumulative[:,1:])
+            sums.append(cumulative[:,binends[1:]] - cumulative[:,binends[:-1]])
+
+        bootprofile = _profilefromsums(errors, *sums)
+        bootE.append(bootprofile.E)
+        bootB.append(bootprofile.B)
+
+    bootE = vstack(bootE)
+    bootB = vstack(bootB)
 
     E = []
     Eerr = [[],[]]
     B = []
     Berr = [[],[]]
-    for i in xrange(len(profiles[0].r)):
-
-        Es = [profile.E[i] for profile in profiles]
+    for i in xrange(bins):
 
-        E_cr = ConfidenceRegion(Es)
+        E_cr, E_crerr = ConfidenceRegion(bootE[:,i])
 
-        E.append(float(E_cr[0][0]))
+        E.append(float(E_cr))
 
-        Eerr[0].append(float(E_cr[1][0]))
-        Eerr[1].append(float(E_cr[2][0]))
+        Eerr[0].append(float(E_crerr[0]))
+        Eerr[1].append(float(E_crerr[1]))
         
 
-        Bs = [profile.B[i] for profile in profiles]
+        B_cr, B_crerr = ConfidenceRegion(bootB[:,i])
 
-        B_cr = ConfidenceRegion(Bs)
-
-        B.append(float(B_cr[0][0]))
+        B.append(float(B_cr))
         
-        Berr[0].append(float(B_cr[1][0]))
-        Berr[1].append(float(B_cr[2][0]))
+        Berr[0].append(float(B_crerr[0]))
+        Berr[1].append(float(B_crerr[1]))
 
-    return Profile(profiles[0].r, array(E), array(Eerr), array(B), array(Berr), profiles[0].n)
+    return Profile(profile.r, array(E), array(Eerr), array(B), array(Berr), profile.n)
         
         
 
@@ -72,9 +101,26 @@ def shearprofile(x,y,e1,e2,sigma2,range,bins=30,center=(6000,6000),
 
     errors = (sigma2 is not None)
 
+    rbin, index, goodentry, E, B = _tangentialshear(x,y,e1,e2,range,bins,center,wcs,logbin)
+
+    # Calculate tangential shear and add it to the (weighted) sum:     
+    binindex = index[goodentry]
+    sums = [bincount(binindex, weights = val[goodentry], minlength = bins) 
+            for val in _binvalues(E, B, sigma2)]
+
+    profile = _profilefromsums(errors, *sums)
+    profile.r = rbin
+
+    return profile
+
+###
+
+def _tangentialshear(x,y,e1,e2,range,bins,center,wcs,logbin):
+    '''Bin centers, bin index of each galaxy, whether it is in range, and the E & B shear components'''
+
     xrel = x - center[0]
     if (wcs):
-        xrel = xrel*cos(y*M_PI/360.)
+        xrel = xrel*cos(y*pi/360.)
 
     yrel = y - center[1]
     dr = sqrt(xrel**2 + yrel**2)
@@ -101,13 +147,6 @@ def shearprofile(x,y,e1,e2,sigma2,range,bins=30,center=(6000,6000),
 
     # Set up binning grid:
     
-
-    Ebin = zeros(bins, dtype=float64)
-    Ebinerr = zeros(bins, dtype=float64)
-    Bbin = zeros(bins)
-    Bbinerr = zeros(bins)
-    nbin = zeros(bins)
-
     index = ((dr - rmin) / binwidth).astype(int)
     
     goodentry = logical_and(index >= 0, index < bins)
@@ -123,33 +162,23 @@ def shearprofile(x,y,e1,e2,sigma2,range,bins=30,center=(6000,6000),
     b1 =  e2
     b2 = -e1
     B = -(b1*cos2phi+b2*sin2phi)
-  
 
-    # Calculate tangential shear and add it to the (weighted) sum:     
-    nentries = len(x)
-    if errors:
-        w = 1.0/sigma2;
-        for cur in xrange(nentries):
-            i = index[cur]
-            if goodentry[cur]:
-                nbin[i] += 1
-                Ebin[i] += E[cur]*w[cur]
-                Ebinerr[i] += w[cur] 
-                Bbin[i] += B[cur]*w[cur]
-                Bbinerr[i] += w[cur]
+    return rbin, index, goodentry, E, B
 
-    else:
-        for cur in xrange(nentries):
-            i = index[cur]
-            if goodentry[cur]:
-                nbin[i] += 1 
-                Ebin[i] += E[cur]
-                Ebinerr[i] += E[cur]*E[cur]
-                Bbin[i] += B[cur] 
-                Bbinerr[i] += B[cur]*B[cur]
+###
+
+def _binvalues(E, B, sigma2):
+    '''Per galaxy quantities whose bin sums make a profile: n, E, E err, B, B err terms'''
+
+    if sigma2 is not None:
+        w = 1.0/sigma2
+        return [ones_like(E), E*w, w, B*w, w]
 
+    return [ones_like(E), E, E*E, B, B*B]
 
-           
+###
+
+def _profilefromsums(errors, nbin, Ebin, Ebinerr, Bbin, Bbinerr):
 
 # Now work out averages and errors and finish!
 
@@ -167,7 +196,7 @@ def shearprofile(x,y,e1,e2,sigma2,range,bins=30,center=(6000,6000),
         Bbinerr = Bbinerr / sqrt(nbin - 1.0)
 
 
-    return Profile(rbin, Ebin, Ebinerr, Bbin, Bbinerr, nbin)
+    return Profile(None, Ebin, Ebinerr, Bbin, Bbinerr, nbin)
 
 ############################################################
 
@@ -267,7 +296,6 @@ def ConfidenceRegion(dist, interval = .68, bins = 50, range = None, useLog = Fal
         counts, left_edges = histogram(log(dist), bins, range)
     else:
         counts, left_edges = histogram(dist, bins, range)
-    counts = counts[:-1]
     left_edges = left_edges[:-1]
 
     center = left_edges + (left_edges[1] - left_edges[0])/2.
@@ -293,48 +321,25 @@ def ConfidenceRegion(dist, interval = .68, bins = 50, range = None, useLog = Fal
 
     x = sort(dist)
     
-    # Initialize interval
-    min_int = [None,None]
-    
-    try:
-        
-        # Number of elements in trace
-        n = len(x)
-        
-        # Start at far left
-        start, end = 0, int(n*interval)
-        hi, lo = x[end], x[start]
-        
-        # Initialize minimum width to large value
-        min_width = inf
-
-
-        while end < n and lo <= maxl:
+    # Number of elements in trace
+    n = len(x)
 
-
-
-            # Endpoints of interval
-            hi, lo = x[end], x[start]
-            
-            if lo <= maxl <= hi:
-        
-                # Width of interval
-                width = hi - lo
-            
-                # Check to see if width is narrower than minimum
-                if width < min_width:
-                    min_width = width
-                    min_int = [lo, hi]
-            
-            # Increment endpoints
-            start +=1
-            end += 1
-        
-
-    
-    except IndexError:
+    # Shortest interval containing interval*n samples and the peak; first one wins ties
+    width = int(n*interval)
+    if width >= n:
         print 'Too few elements for interval calculation'
         raise IndexError
+
+    lo = x[:n-width]
+    hi = x[width:]
+    contains = logical_and(lo <= maxl, maxl <= hi)
+
+    min_int = [None,None]
+    if contains.any():
+        widths = where(contains, hi - lo, inf)
+        best = argmin(widths)
+        if widths[best] < inf:
+            min_int = [lo[best], hi[best]]
     
     err = array([maxl - min_int[0], min_int[1] - maxl])
 
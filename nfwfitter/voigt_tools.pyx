@@ -10,12 +10,14 @@ cimport numpy as np
 cimport cython
 
 cdef extern from "math.h":
-    double log(double)
-    double sqrt(double)
-    bint isnan(double)
+    double log(double) nogil
+    double exp(double) nogil
+    double sqrt(double) nogil
+    bint isnan(double) nogil
+    double INFINITY
 
 cdef extern from "voigt.h":
-    double voigt(double, double, double)
+    double voigt(double, double, double) nogil
 
 ######################
 
@@ -28,37 +30,63 @@ ctypedef np.double_t DTYPE_T
 
 #######################
 
-def voigtProfile(np.ndarray[DTYPE_T, ndim=1, mode='c'] x,
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def voigtProfile(x,
           double sigma,
           double gamma):
+    '''Voigt profile evaluated at x (any shape)'''
 
-    cdef Py_ssize_t nobjs = x.shape[0]
+    cdef np.ndarray[DTYPE_T, ndim=1, mode='c'] flatx = np.ascontiguousarray(x, dtype=DTYPE).ravel()
+    cdef Py_ssize_t nobjs = flatx.shape[0]
     cdef np.ndarray[DTYPE_T, ndim=1, mode='c'] results = np.zeros(nobjs)
 
-    cdef int i = nobjs
-    for i from nobjs > i >= 0:
-        results[i] = voigt(x[i], sigma, gamma)
+    cdef double * xdata = <double *> flatx.data
+    cdef double * resultdata = <double *> results.data
 
-    return results
+    cdef Py_ssize_t i
+    with nogil:
+        for i from 0 <= i < nobjs:
+            resultdata[i] = voigt(xdata[i], sigma, gamma)
+
+    return results.reshape(np.shape(x))
 
 ###############
 
-def voigtSamples(double sigma, double gamma, int size, limits=(-5,5), double binsize = 0.0001):
+_voigtcdfs = {}
 
-    cdef np.ndarray[DTYPE_T, ndim=1, mode='c'] xbins = np.arange(limits[0], limits[1], binsize)
+class VoigtSampler(object):
+    '''Inverse CDF sampling of a Voigt profile, tabulated on a grid of binsize between limits.
+    The CDF table is built once per (sigma, gamma, limits, binsize) and shared between samplers.'''
 
-    cdef np.ndarray[DTYPE_T, ndim=1, mode='c'] probs = voigtProfile(xbins, sigma, gamma)
-    cdef int nbins = len(xbins)
+    def __init__(self, sigma, gamma, limits=(-5,5), binsize = 0.0001):
 
-    cdef np.ndarray[DTYPE_T, ndim=1, mode='c'] cdf = np.cumsum(probs)
-    cdf = cdf / cdf[nbins - 1]
+        key = (float(sigma), float(gamma), tuple(limits), float(binsize))
 
+        if key not in _voigtcdfs:
 
-    cdef np.ndarray[DTYPE_T, ndim=1, mode='c'] picks = np.random.uniform(size = size)
+            xbins = np.arange(limits[0], limits[1], binsize)
+            probs = voigtProfile(xbins, sigma, gamma)
+            cdf = np.cumsum(probs)
+            cdf = cdf / cdf[len(xbins) - 1]
 
-    positions = np.searchsorted(cdf, picks, side='left')
+            _voigtcdfs[key] = (xbins, cdf)
 
-    return xbins[positions]    
+        self.xbins, self.cdf = _voigtcdfs[key]
+
+    def draw(self, size):
+
+        picks = np.random.uniform(size = size)
+
+        positions = np.searchsorted(self.cdf, picks, side='left')
+
+        return self.xbins[positions]
+
+###
+
+def voigtSamples(double sigma, double gamma, int size, limits=(-5,5), double binsize = 0.0001):
+
+    return VoigtSampler(sigma, gamma, limits = limits, binsize = binsize).draw(size)
 
 
 ###############
@@ -68,42 +96,146 @@ def voigtSamples(double sigma, double gamma, int size, limits=(-5,5), double bin
 
 ###############
     
-@cython.boundscheck(False)
-@cython.wraparound(False)
+cdef inline double voigt_logprob(double x, double sigma, double gamma) nogil:
+
+    cdef double prob = voigt(x, sigma, gamma)
+
+    if isnan(prob) or prob <= 0:
+        return -INFINITY
+
+    return log(prob)
+
+###
+
+cdef double voigt_loglike(double * g, double * mu, Py_ssize_t nobjs,
+                          double sigma, double gamma) nogil:
+
+    cdef double tot_logprob = 0.
+    cdef double logprob
+    cdef Py_ssize_t i
+
+    for i from 0 <= i < nobjs:
+
+        logprob = voigt_logprob(g[i] - mu[i], sigma, gamma)
+        if logprob == -INFINITY:
+            return -INFINITY
+
+        tot_logprob += logprob
+
+    return tot_logprob
+
+###
+
 def likelihood(np.ndarray[DTYPE_T, ndim=1, mode='c'] g not None, 
                np.ndarray[DTYPE_T, ndim=1, mode='c'] mu not None, 
                double sigma, 
                double gamma):
 
+    cdef double tot_logprob
     cdef Py_ssize_t nobjs = g.shape[0]
-    cdef double x = 0.
-    cdef double prob = 0.
 
-    cdef double tot_logprob = 0.
-    cdef int i = nobjs
-    for i from nobjs > i >=0:
-        
-        x = g[i] - mu[i]
-        prob = voigt(x, sigma, gamma)
+    with nogil:
+        tot_logprob = voigt_loglike(<double *> g.data, <double *> mu.data, nobjs, sigma, gamma)
 
-        if isnan(prob) or prob <= 0:
-            return -np.infty
+    return tot_logprob
 
-        tot_logprob = tot_logprob + log(prob)
+###
 
+def checkBatchShapes(g, mu, params, nparamcols):
+    '''The batch loops read mu and params unchecked; make sure they fit'''
 
-    return tot_logprob
+    if mu.shape[0] != g.shape[0]:
+        raise ValueError('g and mu have different lengths (%d, %d)' % (g.shape[0], mu.shape[0]))
+    if params.shape[1] != nparamcols:
+        raise ValueError('params needs %d columns, has %d' % (nparamcols, params.shape[1]))
 
+###
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def likelihood_batch(np.ndarray[DTYPE_T, ndim=1, mode='c'] g not None, 
+                     np.ndarray[DTYPE_T, ndim=1, mode='c'] mu not None, 
+                     np.ndarray[DTYPE_T, ndim=2, mode='c'] params not None):
+    '''Voigt log likelihood for each row (sigma, gamma) of params'''
+
+    checkBatchShapes(g, mu, params, 2)
+
+    cdef Py_ssize_t nobjs = g.shape[0]
+    cdef Py_ssize_t nparams = params.shape[0]
+    cdef np.ndarray[DTYPE_T, ndim=1, mode='c'] results = np.zeros(nparams)
+    cdef double * gdata = <double *> g.data
+    cdef double * mudata = <double *> mu.data
+    cdef Py_ssize_t j
+
+    with nogil:
+        for j from 0 <= j < nparams:
+            results[j] = voigt_loglike(gdata, mudata, nobjs, params[j,0], params[j,1])
+
+    return results
 
 
 #####################
 
-cdef double sqrt2pi = np.sqrt(2*np.pi)
+cdef double sqrt2pi = sqrt(2*np.pi)
+cdef double logsqrt2pi = log(sqrt2pi)
+
+cdef inline double gauss_c(double x, double sigma) nogil:
+
+    return exp(-0.5*(x/sigma)**2)/(sigma*sqrt2pi)
+
+###
+
+cdef inline double gauss_logprob(double x, double sigma) nogil:
+
+    return -0.5*(x/sigma)**2 - log(sigma) - logsqrt2pi
+
+###
+
+cdef inline double doublegauss_logprob(double x, double sigma1, double sigma2,
+                                       double logalpha, double logcomp_alpha) nogil:
+    '''log((1-alpha)N(x|sigma1) + alpha N(x|sigma2)), stable in the tails'''
+
+    cdef double a = logcomp_alpha + gauss_logprob(x, sigma1)
+    cdef double b = logalpha + gauss_logprob(x, sigma2)
+
+    if isnan(a) or isnan(b):
+        return -INFINITY
+    if a == -INFINITY and b == -INFINITY:
+        return -INFINITY
+    if a > b:
+        return a + log(1 + exp(b - a))
+    return b + log(1 + exp(a - b))
+
+###
+
+cdef double doublegauss_loglike(double * g, double * mu, Py_ssize_t nobjs,
+                                double sigma, double sigma2scale, double alpha) nogil:
+
+    if sigma <= 0 or sigma2scale <= 0 or alpha < 0 or alpha > 1:
+        return -INFINITY
+
+    cdef double sigma2 = sigma*sigma2scale
+    cdef double logalpha = log(alpha)
+    cdef double logcomp_alpha = log(1 - alpha)
+    cdef double tot_logprob = 0.
+    cdef double logprob
+    cdef Py_ssize_t i
+
+    for i from 0 <= i < nobjs:
+
+        logprob = doublegauss_logprob(g[i] - mu[i], sigma, sigma2, logalpha, logcomp_alpha)
+        if logprob == -INFINITY:
+            return -INFINITY
+
+        tot_logprob += logprob
+
+    return tot_logprob
+
+###
 
 def gauss(double x, double sigma):
 
-    return np.exp(-0.5*(x/sigma)**2)/(sigma*sqrt2pi)
+    return gauss_c(x, sigma)
 
 
 ####################
@@ -113,42 +245,48 @@ def doublegauss(double x,
                 double sigma2scale,
                 double alpha):
 
-
-    cdef double curx
     cdef double sigma2 = sigma1*sigma2scale
     cdef double comp_alpha = 1-alpha
-    return comp_alpha*gauss(x, sigma1) + alpha*gauss(x, sigma2)
-
+    return comp_alpha*gauss_c(x, sigma1) + alpha*gauss_c(x, sigma2)
 
+###
 
-
-
-
-@cython.boundscheck(False)
-@cython.wraparound(False)
 def doublegauss_likelihood(np.ndarray[DTYPE_T, ndim=1, mode='c'] g not None, 
                            np.ndarray[DTYPE_T, ndim=1, mode='c'] mu not None, 
                            double sigma, 
                            double sigma2scale,
                            double alpha):
 
+    cdef double tot_logprob
     cdef Py_ssize_t nobjs = g.shape[0]
-    cdef double x = 0.
-    cdef double prob = 0.
 
-    cdef double tot_logprob = 0.
-    cdef int i = nobjs
-    for i from nobjs > i >=0:
-        
-        x = g[i] - mu[i]
-        prob = doublegauss(x, sigma, sigma2scale, alpha)
+    with nogil:
+        tot_logprob = doublegauss_loglike(<double *> g.data, <double *> mu.data, nobjs, 
+                                          sigma, sigma2scale, alpha)
 
-        if isnan(prob) or prob <= 0:
-            return -np.infty
+    return tot_logprob
 
-        tot_logprob = tot_logprob + log(prob)
+###
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def doublegauss_likelihood_batch(np.ndarray[DTYPE_T, ndim=1, mode='c'] g not None, 
+                                 np.ndarray[DTYPE_T, ndim=1, mode='c'] mu not None, 
+                                 np.ndarray[DTYPE_T, ndim=2, mode='c'] params not None):
+    '''Double gaussian log likelihood for each row (sigma, sigma2scale, alpha) of params'''
 
-    return tot_logprob
+    checkBatchShapes(g, mu, params, 3)
+
+    cdef Py_ssize_t nobjs = g.shape[0]
+    cdef Py_ssize_t nparams = params.shape[0]
+    cdef np.ndarray[DTYPE_T, ndim=1, mode='c'] results = np.zeros(nparams)
+    cdef double * gdata = <double *> g.data
+    cdef double * mudata = <double *> mu.data
+    cdef Py_ssize_t j
 
+    with nogil:
+        for j from 0 <= j < nparams:
+            results[j] = doublegauss_loglike(gdata, mudata, nobjs, 
+                                             params[j,0], params[j,1], params[j,2])
 
+    return results
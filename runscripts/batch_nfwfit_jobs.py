@@ -1,8 +1,11 @@
 #Take nfwfit job files, and batch them up into bash scripts to lessen disk I/O
 
-import os
+#Or, put them in a shared job queue (nfwfitter/jobqueue.py) that worker scripts drain
+
+import os, json
 
 import nfwfitter.rundln as rundln
+import nfwfitter.jobqueue as jobqueue
 
 aifa_batch_header = '''#!/bin/bash
 
@@ -155,7 +158,7 @@ def checkRunDlnOutput(bashfiles):
                 if tokens[2] == 'starting' :
                     continue
 
-                if not os.path.exists(outfile):
+                if not os.path.exists(rundln.doneMarker(outfile)):
 
                     argsets_to_rerun.append(tokens[2:])
 
@@ -165,6 +168,65 @@ def checkRunDlnOutput(bashfiles):
     return argsets_to_rerun
 
 
+#############
+# Work stealing alternative to the static batches above: queue every task once,
+# then launch any number of worker scripts; each pulls the next task when a slot frees.
+
+
+def nfwFitJobOutputs(job):
+    '''The .out files multiconfig_nfwfit.py writes for a job file'''
+
+    with open(job) as input:
+        jobparams = json.load(input)
+
+    return ['{0}/{1}{2}'.format(os.path.dirname(configfile), jobparams['outbasename'], jobparams['outputExt'])
+            for configfile in jobparams['configurations']]
+
+###
+
+def queueNFWFitJobs(jobs, queuefile):
+
+    tasks = []
+    for job in jobs:
+        jobbase, jobext = os.path.splitext(job)
+        tasks.append(('python nfwfitter/multiconfig_nfwfit.py {jobfile}'.format(jobfile=job),
+                      nfwFitJobOutputs(job), jobbase))
+
+    queue = jobqueue.JobQueue(queuefile)
+    queue.addMany(tasks)
+    queue.close()
+
+###
 
+def queueRunDLNJobs(argsets, queuefile):
 
+    tasks = []
+    for argset in argsets:
+        outfile = argset[2]
+        tasks.append(('python nfwfitter/rundln.py {argset}'.format(argset = ' '.join(map(str, argset))),
+                      [rundln.doneMarker(outfile)], outfile))    #written last, once the bin is sampled (or skipped)
 
+    queue = jobqueue.JobQueue(queuefile)
+    queue.addMany(tasks)
+    queue.close()
+
+###
+
+def writeQueueWorkers(queuefile, outputdir, nrunners, nprocs = None, prefix = 'queueworker',
+                      time = '48:00:00', batch_header = midway_batch_header):
+    '''One script per node; each runs nprocs workers (default: all cores) until the queue is empty.
+    Failed tasks are retried, and tasks with existing outputs skipped, so rerunning is just resubmitting.'''
+
+    if not os.path.exists(outputdir):
+        os.mkdir(outputdir)
+
+    nprocsarg = ''
+    if nprocs is not None:
+        nprocsarg = ' --nprocs {}'.format(nprocs)
+
+    for currunner in range(nrunners):
+
+        with open('{}/{}_{}.sh'.format(outputdir, prefix, currunner), 'w') as output:
+            output.write(batch_header.format(jobdir = outputdir, jobname = prefix, runner=currunner, time=time))
+            output.write('python nfwfitter/jobqueue.py work {queuefile}{nprocs}\n'.format(queuefile = os.path.abspath(queuefile),
+                                                                                         nprocs = nprocsarg))
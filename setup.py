@@ -1,6 +1,39 @@
 from setuptools import setup, find_packages, Extension
 from Cython.Build import cythonize
 import numpy
+import os, shutil, tempfile
+import distutils.ccompiler, distutils.sysconfig, distutils.errors
+
+
+def openmpFlags():
+    '''-fopenmp if the compiler takes it (stock Apple clang does not), else no flags, and
+    concentrationfittools builds serially. Set NFWFITTER_OPENMP=0 or 1 to skip the test.
+
+    The parallel likelihood sums clusters in a thread-count dependent order, so its
+    results can differ in the last bits between OpenMP and serial builds, or thread counts.'''
+
+    if 'NFWFITTER_OPENMP' in os.environ:
+        return ['-fopenmp'] if os.environ['NFWFITTER_OPENMP'] == '1' else []
+
+    compiler = distutils.ccompiler.new_compiler()
+    distutils.sysconfig.customize_compiler(compiler)
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        source = os.path.join(tmpdir, 'testopenmp.c')
+        with open(source, 'w') as output:
+            output.write('#include <omp.h>\nint main(void) { return omp_get_num_threads() < 1; }\n')
+        objects = compiler.compile([source], output_dir = tmpdir, extra_postargs = ['-fopenmp'])
+        compiler.link_executable(objects, os.path.join(tmpdir, 'testopenmp'), extra_postargs = ['-fopenmp'])
+    except (distutils.errors.CompileError, distutils.errors.LinkError):
+        print 'OpenMP not available; building concentrationfittools without it'
+        return []
+    finally:
+        shutil.rmtree(tmpdir)
+
+    return ['-fopenmp']
+
+openmp = openmpFlags()
 
 extensions = [
     Extension("nfwfitter.nfwmodeltools", ["nfwfitter/nfwmodeltools.pyx"],
@@ -17,7 +50,9 @@ extensions = [
               include_dirs = [numpy.get_include()]
               ),    
     Extension("nfwfitter.concentrationfittools", ["nfwfitter/concentrationfittools.pyx"],
-              include_dirs = [numpy.get_include()]
+              include_dirs = [numpy.get_include()],
+              extra_compile_args = openmp,
+              extra_link_args = openmp
               ),
     ]
 